@@ -6,71 +6,189 @@ email: nbxlc@hotmail.com
 """
 
 
-from enum import Enum
-import importlib
+import os
+import re
+import time
+import logging
 import threading
-import requests
-from concurrent.futures import ThreadPoolExecutor
+import simplejson as json
 
-from cachetools import cached, LRUCache
-
-
-from common import py
 from .thread import TH_POOL
-
-
-CACHE = LRUCache(maxsize=100)
-
-class Cache(Enum):
-
-    PYVER = ["common.py", "getPyVer"]
-
-
-    def getCache(self, name):
-
-        if name in CACHE:
-            return CACHE[name]
-        print("mark")
-
-    def setCache(self, name, value):
-        CACHE[name] = value
-
-    def getCachebyFunc(self, module_name, func_name):
-
-        if func_name in CACHE:
-            return CACHE[func_name]
-
-        getVerTh = TH_POOL.submit(getattr(importlib.import_module(module_name, func_name)))
-        pyVers = getVerTh.result()
-        TH_POOL.shutdown()
-
-        if pyVers:
-            CACHE[func_name] = pyVers
-            return pyVers
+from .lazy import lazyImport
+from manage import ROOT_PATH, SettingPath
+
+requests = lazyImport("requests")
+
+
+# 上游 Python 版本目录
+CATALOG_URL = "https://api.github.com/repos/python/cpython/tags?per_page=100"
+CATALOG_FILE = os.path.join(ROOT_PATH, SettingPath, "python_versions.json")
+CATALOG_TTL = 24 * 3600
+CATALOG_TIMEOUT = 10
+CATALOG_MAX_PAGES = 20
+
+RELEASE_PATTERN = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+LINK_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+
+def parseLinks(header):
+    """
+    HTTP Link 头 -> {rel: url}
+    """
+    return {rel: url for url, rel in LINK_PATTERN.findall(header or "")}
+
+
+def requestsFetch(url, headers, timeout):
+    """
+    默认的获取后端
+    @return (状态码, 响应头, 解析后的 JSON or None)
+    """
+    response = requests.get(url, headers=headers, timeout=timeout)
+    data = response.json() if response.status_code == 200 else None
+    return response.status_code, dict(response.headers), data
+
+
+def latestRelease(versions):
+    """
+    最新的正式版本(不含 a/b/rc)，如 "3.13.1"
+    """
+    releases = [tuple(map(int, match.groups())) for match in map(RELEASE_PATTERN.match, versions) if match]
+    if not releases:
+        return ""
+    return ".".join(map(str, max(releases)))
+
+
+class VersionCatalog:
+    """
+    上游 Python 版本目录(GitHub cpython tags)
+
+    结果保存在 data/python_versions.json，带获取时间和首页 ETag：
+    versions() 只读缓存不访问网络；缓存超过 TTL 后 refreshAsync() 在线程池中刷新，
+    请求带 If-None-Match，304 时只更新获取时间；分页按 Link 头的 rel="next" 依次获取
+    获取后端可替换为 fetch(url, headers, timeout) -> (状态码, 响应头, JSON)，便于使用本地 HTTP 服务测试
+    """
+
+    def __init__(self, path=CATALOG_FILE, url=CATALOG_URL, ttl=CATALOG_TTL, fetch=None,
+                 timeout=CATALOG_TIMEOUT, maxPages=CATALOG_MAX_PAGES):
+        self.path = path
+        self.url = url
+        self.ttl = ttl
+        self.fetch = fetch or requestsFetch
+        self.timeout = timeout
+        self.maxPages = maxPages
+        self.data = None
+        self.future = None
+        self._lock = threading.RLock()
+
+    def load(self):
+        with self._lock:
+            if self.data is not None:
+                return self.data
+            self.data = {}
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    content = json.load(f)
+                if content.get("url") == self.url:
+                    self.data = content
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.error(f"version catalog load error: {e}")
+            return self.data
+
+    def save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmpFile = f"{self.path}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=4)
+            os.replace(tmpFile, self.path)
+
+    def versions(self):
+        """
+        缓存中的版本标签列表(如 "v3.13.1")，不访问网络
+        """
+        return list(self.load().get("versions", []))
+
+    def isStale(self):
+        fetched = self.load().get("fetched", 0)
+        return time.time() - fetched > self.ttl
+
+    def fetchAll(self, etag=None):
+        """
+        @return (ETag, 标签列表) or (ETag, None) 未改变
+        """
+        url = self.url
+        headers = {"Accept": "application/vnd.github+json"}
+        if etag:
+            headers["If-None-Match"] = etag
+        firstEtag = None
+        tags = []
+        for page in range(self.maxPages):
+            status, responseHeaders, data = self.fetch(url, headers, self.timeout)
+            responseHeaders = {key.lower(): value for key, value in responseHeaders.items()}
+            if page == 0:
+                if status == 304:
+                    return etag, None
+                firstEtag = responseHeaders.get("etag")
+                headers.pop("If-None-Match", None)
+            if status != 200 or not isinstance(data, list):
+                raise RuntimeError(f"HTTP {status}: {url}")
+            tags.extend(tag["name"] for tag in data if tag.get("name", "").startswith("v"))
+            url = parseLinks(responseHeaders.get("link")).get("next")
+            if not url:
+                break
+        return firstEtag, tags
+
+    def refresh(self, force=False):
+        """
+        阻塞刷新，缓存未过期且非 force 时直接返回缓存
+        @return [True, 版本列表] or (False, "Error: ...")
+        """
+        if not force and not self.isStale():
+            return [True, self.versions()]
+        data = self.load()
+        try:
+            etag, tags = self.fetchAll(None if force else data.get("etag"))
+        except Exception as e:
+            logging.error(f"version catalog refresh error: {e}")
+            return (False, f"Error: {e}")
+        with self._lock:
+            self.data = {
+                "url": self.url,
+                "etag": etag,
+                "fetched": time.time(),
+                "versions": data.get("versions", []) if tags is None else tags,
+            }
+            self.save()
+        return [True, self.versions()]
+
+    def refreshAsync(self, callback=None, force=False):
+        """
+        后台刷新，结果在主线程中交给 callback，已有刷新在进行时复用
+        @return Future or None(缓存未过期)
+        """
+        if not force and not self.isStale():
+            return None
+        with self._lock:
+            if self.future is None or self.future.done():
+                self.future = TH_POOL.submit(self.refresh, force)
+            future = self.future
+        if callback:
+            TH_POOL.addCallback(future, callback)
+        return future
 
     def get(self):
-        if self.name in CACHE:
-            return CACHE[self.name]
-
-        getVerTh = TH_POOL.submit(getattr(importlib.import_module(self.value[0]), self.value[1]))
-        pyVers = getVerTh.result()
+        """
+        版本列表: 缓存有效时直接返回，否则阻塞刷新，失败时返回过期缓存
+        """
+        result = self.refresh()
+        return result[1] if result[0] else self.versions()
 
-        CACHE[self.name] = pyVers
 
-        return pyVers
+VERSION_CATALOG = VersionCatalog()
 
 
-
-@cached(CACHE)
 def getPyVer():
     # 获取Python版本列表
-    response = requests.get('https://api.github.com/repos/python/cpython/tags')
-
-    # 解析JSON数据
-    data = response.json()
-
-    # 获取Python版本列表
-    python_versions = [tag['name'] for tag in data if tag['name'].startswith('v')]
-
-    # 打印Python版本列表
-    return python_versions
\ No newline at end of file
+    return VERSION_CATALOG.get()
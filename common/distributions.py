@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import re
+import logging
+
+from .thread import TH_POOL
+
+
+# 超过该数量的元数据目录时并发读取
+PARALLEL_THRESHOLD = 64
+CHUNK_SIZE = 32
+
+
+def readHeaders(path):
+    """
+    读取 METADATA/PKG-INFO 的头部(RFC 822 格式，遇到空行即为正文)
+    @return {"name": str, "version": str, "requires": [str]}
+    """
+    result = {"name": "", "version": "", "requires": []}
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line in ("\n", "\r\n"):
+                break
+            if line[0] in " \t":
+                continue
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            key = key.lower()
+            if key == "name":
+                result["name"] = value.strip()
+            elif key == "version":
+                result["version"] = value.strip()
+            elif key == "requires-dist":
+                result["requires"].append(value.strip())
+    return result
+
+
+def readRequiresTxt(path):
+    """
+    egg-info 的 requires.txt，只取默认依赖(第一个 [extra] 段之前)
+    """
+    requires = []
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    break
+                if line:
+                    requires.append(line)
+    except FileNotFoundError:
+        pass
+    return requires
+
+
+def readDistribution(site, name):
+    """
+    解析单个 *.dist-info / *.egg-info
+    @return {"name", "version", "location", "requires"} or None
+    """
+    path = os.path.join(site, name)
+    try:
+        if name.endswith(".dist-info"):
+            record = readHeaders(os.path.join(path, "METADATA"))
+        elif os.path.isdir(path):
+            record = readHeaders(os.path.join(path, "PKG-INFO"))
+            if not record["requires"]:
+                record["requires"] = readRequiresTxt(os.path.join(path, "requires.txt"))
+        else:
+            # 单文件形式的 egg-info 本身就是 PKG-INFO
+            record = readHeaders(path)
+    except OSError as e:
+        logging.debug(f"read distribution error: {path} {e}")
+        return None
+
+    if not record["name"]:
+        return None
+    record["location"] = site
+    return record
+
+
+def _readChunk(site, names):
+    return [readDistribution(site, name) for name in names]
+
+
+def scanSitePackages(site):
+    """
+    扫描 site-packages 中的包元数据
+    @return [{"name", "version", "location", "requires"}, ...]，目录布局无法识别时返回 None
+    """
+    try:
+        with os.scandir(site) as it:
+            names = [entry.name for entry in it if entry.name.endswith((".dist-info", ".egg-info"))]
+    except OSError:
+        return None
+    if not names:
+        return None
+
+    if len(names) > PARALLEL_THRESHOLD:
+        chunks = [names[i:i + CHUNK_SIZE] for i in range(0, len(names), CHUNK_SIZE)]
+        records = [record for chunk in TH_POOL.map(_readChunk, [site] * len(chunks), chunks) for record in chunk]
+    else:
+        records = _readChunk(site, names)
+
+    # 同名包只保留一份(dist-info 优先于 egg-info)
+    result = {}
+    for name, record in sorted(zip(names, records), key=lambda item: item[0].endswith(".egg-info")):
+        if record is None:
+            continue
+        key = re.sub(r"[-_.]+", "-", record["name"]).lower()
+        if key not in result:
+            result[key] = record
+    return sorted(result.values(), key=lambda record: record["name"].lower())
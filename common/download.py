@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import re
+import time
+import hashlib
+import logging
+import threading
+import simplejson as json
+
+from .thread import TH_POOL
+from .lazy import lazyImport
+
+requests = lazyImport("requests")
+
+
+# 分段数与最小分段大小，小文件不分段
+DOWNLOAD_SEGMENTS = 4
+MIN_SEGMENT = 1 << 20
+CHUNK_SIZE = 1 << 16
+PROBE_TIMEOUT = 5
+DOWNLOAD_TIMEOUT = 30
+# 每个分段出错后的重试次数(从已下载的位置继续)
+SEGMENT_RETRIES = 2
+# 断点状态写盘与进度回调的间隔(秒)
+STATE_INTERVAL = 1.0
+PROGRESS_INTERVAL = 0.1
+HASH_BLOCK = 1 << 20
+# 与安装包同目录发布的校验文件，按顺序尝试
+CHECKSUM_SUFFIXES = (("sha256", ".sha256"), ("md5", ".md5"))
+CHECKSUM_PATTERN = {"sha256": re.compile(r"\b[0-9a-fA-F]{64}\b"), "md5": re.compile(r"\b[0-9a-fA-F]{32}\b")}
+
+
+def probeMirror(url, timeout=PROBE_TIMEOUT):
+    """
+    HEAD 请求测量延迟，并取得大小、是否支持 Range 与校验用的 ETag/Last-Modified
+    部分镜像不支持 HEAD(返回 403/405 等)，此时改用只取第一个字节的 GET(Range: bytes=0-0)
+    @return {"url", "latency", "size", "ranges", "validator"} or None(不可用)
+    """
+    try:
+        start = time.perf_counter()
+        response = requests.head(url, allow_redirects=True, timeout=timeout)
+        latency = time.perf_counter() - start
+        if response.status_code != 200:
+            start = time.perf_counter()
+            with requests.get(url, headers={"Range": "bytes=0-0"}, stream=True, allow_redirects=True,
+                              timeout=timeout) as response:
+                latency = time.perf_counter() - start
+    except Exception as e:
+        logging.debug(f"probe {url} error: {e}")
+        return None
+    if response.status_code == 206:
+        # Content-Range: bytes 0-0/<总大小>
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        size, ranges = int(total) if total.isdigit() else 0, True
+    elif response.status_code == 200:
+        size = int(response.headers.get("Content-Length") or 0)
+        ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+    else:
+        return None
+    return {
+        "url": response.url,
+        "latency": latency,
+        "size": size,
+        "ranges": ranges,
+        "validator": response.headers.get("ETag") or response.headers.get("Last-Modified"),
+    }
+
+
+def probeMirrors(urls, timeout=PROBE_TIMEOUT):
+    """
+    并发探测，按延迟从低到高返回可用的镜像
+    """
+    probes = [probe for probe in TH_POOL.map(lambda url: probeMirror(url, timeout), urls) if probe]
+    return sorted(probes, key=lambda probe: probe["latency"])
+
+
+def publishedChecksum(urls, timeout=PROBE_TIMEOUT):
+    """
+    读取与文件同目录发布的校验文件(<文件>.sha256 / <文件>.md5)
+    内容为 "<hex>" 或 "<hex>  <文件名>"
+    @return "sha256:<hex>" / "md5:<hex>" or None(各镜像都没有)
+    """
+    for url in urls:
+        for algorithm, suffix in CHECKSUM_SUFFIXES:
+            try:
+                response = requests.get(url + suffix, timeout=timeout)
+            except Exception as e:
+                logging.debug(f"checksum {url}{suffix} error: {e}")
+                continue
+            if response.status_code != 200:
+                continue
+            match = CHECKSUM_PATTERN[algorithm].search(response.text)
+            if match:
+                return f"{algorithm}:{match.group(0).lower()}"
+    return None
+
+
+def verifyChecksum(path, checksum):
+    """
+    @param checksum "sha256:<hex>" 或 "md5:<hex>"
+    """
+    algorithm, _, expected = checksum.partition(":")
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest().lower() == expected.strip().lower()
+
+
+class RangeNotSupported(Exception):
+    pass
+
+
+class SegmentedDownload:
+    """
+    分段并发、可断点续传的下载
+
+    先对全部镜像测速，从最快的开始下载，失败时换下一个镜像；
+    支持 Range 时把文件分成若干段并发下载到 <目标>.part，进度记录在 <目标>.part.json，
+    中断或取消后再次下载时只获取缺少的部分(If-Range 保证服务器上的文件未变化)；
+    完成后校验 checksum(未提供时校验大小)，再原子替换为目标文件
+    进度通过 onProgress(stage, name, index, total, ok) 回调送出，index/total 为字节数
+    """
+
+    def __init__(self, urls, target, checksum=None, segments=DOWNLOAD_SEGMENTS, onProgress=None,
+                 timeout=DOWNLOAD_TIMEOUT):
+        self.urls = list(dict.fromkeys(urls))
+        self.target = target
+        self.checksum = checksum
+        self.segments = segments
+        self.onProgress = onProgress
+        self.timeout = timeout
+        self.partFile = f"{target}.part"
+        self.stateFile = f"{target}.part.json"
+        self.name = os.path.basename(target)
+        self.state = None
+        self.downloaded = 0
+        self.stopped = False
+        self._abort = False
+        self._lock = threading.Lock()
+        self._stateLock = threading.Lock()
+        self._saved = 0.0
+        self._reported = 0.0
+
+    def stop(self):
+        self.stopped = True
+
+    def progress(self, stage, index, total, ok=True):
+        if self.onProgress:
+            self.onProgress(stage, self.name, index, total, ok)
+
+    def loadState(self, probe):
+        """
+        同一 URL、大小和校验值的未完成下载可以继续
+        """
+        try:
+            with open(self.stateFile, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (state.get("url") != probe["url"] or state.get("size") != probe["size"]
+                or state.get("validator") != probe["validator"] or not probe["validator"]
+                or not os.path.exists(self.partFile) or os.path.getsize(self.partFile) != probe["size"]):
+            return None
+        return state
+
+    def saveState(self, force=False):
+        # 多个分段线程共用，正在写盘时其他线程跳过
+        if not self._stateLock.acquire(blocking=force):
+            return
+        try:
+            now = time.monotonic()
+            if not force and now - self._saved < STATE_INTERVAL:
+                return
+            self._saved = now
+            with self._lock:
+                content = json.dumps(self.state)
+            tmpFile = f"{self.stateFile}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmpFile, self.stateFile)
+        finally:
+            self._stateLock.release()
+
+    def newState(self, probe):
+        size = probe["size"]
+        count = max(1, min(self.segments, size // MIN_SEGMENT)) if probe["ranges"] and size else 1
+        step = size // count if size else 0
+        segments = []
+        for index in range(count):
+            start = index * step
+            end = size - 1 if index == count - 1 else start + step - 1
+            segments.append([start, end, 0])
+        with open(self.partFile, "wb") as f:
+            if size:
+                f.truncate(size)
+        return {"url": probe["url"], "size": size, "validator": probe["validator"], "segments": segments}
+
+    def fetchSegment(self, segment):
+        """
+        下载一个分段的剩余部分，出错时从已下载的位置重试
+        """
+        for attempt in range(SEGMENT_RETRIES + 1):
+            start = segment[0] + segment[2]
+            if start > segment[1] or self.stopped or self._abort:
+                return
+            headers = {"Range": f"bytes={start}-{segment[1]}"}
+            if self.state["validator"]:
+                headers["If-Range"] = self.state["validator"]
+            try:
+                with requests.get(self.state["url"], headers=headers, stream=True, timeout=self.timeout) as response:
+                    if response.status_code != 206:
+                        raise RangeNotSupported(f"HTTP {response.status_code}")
+                    with open(self.partFile, "r+b") as f:
+                        f.seek(start)
+                        for chunk in response.iter_content(CHUNK_SIZE):
+                            if self.stopped or self._abort:
+                                return
+                            f.write(chunk)
+                            self.advance(segment, len(chunk))
+                if segment[0] + segment[2] > segment[1]:
+                    return
+                raise IOError(f"incomplete segment {segment[0]}-{segment[1]}")
+            except RangeNotSupported:
+                raise
+            except Exception as e:
+                if attempt == SEGMENT_RETRIES or self._abort:
+                    raise
+                logging.warning(f"download {self.name} segment {segment[0]} retry: {e}")
+
+    def fetchWhole(self):
+        """
+        不支持 Range 时整体下载
+        以响应的 Content-Length(没有时为测速得到的大小)为准，收到的字节数不足时视为失败
+        """
+        self.state["segments"] = [[0, max(self.state["size"] - 1, 0), 0]]
+        self.downloaded = 0
+        with requests.get(self.state["url"], stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            if response.headers.get("Content-Length", "").isdigit() and not response.headers.get("Content-Encoding"):
+                self.state["size"] = int(response.headers["Content-Length"])
+            with open(self.partFile, "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if self.stopped:
+                        return
+                    f.write(chunk)
+                    self.advance(self.state["segments"][0], len(chunk))
+        if self.state["size"] and self.downloaded != self.state["size"]:
+            raise IOError(f"incomplete download {self.downloaded}/{self.state['size']}")
+        if not self.state["size"]:
+            # 服务器未给出大小，只能以实际收到的为准
+            self.state["size"] = self.downloaded
+
+    def advance(self, segment, length):
+        with self._lock:
+            segment[2] += length
+            self.downloaded += length
+            downloaded = self.downloaded
+            now = time.monotonic()
+            report = now - self._reported >= PROGRESS_INTERVAL
+            if report:
+                self._reported = now
+        if report:
+            self.progress("download", downloaded, self.state["size"])
+        self.saveState()
+
+    def fetch(self, probe):
+        """
+        从一个镜像下载到 .part
+        """
+        self.state = self.loadState(probe) or self.newState(probe)
+        self.downloaded = sum(segment[2] for segment in self.state["segments"])
+        if self.downloaded:
+            logging.info(f"download {self.name} resume at {self.downloaded}/{self.state['size']}")
+        self.progress("download", self.downloaded, self.state["size"])
+
+        if not probe["ranges"] or not probe["size"]:
+            self.fetchWhole()
+            return
+        self._abort = False
+        futures = [TH_POOL.submit(self.fetchSegment, segment) for segment in self.state["segments"]
+                   if segment[0] + segment[2] <= segment[1]]
+        error = None
+        for future in TH_POOL.as_completed(futures):
+            if future.exception() is not None and error is None:
+                # 一个分段失败时通知其余分段停止，全部结束后再处理，避免与后续写入冲突
+                error = future.exception()
+                self._abort = True
+        self.saveState(force=True)
+        if isinstance(error, RangeNotSupported):
+            # 服务器上的文件已变化或不支持分段，整体重新下载
+            self.fetchWhole()
+        elif error is not None:
+            raise error
+
+    def verify(self):
+        if self.checksum:
+            return verifyChecksum(self.partFile, self.checksum)
+        return os.path.getsize(self.partFile) == self.state["size"]
+
+    def run(self):
+        """
+        @return [True, 目标文件] or (False, "Error: ...")
+        """
+        if os.path.exists(self.target):
+            return [True, self.target]
+        os.makedirs(os.path.dirname(os.path.abspath(self.target)), exist_ok=True)
+
+        probes = probeMirrors(self.urls)
+        if not probes:
+            return (False, f"Error: 所有镜像都无法访问 {self.name}")
+
+        errors = []
+        for probe in probes:
+            if self.stopped:
+                return (False, "Error: 已取消")
+            self.progress("probe", 0, 0)
+            try:
+                self.fetch(probe)
+            except Exception as e:
+                errors.append(f"{probe['url']}: {e}")
+                logging.error(f"download {probe['url']} error: {e}")
+                continue
+            if self.stopped:
+                return (False, "Error: 已取消")
+            self.progress("verify", self.downloaded, self.state["size"])
+            if not self.verify():
+                errors.append(f"{probe['url']}: 校验失败")
+                for path in (self.partFile, self.stateFile):
+                    if os.path.exists(path):
+                        os.remove(path)
+                continue
+            os.replace(self.partFile, self.target)
+            if os.path.exists(self.stateFile):
+                os.remove(self.stateFile)
+            self.progress("download", self.downloaded, self.state["size"])
+            return [True, self.target]
+        return (False, "Error: " + "\n".join(errors))
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import re
+import logging
+import simplejson as json
+
+from PySide6.QtCore import QObject, Signal, QTimer, QFileSystemWatcher
+
+from .thread import TH_POOL
+from .uic import SKIP_DIRS
+from .pipreqs import Pipreqs
+from manage import ROOT_PATH, SettingPath
+
+
+# 总是忽略的目录
+IGNORE_DIRS = SKIP_DIRS | {".git", ".hg", ".svn", ".idea", ".vscode", ".mypy_cache", ".pytest_cache", ".tox"}
+GITIGNORE = ".gitignore"
+
+# 文件名/后缀 -> 索引分类
+INDEX_NAMES = {"setup.py", "requirements.txt"}
+INDEX_SUFFIXES = {".ui", ".qrc", ".py", ".whl"}
+
+# 监视的目录数上限(Windows 上每个目录占用一个句柄)
+WATCH_LIMIT = 1024
+# 目录变化的合并间隔(ms)
+WATCH_DELAY = 300
+
+
+def fileKind(name):
+    """
+    文件的索引分类: "setup.py"/"requirements.txt" 或后缀 ".ui"/".qrc"/".py"/".whl"，其他返回 None
+    setup.py 同时属于 ".py"，由调用方分别登记
+    """
+    if name in INDEX_NAMES:
+        return name
+    suffix = os.path.splitext(name)[1].lower()
+    return suffix if suffix in INDEX_SUFFIXES else None
+
+
+def globRegex(pattern):
+    """
+    gitignore 通配符 -> 正则
+    """
+    result = ""
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            result += "(?:.*/)?"
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            result += ".*"
+            index += 2
+            continue
+        if char == "*":
+            result += "[^/]*"
+        elif char == "?":
+            result += "[^/]"
+        elif char == "[":
+            end = pattern.find("]", index + 1)
+            if end == -1:
+                result += re.escape(char)
+            else:
+                result += "[" + pattern[index + 1:end].replace("\\", "\\\\") + "]"
+                index = end
+        else:
+            result += re.escape(char)
+        index += 1
+    return result
+
+
+class IgnoreRules:
+    """
+    gitignore 规则(支持子目录中的 .gitignore、! 取反、/ 结尾只匹配目录、含 / 时相对所在目录)
+    另外加入 pipreqs 的 ignore 列表，与 pipreqs 相同按目录名匹配
+    扫描时会加入新发现的 .gitignore，不是线程安全的: 后台扫描使用 copy() 得到的副本，完成后在主线程 merge()
+    """
+
+    def __init__(self):
+        self.rules = []
+        self.stamps = {}
+
+    def add(self, base, lines):
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dirOnly = line.endswith("/")
+            line = line.strip("/") if dirOnly else line
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if not line:
+                continue
+            regex = globRegex(line)
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+            self.rules.append((base, re.compile(f"^{regex}$"), negate, dirOnly))
+
+    def copy(self):
+        rules = IgnoreRules()
+        rules.rules = list(self.rules)
+        rules.stamps = dict(self.stamps)
+        return rules
+
+    def merge(self, other):
+        """
+        加入副本扫描时新读取的 .gitignore
+        """
+        for path, stamp in other.stamps.items():
+            if path in self.stamps:
+                continue
+            base = os.path.dirname(path)
+            self.stamps[path] = stamp
+            self.rules.extend(rule for rule in other.rules if rule[0] == base)
+
+    def addFile(self, base, path):
+        if path in self.stamps:
+            return
+        try:
+            self.stamps[path] = os.stat(path).st_mtime_ns
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                self.add(base, f.readlines())
+        except OSError as e:
+            logging.debug(f"gitignore read error: {path} {e}")
+
+    def ignored(self, path, isDir):
+        """
+        最后一条匹配的规则生效
+        """
+        result = False
+        for base, regex, negate, dirOnly in self.rules:
+            if dirOnly and not isDir:
+                continue
+            rel = os.path.relpath(path, base)
+            if rel.startswith(".."):
+                continue
+            if regex.match(rel.replace(os.sep, "/")):
+                result = not negate
+        return result
+
+
+def pipreqsIgnore():
+    """
+    pipreqs 的 ignore 列表(data/pipreqs.json，不存在时用默认值)
+    """
+    try:
+        with open(os.path.join(ROOT_PATH, SettingPath, "pipreqs.json"), "r", encoding="utf-8") as f:
+            return list(json.load(f).get("ignore") or [])
+    except (OSError, ValueError):
+        return list(Pipreqs.PIPREQS_PARAMS.get("ignore") or [])
+
+
+def scanTree(folder, rules, known=()):
+    """
+    从 folder 开始扫描，遇到 .gitignore 时加入规则
+    @param known folder 下已索引的子目录名，不再深入
+    @return {目录: (子目录名集合, 文件名集合)}，只包含未被忽略的目录
+    """
+    entries = {}
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        dirs, files = set(), set()
+        try:
+            with os.scandir(current) as it:
+                items = list(it)
+        except OSError as e:
+            logging.debug(f"index scan error: {current} {e}")
+            continue
+        if any(item.name == GITIGNORE for item in items):
+            rules.addFile(current, os.path.join(current, GITIGNORE))
+        for item in items:
+            try:
+                isDir = item.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if isDir and item.name in IGNORE_DIRS:
+                continue
+            if rules.ignored(item.path, isDir):
+                continue
+            if isDir:
+                dirs.add(item.name)
+                if current != folder or item.name not in known:
+                    stack.append(item.path)
+            else:
+                files.add(item.name)
+        entries[current] = (dirs, files)
+    return entries
+
+
+class ProjectIndexer(QObject):
+    """
+    项目文件索引
+
+    后台线程中用 os.scandir 扫描项目目录(跳过虚拟环境、构建输出等目录，遵循 .gitignore 与 pipreqs 的 ignore)，
+    在内存中保存每个目录的内容与 分类 -> 路径 的索引(.ui/.qrc/.py/setup.py/requirements.txt/.whl)；
+    扫描完成后用 QFileSystemWatcher 监视各目录，变化的目录合并后在后台重新扫描该层，只更新差异
+    索引只在主线程中修改，后台线程只负责扫描并返回结果
+    """
+
+    indexed = Signal(str)       # 完整扫描完成: 根目录
+    changed = Signal(list)      # 增量更新: 内容发生变化的目录
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = ""
+        self.entries = {}
+        self.kinds = {}
+        self.rules = None
+        self.ready = False
+        self.generation = 0
+        self.watcher = None
+        self.pending = set()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(WATCH_DELAY)
+        self.timer.timeout.connect(self.flush)
+
+    def setRoot(self, root):
+        """
+        切换项目并在后台完整扫描，完成后发出 indexed
+        """
+        self.clear()
+        self.root = os.path.normpath(root)
+        # 规则在扫描完成后才交给 self.rules，扫描期间只由后台线程修改
+        rules = IgnoreRules()
+        names = [os.path.basename(os.path.normpath(path)) for path in pipreqsIgnore() if path.strip("/\\")]
+        rules.add(self.root, [f"{name}/" for name in names])
+        generation = self.generation
+        TH_POOL.submitUi(lambda entries: self.onScanned(generation, entries, rules),
+                         scanTree, self.root, rules,
+                         errback=lambda error: logging.error(f"index {root} error: {error}"))
+
+    def clear(self):
+        self.generation += 1
+        self.root = ""
+        self.entries = {}
+        self.kinds = {}
+        self.rules = None
+        self.ready = False
+        self.pending.clear()
+        self.timer.stop()
+        if self.watcher is not None:
+            self.watcher.deleteLater()
+            self.watcher = None
+
+    def onScanned(self, generation, entries, rules):
+        if generation != self.generation:
+            return
+        self.rules = rules
+        self.entries = entries
+        self.kinds = {}
+        for folder, (dirs, files) in entries.items():
+            for name in files:
+                self.addFile(os.path.join(folder, name))
+        self.ready = True
+        self.watch(list(entries))
+        logging.debug(f"index {self.root}: {len(entries)} dirs, "
+                      + ", ".join(f"{kind} {len(paths)}" for kind, paths in self.kinds.items()))
+        self.indexed.emit(self.root)
+
+    def addFile(self, path):
+        name = os.path.basename(path)
+        suffix = os.path.splitext(name)[1].lower()
+        for kind in {fileKind(name), suffix if suffix in INDEX_SUFFIXES else None}:
+            if kind:
+                self.kinds.setdefault(kind, set()).add(path)
+
+    def removeFile(self, path):
+        for paths in self.kinds.values():
+            paths.discard(path)
+
+    def files(self, kind):
+        """
+        @param kind ".ui"/".qrc"/".py"/".whl"/"setup.py"/"requirements.txt"
+        @return 排序后的路径列表，索引未完成时返回 None
+        """
+        if not self.ready:
+            return None
+        return sorted(self.kinds.get(kind, ()))
+
+    def listdir(self, folder):
+        """
+        @return (子目录名列表, 文件名列表)，未索引的目录返回 None
+        """
+        entry = self.entries.get(os.path.normpath(folder))
+        if entry is None:
+            return None
+        return sorted(entry[0], key=str.lower), sorted(entry[1], key=str.lower)
+
+    def watch(self, folders):
+        """
+        监视目录与其中的 .gitignore(原地修改文件不会触发目录变化)
+        """
+        if self.watcher is None:
+            self.watcher = QFileSystemWatcher(self)
+            self.watcher.directoryChanged.connect(self.on_directoryChanged)
+            self.watcher.fileChanged.connect(self.on_fileChanged)
+        room = WATCH_LIMIT - len(self.watcher.directories()) - len(self.watcher.files())
+        # 浅层目录优先
+        paths = []
+        for folder in sorted(folders, key=lambda folder: folder.count(os.sep)):
+            paths.append(folder)
+            if GITIGNORE in self.entries[folder][1]:
+                paths.append(os.path.join(folder, GITIGNORE))
+        paths = paths[:max(room, 0)]
+        if paths:
+            self.watcher.addPaths(paths)
+
+    def on_directoryChanged(self, path):
+        self.pending.add(os.path.normpath(path))
+        self.timer.start()
+
+    def on_fileChanged(self, path):
+        self.on_directoryChanged(os.path.dirname(path))
+
+    def gitignoreChanged(self, folders):
+        for folder in folders:
+            path = os.path.join(folder, GITIGNORE)
+            try:
+                stamp = os.stat(path).st_mtime_ns
+            except OSError:
+                stamp = None
+            if stamp != self.rules.stamps.get(path):
+                return True
+        return False
+
+    def flush(self):
+        folders, self.pending = self.pending, set()
+        folders = [folder for folder in folders if folder in self.entries]
+        if self.gitignoreChanged(folders):
+            # 忽略规则变化，整体重新扫描
+            self.setRoot(self.root)
+            return
+        generation = self.generation
+        for folder in folders:
+            TH_POOL.submitUi(lambda result, folder=folder: self.onRescanned(generation, folder, result),
+                             self.rescan, folder, set(self.entries[folder][0]), self.rules.copy(),
+                             errback=lambda error: logging.error(f"index rescan error: {error}"))
+
+    @staticmethod
+    def rescan(folder, oldDirs, rules):
+        """
+        后台: 重新扫描单层目录，新增的子目录完整扫描
+        @param rules 规则副本，新增子目录中的 .gitignore 加入副本
+        @return (本层 (dirs, files), 新增子目录的 entries, rules) or None(目录已不存在)
+        """
+        added = scanTree(folder, rules, oldDirs)
+        if folder not in added:
+            return None
+        return added.pop(folder), added, rules
+
+    def dropTree(self, folder):
+        prefix = folder + os.sep
+        for path in [path for path in self.entries if path == folder or path.startswith(prefix)]:
+            for name in self.entries.pop(path)[1]:
+                self.removeFile(os.path.join(path, name))
+            if self.watcher is not None:
+                self.watcher.removePaths([path, os.path.join(path, GITIGNORE)])
+
+    def onRescanned(self, generation, folder, result):
+        if generation != self.generation or folder not in self.entries:
+            return
+        if result is None:
+            self.dropTree(folder)
+            self.changed.emit([os.path.dirname(folder)])
+            return
+        (dirs, files), added, rules = result
+        self.rules.merge(rules)
+        oldDirs, oldFiles = self.entries[folder]
+        if (dirs, files) == (oldDirs, oldFiles) and not added:
+            return
+        for name in oldFiles - files:
+            self.removeFile(os.path.join(folder, name))
+        for name in files - oldFiles:
+            self.addFile(os.path.join(folder, name))
+        for name in oldDirs - dirs:
+            self.dropTree(os.path.join(folder, name))
+        self.entries[folder] = (dirs, files)
+        for path, (subDirs, subFiles) in added.items():
+            self.entries[path] = (subDirs, subFiles)
+            for name in subFiles:
+                self.addFile(os.path.join(path, name))
+        self.watch(list(added))
+        self.changed.emit([folder])
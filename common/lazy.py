@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+延迟导入: 只在个别操作中用到的重量级依赖用模块代理代替顶层导入，首次访问属性时才真正导入
+    requests = lazyImport("requests")
+    Image = lazyImport("PIL.Image")
+
+导入预算检查(主窗口模块导入后不应包含延迟模块，模块总数不超过预算):
+    python -m common.lazy
+"""
+
+import sys
+import threading
+import importlib
+
+
+# 启动阶段(主窗口首次绘制前)允许导入的模块总数
+# 实测基线: 导入 STARTUP_IMPORTS 后共 360 个模块(Python 3.11, PySide6 6.7, Linux);
+# 留约 25% 余量给 Windows 专有模块(pywin32 等)与 qfluentexpand 的版本差异。
+# requests 一个包就会带入约 160 个模块，任何重量级依赖被提前导入都会超出预算
+STARTUP_MODULE_BUDGET = 450
+
+# 启动集合: main 与主窗口(首页)
+STARTUP_IMPORTS = ("main", "ui.MainWindow", "common.warmup", "resource_rc")
+# 页面在首次绘制之后构建，只检查延迟模块
+PAGE_IMPORTS = ("ui.ProjectWidget", "ui.DesignerWidget", "ui.PackWidget", "ui.OtherWidget",
+                "ui.ConsoleWidget", "ui.DocumentWidget", "ui.SettingWidget")
+
+# 通过 lazyImport 延迟的模块(顶层包名)，启动阶段不应出现在 sys.modules 中
+LAZY_MODULES = set()
+
+
+class LazyModule:
+    """
+    模块代理，首次访问属性时导入并缓存真实模块
+    """
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with self._lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = importlib.import_module(self._name)
+                    self.__dict__["_module"] = module
+        return module
+
+    def isLoaded(self):
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.isLoaded() else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazyImport(name):
+    """
+    @param name 模块全名，如 "paramiko"、"PIL.Image"
+    """
+    LAZY_MODULES.add(name.partition(".")[0])
+    return LazyModule(name)
+
+
+def importBudget(budget=STARTUP_MODULE_BUDGET):
+    """
+    检查当前已导入的模块
+    @param budget 模块总数上限，None 时只检查延迟模块
+    @return [True, 模块数] or (False, "Error: ...")
+    """
+    errors = []
+    loaded = sorted(name for name in LAZY_MODULES if name in sys.modules)
+    if loaded:
+        errors.append(f"延迟模块被提前导入: {', '.join(loaded)}")
+    count = len(sys.modules)
+    if budget is not None and count > budget:
+        errors.append(f"已导入 {count} 个模块，超过预算 {budget}")
+    if errors:
+        return (False, "Error: " + "; ".join(errors))
+    return [True, count]
+
+
+if __name__ == "__main__":
+    for module in STARTUP_IMPORTS:
+        importlib.import_module(module)
+    startup = importBudget()
+    print(f"startup: {startup[1]}")
+    for module in PAGE_IMPORTS:
+        importlib.import_module(module)
+    pages = importBudget(None)
+    print(f"pages: {pages[1]}")
+    sys.exit(0 if startup[0] and pages[0] else 1)
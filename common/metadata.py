@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import sys
+import glob
+import time
+import logging
+import threading
+import simplejson as json
+
+from .py import PyInterpreter, PyPath
+from .distributions import scanSitePackages
+from manage import ROOT_PATH, SettingPath
+
+
+METADATA_FILE = os.path.join(ROOT_PATH, SettingPath, "interpreters.json")
+# 3: venv 解释器的 tools 曾按 Scripts\\scripts\\... 判断，旧缓存作废
+METADATA_VERSION = 3
+
+# 工具可用性检查: 名称 -> 相对解释器目录的路径
+TOOLS = {
+    "pyinstaller": PyPath.PYINSTALLER,
+    "nuitka": PyPath.NUITKA,
+    "pyside6-uic": PyPath.PYSIDE6_UIC,
+    "pipreqs": PyPath.PIPREQS,
+}
+
+# 解释器支持的 wheel 标签，按优先级排列
+SYS_TAGS_SCRIPT = r"""
+import json
+try:
+    from packaging.tags import sys_tags
+except ImportError:
+    from pip._vendor.packaging.tags import sys_tags
+print(json.dumps([str(tag) for tag in sys_tags()]))
+"""
+
+
+def sitePackages(interpreter):
+    """
+    解释器对应的 site-packages 目录
+    Windows: <dir>\\Lib\\site-packages, venv 下解释器在 Scripts 中
+    其他平台: <prefix>/lib/pythonX.Y/site-packages
+    """
+    folder = os.path.dirname(os.path.abspath(interpreter))
+    candidates = [
+        os.path.join(folder, "Lib", "site-packages"),
+        os.path.join(os.path.dirname(folder), "Lib", "site-packages"),
+    ]
+    if sys.platform != "win32":
+        candidates.extend(sorted(glob.glob(os.path.join(os.path.dirname(folder), "lib", "python*", "site-packages"))))
+    for path in candidates:
+        if os.path.isdir(path):
+            return path
+    return None
+
+
+def fingerprint(interpreter):
+    """
+    解释器与 site-packages 的 mtime/size，任一变化即视为缓存失效
+    安装/卸载包会增删 site-packages 下的目录，从而改变目录的 mtime
+    """
+    try:
+        stat = os.stat(interpreter)
+    except OSError:
+        return None
+    result = [stat.st_mtime_ns, stat.st_size]
+    site = sitePackages(interpreter)
+    if site:
+        result.append(os.stat(site).st_mtime_ns)
+    return result
+
+
+class InterpreterMetadata:
+    """
+    解释器元数据的持久化缓存(data/interpreters.json)
+
+    缓存版本号、已安装的包与常用工具是否可用，
+    页面切换和程序重启后不再为同一解释器重复启动子进程
+    """
+
+    def __init__(self, path=METADATA_FILE):
+        self.path = path
+        self.data = None
+        self._lock = threading.RLock()
+
+    def load(self):
+        with self._lock:
+            if self.data is not None:
+                return self.data
+            self.data = {}
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    content = json.load(f)
+                if content.get("version") == METADATA_VERSION:
+                    self.data = content.get("interpreters", {})
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.error(f"interpreter metadata load error: {e}")
+            return self.data
+
+    def save(self):
+        with self._lock:
+            folder = os.path.dirname(self.path)
+            if folder and not os.path.exists(folder):
+                os.makedirs(folder)
+            tmpFile = f"{self.path}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump({"version": METADATA_VERSION, "interpreters": self.data}, f, indent=4)
+            os.replace(tmpFile, self.path)
+
+    @staticmethod
+    def key(interpreter):
+        return os.path.normcase(os.path.abspath(interpreter))
+
+    def entry(self, interpreter):
+        """
+        当前有效的缓存项，指纹变化时丢弃旧数据
+        """
+        key = self.key(interpreter)
+        current = fingerprint(interpreter)
+        with self._lock:
+            data = self.load()
+            entry = data.get(key)
+            if entry is None or entry.get("fingerprint") != current:
+                entry = {"fingerprint": current}
+                data[key] = entry
+            return entry
+
+    def update(self, interpreter, **kwargs):
+        with self._lock:
+            entry = self.entry(interpreter)
+            entry.update(kwargs)
+            entry["updated"] = time.time()
+            # 写入后 site-packages 可能已变化，按最新状态记录指纹
+            entry["fingerprint"] = fingerprint(interpreter)
+            self.save()
+            return entry
+
+    def invalidate(self, interpreter, *fields):
+        """
+        使缓存失效，fields 为空时清除该解释器的全部缓存
+        pip install/uninstall 完成后只需清除包列表和工具信息
+        """
+        key = self.key(interpreter)
+        with self._lock:
+            data = self.load()
+            if key not in data:
+                return
+            if fields:
+                for field in fields:
+                    data[key].pop(field, None)
+                data[key]["fingerprint"] = fingerprint(interpreter)
+            else:
+                del data[key]
+            self.save()
+
+    def version(self, interpreter):
+        """
+        @return 与 PyInterpreter.version 相同格式的结果
+        """
+        entry = self.entry(interpreter)
+        if "version" in entry:
+            return [True, entry["version"]]
+
+        pyI = PyInterpreter()
+        pyI.setInterpreter(interpreter)
+        result = pyI.version()
+        if result[0]:
+            self.update(interpreter, version=result[1])
+        return result
+
+    def distributions(self, interpreter, refresh=False):
+        """
+        已安装的包，直接读取 site-packages 中的元数据，目录布局无法识别时才调用 pip
+        @return [True, [{"name", "version", "location", "requires"}, ...]] or (False, "Error: ...")
+        """
+        entry = self.entry(interpreter)
+        if not refresh and "distributions" in entry:
+            return [True, entry["distributions"]]
+
+        site = sitePackages(interpreter)
+        dists = scanSitePackages(site) if site else None
+        if dists is None:
+            result = self.pipList(interpreter)
+            if not result[0]:
+                return result
+            dists = result[1]
+        self.update(interpreter, distributions=dists)
+        return [True, dists]
+
+    @staticmethod
+    def pipList(interpreter):
+        pyI = PyInterpreter()
+        pyI.setInterpreter(interpreter)
+        result = pyI.pip("list", "--format=json", "--disable-pip-version-check")
+        if not result[0]:
+            return result
+        try:
+            dists = json.loads(result[1])
+        except Exception as e:
+            return (False, f"Error: {e}")
+        return [True, [{"name": dist["name"], "version": dist["version"], "location": "", "requires": []}
+                       for dist in dists]]
+
+    def tools(self, interpreter):
+        """
+        @return {"pyinstaller": bool, ...}
+        """
+        entry = self.entry(interpreter)
+        if "tools" in entry:
+            return entry["tools"]
+
+        tools = {name: os.path.exists(tool.path(interpreter)) for name, tool in TOOLS.items()}
+        self.update(interpreter, tools=tools)
+        return tools
+
+    def tags(self, interpreter):
+        """
+        解释器支持的 wheel 标签(packaging.tags.sys_tags)，用于按文件名判断本地仓库中的 wheel 是否适用
+        @return [True, ["cp312-cp312-win_amd64", ...]] or (False, "Error: ...")
+        """
+        entry = self.entry(interpreter)
+        if "tags" in entry:
+            return [True, entry["tags"]]
+
+        pyI = PyInterpreter()
+        pyI.setInterpreter(interpreter)
+        result = pyI.cmd([interpreter, "-c", SYS_TAGS_SCRIPT])
+        if not result[0]:
+            return result
+        try:
+            tags = json.loads(result[1].strip().splitlines()[-1])
+        except Exception as e:
+            return (False, f"Error: {e}")
+        self.update(interpreter, tags=tags)
+        return [True, tags]
+
+
+METADATA = InterpreterMetadata()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import re
+import shutil
+import logging
+import threading
+import tempfile
+import simplejson as json
+
+from .py import PyInterpreter
+from .thread import TH_POOL
+from .metadata import METADATA
+from .wheelhouse import WHEELHOUSE, parseFilename
+
+
+DOWNLOAD_WORKERS = 4
+
+# pip install 输出中开始处理某个文件的行: Processing c:\...\links\six-1.16.0-py2.py3-none-any.whl
+PROCESSING_RE = re.compile(r"^\s*Processing\s.*?([^\\/\s]+\.(?:whl|tar\.gz|zip))\s*$")
+# 本地仓库无法满足的需求
+UNSATISFIED_RE = re.compile(r"(?:satisfies the requirement|No matching distribution found for)\s+([^\s(]+)")
+
+
+STAGES = {
+    "download": "下载",
+    "install": "安装",
+    "installed": "已安装",
+    "uninstall": "卸载",
+    "uninstalled": "已卸载",
+    "compile": "编译",
+    "probe": "测速",
+    "verify": "校验",
+}
+
+
+def canonicalName(name):
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def progressText(progress):
+    """
+    进度事件 -> 界面显示的文字
+    """
+    stage = STAGES.get(progress['stage'], progress['stage'])
+    if progress.get("unit") == "bytes":
+        # 字节进度: 已下载/总大小(MB)
+        done, total = progress["index"] / (1 << 20), progress["total"] / (1 << 20)
+        text = f"{stage} {progress['name']} {done:.1f}/{total:.1f} MB"
+        if progress["total"]:
+            text += f" ({progress['index'] * 100 // progress['total']}%)"
+    else:
+        text = f"{stage} {progress['name']} ({progress['index']}/{progress['total']})"
+    if not progress["ok"]:
+        text += " 失败"
+    return text
+
+
+class PipPlan:
+    """
+    pip 批量操作计划
+
+    install/upgrade: 先用 `pip install --dry-run --report` 一次性解析出完整的安装集合，
+    并发把每个包下载到本地 wheelhouse(按 wheel 文件名标签判断已有适用文件时跳过)，
+    校验哈希后用一次 pip 调用从仓库安装全部包，进度取自 pip 的输出；
+    失败时只有仓库无法满足的包逐个回退到在线安装，其余的包重试；
+    uninstall: 过滤出已安装的包后一次卸载
+    进度通过 onProgress(stage, name, index, total, ok) 回调送出，下载并发数由 workers 限制
+    """
+
+    def __init__(self, interpreter, wheelhouse=WHEELHOUSE, indexUrl=None, retries=1,
+                 workers=DOWNLOAD_WORKERS, onProgress=None, onOutput=None):
+        self.interpreter = interpreter
+        self.wheelhouse = wheelhouse
+        self.indexUrl = indexUrl
+        self.retries = retries
+        self.onProgress = onProgress
+        self.onOutput = onOutput
+        self.items = []
+        self.tags = []
+        self.stopped = False
+        self._active = set()
+        self._semaphore = threading.Semaphore(workers)
+        self.pyI = self.interpreterFactory()
+
+    def interpreterFactory(self):
+        pyI = PyInterpreter()
+        pyI.setInterpreter(self.interpreter)
+        pyI.setOutputCallback(self.onOutput)
+        self._active.add(pyI)
+        return pyI
+
+    def progress(self, stage, name, index, total, ok=True):
+        logging.debug(f"pip plan: {stage} {name} {index}/{total} {ok}")
+        if self.onProgress:
+            self.onProgress(stage, name, index, total, ok)
+
+    def indexArgs(self):
+        return ["-i", self.indexUrl] if self.indexUrl else []
+
+    def stop(self):
+        self.stopped = True
+        for pyI in list(self._active):
+            pyI.stop()
+
+    def resolve(self, *requirements, upgrade=False):
+        """
+        解析需要安装的包
+        @param requirements 包名/需求串/whl 路径，或 "-r", "requirements.txt"
+        @return [True, [{"name", "version", "requirement", "direct"}, ...]] or (False, "Error: ...")
+        """
+        reportFile = os.path.join(tempfile.mkdtemp(prefix="pipplan"), "report.json")
+        args = ["install", "--dry-run", "--quiet", "--report", reportFile, "--disable-pip-version-check"]
+        if upgrade:
+            args.append("--upgrade")
+        args.extend(self.indexArgs())
+        args.extend(requirements)
+
+        result = self.pyI.pip(*args)
+        if not result[0]:
+            return result
+        try:
+            with open(reportFile, "r", encoding="utf-8") as f:
+                report = json.load(f)
+        except Exception as e:
+            return (False, f"Error: {e}")
+        finally:
+            try:
+                os.remove(reportFile)
+                os.rmdir(os.path.dirname(reportFile))
+            except OSError:
+                pass
+
+        self.items = [self.planItem(item) for item in report.get("install", [])]
+        return [True, self.items]
+
+    @staticmethod
+    def planItem(item):
+        """
+        report 中的一项 -> {"name", "version", "requirement", "direct"}
+        直接引用(本地 whl、git 等)不经过缓存，按原地址安装
+        """
+        name = item["metadata"]["name"]
+        version = item["metadata"]["version"]
+        info = item.get("download_info", {})
+        url = info.get("url", "")
+        direct = bool(item.get("is_direct"))
+        if direct and "vcs_info" in info:
+            vcs = info["vcs_info"]
+            requirement = f"{name} @ {vcs['vcs']}+{url}@{vcs.get('commit_id', '')}".rstrip("@")
+        elif direct:
+            requirement = f"{name} @ {url}"
+        else:
+            requirement = f"{name}=={version}"
+        return {"name": name, "version": version, "requirement": requirement, "direct": direct}
+
+    def download(self, item):
+        with self._semaphore:
+            if self.stopped:
+                return False
+            if self.wheelhouse.has(item["name"], item["version"], self.tags):
+                return True
+
+            staging = tempfile.mkdtemp(prefix="pipplan")
+            pyI = self.interpreterFactory()
+            try:
+                args = ["download", "--no-deps", "--quiet", "--disable-pip-version-check", "-d", staging]
+                args.extend(self.indexArgs())
+                args.append(item["requirement"])
+                if not pyI.pip(*args)[0]:
+                    return False
+                for name in os.listdir(staging):
+                    self.wheelhouse.add(os.path.join(staging, name))
+                return True
+            finally:
+                self._active.discard(pyI)
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def downloadAll(self):
+        """
+        并发下载到本地仓库
+        @return 下载失败的包名列表
+        """
+        # 目标解释器支持的标签只查询一次(有缓存)，查询失败时全部交给 pip download 判断
+        tags = METADATA.tags(self.interpreter)
+        self.tags = tags[1] if tags[0] else []
+
+        items = [item for item in self.items if not item["direct"]]
+        total = len(items)
+        failed = []
+        futures = {TH_POOL.submit(self.download, item): item for item in items}
+        for index, future in enumerate(TH_POOL.as_completed(futures), 1):
+            item = futures[future]
+            ok = future.exception() is None and future.result()
+            if not ok:
+                failed.append(item["name"])
+            self.progress("download", item["name"], index, total, ok)
+        return failed
+
+    def installBatch(self, items, progress):
+        """
+        一次 pip 调用从本地仓库安装 items，pip 开始处理每个文件时送出该包的安装进度
+        @param progress 已送出安装进度的包名列表(跨批次累计)
+        @return (result, failed) failed 为 pip 报告仓库中无法满足的包(规范化包名)
+        """
+        byName = {canonicalName(item["name"]): item for item in items}
+        total = len(self.items)
+        partial = [""]
+
+        def onOutput(text):
+            if self.onOutput:
+                self.onOutput(text)
+            lines = (partial[0] + text).split("\n")
+            partial[0] = lines.pop()
+            for line in lines:
+                match = PROCESSING_RE.match(line)
+                parsed = match and parseFilename(match.group(1))
+                item = parsed and byName.get(parsed[0])
+                if item and item["name"] not in progress:
+                    progress.append(item["name"])
+                    self.progress("install", item["name"], len(progress), total)
+
+        pyI = self.interpreterFactory()
+        pyI.setOutputCallback(onOutput)
+        try:
+            result = pyI.pip("install", "--no-deps", "--no-index", "--find-links", self.wheelhouse.findLinks(),
+                             "--disable-pip-version-check", *[item["requirement"] for item in items])
+        finally:
+            self._active.discard(pyI)
+        if result[0]:
+            return result, set()
+        failed = {canonicalName(re.split(r"[<>=!~;\[@ ]", requirement)[0])
+                  for requirement in UNSATISFIED_RE.findall(result[1])}
+        return result, failed & set(byName)
+
+    def installOnline(self, item):
+        """
+        直接引用与本地仓库安装失败的包按原地址/索引单独安装
+        """
+        return self.pyI.pip("install", "--no-deps", "--disable-pip-version-check",
+                            *self.indexArgs(), item["requirement"])
+
+    def install(self, *requirements, upgrade=False):
+        """
+        解析 -> 并发下载 -> 一次从本地仓库安装，失败的包重试或在线安装
+        """
+        result = self.resolve(*requirements, upgrade=upgrade)
+        if not result[0]:
+            if "no such option" in result[1]:
+                # pip < 22.2 不支持 --report，退回普通安装
+                options = ["install", "--upgrade"] if upgrade else ["install"]
+                return self.pyI.pip(*options, *self.indexArgs(), *requirements)
+            return result
+        if not self.items:
+            return [True, "无需安装，已是最新\n"]
+
+        self.downloadAll()
+
+        total = len(self.items)
+        progress = []
+        installed = set()
+        pending = [item for item in self.items
+                   if not item["direct"] and self.wheelhouse.verify(item["name"], item["version"])]
+        for attempt in range(self.retries + 1):
+            if not pending or self.stopped:
+                break
+            result, failed = self.installBatch(pending, progress)
+            if result[0]:
+                for item in pending:
+                    if item["name"] not in progress:
+                        progress.append(item["name"])
+                    installed.add(item["name"])
+                    self.wheelhouse.touch(item["name"], item["version"])
+                break
+            logging.warning(f"install from wheelhouse failed, attempt {attempt + 1}: {sorted(failed)}")
+            if failed:
+                # pip 在解析阶段失败时不会安装任何包: 无法满足的包改为在线安装，其余的包重试
+                pending = [item for item in pending if canonicalName(item["name"]) not in failed]
+
+        if self.stopped:
+            return (False, "Error: 已取消")
+        for index, name in enumerate(progress, 1):
+            if name in installed:
+                self.progress("installed", name, index, total)
+
+        errors = []
+        for item in self.items:
+            if item["name"] in installed:
+                continue
+            if self.stopped:
+                return (False, "Error: 已取消")
+            if item["name"] not in progress:
+                progress.append(item["name"])
+            index = progress.index(item["name"]) + 1
+            self.progress("install", item["name"], index, total)
+            result = self.installOnline(item)
+            if result[0]:
+                installed.add(item["name"])
+            else:
+                errors.append(f"{item['name']}: {result[1]}")
+            self.progress("installed", item["name"], index, total, bool(result[0]))
+
+        self.wheelhouse.evict()
+        if errors:
+            return (False, "Error: " + "\n".join(errors))
+        return [True, "Successfully installed " + " ".join(f"{item['name']}-{item['version']}"
+                                                          for item in self.items if item["name"] in installed) + "\n"]
+
+    def uninstall(self, *names, installed=None):
+        """
+        @param installed 已安装的包名集合，用于过滤未安装的包
+        """
+        if installed is not None:
+            installed = {canonicalName(name) for name in installed}
+            names = [name for name in names if canonicalName(name) in installed]
+        if not names:
+            return [True, "无需卸载\n"]
+
+        total = len(names)
+        self.progress("uninstall", " ".join(names), 0, total)
+        result = self.pyI.pip("uninstall", "-y", "--disable-pip-version-check", *names)
+        self.progress("uninstalled", " ".join(names), total, total, bool(result[0]))
+        return result
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import sys
+import codecs
+import locale
+import subprocess
+import threading
+from collections import deque
+
+from .lazy import lazyImport
+
+psutil = lazyImport("psutil")
+
+
+# 每次从管道读取的字节数
+CHUNK_SIZE = 4096
+# 界面/结果中保留的尾部行数
+TAIL_LINES = 200
+
+
+def detectEncoding():
+    """
+    子进程输出编码
+    Windows 下跟随系统 ANSI 代码页(中文系统为 cp936/gbk)，其他平台使用 locale 编码
+    """
+    encoding = None
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            encoding = f"cp{ctypes.windll.kernel32.GetACP()}"
+        except Exception:
+            encoding = None
+    if not encoding:
+        encoding = locale.getpreferredencoding(False) or "utf-8"
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+    return encoding
+
+
+ENCODING = detectEncoding()
+
+
+def useShell(cmd):
+    """
+    是否通过 shell 执行: 字符串命令需要 shell 解析; Windows 下保持原有行为全部走 shell
+    """
+    return isinstance(cmd, str) or sys.platform == "win32"
+
+
+class ProcessRunner:
+    """
+    流式子进程执行器
+
+    输出按块读取并增量解码，通过回调或生成器实时送出；
+    只在内存中保留有限的尾部行(环形缓冲)，完整日志可选写入磁盘
+    """
+
+    def __init__(self, tailLines=TAIL_LINES, logFile=None, encoding=None, onOutput=None):
+        """
+        @param tailLines 保留的尾部行数，None 表示保留全部输出
+        @param logFile 完整日志写入的文件路径，None 表示不落盘
+        @param encoding 输出编码，默认自动检测
+        @param onOutput 每个解码后的输出块的回调 callable(str)
+        """
+        self.tailLines = tailLines
+        self.logFile = logFile
+        self.encoding = encoding or ENCODING
+        self.onOutput = onOutput
+        self.process = None
+        self.returncode = None
+
+        self._lines = deque(maxlen=tailLines)
+        self._partial = ""
+        self._errLines = deque(maxlen=tailLines)
+        self._errThread = None
+
+    def start(self, cmd, shell=True, cwd=None, env=None, mergeStderr=True):
+        self._lines.clear()
+        self._errLines.clear()
+        self._partial = ""
+        self.returncode = None
+
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if mergeStderr else subprocess.PIPE,
+            shell=shell,
+            cwd=cwd,
+            env=env
+        )
+
+        if not mergeStderr:
+            # stderr 单独读取，避免管道写满导致子进程阻塞
+            self._errThread = threading.Thread(target=self._readStderr, daemon=True)
+            self._errThread.start()
+
+        return self.process
+
+    def iterOutput(self):
+        """
+        生成器: 逐块产出解码后的 stdout 文本，进程结束后返回
+        """
+        process = self.process
+        if process is None:
+            return
+
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        log = open(self.logFile, "a", encoding="utf-8") if self.logFile else None
+        try:
+            while True:
+                data = process.stdout.read1(CHUNK_SIZE)
+                if not data:
+                    text = decoder.decode(b"", final=True)
+                    if text:
+                        self._feed(text, log)
+                        yield text
+                    break
+                text = decoder.decode(data)
+                if text:
+                    self._feed(text, log)
+                    yield text
+        finally:
+            if self._partial:
+                self._lines.append(self._partial)
+                self._partial = ""
+            if log:
+                log.close()
+            process.stdout.close()
+            self.returncode = process.wait()
+            if self._errThread:
+                self._errThread.join()
+                self._errThread = None
+
+    def run(self, cmd, shell=True, cwd=None, env=None, mergeStderr=True):
+        """
+        执行命令直到结束，输出通过 onOutput 回调实时送出
+        @return 返回码
+        """
+        self.start(cmd, shell=shell, cwd=cwd, env=env, mergeStderr=mergeStderr)
+        for text in self.iterOutput():
+            if self.onOutput:
+                self.onOutput(text)
+        return self.returncode
+
+    def tail(self):
+        return "\n".join(self._lines)
+
+    def errors(self):
+        return "\n".join(self._errLines)
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            try:
+                parent = psutil.Process(self.process.pid)
+                for child in parent.children(recursive=True):
+                    child.kill()
+            except psutil.Error:
+                pass
+            self.process.kill()
+
+    def _feed(self, text, log):
+        if log:
+            log.write(text)
+
+        # \r 用于进度条刷新，同样视作换行
+        text = self._partial + text.replace("\r\n", "\n").replace("\r", "\n")
+        lines = text.split("\n")
+        self._partial = lines.pop()
+        if self.tailLines is None:
+            self._lines.extend(lines)
+        else:
+            self._lines.extend(line for line in lines if line.strip())
+
+    def _readStderr(self):
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        partial = ""
+        for data in iter(lambda: self.process.stderr.read1(CHUNK_SIZE), b""):
+            text = partial + decoder.decode(data)
+            if self.onOutput:
+                self.onOutput(text[len(partial):])
+            lines = text.replace("\r\n", "\n").split("\n")
+            partial = lines.pop()
+            self._errLines.extend(line for line in lines if line.strip())
+        partial += decoder.decode(b"", final=True)
+        if partial.strip():
+            self._errLines.append(partial)
+        self.process.stderr.close()
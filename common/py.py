@@ -8,24 +8,15 @@ email: nbxlc@hotmail.com
 from enum import Enum
 import os
 import signal
-import psutil
 import subprocess
-import requests
 
+from .process import ProcessRunner, useShell
 
 
 def getPyVer():
-    # 获取Python版本列表
-    response = requests.get('https://api.github.com/repos/python/cpython/tags')
-
-    # 解析JSON数据
-    data = response.json()
-
-    # 获取Python版本列表
-    python_versions = [tag['name'] for tag in data if tag['name'].startswith('v')]
-
-    # 打印Python版本列表
-    return python_versions
+    # 获取Python版本列表，带磁盘缓存(只在需要时导入 cache 模块)
+    from .cache import VERSION_CATALOG
+    return VERSION_CATALOG.get()
 
 # from pathlib import Path
 # pyinstaller_path = Path(sys.executable).parent.joinpath('Scripts\pyinstaller.exe')
@@ -69,7 +60,13 @@ class PyPath(Enum):
     def path(self, interpreterPath=None):
         if interpreterPath:
             (interpreterFolder, name) = os.path.split(interpreterPath)
-            return os.path.join(interpreterFolder, self.value)
+            if os.path.basename(interpreterFolder).lower() != self.SCRIPTS.value:
+                return os.path.join(interpreterFolder, self.value)
+            # venv 的 python.exe 位于 <venv>\Scripts 中: 工具与其同目录，Lib 在上一级
+            prefix = self.SCRIPTS.value + os.sep
+            if self.value.lower().startswith(prefix):
+                return os.path.join(interpreterFolder, self.value[len(prefix):])
+            return os.path.join(os.path.dirname(interpreterFolder), self.value)
         else:
             return self.value
 
@@ -78,81 +75,76 @@ class PyInterpreter:
 
     def __init__(self):
         self.process = None
+        self.runner = None
+        self.onOutput = None
+        self.logFile = None
+        self.environ = {}
 
     def setInterpreter(self, path):
         self.interpreterPath = path
         (self.interpreterFolder, name) = os.path.split(path)
 
     def setEnviron(self, **kwargs):
-        for key, value in kwargs.items():
-            os.environ[key] = value
+        """
+        设置子进程的环境变量，只作用于本实例，不修改全局 os.environ
+        """
+        self.environ.update(kwargs)
+
+    def env(self):
+        if not self.environ:
+            return None
+        env = os.environ.copy()
+        env.update(self.environ)
+        return env
+
+    def setOutputCallback(self, callback):
+        """
+        设置输出回调，子进程输出按块实时送出 callable(str)
+        """
+        self.onOutput = callback
+
+    def setLogFile(self, path):
+        """
+        设置完整日志的落盘路径，None 表示只保留尾部输出
+        """
+        self.logFile = path
 
     def stop(self):
-        if self.process and not isinstance(self.process, subprocess.CompletedProcess):
-            parent = psutil.Process(self.process.pid)
-            children = parent.children(recursive=True)
-            # print("pid", parent, children)
-            for child in children:
-                child.kill()
-            self.process.kill()
-            # self.process.terminate()
-
-            # try:
-            #     pid = self.process.pid
-            #     cmd = "taskkill /pid {} -t -f".format(str(pid))
-            #     pp = subprocess.Popen(args=cmd,
-            #                           stdin=subprocess.PIPE,
-            #                           stdout=subprocess.PIPE,
-            #                           stderr=subprocess.PIPE,
-            #                           shell=True)
-            #     out = str(pp.stdout.read(), encoding="utf-8")
-            # except Exception as e:
-            #     print(e)
-
-            self.process = None
+        if self.runner:
+            # 不清除 self.runner: 任务线程在 run() 返回后仍会读取其输出
+            self.runner.stop()
+        self.process = None
 
     def cmd(self, cmd):
         print(f"cmd: {cmd}")
 
-        self.process = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-        if self.process.returncode == 0:
-            print(f"{self.process.stdout}")
-            return [True, f"{self.process.stdout}"]
+        # 短命令: 保留完整输出, stderr 单独收集
+        runner = self.runner = ProcessRunner(tailLines=None, onOutput=self.onOutput)
+        returncode = runner.run(cmd, shell=useShell(cmd), env=self.env(), mergeStderr=False)
+        self.process = runner.process
+        stdout = runner.tail()
+        if returncode == 0:
+            return [True, f"{stdout}\n"]
         else:
-            print(f"Error: {self.process.stderr}")
-            return (False, f"Error: {self.process.stderr}")
+            print(f"Error: {runner.errors()}")
+            return (False, f"Error: {runner.errors() or stdout}")
 
     def popen(self, cmd):
         print(f"cmd: {cmd}")
 
-        # self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        # stdout, stderr = self.process.communicate()
-        # print(f"{stdout.decode('gbk'), stderr.decode('gbk')}")
-        # if self.process.returncode == 0:
-        #     return [True, f"{stdout.decode('gbk')}"]
-        # else:
-        #     return (False, f"Error: {stderr.decode('gbk')}", f"Log: {stdout.decode('gbk')}")
-
-        self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
-        outs = []
+        # 长时间任务(打包等): 只在内存中保留尾部输出, 完整日志可写入磁盘
+        runner = self.runner = ProcessRunner(logFile=self.logFile, onOutput=self.onOutput)
         try:
-            while True:
-                line = self.process.stdout.readline().decode('gbk').strip('\n') \
-                    .strip('\r').strip(' ').replace('\\\\', '\\').replace('\\\\', '\\')
-                if line == '' and self.process.poll() != None:
-                    break
-                elif line == '\n' or line == '\r' or line == '\r\n' or line == ' ' or line == '':
-                    continue
-                print(line)
-                outs.append(line)
+            returncode = runner.run(cmd, shell=useShell(cmd), env=self.env())
         except Exception as e:
             print(e)
             return (False, f"Error: {e}")
+        self.process = runner.process
 
-        if self.process.returncode == 0:
-            return [True, f"{outs}"]
+        if returncode == 0:
+            return [True, runner.tail()]
         else:
-            return (False, f"Error: {outs}")
+            return (False, f"Error: {runner.tail()}")
 
     def pip(self, *args):
         command = [self.interpreterPath, '-m', 'pip']
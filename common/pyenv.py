@@ -7,8 +7,138 @@ email: nbxlc@hotmail.com
 
 
 import os
-import subprocess
-import psutil
+import re
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+import simplejson as json
+
+from urllib.parse import urlsplit
+
+from .process import ProcessRunner, useShell
+from .download import SegmentedDownload, publishedChecksum
+from manage import ROOT_PATH, SettingPath, MIRRORS
+
+
+# pyenv-win 的版本数据库，pyenv install --list 与 pyenv update 读写该文件
+VERSIONS_DB = ".versions_cache.xml"
+VERSIONS_CACHE_FILE = os.path.join(ROOT_PATH, SettingPath, "pyenv_versions.json")
+VERSIONS_CACHE_VERSION = 1
+# pyenv-win 安装时优先使用该目录下已存在的安装包
+INSTALL_CACHE = "install_cache"
+
+# 3.12.0 / 3.13.0a1 / 2.4.3c1 / 3.11.0rc2-win32
+VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?(?:(a|b|c|rc)(\d+))?(?:-(\w+))?$")
+# 预发布阶段排序，正式版排在同号预发布之后
+STAGE_ORDER = {"a": 0, "b": 1, "c": 2, "rc": 2, None: 3}
+
+PyenvVersion = namedtuple("PyenvVersion", ["code", "key", "pre", "arch", "url"])
+
+
+def parseVersion(code, url=""):
+    """
+    版本代码 -> PyenvVersion，无法识别时返回 None
+    key 为可排序元组 (major, minor, micro, 阶段, 序号)，arch 为 "x64"(无后缀) 或后缀如 "win32"
+    """
+    match = VERSION_PATTERN.match(code.strip())
+    if not match:
+        return None
+    major, minor, micro, stage, serial, arch = match.groups()
+    key = (int(major), int(minor), int(micro or 0), STAGE_ORDER[stage], int(serial or 0))
+    return PyenvVersion(code.strip(), key, stage is not None, arch or "x64", url)
+
+
+def parseVersionsDB(path):
+    """
+    解析 .versions_cache.xml
+    @return [PyenvVersion, ...]，按版本从新到旧
+    """
+    versions = []
+    for node in ET.parse(path).getroot().iter("version"):
+        version = parseVersion(node.findtext("code", ""), node.findtext("URL", ""))
+        if version:
+            versions.append(version)
+    versions.sort(key=lambda version: version.key, reverse=True)
+    return versions
+
+
+class PyenvCatalog:
+    """
+    pyenv-win 可安装版本目录
+
+    直接读取 pyenv-win 根目录下的 .versions_cache.xml，不再执行 pyenv install --list；
+    解析结果按数据库文件的 (路径, mtime, size) 缓存在内存和 data/pyenv_versions.json 中，
+    pyenv update 改写数据库后自动重新解析
+    """
+
+    def __init__(self, path=VERSIONS_CACHE_FILE):
+        self.path = path
+        self.cache = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def dbPath(root):
+        return os.path.join(root, VERSIONS_DB)
+
+    @staticmethod
+    def stamp(dbFile):
+        stat = os.stat(dbFile)
+        return [os.path.normcase(os.path.abspath(dbFile)), stat.st_mtime_ns, stat.st_size]
+
+    def readDisk(self, stamp):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.error(f"pyenv versions cache load error: {e}")
+            return None
+        if content.get("version") != VERSIONS_CACHE_VERSION or content.get("stamp") != stamp:
+            return None
+        # simplejson 把 namedtuple 写成对象
+        return [PyenvVersion(**dict(item, key=tuple(item["key"]))) for item in content["versions"]]
+
+    def writeDisk(self, stamp, versions):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmpFile = f"{self.path}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump({"version": VERSIONS_CACHE_VERSION, "stamp": stamp, "versions": versions}, f)
+            os.replace(tmpFile, self.path)
+        except OSError as e:
+            logging.error(f"pyenv versions cache save error: {e}")
+
+    def load(self, root):
+        """
+        @return [PyenvVersion, ...] 从新到旧
+        """
+        dbFile = self.dbPath(root)
+        stamp = self.stamp(dbFile)
+        key = tuple(stamp)
+        with self._lock:
+            if key in self.cache:
+                return self.cache[key]
+            versions = self.readDisk(stamp)
+            if versions is None:
+                versions = parseVersionsDB(dbFile)
+                self.writeDisk(stamp, versions)
+            self.cache = {key: versions}
+            return versions
+
+    def versions(self, root, arch="x64", pre=False):
+        """
+        版本代码列表，不含架构后缀
+        @param arch "x64" 或 "win32"
+        @param pre 是否包含预发布版本
+        """
+        suffix = "" if arch == "x64" else f"-{arch}"
+        return [version.code[:len(version.code) - len(suffix)] for version in self.load(root)
+                if version.arch == arch and (pre or not version.pre)]
+
+
+PYENV_CATALOG = PyenvCatalog()
 
 
 class PyVenvManager():
@@ -17,46 +147,104 @@ class PyVenvManager():
     """
 
     def __init__(self, pyenv_root_path):
-        self.venvPath = os.path.join(pyenv_root_path, 'bin\\pyenv.bat')
+        self.setVenvPath(pyenv_root_path)
         self.process = None
+        self.runner = None
+        self.download = None
+        self.onOutput = None
+        self.environ = {}
+
+    def setVenvPath(self, pyenv_root_path):
+        self.root = pyenv_root_path
+        self.venvPath = os.path.join(pyenv_root_path, 'bin\\pyenv.bat')
 
     def setEnviron(self, **kwargs):
-        for key, value in kwargs.items():
-            os.environ[key] = value
+        self.environ.update(kwargs)
+
+    def env(self):
+        if not self.environ:
+            return None
+        env = os.environ.copy()
+        env.update(self.environ)
+        return env
+
+    def setOutputCallback(self, callback):
+        self.onOutput = callback
 
     def stop(self):
-        if self.process and not isinstance(self.process, subprocess.CompletedProcess):
-            self.process.terminate()
-            parent = psutil.Process(self.process.pid)
-            children = parent.children(recursive=True)
-            for child in children:
-                child.kill()
-            self.process.kill()
+        if self.download:
+            self.download.stop()
+        if self.runner:
+            # 不清除 self.runner: 任务线程在 run() 返回后仍会读取其输出
+            self.runner.stop()
+        self.process = None
 
     def cmd(self, cmd):
         print(f"cmd: {cmd}")
 
-        self.process = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-        if self.process.returncode == 0:
-            return (True, f"{self.process.stdout}")
+        runner = self.runner = ProcessRunner(tailLines=None, onOutput=self.onOutput)
+        returncode = runner.run(cmd, shell=useShell(cmd), env=self.env(), mergeStderr=False)
+        self.process = runner.process
+        if returncode == 0:
+            return (True, f"{runner.tail()}\n")
         else:
-            return (False, f"Error: {self.process.stderr}")
+            return (False, f"Error: {runner.errors() or runner.tail()}")
 
     def popen(self, cmd):
         print(f"cmd: {cmd}")
 
-        self.process = subprocess.Popen(cmd, shell=True)
-        self.process.wait()
-        if self.process.returncode == 0:
-            print(f"{self.process.stdout}")
-            return [True, f"{self.process.stdout}"]
+        runner = self.runner = ProcessRunner(onOutput=self.onOutput)
+        returncode = runner.run(cmd, shell=useShell(cmd), env=self.env())
+        self.process = runner.process
+        if returncode == 0:
+            return [True, runner.tail()]
         else:
-            print(f"Error: {self.process.stderr}")
-            return (False, f"Error: {self.process.stderr}")
+            print(f"Error: {runner.tail()}")
+            return (False, f"Error: {runner.tail()}")
 
-    def list(self):
-        command = [self.venvPath, 'install', '--list']
-        return self.cmd(command)
+    def list(self, arch="x64", pre=False):
+        """
+        可安装版本，从 pyenv-win 的版本数据库读取
+        @return [True, [版本代码, ...]] 从新到旧 or (False, "Error: ...")
+        """
+        try:
+            return [True, PYENV_CATALOG.versions(self.root, arch, pre)]
+        except (OSError, ET.ParseError) as e:
+            return (False, f"Error: {e}")
+
+    def mirrorUrls(self, url):
+        """
+        版本数据库中的下载地址 + 各镜像上的同一文件(<镜像>/<版本>/<文件名>)
+        """
+        path = "/".join(urlsplit(url).path.rstrip("/").split("/")[-2:])
+        return [url] + [f"{base.rstrip('/')}/{path}" for base in MIRRORS["pyenv"].values() if base]
+
+    def downloadInstaller(self, version, checksum=None, onProgress=None):
+        """
+        预先下载安装包到 pyenv-win 的 install_cache，pyenv install 时不再下载
+        @param checksum "sha256:<hex>" / "md5:<hex>"，None 时读取镜像上与安装包一起发布的校验文件
+        @return [True, 安装包路径] or (False, "Error: ...")
+        """
+        if not version:
+            return (False, "Error: version is empty")
+        try:
+            found = [item for item in PYENV_CATALOG.load(self.root) if item.code == version]
+        except (OSError, ET.ParseError) as e:
+            return (False, f"Error: {e}")
+        if not found or not found[0].url:
+            return (False, f"Error: 未知版本 {version}")
+        url = found[0].url
+        target = os.path.join(self.root, INSTALL_CACHE, os.path.basename(urlsplit(url).path))
+        urls = self.mirrorUrls(url)
+        if checksum is None and not os.path.exists(target):
+            checksum = publishedChecksum(urls)
+            if not checksum:
+                logging.warning(f"no published checksum for {url}, verify size only")
+        self.download = SegmentedDownload(urls, target, checksum=checksum, onProgress=onProgress)
+        try:
+            return self.download.run()
+        finally:
+            self.download = None
 
     def install(self, version):
         if not version:
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import logging
+import threading
+import xml.etree.ElementTree as ET
+import simplejson as json
+
+from .py import PyInterpreter, PyPath
+from .thread import TH_POOL
+from .uic import findFiles, contentHash, fileStat, manifestPath, toolVersion
+from manage import ROOT_PATH, SettingPath
+
+
+RCC_MANIFEST_PATH = os.path.join(ROOT_PATH, SettingPath, "rcc")
+RCC_MANIFEST_VERSION = 2
+RCC_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+# 项目类型 -> rcc 工具，PyQt6 没有 rcc，使用 PySide6 的 rcc
+RCC_TOOLS = {
+    "PySide2": PyPath.PYSIDE6_RCC,
+    "PySide6": PyPath.PYSIDE6_RCC,
+    "PyQt5": PyPath.PYQT5_RCC,
+    "PyQt6": PyPath.PYSIDE6_RCC,
+}
+
+# 项目类型 -> 生成代码中需要替换的绑定 (原, 新)
+RCC_REWRITE = {
+    "PySide2": ("PySide6", "PySide2"),
+    "PyQt6": ("PySide6", "PyQt6"),
+}
+
+# 二进制 .rcc 与绑定无关，统一使用 pyside6-rcc --binary (pyrcc5 不支持)
+RCC_BINARY_TOOL = PyPath.PYSIDE6_RCC
+
+# 二进制模式下生成的 <name>_rc.py 加载器，保持 `import xxx_rc` 与 :/ 路径的用法不变
+RCC_LOADER = '''# Resource loader for {rcc}
+# Created by: PyQt Creator (binary rcc)
+# WARNING! All changes made in this file will be lost!
+
+import os
+from {binding} import QtCore
+
+_rcc = os.path.join(os.path.dirname(os.path.abspath(__file__)), "{rcc}")
+
+
+def qInitResources():
+    # 文件资源由 Qt 内存映射，按需分页读取
+    return QtCore.QResource.registerResource(_rcc)
+
+
+def qCleanupResources():
+    return QtCore.QResource.unregisterResource(_rcc)
+
+
+qInitResources()
+'''
+
+
+def rccOutput(qrcFile):
+    """
+    resource.qrc -> resource_rc.py
+    """
+    return os.path.splitext(qrcFile)[0] + "_rc.py"
+
+
+def rccBinaryOutput(qrcFile):
+    """
+    resource.qrc -> resource.rcc
+    """
+    return os.path.splitext(qrcFile)[0] + ".rcc"
+
+
+def writeLoader(path, rccFile, binding):
+    tmpFile = f"{path}.tmp"
+    with open(tmpFile, "w", encoding="utf-8") as f:
+        f.write(RCC_LOADER.format(rcc=os.path.basename(rccFile), binding=binding))
+    os.replace(tmpFile, path)
+
+
+def parseQrc(qrcFile):
+    """
+    .qrc 中引用的资源文件(绝对路径)
+    """
+    folder = os.path.dirname(os.path.abspath(qrcFile))
+    root = ET.parse(qrcFile).getroot()
+    return sorted({os.path.normpath(os.path.join(folder, node.text.strip()))
+                   for node in root.iter("file") if node.text and node.text.strip()})
+
+
+def rewriteImports(src, dst, old, new):
+    """
+    逐行复制 rcc 输出，只替换 import 语句中的绑定名，不把整个文件读入内存
+    """
+    with open(src, "r", encoding="utf-8") as f, open(dst, "w", encoding="utf-8") as f1:
+        for line in f:
+            if line.startswith(("from ", "import ")) and old in line:
+                line = line.replace(old, new)
+            f1.write(line)
+
+
+class RccCompiler:
+    """
+    增量编译项目中的 .qrc 文件
+
+    清单(data/rcc/<项目路径哈希>.json)记录 .qrc 本身和其引用的每个资源的 mtime/size/内容哈希，
+    以及 rcc 工具版本和输出文件状态；.qrc 内容未变时沿用记录中的资源列表而不重新解析，
+    mtime 与 size 未变时不重新计算哈希，只修改了时间戳的资源不会触发重新编译
+    多个 .qrc 并发编译
+
+    binary=True 时输出二进制 <name>.rcc 与同名 <name>_rc.py 加载器，
+    资源不再以 bytes 字面量嵌入 Python 模块，导入时无需编译和反序列化
+    """
+
+    def __init__(self, interpreter, projectType, root, workers=RCC_WORKERS, onProgress=None, onOutput=None,
+                 binary=False):
+        self.interpreter = interpreter
+        self.projectType = projectType
+        self.root = root
+        self.binary = binary
+        self.mode = "binary" if binary else "python"
+        self.onProgress = onProgress
+        self.onOutput = onOutput
+        self.manifestFile = manifestPath(root, RCC_MANIFEST_PATH)
+        self.manifest = None
+        self.stopped = False
+        self._touched = False
+        self._active = set()
+        self._lock = threading.RLock()
+        self._semaphore = threading.Semaphore(workers)
+
+    def load(self):
+        if self.manifest is not None:
+            return self.manifest
+        self.manifest = {}
+        try:
+            with open(self.manifestFile, "r", encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("version") == RCC_MANIFEST_VERSION:
+                self.manifest = content.get("files", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"rcc manifest load error: {e}")
+        return self.manifest
+
+    def save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.manifestFile), exist_ok=True)
+            tmpFile = f"{self.manifestFile}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump({"version": RCC_MANIFEST_VERSION, "root": self.root, "files": self.manifest}, f, indent=4)
+            os.replace(tmpFile, self.manifestFile)
+
+    def progress(self, stage, name, index, total, ok=True):
+        if self.onProgress:
+            self.onProgress(stage, name, index, total, ok)
+
+    def stop(self):
+        self.stopped = True
+        for pyI in list(self._active):
+            pyI.stop()
+
+    @staticmethod
+    def key(qrcFile):
+        return os.path.normcase(os.path.abspath(qrcFile))
+
+    @staticmethod
+    def hashed(path, old=None):
+        """
+        {"stat", "hash"}，mtime/size 与旧记录一致时沿用旧哈希
+        """
+        stat = fileStat(path)
+        if stat is None:
+            return {"stat": None, "hash": None}
+        if old and old.get("stat") == stat:
+            return old
+        return {"stat": stat, "hash": contentHash(path)}
+
+    def state(self, qrcFile, tool, record=None):
+        """
+        .qrc 及其资源的当前状态
+        """
+        record = record or {}
+        qrc = self.hashed(qrcFile, record.get("qrc"))
+        oldAssets = record.get("assets", {})
+        if record.get("qrc", {}).get("hash") == qrc["hash"]:
+            assets = list(oldAssets)
+        else:
+            assets = parseQrc(qrcFile)
+        return {
+            "qrc": qrc,
+            "assets": {asset: self.hashed(asset, oldAssets.get(asset)) for asset in assets},
+            "tool": tool,
+            "type": self.projectType,
+            "mode": self.mode,
+        }
+
+    def outputs(self, qrcFile):
+        if self.binary:
+            return [rccBinaryOutput(qrcFile), rccOutput(qrcFile)]
+        return [rccOutput(qrcFile)]
+
+    def toolPath(self):
+        tool = RCC_BINARY_TOOL if self.binary else RCC_TOOLS[self.projectType]
+        return tool.path(self.interpreter)
+
+    def isStale(self, qrcFile, tool):
+        record = self.load().get(self.key(qrcFile))
+        if not record:
+            return True
+        current = self.state(qrcFile, tool, record)
+        if (current["qrc"]["hash"] != record["qrc"]["hash"]
+                or any(field != record.get(name)
+                       for name, field in (("tool", tool), ("type", self.projectType), ("mode", self.mode)))
+                or record.get("output") != [fileStat(path) for path in self.outputs(qrcFile)]
+                or set(current["assets"]) != set(record["assets"])
+                or any(value["hash"] != record["assets"][asset]["hash"] for asset, value in current["assets"].items())):
+            return True
+        if current["assets"] != record["assets"] or current["qrc"] != record["qrc"]:
+            # 只有时间戳变化，更新记录以免下次重复计算哈希
+            with self._lock:
+                current["output"] = record.get("output")
+                self.manifest[self.key(qrcFile)] = current
+                self._touched = True
+        return False
+
+    def compileFile(self, qrcFile):
+        """
+        编译单个 .qrc，先输出到临时文件，需要替换绑定时逐行改写，最后原子替换
+        @return [True, 输出文件] or (False, "Error: ...")
+        """
+        outFile = self.outputs(qrcFile)[0]
+        with self._semaphore:
+            if self.stopped:
+                return (False, "Error: 已取消")
+            pyI = PyInterpreter()
+            pyI.setInterpreter(self.interpreter)
+            pyI.setOutputCallback(self.onOutput)
+            self._active.add(pyI)
+            tmpFile = f"{outFile}.tmp"
+            try:
+                args = [self.toolPath(), "--binary"] if self.binary else [self.toolPath()]
+                result = pyI.cmd(args + [qrcFile, "-o", tmpFile])
+                if not result[0]:
+                    return result
+                rewrite = RCC_REWRITE.get(self.projectType)
+                if self.binary:
+                    os.replace(tmpFile, outFile)
+                    writeLoader(rccOutput(qrcFile), outFile, self.projectType)
+                elif rewrite:
+                    rewriteImports(tmpFile, f"{outFile}.part", *rewrite)
+                    os.replace(f"{outFile}.part", outFile)
+                else:
+                    os.replace(tmpFile, outFile)
+                return [True, outFile]
+            except OSError as e:
+                return (False, f"Error: {e}")
+            finally:
+                self._active.discard(pyI)
+                if os.path.exists(tmpFile):
+                    os.remove(tmpFile)
+
+    def compileAll(self, files=None, force=False):
+        """
+        @param files 指定的 .qrc 文件，None 时编译项目中的全部 .qrc
+        @param force 忽略清单强制编译
+        @return [True, {"compiled": [...], "skipped": [...]}] or (False, "Error: ...")
+        """
+        if self.projectType not in RCC_TOOLS:
+            return (False, f"Error: 不支持的项目类型 {self.projectType}")
+        self.load()
+        self._touched = False
+        files = findFiles(self.root, ".qrc") if files is None else list(files)
+        toolPath = self.toolPath()
+        tool = toolVersion(self.interpreter, "rcc", os.path.basename(toolPath), toolPath)
+        if not tool:
+            return (False, f"Error: 未找到 {toolPath}")
+
+        stale = []
+        errors = []
+        for qrcFile in files:
+            try:
+                if force or self.isStale(qrcFile, tool):
+                    stale.append(qrcFile)
+            except (OSError, ET.ParseError) as e:
+                errors.append(f"{os.path.basename(qrcFile)}: {e}")
+        staleSet = set(stale)
+        skipped = [qrcFile for qrcFile in files if qrcFile not in staleSet]
+        compiled = []
+        futures = {TH_POOL.submit(self.compileFile, qrcFile): qrcFile for qrcFile in stale}
+        for index, future in enumerate(TH_POOL.as_completed(futures), 1):
+            qrcFile = futures[future]
+            result = future.result() if future.exception() is None else (False, f"Error: {future.exception()}")
+            if result[0]:
+                try:
+                    record = self.state(qrcFile, tool)
+                except (OSError, ET.ParseError) as e:
+                    result = (False, f"Error: {e}")
+                else:
+                    record["output"] = [fileStat(path) for path in self.outputs(qrcFile)]
+                    with self._lock:
+                        self.manifest[self.key(qrcFile)] = record
+                    compiled.append(qrcFile)
+            if not result[0]:
+                errors.append(f"{os.path.basename(qrcFile)}: {result[1]}")
+            self.progress("compile", os.path.basename(qrcFile), index, len(stale), bool(result[0]))
+
+        if stale or self._touched:
+            self.save()
+        if errors:
+            return (False, "Error: " + "\n".join(errors))
+        return [True, {"compiled": compiled, "skipped": skipped}]
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import time
+import datetime
+import logging
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from .py import PyInterpreter
+from .pyenv import PyVenvManager
+from .scheduler import SCHEDULER, JobPriority
+from .metadata import METADATA
+from .pipplan import PipPlan
+from .wheelhouse import WHEELHOUSE
+from .venv import VenvManager
+from .uic import UicCompiler
+from .rcc import RccCompiler
+from manage import LIBS, MIRRORS, CURRENT_SETTINGS, REQUIREMENTS_URLS
+
+
+# 通过 pyenv 执行的命令
+PYENV_CMDS = ("init", "list", "versions", "update", "install", "uninstall")
+
+
+def isPipChange(cmd):
+    """
+    会改变解释器已安装包的命令
+    """
+    if cmd in PYENV_CMDS:
+        return False
+    return (cmd.endswith(("_install", "_upgrade", "_uninstall"))
+            or cmd.startswith(("install_", "uninstall_")))
+
+
+def pipIndexUrl():
+    """
+    设置页中选择的 pip 镜像，origin 时使用 pip 自身配置
+    """
+    mirror = CURRENT_SETTINGS["settings"].get("pip_mirror_url")
+    if not mirror or mirror == "origin":
+        return None
+    if mirror == "local":
+        return WHEELHOUSE.indexUrl()
+    return MIRRORS["pip"].get(mirror)
+
+
+def packLogFile(cmd):
+    """
+    打包任务的完整日志路径
+    """
+    if not os.path.exists("./logs"):
+        os.mkdir("logs")
+    return os.path.join("logs", f"{cmd}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}.log")
+
+
+class VenvRunner(QObject):
+    """
+    各页面共用的命令执行器
+
+    setCMD/start 的用法与原 VenvManagerThread 相同，但每次 start 都会把当前命令
+    作为一个任务提交到全局调度器排队执行，而不是在忙碌时直接拒绝
+    """
+
+    signal_result = Signal(str, object)
+    signal_output = Signal(str, str)
+    # pip 批量操作进度: cmd, {"stage", "name", "index", "total", "ok"}
+    signal_progress = Signal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.interpreter = None
+        self.venvPath = LIBS["pyenv"]
+        self.environ = {}
+        self.venvEnviron = {}
+        self.priority = JobPriority.NORMAL
+        self.cmd = None
+        self.args = ()
+        self.kwargs = {}
+
+    def setCMD(self, cmd, *args, **kwargs):
+        self.cmd = cmd
+        self.args = args
+        self.kwargs = kwargs
+
+    def setPyInterpreter(self, path):
+        self.interpreter = path
+
+    def setVenvPath(self, path):
+        self.venvPath = path
+
+    def setEnviron(self, **kwargs):
+        self.environ.update(kwargs)
+
+    def setPriority(self, priority):
+        self.priority = priority
+
+    def isRunning(self):
+        return bool(SCHEDULER.activeJobs(self))
+
+    def jobs(self):
+        return SCHEDULER.activeJobs(self)
+
+    def stop(self):
+        SCHEDULER.cancelOwner(self)
+
+    def start(self, depends=()):
+        """
+        提交当前命令
+        @param depends 需要先完成的任务
+        @return Job, 环境变量设置类命令直接生效并返回 None
+        """
+        cmd = self.cmd
+        if cmd == "environ":
+            # pyenv 的镜像等设置作用于之后的 pyenv 命令
+            self.venvEnviron.update(self.kwargs)
+            return None
+
+        pyI = PyInterpreter()
+        venvManger = PyVenvManager(self.venvPath)
+        if self.interpreter:
+            pyI.setInterpreter(self.interpreter)
+        pyI.setEnviron(**self.environ)
+        venvManger.setEnviron(**self.venvEnviron)
+        pyI.setOutputCallback(lambda text: self.signal_output.emit(cmd, text))
+        venvManger.setOutputCallback(lambda text: self.signal_output.emit(cmd, text))
+        plan = None
+        if self.interpreter:
+            plan = PipPlan(
+                self.interpreter, indexUrl=pipIndexUrl(),
+                onProgress=lambda stage, name, index, total, ok: self.signal_progress.emit(
+                    cmd, {"stage": stage, "name": name, "index": index, "total": total, "ok": ok}),
+                onOutput=lambda text: self.signal_output.emit(cmd, text)
+            )
+
+        # pyenv 命令按 pyenv 排队，其余按解释器排队
+        if cmd in PYENV_CMDS:
+            interpreter = f"pyenv:{self.venvPath}"
+        else:
+            interpreter = self.interpreter
+        priority = JobPriority.HIGH if cmd == "py_version" else self.priority
+
+        cancelled = threading.Event()
+        # 执行中创建的可取消对象(如 UicCompiler)
+        workers = []
+
+        def onCancel():
+            cancelled.set()
+            pyI.stop()
+            venvManger.stop()
+            if plan:
+                plan.stop()
+            for worker in list(workers):
+                worker.stop()
+
+        return SCHEDULER.submit(
+            self._execute, cmd, self.args, self.kwargs, pyI, venvManger, plan, workers, cancelled,
+            name=cmd, interpreter=interpreter, priority=priority,
+            depends=depends, owner=self, onCancel=onCancel
+        )
+
+    def _execute(self, cmd, args, kwargs, pyI, venvManger, plan, workers, cancelled):
+        result = self._dispatch(cmd, args, kwargs, pyI, venvManger, plan, workers)
+        if isPipChange(cmd) and getattr(pyI, "interpreterPath", None):
+            METADATA.invalidate(pyI.interpreterPath, "distributions", "tools")
+        # 被取消的任务不再回传结果
+        if result is not None and not cancelled.is_set():
+            self.signal_result.emit(cmd, result)
+        return result
+
+    def _dispatch(self, cmd, args, kwargs, pyI, venvManger, plan, workers):
+        if cmd == "py_version":
+            return METADATA.version(pyI.interpreterPath)
+
+        # pyenv
+        elif cmd == "init":
+            result = venvManger.list()
+            self.signal_result.emit("list", result)
+            result = venvManger.versions()
+            self.signal_result.emit("versions", result)
+            return result
+        elif cmd == "list":
+            return venvManger.list()
+        elif cmd == "versions":
+            return venvManger.versions()
+        elif cmd == "update":
+            return venvManger.update()
+        elif cmd == "install":
+            # 先由本程序分段下载安装包(可续传、显示字节进度)，pyenv 直接使用已下载的文件
+            result = venvManger.downloadInstaller(
+                args[0],
+                onProgress=lambda stage, name, index, total, ok: self.signal_progress.emit(
+                    cmd, {"stage": stage, "name": name, "index": index, "total": total, "ok": ok, "unit": "bytes"})
+            )
+            if not result[0]:
+                # 预下载失败(镜像不可用等)不影响安装，由 pyenv 自行下载
+                logging.warning(f"download installer {args[0]} failed: {result[1]}")
+                self.signal_output.emit(cmd, f"{result[1]}\n")
+            result = venvManger.install(args[0])
+            venvManger.rehash()
+            return result
+        elif cmd == "uninstall":
+            return venvManger.uninstall(args[0])
+
+        # 代码生成 / 资源编译
+        elif cmd == "generate_code":
+            return pyI.cmd(args)
+        elif cmd in ("uic_compile", "uic_compile_all"):
+            # args: 项目类型, 项目目录, .ui 文件...(uic_compile_all 时为空，kwargs["indexed"] 为项目索引中的文件)
+            compiler = UicCompiler(
+                pyI.interpreterPath, args[0], args[1],
+                onProgress=lambda stage, name, index, total, ok: self.signal_progress.emit(
+                    cmd, {"stage": stage, "name": name, "index": index, "total": total, "ok": ok}),
+                onOutput=lambda text: self.signal_output.emit(cmd, text)
+            )
+            workers.append(compiler)
+            files = kwargs.get("indexed") if cmd == "uic_compile_all" else args[2:]
+            return compiler.compileAll(files, force=kwargs.get("force", False))
+        elif cmd == "generate_requirements":
+            return pyI.cmd(args[0])
+        elif cmd in ("rcc_compile", "rcc_compile_all"):
+            # args: 项目类型, 项目目录, .qrc 文件...(rcc_compile_all 时为空，kwargs["indexed"] 为项目索引中的文件)
+            compiler = RccCompiler(
+                pyI.interpreterPath, args[0], args[1], binary=kwargs.get("binary", False),
+                onProgress=lambda stage, name, index, total, ok: self.signal_progress.emit(
+                    cmd, {"stage": stage, "name": name, "index": index, "total": total, "ok": ok}),
+                onOutput=lambda text: self.signal_output.emit(cmd, text)
+            )
+            workers.append(compiler)
+            files = kwargs.get("indexed") if cmd == "rcc_compile_all" else args[2:]
+            return compiler.compileAll(files, force=kwargs.get("force", False))
+        elif cmd == "py_run":
+            return pyI.py(args[0])
+
+        # designer
+        elif cmd == "designer":
+            return pyI.cmd(args)
+        elif cmd == "designer_plugin":
+            return pyI.py_popen(args)
+        elif cmd in ("thirdplugin_install", "thirdplugin_upgrade"):
+            return plan.install(REQUIREMENTS_URLS["qfluentwidgets"]["pyside6"],
+                                "git+" + REQUIREMENTS_URLS["qfluentexpand"] + "@pyside6",
+                                upgrade=cmd == "thirdplugin_upgrade")
+        elif cmd == "thirdplugin_uninstall":
+            return self._uninstall(plan, "PySide6-Fluent-Widgets", "qfluentexpand")
+
+        # 打包
+        elif cmd in ("pack_pyinstaller", "pack_nuitka"):
+            start = time.time()
+            pyI.setLogFile(packLogFile(cmd))
+            result = pyI.popen(args[0])
+            pyI.setLogFile(None)
+            if not result[0]:
+                return result
+            pyI.cmd(args[1])
+            result.append(time.time() - start)
+            return result
+        elif cmd in ("pack_setup", "setup_install"):
+            return pyI.popen(args[0])
+        elif cmd == "setuptools_install":
+            return plan.install(*args, upgrade=True)
+
+        elif cmd == "venv_create":
+            # args: 基础解释器, 项目类型, 目标目录
+            manager = VenvManager(
+                indexUrl=pipIndexUrl(),
+                onProgress=lambda stage, name, index, total, ok: self.signal_progress.emit(
+                    cmd, {"stage": stage, "name": name, "index": index, "total": total, "ok": ok}),
+                onOutput=lambda text: self.signal_output.emit(cmd, text)
+            )
+            return manager.createProjectVenv(*args)
+
+        elif cmd == "wheelhouse_prefetch":
+            return WHEELHOUSE.prefetch(pyI.interpreterPath, *args, indexUrl=pipIndexUrl(),
+                                       onOutput=lambda text: self.signal_output.emit(cmd, text))
+
+        # pip: pip_list, xxx_install / xxx_upgrade / xxx_uninstall, install_xxx / uninstall_xxx
+        elif cmd == "pip_list":
+            return METADATA.distributions(pyI.interpreterPath)
+        elif cmd == "uninstall_whl":
+            # whl 文件名的第一段即包名: {name}-{version}-...whl
+            return self._uninstall(plan, *[os.path.basename(arg).split("-")[0] for arg in args])
+        elif cmd.endswith("_uninstall") or cmd.startswith("uninstall_"):
+            return self._uninstall(plan, *args)
+        elif cmd.endswith("_upgrade"):
+            return plan.install(*args, upgrade=True)
+        elif cmd.endswith("_install") or cmd.startswith("install_"):
+            return plan.install(*args)
+
+        logging.error(f"未知命令: {cmd}")
+        return (False, "未知命令")
+
+    @staticmethod
+    def _uninstall(plan, *names):
+        result = METADATA.distributions(plan.interpreter)
+        installed = [dist["name"] for dist in result[1]] if result[0] else None
+        return plan.uninstall(*names, installed=installed)
+
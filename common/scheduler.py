@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import time
+import heapq
+import logging
+import itertools
+import threading
+from enum import Enum, IntEnum
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal
+
+
+class JobState(Enum):
+
+    PENDING = "等待"
+    RUNNING = "运行中"
+    FINISHED = "完成"
+    FAILED = "失败"
+    CANCELLED = "已取消"
+
+
+class JobPriority(IntEnum):
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class Job:
+    """
+    调度器中的一个任务
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name, func, args=(), kwargs=None, interpreter=None,
+                 priority=JobPriority.NORMAL, depends=(), owner=None, onCancel=None):
+        self.id = next(Job._ids)
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.interpreter = interpreter
+        self.priority = priority
+        self.depends = list(depends)
+        self.owner = owner
+        self.onCancel = onCancel
+
+        self.state = JobState.PENDING
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.cancelEvent = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.cancelEvent.is_set()
+
+    def isDone(self):
+        return self.state in (JobState.FINISHED, JobState.FAILED, JobState.CANCELLED)
+
+    def elapsed(self):
+        if not self.started:
+            return 0
+        return (self.finished or time.time()) - self.started
+
+    def __lt__(self, other):
+        return (self.priority, self.id) < (other.priority, other.id)
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.name} {self.state.name}>"
+
+
+class JobScheduler(QObject):
+    """
+    全局任务调度器
+
+    有界工作线程池 + 按解释器的并发上限 + 优先级队列(同优先级先进先出)，
+    支持取消与任务依赖；任务返回 [False, ...] 形式的结果或抛出异常视为失败
+    """
+
+    jobChanged = Signal(object)
+
+    def __init__(self, maxWorkers=None, interpreterLimit=2, parent=None):
+        super().__init__(parent)
+        self.maxWorkers = maxWorkers or min(4, os.cpu_count() or 1)
+        self.interpreterLimit = interpreterLimit
+        self.interpreterLimits = {}
+
+        self._lock = threading.RLock()
+        self._queue = []
+        self._jobs = {}
+        self._running = {}
+        self._pool = None
+
+    def setInterpreterLimit(self, interpreter, limit):
+        """
+        单独设置某个解释器的并发上限
+        """
+        with self._lock:
+            self.interpreterLimits[interpreter] = limit
+        self._schedule()
+
+    def submit(self, func, *args, name="", interpreter=None, priority=JobPriority.NORMAL,
+               depends=(), owner=None, onCancel=None, **kwargs):
+        """
+        提交任务
+        @param depends 依赖的任务列表，全部完成后才会执行；任一失败或取消则本任务取消
+        @return Job
+        """
+        job = Job(name or getattr(func, "__name__", "job"), func, args, kwargs,
+                  interpreter=interpreter, priority=priority, depends=depends,
+                  owner=owner, onCancel=onCancel)
+        with self._lock:
+            self._jobs[job.id] = job
+            heapq.heappush(self._queue, job)
+        logging.debug(f"job submit: {job}")
+        self.jobChanged.emit(job)
+        self._schedule()
+        return job
+
+    def cancel(self, job):
+        with self._lock:
+            if job.isDone():
+                return
+            job.cancelEvent.set()
+            if job.state == JobState.PENDING:
+                self._queue.remove(job)
+                heapq.heapify(self._queue)
+                self._finish(job, JobState.CANCELLED)
+
+        if job.state == JobState.RUNNING and job.onCancel:
+            try:
+                job.onCancel()
+            except Exception as e:
+                logging.error(e)
+        self._schedule()
+
+    def cancelOwner(self, owner):
+        for job in self.activeJobs(owner):
+            self.cancel(job)
+
+    def job(self, jobId):
+        return self._jobs.get(jobId)
+
+    def jobs(self):
+        """
+        任务表快照，按提交顺序
+        """
+        with self._lock:
+            return list(self._jobs.values())
+
+    def activeJobs(self, owner=None):
+        with self._lock:
+            return [job for job in self._jobs.values()
+                    if not job.isDone() and (owner is None or job.owner is owner)]
+
+    def clearFinished(self):
+        with self._lock:
+            for jobId in [jobId for jobId, job in self._jobs.items() if job.isDone()]:
+                del self._jobs[jobId]
+
+    def shutdown(self, wait=False):
+        for job in self.activeJobs():
+            self.cancel(job)
+        if self._pool:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def _limit(self, interpreter):
+        return self.interpreterLimits.get(interpreter, self.interpreterLimit)
+
+    def _schedule(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix="job")
+
+            blocked = []
+            while self._queue and len(self._running) < self.maxWorkers:
+                job = heapq.heappop(self._queue)
+
+                states = [dep.state for dep in job.depends]
+                if any(state in (JobState.FAILED, JobState.CANCELLED) for state in states):
+                    job.error = "依赖任务失败"
+                    self._finish(job, JobState.CANCELLED)
+                    continue
+                if any(state != JobState.FINISHED for state in states):
+                    blocked.append(job)
+                    continue
+
+                if job.interpreter:
+                    count = sum(1 for running in self._running.values()
+                                if running.interpreter == job.interpreter)
+                    if count >= self._limit(job.interpreter):
+                        blocked.append(job)
+                        continue
+
+                job.state = JobState.RUNNING
+                job.started = time.time()
+                self._running[job.id] = job
+                self.jobChanged.emit(job)
+                self._pool.submit(self._run, job)
+
+            for job in blocked:
+                heapq.heappush(self._queue, job)
+
+    def _run(self, job):
+        state = JobState.FINISHED
+        try:
+            job.result = job.func(*job.args, **job.kwargs)
+            if isinstance(job.result, (list, tuple)) and job.result and job.result[0] is False:
+                state = JobState.FAILED
+        except Exception as e:
+            logging.exception(e)
+            job.error = str(e)
+            state = JobState.FAILED
+
+        if job.cancelled:
+            state = JobState.CANCELLED
+
+        with self._lock:
+            self._running.pop(job.id, None)
+            self._finish(job, state)
+        self._schedule()
+
+    def _finish(self, job, state):
+        job.state = state
+        job.finished = time.time()
+        logging.debug(f"job finish: {job} {job.elapsed():.2f}s")
+        self.jobChanged.emit(job)
+
+        # 依赖本任务的等待项需要重新检查
+        if state != JobState.FINISHED:
+            for other in list(self._queue):
+                if job in other.depends:
+                    self._queue.remove(other)
+                    heapq.heapify(self._queue)
+                    other.error = "依赖任务失败"
+                    self._finish(other, JobState.CANCELLED)
+
+
+SCHEDULER = JobScheduler()
@@ -1,6 +1,9 @@
 # coding=utf-8
-import paramiko
-from scp import SCPClient
+from .lazy import lazyImport
+
+# paramiko 与其加密依赖导入较慢，只在使用 SSH 时导入
+paramiko = lazyImport("paramiko")
+scp = lazyImport("scp")
 
 class SSH(object):
 
@@ -43,11 +46,11 @@ class SSH(object):
         return self.client.exec_command(cmd, bufsize)
     
     def upload(self, localpath, remotepath):
-        self.sftpclient = SCPClient(self.client.get_transport(), socket_timeout=15.0)
+        self.sftpclient = scp.SCPClient(self.client.get_transport(), socket_timeout=15.0)
         self.sftpclient.put(localpath, remotepath)
 
     def download(self, localpath, remotepath):
-        self.sftpclient = SCPClient(self.client.get_transport(), socket_timeout=15.0)
+        self.sftpclient = scp.SCPClient(self.client.get_transport(), socket_timeout=15.0)
         self.sftpclient.get(remotepath, localpath)
 
     def close(self):
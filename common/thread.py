@@ -9,30 +9,129 @@ email: nbxlc@hotmail.com
 import os, sys
 import subprocess
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+from PySide6.QtCore import QObject, Signal
+
+
+class MainThreadBridge(QObject):
+    """
+    把后台线程的回调转到 Qt 主线程执行
+    需在主线程中创建，跨线程 emit 时自动走队列连接
+    """
+
+    signal_call = Signal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.signal_call.connect(self.on_call)
+
+    def call(self, func, *args):
+        self.signal_call.emit(func, args)
+
+    def on_call(self, func, args):
+        try:
+            func(*args)
+        except Exception as e:
+            logging.exception(e)
 
 
 class ThreadPool():
-    def __init__(self, max_workers=5):
-        self.max_workers = max_workers
+    """
+    全局线程池，submit 返回 Future，不阻塞调用方
+    """
+
+    def __init__(self, max_workers=None):
+        # 任务以等待子进程/网络为主，按 cpu 数适当放大
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.pool = None
+        self.bridge = None
+        self._lock = threading.Lock()
 
     def init(self):
-        self.pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        with self._lock:
+            if self.pool is None:
+                self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pool")
+        return self.pool
+
+    def submit(self, func, *args, **kwargs):
+        """
+        @return concurrent.futures.Future
+        """
+        return self.init().submit(func, *args, **kwargs)
+
+    def map(self, func, *iterables, timeout=None):
+        """
+        并发执行，按输入顺序产出结果
+        """
+        return self.init().map(func, *iterables, timeout=timeout)
+
+    def submitBatch(self, func, iterable):
+        """
+        对每个元素提交一个任务
+        @return {Future: item}
+        """
+        pool = self.init()
+        return {pool.submit(func, item): item for item in iterable}
+
+    @staticmethod
+    def as_completed(futures, timeout=None):
+        return as_completed(futures, timeout=timeout)
+
+    @staticmethod
+    def wait(futures, timeout=None):
+        return wait(futures, timeout=timeout)
+
+    def setBridge(self, bridge=None):
+        """
+        在主线程中调用，创建主线程回调桥
+        """
+        self.bridge = bridge or MainThreadBridge()
+
+    def addCallback(self, future, callback, errback=None):
+        """
+        Future 完成后在 Qt 主线程中调用 callback(result)，异常时调用 errback(exception)
+        """
+        if self.bridge is None:
+            self.setBridge()
+
+        def done(fut):
+            if fut.cancelled():
+                return
+            error = fut.exception()
+            if error is None:
+                self.bridge.call(callback, fut.result())
+            elif errback:
+                self.bridge.call(errback, error)
+            else:
+                logging.error(error)
 
-    def submit(self, func, *args):
-        if len(args) > 0:
-            th = self.pool.submit(func, args)
-        else:
-            th = self.pool.submit(func)
-        return th.result()
+        future.add_done_callback(done)
+        return future
+
+    def submitUi(self, callback, func, *args, errback=None, **kwargs):
+        """
+        后台执行 func，结果回到主线程交给 callback
+        """
+        return self.addCallback(self.submit(func, *args, **kwargs), callback, errback)
+
+    def shutdown(self, wait=False):
+        with self._lock:
+            if self.pool is not None:
+                self.pool.shutdown(wait=wait, cancel_futures=True)
+                self.pool = None
 
-    def shutdown(self):
-        self.pool.shutdown()
+    def bindApp(self, app):
+        """
+        绑定到 QApplication: 主线程回调桥 + 退出时关闭线程池
+        """
+        self.setBridge(MainThreadBridge(app))
+        app.aboutToQuit.connect(self.shutdown)
 
 
 
 TH_POOL = ThreadPool()
-TH_POOL.init()
 
 
 class CommandRunner:
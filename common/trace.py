@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+启动追踪: 记录启动各阶段的耗时，输出 Chrome trace JSON (chrome://tracing 或 Perfetto 打开) 与日志摘要
+    python main.py --trace-startup[=logs/startup.json]
+    PYQT_CREATOR_TRACE=1 python main.py          # 或 PYQT_CREATOR_TRACE=<输出文件>
+未启用时所有接口都是空操作；本模块应在其他重量级模块之前导入，才能统计到它们的导入耗时
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+import contextlib
+import simplejson as json
+from collections import defaultdict
+from importlib.abc import MetaPathFinder
+
+from manage import LOGFILE
+
+
+TRACE_OPTION = "--trace-startup"
+TRACE_ENV = "PYQT_CREATOR_TRACE"
+# 启动到首次绘制超过该时间(秒)时在摘要中给出警告
+STARTUP_BUDGET = 1.0
+# 摘要中列出的导入耗时最多的顶层包数量
+SUMMARY_IMPORTS = 10
+
+
+class _TimedLoader:
+    """
+    包装模块的 loader，统计 exec_module 的耗时
+    执行前把 __loader__/__spec__.loader 还原为原 loader，模块看不到包装
+    """
+
+    def __init__(self, trace, loader):
+        self.trace = trace
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        with self.trace.importSpan(module.__name__):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _ImportFinder(MetaPathFinder):
+    """
+    放在 sys.meta_path 最前面，交给其余 finder 查找后替换 spec.loader
+    """
+
+    def __init__(self, trace):
+        self.trace = trace
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "busy", False) or not self.trace.enabled:
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(self.trace, spec.loader)
+                    return spec
+            return None
+        finally:
+            self._local.busy = False
+
+
+class StartupTrace:
+    """
+    启动追踪
+    span(name) 记录一个阶段(Chrome trace 中的 "X" 事件)，mark(name) 记录一个时间点("i" 事件)，
+    导入耗时按模块记录为 import 分类的事件，摘要中按顶层包汇总自身耗时(不含子模块导入)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output = None
+        self.origin = time.perf_counter()
+        self.events = []
+        self.phases = []
+        self.importSelf = defaultdict(float)
+        self.importCount = defaultdict(int)
+        self.finder = None
+        self.summarized = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @staticmethod
+    def option(argv=None, environ=None):
+        """
+        从命令行或环境变量读取追踪设置
+        @return (是否启用, 输出文件 or None)
+        """
+        argv = sys.argv if argv is None else argv
+        environ = os.environ if environ is None else environ
+        for arg in argv[1:]:
+            if arg == TRACE_OPTION:
+                return True, None
+            if arg.startswith(f"{TRACE_OPTION}="):
+                return True, arg.split("=", 1)[1] or None
+        value = environ.get(TRACE_ENV, "").strip()
+        if value.lower() in ("", "0", "false", "no", "off"):
+            return False, None
+        if value.lower() in ("1", "true", "yes", "on"):
+            return True, None
+        return True, value
+
+    def enable(self, output=None):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.output = output or os.path.join(os.path.dirname(LOGFILE) or ".",
+                                             time.strftime("startup-%Y%m%d-%H%M%S.json"))
+        self.finder = _ImportFinder(self)
+        sys.meta_path.insert(0, self.finder)
+
+    def disable(self):
+        self.enabled = False
+        if self.finder in sys.meta_path:
+            sys.meta_path.remove(self.finder)
+        self.finder = None
+
+    def now(self):
+        """
+        相对追踪起点的微秒数
+        """
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def addEvent(self, name, category, start, duration=None, args=None):
+        event = {"name": name, "cat": category, "ts": round(start, 1),
+                 "pid": os.getpid(), "tid": threading.get_ident()}
+        if duration is None:
+            event.update({"ph": "i", "s": "p"})
+        else:
+            event.update({"ph": "X", "dur": round(duration, 1)})
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+        return event
+
+    def complete(self, name, start=0.0, category="startup"):
+        """
+        记录从 start(微秒，默认为追踪起点)到现在的阶段
+        """
+        if not self.enabled:
+            return
+        duration = self.now() - start
+        self.addEvent(name, category, start, duration)
+        if category == "startup":
+            with self._lock:
+                self.phases.append((name, duration))
+
+    @contextlib.contextmanager
+    def span(self, name, category="startup"):
+        if not self.enabled:
+            yield
+            return
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.complete(name, start, category)
+
+    def mark(self, name, category="startup"):
+        if self.enabled:
+            self.addEvent(name, category, self.now())
+
+    @contextlib.contextmanager
+    def importSpan(self, name):
+        """
+        记录一个模块的导入，自身耗时 = 总耗时 - 期间导入子模块的耗时
+        """
+        stack = self._local.__dict__.setdefault("stack", [])
+        start = self.now()
+        stack.append(0.0)
+        try:
+            yield
+        finally:
+            duration = self.now() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += duration
+            top = name.partition(".")[0]
+            with self._lock:
+                self.importSelf[top] += duration - children
+                self.importCount[top] += 1
+            self.addEvent(f"import {name}", "import", start, duration)
+
+    def save(self):
+        """
+        写出 Chrome trace JSON，可多次调用(如首次绘制后与退出时)
+        """
+        if not self.enabled or not self.output:
+            return
+        with self._lock:
+            events = list(self.events)
+        try:
+            folder = os.path.dirname(self.output)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            tmpFile = f"{self.output}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+            os.replace(tmpFile, self.output)
+        except OSError as e:
+            logging.error(f"startup trace save error: {e}")
+
+    def summary(self):
+        """
+        首次绘制的时间、各阶段与导入耗时最多的顶层包
+        """
+        lines = [f"startup trace: first paint at {self.now() / 1000:.1f}ms -> {self.output}"]
+        with self._lock:
+            phases = list(self.phases)
+            imports = sorted(self.importSelf.items(), key=lambda item: item[1], reverse=True)
+        for name, duration in phases:
+            lines.append(f"  {name:<24} {duration / 1000:8.1f}ms")
+        total = sum(duration for _, duration in imports)
+        lines.append(f"  imports (self time)      {total / 1000:8.1f}ms")
+        for top, duration in imports[:SUMMARY_IMPORTS]:
+            lines.append(f"    {top:<22} {duration / 1000:8.1f}ms  ({self.importCount[top]} modules)")
+        return "\n".join(lines)
+
+    def firstPaint(self):
+        """
+        主窗口首次绘制: 记录时间点、停止统计导入、写出文件与摘要
+        之后的 span (如页面预热) 仍会记录，退出时再次 save
+        """
+        if not self.enabled or self.summarized:
+            return
+        self.summarized = True
+        self.mark("first paint")
+        if self.finder in sys.meta_path:
+            sys.meta_path.remove(self.finder)
+        self.save()
+        elapsed = self.now() / 1e6
+        logging.info(self.summary())
+        if elapsed > STARTUP_BUDGET:
+            logging.warning(f"startup trace: first paint {elapsed:.2f}s exceeds budget {STARTUP_BUDGET:.2f}s")
+        from .lazy import importBudget
+        result = importBudget()
+        if not result[0]:
+            logging.warning(f"startup trace: {result[1]}")
+
+
+TRACE = StartupTrace()
+_enabled, _output = StartupTrace.option()
+if _enabled:
+    TRACE.enable(_output)
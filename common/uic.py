@@ -0,0 +1,783 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import re
+import sys
+import hashlib
+import logging
+import itertools
+import threading
+import subprocess
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import xml.etree.ElementTree as ElementTree
+import simplejson as json
+
+from .py import PyInterpreter, PyPath
+from .thread import TH_POOL
+from .metadata import METADATA, fingerprint
+from manage import ROOT_PATH, SettingPath
+
+
+UIC_MANIFEST_PATH = os.path.join(ROOT_PATH, SettingPath, "uic")
+UIC_MANIFEST_VERSION = 1
+UIC_WORKERS = max(1, min(8, os.cpu_count() or 1))
+UIC_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uicworker.py")
+UIC_TIMEOUT = 60
+FORM_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uicformworker.py")
+FORM_TIMEOUT = 30
+SIGNATURE_DB_PATH = os.path.join(ROOT_PATH, SettingPath, "signatures")
+SIGNATURE_DB_VERSION = 1
+
+# 项目类型 -> uic 工具
+UIC_TOOLS = {
+    "PySide2": PyPath.PYSIDE6_UIC,
+    "PySide6": PyPath.PYSIDE6_UIC,
+    "PyQt5": PyPath.PYQT5_UIC,
+    "PyQt6": PyPath.PYQT6_UIC,
+}
+
+# 项目类型 -> 解析窗体使用的 Qt 绑定
+FORM_BINDINGS = {
+    "PySide2": "PySide2",
+    "PySide6": "PySide6",
+    "PyQt5": "PyQt5",
+    "PyQt6": "PyQt6",
+    "E7Plugin": "PyQt6",
+}
+
+# 查找 .ui 文件时跳过的目录
+SKIP_DIRS = {"__pycache__", "venv", ".venv", "env", "build", "dist", "node_modules", "site-packages"}
+
+
+def uicOutput(uiFile):
+    """
+    form.ui -> Ui_form.py
+    """
+    (filePath, fileName) = os.path.split(uiFile)
+    return os.path.join(filePath, "Ui_" + os.path.splitext(fileName)[0] + ".py")
+
+
+def findFiles(root, suffix):
+    """
+    查找项目中指定后缀的文件，跳过隐藏目录与虚拟环境、构建输出等目录
+    """
+    result = []
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        result.append(entry.path)
+        except OSError as e:
+            logging.debug(f"scan {suffix} error: {folder} {e}")
+    return sorted(result)
+
+
+def findUiFiles(root):
+    return findFiles(root, ".ui")
+
+
+def contentHash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def fileStat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def manifestPath(root, folder=UIC_MANIFEST_PATH):
+    digest = hashlib.sha1(os.path.normcase(os.path.abspath(root)).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(folder, f"{digest}.json")
+
+
+def toolVersion(interpreter, field, name, tool):
+    """
+    命令行工具的版本(tool --version)，缓存在解释器元数据的 field 中(site-packages 变化后自动失效)
+    """
+    entry = METADATA.entry(interpreter)
+    versions = entry.get(field, {})
+    if name in versions:
+        return versions[name]
+
+    if not os.path.exists(tool):
+        return ""
+    pyI = PyInterpreter()
+    pyI.setInterpreter(interpreter)
+    result = pyI.cmd([tool, "--version"])
+    version = result[1].strip() if result[0] else ""
+    if version:
+        versions = dict(versions, **{name: version})
+        METADATA.update(interpreter, **{field: versions})
+    return version
+
+
+def uicIdentity(interpreter, projectType):
+    """
+    清单中记录的 uic 标识 "<绑定> <版本>"，与 UicWorker 就绪时报告的 version 相同
+    常驻进程与 pyuic/pyside6-uic 命令行生成相同的代码，两种方式共用一个标识，
+    互相切换时不会因标识不同而重新编译全部 .ui；版本取自已安装包的元数据，不启动子进程
+    @return 标识 or ""(未安装该绑定)
+    """
+    result = METADATA.distributions(interpreter)
+    if not result[0]:
+        return ""
+    for dist in result[1]:
+        if dist["name"].lower() == projectType.lower():
+            return f"{projectType} {dist['version']}"
+    return ""
+
+
+class UicWorker:
+    """
+    常驻的 uic 编译进程(common/uicworker.py)，每个解释器和 Qt 绑定一个
+    启动后只需一次解释器启动与模块导入，之后每个 .ui 只是一次管道往返
+    """
+
+    SCRIPT = UIC_WORKER_SCRIPT
+
+    def __init__(self, interpreter, binding):
+        self.interpreter = interpreter
+        self.binding = binding
+        self.version = ""
+        self.error = ""
+        self.process = None
+        self.fingerprint = fingerprint(interpreter)
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        启动并等待就绪
+        @return bool
+        """
+        creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        env = dict(os.environ, PYTHONIOENCODING="utf-8")
+        try:
+            self.process = subprocess.Popen(
+                [self.interpreter, self.SCRIPT, self.binding],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                encoding="utf-8", bufsize=1, env=env, creationflags=creationflags
+            )
+            hello = json.loads(self.process.stdout.readline() or "{}")
+        except (OSError, ValueError) as e:
+            hello = {"ready": False, "error": str(e)}
+        if not hello.get("ready"):
+            self.error = hello.get("error", "worker exited")
+            logging.info(f"{self.SCRIPT} unavailable: {self.interpreter} {self.binding} {self.error}")
+            self.stop()
+            return False
+
+        self.version = hello["version"]
+        threading.Thread(target=self._read, daemon=True).start()
+        logging.info(f"{os.path.basename(self.SCRIPT)} ready: {self.interpreter} {self.version}")
+        return True
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def _read(self):
+        process = self.process
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+            with self._lock:
+                future = self._pending.pop(response.get("id"), None)
+            if future:
+                future.set_result(response)
+        # 进程退出，等待中的请求全部失败
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_result({"ok": False, "error": "worker exited"})
+
+    def request(self, **payload):
+        """
+        @return Future -> 响应 {"ok": bool, "error": str, ...}
+        """
+        future = Future()
+        with self._lock:
+            requestId = next(self._ids)
+            self._pending[requestId] = future
+            try:
+                self.process.stdin.write(json.dumps(dict(payload, id=requestId)) + "\n")
+                self.process.stdin.flush()
+            except (OSError, AttributeError, ValueError) as e:
+                self._pending.pop(requestId, None)
+                future.set_result({"ok": False, "error": str(e)})
+        return future
+
+    def submit(self, uiFile, outFile):
+        """
+        @return Future -> {"ok": bool, "error": str}
+        """
+        return self.request(ui=uiFile, out=outFile)
+
+    def compile(self, uiFile, outFile, timeout=UIC_TIMEOUT):
+        """
+        @return [True, 输出文件] or (False, "Error: ...")
+        """
+        try:
+            response = self.submit(uiFile, outFile).result(timeout)
+        except FutureTimeoutError:
+            return (False, "Error: uic 超时")
+        if response["ok"]:
+            return [True, outFile]
+        return (False, f"Error: {response.get('error', '')}")
+
+    def stop(self):
+        process, self.process = self.process, None
+        if process and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(2)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+
+
+class UicFormWorker(UicWorker):
+    """
+    常驻的窗体解析进程(common/uicformworker.py)
+    加载一次窗体即得到对象名、类名与全部信号，替代每项查询启动一次 UicLoadUi*.py
+    """
+
+    SCRIPT = FORM_WORKER_SCRIPT
+
+    def introspect(self, forms, timeout=FORM_TIMEOUT):
+        """
+        @param forms [(窗体文件, 项目目录), ...]
+        @return [True, [{"form", "ok", "object_name", "class_name", "signatures"} or {"form", "ok", "error"}]]
+                or (False, "Error: ...")
+        """
+        forms = [{"form": form, "path": path} for form, path in forms]
+        try:
+            # 批量请求按窗体数放宽超时
+            response = self.request(forms=forms).result(timeout * max(1, len(forms)))
+        except FutureTimeoutError:
+            return (False, "Error: 窗体解析超时")
+        if response["ok"]:
+            return [True, response["results"]]
+        return (False, f"Error: {response.get('error', '')}")
+
+    def classes(self, timeout=UIC_TIMEOUT):
+        """
+        绑定中全部控件类的信号(读取 staticMetaObject，不创建实例)
+        @return [True, {类名: {"super": 父类名, "signals": [...]}}] or (False, "Error: ...")
+        """
+        try:
+            response = self.request(classes=True).result(timeout)
+        except FutureTimeoutError:
+            return (False, "Error: 读取控件类超时")
+        if response["ok"]:
+            return [True, response["classes"]]
+        return (False, f"Error: {response.get('error', '')}")
+
+
+class UicWorkerPool:
+    """
+    按 (解释器, Qt 绑定) 管理常驻 uic 进程
+    解释器或 site-packages 变化(如升级 PySide6)后重启；启动失败的组合不再重试，直到环境变化
+    """
+
+    def __init__(self, workerClass=UicWorker):
+        self.workerClass = workerClass
+        self.workers = {}
+        self._lock = threading.Lock()
+        self._starting = {}
+
+    @staticmethod
+    def key(interpreter, binding):
+        return (os.path.normcase(os.path.abspath(interpreter)), binding)
+
+    def get(self, interpreter, binding):
+        """
+        @return 可用的 workerClass 实例 or None
+        """
+        key = self.key(interpreter, binding)
+        with self._lock:
+            worker = self.workers.get(key)
+            if worker and worker.fingerprint == fingerprint(interpreter) and (worker.alive() or worker.error):
+                return worker if not worker.error else None
+            if worker:
+                worker.stop()
+            # 同一组合只启动一次，其余调用者等待
+            event = self._starting.get(key)
+            starting = event is None
+            if starting:
+                event = self._starting[key] = threading.Event()
+
+        if not starting:
+            event.wait()
+            worker = self.workers.get(key)
+            return worker if worker and not worker.error else None
+
+        worker = self.workerClass(interpreter, binding)
+        worker.start()
+        with self._lock:
+            self.workers[key] = worker
+            self._starting.pop(key).set()
+        return worker if not worker.error else None
+
+    def warm(self, interpreter, binding):
+        """
+        后台预启动，打开项目时调用
+        """
+        if interpreter and binding in UIC_TOOLS:
+            return TH_POOL.submit(self.get, interpreter, binding)
+
+    def shutdown(self):
+        with self._lock:
+            workers, self.workers = self.workers, {}
+        for worker in workers.values():
+            worker.stop()
+
+
+UIC_POOL = UicWorkerPool()
+FORM_POOL = UicWorkerPool(UicFormWorker)
+
+
+def parseForm(formFile):
+    """
+    直接读取 .ui 的 XML，不加载窗体
+    @return {"object_name", "class_name", "objects": [[对象名, 类名], ...]}
+    """
+    root = ElementTree.parse(formFile).getroot()
+    top = root.find("widget")
+    if top is None:
+        raise ValueError(f"{formFile} 中没有顶层控件")
+    widgets, actions = [], []
+    for element in top.iter():
+        if element is top:
+            continue
+        name = element.get("name", "")
+        if not name or name.startswith("qt_"):
+            continue
+        if element.tag == "widget":
+            # uic 的 Line 是 QFrame
+            className = element.get("class", "")
+            widgets.append([name, "QFrame" if className == "Line" else className])
+        elif element.tag == "action":
+            actions.append([name, "QAction"])
+    return {"object_name": top.get("name", ""), "class_name": top.get("class", ""), "objects": widgets + actions}
+
+
+def formSignatures(objects, classes):
+    """
+    [对象名, 类名] 与类的信号 -> 生成代码对话框使用的信号列表(与 UicLoadUi*.py 的 signatures 命令格式相同)
+    """
+    chains = {}
+
+    def classSignals(className):
+        if className not in chains:
+            entry = classes[className]
+            inherited = classSignals(entry["super"]) if entry["super"] in classes else []
+            chains[className] = inherited + entry["signals"]
+        return chains[className]
+
+    objectsList = []
+    for name, className in objects:
+        methods = []
+        for signal in classSignals(className):
+            method = "on_{0}_{1}".format(name, signal["signature"].split("(")[0])
+            parameterNames = signal["parameter_names"]
+            if parameterNames:
+                pythonSignature = "{0}(self, {1})".format(method, ", ".join(parameterNames))
+            else:
+                pythonSignature = "{0}(self)".format(method)
+            methods.append({
+                "signature": "on_{0}_{1}".format(name, signal["signature"]),
+                "methods": [method, "{0}({1})".format(method, ", ".join(signal["parameter_types"]))],
+                "return_type": signal["return_type"],
+                "parameter_types": signal["parameter_types"],
+                "pyqt_signature": ", ".join(signal["parameter_types"]),
+                "parameter_names": parameterNames,
+                "python_signature": pythonSignature,
+            })
+        objectsList.append({"name": name, "class_name": className, "methods": methods})
+    return objectsList
+
+
+class SignatureDatabase:
+    """
+    控件类信号数据库，每个 (Qt 绑定, 版本) 一个文件 data/signatures/<绑定>-<版本>.json
+
+    由 UicFormWorker 读取绑定中全部控件类的 staticMetaObject 一次生成，每个类只保存本类声明的信号与父类名；
+    解释器对应的版本记录在解释器元数据中(site-packages 变化后失效)，之后查询只读文件，不启动进程
+    """
+
+    def __init__(self, folder=SIGNATURE_DB_PATH, pool=FORM_POOL):
+        self.folder = folder
+        self.pool = pool
+        self.databases = {}
+        self._lock = threading.Lock()
+
+    def dbFile(self, version):
+        return os.path.join(self.folder, re.sub(r"[^\w.]+", "-", version) + ".json")
+
+    def load(self, version):
+        with self._lock:
+            if version in self.databases:
+                return self.databases[version]
+        try:
+            with open(self.dbFile(version), "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.error(f"signature database load error: {e}")
+            return None
+        if content.get("version") != SIGNATURE_DB_VERSION or content.get("qt") != version:
+            return None
+        with self._lock:
+            self.databases[version] = content["classes"]
+        return content["classes"]
+
+    def save(self, version, classes):
+        with self._lock:
+            self.databases[version] = classes
+        dbFile = self.dbFile(version)
+        tmpFile = f"{dbFile}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump({"version": SIGNATURE_DB_VERSION, "qt": version, "classes": classes}, f)
+            os.replace(tmpFile, dbFile)
+        except Exception as e:
+            logging.error(f"signature database save error: {e}")
+
+    def get(self, interpreter, binding):
+        """
+        阻塞，首次使用某个版本时启动 UicFormWorker 生成
+        @return {类名: {"super", "signals"}} or None(无法生成)
+        """
+        versions = METADATA.entry(interpreter).get("formSignatures", {})
+        if binding in versions:
+            classes = self.load(versions[binding])
+            if classes is not None:
+                return classes
+
+        worker = self.pool.get(interpreter, binding)
+        if worker is None:
+            return None
+        classes = self.load(worker.version)
+        if classes is None:
+            result = worker.classes()
+            if not result[0]:
+                logging.error(f"signature database {worker.version} {result[1]}")
+                return None
+            classes = result[1]
+            self.save(worker.version, classes)
+            logging.info(f"signature database {worker.version}: {len(classes)} classes")
+        METADATA.update(interpreter, formSignatures=dict(versions, **{binding: worker.version}))
+        return classes
+
+
+SIGNATURE_DB = SignatureDatabase()
+
+
+class FormIntrospector:
+    """
+    .ui 窗体的对象名、类名与信号
+
+    直接读取 .ui 的 XML，按类名从 SIGNATURE_DB 查出信号，不加载窗体；
+    窗体中有数据库以外的类(自定义控件、提升的控件)时交给常驻的 UicFormWorker 加载，多个窗体合并为一个请求
+    结果按 (解释器, 绑定, 窗体) 缓存在内存中，窗体的 mtime/size 变化后重新解析
+    """
+
+    def __init__(self, pool=FORM_POOL, database=SIGNATURE_DB):
+        self.pool = pool
+        self.database = database
+        self.results = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(interpreter, binding, formFile):
+        return (os.path.normcase(os.path.abspath(interpreter)), binding, os.path.abspath(formFile))
+
+    def cached(self, interpreter, projectType, formFile):
+        """
+        @return 已缓存且窗体未变化时返回结果，否则返回 None
+        """
+        binding = FORM_BINDINGS.get(projectType)
+        with self._lock:
+            entry = self.results.get(self.key(interpreter, binding, formFile))
+        if entry is not None and entry[0] == fileStat(formFile):
+            return entry[1]
+        return None
+
+    def lookup(self, formFile, classes):
+        """
+        不加载窗体，只用信号数据库
+        @return 结果 or None(XML 无法解析或含有数据库以外的类)
+        """
+        try:
+            form = parseForm(formFile)
+        except (OSError, ValueError, ElementTree.ParseError) as e:
+            logging.debug(f"parse form {formFile} error: {e}")
+            return None
+        if form["class_name"] not in classes or any(className not in classes for _, className in form["objects"]):
+            return None
+        return {
+            "form": formFile,
+            "ok": True,
+            "object_name": form["object_name"],
+            "class_name": form["class_name"],
+            "signatures": formSignatures(form["objects"], classes),
+        }
+
+    def introspectAll(self, interpreter, projectType, forms, projectPath=None):
+        """
+        阻塞，在后台线程中调用
+        @param forms 窗体文件列表
+        @param projectPath 导入自定义控件的目录，默认为各窗体所在目录
+        @return {窗体文件: {"ok": True, "object_name", "class_name", "signatures"} or {"ok": False, "error"}}
+        """
+        forms = list(dict.fromkeys(forms))
+        binding = FORM_BINDINGS.get(projectType)
+        if binding is None:
+            return {form: {"form": form, "ok": False, "error": f"不支持的项目类型 {projectType}"} for form in forms}
+
+        results = {}
+        missing = []
+        for form in forms:
+            result = self.cached(interpreter, projectType, form)
+            if result is None:
+                missing.append(form)
+            else:
+                results[form] = result
+        if not missing:
+            return results
+
+        stamps = {form: fileStat(form) for form in missing}
+        classes = self.database.get(interpreter, binding) or {}
+        loaded = {}
+        unknown = []
+        for form in missing:
+            result = self.lookup(form, classes)
+            if result is None:
+                unknown.append(form)
+            else:
+                loaded[form] = result
+
+        if unknown:
+            worker = self.pool.get(interpreter, binding)
+            if worker is None:
+                error = f"{interpreter} 无法启动 {binding} 窗体解析进程"
+                response = (False, error)
+            else:
+                response = worker.introspect([(form, projectPath or os.path.dirname(form)) for form in unknown])
+            if not response[0]:
+                results.update({form: {"form": form, "ok": False, "error": response[1]} for form in unknown})
+            else:
+                for form, result in zip(unknown, response[1]):
+                    if result["ok"]:
+                        result = {
+                            "form": form,
+                            "ok": True,
+                            "object_name": result["object_name"],
+                            "class_name": result["class_name"],
+                            "signatures": formSignatures(result["objects"], result["classes"]),
+                        }
+                    loaded[form] = result
+
+        for form, result in loaded.items():
+            results[form] = result
+            if result["ok"] and stamps[form] is not None:
+                with self._lock:
+                    self.results[self.key(interpreter, binding, form)] = (stamps[form], result)
+        return results
+
+    def introspect(self, interpreter, projectType, formFile, projectPath=None):
+        """
+        @return [True, {"object_name", "class_name", "signatures"}] or (False, "Error: ...")
+        """
+        result = self.introspectAll(interpreter, projectType, [formFile], projectPath)[formFile]
+        if result["ok"]:
+            return [True, result]
+        error = result.get("error", "")
+        return (False, error if error.startswith("Error: ") else f"Error: {error}")
+
+    def warm(self, interpreter, projectType):
+        """
+        后台准备信号数据库(版本未知或数据库不存在时才启动窗体解析进程)，打开项目时调用
+        """
+        binding = FORM_BINDINGS.get(projectType)
+        if interpreter and binding:
+            return TH_POOL.submit(self.database.get, interpreter, binding)
+
+
+FORM_INTROSPECTOR = FormIntrospector()
+
+
+class UicCompiler:
+    """
+    增量编译项目中的 .ui 文件
+
+    清单(data/uic/<项目路径哈希>.json)记录每个 .ui 的 mtime/size/内容哈希、
+    uic 工具版本和输出文件状态，三者都未变化时跳过；
+    mtime 与 size 未变时不重新计算哈希，无变化的重建只需遍历一次目录
+    过期的文件并发编译，优先交给常驻的 UicWorker，不可用时每个文件启动一次 uic 子进程
+    """
+
+    def __init__(self, interpreter, projectType, root, workers=UIC_WORKERS, onProgress=None, onOutput=None,
+                 pool=None):
+        """
+        @param pool UicWorkerPool，默认 UIC_POOL，False 表示不使用常驻进程
+        """
+        self.interpreter = interpreter
+        self.projectType = projectType
+        self.root = root
+        self.onProgress = onProgress
+        self.onOutput = onOutput
+        self.manifestFile = manifestPath(root)
+        self.manifest = None
+        self.stopped = False
+        self.pool = UIC_POOL if pool is None else pool
+        self.worker = None
+        self._active = set()
+        self._lock = threading.RLock()
+        self._semaphore = threading.Semaphore(workers)
+
+    def load(self):
+        if self.manifest is not None:
+            return self.manifest
+        self.manifest = {}
+        try:
+            with open(self.manifestFile, "r", encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("version") == UIC_MANIFEST_VERSION:
+                self.manifest = content.get("files", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"uic manifest load error: {e}")
+        return self.manifest
+
+    def save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.manifestFile), exist_ok=True)
+            tmpFile = f"{self.manifestFile}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump({"version": UIC_MANIFEST_VERSION, "root": self.root, "files": self.manifest}, f, indent=4)
+            os.replace(tmpFile, self.manifestFile)
+
+    def progress(self, stage, name, index, total, ok=True):
+        if self.onProgress:
+            self.onProgress(stage, name, index, total, ok)
+
+    def stop(self):
+        self.stopped = True
+        for pyI in list(self._active):
+            pyI.stop()
+
+    @staticmethod
+    def key(uiFile):
+        return os.path.normcase(os.path.abspath(uiFile))
+
+    @staticmethod
+    def stat(path):
+        return fileStat(path)
+
+    def state(self, uiFile, tool, record=None):
+        """
+        当前状态，mtime/size 与记录一致时沿用记录中的哈希
+        """
+        stat = self.stat(uiFile)
+        if record and record.get("stat") == stat:
+            digest = record["hash"]
+        else:
+            digest = contentHash(uiFile)
+        return {"stat": stat, "hash": digest, "tool": tool, "type": self.projectType}
+
+    def isStale(self, uiFile, tool):
+        record = self.load().get(self.key(uiFile))
+        if not record:
+            return True
+        current = self.state(uiFile, tool, record)
+        if any(record.get(field) != current[field] for field in ("hash", "tool", "type")):
+            return True
+        return record.get("output") != self.stat(uicOutput(uiFile))
+
+    def compileFile(self, uiFile):
+        """
+        编译单个 .ui
+        @return [True, 输出文件] or (False, "Error: ...")
+        """
+        with self._semaphore:
+            if self.stopped:
+                return (False, "Error: 已取消")
+            if self.worker:
+                return self.worker.compile(uiFile, uicOutput(uiFile))
+            pyI = PyInterpreter()
+            pyI.setInterpreter(self.interpreter)
+            pyI.setOutputCallback(self.onOutput)
+            self._active.add(pyI)
+            try:
+                outFile = uicOutput(uiFile)
+                result = pyI.cmd([UIC_TOOLS[self.projectType].path(self.interpreter), uiFile, "-o", outFile])
+                return [True, outFile] if result[0] else result
+            finally:
+                self._active.discard(pyI)
+
+    def compileAll(self, files=None, force=False):
+        """
+        @param files 指定的 .ui 文件，None 时编译项目中的全部 .ui
+        @param force 忽略清单强制编译
+        @return [True, {"compiled": [...], "skipped": [...]}] or (False, "Error: ...")
+        """
+        if self.projectType not in UIC_TOOLS:
+            return (False, f"Error: 不支持的项目类型 {self.projectType}")
+        self.load()
+        files = findUiFiles(self.root) if files is None else list(files)
+        self.worker = self.pool.get(self.interpreter, self.projectType) if self.pool else None
+        if self.worker:
+            tool = self.worker.version
+        elif os.path.exists(UIC_TOOLS[self.projectType].path(self.interpreter)):
+            tool = uicIdentity(self.interpreter, self.projectType)
+        else:
+            tool = ""
+        if not tool:
+            return (False, f"Error: 未找到 {UIC_TOOLS[self.projectType].path(self.interpreter)}")
+
+        stale = [uiFile for uiFile in files if force or self.isStale(uiFile, tool)]
+        staleSet = set(stale)
+        skipped = [uiFile for uiFile in files if uiFile not in staleSet]
+        compiled = []
+        errors = []
+        futures = {TH_POOL.submit(self.compileFile, uiFile): uiFile for uiFile in stale}
+        for index, future in enumerate(TH_POOL.as_completed(futures), 1):
+            uiFile = futures[future]
+            result = future.result() if future.exception() is None else (False, f"Error: {future.exception()}")
+            if result[0]:
+                record = self.state(uiFile, tool)
+                record["output"] = self.stat(result[1])
+                with self._lock:
+                    self.manifest[self.key(uiFile)] = record
+                compiled.append(uiFile)
+            else:
+                errors.append(f"{os.path.basename(uiFile)}: {result[1]}")
+            self.progress("compile", os.path.basename(uiFile), index, len(stale), bool(result[0]))
+
+        if stale:
+            self.save()
+        if errors:
+            return (False, "Error: " + "\n".join(errors))
+        return [True, {"compiled": compiled, "skipped": skipped}]
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+常驻的 .ui 窗体解析进程，由目标解释器运行，不依赖本项目的其他模块
+(替代每次查询都启动一次 ui/eric/uic/UicLoadUi*.py)
+    python uicformworker.py <PySide6|PySide2|PyQt6|PyQt5>
+
+标准输入/输出逐行交换 JSON:
+    启动: {"ready": true, "version": "PySide6 6.7.2 Qt 6.7.2"} 或 {"ready": false, "error": "..."}
+    请求: {"id": 1, "forms": [{"form": "form.ui", "path": "项目目录"}, ...]}
+    响应: {"id": 1, "ok": true, "results": [{"form": "form.ui", "ok": true, "object_name": "...",
+            "class_name": "...", "objects": [[对象名, 类名], ...], "classes": {...}},
+            {"form": "...", "ok": false, "error": "..."}]}
+    请求: {"id": 2, "classes": true}
+    响应: {"id": 2, "ok": true, "classes": {...}}
+classes 为 {类名: {"super": 父类名 or null, "signals": [本类声明的信号, ...]}}，继承的信号沿 super 查找
+"classes" 请求读取绑定中全部 QWidget/QAction 子类的 staticMetaObject，不创建任何实例，用于生成信号数据库；
+窗体请求只在窗体中有数据库以外的类(自定义控件)时使用，每个窗体只加载一次，一个请求可以包含多个窗体
+窗体必须在主线程中创建，请求按顺序处理
+"""
+
+import os
+import sys
+import json
+import traceback
+
+
+def mapType(type_):
+    """
+    Qt 元对象中的类型 -> Python 类型
+    """
+    mapped = type_ if isinstance(type_, str) else bytes(type_).decode()
+    mapped = mapped.replace("*", "").replace("const ", "")
+    mapped = mapped.replace("QStringList", "list").replace("QString", "str")
+    return mapped.replace("double", "float")
+
+
+def loadBinding(binding):
+    """
+    @return (版本, QtCore, QtWidgets, QAction, load(窗体, 项目目录) -> QWidget)
+    """
+    QtCore = __import__(f"{binding}.QtCore", fromlist=["QtCore"])
+    QtWidgets = __import__(f"{binding}.QtWidgets", fromlist=["QtWidgets"])
+    QtGui = __import__(f"{binding}.QtGui", fromlist=["QtGui"])
+    QAction = getattr(QtGui, "QAction", None) or QtWidgets.QAction
+    try:
+        __import__(f"{binding}.QtWebEngineWidgets")
+    except ImportError:
+        pass
+
+    if binding.startswith("PySide"):
+        QtUiTools = __import__(f"{binding}.QtUiTools", fromlist=["QtUiTools"])
+        version = __import__(binding).__version__
+
+        def load(formFile, projectPath):
+            loader = QtUiTools.QUiLoader()
+            loader.setWorkingDirectory(QtCore.QDir(projectPath))
+            file = QtCore.QFile(formFile)
+            if not file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
+                raise IOError(f"Unable to open {formFile}")
+            try:
+                widget = loader.load(file)
+            finally:
+                file.close()
+            if widget is None:
+                raise ValueError(loader.errorString() or f"Unable to load {formFile}")
+            return widget
+    else:
+        uic = __import__(f"{binding}.uic", fromlist=["loadUi"])
+        version = QtCore.PYQT_VERSION_STR
+
+        def load(formFile, projectPath):
+            return uic.loadUi(formFile, package=projectPath)
+
+    # 信号数据库按 Qt 版本区分，PyQt 的版本号与 Qt 不同
+    return f"{binding} {version} Qt {QtCore.qVersion()}", QtCore, QtWidgets, QAction, load
+
+
+# 信号数据库包含的模块(不存在的跳过)
+CLASS_MODULES = ("QtWidgets", "QtGui", "QtWebEngineWidgets", "QtSvgWidgets", "QtOpenGLWidgets",
+                 "QtMultimediaWidgets", "QtPrintSupport", "QtQuickWidgets", "QtCharts", "QtDataVisualization")
+
+
+def classSignals(metaObject, QtCore):
+    """
+    本类声明的信号(不含继承的)
+    """
+    signalsList = []
+    for index in range(metaObject.methodOffset(), metaObject.methodCount()):
+        metaMethod = metaObject.method(index)
+        if metaMethod.methodType() != QtCore.QMetaMethod.MethodType.Signal:
+            continue
+        returnType = mapType(metaMethod.typeName())
+        signalsList.append({
+            "signature": bytes(metaMethod.methodSignature()).decode(),
+            "return_type": "" if returnType == "void" else returnType,
+            "parameter_types": [mapType(t) for t in metaMethod.parameterTypes()],
+            "parameter_names": [bytes(n).decode() or f"p{i:d}" for i, n in enumerate(metaMethod.parameterNames())],
+        })
+    return signalsList
+
+
+def describe(metaObject, classes, QtCore):
+    """
+    把 metaObject 及其全部父类加入 classes
+    """
+    while metaObject is not None:
+        name = metaObject.className()
+        if name in classes:
+            return
+        superClass = metaObject.superClass()
+        classes[name] = {
+            "super": superClass.className() if superClass is not None else None,
+            "signals": classSignals(metaObject, QtCore),
+        }
+        metaObject = superClass
+
+
+def bindingClasses(binding, QtCore, QtWidgets, QAction):
+    classes = {}
+    for name in CLASS_MODULES:
+        try:
+            module = __import__(f"{binding}.{name}", fromlist=[name])
+        except ImportError:
+            continue
+        # PySide 的模块属性按需创建，不能直接遍历 vars()
+        for attr in dir(module):
+            value = getattr(module, attr, None)
+            if (isinstance(value, type) and issubclass(value, (QtWidgets.QWidget, QAction))
+                    and hasattr(value, "staticMetaObject")):
+                describe(value.staticMetaObject, classes, QtCore)
+    return classes
+
+
+def formObjects(widget, QtCore, QtWidgets, QAction):
+    """
+    窗体中每个具名控件/动作的 [对象名, 类名]，以及用到的类
+    """
+    objects = []
+    classes = {}
+    for obj in widget.findChildren(QtWidgets.QWidget) + widget.findChildren(QAction):
+        name = obj.objectName()
+        if not name or name.startswith("qt_"):
+            continue
+        metaObject = obj.metaObject()
+        objects.append([name, metaObject.className()])
+        describe(metaObject, classes, QtCore)
+    return objects, classes
+
+
+def main():
+    binding = sys.argv[1]
+    # 协议使用原来的标准输出，窗体中自定义控件的 print 等输出改到标准错误
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    def send(message):
+        protocol.write(json.dumps(message) + "\n")
+        protocol.flush()
+
+    try:
+        version, QtCore, QtWidgets, QAction, load = loadBinding(binding)
+        app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    except Exception as e:
+        send({"ready": False, "error": f"{type(e).__name__}: {e}"})
+        return 1
+    send({"ready": True, "version": version})
+
+    def introspect(form):
+        formFile, projectPath = form["form"], form.get("path") or os.path.dirname(form["form"])
+        if projectPath not in sys.path:
+            sys.path.append(projectPath)
+        widget = None
+        try:
+            widget = load(formFile, projectPath)
+            objects, classes = formObjects(widget, QtCore, QtWidgets, QAction)
+            return {
+                "form": formFile,
+                "ok": True,
+                "object_name": widget.objectName(),
+                "class_name": widget.metaObject().className(),
+                "objects": objects,
+                "classes": classes,
+            }
+        except Exception as e:
+            return {"form": formFile, "ok": False, "error": str(e) or traceback.format_exc()}
+        finally:
+            if widget is not None:
+                widget.deleteLater()
+                app.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        try:
+            if request.get("classes"):
+                send({"id": request["id"], "ok": True, "classes": bindingClasses(binding, QtCore, QtWidgets, QAction)})
+                continue
+            send({"id": request["id"], "ok": True, "results": [introspect(form) for form in request["forms"]]})
+        except Exception as e:
+            send({"id": request["id"], "ok": False, "error": str(e) or traceback.format_exc()})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+常驻 uic 编译进程，由目标解释器运行，不依赖本项目的其他模块
+    python uicworker.py <PySide6|PySide2|PyQt6|PyQt5>
+
+标准输入/输出逐行交换 JSON:
+    启动: {"ready": true, "version": "6.7.2"} 或 {"ready": false, "error": "..."}
+    请求: {"id": 1, "ui": "form.ui", "out": "Ui_form.py"}
+    响应: {"id": 1, "ok": true} 或 {"id": 1, "ok": false, "error": "..."}
+PyQt 在进程内调用 uic.compileUi；PySide 没有 Python 接口，直接调用包内的原生 uic，
+省去 pyside6-uic 启动解释器的开销。请求并发处理，响应顺序不保证与请求一致
+"""
+
+import os
+import sys
+import json
+import threading
+import traceback
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+
+def nativeUic(package):
+    folder = os.path.dirname(package.__file__)
+    names = ["uic.exe", "uic"]
+    for sub in ("", "Qt/libexec", "Qt/bin", "bin"):
+        for name in names:
+            path = os.path.join(folder, sub, name)
+            if os.path.isfile(path):
+                return path
+    raise FileNotFoundError(f"uic not found in {folder}")
+
+
+def pysideBackend(binding):
+    package = __import__(binding)
+    uic = nativeUic(package)
+    startupinfo = None
+    if sys.platform == "win32":
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+    def compileUi(ui, out):
+        result = subprocess.run([uic, "-g", "python", ui, "-o", out], capture_output=True,
+                                startupinfo=startupinfo)
+        if result.returncode != 0:
+            raise RuntimeError((result.stderr or result.stdout).decode("utf-8", "replace"))
+
+    return package.__version__, compileUi
+
+
+def pyqtBackend(binding):
+    uic = __import__(f"{binding}.uic", fromlist=["compileUi"])
+    qtcore = __import__(f"{binding}.QtCore", fromlist=["PYQT_VERSION_STR"])
+
+    def compileUi(ui, out):
+        tmp = f"{out}.tmp"
+        with open(ui, "r", encoding="utf-8") as f, open(tmp, "w", encoding="utf-8") as f1:
+            uic.compileUi(f, f1)
+        os.replace(tmp, out)
+
+    return qtcore.PYQT_VERSION_STR, compileUi
+
+
+def main():
+    binding = sys.argv[1]
+    writeLock = threading.Lock()
+
+    def send(message):
+        with writeLock:
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+
+    try:
+        backend = pysideBackend if binding.startswith("PySide") else pyqtBackend
+        version, compileUi = backend(binding)
+    except Exception as e:
+        send({"ready": False, "error": f"{type(e).__name__}: {e}"})
+        return 1
+    send({"ready": True, "version": f"{binding} {version}"})
+
+    def handle(request):
+        try:
+            compileUi(request["ui"], request["out"])
+            send({"id": request["id"], "ok": True})
+        except Exception as e:
+            send({"id": request["id"], "ok": False, "error": str(e) or traceback.format_exc()})
+
+    with ThreadPoolExecutor(max_workers=max(1, min(8, os.cpu_count() or 1))) as executor:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                executor.submit(handle, json.loads(line))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
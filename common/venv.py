@@ -5,39 +5,143 @@ author: Reiner New
 email: nbxlc@hotmail.com
 """
 
+import os
+import sys
+import shutil
+import hashlib
+import logging
+import threading
 import subprocess
-import venv
-import virtualenv
+import simplejson as json
 
+from .py import PyInterpreter
+from .pipplan import PipPlan
+from .metadata import METADATA, sitePackages
+from .wheelhouse import linkOrCopy
+from .lazy import lazyImport
+from manage import ROOT_PATH, SettingPath
 
+# virtualenv 导入较慢，只在创建环境时导入
+virtualenv = lazyImport("virtualenv")
 
-def create_venv(env_name):
+
+TEMPLATE_PATH = os.path.join(ROOT_PATH, SettingPath, "venvs")
+TEMPLATE_FILE = "template.json"
+
+# 每个模板目录一把锁: 同一基础解释器与项目类型的并发 venv_create 任务只构建一次模板，
+# 其余任务等待后直接使用(否则会同时删除/重建 <模板>.building)
+_templateLocks = {}
+_templateLocksGuard = threading.Lock()
+
+# 各项目类型的模板环境预装的包
+PROJECT_PACKAGES = {
+    "PySide6": ["PySide6"],
+    "PyQt6": ["PyQt6"],
+    "PyQt5": ["PyQt5"],
+    "PySide2": ["PySide2"],
+}
+
+# 用模板解释器中 pip 自带的 distlib 为新环境重新生成入口脚本(Scripts/*.exe 中写死了解释器路径)
+REGENERATE_SCRIPTS = r"""
+import os, sys, configparser
+from pip._vendor.distlib.scripts import ScriptMaker
+site, scripts, executable = sys.argv[1:4]
+maker = ScriptMaker(None, scripts)
+maker.executable = executable
+maker.clobber = True
+maker.variants = {""}
+for name in os.listdir(site):
+    path = os.path.join(site, name, "entry_points.txt")
+    if not name.endswith(".dist-info") or not os.path.exists(path):
+        continue
+    parser = configparser.ConfigParser(delimiters=("=",), interpolation=None)
+    parser.optionxform = str
+    parser.read(path, encoding="utf-8")
+    for section, gui in (("console_scripts", False), ("gui_scripts", True)):
+        if parser.has_section(section):
+            for key, value in parser.items(section):
+                maker.make(f"{key} = {value}", {"gui": gui})
+"""
+
+
+def templateLock(path):
+    key = os.path.normcase(os.path.abspath(path))
+    with _templateLocksGuard:
+        lock = _templateLocks.get(key)
+        if lock is None:
+            lock = _templateLocks[key] = threading.Lock()
+        return lock
+
+
+def venvPython(path):
+    if sys.platform == "win32":
+        return os.path.join(path, "Scripts", "python.exe")
+    return os.path.join(path, "bin", "python")
+
+
+def venvScripts(path):
+    return os.path.join(path, "Scripts" if sys.platform == "win32" else "bin")
+
+
+def create_venv(env_name, python=None, seed=True):
+    """
+    创建虚拟环境
+    @param python 基础解释器，默认为当前解释器
+    @param seed False 时不安装 pip/setuptools/wheel(等同 --without-pip)
+    """
     if not env_name:
         print("Please enter a valid name.")
         return (False, "Please enter a valid name.")
 
-    # Create virtual environment
-    # result = subprocess.run(['python', '-m', 'venv ', env_name], capture_output=True, text=True)
-    # if result.returncode == 0:
-    #     print(f"Virtual environment '{env_name}' created successfully.")
-    #     return (True, f"Virtual environment '{env_name}' created successfully.")
-    # else:
-    #     print(f"Error: {result.stderr}")
-    #     return (False, f"Error: {result.stderr}")
+    args = [env_name]
+    if python:
+        args.extend(["--python", python])
+    if not seed:
+        args.append("--no-seed")
+    try:
+        virtualenv.cli_run(args)
+    except Exception as e:
+        logging.error(e)
+        return (False, f"Error: {e}")
+    return [True, venvPython(env_name)]
+
+
+def templatePath(python, projectType):
+    """
+    模板环境目录: data/venvs/<项目类型>-<基础解释器路径哈希>
+    """
+    digest = hashlib.sha1(os.path.normcase(os.path.abspath(python)).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(TEMPLATE_PATH, f"{projectType}-{digest}")
 
-    # virtualenv.cli_run([env_name, "--pip", "23"])
-    virtualenv.cli_run([env_name, '--python=python3.9.10'])
 
-    # result = subprocess.run(['python', '-m', 'virtualenv', env_name, '--pip', 'latest'], capture_output=True, text=True)
-    # if result.returncode == 0:
-    #     print(f"Virtual environment '{env_name}' created successfully.")
-    # else:
-    #     print(f"Error: {result.stderr}")
+def readTemplate(path):
+    try:
+        with open(os.path.join(path, TEMPLATE_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
 
 
 class VenvManager:
-    def create_venv(self, env_name):
-        virtualenv.cli_run([env_name, "--pip", "23"])
+    """
+    虚拟环境管理
+
+    每种项目类型在每个基础解释器上只构建一次"模板环境"(包从本地 wheelhouse 安装)，
+    新的项目环境用 --no-seed 创建后，以硬链接(不支持时复制)克隆模板的 site-packages，
+    再为新解释器重新生成入口脚本，无需再次执行 pip 安装
+    """
+
+    def __init__(self, venv_path=None, onOutput=None, onProgress=None, indexUrl=None):
+        self.venv_path = venv_path
+        self.onOutput = onOutput
+        self.onProgress = onProgress
+        self.indexUrl = indexUrl
+
+    def create_venv(self, env_name, python=None, seed=True):
+        result = create_venv(env_name, python, seed)
+        if result[0]:
+            self.venv_path = env_name
+        return result
 
     def activate_venv(self, path):
         if sys.platform == "win32":
@@ -48,13 +152,99 @@ class VenvManager:
         subprocess.run(activate_script, shell=True)
 
     def install_package(self, package_name):
-        subprocess.run([f"{self.venv_path}/bin/pip", "install", package_name])
+        pyI = PyInterpreter()
+        pyI.setInterpreter(venvPython(self.venv_path))
+        pyI.setOutputCallback(self.onOutput)
+        return pyI.pip("install", package_name)
+
+    def templateValid(self, path, python):
+        info = readTemplate(path)
+        if not info or not os.path.exists(venvPython(path)):
+            return False
+        # 基础解释器升级后模板需要重建
+        version = METADATA.version(python)
+        return bool(version[0]) and info.get("version") == version[1]
+
+    def buildTemplate(self, python, projectType):
+        """
+        构建模板环境
+        @return [True, 模板目录] or (False, "Error: ...")
+        """
+        path = templatePath(python, projectType)
+        building = f"{path}.building"
+        shutil.rmtree(building, ignore_errors=True)
+
+        result = create_venv(building, python)
+        if not result[0]:
+            return result
+
+        plan = PipPlan(venvPython(building), indexUrl=self.indexUrl,
+                       onProgress=self.onProgress, onOutput=self.onOutput)
+        result = plan.install(*PROJECT_PACKAGES[projectType])
+        if not result[0]:
+            shutil.rmtree(building, ignore_errors=True)
+            return result
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(building, path)
+        with open(os.path.join(path, TEMPLATE_FILE), "w", encoding="utf-8") as f:
+            json.dump({
+                "python": python,
+                "version": METADATA.version(python)[1],
+                "type": projectType,
+                "packages": PROJECT_PACKAGES[projectType],
+            }, f, indent=4)
+        return [True, path]
+
+    def template(self, python, projectType):
+        path = templatePath(python, projectType)
+        # 检查、构建与替换在同一把锁内完成，等待的任务拿到锁后模板已有效
+        with templateLock(path):
+            if self.templateValid(path, python):
+                return [True, path]
+            return self.buildTemplate(python, projectType)
+
+    def clone(self, template, target, python):
+        """
+        从模板克隆新环境
+        @return [True, 新环境解释器路径] or (False, "Error: ...")
+        """
+        if os.path.exists(target) and os.listdir(target):
+            return (False, f"Error: {target} 已存在")
+
+        result = create_venv(target, python, seed=False)
+        if not result[0]:
+            return result
+
+        src = sitePackages(venvPython(template))
+        dst = sitePackages(venvPython(target))
+        if not src or not dst:
+            return (False, "Error: site-packages 目录不存在")
+        shutil.copytree(src, dst, copy_function=linkOrCopy, dirs_exist_ok=True)
+
+        pyI = PyInterpreter()
+        pyI.setInterpreter(venvPython(template))
+        pyI.setOutputCallback(self.onOutput)
+        result = pyI.cmd([venvPython(template), "-c", REGENERATE_SCRIPTS, dst, venvScripts(target),
+                          os.path.abspath(venvPython(target))])
+        if not result[0]:
+            return result
+
+        self.venv_path = target
+        return [True, venvPython(target)]
+
+    def createProjectVenv(self, python, projectType, target):
+        """
+        创建项目环境: 模板不存在或已过期时先构建模板，再克隆
+        """
+        if projectType not in PROJECT_PACKAGES:
+            return (False, f"Error: 不支持的项目类型 {projectType}")
+        result = self.template(python, projectType)
+        if not result[0]:
+            return result
+        return self.clone(result[1], target, python)
 
 
 
 if __name__ == "__main__":
     create_venv("myVE")
-    # cli_run(["myVE"])
-    # create_environment("myVE")
-    # print("done")
-    # asyncio.run(install_virtualenv("myVE"))
\ No newline at end of file
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import logging
+import threading
+import importlib
+
+from .thread import TH_POOL
+from .trace import TRACE
+from .pyenv import PyVenvManager
+from .metadata import METADATA
+from manage import LIBS, CURRENT_SETTINGS
+
+
+class Warmup:
+    """
+    启动预热任务
+
+    任务在全局线程池中并发执行，每完成一个在主线程中调用 onProgress(标题, 已完成数, 总数)，
+    启动画面据此显示进度；结果按名称保留，页面构建时通过 result() 取用，不必再次执行
+    """
+
+    def __init__(self):
+        self.futures = {}
+        self.titles = {}
+        self.done = 0
+        self.onProgress = None
+        self._lock = threading.Lock()
+
+    def setProgressCallback(self, callback):
+        self.onProgress = callback
+
+    def total(self):
+        return len(self.titles)
+
+    def progress(self, title):
+        with self._lock:
+            self.done += 1
+            done = self.done
+        if self.onProgress:
+            self.onProgress(title, done, self.total())
+
+    def step(self, name, title, func, *args):
+        """
+        在当前线程(主线程)中执行的步骤，同样计入进度
+        """
+        self.titles[name] = title
+        with TRACE.span(name):
+            result = func(*args)
+        self.progress(title)
+        return result
+
+    def add(self, name, title, func, *args):
+        """
+        提交后台任务，需在 TH_POOL.bindApp 之后调用
+        """
+        self.titles[name] = title
+
+        def run():
+            with TRACE.span(name):
+                return func(*args)
+
+        future = TH_POOL.submit(run)
+        self.futures[name] = future
+        TH_POOL.addCallback(future, lambda result: self.progress(title),
+                            lambda error: self.failed(name, title, error))
+        return future
+
+    def failed(self, name, title, error):
+        logging.error(f"warmup {name} error: {error}")
+        self.progress(title)
+
+    def result(self, name, callback):
+        """
+        任务完成后在主线程中调用 callback(结果)
+        @return False 没有该任务(调用方自行处理)
+        """
+        future = self.futures.get(name)
+        if future is None:
+            return False
+        TH_POOL.addCallback(future, callback, lambda error: callback(None))
+        return True
+
+
+def registerResources():
+    """
+    注册 Qt 资源(二进制 rcc 由 Qt 内存映射，注册受 Qt 内部锁保护)
+    """
+    importlib.import_module("resource_rc")
+
+
+def currentInterpreter():
+    settings = CURRENT_SETTINGS["settings"]
+    if settings["mode"] == "现有环境":
+        return settings["custom_python_path"]
+    if settings["mode"] == "Pyenv 环境" and settings["pyenv_current_version"]:
+        return os.path.join(LIBS["pyenv"], "versions", settings["pyenv_current_version"], "python.exe")
+    return ""
+
+
+def probeInterpreter():
+    """
+    探测当前全局解释器版本，结果写入 METADATA 缓存
+    """
+    interpreter = currentInterpreter()
+    if not interpreter or not os.path.exists(interpreter):
+        return None
+    return METADATA.version(interpreter)
+
+
+def listPyenv():
+    """
+    pyenv 可安装版本与已安装版本，与 VenvRunner 的 "init" 命令结果相同
+    @return {"list": result, "versions": result} or None(未安装 pyenv)
+    """
+    manager = PyVenvManager(CURRENT_SETTINGS["settings"]["pyenv_path"] or LIBS["pyenv"])
+    if not os.path.exists(manager.venvPath):
+        return None
+    return {"list": manager.list(), "versions": manager.versions()}
+
+
+WARMUP = Warmup()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+import re
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+import html
+from pathlib import Path
+import simplejson as json
+
+from .py import PyInterpreter
+from manage import ROOT_PATH, SettingPath
+
+
+WHEELHOUSE_PATH = os.path.join(ROOT_PATH, SettingPath, "wheelhouse")
+# 本地仓库容量上限，超过后按最近使用时间淘汰
+WHEELHOUSE_MAX_SIZE = 5 * 1024 ** 3
+HASH_BLOCK = 1024 * 1024
+
+
+def canonicalName(name):
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parseFilename(filename):
+    """
+    wheel: {name}-{version}(-{build})?-{python}-{abi}-{platform}.whl
+    sdist: {name}-{version}.tar.gz / .zip
+    @return (project, version) or None
+    """
+    if filename.endswith(".whl"):
+        parts = filename[:-4].split("-")
+        if len(parts) < 5:
+            return None
+        return canonicalName(parts[0]), parts[1]
+    for ext in (".tar.gz", ".zip"):
+        if filename.endswith(ext):
+            name, sep, version = filename[:-len(ext)].rpartition("-")
+            if not sep:
+                return None
+            return canonicalName(name), version
+    return None
+
+
+def wheelTags(filename):
+    """
+    wheel 文件名中的标签集合，压缩标签按 "." 展开(同 packaging.tags.parse_tag)
+    例: cp312-cp312-win_amd64 / py2.py3-none-any -> {"py2-none-any", "py3-none-any"}
+    @return set or None(不是 wheel)
+    """
+    if not filename.endswith(".whl"):
+        return None
+    parts = filename[:-4].split("-")
+    if len(parts) < 5:
+        return set()
+    interpreters, abis, platforms = parts[-3:]
+    return {f"{interpreter}-{abi}-{platform}".lower()
+            for interpreter in interpreters.split(".")
+            for abi in abis.split(".")
+            for platform in platforms.split(".")}
+
+
+def fileHash(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def linkOrCopy(src, dst):
+    """
+    优先硬链接，跨盘或文件系统不支持时复制
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class Wheelhouse:
+    """
+    所有解释器共用的本地 wheel 仓库
+
+    objects/<sha256[:2]>/<sha256> 按内容存储，links/<filename> 为其硬链接，
+    可直接作为 pip --find-links 目录；simple/ 下生成 PEP 503 静态索引，
+    可作为 --index-url 使用。index.json 记录哈希、大小与最近使用时间
+    静态索引只在仓库内容变化(add/remove/evict)时重建，先写入临时目录再整体替换，
+    正在读取索引的 pip 任务不会看到写了一半的目录
+    """
+
+    def __init__(self, root=WHEELHOUSE_PATH, maxSize=WHEELHOUSE_MAX_SIZE):
+        self.root = root
+        self.maxSize = maxSize
+        self.objects = os.path.join(root, "objects")
+        self.links = os.path.join(root, "links")
+        self.simple = os.path.join(root, "simple")
+        self.indexFile = os.path.join(root, "index.json")
+        self.entries = None
+        self._lock = threading.RLock()
+
+    def load(self):
+        with self._lock:
+            if self.entries is not None:
+                return self.entries
+            self.entries = {}
+            try:
+                with open(self.indexFile, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.error(f"wheelhouse index load error: {e}")
+            if not os.path.exists(self.simple):
+                self.writeSimpleIndex()
+            return self.entries
+
+    def save(self):
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            tmpFile = f"{self.indexFile}.tmp"
+            with open(tmpFile, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=4)
+            os.replace(tmpFile, self.indexFile)
+
+    def findLinks(self):
+        """
+        --find-links 目录
+        """
+        os.makedirs(self.links, exist_ok=True)
+        return self.links
+
+    def indexUrl(self):
+        """
+        --index-url 地址(file:// 静态索引)，只返回地址，索引由 add/remove/evict 维护
+        """
+        return Path(self.simple).absolute().as_uri()
+
+    def objectPath(self, digest):
+        return os.path.join(self.objects, digest[:2], digest)
+
+    def add(self, path):
+        """
+        加入仓库，已有相同内容时只更新链接
+        @return 文件名 or None
+        """
+        filename = os.path.basename(path)
+        parsed = parseFilename(filename)
+        if parsed is None:
+            logging.debug(f"wheelhouse skip: {filename}")
+            return None
+
+        digest = fileHash(path)
+        objectPath = self.objectPath(digest)
+        with self._lock:
+            entries = self.load()
+            if not os.path.exists(objectPath):
+                os.makedirs(os.path.dirname(objectPath), exist_ok=True)
+                tmpFile = f"{objectPath}.tmp"
+                linkOrCopy(path, tmpFile)
+                os.replace(tmpFile, objectPath)
+
+            link = os.path.join(self.findLinks(), filename)
+            old = entries.get(filename)
+            if old is None or old["sha256"] != digest or not os.path.exists(link):
+                if os.path.exists(link):
+                    os.remove(link)
+                linkOrCopy(objectPath, link)
+                if old and old["sha256"] != digest:
+                    self._removeObject(old["sha256"], exclude=filename)
+
+            entries[filename] = {
+                "project": parsed[0],
+                "version": parsed[1],
+                "sha256": digest,
+                "size": os.path.getsize(objectPath),
+                "atime": time.time(),
+            }
+            self.save()
+            if old is None or old["sha256"] != digest:
+                self.writeSimpleIndex()
+        return filename
+
+    def files(self, name, version=None):
+        project = canonicalName(name)
+        with self._lock:
+            return [filename for filename, entry in self.load().items()
+                    if entry["project"] == project and (version is None or entry["version"] == version)]
+
+    def verify(self, name, version=None):
+        """
+        校验哈希，损坏或缺失的文件从仓库中移除
+        @return 校验通过的文件名列表
+        """
+        valid = []
+        for filename in self.files(name, version):
+            link = os.path.join(self.links, filename)
+            entry = self.entries[filename]
+            if os.path.exists(link) and fileHash(link) == entry["sha256"]:
+                valid.append(filename)
+            else:
+                logging.warning(f"wheelhouse hash mismatch: {filename}")
+                self.remove(filename)
+        return valid
+
+    def touch(self, name, version=None):
+        with self._lock:
+            filenames = self.files(name, version)
+            for filename in filenames:
+                self.entries[filename]["atime"] = time.time()
+            if filenames:
+                self.save()
+
+    def remove(self, filename, rebuild=True):
+        """
+        @param rebuild 是否重建静态索引，批量删除时由调用方最后重建一次
+        """
+        with self._lock:
+            entry = self.load().pop(filename, None)
+            if entry is None:
+                return
+            link = os.path.join(self.links, filename)
+            if os.path.exists(link):
+                os.remove(link)
+            self._removeObject(entry["sha256"], exclude=filename)
+            self.save()
+            if rebuild:
+                self.writeSimpleIndex()
+
+    def _removeObject(self, digest, exclude=None):
+        # 仍被其他文件名引用的对象保留
+        if any(entry["sha256"] == digest for filename, entry in self.entries.items() if filename != exclude):
+            return
+        objectPath = self.objectPath(digest)
+        if os.path.exists(objectPath):
+            os.remove(objectPath)
+
+    def size(self):
+        with self._lock:
+            return sum(entry["size"] for entry in self.load().values())
+
+    def evict(self, maxSize=None):
+        """
+        超过容量上限时按最近使用时间(LRU)淘汰
+        @return 被淘汰的文件名列表
+        """
+        maxSize = self.maxSize if maxSize is None else maxSize
+        removed = []
+        with self._lock:
+            total = self.size()
+            for filename, entry in sorted(self.load().items(), key=lambda item: item[1]["atime"]):
+                if total <= maxSize:
+                    break
+                total -= entry["size"]
+                self.remove(filename, rebuild=False)
+                removed.append(filename)
+            if removed:
+                self.writeSimpleIndex()
+        if removed:
+            logging.info(f"wheelhouse evict: {removed}")
+        return removed
+
+    def writeSimpleIndex(self):
+        """
+        生成 PEP 503 静态索引: simple/index.html, simple/<project>/index.html
+        在临时目录中生成后改名替换 simple/，旧目录改名后再删除
+        """
+        with self._lock:
+            projects = {}
+            for filename, entry in self.entries.items():
+                projects.setdefault(entry["project"], []).append((filename, entry["sha256"]))
+
+            os.makedirs(self.root, exist_ok=True)
+            building = tempfile.mkdtemp(prefix="simple.", dir=self.root)
+            try:
+                self._writeSimpleTree(building, projects)
+                old = None
+                if os.path.exists(self.simple):
+                    old = f"{building}.old"
+                    os.replace(self.simple, old)
+                try:
+                    os.replace(building, self.simple)
+                except OSError:
+                    if old:
+                        os.replace(old, self.simple)
+                    raise
+            except OSError as e:
+                logging.error(f"wheelhouse simple index error: {e}")
+                shutil.rmtree(building, ignore_errors=True)
+                return
+            if old:
+                shutil.rmtree(old, ignore_errors=True)
+
+    def _writeSimpleTree(self, folder, projects):
+        with open(os.path.join(folder, "index.html"), "w", encoding="utf-8") as f:
+            f.write("<!DOCTYPE html>\n<html><body>\n")
+            for project in sorted(projects):
+                f.write(f'<a href="{html.escape(project)}/">{html.escape(project)}</a>\n')
+            f.write("</body></html>\n")
+        for project, files in projects.items():
+            os.makedirs(os.path.join(folder, project))
+            with open(os.path.join(folder, project, "index.html"), "w", encoding="utf-8") as f:
+                f.write("<!DOCTYPE html>\n<html><body>\n")
+                for filename, digest in sorted(files):
+                    href = f"../../links/{filename}#sha256={digest}"
+                    f.write(f'<a href="{html.escape(href)}">{html.escape(filename)}</a>\n')
+                f.write("</body></html>\n")
+
+    def has(self, name, version, tags):
+        """
+        仓库中是否有适用于目标解释器的文件
+        按 wheel 文件名中的标签与解释器支持的标签(METADATA.tags)比较，不启动子进程；
+        源码包与平台无关，视为适用
+        @param tags 目标解释器支持的标签，如 ["cp312-cp312-win_amd64", ..., "py3-none-any"]
+        """
+        supported = {tag.lower() for tag in tags}
+        for filename in self.files(name, version):
+            fileTags = wheelTags(filename)
+            if fileTags is None or fileTags & supported:
+                return True
+        return False
+
+    def prefetch(self, interpreter, *requirements, indexUrl=None, onOutput=None):
+        """
+        用目标解释器 pip download 预取(含依赖)并加入仓库
+        @return [True, [filename, ...]] or (False, "Error: ...")
+        """
+        staging = tempfile.mkdtemp(prefix="wheelhouse")
+        try:
+            pyI = PyInterpreter()
+            pyI.setInterpreter(interpreter)
+            pyI.setOutputCallback(onOutput)
+            args = ["download", "--disable-pip-version-check", "-d", staging, "--find-links", self.findLinks()]
+            if indexUrl:
+                args.extend(["-i", indexUrl])
+            args.extend(requirements)
+            result = pyI.pip(*args)
+            if not result[0]:
+                return result
+            added = [self.add(os.path.join(staging, name)) for name in os.listdir(staging)]
+            self.evict()
+            return [True, [name for name in added if name]]
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+WHEELHOUSE = Wheelhouse()
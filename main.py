@@ -12,9 +12,11 @@ import getopt
 import logging.handlers
 import os
 import platform
-import time
 import simplejson as json
 
+# 启动追踪需在其他模块之前导入，才能统计它们的导入耗时
+from common.trace import TRACE
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QSplashScreen, QMessageBox
 from PySide6.QtGui import QPixmap
@@ -25,11 +27,16 @@ from manage import (
     SettingPath, SettingFile, CURRENT_SETTINGS,
     RUNTIMEENV, BUNDLE_DIR
 )
-from ui.MainWindow import MainWindow
 from common.pyinstaller import PyinstallerPackage
 from common.nuitka import NuitkaPackage
 from common.pipreqs import Pipreqs
 from common.config import diff_config
+from common.scheduler import SCHEDULER
+from common.thread import TH_POOL
+from common.uic import UIC_POOL, FORM_POOL
+from common.warmup import WARMUP, registerResources, probeInterpreter, listPyenv
+
+TRACE.complete("imports")
 
 
 # from pycrunch_trace.client.api import trace
@@ -112,6 +119,11 @@ def readConfig():
         with open(os.path.join(ROOT_PATH, SettingPath, "pipreqs.json"), "w") as f:
             json.dump(Pipreqs.PIPREQS_PARAMS, f, indent=4)
 
+def createMainWindow():
+    # 界面模块(及其依赖的资源模块)在主线程导入，与后台预热任务并行
+    from ui.MainWindow import MainWindow
+    return MainWindow()
+
 # @trace()
 def main(argv=None):
     os_platform = platform.system()
@@ -121,20 +133,40 @@ def main(argv=None):
         try:
 
             # opts, args = getopt.getopt(argv[1:], "h", ["help"])
+            # 只配置一次日志，重复调用会重复添加 handler
             log(LOGLEVEL)
-            app = QApplication(sys.argv)
+            with TRACE.span("qapplication"):
+                app = QApplication(sys.argv)
             app.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
+            # 退出时取消排队任务并结束正在运行的子进程
+            app.aboutToQuit.connect(SCHEDULER.shutdown)
+            app.aboutToQuit.connect(UIC_POOL.shutdown)
+            app.aboutToQuit.connect(FORM_POOL.shutdown)
+            app.aboutToQuit.connect(TRACE.save)
+            TH_POOL.bindApp(app)
+
+            # 启动画面，随启动任务显示进度，主窗口显示后立即关闭
+            splash = None
+            if os.path.exists(os.path.join(BUNDLE_DIR, UI_CONFIG["startLogo"])):
+                splash = QSplashScreen(QPixmap(os.path.join(BUNDLE_DIR, UI_CONFIG["startLogo"])))
+                splash.show()
+                app.processEvents()
+
+            def showProgress(title, done, total):
+                if splash is not None:
+                    splash.showMessage(f"{title} ({done}/{total})",
+                                       Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter,
+                                       Qt.GlobalColor.white)
 
-            # 没有运行配置时，复制默认配置
+            WARMUP.setProgressCallback(showProgress)
+
+            # 没有运行配置时，复制默认配置；其余任务依赖配置，先执行
             try:
-                readConfig()
+                WARMUP.step("config", "读取配置", readConfig)
             except Exception as e:
                 QMessageBox.critical(None, "Error", "Read Config Error!")
                 raise Exception("Read Config Error!", e)
 
-            # log enable
-            log(LOGLEVEL)
-
             # internationalization i18n setting
             # fluentTranslator = FluentTranslator(UI_CONFIG["MainWindow"]["Language"])
             # translator = QTranslator()
@@ -143,16 +175,17 @@ def main(argv=None):
             # app.installTranslator(fluentTranslator)
             # app.installTranslator(translator)
 
-            # 启动图标
-            existPic = os.path.exists(os.path.join(BUNDLE_DIR, UI_CONFIG["startLogo"]))
-            if existPic:
-                splash = QSplashScreen(QPixmap(os.path.join(BUNDLE_DIR, UI_CONFIG["startLogo"])))
-                splash.show()
-                time.sleep(2)       # 启动图标显示2s
-
-            ui = MainWindow()
-            ui.show()
-            if existPic:
+            # 后台预热: 资源注册、解释器版本探测、pyenv 版本列表(设置页构建时直接取用结果)
+            WARMUP.add("resources", "注册资源", registerResources)
+            WARMUP.add("interpreter", "检测解释器", probeInterpreter)
+            WARMUP.add("pyenv", "获取 Pyenv 版本", listPyenv)
+            app.processEvents()
+
+            ui = WARMUP.step("main window", "加载界面", createMainWindow)
+            app.processEvents()
+            with TRACE.span("show"):
+                ui.show()
+            if splash is not None:
                 splash.finish(ui)
             sys.exit(app.exec())
 
@@ -106,6 +106,7 @@ MIRRORS = {
         "tencent": "https://mirrors.cloud.tencent.com/pypi/simple/",
         "huawei": "https://mirrors.huaweicloud.com/repository/pypi/simple/",
         "douban": "https://pypi.douban.com/simple/",
+        "local": "",            # 本地 wheelhouse(data/wheelhouse)，离线安装
     },
 }
 
@@ -122,7 +123,8 @@ REQUIREMENTS_URLS = {
 SETTINGS = {
     "project": {
         "python_env_modes": ["独立模式", "跟随全局"],
-        "project_types": ["PySide6", "PyQt6", "PyQt5", "PySide2"]
+        "project_types": ["PySide6", "PyQt6", "PyQt5", "PySide2"],
+        "rcc_modes": ["Python 模块", "二进制 rcc"]
     },
     "designer": {
         "python_env_modes": ["独立模式", "跟随项目", "跟随全局"],
@@ -157,6 +159,7 @@ CURRENT_SETTINGS = {
         "project_path": "",
         "project_name": "",
         "project_type": 'PySide6',
+        "rcc_mode": "Python 模块",
         "recently_opened": []
     },
     "designer": {
@@ -194,5 +197,8 @@ CURRENT_SETTINGS = {
         "pip_mirror_url": "origin",
         "editors": ["notepad"],
         "editor": "notepad",
+    },
+    "window": {
+        "last_page": "home",
     }
 }
\ No newline at end of file
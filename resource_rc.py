@@ -1,10536 +1,20 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.7.2
+# Resource loader for resource.rcc
+# Created by: PyQt Creator (binary rcc)
 # WARNING! All changes made in this file will be lost!
 
+import os
 from PySide6 import QtCore
 
-qt_resource_data = b"\
-\x00\x00\xb1\x18\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01^\x00\x00\x01P\x08\x06\x00\x00\x00\xf7!\x16j\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xbbiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.eda2b3f, 2021/1\
-1/14-12:30:42   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.1 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-08-15T13:53\
-:49+08:00\x22 xmp:M\
-odifyDate=\x222024-\
-09-27T23:20:42+0\
-8:00\x22 xmp:Metada\
-taDate=\x222024-09-\
-27T23:20:42+08:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:347a5\
-fcd-6ebb-cc4a-9f\
-3e-692aae068ef9\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:21040\
-b41-a6e5-8647-85\
-ca-209c85144c30\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:21040b41-a6e5\
--8647-85ca-209c8\
-5144c30\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:210\
-40b41-a6e5-8647-\
-85ca-209c85144c3\
-0\x22 stEvt:when=\x222\
-023-08-15T13:53:\
-49+08:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.1 (Windows)\x22/>\
- <rdf:li stEvt:a\
-ction=\x22saved\x22 st\
-Evt:instanceID=\x22\
-xmp.iid:347a5fcd\
--6ebb-cc4a-9f3e-\
-692aae068ef9\x22 st\
-Evt:when=\x222024-0\
-9-27T23:20:42+08\
-:00\x22 stEvt:softw\
-areAgent=\x22Adobe \
-Photoshop 23.1 (\
-Windows)\x22 stEvt:\
-changed=\x22/\x22/> </\
-rdf:Seq> </xmpMM\
-:History> </rdf:\
-Description> </r\
-df:RDF> </x:xmpm\
-eta> <?xpacket e\
-nd=\x22r\x22?>\xd8~b\x95\x00\x00\xab\x03\
-IDATx\x9c\xed\x9dy`\x14\xe5\xf9\xc7\xbf\xef\
-\xecf\x93l\x0eB\x08\x10B\x80\x80\xdc \x22*\x22\
-\xde\xb7U\xeb\xddZ\x8f\xaa\xf5\xb6j\xab\xb5V\xad\xb5\
-\xd6\xaa\xb5j\xad?\xdbZ\xef\xfb\xbe\xd1z\x8b\xb7\x22\
-**\x22\x02\x22\xf7M\x08!w6{\xcc\xfb\xfbc\
-\xf7\x9d\xf7\x98w\xf6H\xf6J\x98\xa7\xc5\xcd;\xef\xbc\
-\xe7\xbc\xf3\xccg\xbe\xfb\xec\x0c\xa1\x94\xc25\xd7\x5cs\
-\xcd\xb5\xec\x99\x91\xeb\x0e\xb8\xe6\x9ak\xaemo\xe6:\
-^\xd7\x5cs\xcd\xb5,\x9b\xebx]s\xcd5\xd7\xb2\
-l\xae\xe3u\xcd5\xd7\x5c\xcb\xb2\xb9\x8e\xd75\xd7\x5c\
-s-\xcb\xe6:^\xd7\x5cs\xcd\xb5,\x9b\xebx]\
-s\xcd5\xd7\xb2l\xae\xe3u\xcd5\xd7\x5c\xcb\xb2\xb9\
-\x8e\xd75\xd7\x5cs-\xcb\xe6\xcdu\x07\x5c\xeb\xfd\xd6\
-\x15\x09\x14\x85\x22!_\xc8\x0c\xfaB\x91\xa0/l\x86\
-\xbd\xc1H\x97/h\x06}\xe1\xd86\x000\x0c\x8f\xe9\
-!\x9e\xb0\xc7\xf0\x86=\xc40=\xc4\x1b\xf6\x18\x1e\xd3\
- \x9e\xb0\xd7\xf0\x86K\x0a\xca\xda\xca|\xfd\x9ar<\
-\x1c\xd7\x5c\xcb\xb8\xb9\x8e\xd7\xb5\x84\xb6\xb9mc\xcd\x86\
-\xd6u\xb5\xeb[\xd7\xd6\xaeo];|c\xdb\xba\xa1\
-\xeb[\xd7\x0c\xdf\xd8\xb6\xaevK\xfb\xe6j\xc3 &\
-@G\x13\x02\x00\x14\x84\x10\xe1\xd3T\xd2\x14l?\xc3\
- \xa0\x94\xa5\x01\xc3\xc0*J\xa91\xa2\xdf\xe8eC\
-\xcb\xeaV\x0d+\xab[YS:b\xcd\xd0\xb2\x91+\
-\x86\x96\x8e\x5c5\xd8?t]nf\xc05\xd7\xd2k\
-\xc4}V\x83k\xcc\x965\xfe8\xf6\xc7\xadK\xc6/\
-o\xfcq\xf4\x92\xad\xdfOZ\xdb\xbc\xban}\xeb\x9a\
-\xe1\x00@\x08Fs\xa7\x09\xe1\x93Zi\xb6\x8d9Y\
-\x9e\xc7\x9d\xae\xba\xafX\x9e\x7f\xaa\xedP\x10B\xd6\xf8\
-<\xbe\xe0\xd8\xfe;.\x18W\xb9\xd3\xb7c\xfa\xef\xb8\
-pL\xc5\x94\x05\xc3\xcavX\x96\x91\xc9p\xcd\xb5\x0c\
-\x9a\xebx\xb7Ck\xedj)_\xbce\xd1\xc4\x1f\xb6\
-.\x19\xbf\xb4a\xc9\x84\xe5\x8d?\x8e^\xb4e\xe1\xe4\
-\x98\x93\x1b\xab\x12\xaaa\x00\x94rB\x15\xd3:\x92\x95\
-\xd3p\xd8.\xd6o\xaf\x97\xa5\xed\x04-\x95_S\xe4\
-)\x0e\x8c\xab\x9c:\x7fL\xc5\xe4\xef\xc6WN\xfbz\
-\xa7\x81{\xce)-p\xe5\x0a\xd7\xf2\xdb\x5c\xc7\xbb\x9d\
-\xd8\x97\xeb\xbe\x98\xfe\xf1\xea\x0f\xf7\xfbx\xf5G{/\
-o\xfcq,\x80\xb1\xf1\xa8\xd5\x99<\xc5\xb4~\xbb\x9e\
-b\x19\xf9\xa6^\x9f\xbd~{\xbfy\xfdd\xdd\xd4\x81\
-{}\xb2W\xcd\xe1\xaf\xcd\x1cr\xf8\xeb\xe5\xbe\xca\xc6\
-T\xe7\xca5\xd72m\xae\xe3\xed\xa3\xb6\xb5ck\xd5\
-\x87+?\xdc\xe7\xa3U\x1f\xee\xfb\xd9\xda93\xdb\x83\
-\xad\xe5\x84\x90\xb1\xdd!QU\x935\x0c^^&_\
-\xb5\xbe\x945^[}=$\xebu;\x0e\x981w\
-\xcf\x9a#_\x9b9\xe4\xf0\xd7\xfb\x17\x0e\xac\xcf\xd4|\
-\xbb\xe6Z*\xe6:\xde>d\xdfl\xf8f\xda\x07+\
-?\xdc\xef\xa3\x95\x1f\xee\xfdC\xc3\x0f\xe3\x01:\xdeN\
-\x8az\x9d5\xbe3N\x8eP\x9d5\xde\xf8m;\xd5\
-\x97\xa8?\xce\xfa\xb2\xae>\xb2n|\xff]\xbe\xdew\
-\xe81/\xed7\xf4\xf8\x17\xfd\xde\xb2\x96\xa4'\xd65\
-\xd7\xd2l\xae\xe3\xed\xe5V\xdfV?\xe8\x85\x85/\x9e\
-0k\xd1\xcbG\xafi^=\x1c\xc0\xf8D$\x1b\x9f\
-\x1c\xed\xfb\xe5\xb1\xc6\xdb\x8d\xf1\x01E\xde\xa2\x153\xab\
-\x8fx\xf5\xd0\xe1\xa7>1\xbe\xffn_\xa4\xff\xa8\xb8\
-\xe6Z|s\x1do/\xb4@8P\xf4\xc6\x0fo\x1d\
-\xfe\xd2\xf7/\x1f\xfb\xf9\xda\xcf\xa7G\xbf\x10\x8b\xe6%\
-C\x8ezm4\xd9\xf2\x89\xf7KM\xe3M\x9d\xac\xe3\
-\xb5\x93b\xbf7\x0c/\x1b\xbb\xf4\xe0a'?\xb5\xff\
-\xd0\x13\x9f.\xf1\x96\xbb\x14\xecZV\xccu\xbc\xbd\xc8\
->[\xf3\xf9\xcc\xe7\x17\xbcx\xfc;\xcb\xde=\xa43\
-\xd49\xd9N\x88\x04\x94\x9ai'\xd1^\xac\xf1j\xc6\
-c*\xf3e\x91\xf5\xa6\xbd\x86\x1c3\xeb\x88\x11g=\
-0\xb6\xdf.\xf3\xd2{\xe4\x5csM6\xd7\xf1\xe6\xb9\
-u\x04;\xfcO\xcc\x7f\xe6\xd4\xc7\xbe~\xf2\x97\x1bZ\
-6\xd6\x10\x82Q\xc9j\xa0\xfah\x00U\x8f\xed)\x89\
-f-\x8eW3\x9e\x8cDOl\x9a6\xf0\xc0\xd9\xbf\
-\x1cs\xf5\x8d\xc3J\xc7/\x81k\xaee\xc0\x5c\xc7\x9b\
-\xa7\xb6\xa5\xbda\xd0\x03_<z\xe6S\xf3\x9f=\xa9\
--\xd86%yM41\xf9m\xef\x1ao\x92\xe3\xd9\
-\xb4\xcf\x90\xe3^\xfc\xc5\x0eW\xdc<\xb0x\xd8\x9at\
-\x1e[\xd7\x5cs\x1do\x9e\xd9\x8a\xad\xabF\xdd=\xf7\
-\x81\x0b\x9e[0\xeb\x04Bh]:\xb5\xd7x\x1a/\
-K\xa7\xa3\x9d\x1c\xc7\xf1\xf6x~\x94\xed\x9b~2\xec\
-\xcc\x07\x8f\x1fu\xe9\xed\xe5\x05\x03\x1a\xe0\x9aki0\
-\xd7\xf1\xe6\x89}\xbe\xe6\xab\x19\xf7\xce}\xe8\x9cw\x97\
-}x\x10!\x18\x9e\x0c9\xeaH\xcd\xd5x\x13k\xbc\
-:\xd2NT_\x91\xc7\xbf\xe2\xa7#.\xb8\xeb\xa7\xc3\
-/\xf8o\xa1\xc7\xdf\xd1\xa3\x83\xed\xdavo\xae\xe3\xcd\
-\xb1\xbd\xfb\xe3\x87\x07\xdd\xfe\xd1]\x97~\xb7i\xd1d\
-B({.\x82u\xd2\xcb\xe9\xd44P'\x8d\xd7^\
-gz\xa2\x0d\xd86\x1dY\xc7k\xdb\xa9\xbeD\xfdI\
-1\x8e\x17\x89\x9dv\xe2:+\x0a\x07-8g\xdc\xad\
-\x97\xefRu\xc8\xdbp\xcd\xb5n\x9a\xebxsd?\
-\xd4/\x1b\x7f\xcd[\x7f\xbb~\xee\xeay3\x08Am\
-\xba\xb4W\xc0\xd5x\xbb\xa3\xf1\xa6\xd8\xce\xa6\x99\x83\x8e\
-~\xe5\x8c\xb1\x7f\xbb\xaa\xac\xc0\xfdI\xb2k\xa9\x9b\xeb\
-x\xb3l\x9b[\xb7T\xff\xfd\xbd;\xaex~\xc1+\
-'\x00\xa8\x8dO\x7f\xdd\xd3@\xe3\xef\xe7\xc6\xf1\xa6:\
->'M\xbc\xdcW\xb9\xe4\xf417^=s\xd0\xb1\
-/\xc25\xd7R0\xd7\xf1f\xc9\xda\x82\xed\xa5w~\
-\xf2\xe0E\xf7\xcd}\xec\x9c\xaeH\xd7\xa8d4\xd0T\
-4^7\x8e7y\x8d\xd7!\x8e7\xe5\xfab\x9f\xf5\
-S*\xf7\xfb\xe0\xfc\xf1w\xfc\xb6\xc27xS\xb7\x16\
-\x87k\xdb\x9d\xb9\x8e7\x0b\xf6\xf0\x97\xcf\x9c\xf1\xcf\x0f\
-\xef\xbalk\xfb\xb6\xc9\xfc\xe4\xed\xae&\xca\xcb\xcb\xe9\
-\xc4\xe4\xa8o\xbb\xa7$\xda\xe7\xe2x\x1d\xc6\xa3\xd6/\
-\x8f\xc7\xef-[v\xf2\xa8k\xaf\xdb\x7f\xc8\xa9\x8f\xc3\
-5\xd7\x12\x98\xebx3h\x1f,\x9b\xb3\xdf\x95\xaf\xdd\
-x\xf3\xda\xa6\xf5\xb5\x94\xd2\x1a=Y\xa5\xaea\xbaq\
-\xbc=\x19_\xd2q\xbc\xddi\xa7~\xd7\xaa\xc3\xde\xfc\
-\xf5\xf8\xbb\xcf\xf3\x19E\x81n.\x1b\xd7\xb6\x03s\x1d\
-o\x06\xac\xa1\xbd\xb1\xea\x9a\xd7o\xb9~\xd6\xc27\x8e\
-!\x84T'KV\xb9\xd4x\xed}\xe9~;},\
-\x8e\xd7a<*\x05\xf3m\xb5\xfeq\x9f\x5c6\xf9\xc9\
-\x93\xaa\x0ak\xddW\x15\xb9\xa65\xd7\xf1\xa6\xd9\x1e\x9b\
-\xf7\xc2i7\xbc\xf3\x7fW7w\xb6\x8c\xed\x9e&\xda\
-=\x8d\x97mw5\xde\xc4\x1aow\xe2x\x939^\
-\xe2xJ\xbc\xe5\xcb.\x9d\xf4\xd8/\xc7\x95\xcf\x98\x9b\
-\xc2\xf2qm;1\xd7\xf1\xa6\xc9\x96nY9\xf6\x92\
-\x97\xae\xbd\xe3\xebu\x0b\xa6\x01\x18\xe4Le\x80JK\
-:\x12\xe5'3`\x18\xd1OB\xc4O^G\xf4d\
-'`\x87R=\xa4\x94\x02\x94\x12\xabN\xb9\x8d\x9ej\
-\xbc\xa9\x8dG\xd7\xb6S}\x89\xfa\x93\x8b8^>_\
-D3\x1e[}\xf5\xa7\x8c\xfa\xeb\xb5\x87\xd6\x9cw7\
-\x5csM0\xd7\xf1\xa6\xc1\xfe>\xfb\xbfW\xfe\xf3\x83\
-{/#\x84T\xe95Qg\xb22\x0c\x0a\x8f\x07 \
-\xc4\x84\xc7\x03\x18\x06\xfb\x8cng\xf5\xe9?IJ\xf9\
-\x84\x10\x84B@$\xe2A8\x0c\x84\xc3\x06B!\x92\
-\x90\xe8\xb6\x07\x8d7\x9d\xed(\xf57\xcc\x18t\xcc\xac\
-_\x8f\xbd\xf7\x9cn/0\xd7\xfa\x9c\xb9\x8e\xb7\x07\xf6\
-\xed\xfa\xc5S\xcf}\xe6\x8a{V6\xae\x1dE\x08\xaa\
-\x12\x11T\xd4\x99F\xffy\xbd\xd4\x22M\xfe\xc9\xff\xe6\
-\xce\x80\x93.\xabO\xcc\x17?E\x0addl\xaf\xdf\
-\xbe=\x1c&\x88D\xa2N8\x14\x8a~Rj@\xef\
-<\x9d\xc7\xe7L\xbcN\x84\x98>\xe2U\xfb\x94\x0a\xa9\
-;\xa5\xd3@\xbc\xac\x8f\x0dc\xcaw\x9dw\xd9\xc4\xa7\
-O,\xf6\xb8\xcf\xfcu\xcdu\xbc\xdd\xb6\x9b\xde\xf9\xef\
-\x1f\xff\xf9\xc1\xfd\x97\x02\xb4\xca\x89x\xbc\xde\xe8\x89\xe7\
-\xf5\x8a\xd2\x80\xf8I@\x88\x19\x87\x5cS#\xdad\xf2\
-\xb9\xd3\x88\xb6kw\xce\x9c\x8cC!\x0f\xba\xba\x0c\x84\
-B\x1e\x84B\xe8\xd3\xc4\x9b\xa6\xa8\x06\xe9\xf8\xabw<\
-5\xfe\xd1s/\x9f\xf4\xfc\xf1\x95\xbe\x9a\x0d=Xz\
-\xae\xf5\x01s\x1do\x8a\xb6d\xf3\xf2\xf1g?u\xc5\
-\x03?lY>\x16@\x95\xea\x5c<\x1e*\xc8\x07\xc9\
-\x11g*\xf9\xceN6\xda\x0f=\xe9\xf6\xb4}\xc04\
-\x81\xceN\x0f\xba\xba<\xe8\xec\xf4\x80R\x22\x8d;\x17\
-$\x9a\xafQ\x0d\xf1\xea\xab\xf0\x0dZt\xe5\xa4YG\
-W\x17\x8f^\x06\xd7\xb6[s\x1do\x0av\xe7\xc7\x8f\
-]\xf4\xe7\xd7\xffy\x1d!\xa4\x92\x9fT\xa6\xe5dE\
-M6\x19\xb2\x8c\x12V\xf4[v.'\xa8\xc4\x9a\x88\
-\x88\xbb\x97/:)'g-F\x17\xa8\xfd\xeb\xea2\
-\x10\x08x\xd1\xda\xeaA$\xe2\x01w.*\x11n\x9f\
-Q\x0d\xf1\xc6SR\xd0o\xc5%\xe3\x9f8eL\xd9\
-\xeen\xc4\xc3vj\xae\xe3M\xc2\x9a:[*.x\
-\xf6\xcfw\xbd\xbd\xe4\xa3C\x00T2\xa7\x14\x95\x09\xf4\
-\x1a\xad3Qv/?}\x1ao\xa2\xf6S'\xe2`\
-\xd0@{{\x01Z[\xbd0M\xee\x94\xdc\xa8\x86\xb8\
-\xe3k\xb8d\xfcS'M\xa98h\xb6~\xd5\xb9\xd6\
-\x97\xcdu\xbc\x09\xec\xcb5\xdfM?\xed\xb1\xdf?\xb2\
-\xb9u\xcbx\x1d\xf9\xc5\xd7Z\xa3\xce\x999!\xbb\xd3\
-r\x22\xddD\xf5\xa6/\xdf\xb9_\xdd#\xf1\x8e\x0e\x0f\
-Z[}hk\xf3$\xed\xfc\xf2A\xe3Mg;)\
-D\xb54\xfca\xc2\xacc\xc7\x95\xef\xf9I\xd2\x0b\xd2\
-\xb5>a\xae\xe3\x8dc\xb7\xbd\xf7\xe0\xefox\xeb\xce\
-\xab\x09\xa1\x15\x00w\xba\x99 \xdad\x8933\x1ao\
-\xfaH\x9d\xf5\xc74\x09ZZ\x0a\xd0\xdc\xecC$\x12\
-\xf5x\xe9\x8a\x17fi\x1dM:\x13s\xe2\xfa\x9c\xf6\
-\xd3i\xc9r{\xa9\x91\xba\x98.\xf4\x14\xaf\xfb\xc3\xc4\
-\x97\x8f\x1eY\xb2\xf3\xd7pm\xbb1\xd7\xf1jlk\
-{S\xd5\x99O\x5c\xf5\xc0G\xcb\xbf\xd8\x87RZ\xd1\
-3\x0d5\xdf5\xdeD\xfdS\xe5\x0e\xd9\xc9'\xba\x08\
-\x00\x14\x1d\x1d^l\xdbV\x80\xce\xce\x02p\xa7\x93;\
-\x8d7\xcdO'Kb<\xbc>\xfbxL\x94\x16T\
-.\xbbr\xc2\xabG\x0c)\x1e\xbb4\xfe\xcat\xad\xaf\
-\x98\xebx\x15[\xb8a\xe9\xe4\xe3\x1f\xb8\xf8\x85M-\
-\x0dc\x01(\xceJ\xaf\xa1\xaa\xf9\xe9$G\xd9\xe9\xd9\
-\xf3\xd3\x11\xc7\xdb\x9d|\xe7\xfe\x89w\x06\xb2S\x0a\x06\
-\x09\x1a\x1b\x0b\xd1\xd2R\xa0\xa5G\xfe\x99\xba\xc6+\x7f\
-\xa6\x87x\xd9\xdf|\x9cb\xfd\xd1\xfe\xc8\xfb\xa6\xa2\xf1\
-r\x0d\x1c\xa0\xe8\xe7\x1b\xb8\xe4\xaa\x89o\xfed`\xe1\
-\x88Up\xad\xcf\x9b\x91\xeb\x0e\xe4\x93\xbd\xf8\xed\xdb\xc7\
-\xcd\xfc\xe7I\x9fml\xde:\x96RN(\xea\xcfq\
-\xd9v\x80h\xf3\xa3\x9f\xd1\xfc\xe8\xc9I\xec\x8d\x81\xe7\
-\x93\xd8Y)\x9e\x9c\xac\xdeh\x9aX\xed\xaa\xf9\xd1\xed\
-\xf1\xfa\x07\xe1\x93\xb7\xcb\xfb\x07\xa5\x7f\xf6~\xcb\xfdc\
-\xed:\xf5\x8f\xe7\xb3vY\xba\xb0\xd0\xc4\x90!\x1d\x18\
-3\xa6\x15\x95\x95\x01\x18\x06\x95\xfao\x1f\x17\xaf\xcf>\
-O\xea\xbcR\xe1\x93\xd8\x8e\x83n~t\xed\x8a\xe3e\
-\xf5\xa9i\xfb\xfcA\x19/\xab\x0f\xb6\xf1\x89\xe3aF\
-\x08AKh\xcb\xf8\x7f,9\xea\xe5\xa6\xd0\xa6j\xb8\
-\xd6\xe7\xcd%\xde\x98\x9d\xfd\xc45\x0f<\xfd\xd5\x1b\xbf\
- \x04~ \xfemt\xf7\xc9\xb1\xe7\xc4\x99\xab8\xde\
-TI\xdd\xde/;\x89\x9b&\xd0\xd8X\x88\x86\x86\xc2\
-n\x91\xa8N{\xcd\xf78\xdeD\xe3\x19R<v\xee\
-\x15\xe3_;\xa2\xc4\xdb\xdf}\xa5P\x1f\xb6\xed\xde\xf1\
-6w\xb6V\xecy\xdb/?]\xd1\xb0~\x94a\xa0\
-(\xfb\x1aj\xae5\xde\xee\xc5\xf1\xf2\xfa\x13k\xbc\x89\
-\xf2\xc3a\x03\x1b7\x16\xa3\xa3\xc3\xbb]\xc4\xf1\xaa\x1a\
-\xafZ\xdf\x98\xb2\x19\xaf\xffa\xfc\xabG\xc4Y\xb6\xae\
-\xf5r\xdb\xae\xa5\x86\xf9\xeb\x96L\x1dy\xcdOV.\
-\xdf\xb2~\x22!(\x92oGE\x19A>\x19Y\xbe\
-\xf3\xc9\x0a\xc82\x82\xee\xe2&\xde\xaeR\xab]\xfe)\
-\xde\xae\xf3\xdb\xd6\xf4\xf7\x0fJ\xff\x88\xf5\xc9/\xcab\
-\xff\x88\xd2?U\x8e\xd1\xddn\xc7\x93%\x00\x9f\xcfD\
-]];\x86\x0foGa!\x15\xea\xe5\xe3\x94\xdb\xe3\
-\xfd\xb7zm\x8d\x8b\xd7\xcb\xda\xb3\xcb#\xf2\xbc\xa9r\
-\x8c\xcc\x22\xe2<\x88\xf3\xa6\xb6\xeft\x1c\xe00\x1e6\
-\xaf\xf6u\xb0\xacm\xee\x8c'V_v\x1b\x5c\xeb\xb3\
-\xb6\xdd:\xde\x97\xbe}\xef\xb8=\xffq\xc6\xa7\x1d\xc1\
-\xae\x0ag\x0dUu*\xba\x93\xc9\xae!\x8a\xdb\xd9\xc9\
-e7'\x0dU%-\xd5Y\xc1\xd6\xafT4^{\
-\xff\xa0\xf4/9\x8d\xd7\xde?\x99\x08\xed\xfdS\x9d\xb4\
-]\x8b-+\x0ba\xcc\x98f\x0c\x1e\xdc\x05g\xc2\xe4\
-\xfd\x80Mce\xa6\xd3x\xed\xceOw\x11\x10\xc7\xcb\
-\xe6#3\x1a\xaf\xd0[\x22\xcf7\x80\xca\x0f\xb7<|\
-\xc6\x87[\x1e:\x13\xae\xf5I\xdb.\xa5\x86{>y\
-\xfe\xfc\xdf<s\xeb\x1d\x00\xf5\xd9o\xaf\x01\x00m\x86\
-\x01\xb3\xc0\xe3\x09\x97\x15\xf9[\x0a<\x9e\xb0\xcf\xeb\x0d\
-\x16x\xbc\xc1\xa2\x82\x82\x80\xcf[\x10,*\xf0\x05\x8a\
-\x0b\x0a\x03\xc1H\xd0\xd7\x15\xee\xf2\x05#A_\xc8\xec\
-\xf2\x85\xcc\x907\x1c\xfb\xd7\x19\xee\xf0SDX\xfdu\
-r[NZ\xa9\xfe\xb6\x9f\xe5\xf5\x968\xded4\xde\
-x\xf5\x87\xc3\x066l(Fkk\x01\x00\x9ds\x8c\
-\xee\xc7\xf3\xf8\xf8\xf4r\x01l\xfb&\xbb_&\xe3x\
-\xe5:l\xed4^6\xee\x7f?\x1d[:s\x0e\x5c\
-\xebS\xb6\xdd9\xde\x1b\xde\xb8\xffO\x7f}\xed\xbek\
-\x01\xea\x8di\xa0A_\x817XUR\xdePW5\
-t\xd5\x94\xa1c\x16\xec9j\xe7O\x7f\xb6\xf3a\xcf\
-\xa6\xab\xcd7\x7f\x98}\xd8\x82\x8d\xdfOY\x5c\xbfd\
-\xc2\x9a\xa6\xb5\xc3\x1b;\x1b*;\xc2\xad~\xc3\x80\x09\
-\x98\xe3\xfbz\x1coO~Q\xd7\xda\xea\xc1\xc6\x8d%\
-\x08\x06\xe3=78\xda\x9e~\xbb]\xe3\xcd\xb78\xde\
-x\xbf\x84\xf3{\xfa\xad\xf8\xd3\xc4\xf7\xf7\x1f\xe0\x1b\xbe\
-&\x89\xa5\xe6Z/\xb1\xed\xca\xf1\xfe\xe6\xd9[\xff\xfd\
-\xdf\x0f\x9e\xffueIi\xe3\x94\xda\xd1\x0b\x0e\x9b4\
-\xf3\x8d\xd3\xa6\x1f\xf9\xe8\xa0\xf2\x01\xf5\xb9\xe8\xcf+\x8b\
-^;\xea\xbd\xe5\xef\x1f\xb8p\xf3w\x93\xb7tl\xaa\
-\x8a \xe8#\x84\x8e\x17\xc9Q!\xf1\xb8d)\xd2Y\
->\xc6\xf1\xda\xe3\x9e\xc5\xfa\x9d~\xbe\x1c\xad\xb3\xbe\xbe\
-\x08\x9b6\x15%$^q\x8e\xf8\xb6\xee\x11/\xfb\x9b\
-\x8fS\xac?\xea$\xe5}u\xed8ED\xc8q\xbc\
-bZ\xac\x0f\x00j\x8a\xc7\xcd\xbdr\xfc;\x07\x17\x1a\
-%m\xbau\xe4Z\xef\xb3\xed\xc6\xf1\xce^\xf2\xc5A\
-/|\xf3\xee\xf1W\x1ez\xc6\xcd#*\x87\xac\xcau\
-\x7ft\xb6\xa6i\xed\xf0\x17\x16\xbep\xc2\xbb+\xde9\
-pm\xeb\x8aQ\x86A\x0d\x80\x8e\xed\x099v\x87t\
-\xa3N \xb7\xd1\x16\xbag\x5c\x04\x02^\xacZU\x82\
-P\xc8@*$\xaa\x92\xac\x18m\x90\xcd\xe7\xf1v\x9f\
-\xac\x81\x9d\xfa\x1d\xf6\xe4\x05;<qJ7\x97\x96k\
-yf\xdb\x8d\xe3\xed\x8d\xf6\xbf%\xff;\xea\xa5E\xcf\
-\x1f\xbf\xa8\xe1\xdb\xa9!\xda\xe1'\x04\xa3\xfbR\x1co\
-w\xea\xa7\x94`\xedZ?\x9a\x9a|\x1a\x9aLNS\
-u\xde\xae/\x9f\xcd8^\xfbx\xac\xfd\x1aO\x1av\
-\xeb\xe5\xfbT\x9d\xf9`\x9c%\xe3Z/1\xd7\xf1\xf6\
-\x12\xfbq\xeb\x8fc\xef\xfa\xe2\xdf\x17\x7f\xb6\xee\xbd\x03\
-L\xa3\xcb\x07\xd0\xd1}%\x8e7YYB$\xc6\xad\
-[}X\xb7\xae\x04\x89\x9d\x9d]\xe3\xcd\xf78^'\
-\xa7]\xe8)\xdep\xf5\xf8\x0f\xf7\x1dT\xb8\x83\xfb\x10\
-\xf5^n\xae\xe3\xed\x85\xf6\xda\xd2\xff\x1d\xf5\xc8\xb7\xf7\
-\x9c\xb7\xa6u\xe9X\xc30\x0d\x80\x8eJ^\xe3MD\
-\x96\xdd#\xe6d\x9c\xb4\xb3\xc6\xdb\xbdv\x03\x01\x0fV\
-\xae,E0hX\xce\xc9\x99D\xe3;5\x1du:\
-\xd7\x99\x0e\x8dW\xad?\xb9\xe7\x17\x0f-\x9e0\xe7O\
-\xe3?\xd93\xf9\xd5\xe2Z>\x9a\xebx{\xb9\xdd6\
-\xe7\xa6?\xbe\xb9\xe2\xc5c;\x22\x8d\x95\x86\x81Q\xa9\
-j\xc0\xf9\xa6\xf1\xaa\xf9\x89\xfag\x9a\xc0\xaaU\xa5h\
-i\xf1&M\x8e:\x8d7y\x8d8\x17\x1a\xaf\xb4\xbd\
-\xe9'\xd5\xbf\xbb\xed\xa8!\x7f\xba\xa1\x07\xcb\xc6\xb5\x1c\
-\x9b\xebx\xfb\x88\xbd\xb6t\xd61\xff\xfa\xf2\x86k:\
-\xe9\xb6\x0aB\xe8\xa8\xd4\x885y\x8d5Q~\xa65\
-^\xa7\xfc\x8d\x1b\x8b\xb1iS\xb1\x03y\xa6\xa2\xf1\xda\
-\xf7\xd3i\xaf</Q}NN\x16\x9a:\xe2j\xbc\
-b\xf9\xa6\xcb\xc7\xbe}\xf0H\xff\xae\xf3\x12.\x0c\xd7\
-\xf2\xd2\x5c\xc7\xdb\xc7\xec\xb9EO\x9e|\xdf\xfc[\xae\
-\xe8\xa2\xcd\xe5\x86A\xeaz{\x1c\xaf^\x83\x96I\x9c\
-moi\xf1a\xc5\x8a\x12\xc8\xaf\xa6\xb7k\xbc\xbd)\
-\x8e\xd7\xa9?\xfd}5\x0b\xaf\x1c\xfb\xde\x81e\xde\x81\
-9\x09\x85t\xadg\xe6:\xde>jO~\xf7\xe0\x99\
-\x8f,\xbc\xe3\xb7!\xd2RN\x08\xad\x8bO\xbc\xa9k\
-\xad\xd9\x8e\xe3M\x96\x84\xbb\xba<\xf8\xf1\xc7\xb2X\xc8\
-Y\xcf\x88\x97\xfd\x9d\x19\x8d7\xf98^'\xb2\x9eT\
-v\xd0\xf3\xbf\x1e\xf5\xec\xcfRX\x16\xae\xe5\x89\xb9\x8e\
-7\x8e\xd1\xd0\xd6*3\xb0|\x14\x0dn\xae\xa6\xa1\xad\
-\x954\xbc\xad\x12\xe1\x0e?\x00\xf6\x1b|\x13\xa4(\x00\
-\x8f\xbf\x83\x18%\x1d\xf0\x94\xb4\x11\xa38@\xbc\xe5-\
-\xa4\xb0f\x83\xe1\x1f\xb9\x22\xd7c\xb8\xe7\xab\x7f\xfe\xee\
-\xb9\x1f\xef9\x8f\x92\xae\x22\xc3\xc0\xf0dH7_\xe3\
-x\x93#q\x0a\xd34\xb0ti\x19::\xbcHV\
-\xe3\xcd\xf78^;\xb9S\x18\x06\x9a\xce\x18~\xef9\
-\xbbV\x9c\xf0|zV\x8bk\xd92\xd7\xf1\xc6\x8cv\
-\xad\x18\x15i\xfd|\x86\xd9\xf6\xe5n\x91\xb6\xaf\xa7\x99\
-\x1d\x8b&\xd2p[)(\x8a@\x01\xd0\x98\xb3\x05\x01\
-5c\x0f41cec\xf9\xd1\x7f\x84\xfd\xddA)\
-`\x14\xd5\xae3\x8aG\xac\x22E\xc3\xd7\x18\xfeQ+\
-=\xfd\xa6\xce\xf7\xf6\xdf}.\xf1Uf\xf5y\xabW\
-\xbd\x7f\xfe=_ny\xeb\x10\xc3\xa0u\xbd9\x8e7\
-\x95\xfc\xe5\xcb\xcb\xd0\xd4\xe4Cj\xc4kw\x8a\xc9D\
-&\xa4R_\x1a4^+]\xe4)]\xf7\x97\xf1\xf3\
-v)\xf3\x0er%\x87^d\xdb\xad\xe35\xdb\xbf\x98\
-\x1ei\xfdx\x1f\xb3m\xee\xeef\xdb\xdc\x19f\xb0\xa1\
-\x8a\x80\x14\x99&\x8d:WJAh\xec)T\xcc\x99\
-\xc6\x9c\xae\xe8|\xad4\x85\xb4?\xa5l?\xd6\xa0T\
-\xbe\x8d\x14\x0d\xdd\xe0\xad\xd8u\x9eQ1\xed+o\xe5\
-\xee_x\xab2\xff\xa6\xd9\xf5\xadk\x86\xff\xe9\xa3\xf3\
-\xee\xd9\x10X4\x91\x10:\xbc7\xc7\xf1\xea\xe5\x0e;\
-I\xaf[W\x8c\x8d\x1b\xfdV\xbd\xbd9\x8e\xd7\xa9?\
-\xd3+\x7f~\xef\xe9\xc3\xee9\xaf{\xab\xc2\xb5\x5c\xd8\
-v\xe5xixsu\xa4\xf1\xf1S\xc3\x0d\x8f\xfe\xd2\
-\x0c,\x1d\xcbh6J\xb2\xb0;I\x89daQ/\
-s\xc2\x12\x09[y$\xfa\x07U\xcaC\xdc.8\xf3\
-h\xb96\xa3pP}A\xcd\xd1\xaf\xf8j\x8f\x7f\xc1\
-;0\xb3N\xf8\xb3\xf5\x1f\xecw\xf3\x17\x97\xdc\xd1\x85\
-\xc6JBP\xdb[\xe3x\xe3\xe5s\xcd\x99b\xeb\xd6\
-B\xac\x5cY\x06$tj2u\xb2mv\xbaM\x87\
-\xc6\xab\xd6\x9f\xba\xc6+\xd4\xdb\xf4\x9bQ/\x1f=\xb6\
-t\xef\x8fRY\x07\xae\xe5\xce\xb6\x0b\xc7\x1biy\xed\
-\xc8\xf0\xd6\x07\xce2[^?\x9cR\xf8\x9c\xc9\x94\x00\
-\x1a\x92Ue\x06\x99x\xb9\xd3f\xa4,\x931\x1c\x08\
-\x99;g\xa5\xde6\xa3h\xc8\xa6\x82\xa1G\xcf\xf2\x0d\
-?\xfe\x05o\xd5\x8c\xb9\x99\x9a\x97[?\xbf\xea\xa6\xf7\
-\xd6?y\xb2\xe1\xa1\xc3\xf3E\xe3U\xf3\xbb\xafA\xcb\
-\xdb[Z\xbcX\xba\xb4\x1c\xa6I\xb4\x1ao<\x92\xcd\
-\xbd\xc6\x9b\xb8\x9d\x01\xbe\x11\xf3\xff2\xee\x9b\x9d\xd3\xb2\
-0\x5c\xcb\xb8\xf5]\xc7\x1bi\xae\x087\xdeu~x\
-\xeb]\x17\xd0\xd0\xe6jP\xf8\xe2\x92)`i\xb6L\
-\xab\xd5\x11\xafE\xac\x895\xde\x14\xebe\xfb\xcb$\xec\
-)\xae]W0\xec\xd8\x17}#Nx\xc1[\xb9\xf3\
-\xd7\xe9\x9e\xa6\xb5-+G]\xf5\xf1i\x8f4EV\
-\xd5E\xe9\xb7\xb7j\xbcN$\x0e\xab\xdd\xd6V/~\
-\xf8!\xea|\xf5\xe4\xa8\xd7T\xf30\x8eW\xd7N\xd3\
-\x91\x83\xffx\xe3\xa1\x83~\xff\x8f$\x0f\xbdk9\xb4\
->\xe7xi\xb8~Pd\xeb?/\x0b7\xdew6\
-\xcc\xf6J\x99L\x85/\xc6\x1c\xc8\xd4\xa6\xf1Z\xfbC\
-\xd9?\x91\xc6\xeb _\x88\xfb#\xfa\xc2Gg\x92\x96\
-\xfa\xdb\xe6)\x1d\xb5\xa2`\xf8q/\x14\xeep\xea\xe3\
-\x9e\xb2Qi\x8d\x98xf\xf1}\xe7>\xfe\xe3MW\
-\x11#X\x97\x9c|\x90\x7fq\xbc\x89\xeb'hn\xf6\
-\xe2\x87\x1f\xfa\xf5\xfa8^]\xbb\x86\x81\xa6\xeb\xc7-\
-\x9e\xd0\xaf\xa0zS\xca\x0b\xc0\xb5\xacZ\x9fq\xbc4\
-\xbc\xa9:\xbc\xf5\x96+\x22M\x0f\x9eI#\x9d\xe5\xf6\
-/\xb6\xc0\xa92\xfdd\x9a\xa2\xc6k\xafO\x17-\x11\
-\xa7\xbf-\x85u\xc7\xbdX\xbc\xe3\x157{*\xc6/\
-I\xd7\x1c\xb6v5U\x5c\xf2\xc1q/5\x84\x97\x8e\
-%\x045\xbd1\x8e\xd7\xde\x1f;\x89o\xdb\xe6\xc3\xd2\
-\xa5\xe5V\xffY\xbf\x9dH\x94\x8fS\xac\x93\xb0\x03+\
-\xe4\xa5\xa2\xf1\xf6<\x8eW\xd7\xce\x01\x03\x7f\xfd\xb7c\
-\xabo\xbc:\xd9c\xeeZn\xac\xf7;^\x1a(\x0a\
-7\xfc\xf9\xfap\xe3\xff]\x02J\xbc\xced\x1a#P\
-\x91L\x15\xe2\x05\xa0!SG-V\xae7\x8e\xc6\xab\
-\xf6'\xa5zm$-\xd5\xdb\xe2\xab\xfd\xc9\xeb\xc5S\
-\xfep\xab\xb7*}2\xc4M\x9f_r\xc7\xe7[\x9f\
-;\x81\x10R\xd3\x1b\xe3x\x93!\xea\xc6\xc6\x02\xfc\xf8\
-c?\x8bH{i\x1c\xaf\xad\x9d\x02R\xb8\xe9\xfa\xf1\
-\x8b'\xf8=\x15MiY\x0c\xaee\xc4<\x7f\xf9\xcb\
-_r\xdd\x87n\x9b\x19\x98;#\xb4\xfe'oD\xda\
-\xdf<\x0a \x86\x95A\x05'H\xa2\xa4\x18\xfb\x80\xc0\
-)\x00sbb\x06;\x19@\xf8~\x10\x9c \xd1\xd7\
-\xcb\x8d\x08\xed\xf3zI\x9czAy\xfdlG\xb1;\
-T\xd8\xa2\xd4[\x18i\xf9qr\xd7\xd2\x87O\x0a\xd7\
-\xcf\xdb\xcd\xd3\x7f\xd2\x22\xa3\xb8\xe7\xf1\x9c{\xd7\x1e\xf6\
-f\xb9g\xe8\x86\xaf\xb6\xcc\x9eA\x0cZ\x0e\x08\xfd\xd7\
-:\x1d\x9e\xcf\x9d\x9e\xe8\xfc |2g*:U\xf1\
-_\xe2|\xd1\xe9\xda\xc9OuV\xe2v\xde\xbf\x92\x92\
-\x08\x8a\x8a\x22\xd8\xb6\xad0\xc1\xb8d\x12\x05\x88\xd4\xa6\
-\xbe\xdd\xf8\xf5\xe9\xc9Z\xd7\x8e\xbd\xff\x89\xda1\x11.\
-\xf5\x10o\xfb\xd8\xd2}\xdc\x08\x87<\xb6^K\xbc\xe1\
-\x86?\xdc\x1ai\xba\xe37\xd4\xa4>\xcb\x19\x01\x926\
-\x9a@3\x85J\xa6Z\x8d73q\xbc\x99\xeaoK\
-\xe1\xd8\xd3\x1e\xf5\xefz\xeduF\xd1\x80\x86\x9e\xce\xf1\
-\x9a\xd6\xe5\xa3/\xfb\xf8\x88\xd7LOk)!\xb4\xa6\
-7\xc6\xf1&\x22\xedM\x9b\x8a\xb0jU)\xf4N\x12\
-\x9a\xed\xdd\xd1x\xf9~\x19\xd6x\x01D\x7fTq\xfd\
-\xb8\xc5\x13\x0a\x8dR\xf7UAyjF\xe2]\xf2\xcb\
-hp\xc1\x94\xe0\xda\xc9\xdfG\x9a\xef\xf8\x0d@}\x84\
-0\x82\x84@\x8eTK\xa6\xd6\x0e\x8c%\x052e'\
-\x05\x89\xa1\xa7J\xa6\xd1\xfai\xec\x83#,k?z\
-*\xf0\xbfD\xe7\x0a\x8bdc\xfdb=\xb6\xf5\x17I\
-\xf7\x17b\x7fa\xf5\xb7<\xf0\xc3\xa3\x17m{v\xda\
-W\x9d\xdf\xdf{nO\xe7zx\xd9\x0e\xcb\x9e;|\
-\xc9\xb8\x81\xde\xf1K\x00lb\xda6\xff\xe4\xf3a\xf5\
-_3\x9f,\xdf\x9a/*:\x11\xd6\x9aLtl\x82\
-\xc4|K[\x87p\x1c \xe6S\xeb\x93\x10\xf0\x8b\x9b\
-x\xa7\xa2\xe4\x0f\x19\xd2\x89\x9a\x9a\x0e\xa1~^N\xae\
-W\xec'U\xfa\xc9\xeb\x17\x9d\xa48\x0f\xf6~\x00\xec\
-\xb8\xf2W\xc5\xcb\xf5\xc9iy\xbb\x98\xe6\xedD\xb7\x05\
-\x22m\xb5\x1fn\xbd\xe7|\xb8\x96\xb7\xd6\xab\x1co\xa4\
-\xf5\xee\xf3\x83\xebv\xfd\x0a\xa1\x1f'\x82R\x9fu\x12\
-\x01\xb0NF\x88'\x01[\xfd\xf2\xc9D\xc4\x93\x17\xc2\
-Ij\xe9\x11b\xbd\xe0\xb5\x8b\xb7{\xe2\xc9d}\xc6\
-\xea\x8d9W\xe9d\x11Oz\xa9}\xe5\xa4\x8d\xd7_\
-\xc2\xfb\x0b\xb1\xbf\x90\xfbK\x83\xcd\xc3\xdb\xe6\xfc\xe1\xd6\
-m\xcf\xcd\xf8<\xb4q\xce\xcc\x1eM:\x80\xbb\x0f|\
-\xf7\xc0I\xa5\x87\xbcM\x086\xd9\x89Ou:T\x9a\
-\x7f\xd5\xd9H\x17E\xc9\xd9\x89\xceTtF\xccdg\
-\xc5?U'N!;w\xe5\xa2\xaa\xe4S\x0a\xd4\xd5\
-\xb5c\xe0\xc0N\xdbm=kOM\xeb\xfa'\x8eG\
-\xbe\xe8\xe8.6b}\xa2\x93\xb5\xd7\x17\xdbC\x99\xa7\
-\xc4\xed\xbc\xd7\xf0\xef\x8bC4P\xa4\x1eK\xd7\xf2\xc3\
-z\x8d\xc6\x1b\xd9v\xd5M\xe1\xc6?\xdf\x00\x02o\x22\
--\xb6\x07\x9a\xa9\xa6^(\xf5vO\xe3MK\x7f\x93\
-\xd2\xa4\xad^\x14\x9a\x9d\x0dC\xbb\x96>y\xbc\xd9\xbe\
-\xa9\xa6\xa0f\xafO\x88\xc7\x17L<\xd3z\xdb\x7f\xd8\
-1\xb3\xb6\xb5u\x94\xach\x9f7\x01\xa0\xa5\xb9\xd4x\
-\xd5\xfch\xfb21\x8b2\x05\xef\x17\xb42\x04!@\
-UU\x10\xad\xad^\x04\x02\x1ei<z\x8d\x97\xa7\xe3\
-\x91\xa8^.\xb0\xcf\x9b\xae^\x96V\xe77\xd9v\xc2\
-\xe8\xea\xd7\xcf;d\xf5\xf0\xe2ii\x8f\xfdv\xad\xe7\
-\xd6+\x1co\xb8\xe1\xd4'\x22\xad\xf7\x9dC\x08\xf1\xca\
-\xdeH$HX\xa4(\x92\x16DBPoW%2\
-\x16\xca!F\xac\x82\xb6\x1a\xad_%i\xb9}\x22x\
-CA]p\xec\xaf\x9dTz\xd0_\x89\xa4%\x12-\
-\x8a4|\xbb{`\xc9\xd3\xc7y+',\xf6\xf4\x1b\
-\xb9\xb2\xbb\xc7a\x97\xc1\xfb~X`\xf6\xdf\xf6]\xd3\
-\x07\xbb\x11B\xcb\xb83\x83\xf0\xa9svr\xbe\xec$\
-\xa18\x17\xe6T\xe5|\xfe\x8f\xe7\xb3\xfa\xd9vY\xcb\
-U\xdb\xa7\xcaEA.\x0fP\x0c\x1c\x18Dss\x01\
-B!\x8f\xad?\xfa\xb4\xbc=\xaa\xb5\xca\x17!\xe78\
-^\x9d\xd3tj\xc7>?\xf6v\xed\xedl\x0b\xaf\x1d\
-\xb4W\xe5\xd9\x0f\xd8\x0e\xa4k9\xb7\xfc\x96\x1ah{\
-i\xb8\xfe\xe0w\xcc\xf6g~N@\xbc9\xd0L\xf9\
-\xaa\x07b\xc4\x89$5^A.\xb0\xf5\xd7\xaaN\xe9\
-/M\xba\xbf\xd1\xdd\x04M\x9a\xc8$m5\x10\xab\xdf\
-\xec\xd88\xbe\xf9\xd5\xe3_h}\xf7\xd7w\xd1\xae\xe6\
-\x8a\xee\x1e\x92cF\x9f\xf9\xe0%\x13\x1f8\x8b\x9a\x9e\
-\x0d\xb2|\x00\xeb\x22\xa1j\xb8v\x8d\x97J\xf9vg\
-\xc6'\x8eO?\x11>\xb9\xcc\xc3M\xd6\x9ey\x7f\xc4\
-\x8b\x1bU\xda\x97/~\x86A1iR3\x0a\x0b#\
-J\xbd\xea\xbdO\xaa\x1a\xaf\xbd\x1f\xe2-K\xba5^\
-\xd6\xce\xc6\xc0\xe2\x89+:>\xeb\xb1\xd4\xe4Z\xfa-\
-\x7f\x1d\xaf\xb9\xb5*\x5c\x7f\xe0\xbbf\xe0\x83\x83@\x88\
-7Y\xcd\x94\xe5wO3e\xd5\xe8\xb5c0'+\
-\xac\xf2d4^\x08'[Z5\xe9\x983\xe6\xe4m\
-\x15\x90.\x1aB\x7f+:\x97<u~\xe3\x93\xbb\x7f\
-\x1e\x5c\xfb\xc1~\xa9\x1d\x10n3k\x0e{\xf3\xfa]\
-^;\x02f\xe1\x1a>\xdf2\x91\xc9Zd\x22\x8d\xd7\
-\xfe\x85\x93\xa4\xa3\x08\xf3%:ik\xb8\x1a'\xee\xa4\
-\xf1\xca_\x04\x8a\xce1\xba\xc1\xe311iR3<\
-\x1e\xa7\xf6Tg\xc9\xea\x11\xc7+_\x8c\xf4\x1a\xaf\xce\
-\xc9\xda\xeb\x93\xd3r\xff\x93h\xa7\xfc\xe3\xc6\xfb\xcf\x82\
-kyg\xf9\x19Nfn\x19\x14\xaa\xdf\xff}\x1a\xfa\
-ab\xf7\x7fa&\x9c\x1c\xc23\x15z\xf2\xac\x06\xeb\
-\xb6>\xb9\xe7\xf1\xa6\xd8_\xc5\x99\xd2\x9e\xf77\xde<\
-\x80\xa2\xc9\xbf\xf3o\xffU\xba\xe7_\xaeM\xfe\xc0\xc8\
-\xb6\xb2e\xf1\xc4\xab\xe7\x1d\xfa\x16\xf1\x04\xad'\x9c\xe5\
-\xeeY\x0d\x89\xf2\xa3\xe9dC\xdb\xb6m+\xc4\xf7\xdf\
-\xf7\xb3\xca\x01\xb2#g\x8e^\xb7MN\xab\x84j\xdf\
-\x8f\xff\xad\xb6\xa3\xd3xSn\xa7\xe5\xc6q+F\x96\
-x\xb2\xfb\xfcg\xd7\xe2[\xfe\x11\xaf\xd9X\x19\xder\
-\xe0\xbb4\xfc\xc3D\x1d\xe99\x93)$\xd2\xa3l1\
-\x0a\x04\xa9\xd5L\x85z\xa5\x90(\xc8d\x1a\xadVG\
-\xa6\xbc\xfd\x9e\xf5WG\xd2=\xeb\xaf~\x1e\xac\xf6+\
-:\xbf\xfe\xd7o\x1a\x9f=\xe4\x1d\xb3u}m\xea\x07\
-\x0a\x18Y>a\xd1\x8d\xbb\xbeu(L\xdf\xbaXs\
-\x8e\x04\xa6\x92\xa5(K\x88\xe6\xf4m>\xab_$C\
-\xa7\xe8\x00'\x0dV\x1fm!\xf6\x9b_\xa4\xfa\xf7\xef\
-\xc2\x88\x11\xedR{\xb1\x1e\x8a-\x0a\xe4\xac#ia\
-\xbd@nG\xec/\xafWG\xd6\xbc>q~\xec\xed\
-\xaa2\x87\xd5N\xf9\x9cm\x0f\x9e\x09\xd7\xf2\xca\xf2\xcb\
-\xf1\xd2\xe6\x8ap\xc3A\xef\x9a\xe1\xc5\x93\xa3K\x92{\
-\xad\xf8q\xb1|;\x81r\x12\x11\xc2|\x16\xdf\x81\xd5\
-+87\xd1i\x80\x0a\x1a\xaf\x83f\x0a\xe1\xe4\xe1\xbd\
-L\xb6\xbf\xd4\xda.\xf7\x17I\xf7\xd7Q\x93V\xfa\xcb\
-\xeaw\xe8oEx\xd3\xbc\x83\xb6>>\xf3\xd3\xae\x95\
-o\x1f\x92\xea\xe1\x02\xa2\xce\xf7\x86]\xde:\x14f\xe1\
-:\xd1\x99\xean\xef\xad\xf6\x85\xf1q\xdf\xa9wFb\
-\xbet\x11b\xe3\x82\x98O\xadO\xe1\x1a\xa6\xc8\x1dr\
-\xbex\x91\x90\x9d30bD;*+\x83\xb6vD\
-\xc2\xb4\xb6j\x9d\x9f\xfdb#\xca.\xdc\xb9JWg\
-\xcd<\x88\xc4\xab\x92\xad\xb3\xc6\xcb\xda\xf9d\xdb\xfd\xe7\
-\xa8\xc7\xcd\xb5\xdcZ^9\xdep\xe3\x91\xff3C\xdf\
-M\x8d\xf9>G\xcd\xd4\xae\xf1\x02\x9c4\x9d\xc8\x94\xb7\
-\xd3\xd7\xe3x\xc5\xfe\xeaIZ\xee/\x0d\xb5\x0eoz\
-\xf9\xc4g\xda\xe7\xde\xf2\x87\xe4\x8f\x16\xb7\x91\xe5\x13\x16\
-]?\x8d\x91\xaf\x13Yrgi\xd7x!\xe5\xcb\xce\
-H\x1a\x11\x1b\xb8\xf0\xa9:\xf1\xf8\x1a\xaf\x9aow\x8e\
-2\xb9N\x98\xd0\x8c\x92\x12\xf1\xcb6}\xff\xf2-\x8e\
-Wl\xa7%\xbc\xa9zY\xc7'{9\x1c>\xd7r\
-`y\xe3x#M\xbf|\x8cv\xcd\x9d!\xf8\x12N\
-\x90\x1a\xd2\x83x\x12!V\x80\xfdWKz\xe2)\xab\
-!S\xc1\xe9\xd9HZ\xaa\xd7N\xd2Y\xeb/M\xad\
-\xbfN\xe4\xef\xd0\xdf\x8a\xb6\xcf\xfe~U\xf3\x1b\xe7\xdd\
-\xd3\x9d\xe37\xb2|\xc2\xa2\xbf\xee\xfc\xd6\xa14\xe2\xdb\
-\xa0\xde\xfe:\x91\xa5Ln\xecSO\x94\xca\xc8\x84O\
-vM\xb1\x7fQ\xa7wJb\xbft\xe4(\xf6\x8b\xc2\
-\xe3\xa1\x984\xa9\xc9\xd2\xa8e2\xa5\x9a~CiG\
-%p\xb1\x7f\xbaq\xc9i\xf5\xce\xa0\x9b\xed\x94\xcfo\
-y\xe9\xd88\x87\xcf\xb5,[^8^\xb3\xfd\xf6\xdf\
-\x99\x9dO\x9d\x0c\x02\xaf\xe5K\xa0'S\xf9\x9c\xcb\x82\
-f*\xa1g\x5c\xcdTC\xb2\xf1\xfbK\xd2\xd9_\x85\
-\xfc\x01\xf9\xa4L\xdc_\x0aBP\x11X\xfc\xdc\xcf\xb7\
-=\x7f\xdcK4\xd4\xe9O\xea\xe0\x096\xb2|\xe2\xa2\
-\xdfOz\xfaDJ\x8dz\x95\xc0d\xb2\x14\xfb\x0dk\
-\xbc\xd1O=\xe9q\x13IW&b\x95\xf4\x9c4\x5c\
-U\xe3e\xed\xea\xa3-\x80\xe2\xe2\x08\xc6\x8dk\xb1\xb5\
-\xaf\x92\xa8\xb3\xc6\x1b\xdb[\xe8\x07\xef\xbfJ\xf2\xf28\
-\x9d\xe6G\xd7o\xe7v\x80oZ^8A\x9dI\xd7\
-rg9w\xbc4\xfc\xed\xd4H\xeb\xe5\xb7\x82D\x9f\
-.f'=@\x22\xd3h\xd2\xf2j\x19\xd7L\xc5\x93\
-[K\xa6N\x1a/\xe2\xf4\xd7\xaa..\x99\xc6\xeb/\
-!\xe2\xc5\xc8N\xd2V\x03\x09\xfbk\x9b\xdf\x8a\xe0\xea\
-\x0f\x8ei|\xfa\xb07\xcc\xf6\xfaAI\x1cB\xc9v\
-\xaa\xda\xeb\x93_\x8e\xb8\xfdRB\xd0\xc0\xc9Lu\x86\
-*\xc99;#>\xfdD\xf8\xd4\x13\xa3t\x11\xe2\xd7\
-0G2\x8c\xb6g'q5\x1f\x00\x06\x0d\xeaBu\
-u\xa7\xd5~j\x1a\xaf\xbd\x1f\x22\xb9gZ\xe3\x05\x80\
-\x8eHS\xc5\x8f\xed\x1f\xee\x07\xd7\xf2\xc2r\xeex#\
-\xcd\xa7=B\x081t\xa4\xc7\x7f\x91\x96\xbcf\xca\xf2\
-\xbb\xa7\x99\xb2j\xf4\xda\xb13\x99B\xe8/\xb5\xf5\x17\
-\x12I\xa5Q\x93f\x88O\xc4z\xf9f\xd1\xd9\xda\xe6\
-\x17\xf1\xe77\xbc\xf9\xbb}\x1a\x9f8\xf8\x9dH\xf3\xea\
-\xba\xb8\x07Pc\x07\x0f;\xe9\xc9\xfd+/\xb9\x1d \
-\x0d\xaa\x13p&K\x95\xfct\x04\x18\xfd\xb4k\xa4l\
-;\xcf\x17\xae5\x82\xf3w\x22Sh\xfa\xc7\xf3\xd9\xf6\
-1cZQ\x5c\x1c\x16\xfa\xcb\xfb\x91\xba\xf6\xaas\xb2\
-\xf6\xfa\xe4\xb4\xdc\xbf\xe4\xda\xb1j(\x9f\xdf\xea\xca\x0d\
-\xf9b9u\xbcf\xfb_\xff\x8c\xf0\xa2\x89v\x0d\x92\
-;E'2\x85x\x92\x01PI/\xfe\xf3x\xad\x8a\
- k\xa6p\xac7\x1e\x99r\x1f\xa8\xef/\xa8\xe2\x14\
-\x94z\xf5$\xad\xe9/\xd4\xfe\xea\xe6\x01\x02(;\xcd\
-\x03w\xe2\xf1\xe67\xd2\xb2vJ\xe3SG\xfe/\xd2\
-\xbcfx\xaa\xc7\xf6\xb4q\x7f\xfc\xdbN%'>M\
-\x08\x1aD\x22K\xa4\xf1\xca\x07\x82jjV\x9d\xb4L\
-zb\xbe\xac\xa5:k\xbc\xb2\xd3\x12\xfb%_\x8c\x0c\
-\x83b\xf2\xe4fA\xef\xcd\x96\xc6\xcb\xeaW\xfb\x9fJ\
-;\x04\xdf\xb6\xbc|\x94fB]\xcb\x81\xe5\xcc\xf1\xd2\
-\xc8\xa2\x89f\xc7\xf5\xd7PPo\x0a\x1ad\x1c2\x85\
-Dzn\x1c\xaf\xd3<\xa4\xd6\xdfH\xcb\xfa\xc9\x8dO\
-\x1e\xfeF\xa4iU]\xe2\xa3*\xdbow\xfc\xf7\xc5\
-\x03\xc9\xb4\xafe\xe7kw\x86\xa2\xc5\xd3x\x993\xb4\
-.Z6\xf2\x15\x9d\xba\xe8\xac`m\xd7i\xbc2\x09\
-\xab$n\xf5\x0c\x00\x81\xdf\x1f\xc2\xe8\xd1\xad\xb6\xfe\xc5\
-\xd7x\x85\x8b)U\xfb\xa7\x92\xbe\xdc\x9e\x8e\xbc\xf5\xed\
-\xc6\xd7x\x01\x8a\x0es[\xe5\xd2\xf6\xf7\x0f\x80k9\
-\xb7\x9c9^\xb3\xf5\xbc{@\xa9\xd7NzN\x9ai\
-<\x8d\x97o\x8fG\xa6\x02\x0aB%=\x91\x80,R\
-\x8c\xf6\x88wZ$\xa9\x1e\xf5\x97Z\xdb\xe5\xfe\x22\xe9\
-\xfeB\xec/\x9c\xfb\x9b\x8e\xf9\x8d\xb4n\x9c\xd8\xf8\xe4\
-O\xbbE\xbe\x7f\x9f\xfe\xd6\xa1$\xdc\xafE\xf7\x85\x97\
-Ht\xb23\xb5\x13\xa5\xe8\x0c9\xe9\xca\x84(\xc99\
-\xfc\x1a&9A5_G\xe2:\x8d\x97\x13(AM\
-M\x07\x86\x0e*\x10\xfa\x09m9\xdd\xc5F\xd6^y\
-\x7fT\xe2M\xb7\xc6\x1bk\xa7|Q\xfb[\x87\xc2\xb5\
-\x9c[N\x1c/\xedz\xf443\xf4\xd9Lg\xd2\xe3\
-\xc4g#=i\xff4k\xa61\xa7\x07\x22\xd6\x0b^\
-\xbbH*=\xea\xaf\xd8\xber\xd2\xc6\xeb/Q\xc9\xd4\
-Bf\xc7\xfe\xa6k~#\xad\xeb'7>q\xc4k\
-\xddq\xbe\x7f\x98\xf8\xdc\xcf\x22\x11\xd2\x10m_G\x96\
-\xa2sR\x9d\x914\x226p\xe1Su\xe2\xf15^\
-5\xdf\xee\x1c\x9d5^\x00\x08\x85<\xe1!\xcd\xe7\xdf\
-}\xe5\x0es\x87\x01\xc4z\x9bo\xea\x1a/\xb7\xc4\x1a\
-\xaf:O\xdd\xd2xA\x08\xc1\x0fm\xef\xef\xa7?J\
-\xaee\xd3\xb2\xefxiSE\xa4\xed\xf2[\x09`0\
-'\x94\xaaf\x1aO\xe3\x8dnN\xb3f*\xd5\x9b\xc3\
-\xfe\xd2\xd4\xfa\xdb]M\xda\xa9\xbf\x91\x96\x0d\x93\xb7=\
-\xfd\xb3\xe7hWKy*\x87|L\xc5\xce_\x1f6\
-\xf0\x8a\x9b)Ec\x22\x8dW\xcd\xb7\x9b\xe8\xa4\xf8\xc5\
-D$b\xd9\x89\xaaN\xc9\xae\xf1\xb2ve\xf2\x05\xe4\
-\xfe\x11\xb3\xa0y\xf7\xb9\xa7{\xd7\x0e;\xaa\xe2\xae\x0b\
-\xaa\x8a\x86\xae\xdb}\xe0\x11\xaf\xebHTn'\x1d\x1a\
-o:\xb4\xe4h\x05\x9b\x83K\xc6\xb7E\xb6\xa4\x1c\xad\
-\xe2Zz-\xeb\x8e\xd7\xec\xb8\xe6z\xd0\xad\x83\x00X\
-\xb7\xddv-6jy\xa1\x99J\xe8\x99\x8af\x8a\x84\
-\xfd%\xe9\xec\xafB\xfe\xd6\xfc\xda\xc8\xbfg\x9at\xa8\
-q\xd9\xf4m/\x9c\xf6\x98\xd3\xf1u\xb2\x9f\xefp\xd9\
-?\x06\x90\x9d\xe6SJ\x1be'\x09k\xbc\xd1O=\
-\xe9q\x13IW%:\xf6\xc9\xf3e2\xd4k\xbc\xac\
-]\x07\x8d\xd7\x0c\xb5W\xd5\x1f\x1cz\xe7\xe0\xb3+?\
-\xdb\xa3\xdcSmQ\xee\xa1\xb5\xe7\xdcG)\xea\xe5\xf2\
-|<\x89\xb5W\xd1\xd9\xea\x08?\xbd\x1ao\xcc\xca\x17\
-\xb5u\xef\xe7\xe1\xae\xa5\xcf\xb2\xeaxid\xc9x3\
-p\xd7\xaf\xf9\x06N&\xce\xa4\x07Hd\x1aMZ^\
--\xe3\x9a\xa9xrk\xc9\xd4I3E\x9c\xfe\xf2\xe1\
-\xc7#\xd3x\xfd%Dt\x96v\x92v\x9e_\xb5\xbf\
-\xa9\xcfo\xd7\xaa\x8f\xf7jy\xeb\xca\x9b\x91\xa2\xfd}\
-\xd7w\x0fD\xd8\xdf!\xdf\xf6\xb3O\xbd3\xe2\xd3O\
-\x84O=1J\x17!~\x0ds$C\x00\xd6~\x1a\
-\x8d\xd7\x0cu\xf9\x02\xe3:\xfft\xc3%\x15\x9b\x07\x8f\
-)>\xe0=u<\xe3\xfb\xed>\xb7\xb6d\xecR\xd6\
-og\x8d\xd7\xde\x0f\x91\xdc\xb3\xa8\xf1\x02 \xf8\xa1\xfd\
-\xdd\x03\xd5\xb1\xb8\x96]\xcb\xaa\xe35\xdb\xcf\xbd\x8f\xb5\
-):5'\xd2s\xe3x\x95\xfe\x82\xf7\xd7\x22a\xca\
-\xeb\xd7\x91\xbf\xe3\xfc\xa2G\xf3[\xd9>\xef\xbe\xb3;\
-\xe6?v\x1aR\xb4_\x8f~\xfc\x97\x84\x90F;Y\
-\xaa\xe4\xa7#\xc0\xe8\xa7]#e\xdby\xbep\xad\x11\
-\x08\xd0\x89La\xb5\x1f\xcb\x0f\x97\xb5\x1c\xfa\xe6\xef\xca\
-;\x8a\x0f\xa9\xb8\xee\xdax\xe39\xbc\xf6\x82\xbbX9\
-6\x1e\xb9=(\xfd\xb1\xcb(\x895^[\xffRh\
-\x87\xcf\x1fk\xe7\x87\x8ew\xdd\xc8\x86\x1c[\xd6\x1c/\
-\x0d\xbet\x1c\x0d\xf3\x17/F\xd7\x86\x93f\xca\x9d\xa2\
-\x13\x99B<\xc9x\x8d\xb1\xc6\x9c\xb5X\x89L\xad\xfd\
-\xa0\x9c\xebz-\xb6\xbb\x9a)\xa8\xe2\x14\x94z\xf5$\
-\xad\xe9/\xd4\xfe\xea\xe6\x01\x02(\xc7\x99_\xf4x~\
-+\x9b_\xbd\xe4\xf6\xae\x95\x1f\xed\x93\xe4\x12\x00\x00L\
-\xad\xda\xf7\x83\x11\x9e\x83f\x13B\x1aerc{\xd8\
-\xae\x82\x8a\xa9NZ&=1_\xd58\xd5\xdb\x7f\x8d\
-\xd3\x0a\xa3}\xd4\xb2\xe3\xc8\xe7\xbb\xffj\xd0kG$\
-3\x9e=\x07\x1f\xf7b\x91\xa7dEf5^XN\
-T\xad/U\x8d\x17 \xe8\x8c4U\xac\xefZ0%\
-\x99\xf1\xb9\x96\x19\xcb\x9a\xe35;/\xbb\x8d\x00\x86\xb4\
-\xda,\xd2\x12I\xafg\x1a$u\xacWp.:2\
-\x15\x88\x01\x104^-Ig\xa2\xbf\xce\xe4\xdf\xdd\xfe\
-fa~+\x9b^<\xfb\x01\xb3ck\x95\xe6\x90;\
-\xdaU;=}\xa2\x19*\x0cr\xe2\xe5\x16O\xe3e\
-\x17/\xeb\xa2e#_\xe6\xac\xe4|\x99\x84\xed\x1a/\
-!\x08\x07\x03\xc5-{D\xee\xbe\xe0\xd2AK\xc7\x0c\
-+J\xfe\x05\x91\x05Fa`\xc6\xc0\xa3^\x89\xaf\xf1\
-\x0a\x17S\xaa\xf6O%}Hi\xf9\xa2\x22\x935K\
-\xa7\xa6\xf1R\x00\xa4|e\xc7\xdc\x19\xc9\x8e\xd1\xb5\xf4\
-[V\x1c/\xed\xfa\xcfE0\xd7\x0cg'-\xcfH\
-E3\x8d\xa7A\xf2\xed\xf1\xc8T@A\xa8\xa4'\x12\
-\x90E\x8a\xd1\x1eI\xfdEZ\xfaK\xad\xedr\x7f\x91\
-t\x7f!\xf6\x17\xce\xfd\xcd\xf4\xfc\x9a\x9d\x8d\xa3\xb7\xbd\
-xn\xcaO4\xfb\xf9\xd0[.\x07h\x93L\xbav\
-g$\xe6K\x17!6.\x88\xf9\xd4\xfa\x14\xaea\x92\
-\x13T\xf3#\x11O\xa0\xba\xe3\xa4'\xaf\xacj\xee\xb7\
-G\xbf\xb3\xeeOu\x1c\x00\xb0w\xf5\xcf\x9f#\x84\xd4\
-;k\xbc\xc2\xc5\xd4\xea\x07\xc0\x9d\xab\x9d\xf03\xa9\xf1\
-\x02\x14k\x03_\xed\xd2\x9d\xb1\xba\x96\x1e\xcb\xbc\xe3\xa5\
-\x9d~3p\xe3\xd5\x94RC\xbd\x9e;\x93\x1e'>\
-\x1b\xe9I\xfb\xa7Y3\xb5\xee\xef\x15\xd2\x13\xfa+\xb7\
-\xdf\xdd\xfe\x8a\xed\x8b\xfdE\xfc\xfe\x12\x95L-\x04u\
-\xeco6\xe67\xb8\xf2\xc3\xfd\xda\xe6\xfc\xe7\x22\xa4`\
-\x07\x0e=\xf5\xf1\x0as\xc7\x052\xc9\x89D\xa7#@\
-\xab\x07\xc2\xa7H\xb4\xec\xd3Y\xe3\x15\xf2\x83\x85\x1dS\
-\xe6\x9dS\xbah\xd2)\x83\x1f9=\x95\xbe\xab6\xbe\
-\xdf\x1es\xfa\xfb\x86l`\x17\x07\xb1=\x85\xac\xad\xf6\
-EK\xac\xf1\xca\x84\xdb\xbdv\xa8\xd4\xce\xea\xc0\xbc]\
-{2f\xd7zf\x19w\xbc4\xf4\xc8i\xa0\xf5\xd5\
-\x129A 'v\x92\x09\xa4\xc7\xc0\xc6\x8d\xe3U\xfa\
-KS\xebow5\xe9n\xf4\xb7\xb2u\xf6_\xae\x0b\
-m\xfa.%\xdd\xf0\x0f\x93\x9f\xff\x195\xbd\x0dl\xbc\
-\xd1ON\xda\x90F$\x8dL\xf8d\xd7\x14\xfb\x17u\
-z\xa7D\x82\xa1\xce\xf2\x86\xc3\xbd/\x1d\xfb\xdb\x9a/\
-w\x1b\xe0\x1b\xb9\x22\x95>;\xd9~\xd5'=\xc5\x9c\
-\xbf*3\xf4\x5c\xe3U\xb5\xde\x9eh\xbc\xd1\xfa\xb6\x04\
-\x97\x8d\x0e\x98\xa9\xc5c\xbb\x96>\xcb\xb8\xe35\x03\xb7\
-^\xae#'\x00\xd6m\xb7]\x8b\x8d\xe5k\xc8T>\
-\xe7\xb2\xa0\x99J\xe8\x99\x8af\x8a\x84\xfd%\xe9\xec\xaf\
-\xd3\xfc\xda\xc8?c\x9at\xe5\xb6g\xcfx\x88\x06;\
-\x92~\x8eo\x85o`\xfd\x1e\xe5\xe7\xdf\x0d\xa0I%\
-:\xd6\xa0\xec\x9c\xac\x99\xb5\xc6'nWIO\xfd\xf6\
-?\x12\xf6v\x8c\x09]\xf4\x9f?\xd5\xd4\x0f\xdc\xb1\xec\
-\xf0\xd7\x93\xedg2\xb6\xc7\xa0cgE\xe5\x066\x0e\
-H\xce0\xda\x1f~1\xe4\xfdWI^\x1e\xa7X_\
-\xf4S\xdd\x9e\xaa\xc6\x0b\xd6N\xf9\x9a\xc0W.\xf5\xe6\
-\xc82\xeaxih\xd61\xa0\xab\xea\xac\xc5\x01@Z\
-\x5c\xe2\xed\xa5#\xe9\x01\x12\x99F\x93\x96W\xcb\xb8f\
-J\xe4\xfe\xda\xc9\xd4I3E\x9c\xfe\xf2\xe1\xc7#\xd3\
-x\xfd%Dt\x96\xa9\xcc\xaf\xda\xdf\xf4\xcdod\xdb\
-\xeai-\xb3\xe3\x87_\xa9v\xda\xe8\xbf^c\x86J\
-\xda\x9c\x9c\x11\x9f~\x22|\xea\x89Q\xba\x08\xf1k\x02\
-(E\xa0_\xe7\xde\xb3\x7fW\xb5f\xd8\xf1\x83\xffq\
-Y*\xfdK\xd6j\xfcc\x96\x0e*\x1a\xb1Jv~\
-P\xfb\xc1\x8f\xb3@\xee\xb9\xd0x\x01`M\xa7+7\
-\xe4\xca2\xebx\x83\xff\xfa-(\x0c\xeb\x8a,\xe6\x01\
-\x923\xd0\x91\x9e\x1b\xc7\xab\xf4\x17\xbc\xbf\x16\x09S^\
-\xbf\x8eL\x1d\xe7\x17\x99\x99\xdf\xf6/\x1e8;\xb4a\
-\xfeT\xa4`\xc7\x0f\xb9\xf1jJi\x13\xf8\x8c\x08\x9f\
-\xccDg,n\xe7\x17)\x91xc\xce(\x80\xce\x9a\
-\x15'\x96\xcc>\xf8\xa2\xe1\xef\x1c\x5c\xe2\xcd\xec+\xce\
-w\xae<\xe4m\x91\xb0\xed2\x87\xd8\x7f\x9d\x93\xe5\xe3\
-R5nY>\xe9\xb9\xc6\x0b\x00k\xbb\xbe\xde9\x13\
-\xf3\xe0Zb\xcb\x9c\xe35\x17O\xa4\xe1\x0f\xf7\x81x\
-2\x08\xd9\xd1\xcdN\x9a)w\x8aNdj\xafW%\
-S\xbd\xb6)\x91\xa9\xb5\x1f\x94s]\xafmvW3\
-\x05U\x9c\x82R\xaf\x9e\xa45\xfd\x85\xda_\xdd<@\
-\x00\xe58\xf3\x8b4\xce\xaf\xdc\xdf\xca\xa6Y\xbf\xf9w\
-\xfc\xc5!\xdb\x815\xa7=Z\x18\x1e\xbe\x06|\xa6\x85\
-O\xd5D\x92\x93\xc9W \xde@8T\xd8\xb4\x87q\
-\xf3\x15\xd7\xd4-\xdfaL\xc9\x9e\x9f\xa4\xd2\x9f\xee\xda\
-\xd4\xca\x83\xde%\x04\xc2k\x8f\xd2\xa5\xf1\xc2r\xa2j\
-}\xa9k\xbc\xbc\x9dM]K\xc6\xa7}\x12\x5cK\xca\
-2\xe6x\xcd\xe0?/%\x84\x18\xd6\x22@O5\xd3\
-T5H\x9dv\xdc\x0d\x8dWKz\x99\xe8\xaf3\xf9\
-w\xb7\xbfY\x9b_\xa5\xbf\xa1\xcd\x8b\xc7\xb7\xcf\xbd\xf7\
-\x5c\xa4`\xe7\xeep\xdf9\x00\x9a\xe2i\xbc\x96\xfc\xc2\
-.Z6\xf2%0#\xa4cH\xe8\xa7\xaf\x5c?|\
-[\xff\x83\x06^\xfc\xafT\xfa\xd0S\x9b\xdc\x7f\xdf\x0f\
-|\x86\xbf\x03\xb0;E\xd6\xff\xdck\xbc\xbc\x9d\xad\xa1\
-\x15\xa3\xd27z\xd7R\xb1\xcc8^\xdaXIC\x0f\
-\x9e)\xde\x8e\xf6\x5c3\x8d\xa7A\xf2\xed62\x05\x01\
-\x0d\x03\x08\x13\xd0 @\x83\x04f\x000;\x0d\x98\xed\
-\x04\xb4\xd3\x80\xd9I\xa2\xdb\x83\x00\x22\x040\x85\xfe*\
-\xa4\x87\xb4\xf4\x97Z\xdb\xe5\xfeB\x22S\x01]\xe1D\
-\xa6\x16I;\xf47\xe3\xf3\xab\xefoU\xeb\xbb7]\
-e\xb6%\xff\xce\xb6q\xfd\xa6\x7f\xd1?\xb2\xf3\xfcx\
-\x1a\xaft\x11b\xe3\xb2\x8ctx;G/8\x7f\xe0\
-\xbc]\xce\x1b\xf1\xcc\x89\xc9\xb6\x9bn\x9b\xd2\x7f\xbf\x0f\
-\x00\xe6\xfc\xb8\x13\x04dg\x1c5\xe6D\xed\x84\x9f\x0d\
-\x8d\x17\x00\x1aB\xcbG\xa7g\xe4\xae\xa5b\x19q\xbc\
-4t\xef\xb9\xa00\xf8\xfd\xa7\xb3\xc6\xab'=NP\
-6\xd2\x93\xf6\x17\xea\xa5\x144L`vE\x9di\xa4\
-\x95\xc0l\xf1 \xbc\xcd\x80\xd9\xe2A\xa4\x85 \xd2f\
- \xd2f\x80\xb6{`\xb6\x13\x98\x9d\x06\x22\xed\x04f\
-\x9b\x81H\xb3\x81H\xb3\x07\xe1F\x03\xe1\x06/B\xf5\
-\x06\x22[=\x884\x19\xd1\xfcN\x02\x1a6\x94\xf6\xbb\
-\xdb_\x914\xe5\xdbGU3\x05\xc4zU2\xb5\x10\
-4\xf3\xf3\xab\xed/q\xec\xaf\xd9\xd5Z\xd7\xfc\xc65\
-\xd7'\xb3^\x98]0\xe6\xfe\xb3L\x13M\xb2\x93\x90\
-F\xc4z |\xa2#\x12,\xa9?\xa4\xe8\xbf\x17\x5c\
-3z\xfeNC\x8b\xc7/I\xa5\xcdt\xdb\x84\x8a=\
-?MM{\x15\x9d,\xdf\x9e\xe98\xde\x98\x95o\x09\
-.w\xa97\x07\x96\x19\xc7\x1b\xfc\xd7o\x85\xb3\x1b6\
-r\x82@N\xb0\x93\x13\x03\x9b\xb8\x1a$\x10%\xd8N\
-\x03\x91V\x03\x91\x16\x0f\xcc\xb6\x18\xc1v\x11\xd00\x01\
-\x8d\x08d\xc7\xea\x97\xd2\x22\x89CN\xc7H\x99v\x91\
-\xa8sn\xf6 \xdc` \xbc\xc9\x8b\xd0\x16\x03\x91V\
-\x0f\xcc\x0e\x02\x98I\xf6\xd76\x0f\x84\xffWK\xa6\xa2\
-\x8b\xb1*BR\x1a\xaf8\xbf\x1a2\xcdV\x7f;\x17\
-\xbcpBhc\xf2\xb1\xbd\xd5\xfeQ+\xaa\xe8._\
-\xcbNB5\xee<\x22a\xa3e\x0cN\x7f\xf8\xa6\xd1\
-\x9b\x07\xef=\xf0\xb4G\x93m'\x936\xa1\xdf\xcc9\
-\x94\xa2>\xdf\xe3x\x99\xb9\xc4\x9b\x1bK\xbb\xe3\xa5\xe1\
-\xe7O\x006\x0f\x82p\x05\xd6\x91\x13\xc0n{uZ\
-l,_\x22C\x1aur\x01\x02\xb3#\xeal\xcd\x80\
-\x013\x04\xc0\x04'k0\x02f\xe9X=\xac~)\
-\xad\xdb_IKd\x18[\xc4a\x03f\x1bA\xa4\xd9\
-\x83\xd0&\x0f\xc2\xf5^D\x9a\x0d\xa0\xcb\x10\xfa\x8b\x84\
-\x9a)w\x82i\xd0x\x9d\xe6\xd7F\xa6\x99\xd7\xa4\x05\
-\x92\xaely\xef\x96\xcb\xe3.\x18\xc5N\x1by\xdbe\
-\x00ib\x0d\xca\xce\xc9\x9a\xd9\xb6\xb2\xe0\xb4\x8f\xfe8\
-b\xe9\xb83F\xdcya*\xf5g\xda\x86\x95L\x5c\
-T\xec-m\x93\x9db4/?4^H\xed4\x04\
-\x97\xef\x90\x8eq\xbb\x96\x9a\xa5\xdf\xf1\x86\xfe}1\xa5\
-0\x88p[\xdc\xd38^\x1a\x02h\x87\x07f\x87\x01\
-\x1a\x8c\x92\xacDj\xacZ-\xc1\xc6#^\x87\xf2\x02\
-QZ\x1a\x9dH\x8cR\x9a\x80\x86\x00\xb3\xcd@\xa8\xc1\
-@h\x83\x17\xe1F\x03\x08&\xd6L\xf9m\x7fB\xcd\
-T\x1e\xaf\xb5\x9b\xa0\xa1'=\xbf\xaa\xc6\x1b\xad?\x9d\
-\x9a\xb4H\xd2]\x8b\xdf<,\xb4>\xf9\xf0\xb2\x91e\
-;\xcd/\x0c\xd5\xad\xb2\xfa%z}\xa0\x0d]\x03\xd6\
-\x9c\x5c\xf9\xe2\xb1\x7f\x1c\xf7\xe1\xbe\xfd\x0a\x06o\xd2V\
-\x92c\x1b_\xbe\xc7\x5cY\xe3\x8dn\x97\xb5W~\x95\
-\xcb\xb1\xc6\xebJ\x0d9\xb0\xf4:^s\xf1D\x1a\xf9\
-x\x1f\xf1v\x07\xc2\x22\xb0\xdd\xec\x88W~\x1d\xe9\x85\
-\x0c\x98\xed\x06h\x97\x01\x1a\x11HR\x22\xd8x\xc4\xaa\
-\xdb?\x89\xf2D)/\xf6\xcf\xd6_\xe5\x0b \x13\xa0\
-\x9d\x06B\xf5Q\x126\xdbI\x8c\x9c\xf9I&\x92)\
-\xab\xaf\xaf\xc4\xf1J\xfd\x8d\xceoU\xcb\xec\xbf_\x85\
-\x14\xec\xf8\x9a\xeb\xaf\x01h\x8bx\x11\x89\x84\xbc\x8d\xbb\
-\xf9.\xfb\xe7\xcd\x13W\x8d\x98Rq\xd0\xecT\xea\xcb\
-\xb6\x8d\xeb\xb7\xc7g\xbd!\x8e\x17\x00\xb6\x85\xd6\xd5\xa6\
-{\xfc\xae%\xb6\xb4:^\x1a\xfa\xe7\xa5\xe9x\xf6\x81\
-\x19\x8aE\x1dt\x01\xa0\xf1\x885\x8eF\xcb\xcf\xfd\xf4\
-\x94\x8f-V[\x9a\x08\xa4\x08*\xa5i\x10\x88l\xf3\
- \xb4\xde\x03\xb3\xcd\xd0\x92)\x9f\x87D\xe4\x1f#\x9d\
-d\xe6\x97\xc6\x9f\xdf\x0c\xc7\xf1\x0a\xf5F\xf7\x0b,}\
-\xf7\x80\xe0\xda\xe4\x7f%5}\xe0\x91\xaf\x92`U\x03\
-@a\x9a\xa4e\x88y\xc0\xac\x1b\xc6\xae\x1c\xf9\xb3\xe1\
-\xd7^\x9bl\x1d\xb9\xb41\xe5\xbb}\xd1\x1b\xe2x\x01\
-\xc0}\xffZn,}\x8e\x976V\xd2\xc8\x93'\xf7\
-\xe4\xd9\x074B\x10\xe9 @P 9\xa8\x04\xc5\x9d\
-JR\x1a-+\xaf%^\x9d\xa6\x9bX\xe3\x95\xd3j\
-\xc8\x93&\x04\xca$\x88l3\x10\xdaP\x80p\x8b\xc5\
-\x99\x12\x99\xdaIZp\x86V{q4^6\x0e8\
-\xcf\xaf\xd5_\xaby;I\x0b\xde\x93\x8fG\xdb_\x9a\
-J\x7f\xabZg\xdfr\x85\xe3\xda\xd1\xd8\xde\xfd\xcf\xbf\
-\xc7\x17\x1a\xb1\xf0\xe2a\xef\xef\x7f\xd9\xf8\x97\x8e\xf5{\
-\xcb[R)\x9fK\x1bQ2y!U\xbe`\x03D\
-B\x15\xeeD\xac\xe3%\x93(K\x8b\xf2A\xf4S\xdd\
-\x9e\xaa\xc6+\xb7\xd3\x11i\xacL\xd7\xb8]K\xde\xd2\
-\xe6xi\xe4\x81\xb3A\x03~m\x9c\xa9D\x92*9\
-\x014B\xa3rB\x10 T\xd0\x14!h\xb4\x12q\
-B X\x1d\xb1R!\x1d\x8fx5\xe5\x09\xef?,\
-\x82P\x88QJ;\x13/#\x16\xebd\x89\x00f\x93\
-\x07\xc1u\xde\x18\x01\xb3f\xe2k\xa6\xd6\xc9\xa2!S\
-\xeb\xb6\x92\x8d\xc3F\xa6*I\xab\x1a\xafB\xd2Vs\
-\x8c\xb8\xec$\xdd\x1dM\xbak\xd9\xfb\xfb\x85\x1bW\xd5\
-%XF\x96\x1d;\xfc\xf2[\xfe\xbe\xe3\x82\x1dG\x95\
-\xee\x9c\xf4C\xc9\xf3\xc5\x0a=\xfe\x8e\xc1\xc5u\xabD\
-9\x00\x90\x095j\xcc\x89JW;\x00\xaaS\x86\xe0\
-T\xed$\xcc\xdb\x81C;\x88\xd7\x8e\xd9\x12\xdeT\x9d\
-\xb6\xc1\xbb\x96\x94\xa5\xcf\xf1\x86\xfe}1\x88JN\x02\
-\xb9\x8a\xe4\x04\xee<\xcd\x10\x01\x0d\x1a\xa0&`\x91[\
-<M\x15*\xc1\xea\x88\xd7\x89p\x93,/\xacM-\
-\x89J\xe9x\xc4+\xec\x0f^\x1e&Ax\xab\x81\xd0\
-z/\x22\xedF\xaa\x9a\xa9}~U2\x15\xe6WO\
-\xd2*\xb9'\xd2x\xad\x1a\xad\xfa\x92\xd2\xa4\x85\xfeR\
-\x8a\xaa\xb6O\xee\xba\x00\xdb\x89\x0d/\x99\xb4(9\xed\
-U\x5c\x1f|{\x96\xe2xA)-o\x8b4\xa4\xf4\
-\x06\x11\xd7zniq\xbc42\xeb\x18\xd0\xf55\x5c\
-\xfb\x83xv\xc3FN\x00\x88\x09\x98\x01\x00\x11\x07b\
-t\x22L0b\x85B\xd2j\xda\x89p\xc5t\x02\x8d\
-\x17\xc2\xfe\x8c\xb8\x89xR\xe8\x08\x97\xc8N\x88\x10\xe9\
-$\x92\x088L\x10i\xf0 \xb4\xc1\x13\xfde\x9dD\
-\xa6\xfc\x14\xe9\xadq\xbcj\x7f;\xbez\xead\xda\xd5\
-\xba]<\x03vx\xc9\xa4\xef{C\x1c/@\x5c\x9d\
-7\x07\x96\x1e\xe2\x0d\xff\xe7b\x80\x1aq5H\x81\x9c\
-h\x98\xc0\x0c\x12\x80\xaa\xa4\xa6j\x8a\x1a\x8d\x15\x90\xf3\
-\xb5\xc4+\xa6\xe3\x11o\x12\xe5\xd5\xf6E\x82U\xb45\
-;\xf1\x8a\x1a\x9fB\xccV\x9a\x82\x06\x09\x82\xeb\xbd0\
-\xdb<\x0a\x99\xa6\xa0\xf1*d\x1a\x9d\x1e\x1d\x99\xa6K\
-\xe3\xd5\x91\xb4:_\xca\x1dD(P\xdb\xfe\xe5\x13'\
-kVP\x9f\xb3\xe1%\x93\x16\xf6\x868^\x80\xa2=\
-\xb2\xc5%\xde,[\xcf\x1d/\xfdq,5\xdf;@\
-%'\x22\xddfrr\xa2!#\xfa\xec\x04\x8b\xa0D\
-R\x134Z+\xad\x10'\xd8\x12\x12\xda\xb32t\x04\
-\x1b\x8fx\x1d\xca\x0bDi#n[:y\x8d\x17P\
-\x89Y(O\x81p\x83\x81\xd0f/\x10\x11N\x16~\
-\x15p\x9c_\x08\xf3+\x9dT\x82\x1c\x02\xe1d\x97\xc9\
-T\x98w\xc9\x07\x08D\xcf\xf6\xb3n4\xe2k\xd2\xf1\
-H\xba\xed\xd3{\xcf\xd3/\xa4\xbee\x83\x8bG\xae\xe2\
-r@t\x9bH\xa8|%\xe7\x5c\xe3EGd\x9b\xfb\
-\x05[\x96\xad\xc7\x8e\x97F^<.Q\x9c\xa9\xb5\x08\
-B\xd1/\x98$\xe2\x83B\x88\xd0h\xbcpH3\xe7\
-ce\xa8\xc4\xaa\xdb?\x89\xf2D)\xaf\xf6G\x22\xbd\
-\xc4Q\x0d\xf1\x89\x17\xd2\xfef\x07ApCA\xf4\x8e\
-\xc0\xda\x1a\x7f~-\xf2\xe6\x05,2\x85\xad\xbf\xfcb\
-\x93\xa58^i>#\xdb\xd6\xd6v-}\xff\x00\xf4\
-q\x1b\x18}(\xba\xf0\x88H~q\xca\xa78^J\
-)B\xb4\xb3(\xdd\xe3w-\xbe\xf5\x9cx\xcdYG\
-'\x8c3\xa5\x14\x08E\xbf@\xe3\xc4\x07\xd8\x08QG\
-R\x88G\xac\x094\xdat\x96\x97\x88[C\xac\xba\xf1\
-$E\xbc\xb0\x97\x0f\x01\xa1\x0d^D:\x88\xd2^\x92\
-\x1a\xaf\xb5\x99\xed\xaf\x10\xbb\xe0\xc4\x9d\xc8\xd4^\xafL\
-\xd2\xa9\xc4\xf1*\x80W\xd5\xb1`\xd6\xd1\xba\xa5\xd4\x97\
-\xccg\x14\x05J\xbd\x95\x8d\xf9\x1e\xc7\x0b\x10\x84\xcc\x80\
-\xebx\xb3l=s\xbctS5\x8d|>\x83{)\
-\x8d\x06i\x024l(WlV\x81N\xd3U\xd2P\
-\x09\x8a;\x15;\xe1\xa6A\xe3\xa5jZi\xdf\x96\xee\
-)\xf1:\x947\x81\xf0\xa6\x02\x84\xb7\x19\x88;\xbf\xec\
-$c\xe3\x10O*k\x7fa\xfc\xc2\xfcf1\x8eW\
-\xeao\xe7w\xff;\x0a\xdb\x81\x0d,\x1a\xbe&\xdf\xe3\
-x\x01\x8a0\x02\xc5\xe9\x19\xb1k\xc9Z\x8f\x1c/5\
-_:N\xf0Rzr\x8a\x10PSG\x88B\x9a\xd7\
-\x88\xa45^\x22\xb4ge\x08\xe5\xadt<\xe2\xd5\x94\
-'\xbc\xff\xb0\x08B!F)\x9d&\x8d\xd7\xa1|\xa4\
-\xd1\x83\xf0\x16\xc3q~\xad\xdbJ6\x0e\x1b\x99\x0a\xfd\
-\x15\xe6\xdb\x91\xa4\xad\xc3\xc9\x88\xcbN\xd2\xdd\x89\xe3e\
-\xa4M\x08@\x03\xad\xa5\x81\x1f\xde\xeb\xf3r\xc3\x80\xc2\
-\xdau\xe2\x1d\x9eH\xa8QcNT\xba\xda\x01P\x9d\
-2\x04\xa7j'a.;\xc0\xa1\x1d\xc4m'\xe8\x12\
-o\xd6\xadg\xc4kFo\x19\x9d4=\x1a!1y\
-!\x05\xe2SI\x0a\xb0\xa7%\x82\xd5\x11\xaf\x13\xe1&\
-Y^X\x9b\xb6\xf6\xa9\x9a\x8eG\xbc\xba\xf1\xea\xd2N\
-\xe5\xa3N\xcfl\xf5 \xb4\xd1\x13\xeb\x8fH\xa6\x16\x82\
-\xcad\xcajgN\xd6F\xa6*\xb9'\xd2x\xad\x1a\
-\xad\xfa\xba\x11\xc7\x0b~\x00HU\xe7\x82\x97\x8fF\x1f\
-\xb7\xaa\xc2\xdau\xdc\x09\xf2\x8bS\x9e\xc5\xf1\x22L\xb7\
-O\xc7\xdbi\x22\xe97b\xa7\xdbz\xe0x\x9b*\xa8\
-\xf9\xce!\x129\x89\x9a^\x84\x00\x92\xa6\xab\x12\x1f\xa0\
-'D\xfb\xb7\xe5}5\x8e\x97\xa7\x9d\xcas\xb24;\
-\x0c\x846x k\xa6\x9c0{C\x1c\xaf\xd8\xdf\xce\
-\xef_?\x1c}\xdc\xca\x0a\xaa\xb6\xf6\x868\xde\x90\xb9\
-\xfd}\xb9\xb69\xb2\xbe\xf6\x9d\xd6\x1f\x0e\xcaU\xfb\xdd\
-v\xbc\xd4|\xedH'M\x0f&\xf8/\xd1\x92!<\
-8\xa4\xd9\x15\x5c\x22(\xc8\xf9Z\xe2\x15\xd3\xf1\x887\
-\x89\xf2j\xfb\xe2x\x14mMK\xac\x94j\xc6\x1f\x87\
-\xf85i6\xbff\xa7\x81P\xbd\x01\xde<\x91N2\
-\x91L\xa3\xd3\xa3#\xd3ti\xbc:\x92V\xe7\xcbY\
-\x936;\x9b*\x82\xebR{\x1bqo\xb3\xb2\x82\xca\
-\xc6\xde\x10\xc7\x1bA\xd0\xd7\xf3\xd1\xf6.\xfb\xb2c\xd5\
-\xd4\xef;\xbb&\xe7\xaa\xfd\xee\x13\xaf9\xebh\x0b!\
-Er\xa2$\xf6\xbc\xdc\xe8vg\xc2c\x04\xd5M\x8d\
-W$5+CG\xb0\xf1\x88\xd7\xa1\xbc@h6\xe2\
-\xb6\xa53\xab\xf1\xf2\xcf\xe8\xfefK\xf4\xf5D\x84\x88\
-\xce\xd29\xfa \xfa!\x92\xa9\xaa\xf1\x0a\xf3.5'\
-\x10=\xdb\x8f\xcd\x1f\x15\xfa)\xcc\x0b\xbf8:\x93\xb4\
-Ep U\xc1U_LG\x1f\xb6hT\x03$\xe7\
-\x99\x8fq\xbc\x04\xdep\x1a\x87\xdd+li\xa0k\xec\
-\xea\xce\x11#r\xd5~\x0f\x88\x97\xdf*\x8a\xe4d\xaa\
-q\xbaZ\xe2\xd5\x90V\xac\xa6\xed=\x8eW-\x0fM\
-\xfb\x91F/\x22\xad\xfc\x0b7\x8b\xbc\x85b\x8cLm\
-\xe5\x85\x8bM.\xe2xE\x92\x0e\xae\xfabw\xf4a\
-\x8b\x12\xaf\xec\x1c\xd9\xc5L\xefd\xf9E3\x9bq\xbc\
->\xa3(\x90\xee\xb1\xe7\xbb\xad\x0bT\x0d\x0b\x9be\xde\
-\x15]\x1d9y\x10|\xf7\x1c\xaf\xf9\xbf\xa3\x08:\xfd\
-29\x91\xd8;\xce\xd4\xa8\x05'\xe2\x03l\x84\xa7#\
-)V\xbf6\x9d@\xa3Mgy\x89\xb8\x93'\xd6\xc4\
-\xc4\x8b\x04\xe55\x1a-\xa5\x08m\xf6\x80v\xb1j\xf4\
-\xd1\x07\x9c\xe0\x95\xf2\xc2E\xcf\x89L\xed\xf5\xca$\xdd\
-\x838^\xab\xde\xc0\xf2O\xf6B\x1f\xb6\xb2\x82\xde\x11\
-\xc7\xeb%\xc5\xdb\x95\xe3\x0d\xd0@Qs\xd7\xa4r\x0a\
-z\xe6\x17\x9d+sr\xd7\xd5=\xc7Kg\x1d-j\
-z\x00\x89\x86\x8cQ\x81\x84\xd8\xae6\xc2\xd3\x10\xa2\x95\
-\xd4\xa4\xa1\x12\x14w*v\xc2M\x83\xc6K\xd5\xb4\xd2\
-\xbe-\xddS\xe2MB#V\xdag\x03\x09m\xf4Z\
-\xafA\xeaMq\xbc\xac\xbf\xb4\xbd\xb12\xdc\xb8v8\
-\xfa\xa8\x15{\xcaZzC\x1c\xaf\x8fl_\xc4\xfbU\
-\xe7\xa2]\x01\x9cI@\xb0\xa8\x83L\xcaE\x1f\xba\xe5\
-x\xa9\xf9\xf21\xa2\xa6\x07J\x01\x93_\xa1Em\xc9\
-Nx*\x11wS\xe3\xb5\x08VG\xacTH\xc7#\
-^My\x8b\xb8Y\x9a\x11\xa0L\x9c<\x9dY\x8dW\
-\x1d?\xdb\x0e\x10\xd0\x10A\xb8\xde+\xcc\x1b\xe4\xfd\xd8\
-\xf8%2U5^\xc2\xcbK\xe7&;\x9ev\x92\xee\
-i\x1c\xafpgQ\x15\x5c\xfde\xd2o\xa6\xe8mV\
-`\x14\x05\xc4\xf3A$\xd4\xa81'*]\xed\x00\xa8\
-N\xd9:|\xd6v1\xcde\x078\xb4\x83\xb8\xed\x14\
-\x10\x7f{\xda\x06\xdd\x0b\xec\xfb@\xd3D \xba\x1e7\
-\x04\xc6\xd7tQd=\xaa#u\xc7K\xe7\xed\x0a4\
-VJ\xc7\xd4\xe4\x0c\x95\x98\xf0\x12\x10\x9fJR\x80=\
--\x11\xac\x8ex\x9d\x087\xc9\xf2\xc2\xda\xb4\xb5O\xd5\
-t<bMf\xfc\x88S^\x88\x1ePO\xcaX\xfb\
-\x91V\x03f\x87G&S\xb67!\xfa\xfe[\x9f\x1a\
-2\x95\xf6\x17\x89W>\x1e=\x8c\xe3\xb5\xea\x0d7\xf4\
-\xdd\xd7\x8b\xfb\x8c\xe2\x00\xa5h\xc8\xf78\xde\x82\xedL\
-\xe3]\x1d\xf0\x8f\x00\x18\x14\xd03?im\xce\xba\xe4\
-\xd5\x0d\xc7\xfb\xd9L\xc0\x02\x1d\x10*\x9et\x22\xb19\
-\x11\x9eH\xc4N\x9a&o\xc0F\x98`\xc4\x0a\x91\x9c\
-4i'\xc2\x15\xd3\x094^\x08\xfbk\xc7\x13\xa7\xff\
-1KW\x1c\xafE\x90\x9a\xf9\x08m2\x04\xe2\x15\xfa\
-\xed@\xa6\xdc\x07\xda\xc9\x14V\xfdB\xfbV\x8dl\xb3\
-\x8e\xa4\xf9)\x9dL\x1c/\xab7\xbcu\xd5\x08\xf4Q\
-+0\x0a\x03\x84\x103\xdf\xe3x\xb77\x8dwK\xe7\
-\xd8A\x00\x83.\x82\xf9\x9d\x8dS\xb3\xdd\x87\x94\x1d/\
-\xa5s\xf6\x88~FOV\xd3L@l\xc9\x10\x1e\x1c\
-\xd2\xec\x0a.\x11\x14\xe4|-\xf1\x8a\xe9x\xc4\x9bD\
-y\xb5}q<D7^]:\x05\xe2\xd7\xa4\xa1\xb6\
-\xaf\x10%\x0d\x13\x84\xb6\x18\x12\x99F\xa7GG\xa6\xe9\
-\xd2xu$\xad\xceW|\x8d7J\xbc\xc9\xbf\x0e\xa8\
-7Z\x01)\x0cr\xa7\x09a=\xc8\xeb@%Q\x96\
-\x16\xe5\x83\xe8\xa7\xba=U\x8d\x17\xb6v|FqG\
-\xcfG\xda;\xec\x8b\xce\x85\xd3#\xb4\x9f\x01\xb0u\x0a\
-\xac\xeb\xf2\x0f\xcdv?\xbaA\xbcsg0r\x92\x88\
-&\x9ai\xd3\xb0\x9c\x09\x8f\x11T75^\x91\xd4\xac\
-\x0c\x1d\xc1\xc6#^\x87\xf2\x02\xa1\xd9\x08\xd3\x96\xce\xac\
-\xc6\xcb?\xc5\xf1\x8b'i\xf43\xd2\xe4\x81\x19\x22\x90\
-N*A\x0e\x81p\xb2\xcbd*\xcc\xbb\xd4\x9c@\xf4\
-l?6\x7fT\xe8\xa70/\xe2\xc5\xc0\x89\xa4-\x82\
-\x8b\xcd{d\xeb\xca\x9c\x84\xf3d\xcb|\x9e\xe2\x0e\xd1\
-y\xe6c\x1co\x01\xf1o7\x8e\xf7\xcb\xb6\xad\xd3\x01\
-\x9c\x090?\x00\xb4\x86\x07\x96\xaf\x0f\x22\xab\xaf\xb9O\
-\xd1\xf1n\xa8\x01]U\xc7\xc8\x8b\xda\xa2\x18\x92!<\
-%\x0d\xa5<4\x1a/\x1c\xd2\x84\xdd.\xb0\x0c\x95X\
-u\xfb'Q\x9e(\xe5\xd5\xfeH\xa4\xd7\xd3\xa8\x06\xcd\
-\x1d\x80\x88\x98\x09\xda\xb7\xf6\xa2@\xa4\xd1cm`d\
-j+/\x5clr\x1d\xc7K\x00D\xda\xb6T\xd1P\
-\xdf}V@\x84\x86\xbd\xf9\x1e\xc7[\xea\xa9jH\xf7\
-\xb8\xf3\xd5~\xec\x188\x86\xfdM\xf8\xfa>sv\xeb\
-\xd6\xac\xfe|85\xc7K\xe7\xcc\xb4Nf F\x84\
-N\xc4\xe6Dx|\x11\xd9\x08OGR\x88G\xac\x09\
-4\xdat\x96w \xce\x5c\xc5\xf1\xca\xe3\x89V\x17i\
-\x22\xa0!\xbe\x9d\x13\xbcR^\xb8\xe89\x91)\xf3\xe6\
-\x99\x8c\xe3\x8d\xd5[\x15nX\xd1g\xa97\x10i+\
-\xcd\xf78\xde~\xde!\x9b\xd28\xe4\xbc\xb5\x86\xc8\xd6\
-\xaa\xd6\xe0\xb8R~\x03\xc7\xef\xb0\x97t\xd2q\xd9\xec\
-K\x8a\x8ew\xee\x1e\x169Y\xcfbH\xf5[}\xcd\
-\xfeVR\x93\x86JP\xdc\xa9\xd8\x097\x0d\x1a/U\
-\xd3J\xfb\xb6tO\x897\x09\x8dXi\x1f\xd2|\xc8\
-\xf3\x15n\x14\x0e\xa9E\xb2\xc2\xf8\x85\xf9\xcdu\x1c/\
-\x89\xb5lv6U\xa0\x8f\x1a\xa5\xd4\xc8\xf38\xde\xb6\
-r\xef\x90\x0d\xe9\x19m~\xdb{\xad\x8b\x0f\xa0\xa0g\
-Z7z\x16L\x114\x85\x8b+\xb2\xd9\x97\x94\x1c/\
-\xa5\x9f\xce\xb4\xd0\xc6\xba\x22;\x11^\xd4\xec\x84\xa7\x12\
-q75^\x8b\xf8t\xc4J\x85t<\xe2\xd5\x94\xb7\
-\x88\x9b\xa5\x15\xc2\xb4\xa53\xab\xf1\xaa\xe3g\xdb!,\
-\x1aN\xa4\x14\x91&\x0f`Z\x07,6\x0c\x91LU\
-\x8d\x97\xf0y\x97\xceM\xe1\xf8\x0a\xcd\xb2\xfa\xd2\x14\xc7\
-\x0b\x80\xc0\xecl\xae@\x1f\xb4\x8eps\x85x>\x88\
-\x84\x1a5\xe6D\xa5\xab\x1d\x00\xd5)[\x87\xcf\xda.\
-\xa6\xb9\xec\x00\x87v\x10\xaf\x1d\xb3\xc8(oI\xdb\xa0\
-\xf3\xd8\xbek\xf7\xecH\x84\xf3\x88\xf9\x09\x0a\x8a\x90Y\
-\x9c\xd5\x07\x05\xa5\xe4x\x09>\x9f\x01Jc\xc7\x8d/\
-\x9a\xd4\x08/\x01\xf1\xa9$\x05\xd8\xd3\x12\xc1\xea\x88\xd7\
-\x89p\x93,/\xacM[\xfbTM\xa7J\xfc\xba\xb4\
-Sy\xc2\xdbWOJ\xdd|0\xe7\xdbj\x08d\xaa\
-\xe9\xbf\xf5\xa9!Si\x7f\x91x\xe5\xe3\x91\xae8^\
-\x00\xa0\x9d-}\xf2\x95\xef]f\x87\x9fRT\xe5s\
-\x1c\xef\x00\xef\xa8\x15i\x1dt\x1e\xdb\xa6\xce\xc9\xd5T\
-<\x8f\xa4;J\xe0\xfbNd\xedie\xc9;^:\
-g&#\x9c\xf8\x84\xd7\x03\x8dWL;\x11&\xf8\x95\
-J\x22'[\xda\x89p\xc5t\x02\x8d\x17\xc2\xfe\xda\xf1\
-\xc4\x1b\x7f\xac<!\x0e\xe3\x17\xd3\x89\xe6S \xc8$\
-\xe6#\xd2\xe4\x89K\xa6\xdc\x07\xda\xc9\x14V\xfdB\xfb\
-\xd6L\xb0\xcd:\x92\xe6\xa7t*q\xbc\x00`v6\
-\xf7M\xc7\x1b\xe9\xf0'\xd6^\x99\xc9\x17W\xbe\xbe \
-|\xca\xc4+\x92mw\xe3x\xfb\x15l\x1f\xfa\xee\xc7\
-\xed\x0b\xf6\x89\x98\xc5^\xc2.\xfe`\xd0e\xc1\xde\x99\
-\xf3:\x1a\xb2\xf6+\xca\x14\x88\xf7\xb3\x99\x84\x10\xc0L\
-B\x93LH\xc0\xca\xfepH\xb3+\xb8DP\x90\xf3\
-\xb5\xc4+\xa6\xe3\x11o\x12\xe5\xd5\xf6\xc5\xf1\x90d\xc6\
-O5\xe3\x17\xd3\x89\xcbCm_!J(\xfd\xa7\x01\
-\x02\x902\x072M\x97\xc6\xab#iu\xbe\x92\xd5x\
-\xfb&\xf1\x06\xcd\xce\xa2\xf8\xda\xab\xe8le\x12ei\
-Q>\x88~\xaa\xdbS\xd5x!\xb5S\xee\xd9>\xf4\
-\xdd/Z\x9b\xa6\x83\xe0\x0c\x0bR\xc0\xd6)'\xdf\x95\
-]td\xb6\xfa\x93\x0a\xf1\xee!\x1f\xf4x\xc4'\x12\
-\xad\x13\xe1\x09\x83\x86P\x1eIj\xbc\x22\xa9Y\x19:\
-\x82\x8dG\xbc\x0e\xe5\x05B\xb3\x11\xa6-\x9dY\x8d\x97\
-\x7f\x8a\xe3\x17OR\x11\xcdi\x83\xa7\xd4\xbf\xa6\xf2\xf4\
-;O,\xde\xf1\xf4\xbf\x89r\x08\x84\x93]&Sa\
-\xde\xa5\xe6\x84\xe3+8w\x99\xa4!\xcd\x8b|1\xd0\
-\x93\xb4Ep\xd6q'\xa0\xc1\xf62\xf4A\x8b\x12\xaf\
-\xe84\x01\xe9\x0e\xc6r\xae\xd2\xd5\x0e\x80\xea\x94!8\
-U\x91\x84\xf9\xfaqn\xc7\xaaA\xdbN\xbf\x82\x9a\xed\
-\xc2\xf1.m\x1f;\x86\xadGf\xa2\xc6K\x08\xc1\xd6\
-PQe\xb6\xfa\xe3MvGJ?\xdc\x8f\x10\x02S\
-Y<\xd2I(\xa5\xb9\x93\x8e\x9b\x86R\x9e\xa5M\x96\
-\xcf\xafH\xb64\xbb\xd2\x83;\x019-\x92\x18\xdb?\
-\x89\xf2\x84D\xa36\xc4\xdb9\xb1?b\xdaq\xfc\xa9\
-\xcc\x07\x1c\xcbC7\x1fB\xda\xda\xcbk\xd4\x97\xed\xf5\
-\xcb\xc7\xcb\x0f\xfd\xc7e\x00\xd0\xb5\xc2\x1b\xb6\xe4\x14\xa9\
-\xbf\xecb#~\x11)\xb7k\x1b\x9fu1\x14\x9c\xb7\
-)\xd4\x1b\x9b/\x91\xa4m\xf5\xc6\xe6\x13b4\x0c\xdb\
-\xcf\xe3\x0d%\xbb\x0e{\x93\xc54^\x18Ft\xbc\x86\
-\x01\xb0\xe3\xa9w\xb2\xea\x9d\x90=\x1d\xad\x87\xd7\xc7\xd3\
-\x89\xdaQ5\xde\xe8\xf6rO\xf5\xe6L\xcfC\xaem\
-N\xc7\xa2\x99\xc1\xf0\x18\x9fapy\x01\xe0~\xc0 \
-\xd1\xb7\xa0w\xd1\x92\xac\xc5\x93'\xe9x\x1b\xaa\x08\xb6\
-V\xb2\x17WFOJ\x80;\x05h\xd2\x02\xe1Io\
-\x19\x86sy\xe9$%\xd1w\xb6A T[Z!\
-\x5c[:\x8d\xe5\x1d\x88\xd3y\xfc,\xed4~1\x1d\
-\xaf<wn\xd6;\xec\xc4\xb4\x81\x86\xc21\xbb\xcd\xeb\
-\xff\xb3\xc7O1\x8a+\x1bYI\xef\xc0]\xe6\x81\xd2\
-\x16\x02Rn\x11\xaf\xf4\x0e\xbc8djZh\xab\x5c\
-\x04\x84\xe3$\x5c\xbc\xf8\x9d\x802?\xea\x1d\x04s\xbe\
-J\xbd\xc4(\x08\xa2\x0fZSps\xb5\xaa\xbd\xda\xd3\
-lo\xd9\x19\xf3\x8bn,%\xde\xb1h\xebK\xd4\x0e\
-\xd1\xb6S\xe5\xeb\xfb_\xae}\xd4\xbcu\x1fB\xc6\x9e\
-a\xcd\x83\xb5\xec%\x8d\x17\x94\x02[\xc3\xa8\x1a\xe0E\
-\xc6\x7fP\x92\xa4\xd4\xb0b\x94EZ\x82\x96\xc4\x09\xcd\
-)-\x1et\xf1\xca\xad\xeco%5i\xb0\xdb\x03v\
-[\x10s\x01\x8cX\x91f\x8d\x97\xaai\xa5}[\xba\
-;\x1aw\x82\xf9\xb0\xcd\x8f\xdc~\xec\xe4i,\x18\x5c\
-\xbdp\xe0\xf9\xaf\x1d1\xe0\xb4\xd7\x7f\x22:]\x00\xf0\
-\x94\x0d_C\x0a\xfb5\xf5\x868^\xe2\xe9\x9b\xaf\x9e\
-\xd9\xda\xb5\xbeF\xd5Zs\xaf\xf1J\xed\xb4T\xfb&\
--L\xdb\x80\xf3\xd4V\xb4O\xdc\x81Z\xe7?\xb5\x86\
-\xaf\x92/\x80\xb3?o\x0ff\xe5\xc1\xe8\xc99^\xba\
-|\xb4t\x1b\xaa\xde\x06[\x17PQ\xd3\x8c\x1aO\x8b\
-Wl\xc8i\x08\xe5\xad\xdbZ\x96\xd6\x11'\xab\x182\
-\xa1\x8a\xb7\xafVZ \x5c\x91\xc8\x9c\xca\xb3\xfeYi\
-h\xc8NL\xab\xe3w\x9a\x0f\xf9\xe4\xb3\xcf\x87Cy\
-e\xfc\x00\x1a\x8d\xe2\x82M\x15\xc7\xdex\xf5\xc0\x8b\xbf\
-\xdb\xb1`\xe8\xf4/\x9c\x0e[\xc1\xe0\x19s\xa3\xc3\xe0\
-he\xd7x\x09\x9fw\xe9\xdc\x14\x8e/\xef\x0eX}\
-\xbah\x09k\x07\x0dI\x13F\x18\xd2q\x8aM\xbc\xd1\
-W\x1d\xef\xbaa\xd2\x1d\x86@\xa2QcNT\xba\xda\
-\x01P\x9d2'\xe3tj\xbc\x05\xa48PY0|\
-MZ\x07\x9dg\xf6A\xdb\x82\xfdB\x91r/\x11\xce\
-wf\xaa\xc6\x0bP\xfc\xd0\xd52>\x1b\xfdJ\x9ex\
-M\x1d\xb1u\x87\xf0\x12\x10\x9fJR\x80=-\x11\xac\
-\x8ex\x9d\x087\xc9\xf2\xc2\x9a\xb7\xb5O\xd5t\xaa\xc4\
-\xafK;\x95\xe7\x9an\x94\x0cIC\xc9n\xc7\xbeX\
-}\xe5\x86!\xfe\x9d\xcf\xbb;\xd1Q\xf3TN\x5c\xa2\
-\xed\xbf\xf5\xa9!Si\x7f\x91x\xe5\xe3a\x8f\x96\xe0\
-\xed\xa6\x1a\xc7K<\x05}\xd2\xf16vm\xa8\x11a\
-\x85]\x9c\x88\xb8@ \x9fO\xcc\xc4\x8b\xb3J\xb8\xfc\
-<\xe3\xeb/q;\xaa\xc6\x0b\xd4\x14\xed\xb8 \xed\x83\
-\xce3\xfb\xa4\xb9e/\x02r\x86D\xbc1\x13\xe3x\
-\xd9\xbc\xd6\x8700\x1b\xfdJR\xe3]1R\xba\xb2\
-fJ\xe3\x15\xd3\x84\xe85M\x08\xb7\x0bq5Zu\
-\x7f]:\x81\xc6+\x12\xb2v<\xf1\xc6\x8f\xd8\xfe$\
-\x1d\x1aoc\xe1\xc8\x1d\x17V\x1c\xfd\xf8)FY\xed\
-\xba\xe4\x8e\x19\xe0)\x1f\xb9\x5c\xab\x113 \xb5\xfe\xe0\
-d\x0ak\xbe!\xdf\x01\x08w\x1c\xd6\x9d\x84\xedN@\
-\x99/kQ\xf3\xf9\xb5\xd7\x0b\xa0\xa0o>\x96\xb0\xa1\
-k]mz4^U\xeb\xed\x89\xc6\x0b\xab\x9dj\xdf\
-\x84%\x99\x9d\x81\xdc\xdb\xaa\xf6I#9\xcc\xc1\xfa\xe4\
-\xd0%\xc0\x1e\x80\xd6HQVB\x1b\x93'\xde\xa4\x08\
-/Y\x02V\xf6\x87C\x9a9{\x89\xa0 \xe7k\x89\
-WL\xc7#\xde$\xca\xab\xed\x8b\xe3!\xc9\x8c\x9fj\
-\xc6/\xa6\xe3\x96o4\xca\xcbW\x0d8\xfd\x85\xe3+\
-O\xfd`\xdfT\x9c.\x00x\xcaG\xae\xb2\x93i\xba\
-4^\x1dI\xab\xf3\x95\x9c\xc6\xeb)\x1b\xd8'\x9f\x8e\
-\xd5\xd0\xb5\xb66\xbe\xf6*:[\x99xYZ\x94\x0f\
-\xa2\x9f\xea\xf6T5^X\xed\x0c)\x9c\xf4}\xba\xc6\
-\x9a\x8f\xf6V\xcb\xd7\x87E\xccR\x83\xcbb\x02\xb4\x81\
-\xadSN\xbe\x00\x104\x8b\xb2\xf2\xd3\xe1\xa4\x88\x97\xd2\
-%\xe39\xa1\x89D\xebHhB\xbe\x13\xe1\x09\x83\x86\
-P\x1eL\xe3\x8d\x95\x87B\x9c`KH 5\x96\xa1\
-%\xd8x\xc4\xebP^ 4\x1bq\xdb\xd2\xf1\x88\xd7\
-i\xfcbZ[\xbe\xd1(,\x08\x97\xec\xf9\xdb;J\
-\xa6_\xf5\xb7d\x8e\x91\xce<\xe5#W\x00h\xa1\x94\
-\x96s2e\xceQ\xbc\xedr\xd0xE-\xd7\x9ao\
-\xe1dW\xeeLD\xe7\xeeD\xd2l?Q\xe35\xca\
-\x06\xd6ww\x8c\xf9j\xed\xe1\xa6\x8a`$P$\x92\
-\xadJ\xa8\xdc\xb9\xca\x17g@u\xca\x1cV\x12i\xbc\
-:\xe2\x8d\xedikg\x88o\xe2\xa2\x8cNB\x8e\xed\
-\x93\xe6\xd0\x9e 8\x83\xc3\x87L\xfeV4\x83@\xbc\
-\x14\x1et\x98\xf0\xfb\x0dd\xf4.,)\xe2%ds\
-\xb5\x9e\xd8\xbaCxJ\x1aJy\xeb\xb6\x80\xe5\x0b\x84\
-\xaa\xa6\xad\xdb\x05\x96\xa1\x12\xabn\xff$\xca\x13\xa5\xbc\
-\xda\x1f\x89\xf4\xbaC\xfc\xcew\x00 h,\x9e|\xf0\
-\xecA\x97n\x1a\xdc\x13\xa7\x0b\x00Fi\x94\x90\xb5d\
-\xca\xe6\x01\xca\xb8\xa5\xfd\xb9\x06\xa6:\x05k\x9cIj\
-\xbc\xce$M\xe1)\xed{\xc4\x1b\x95\x190\xc8Y{\
-\xd59Y\xc1)P]Z$\x5c\x91lEg\xab\xb6\
-c\xd5\xa0\xb6\xd3RS4\xa5\xcfj\xbc\x0d\xe1\xd6\xaa\
-u\xed\xd3j\xf9\xc5?6O\xe2\xbc\x0b\xeb\xdb\xfa\x22\
-\x92\xe2\xec\xf5\xa1\xcc?\x14=\x09\xc7\xfb\xe3X\x08\x8b\
-\x80\x1d\xec\xa8)Z\x9d\x94V\xf7O\xa2\xbc\xa8\xfd\xb1\
-+\x14\x04B\xb5\xa5UM6\x8eF\xdb\xd3\xf2\x12q\
-+\xc4\xaa\x1d?K;\x8d_L\x03\x00\x9a\x0a\x86\x8c\
-\x9aWu\xf6g{\xf4;\xe2\xe9\x13\x13\x1f\x97\xe4\xcc\
-\xd3o\xe4\x0a\x9b\x16+\x5c\xf4\xb4d\xca\x90\xd8\x22\x02\
-6r6,a\xb1\x0a\xb7\xb3\xdc\xb7Z\x15\xc9w\x10\
-\xd6\xb0\xa5z\x1b<e\x83\xfa\x1c\xf1n\xedZ_\xab\
-\xd3^\xd9E\x07\x90/V\xc2UIJ\xcb\xa4\x0b[\
-}N\x1a\xaf\xbd\x1d\x22\xd5[\xee\xad\xdeTl\xf4k\
-\xca\xc0\xd0\xf3\xc2\x9eo\xfc\xf6\x04\x80\x9e\xc1/\xfe\x82\
-\x0cf\xf9X\xbb\xc6\x0b\x02,\x0bn\xcd\xf8\x0bX\x93\
-p\xbc\xcbG\x89\x8b\xc2\x8d\xe3U\xd3=%^\xda\xe4\
-))YWq\xdc\x03gU\x9e\xf2\xe5n\x9e\x8a\xb1\
-K\x13\x1f\x93\xe4\x8d\xf8\xfa\xb5dF\xe3U\xeeLD\
-\xe7m\xcdOr\x1a/),iK\xe7\x98\xf3\xc16\
-v,\x1b-\xcb\x0a\x22\xa1r'\xca\x9d\xadL\xb8,\
-\xcd\xb5\x5c\xf6\xa9nOU\xe3\x8d\x96\x1f^4\xed\xeb\
-4\x0f9\xaf\xec\xeb\xa6Q\xbbXPA\x92\xd7xA\
-\x81\x8d\xa1Pu\xa6\xfb\x97\x84\xc6\xbb`\x8a-n5\
-\xae\xc6\x8b$5M\x07bD\x92\x1a/!\xce\x1a-\
-C\xbb\xeeh\xbc\xac\x7fV\x1a\x19\xd3x\x89\xd7h\xf4\
-O;\xeb\xfe\xd2=n\xbe\x22\xf1q\xe8\x9e\x19\x85\x15\
-Ma\xf5\xf8\xd9H>\x91\xc6\xcb\xb7Go\x0c\x04-\
-_\x98\x17^\xb1\x9d\xa4\xc5\xdbbQ\x8b/\x18\x94\xde\
-\x0bM\xbe\xd8\xea\xf6\xefvt\x96\x03\x98\x93dN4\
-\xfb\x1a\xef(\xff\x9e\x9ffx\x0arf\xef\xb4|{\
-H02\xc1\x07\x22^\x94\xf8\xfag&i\xbc\x02,\
-l\x09aP\xa6\xfb\x98\xd8\xf1\xd2/w\x13\xbf0\x13\
-\x0f\xaax0\xc5\xdb\x1b9_\xdd?Ay\x08'u\
-\xec\xe4\xb4\xa5\x85\xdb\x5c\xae\xd1@I\xb3|u\xff$\
-\xca\x0b\xce\xd3\xd6>U\xd3N\xe3\x8f\x95\xd7\x8d\xdf \
-M\xbe\xba=\xe6\x94\x1f\xf2\xe4)\xa4 \xb3\xb7{\xc4\
-W\xd1d\xeb?\xeb\x97p\x91\x92\xb5Ce|\xc2\xc5\
-P\x9c\x0f\xd1\xf9&\xf5\xac\x06\xf1N#\xe6|\xbd\x03\
-G/\xcb\xe4\xf8se\xab\xda\x16LaN\xb0\xe7\xcf\
-j\x10e\x04~~\xf5\xe0Y\x0d-\xa3\x8a\xf7\x9c\x93\
-\x9d\x99\xc8\xbe\xbd\xb7-\xb4?\x80\xd3\x98\xac`9_\
-Ct\xb2\xdc\x0f\x18\xc4\xe0\xdb)\xd0\x1c\xf1\xf6\xcbt\
-\x1f\x13;^\xb2|t\xb7\xe2p\x1d\x897\xc9\xf2N\
-\x84\x09\xe1v\xa1\xf7\xc5\xf16\x15T\x0d\xddPv\xd0\
-\xa3\xbf\xf4Ve\xe7V\xcf(\xaah\xb2\xeeX\xf20\
-\x8e\xb7\xa0z\xdc\x0f\xd9\x98\x87lZ\xd0\x0c\x14m\xea\
-\x5c>\xcaZ\x0f\x0e\xc4\xcb\xa6/j\xb23\xe6\xeb\x0b\
-\xc2\xa7L\xbcr}\x89\xda\xe1\xa4\xe7%\x85\x81aE\
-;\xf7I\xa9aC\xb0\xb1fc\xfb\x94\x1a\x81\x02\x04\
-Y\x0c\xd6\xa7\xb5\x1d\xb23\x06\x01:\x22>\x7f\xa6\xfb\
-\x99P\xe3\xa5tCMB\x8d6nZ\xbemR\x17\
-\xdbv\x12\xc7\xdbD\x8a\x0a\xeb\xcb\x0e\xba\xf5\xf2\xfe\xbf\
-X8)[N\x17\x00\xe0-m\xcb\x8c\xc6\xcb\x16\xb1\
-p\x5c\xa1\xce\x17A\x22\x8d\xd7\xdb\x07\xa5\x86\xd5m\xdf\
-M\xa1\x14\x83\x12k\xaf2\x91\x0a+\xdbJ\x8bwN\
-\xd1Ou{\xaa\x1a/\xb0\x83\x7f\xafO\xd2:\xe0<\
-\xb2\xe7\xb7.:\x01\x04\xa7Y\x1b\xc4;N\x22@\x1b\
-\xd8:\x15\xee\xd0b\xfb\x07ia\xc6cy\x13\x12/\
-AK\xb9\xfc-\xbcH\xb4N\xc4'\x12\xa1\x8ex\xc1\
-\xd3\x8c0Yy\xe1\xb6\x16\x88\xa3\xf1\x8a\xa4\xc62\xf2\
-1\x8e\xd7k4\x15M\xf8\xf9\xb3\xa53\xef>/\xe1\
-\xd1\xc8\x80\x11b\x986\x8d^\x22\xd3X?\x85\x93\x99\
-]t \x9c\xd4|\xbe\x85\x93\xbd\xe7q\xbc\x0d\x05\x83\
-\xc7\xf59\xc7+\xca\x0c\xf6O\x228EQF\x90\x89\
-7\x93\x1a\xef\x0e\xc5}W\xdf\xfd\xaee\x87\x1d\xd9\xdf\
-<\x9a!\xb1\xc6k\x19\x01\x22\xd4\x9b\xdaK\x80\xbba\
-\x09\x1d/E\xd0\x97\x92F\xab\x9c\xacZ\x8dSLC\
-)\xaf8oF\xa8|\x7f!\xcd&\xd5:\xb9\xd5\xb4\
-Hbl\xff$\xca[NEX\xc4\xa9?\x8f\xb7\xa5\
-\xa0v\xea\xfc\xb2\xfd\x9e>\xd1(\xae\xce\xdd\xebU\xa8\
-i\xd85^~{\x95\xaa\xc6\x0ba\xfc)k\xbc\x04\
-\xb6\xe7\xf1\x16\x0c\xed{\xcf\x0bX\xdd\xbepR\xf2\xda\
-\xab\xe8d\xd5;K{\x9a\xd7\xdbm\x8d\xb7e\x94\x7f\
-f\x9f\xd4w\x9f\xd9\xfa\xc5/\x82\x91\x9d|\xd6E\x09\
-\xdc\xd9Z\xf3$\xc8\x0a\xaa\xc6\x0b\x00\xa0\x00%\x9e\xdc\
-;^\x82\x88!i|\x16\xc1\x02\xf15Nu\xff$\
-\xca\xebH\x0a\xf1\x885\x81F\x9b\x9b\xe7\xf1\xb6\x18e\
-U\x0d\xa5{\xdfwN\xc1\xe0\xfd\xdfK4\xbf\xd90\
-\xbb\xc6\xcb\xe5\x05'2\x05#S\xe1\xa2\x22T(]\
-\xbc\xd8t&\xd6x!\xd5\xeb\x19\xb0C\x1f\xfdb\xed\
-\xbb)\xc9k\xaf\xac\x94\xec\x8cYZ&]]\xf9d\
-\xdb\x89\x96/0\x8a\x02#\x8bg\xcc\xcd\xd2Td\xd5\
-\xdek\x18\xbc?\x01\xe12\x83$wq\xa8\xe0\xcb^\
-\x84\x8a\x98\xc5\xce\x8f0%^/A\xc6\x1e\xde\x94\xc0\
-\xb3\x87\xbdv\x8d6\x15\x8dW\xd1D\x9d\xca[IM\
-\x1a\xb1+W\xec>\xd7ryT\x98T\xc0\xba=\xce\
-a\x1co\x0b\xf1\x154\x96\xcc\xfc\xeb5\xfdOX\xb6\
-C\xfe8\xdd\x88\x91\x19\x8d\x97\xdd\xbe\xb1\xe3*8o\
-k~\x88T\xafzgSX\xb7\xdb\xbc,LA\xd6\
-mu\xdbw\x93\xed\xb2\x02\xbf\xe8\xe5R\xe3\x1dQ\xd4\
-7\xe7\xfc\x7f\xdb\xbe9\xaa+R]$9Q\x85x\
-\x99\xb3e\xd3,\x92\xafe\xd1\xfd\xcf\xee2\x91\xd1\xb7\
-Q$ \xde\xadU\x16\xa1\x0a\x1a\x89\x1b\xc7+\xa6\x09\
-(HK\xd1\xd8\x9f\xbeR\xb2\xc7c\xbf\xec\xdea\xc8\
-\xa4Q#\xbe\xc6\xcb\xe6Y8\x0e\xb1\x8b\x8eL\xbc`\
-\xd7\x1aA>\x90\xe7\x85Wl'i\xee\x0c`\x1d'\
-\xdf\x88]\xbf\xcc\xf2dd\xdc\x96\xb7~3\x0d\x10\xee\
-\x00\x84q\xdb\xb5WA\xceq\x94\x1fXZ\xde.\xa6\
-y;ph\x07V;\xe3J\x0e|7\xb33\x90\x1b\
-{\xab\xa1\xe4PJq\x9aV\xc3e\xf3+\x90\xbf\x94\
-/^\xfcb\xfb\x85Rx-Zw,A\xe5\xed~\
-\xbb\xe6'\x5cA\x84Ec\xd78\x9d\xf6OP\x1eT\
-n\x0f\xb0\xa7\x85\xdb\x5cg\x8d\x97\xe5\xab\xfb'Q^\
-\xb8\x98\xd8\xda\x97\xe7\xa3\xc5;p\xec\xd2\xd2=\x9f:\
-\xc9(\xcd\xcfxT\x1al)\xb7k\xbc\x02\xa1\x82\xca\
-\xe3\xb6\x1do\xf9b(\xceG\xca\x1a\xafx\xa7a\xd2\
-\x06\xdf\x08\xe7\x87\xb8\xf7V\xfb~\xdb\x87\xfb\x10\x82A\
-\xe9\xd5xE\xd9@\xd4z\x91\xaa\xc6\xdb\xb2c\xd9\x11\
-\xaffk.\xb2e\x1f\xb5\xfc\xb8Ok\xd7\xf0R]\
-\x9c\xaeH\xbcNq\xbc\xdc\x19\xc7n\xe9\x0c Ls\
-\xeax\xbb\x8a\x9c\x09\x16\xd0\x13o\x0f4^1\xedD\
-\x98\x10n\x17r\x17\xc7\xdbf\xf8\xcbZJv\xbf\xf7\
-\xbc\x82!\xf9\xbd\x90i`[\x85]\xe3\x05\x98\xec\xa0\
-\x92)\xac\xf9\x86B\xbc\xfc\x8e\x031\xf9!u\x8d\x97\
-\xd7k\x14\x95\xb5\x15T\x8f\xefs\xcf\x83]\xd8\xf4\xf1\
-\xde\xa9i\xaf\xac\xa4\xec\x8c\xad;\x91\x18\x19\xeb\x887\
-U\x8d\xb7\x7f\xc1\xf05\x83|}/|\xef\xa5\xfa\xce\
-cA\xc8i\x22\xd9\x0a\x14 \xc8b\x90\xf2\xc5\x1fM\
-H\xfbS\x8a.\x1a.\x02\x0a2\xd6\xe7\x04\x1ao\xa0\
-\xa8g\x1a\xaf h[\xe5a\xdf\x1f\x0ei\x81P\x99\
-\x17\x14\xe7\x08$\x03\x1a\xaf\x9a\x96\xdbo\x83\xc7\xd3\xe4\
-\x9fr\xd1\x7f*\x8eY?4\xdf\x9d.\x00\x98\x81\xc6\
-\xca\xcch\xbcl\x11\x0b\xc7\x15\xea|9k\xbc\xbe\xe1\
-\xbb\xf6I\xadqQ\xd3'{\x01\xfa\xdb}\x91X\xa3\
-i\x99H\x85\x95m\xa5\xd3\xa9\xf1\xee\x5cv\xec\x8b\xe9\
-\x1fqn\xed\xcb\xb6\x15\xd3\x1b\xbb\xc6UZ\x17\x19F\
-K\xcc\xc4;l%_\xfc\xd1\x84\xba\x7f\x17\x8dd4\
-\x967\x01\xf1\x064\xc4\x9bH\xe3%\xc2\xfeN\x9a/\
-x\x9a\x11&+/\xdc\xd6\x02q4^\x91\xd4XF\
-&\xe3x\x0d\xd2\xe6\xab\xd9\xf7\x83\x92=\xfe\xf7\xd3\x14\
-\xe78\xa7F\xbb\xb6V\xc5\xd7x\x01k\xde%\x1f@\
-\x04\xe2\x15\xc9X8\xd9{\x10\xc7[8r\xf7\xcf\xb3\
-<\x15\x19\xb7\x05\xdb\xde?@v~\xbaOU\xd3\xcd\
-\x9a\xc6\xdb2\xb9\xec\xf072:\x019\xb0\x17\xb64\
-\x1eOi\xcdiR\xd4B\xcc\x92\xd5xU\xe2\x05\x05\
-B\xd4\xcc\xa8\xe3M@\xbc]>=\xb1\xaa\x8b\x86\xed\
-o_D\xf1\xcb\x0b\xa4\xc5\xca[\x93\xc1\xf2\x05BU\
-\xd3\xd6\xed\x02\xcbP\x89U\xb7\x7f\x12\xe5\x89\x5c\xde\xdb\
-\x7f\xd8\x92\xf2\x83?\xd9\xb3\xb79]@!^\x08d\
-\x0a\xf1\x8aO\xa4\xe3\xc0\xf7\xe7\x1a\xaf\xea\x14\xac\xe3n\
-9[\xde\xa6|\x87\xa2%\xe9\x86\xc2q\x07\xcd\xce\xec\
-\xc8\xb3o\xdfo\xfbh_J1\x88\x13\xa7\xe8\x049\
-y\xc6\xd7x\xa3f]\xbc\xa4\xb4H\xb8\x22\xd9\xc6k\
-'j~O\xff\xc6\xba\xe2\xdd\xfbT\x18\xd9w\x1d\xab\
-\xa7lh\x9b\x5c\xc3\xd6\xab\xfcE\x19;\xcf\xd9\xc5_\
- b!\xdf\x92\xd5\x98\xc5\xa6=D\xcd\x8cj\xbc\x89\
-\x1co\x11;\xb8\x12\xb1\x0ahd\x8bJ\x10n'\xe5\
-\xfd\x93(/j\x8a\xec\x0a\x05\x81PmiU\x93\x8d\
-\xa3\xd1\xf6\xa0|\xc9\x1e\xaf\x1d\xe1)\xef\x9d\x0f\x8d\x96\
-4^\xeb\x83_\xf4\xb4d\xca\x90\x98\x1d\x1f\x00\xd2\xea\
-\xb4\xb4[\xeb,g\xd5\xcbw(\xaa\xc6\x1b\xfb4\xfc\
-\xfd\x1b}\xb5;\xcd\xcf\xce\x0cd\xcf\x166}\xb4\x97\
-\x8elE\xe7\xc8.f\x80|\xb1\x12\xef\xe5\xc4\xb4L\
-\xba\xb0\xd5\x97l;;\x95\x1d\xf5J&\xc7\x9e\x0b{\
-p}\xf3\xaf@p\xaa\xfaE97\xf1\xe2/\xc8`\
-\x94\xe5\x0a\xc4\xcb,\xb6\xfe\x83\xa0\xb9$\xde\x9ej\xbc\
-:\xe2\xd5\xeco%5i\xa8\x04\xc5|\x02\xd5\x10n\
-\x1a4^\xaa\xa6\x81\xae\x1f\xff\x9e\xb1\xc76f\xd2\xc2\
-[\xbf\x9bBA\xf3.\x8e\xb7x\xf2\x91y\xaf\x8d\xa7\
-j\x1d\xe1\x96\xf25\xed\xdfO\x165YYV\x10\x09\
-\x95;Q~\xd6\xcb\x84\xcb\xef(y}\xd1Ou{\
-R\x1ao\x9f\x93\x19\xdeo\xfa\xf1\x80\xad\x81\xb1U\x90\
-\xe6Y&Z\x0b*\x98\x5c\xc6\xf2\xd9<\x81o\xb7,\
-\xb6\x7f\xd8\x8c\xe4\x94x}\x16\xa1JW\x5c\x80_\x91\
-U\xe2\x15\x89VG\xbc*\x11;i\xbc,-\x10\x94\
-\xd5*\xab\x98\xdf6\xcb\xc4J\x85t<\xe2\xd5\x94\xb7\
-\x88\x9b\xa5\x81\xe0\x867\x0fKaN\xf3\xc6\x22-+\
-\xeb\x08Pn;~P\xc8\x94\xcd\xbb\xe4\x03\x84\xe3\x0b\
-\xbe=:-\x82\xf6+\x90\xb4\xb5\x83\x86\xa4\xd9IA\
-\x08P4\xe1\x90w\xb25\x07\xd9\xb2o\xb7\xbdw\x00\
-\xa5t\x90\xec\xfc\xe4;<\xd1\x19G\x8d9Q\xe9j\
-\x17+\xaf\xa6\xe5\xedbZ\xd4vu\xed\x14\x90\xa2\xc0\
-\xc4\xd2C\xdf\xcc\xc4\xb8se\xcfl\x22'\x028\xd5\
-\x82\x09\x91hc\xc6\xfc\x80\xa4\xf1*\xf92\xf1Z\x0e\
-\x02&\xcc\x8c\xfel8A\xe5\xd4\xb0\x88UY<\xe2\
-\xa2\x91\x09V%\xdcD\xe9$4^5-\x11\xac\x8e\
-x\x9d\x087\xc9\xf2\xc2\x9a\xa7\x00h\xe7\xb6\xcan\xcc\
-m\xce\xcdl^>\xda6\x7f\xfc\x9a$\xdcI$\xd2\
-x\x01N\xc6\x0a\xc9Y$\xcd\xdb\xd5i\xbc\xd6\xc5\x96\
-\xa2\xa1p\xf4\xbe\x1fdc\xfc\xd9\xb4\x05\x8d\xef\x1d\xc8\
-\xd7?_\xd7\x89\xb4W@>\x9f\x98\xc9\x1a\xafL\xb8\
-\xa9\xb6\xb3S\xf9\xd1\xb328\xf4\xac\xdb\x8b\x0d\xdf\x1c\
-\xd7\x1e\x1c\x1a}t\xa3\xe0\x9f\x12i\xbc\x16\xf1\x0a\xf9\
-2\xf1\xf2[j\x93\xd2\x5c:^_\xd0N\xac\x22\xd1\
-\xa6Y\xe3\x15\xd3\x02IId\x05\xe1v\xc1\x22\x5ch\
-\xd2N\x84+\xa6\x13h\xbc\xd6f\x8a\xe0\xda\x87\xcfH\
-mjso\xe1\xe6\xe5;\xe8\xc8\x94\xfb@;\x99\xc2\
-\x9ao@&^~\xc7a\xddIH$\xcd]\x87\xb3\
-\xc6KQ4\xf1\xd0\xb7IAQ \x8b\xd3\x90\x15\xfb\
-\xa2\xe1\xb5\xc3\x19\x89\xaa2C\xcf5^U\xebM\xa9\
-\x9d\x96\xdd\xfa\x9d\xfcTF\x07\x9fe{}s\xe5\x11\
-\x84\x90S\x01\x08\xebU\xd0x\x95i\x94\xe2x\x85|\
-\xfe\x05\xb1\xb2?\xa5 $\xb3\xcf\xc9I\xe8x\x13\x12\
-j\xc2\xb4\x8ex\x95\xfd\xe1\x90\x96n\x1fDb\x15\xf2\
-\xb5\xc4+\xa6\xe3\x11o\x12\xe5\xa3\xed\x97\x866\xbe~\
-D\x12\xf3\x99W\x16\xd9\xfa\xddd;\x99\xa6K\xe3\xd5\
-\x91\xb4z\xbc\xec\x1a\xaf\x7f\xea\xcf\x9e\xcb\xce\xe8\xb3g\
-_m}\xf3\xb0@\xb8\xadT\x84\x08\xd9)F\xb7q\
-Be\x17+\xf1\xac\x97\x89\x97\xa5\xc5\xfa\xa2\x9f\xea\xf6\
-\xf8\x1ao\xb9w\xf0\xa6\xb1%}\xe7\x0e\xe3\xa1M\x9f\
-\x9f\x19\x8c\x0c\xf2Y\xf0\xa6\xccs*q\xbc\x80uc\
-g\xdb\xdf\x0b\x9a\xb1\x07\xe4\x00\xdd\x22\xdeD\x1a\xaf\xac\
-a\xe9\x89\x17<\xcd\x08\x93\xed\x8f$5^\x91\xd4\xac\
-\x0c\x1d\xc1\xc6#^\x87\xf2\x02\xa1\xb1\xfeGZ\xbe\x9f\
-\x98\xf4\xac\xe6\x81\xd1p\xa0(\xdc\xf0\xedT@%S\
-U\xe3\x05\xacy\x97|\x80p|\x05\xdd\x85\x91\xae\xee\
-\xce\x84_\x1c\xf5$\x8d\x82\xe25E\x13\x0f\xebSZ\
-#\x00\xcc\xd9\xfc\xd2\xb1\x84\x90Av\xe7'\xaew\xd9\
-\x19\xf3\x95\x9cY\x8dw\x8f\xfe\xa7?\x92\xb1\x81g\xd9\
-:#\xd4\xffQC\xdd\xde\x14\x88\xd2.[o\xc2z\
-LE\xe3\x05`m\xe7\x1b\xa2\xd5z\x88\x91K\xc7[\
-\x18\xd0\x13\xab\xbch\xec\xc4\xeb\xb4\xbf&\x0d\xa5<\x04\
-B\xb3ZqH\xb3\xdb\x08+C%V\xdd\xfeI\x94\
-'JyB`\xb6o\xce\xf8\x9bG\xd3i\xe1\x86o\
-\xa6\x81\x90r\xc0\x81L!,Bq\xdc\xd2\xfeb\x88\
-\x8e\xec\x14\xba\x13\xc7\xeb\xdf\xe9\xb8\x17\x89\xb7\xb0O\xc9\
-\x0c!\xb3\xab\xe8\xeb\xado\x1e\x96\xba\xf6\xaas\xb2\x82\
-\xd3\xa0\xba\xb4\xe2d\x12\xb7\xd3\xb4{\xc5/\x1f\xcf\xf8\
-$d\xc9\xee\xdc0\xf7\xd7\xa1H\xd9\x19|\x0b\xbb\xe8\
-\x13$\xa3\xf1ZD\x0cy>57\x1a\xf0\xe6\xd8\xf1\
-fW\xe3\xd5\x91\x14\xe2\x11k\x02\x8d6\x8d\xe5i0\
-\x98\xf1\xd7\x81\xa4\xd3\xc2\x9b\xbf\x98\xce\x09^\x18\xbf\xb8\
-\xf8\x1c\xc84Cq\xbc\x0d\xc5;\xf7=\x99\xe1\x8b-\
-\xaf\x1e\x194\xbb\x86wC{MA\xe3e\xce\x19\xb6\
-\xfa\xe2\xb5\xb3\x83\x7f\xe6\x9c\xca\x82ak2;\x03\xd9\
-\xb1\x1f;7\x8e\x9d\xbfu\xa7\x9d\xf9\x03nbf\xad\
-W\x11\x12\x98\x89\x17\x7f\x81\x88E\xf2\xd5L;\xa5\x14\
->B\x82\x99\x1cO7\x887\x15\x8dWG\xbc\x9a\xfd\
-\xad\xa4&\x0d\x95\xa0\x98O\xa0\x1a\xc2M\x83\xc6K\xd5\
-4o\xdfl\xfd~r2\x93\x9a\x0f\x16\xda\xfc\xf9\xee\
-\x9cd\x85\xf1\x0b\xf3\x9b\xcd8^Oy\xcd\x86\xc2\x91\
-}\xef\xcd\x07s\xea_:\x16\x90I4\x9a\x96\x9d\x22\
- \x12*w\xa2\xfc\xac\x97\x09\x97\xdfQ\xf2\xfaX;\
-\xf2vg\x8dwzE\xdf\xf9R\xed\xce5\x1b.$\
-\x84\x9c\xcc\xceW\x81\xf5\xec\x1a\xafeD\xcagN\x18\
-\xe2~\x9ai'\x84\xc0K<\xb9$\xde\xa2\x80E\xa8\
-\xd2\x15\x17\xe0Wd\x95xE\xa2\xd5\x11\xafJ\xc4\xdd\
-\xd4x\x05\xcd\xc6N\xacTH\xc7#^My\x8b\xb8\
-Y\xda\x1a\x7fi\xa4\xf5\x87\xb1)\xccmN-\xb4\xf1\
-\xe3\xbd\xac\xf1\xab\xc7\x0f\x0a\x99\xb2y\x97|\x80p|\
-\xc1\xb7\xb3\xfaR\x8d\xe3\xf5\xefrR\x9fq\x02\xcc\xda\
-\xc3\xcd\x15\xdfl\x9d}\x10\x00\x07\xe7'\xdf\xe1\x89\xce\
-8j\xcc\x89JW;\xb0\xfa\xe4\xb4\xbc]L\xf3v\
- \xb6\xd3\xb4sy\xdfx(\xce\xab[\xbf:\xb2\xa1\
-sB\x15\xb5\xceo\xc1\x88\xb8\x1e\x05\x92\x85\xe0d\xd9\
-\xc5\xceZ\x8f\x9c\x8c\x9d\xe2x\x8bIAF%\xb1\x04\
-\x8e\xb7 l\x11\xab\xb2x\xc4E#\x13\xacJ\xb8\x89\
-\xd2Ih\xbcjZ\x22X\x1d\xf1:\x11n\x92\xe5\x85\
-5/\xb6ov\xac\x1c\xd5\x8d9\xce\xba\x856\xcd\x99\
-i\x06[\xcb-\xe2\xb7\x91)\x84E*\x93)\xa4\xfd\
-E\xe2\x95\x8fG\x8aq\xbc\x0d%\xd3\xcfx8;\xa3\
-\xcf\x9e\xcd\xad\x7f\xe5(\x00\x83\x00\x99D9\xd9\x8a\xce\
-\x96_\x9c\xb2\x11\xc7;\xbd\xe2\xa4\xa7}\x86\xbf#\xa3\
-\x13\x90%{ic\xffc\x01\x9c\xacj\xb8\x00,B\
-\xb5\xa0I\xbcXI\x17\x7f\x99t%\xadW\xbd\xa5#\
-@1)\xc8\xe8\xdc%p\xbc\xfe\x0e;\xb1\x8aD\x9b\
-f\x8dWL\x0b$\x95\xf38^v\x91\x09\xb7\x96\xa5\
-6\xbd\xb9\xb1\xe0\xda\xd9\x07\x91\xd8/\xd6\xf2!\x8e\xb7\
-h\xf2\xd1\xafx\xcas\xf8\xc2\xcf\x0c\xd9'\x9b\x9f?\
-^G\xa2\xaa\xcc\x90\x838\xde\xa6\xbd+\xcf\xb9/\x93\
-c\xcf\x96\xfd\xdf\xda\xd9\x97t\x85\x06\x17\x01\xb0\x93*\
- \xacW\x81d\x95i\xd4\xc5\xf1\xf2z`\xdf\x9fR\
-\x14\x19\xc8%\xf1\xf6T\xe3u\x22`e\x7f8\xa4\xa5\
-\xdb\x07\x91X\x85|-\xf1\x8a\xe9x\xc4\x9bDy\xb1\
-\xfdHgF\xdf\xc3\x94.\x0b\xad\x9f}0\xe0D\xa6\
-\xe9\xd2xu$\xad\x1e/\x02\x0a\xdaX\xba\xc7\xb9\xf7\
-de\xe0Y\xb4\xf5\xedK\xc7\xfe\xd0\xfc\xc5t\x91D\
-\xf3%\x8ewt\xc9\xcc9\xc3\x8bw\xfe:\xed\x83\xce\
-\xb2\xad\xecZ3\xea\xcb-{\xec\x06BN\x16\x89\xd6\
-\xba\xe8\x03\x16\xf1&\x1d\xc7\xab\x901\xd5L;!\xe4\
-\xfe\x82\x0c\xbe\xe8\x12HE\xe3\x15\xae4\x9ch\x9d\x88\
-U$Z\x1d\xf1\x82\xa7\x19a\xb2\xfd\x91\xa4\xc6+\x92\
-\x9a\x95\xa1#\xd8x\xc4\xebP\x9e\x0ai\xe9\x8a\x1a\xce\
-\xe8\x833\xd2af\xfb\x86\x9ap\xc3\x82)\x00\x04\xa7\
-(\x92\xa9\xaa\xf1\x02\xd6\xbcK>@8\xbel?\xeb\
-FC\x7fg\xc2/\x8e\x9c\xa4}C&/\xec\x8b\xaf\
-\xf8ys\xfd\xfd\xe7\x00\xd4\x0a1\x8c\xaf\xf1F\xb7\x89\
-\xce\x98\xaf\xe4\xb4k\xbcM\x07T]\xfc\xefL\x8c9\
-\xdbv\xe7\xea\xe5\x17\x82\xe0d\x0b\x92\xc4\xf3\x1b\x80\xb5\
-\xde\x84\xf5\x98H\xe3\x054\xe4l\xbf\xd1@\x01A.\
-\xa3\x1a\xfc\x1dzb\x95\x17\x8d\x9dx\x9d\xf6\xd7\xa4\xa1\
-\x94\xb7n\x0bX\xbe@\xa8j\x9a\xddFX\x19*\xb1\
-\xea\xf6O\xa2<Q\xca3Y\xc2[\xda\x96\xfa\x14g\
-\xd7\xbaV\xbex\x1c\x08\xca\x19\x99F?4d\x0aa\
-\x91\x8a\xe3\x96\xf6\x17\xbf\x88\x90\x9dB\x92q\xbc\x0d%\
-}\x90v;\xc3\xad\xe5\x1foz\xee\x04\x11\x95\xf2%\
-\x8e\xb7\xb2`\xf8\x9a\xc9e\xbd\xffG*\xb3\x1a>8\
-fc\xdb\xf4j\x0e\x01\x0c\x1a\x14/I\x85\xf3S\xc9\
-\xd7\xc6\xf1\x0a\xe7=\xc0\xd3\x96Q\xc0 \x11\x13\x19\xb6\
-\x84?H&\xc4\x1bv\xe3xcn\xca[\xd6\x9a\xe2\
-\xfcf\xdd\xbaV\xbcx\xbcu\xb7e\x11\xbc0~q\
-\xd1\x09W\x97L\xc4\xf1\x1a\xfe\x01\x8d\xfei'?\x99\
-\xad\xb1g\xcb>\xd8\xf8\xd4/\xba\x22\x9du*y\xb2\
-\xb4,3\xa4C\xe3e\xf5\xc3V\x9f\xd2N\xd3!\x83\
-~w{\x06\x87\x9e\x15\xdb\x12j\x1c\xf4\xe2\xba\xb1\xc7\
-\x038\xd9Z\x8fPH\x95\xed,\xdd\x91\xf2\xfc\xa8\x09\
-pE\x08LS\xd1zYE\xca\xb4{H(\xa32\
-\x03\x90\x84\xe3\xa5(\xe9p\xe3xc'\x81o@c\
-\xe2)\xcd\x9d\x99\xad\xab\xeb\xc2[\xbe\x9afm\xb0H\
-V\x18\xbf0\xbf\x99\x8e\xe3-\xdb\xe7\x92^\xef\x04t\
-\xf6\xd6\xfa\x87~\x15\xfdK\xa7\xb5\xb2\xb4\xec\x14\x01\x91\
-P\x85;\x11\xeb\xac\x97\x09\x97\xdfQ\xf2\xfaX;\xfa\
-v)\xfc\xde\x8a\xa6\x99\xfdO\x7f8\xed\x03\xce\xb2\xdd\
-\xb4|\xd9U\xe1Hy\xf4g\xc1\x1a\xa2\x95|\xa54\
-\xcf\x1c*\xa2F\xe4|\x08\xf3\xc5\xf6\xd3L{\xa1\x11\
-\xca\xa8\xcc\x00$C\xbc\xa8hr\xe3x)@H\x9b\
-Q\x9a\xdfo\xc5\xedZ\xf1\xc2q@\xf4g\xc2\x00\xf8\
-\xf8\xd5\xe3\x07(\xf3\x9aH\xe3\xe5\xdb\xa5\xc5\xab\x90\xb4\
-\xb5\x03(<e\x83\x17\xf9\xa7\xff\xea\xe1L\x8f9\xdb\
-\xf6\xed\xd6\xf7\x0f\xd8\xdc\xb9r\x94N.\xc8u\x1c\xef\
-\xfe\x03~}W\x06\x86\x9cU{\xb1\xfe\xab\xe36\xb5\
-O\xac\xb6E\x1d\x08D\xab\xde($\xa5\xf1Z\xd5\xc8\
-d\xac\x8b\xe3-6B\x19\x0f\xc3K\xe2\xd9g\x837\
-\xb9q\xbc\xd1\xfd\xbd\x95{\xe4\xf5/\xaf\x02K\x1f=\
-\x9d\xfd\xcd\xc9T\x99?~M\x12\xee$\x12i\xbcV\
-\x8d\xf2\xe2\x95H\x9a\xf7\x83\x804\x94\xee}\xc9\x1d}\
-\xed\xb9\x0c\x00\xf0\xe6\xba\x07\x7f\x05D\x1f\x88#\xa2R\
-\x1e\xc4\xf16\xed3\xe0\x9c{35\xeel\xd8\xe6`\
-s\xf5K\xeb\x86\x1eK\x80_\xe8\xa2\x0ez\x16\xc7\xcb\
->\xf9y\x1f\xad\x9f\x0a\xd3\x1e\xdd\xbf\xdccf\x5cR\
-L\xecx\xc9\xb0un\x1c/\x05\xf1\x18\x19\x17\xdc{\
-b\xa1\xf5\xef\x1e\x14i]U\xc7\xd2\xf1\xc8\x94\x8d/\
-Sq\xbcF\xd9\xa0\xfa\x92\x19\xbd\xdb\x09\xe8lk`\
-CM\xf4\x97j\xe2\xfa\x8d\xfe\x95\xeb8\xde}\xaa\xce\
-\xbe\xdf\xef\xa9h\xca\xcc\xc8\xb3c7-[qU\xc4\
-,=\xd5\x82\x05\x80S\x02\x18\xb9\x0a\xa4\x1a\xcbO&\
-\x8e\x17\x80\x00u\x80\x8d\xa8\x85\xfd+<\xa4)Sc\
-d\x96\xd8\xf1\xd2Q+\xdc8^\x02RX\xde\x92p\
-\xaerh\x9d\x8b\xee9\x8f\x00\xe5\xea\xedj\x0e\xe2x\
-\x1b\xcb\xf6\xfd\xfdm\x19\x1fp\x0e\xec\xb5\xb5\xf7\x9c\x07\
-\xd0j'\x12\xcda\x1co\xd3O\x06]~k\xba\xc7\
-\x9bM{n\xd3w?\xaf\xef\x183\x08\x10\xbe\xb8\x05\
-\xac\xf3P$Z\xeb\xa2\x1f\xcbO\x14\xc7\x1b\xfd\xd0k\
-\xbcT3\xed\x03\x0b\x0a\xea3:X$E\xbc\x13\x16\
-\xbbq\xbc\x14F\xe9\xb0u\xc9Mi\xf6-\xd2\xbar\
-Th\xdd\xdb\x87\x88d\x0a@\x22\x05g\x8d\x17\xe0\x8b\
-\xddJZ(\x90j\x1c\xaf\xb7\xff\xf05\xfe\xdd~\xf5\
-`\x06\x87\x9b\x13k\x0d5V\xce^\xff\xe8i\xe2\xba\
-\xd7_\xe4X\x9aC\x86\xce\x19\xf3\x95\xdcs\x8d\xf7\x80\
-\xaa\x0b\xffS\xe6\x1d\x94qg\x91)[\x17h\xad}\
-y\xfd\xa0\xa3)\xa5\xbf\x00\x04\xf8\x018\xf1j5^\
-\x01&\xe2i\xbc&/\x17_\xe3\x8d\xb6W\xeb-\xcf\
-\xf8\xb9\x9e\x84\xc6\xbb\xd3|7\x8e\x97\xc0\xd3?\x7f\x7f\
-\x09\x14X|\xef9\x94\xd2r\x1d\x99F?4d\x0a\
-a\x91&\xd4x\xe38\x19Y\xe3m,?\xf4\xaf\xd7\
-dv\xb4\xb9\xb1WV\xff\xf7\xd7A3Pgw\x96\
-Q\xcbU\x1c\xaf\x8f\xf87\x1c\xda\xcbC\xc8n\x5c\xba\
-\xf6\xea\x88\xe9?Y\x22Z\x96iA\x00\x83\x06\xc5K\
-R\xbe^u\x1a/5ERN\xa4\xf1\x02\xa0\xb8\x7f\
-\xb8\x0f\x19\x7f\x94f\x12\x8ew\xda\xd7n\x1c/m\xf3\
-U\x1f\xf9ZjS\x9b\x1d\xa3\xc1\xe6\x8a\xc0\x0f\x0f\x9d\
-\xa9\x8b>\xe0\x04/\x8c_\x5ct\xc2\xd5%\x1dq\xbc\
-\x05Cw\x99W4\xa1\xef\xbd\xba\xbd=\xdcR\xfe\xe6\
-\xba\x07\xce\x8a\xa6\xe4\xb34;\x1a/\xab\x1f\xb6\xfa\x0e\
-\x1e\xf4\xdb;\xfc\x9e\xfey\x1d\xe6\x18\xcf\xfeo\xe5\x97\
-\x974\x05j+\x00\x06A\x82\x8c\x05\xf0\xf5\x08\xc8\xa4\
-\xca*\xb0\xd6\xabL\xb2Q\x93\xcb\xe94^\xdd\xb4W\
-\x17 \xe3\xcf\x15I\xea\x8dn\x84x\xc3\xd2 l\x84\
-\xeb\x94\xd6\x11\xaff\x7f\xde\x90=\x0d6I\x22\xb1Z\
-\x15' \xdenh\xbcTMG\xfb\xef\x1d\xf4\x93\xd7\
-\x93\x99\xabl[\xe7\xc2\x7f\xfd\x06\x91\xc0 ~{&\
-\xac\x22\x22.6\xe1\xb6\x8ce\x0b\xab.\x0dq\xbc\x8d\
-\xfd\x8e\xbc\xed\xb2\xcc\x8e67\xf6\xbf\xd5\xff\xfdu0\
-\x12\xa8\x8b\xa6\xe4\xb349\x8dW\x86\x8eti\xbc%\
-\xde\xfe+\x0e\x1cx\xe1\x7f\xd29\xd6l\xda\x97\xcd\xab\
-\xa7\xcf\xad\x1f\xb7\x07\x08\xf9\x05\xc0\xd7\xa3\xaa\xf1v;\
-\x8e\x97\x0a\xf9\xac\x9cJ\xc6\xca\xb4{\x10\xca\xca\x97\xe8\
-I9^J\x8b\x02\x12\xee\x0bH\xb8=\xc4\xf1\x92\x92\
-\x81y\xa9\x9f\xd1p{i`\xf1\xdd\xe7\xf1y\x03\xec\
-d\xca\x89\x00\xe0\xf3-\xcfk\x22\x8d\x97o\x97\x16\xaf\
-@\xd2\xfe\x9dO~\xb2\xa0z\xf2\xc2\x8c\x0f:\xcb\xd6\
-\x1en)\x7f}\xed\xfd\xe7\xf0-|^D'\x9c\x83\
-8\xde\xa6\x9f\x0c\xbe\xfc\xd6\xde\xfa\xe8\xc7\xd60-\xff\
-\xf7\x8f\xf4bB\xc8\xcf-\x1f\xc8.*\x105X(\
-P$\xfa\x0bp\x98\xd0h\xbc\xa6\x04\x1b\xc9h\xbc\x14\
-~O\xe6cx\x81\xa4\x89wp=\x94\xc5#.\x1a\
-\x99`U\xc2M\x94NB\xe3u\xd2|\x09\xbb=\x01\
-?8\xec\xa09j\xbaI\x94\x17\xd6<\x05P0x\
-\xdf\x8fR\x9a\xd5,Y`\xf1]\xe7\xd3P[\x8d\x8d\
-L!\x92\xa92\x7f\xfc\x9a$\xdcI$\xd2x\xad\x1a\
-\xe5\xc5\xcbH\xc4W\xbc\xae\xfc\xa0k\xaf\xcb\xca\xa0\xb3\
-l\xaf\xae\xbe\xfb\xfc\xaeH\x87\xf0\x1cf\xd5Y\xc6\xb6\
-\xa6\xac\xf1r\xebN\x1co\x95o\xe4\x8a\xfd\xab\xce\xbf\
-;\xcd\xc3\xcd\x9a\xfdy\xc9\xb7\xd7\x05\xcd\xcaSE\x8d\
-U&Z\xbe^\xd5|\xc94Dlm\x87J\xca\x89\
-4^\x82A\x05\xe1\xcd\x99\x1c7\xb3$_\x1e?i\
-!'T\x91h\xd3\xac\xf1\x8aiQ\x93\x145J0\
-b\x85@\xb8\xd0\xa4\x9d\x08WL'\xd0x\xa3\x1fm\
-\x85u\xbf\xbe3\xe9\x19\xcd\x92\xd1PKy\xe7\xc2\x7f\
-\xfd\x16\xc2\xc9,.I'2\xb5.\xf0\xd6\xe2\x13\xc8\
-\x9f%\xe3h\xbc\xd1\xcd\x12I7\x96\xed{\xe5\xcd\x86\
-\x7f@C\x96\x86\x9e5k\x0f\xb7\x94\xbf\xb6\xe6\xbes\
-`\x9f\xd9\xd8\xdf\xd9\xd2xm\xed4\xfdl\xe8\xdf\xae\
-N\xeb`\xb3h\x8f\xad\xfb\xf6\xb4\x8d\xed\xa3j\xd8z\
-\x14\x89W\xa7\xf1rhPH5\x96\xaf\x8b\xe3\xa5\xb1\
-\xff\xc9\xa4l\xd7x\x95\x1b\x0b\x8c)\xf4/\xcb\xf8\x04\
- Y\xc7K\xf6\xfb\xd0\x91P\x13\xa6u\xc4\xab\xec\x0f\
-\x87\xb4t\xfb \x12\xab\x90\xaf%^1\x1d\x8fx\x13\
-\x97'\x85\xfe\x0eO\xc5\xae\xf3\x92\x9a\xa7,Z\xe7w\
-\xff\xbc\x0c\xa1\x96Z\xf1d\x16\xc9\x14\xb0\x93)\xbf\xed\
-\x8a\xe5\x0b'{w\xe3x\xbdU\xe3\x96\x94\xec\xd1{\
-u\xc6x\xf6\xc6\x9a\xfb\xcf\x0eD\xdaF\x8b$*\xaf\
-\xc0d5\xde\xd8\xde\x84\xef\x17M\xcbN\x5c\xd7\x8eN\
-\xe3\x1dS:s\xce\xe4\xf2C{\xe5\x13\xc8~h\xdf\
-<\xfe\xb5u#\x8f\xa0\x94\xfe\x1c\xb0\x13-D2\x05\
-\xac\xf3\xd0\xa6\xf1*\x1a\xb0M\xe3\x15\x9cp<\x8dW\
-\xb9q\xb9\x7frqAV\xe4\xb2$\x1d\xefQ\xafp\
-bM\xa4\xf1\xca\x1a\x96\x9ex\xc1\xd3\x8c0\xd9\xfeH\
-R\xe3\x15I\xcd\xca\xd0\x11l<\xe2u(Oy:\
-\x1fe\x063\xb0eP`\xc9]\xe7sgi'S\
-\x00\x12)8k\xbc\x00_\xecV\xd2B\x81\x04q\xbc\
-\x8d\x15\xc7\xdc}AF\x07\x9b#\xeb\x0c\xb7\x95\xbe\xba\
-\xe6\xde\xf3DB\x8d\x1a\x9f\x17\xfdE\x8e\xa59d\xe8\
-\x9c1_\xc9)k\xbc\x8d'\xd6\xdezy\xba\xc7\x9b\
-\x0d\xeb\x88P\xff\xdf\x16\xb7]EA\x7f.~\xe1(\
-\x12/ \xc0\x0f\xc0\x89W\xab\xf1\x0a0!@\x9aX\
-\x0f\x87\x8dd4^`\x5c\x11\xb2\xf2<\x96$\xa5\x86\
-\x1d\x96\x01\xd1\x9f\xcc\xca\x04\xebD\xbc*\xe1\xc6IC\
-)o\xdd\x0e\xb0|\x81P\xd5t\xec\x0a\xe7L\xac\xba\
-\xfd\x93(\xcf\x87\xd7V8\xf6\xaa\x9bR\x9a\xd1,X\
-\xe7\xfc\xeb\xaf\xa1\xe1\xc0 > g2\x8d~\x08\xf3\
-'\x5clz\x1a\xc7[\xb2\xdb9\xf7\x16T\xef\xb8 \
-\xe3\x03\xce\x81=\xbb\xfc\x1f\x97w\x84[\xc6r'\xcb\
-Lu\x96\xb1\xad)k\xbc:'k\xafON\x03{\
-\x0d8\xed\xd1\x9a\xa2\x09\x8b\xd2>\xe0,\xd8\xd5\x8b\xbe\
-\xbd1\x10\x1ap\x9a\xa4\xb5*\xc4\xdb\xe38^\xe1\x22\
-\xc9\xdaIV\xe3-0\x82\x19\x7f\x1c$\xb3$\x1d/\
-@H\xf4\x9b\xfd\x8cj\xbc\xe2\xedZ:4\xda\x1e\x96\
-7\xfc\x03\x1a=\xe5\xf9\xf5\xc3\x89H\xf3\xe2\x89\x81\x1f\
-\x1f9\x8d\x93\x00\xc0\xc94f\xd6fq\xb1\xb1E*\
-,:\xe1\xea\x94j\x1c\xaf\xa7\xacfa\xd9\xfe\x7f\xba\
-1+\x83\xce\xb2m\xeaXU\xf7\xea\x9a{\xcf\x15\xef\
-\xec\xb8\xc9N8;\x1ao\xb4>\x9fQ\xbc\xe1\xa8!\
-W\xf7\xca9\xff\xd7\xf2\xf9\xbf\xd9\xd0VW#\xc3\x15\
-#^\x01\xc2\x042\x05\xc0\xd7#8\xb9\xc66\xcb\xf9\
-\xcc\xe9R\xca\xf7\x870\xffj\xbb\xe0\xf5\xb3i/\xf3\
-\x04\xb2\xf6X\x80\xa4\x1d/\xc5\x98e\x00\xbf\x92G-\
-\x91\xc6\xab#^\xcd\xfeVR\x93\x06\x9b$\x91X\xad\
-\x8a\x13\x10o74^j\xa5\xdb|#Ny<\xd9\
-\xf9\xc9\x96\xb5}z\xfe]\x84\xa0\x1c\xd6\xc9\x0d\xc8\xb7\
-g\xc2\xc9K\xc4\xc5&\xdev\xc5\xb2\x85U\x97\xa2\xc6\
-\xdbX~\xd8-W\x10_I\xde\xbf\x91\xa3;\xf6\xf0\
-\xd2\xbf\x5c\x07\xa0\x9a\xf0\x85!\xe4\xca\xce19\x8dW\
-\x86\x8enj\xbc\x8dG\x0c\xf9\xc3\xcd\xa5\xde\xaa^\xf7\
-%\xe6\xdb\xf5?\x1e\xf2\xc9\xe6\xba\xbd\x01\xf2s\x80\x93\
-(\xc0\x88\x979\xd3\xd8\xc5F\xc8\xb7\x11\xad\x86\x88E\
-\xd2\xe5\xfe\x86\x9d\xe7\x0aI+\x1a\xaf8\xed5>\xba\
-1\xa3\x13!X\x0a\xc4\x1b}$\xe2\xf6\x12\xc7K<\
-\x86Y4\xee\xc6\xbc\xfa\xe6\xb8\xf3\xfb\xdb~\x1fi\x9c\
-?U$S\xeb\xf6\x95\x8dC!S\xb6\xd8\x9c5^\
-q\xb1\xb3r`(\xa2%\xe9\xe2\x1d\x7f\xf1t\xd1\xd8\
-\xfc\xfcAIOm\xd1\xb6\xb93\xe6\xd5\xbf}\x08\xdf\
-\x92\x0e\x8dWv\x0a\xdd\x89\xe3\xad)\x1e\xb7\xf4\x90A\
-\xbf\xf9W\xfaF\x9a\x1d[\xd1\xbem\xd4\x83\xcb\xcb\xce\
-\x02p\x82x\x9b/]|\x84\x8b\x17\x87\x08~\xb1\x92\
-\xa1H\xf4\x17\x10\xce\x03\x02j\xf2\xf3\x1e\x80\xe5\x07\x92\
-\xd5x'\x14VdM\xc2I\xda\xf1\x82\x1c\xfe\x06\xa0\
-\x12\xac\x8exU\xc2M\x94NB\xe3u\xd2|\xd9A\
-\xe4;\xf2\x83\xe6\xa8\xe9&Q\x9e\x00\xde\xea\xfc\xfaR\
--\xd2\xfc\xc3\xf8\xceo\xffz\x0d\x05-\x17\x17\xa3\x96\
-L\xc1/N\xb6\xf9\x13\xd6fw\xe2x=\x15\xc3\xe7\
-\x97\x1fzK\xaf\xfcr'\x19\xbbw\xd1\x957\x13B\
-\xaa\xf9\x96Li\xbc\xdc\x92\x88\xe3m\xfcU\xdd=\xe7\
-\xa5q\x98Y\xb1\x8e\x08\xf5_\xf7\xfd\xe6kMZ\x14\
-%]Q\xde\x13\xee\xc0 \xac\xbb\xee\xc6\xf1R\xd3\xb4\
-\xd2\x12A'\xaf\xf1>8\xc5\x8f\xac}_\x91\x82\xe3\
-\xdd\xf7\x03@\xbe\x82\xeb\x89\xb7\x07\x1a\xaf\x98\x165I\
-Q\xa3\x04\xbf\x92\xc5\xd7h\x9d\x08WL;\x96o+\
-\x9e|\xc7oS\x99\xc8L[\xdb\x9c\xb3\x1e\x00\xa5\xe5\
-j\xd4\x05\x84\x93\xd9\xc6e\x82\xc6(k\xbc\x10\x16\x9f\
-@\xfe\x02I\xdb\xeb%\x00\xd0Xq\xf4\x03g\x91\x82\
-\xde\xf9k\xa9D\xf6\xf6\xda\xc7N[\xd7\xbet\xac\xac\
-\xc1\xca\xe4)\xa7\xb3\xa3\xf1\x1e2\xf8\xa2\xff\x0c+\xee\
-}_b^\xbd\xf0\xeb\x1b;C\xd5\xa7I\xb7L\x12\
-\x5c\x09D\x0b;\x99\x02\x90\x09V%\xd5X~T\xdb\
-\x85\x9c\x06?\xcf\x93\x89\xe3%\xa0f6\x9e\xd1\xc0,\
-y\xc7\x0b\x80\x90~M\xdbC\x1coA\xd5\xe4\x85F\
-\xf1\xc8\x15\xa9\xccM&\xads\xfe5\xd7G\xb6-\x98\
-\x22\x91\xa9@R:2\x05\xe4\x93?\x0d\x1aoc\xd9\
->W\xdfXP3-\xaf\xbelL\x97u\x86\xdbJ\
-\x9fXv\xd3U\xb0\xb4]N\xa8\x22\x89\xca\xe9d5\
-^^_\xaa\x1aoe\xc1\xb0\x05?\x1dre\xdeE\
-\xd6$\xb2[\x97~\xf5\x87u\xad\xa3j-H\x02`\
-\xc1\x97z\xf1Q/^B>\xbf\xb3S4^1_\
-\xf0\xbb\xec\xbc`\xf5X\xe7\x89PN\x17\xc7\xeb\xf7t\
-d\x15&Rr\xbc\x14\xe3\x96n\x07q\xbcm\xc5;\
-\xe6\xcfm]h\xf3\x07\xfbu.\xbe\xe3\x12\x80\x94\x8a\
-dJ\x88\xe8,\x9d\xa3\x0f\xa2\x1f\xfcj\xd7\xdd8\xde\
-\x82\x9a]\xbe.\x99\xf9\xbb\x7ff|\xc09\xb2\xe7\x96\
-\xdf\xfe\xbb\xb6`\xd3x\xc0N\xa29\x8c\xe3m<s\
-\xe4\xdd\xe7\x15\x18E\xbd\xea\x15JO\xad]p\xf2\x17\
-\xf5\xa3v\x03p\x02s~\x00\xbf\x93\x925^\xc8\xf9\
-\x10`\x08\x10\xee\xect\x1ao\xac>\x93Ji\x0b\x1a\
-X~\x12\x1a\xef\x0eE\x91\xe5\x99\x9b\x11\xbb\xa5F\xbc\
-\xc61/%\xd6x\xe5E\x99P\xe3\x85R\xde\xba\x1d\
-`\xf9\x02\xa1\xaaiv\x10\xad\x0c\x95`u\xfb\xc7/\
-\xef\xe9?v\xa9Q6%/n\xebh\xd7\xd6\xaa\xf6\
-\xcf\xce\xb9\x8f\x80\x94\xaa\xf3e]\xbc\xd8\xb8\xa9\xbcX\
-\xa3\xd9\xe2\xe2\x12\xe6\x9f-B\x8e\x1a\xd2qP5^\
-\xa3\xa8\xff\x8a\x8ac\x1e9=\x1bc\xce\x85\xado_\
-6z\xd6\xca\xbb.\x90I\x94Y\xa64^\x9b\x93\xb5\
-\xd5\xb7\xcf\xc03\x1e\x1e]:cn\xba\xc7\x9bI{\
-\xaf~\xd9\x01/\xae\x1av,\xa5\xf4\x04.\x13F\xf3\
-\xf4\x1a/\xa4\xfcT\xe3xi\xc4\x84m\xe1\xb3\xfa\x04\
-\x7f\x94@\xe3}p\xef\xd2\x8aO24%ZK\xc9\
-\xf1\xc28\xf7\xde\x8cj\xbc\xe2\xedZ\xcf4Z\xeb\xca\
-\x97Ry\xd0\x0e\xff\xce\x8f\xff2\xa59\xc9\xa0\xb5\xcd\
-=\xe7>\x1a\xd8<Z\x1b}`\x91\x00\xc0\xc94f\
-\xd6fq\xb1\xb1\xdb.a\xd1\x09W\xa78\x1aoc\
-\xbf\xa3\xee?\xc7S6dCV\x07\x9fE\xbbm\xfe\
-\xf9\xf7\x10B\xaa\xb9\xf3\x14nC\x15\x12\x95\xee(\xd4\
-\x8b\x15Tg\xdb}\x8d\xb7\xbc`\xe0\xd2\x13j\xffz\
-mZ\x07\x9aa\xfb\xbee\xcb\xe4\xbb\x97\x96\x5c@A\
-O\x90.6\xb2\x17\x15\xe0\x8a\xe5\x0bP!\x90)\x00\
-\xbe\x1e\xc1\xc95\xb6\x19\x94\xc6V\xb2rxR\x8f\xe3\
-\xa5\xd8\xb9\x04Y\x95\xd0Rs\xbc\xa8l\xa4\xe8\xd7\x94\
-\xbc\xc6\xab#^\xcd\xfeVR\x93\x06\x9b$\x91X\xad\
-\x8a\x13\x10oJ\x1aoG\xc1\xd0\x83\xdf6J\xf2\xe3\
-WA\x9d\x8bn\xf9Cx\xd3\xbb\x07H'\x7f<\x8d\
-\xd7\xba=\x13V!\x11\x17\x9bx\xdb\x15\xcb\x16Nv\
-\x07\x8d\xb7\xb1d\x8f\xdf\xdfVX\xb7\xff{Y\x18r\
-N\xec\xb9\xe5\xffw\xc9\xea\xb6\xc5\xe3E\x12M\xac\xf1\
-2KV\xe3\x95\xa1#\x09\x8d\xb7\xf1\xf4\xba\x7f_\x5c\
-h\xf4\x9e8\xe9\x0d\x9dm57|\xd7v\xb5i\x16\
-\x9e \x93%d\x22\x05'Q\x80\x11/\xdf\xce\xe1\x82\
-M\xa4@\xca\x0a\x11S\x93j\x0fO\xaaq\xbc\xe5\x05\
-\x1dY\x7f\x9fb\x8a\x8e\x17 \xc6\xae\xf3\xe2k\xbc\x22\
-\xd1\xea\x88W%\xe2nj\xbc\xce\x1a-\xba\x13\xc7K\
-\x0a\x0a\x82\xfe\xa9/\x1d\x9b\xea|d\xc2B\x9b\xdf?\
- \xb0\xf0\x86k\x00Z.\x5cE\xb4dj\xdd\xbe\xb2\
-y\x10W!\xe5\x8b\xcdY\xe3UH\xdaj\x8e\xc07\
-b\xdf\x8fJ\xf7\xba\xeaoY\x18rNlU\xeb\xe2\
-\x89O\xfdx\xeb\xe5\x94\xa2Fv\xa2\xe2^\xe9\xd0x\
-\xb9\x93I&\x8ew\xbf\x81g>\xb8c\xbf\x83\xdfN\
-\xf7x3emaZz\xe5\xfc57\x87\x22\xe5\xbf\
-`\xb7\xf1\x12Y\x0a\x17')\x1f\xb0\xf6\xb3\xf2-\x88\
-\xe0\x17+\x0b\xa2\x84;T\xa6\xeb\x8a\xe5\xf9\x09.\xdc\
-\xd1Y\xb0\xe1\xac\xf1\x8e-\x22?dx\x8al\xd6\x0d\
-\xc7\xfb\xf3\xe7\x08!\xa6\xb8hd\x82U\x097Q:\
-\x09\x8d\xd7I\xf3e\x07\x91\xef\xc8\x0f\x9a\xa3\xa6\xab-\
-\xdfQ4\xe1\xfa\xbcxW\x98\xd9\xb9\xb1\xa6}\xee\x19\
-\x0fQ\x8aR\xb6M&~*-Fv\xd5Iw\x1c\
-\xafQ<`Y\xbf\x9f\xb2\xd7\xdd\xf4M\xbbm\xfe\xf9\
-wQ\x8a\x1a\xae\xbdF\xb7gG\xe3\xe5&j\xbcC\
-\x8a\xc7\xcd\xf9\xd9\xb0\xfcX\x8b\xc9\xdae\xdf|{[\
-{p\xf0\xa9\x22\x1c\x80\x0a\x10&\xce\xabM\xe3\x95\xf3\
-\x93\x8a\xe3\xa5\xe2\xc5\x8c\x0a\x87\x81\xf0\xf3\x02b?\xe2\
-j\xbc\x0f\xee_V\xfaA\xa6\xe7H\xb5\x94\x1d/\x8c\
-s\xee\x95\x085\x9d\x1a\xaf\x98\x165IQ\xa3\x04\xbf\
-\x92\xc5\xd7x\x9d\x08WLG\xf77\xcaG\xac\xf2\x0d\
-\xbb(\xe7\x8f6\xa4\x91N\x7f\xfb\xa7?\x7f\x86\x06\xb7\
-\x0dg>U\x22Sk\xd1\xc2\x1a/\xbb\xea\xa49\x8e\
-\xb7\xa9\xe2\x98\xc7O1\x8az\xef\xbb\xbc\x12\xd9\x13K\
-o\xber]\xdb\xb2\xd1z\xedU8\xe9\x05\x12\x8d\x9a\
-\x98N\xaf\xc6\xeb3\x8a\xd6]4\xe6\xf1_\x16\x18\x85\
-\xbd&\x8a\xe1w_\x7f}{C\xfb\xb0\xaa\xe84\x88\
-\xa4)@\x98H\xa4\x12\x5c\x09D\x0b;\x99\x02\x90\x09\
-6\x96o\x9a\xa6\x9d\x88\x99\x89w\x18V?\x9c5^\
-B\x80q\xc5\xd9y\x22\x99h\xa9;^\x00\x84\xb0W\
-I'\xd2x\x9d\x08X\xd9\x1f\x0eiv\xf0$\xe2\x83\
-\x9c\xaf%^1\x1d\x8fx\x09`\x18m\xfe]g\x1f\
-\xdc\x9dyH\xb7\xb5\x7fv\xca\x13\xe1m\xf3\xf7\x028\
-\x91&\xad\xf1Z\xf3\xc6Wa7\xe3x\x9b\xfa\xfd\xf4\
-\xa1_\x15\xd4L\xff\x22;\xa3\xce\xbe-o^0\xe5\
-\xb9e\xff\xba\x98\x10R\xa3#\xd1\xc4\x1a/\x9f\xc1\xe4\
-4^^_\x1c\x8d\xb7\xf1\x94\x11\xb7\x5c1\xa80\x7f\
-\xe2\xc7\x13\xd9U\xdf~u\xd3\xaa\x96\xe1u\x84\xe0\xb8\
-\xe8(\xf8\xb8d\xe7\xc7Jp\x12\xedn\x1co\xd4\xe9\
-\xea\x89\x98\xed\x9fJ\x1co\x85\xb7\xbd)\xbd\xb3\x92\x9c\
-u\xcb\xf1\x82\xec1\x979\x83^\x1e\xc7\xdbQ<\xe5\
-\xae\x0b\x8c\xc2\xdc\x7fc\xdf\xf1\xf5Ew\x866\xbds\
-\x90H\xa6V\x875dJ\x88\xe8,E\xe2\x15V\xa1\
-t;&\x9c\x14\x80\xb4x\xf9bGS\xd9\x01\xb7\x5c\
-^4\xf6\xe8YY\x18rN,\x18\x09\x14\xdd6\xff\
-\xc2;\xa3N79\x12\xcdF\x1c\xef\xee\x03Nx~\
-f\xd5IOff\xd4\xe9\xb7?/\x98\x7f\xfd\x0f\x8d\
-#\xc6\x13\x90c\xc4\xf3\xdf\xba\xb8K\xb7\xfb\xb1\x5c\xad\
-\xc6\x0b9\x1f\x02<E+\xb0&\x92R\x0aP\xe1F\
-\x0f\x1a\xa2\xb6\xea\xe3\xdf\xf5\xc4\xd3x'\xfa}\xdfg\
-`z\x12Z\xf7\x88\xd7s\xeac\xe2\xa2\xb1\x13\xafJ\
-\xb8q\xd2P\xca[\xb7\x03,_ T5\xcd\x0e\xa2\
-\x95\xa1\x12\xafn\x7f+\xddQ0d\xff\xf7\x0a\xaas\
-\xff\x04\xb2\xae\x1f\xff\xf5\x9b\xae\x95\x8f\x9cF\x08)\xe5\
-d\xca\xf3udj]\xbc\xd8\xb8\xa9\xbcX\xa3\xd9\x02\
-YI\x1a\xaf\x18-\x026oM%\xbb\xfd\xf6_\xfe\
-\xa9g\xdf\x9f\xe9\xf1\xe6\xd2\xfe\xf3\xdd\xefo\xdb\xd8\xb1\
-r/\x91P\xf5$\xca,S\x1a/?\xc0\x03\x8bF\
-|}\xfa\xc8\xdb/\xcd\xd8\xa0\xd3l7/\xfa\xf6\xca\
-\x85\x0dC'\x13B\x8e\xb1\x11\xad\x05\x07\xc9j\xbc\x90\
-\xf2\xe3\xc5\xf1R\x93\x0a\xce;\x96\xad\xd5xYJ\x90\
-{\xa0\xb4\x1b\xad\xe1\xc1}\xcb\x0as\xf2L\x96\xee\x11\
-\xafq\xdc\x8b \x86\xe9L\xbc\x80L\xb8*\xf1R\xcd\
-\xfe\xe0\xe4f\xdd^\xd8\x08UI\xc7\xd3x\x11\xb7<\
-),\xe9(\x9e\xf2\xbf\x9fvk\xfci\xb4\xe0\x9a\xa7\
-N\xee\xfc\xee\xea\x1b\x09P*\x93)_CY\x88\xe3\
-m*\x9ep\xd2\xd3\xa5{]{m\x16\x87\x9eu{\
-}\xf5#g|\xb4a\xd61\xaa\x0c\xa0\x92h\x96\xe3\
-x\x1b.\x1c\xf3\xe8\xe9>\xa3\xb8W<\xff\xe2_?\
-\xcc\xff\xcd\xdcM5\xbb\x83\x90c,r\xb4\xf9>\xf9\
-\xa2\xa6xQ\x01\xaeX\xbe\x00\x15\x02\x99Z\xf5Qj\
-\xfd\xd3\xc7\xe1\x0a\x1d\x14\xfcK\xa28^\x83D\xcc\x1d\
-\x8aHV\xde\xb1\xa6Z\xf7\x1c/\x00\x90ak\x9c\x89\
-\x97\xeff'^\xcd\xfeVR\x93\x86@|\xe2\x05\x8d\
-\xdd~\xc4%^\x07\x8d\xd7 \x1d\xfe\x9d\x9e\xfbY\xb7\
-\xc7\x9e&\x0b\xae}\xfa\x17\xed_\x9d{\x0f\x08)\xb5\
-\x16\x9bJ\xa6\xd2U$\x8e\xc6k\xdd\x9e\x89\xa8\xac\xdc\
-AX\xb7]\xb1\xecX\xbd\xbe\xba\x03g\x97\x1f\xfa\xdf\
->\xf9\x0a\x1ffK\x9b\xbe\x99v\xef\xf7\x7f\xba\x9eR\
-Z\x03@p\x8av\x12M\xac\xf12KV\xe3\x95\xa1\
-C \xeb\x86\x93\xebn\xbaj\x98\x7fRV\xde\xf3\xd5\
-S{`\xf9wg\xbf\xbfn\xe8\xfe\x84\x90c\xc0.\
-&\xecb\xc3v\x12\x88\x97\xdfy\xb1\xcc\xd8\xb8\xd5\x8b\
-\x8f(K\x88d\xca\xea#\x04f$\xa6\xed\x0a\xed\xb2\
-|\xf5\xf0$\x1b\xc7;\xb4\xb0-g\x12c\xb7\x1d\xaf\
-\xe19\xe5I=\xf1\x8aD\xab#^\x95\x88\xbb\xa9\xf1\
-\x0aW.;\xf1R!\xad\x10/AG\xd1\xe4\xbb.\
-\xf0TD\x9f\xb6\x96+\x0b\xae{\xe6\x17\x1d_\x9ds\
-\x1f#]]4\x87\x80\xae\x90o\xe3\xc0\x9d(s\x1a\
-l\x1e\xc4UH\xf9bs\xd2x\x0b\x86\xee\xf9z\xbf\
-#\xf3\xe7\xd7z\x99\xb0\xd6PS\xc5M\xf3\xce\xb9\x8f\
-RZ\xcb\x9d\xab\x8eD\xa3\xfb\xa7_\xe3\x15.\xa6\x16\
-Y\xa3aF\xd5\x09\xcf\x1f8\xb8wH;\x8f\xaf\xfc\
-\xfe\xd4WW\x0d>\x02\x04\xc7p\xcdU8\xff\x00p\
-8R\xc8T\xb88I\xf9\x80\xb5\x9f\x95oA\x04\xbf\
-X\x99aS\x22\xe1\xc4\x1a\xafpGg\xc1\x86M\xe3\
-}\xf0\xa0\xf2\xfe\xefdp\xca\xe2Z\xf7\x89\xd7{\xc3\
-\xd5 \x9ep/\x8b\xe3\xed(\x1c}\xe5\xcd\x05\x83~\
-\xf9h\xb7\xc7\x9d\x06\x0b\xad{\xe6\x17\x1d_\x9d\xf5\x00\
-\x80Ri1\x08\xf2\x81V\xe3\x15\x08\x83\x8d\x97]u\
-\xba\x13\xc7[P\xbd\xeb\xec\x8a\xa3\x9f\xfb\x19\xf1\xf4\x9e\
-\xf0\xa5\xee\xd8M\xf3\xce~`k`\xd34@'\x03\
-\x88\xc4\x1b\xdd?\x1b\x1a\xef\xe8\xb2\xe9_\x9c\xb3C\xef\
-\xb8\xcbxb\xe5\xf7\xa7>\xbf|\xe0\xcf\x00r\x8cE\
-9\x029r\x13\x9dm\xb2\x1a\xaf\x9c\xaf\xc6\xf1\x9a\x11\
-A6PI\x1ary~\xc2\x8b\xc4\xab\xd7x\x81\x08\
-\xf6*'Y}>\x83h\xddw\xbc\x00`\xec\xb4\xa0\
-\x17\xc5\xf1v\x14T\x1f\xf9\xaao\xf85\x7f\xed\xd1\x98\
-{h\xc15\x8f\x9d\xd6\xfe\xf5\xd9\xf7\x01\xc4\xcf\xba\xad\
-'S~\x17\x95\x898^o\xd5\xa49\x15G\xbfp\
-<\xf1\xf6\x0em\xb1\xbb\xf6\xf0\xe2\xbf\xfdq\xe1\xd6\xb9\
-3\xec$\x1aO{\x15n\x83\xf9=V\xcc\xc4t\xf7\
-4\xde\xfe\xbe\x9a\x05\xbf\x1d\xf7\xc4)\x19\x1dx\x9a\xec\
-\xc1\xe5\x0b\xce|n\xd9\xc0\x9f\x11\xe0(\x00\xd6\xc5\x9f\
-\xcb\x82\xfc<\xb3`\xca\xca\xd7\x10\xa9\x04W\xe0\x10\x01\
-;\x99\x82\x82k\xbbj9\xc1\x9f\xd8|?U\xfba\
-/_[\xd4\xbe.\x93\xf3\x96\xc8z\xe4x\x8d\x82?\
-]\xdfK\xe2x;<\xe5\xa3\x97\x15Mx\xe6\xc4\x9e\
-\x8c\xb7\xa7\x16\x5cu\xf7\xf9\x1d\xf3/\xb8\x8b \xfa\xab\
-4\x0e\xacNd\x9a\x82\xc6k\xcd\x1b_\x85Nq\xbc\
-\xde\xfec\xbf\xa88\xf6\xe5\xa3\x89\xaf<\xeb\xbfQ\xcf\
-\xa6}\xb9\xf9\xdd\x83^X\xf6\xdf\x0b\x01\x16\xaf+\x7f\
-\xdb\xae\xd7x\xf9\xfa$|!\x09\xb5\x8a\xe9d5^\
-^_\xa1\xe1_s\xd9\x84gN,\xf1V4en\
-\xe4\xe9\xb1\xff,\xf9\xee\xa2WV\x0c>\x9a\x10\x1c%\
-\xdd\xcd\x8b\xf3\xc8.6\x008\x5c\x11\xc5\xf9\xb1\xc2\x9c\
-D\x93\x89\xe35MS!VH\xed\xaa\xe5\xc5\xfe\xb1\
-z\xac\xfeJ\xe5\xc9\x83GT\xf4{-\xed\x13\x96\x82\
-\xf5\x90x\x8f\x99E\x8c\xfe\x8dvb\x95\x89 \xc7q\
-\xbc\x01R2t\x83\x7f\xda\xb7;\xf5h\xac=\xb4\xae\
-\xe5\xff\xfc]\xe7\xc2\xdf\xdfF\x08\xf1\xf3\xdb\xa4\xf8d\
-\xcaQ\x82\x11/w\xc6\xe2\xa2\xe7\x8b\x13\x90V\xa1H\
-p\xb1\xb3\xdf\xdb\xafnA\xc51\xaf\x1cm\x14\x0d\xe8\
-u/ML\xc5V\xb7\xfe0\xfe\x96\xaf~}'!\
-\xa4F\x5c\x87\xdc\xd9&\x8c6\x88Y:4^\xb0z\
-\x1b.\x1a\xf7\xd0\xafj\x8a\xc7e\xfd\x97R\xa9\xda-\
-\x0b\x17\xfc\xe1\x9d5\x83\x0e\x06\xc8Q\xd2\xa5F\x5co\
-\x12\x1c\x00\x16\x1cQ\xe1\x22&\xe8\x02\xa9\xc4\xf1\xf2\xd0\
-1\x91X!\xb4\xcb\xfa\xa3\x10\xb5U\x1f\xff\xaeG-\
-O\x10\xc1\xf42#\xa7?\x10\xea\x99\xe3\x05@|\xd7\
-_C\x08b/<\x12\xbf\xc5\x15\x097NZ\xb8]\
-\x93oCX>;x\x9a4;\x88V\x86J\xbc\x08\
-\x18%C\xd7\x95\xec\xbatLO\xc7\xd9\x13\x0b,\xfe\
-\xe3M\x9d\x8b\xff|=@\xfc*\x99\xf2\xc5\xa4\x92)\
-/\x9f\xae8^O\xf9\xc8\xf9\x15\xc7\xbey\xa8\xe1\x1f\
-\x9c\xb5W\x9c\xe4\xc2\xb6t\xae\xaf\xbdz\xce/\x9e\x0a\
-D:\xc6\x8a\xda+ :C\x99x\xb3\x10\xc7\xdb\xf0\
-\xb3\x11\x7f\xba~rE\xfe?\xe9\xed\xc6\x05\xdf\xfe\xe9\
-\xd3\xf5\x83\xf7$\x84\x1c\xa5\xc6\xd5\xf2u'h\xbc\xca\
-\xc2\xebi\x1c/(@M*\xd4c\xd7hy\x7f\xec\
-\xed[\xf59\x94\x1fQ\xdc\xb9:\x83\xd3\x97\x94\x11\xf9\
-j\xde=3\xdb\x07l\xa5\x91\xa6JP\x00\x94\x80\x9a\
-\x88N@\xec_4M\x944\xfb'\xeco\x02\x80\x92\
-\xa6\xb1\x83C\x89&M\xa3\xe5\xa9\xb8\xbf\x95\x0exJ\
-\xc7.-\xdei~\xeeH\xd7\x0c\x14u|}\xca\x13\
-\xa1\xcdo\x1d\x06\xc0o\x8dW\x98\x1bi\x9eDg\x1a\
-K\x13q\xbcT\x18/\x00v\xb9\x8b_ot\xb1y\
-\xcaG\xce\xaf8\xe6\xadC\x0d?\xfb\xb9w\xdf\xb4\xf6\
-PK\xf9%\x1f\x1d\xfe\xc6\xa6\x8e\xd53\x01QF\x88\
-\xe6\xab2\x82=Ml\xdb\x09\xa1\x8ee\x93\xac\xafa\
-z\xd5Q\xaf\x5c8\xee\xfe\xbc\x7f\xe8\xd0_\xbe\x99\x7f\
-\xdd7\xf5\xd5SA\xc8Q\x00\xe4\x8b\x11\x81\x22\x0b\x88\
-\x9f\xb1\xff\xd8\xf2\x11-D\xd4\xbf\xc5|^\x96 \x1a\
-:\x06\xb6\xab\xd2\xbe\xae?D\xacSl__\xfe\xe1\
-\x8bk<\xff\xde\xb9\x94\xe4\xf4\x15V=&^\x00 \
-\x857^\x0d\xc0\xe4\xc4\xcb\xf3\xec\xc4\xab\xd1\x84\xad\xa4\
-&\x0d\x81\xf8\xc4\x0b\x1a\xbb\x0d\xd1\x13o\xc0;\xf0\xd0\
-7s\xe9ti\xd7\xe6\xea\xf6\xb9\x07\xbd\x1b\xaa\x7f\xeb\
-8\x90\x98\xd3\xb5\x8d\x97\x93)#\xdfnk\xbc\x90I\
-\x1aV\xbd\x14\xde\xfec\xe6U\x1c\xdb\xf7\x9d.\x00\xfc\
-\xe9\xb3S\x9e\xd8\xd8\xbef\xa6\xa8\xbdr\x12\x95\xbf@\
-\xd3k\xbcv\xe7)\x92\xad4\xbf\x12I;k\xbc\x13\
-\xfa\xed\xf9Iop\xba\x7f\xfc\xea\xcb\x9b\xbe\xde\x5c=\
-\x0d\x84\x1c\xc5\x88\x96\xcd\x87\x187k\x91+\xbb\xe3\x14\
-\x08T$^\xbe\xbeYf\xcc\x09\xaa\xb2\x8e K\x98\
-\xe1\x88U\x91\xb3F+\xf7G=<\xaa\xcc!\x967\
-\x101s\xedt\x81t9^\xef\xf9w\x13\xef\xa4E\
-\xd6A\x12(\xda\xae\xf1\xaaQ\x0f\xdd\xd4x\x99\x16\x0a\
-E\xd3%$P0\xe2\x8a[\x8a\xc6\xe6\xee\xd9\xba\x91\
-\x96o\xa6\xb5\xcd\xd9\xf3\xd3p\xf3\xfc\x99\x00\xac\x8b\x02\
-;\xb9\xa5E\x0c\xe5\xa4MR\xe3\xb5\xb4+\xe64\xd8\
-<\x88\xab\x90Rx+\xc6\xce\xebw\xd4kG\x18\xc5\
-}\xdf\xe9\xfe\xf5\xf3\xb3\x1eX\xbam\xfeT\xd9y\x0a\
-\xf3.9\x13\x9d\xc6\x1b-\x93N\x8dwD\xe9\xe4\x0f\
-~7\xf1\xc9\xbc\x8e`\xe8\x8a\xd0\xa2\xf3?\xfd\xfc\x9e\
-\x85[\x86M&\x04GZPci\xaelUY\x0b\
-6\x96/\x9c\x7fB~w\xe3x\xcd\x88\x19\xfdS\xd0\
-z\xadu\xce\xfa\x91\x94\xc6\x1bs\xea\x9a\xf2;\xf8C\
-Y}\xb7\x9a\x93\xa5\xc5\xf1\x02\x80Q\xfc\xc1\xbe \xbe\
-@BM7\x11\x01[\x07\x8dM\x1e\xeci&\x0e\xb1\
-\x83\x18\xcb \xde\x82\xb6\xc2\xf1\x8f\xfd\xd274w?\
-}\x0d\xae\xbd\xf7\xdc\xf6\xb9{\x7flvm\x1c%\x9d\
-\xfc\x16yQ\xc8\x9a\xadr\xd2\xc6\xd3x\x05\xc2\xb0\x9c\
-\xb9\x8e\xa4c\xd9\x9e\xfe\xe3\xbf\xd8^\x9c\xee\x03\x0bo\
-\xfc\xd3\xe7\x9b\xde9\x04@\xadJ\xa2\xa2\xf3\x14I4\
-\xd3q\xbcC\x8aw\x98{\xc5\xe4\x17\x8e\xcf\xe7\x9f\x03\
-o\xed\xea\xa8:\xeb\xe3y\x0f\xaco\x19~.\x80#\
-\xe5\x8b\xbf@\x9a\x00$\x84\xa5\x0aD\x08\xf9\xdd\x89\xe3\
-\xa5&\x15\xde(!\x12kw4^\xc7\xf2\x0f\x1f7\
-\xa0\xe4\xc5\xcc\xcdf\xf2\x966\xc7\x0bR\xd9h\x14?\
-\xf4+B\x88)\x13\xadJ\xbc\x22\x11\xcb\xb7gRZ\
- \xbf$\xe2x\x03\x9e\xb2q\x0b\xfcSW\x8e\xf4V\
-\x1c\xff|\xda\xc6\x94\x82\xd1H[i\xe7\xb7\xa7<\x11\
-X\xfc\xbb\xdbA\xe1W\xc9\x94]\x1d\xd4\xe8\x03&\x9b\
-0\xf2\xb5\x16\x0d[C\x10\x88\xdfZ\xb4\xb0\xc6o\xaf\
-\x17\x00\xd0\xe2\x1b\xba\xef+\x15G\xbfs\xb0Q<\xb0\
-\xcf;\xdd\xb7V?\xfd\x8b\x17\x96\xdds\x1e\x00\xe1\x97\
-i\xd1<\x9d| ;_\x91x9\x0cD?\xa3\xdb\
-\xa1:\x17\xf1\x8eL\xd3\x0e\xa5@\xff\xc2!\x0b\xae\xdc\
-\xf1\xc5cK\xbd\xf9\xfbL\xe3e\xad\x9bG\x9f\xff\xd1\
-\xb2\xbb\x9a;kO\xb6..\xd2\xc5\x9f\xaf7\xd9\xb7\
-q\x22NG\x1c/5iL\xd7\x15\x9c1\xec\xed\xf4\
-4\x8e\xb7\xd0\x08\x04\xc6\x15\x93\xbc\x88(I\x9f\xe3\x05\
-@\x0a~\xf14\xf1\xdfv\x19\x91\xa2\x1ct\xc4k\x95\
-PHM\xa7\xf9\xaa\xc4\x079\x9f \xe0\x1bv\xc5-\
-E\x13\xe7\xef\x04onB\xa4\x22\xad\xf3\xa7\xb6\xcf\x9d\
-\xf9Y\xb8\xfe\xe5\x93\x01\xea\x07\x84\x0b/\xf7\x9eP\xc7\
-\xc7\x815\x0d\x1a\xafU/m)\x1aw\xda\xa3\xfd\x0e\
-\x7f\xf9h\xe2+\xeb\xd3q\xba\x000{\xcd\x0b'\xdc\
-\xf1\xcd\x1fn\x05P\x0b\xc8\xe4\xa9\xa6\xb3\x15\xc7[V\
-P\xb9\xe4\x8f;\xbex|\x7f_u\xdeF\x8f|\xde\
-\xf0\xe3\x8c\xcb\xe74\xdd\x1a\x08U\x9d j\xae\xfcN\
-J\xd5xa\xe5\xa7;\x8e\x97\xb2/\xd3\x98\x13g\xed\
-\xda\x88\x15R\xbb\xac\xbczx\x9c\xe2xw/\xc7\xe7\
-\xe9\x9c\xc3\x9eXZ\xa2\x1aT3\x83\xf7\x9eK\xdb.\
-\xbc\x93\x9a\xd4\x0b\x0a\x87\xa8\x86X\xda\x8cM\x1e\xfbg\
-\xc6\x0e\x8a-\xdf\x96\x0e\x18\xc5#W\xf9F>\x7f\xbc\
-Q81g/\xa8\xecZ\xf1\xd7?w\xad\xbc\xf9\x0a\
-B\xe1\xe7\xfd\x8c\xf6_\x1a\x17\x1c\xb6S\xc1\xc9\x9a\xb1\
-U$D+\xf0}\x89\xb2\xbf\x90\xc7\xa2A(ZJ\
-\xa6\xdfxu\xf1\xe4\x0bs\xfe6\x8dl\xd8\xec5/\
-\x9cp\xdbW\x97\xdeNH\xd4\xe9r\x87\xa9\x8b.\x10\
-\xd3N\xdb\xd5h\x06\xd6\x92\x1a\xc1 k\xbc<\x8f\xa2\
-\xd8[\xba\xe2\x9a\x9d^9zxI\xfe>\xf8\xe6\xe5\
-5\x9f\x1f\xf3\xc0\xc2\xc1g\x99\xd4w\xa4\xf5m?\x00\
-\x10\x12\x1b\x07\xb1\x9c\x99>\x1f\xc2\x9d\x19'eB\xec\
-\xdb%\x92\x06@\x0cy\xbb\x19\xb1\xde\x22f\x95gm\
-E\xb7\x09\xfbKi\xd6\x1f{\xfb,\xcaA)\xff\xf0\
-\xbd\xe3\x0a\xce+ \x08\xa6a\x0a{li%^\xab\
-R\xdf\xb9\xf7\x1a\xe5\xb3\x0f&Fi\x0b\xa50\xd3\x1c\
-\xc7\x1b4|\xfd\xea}#\xee\xf8m\xd1\xf8E\x13r\
-\xe5t\xcd\xf6\xc5\x13;\xbe\xdc\xe3\xb3\xae\x957_A\
-\x10u\xba\x9c\xcc\x89<.\x8b\x00$2\xb5\xfe\x9b\x8e\
-8^x\x8a\xea\xcb\x0fz\xfa\xc4\xed\xc5\xe9\xbe\xb1\xf2\
-\xa9\x93o\xfb\xeaw\xb7!F\xba\xe2\xed\xbf\x13\xf1F\
-\xd3\x0c\xe82\x12\xc7[\xff\x87\xc9O\x9f\x94\xcfN\xf7\
-?\x8b\xdf\xba\xe8\xbe\xef\x86\x9dc9]F\x92\xb1|\
-.cqR\xb4\xe5+$\xaaj\xac\xc9\xc6\xf1\x9a\xa6\
-\x19\x85\x0d\xa5\xbc\xa8\xd1\xa6+\x8ewPas}\xbe\
-8] C\xc4+Z\xa4\xe5\xb0\xb7\xcc\xce\xd9\x07\x81\
-\x12C&^\xf6\x8f$\x17\xc7\x0b\x124|u\xab\xbc\
-\x83\xae\xbd\xce\xd3/\xb7O\xea\x0f\xae\xbe\xf9\xca\xae\x95\
-\x7f\xbd\x06&\xa2\xb2\x82D\xb02\x99\x02H2\xdeV\
-q\xa6\x8cl-\xeaU\x88Y\xa8\xd7(\x19\xb1\xb0\xfc\
-\x80\xa7N\xf2T\xe6\xef\x09\x9fN\x9b\xb5\xec\xa13\xef\
-^\xf0\x97k\x09\xa1\xc3\x01=\x89v\x9fx\xed\xe5\x93\
-\x8c\xe3\xad\xbf|\xf2\x13\xa7\xecTy\xe0\xec\x0c\x0c9\
--v\xf1\x9c7\xff\xbd\xb2q\xc7Q\x009\xdcF\xb4\
-\x8a\xcc\xa2%\xd7\x18E\xda\xb6\xb3\xdd\xd9>\xeav\xb0\
-6\xf8\xdf\xa01\xda%\xb0\x085\xc98\x5c[\x7f\x92\
-(\xff\xe8\x1f\xeb\xbc7\x8e-6\x96\xa6i*{l\
-\xdeL7\xe0)\x7f\xf3PO\xc9\x8aQ\xe1\x96s\xef\
-C\xd7G\xfb\x98\xa6i\x10B\x0cY\x9bd!a\x84\
-\xffb%\x9a\x0e\x12_\xf5&o\xf9\xcf\x9f\xf5\x0e\xf8\
-\xe3\x8d0r\xfb\xfbv\xb3\xed\xdb\xa9\x9d?\x9c{\x0f\
-m[8\x19\x94\xfa\xd5\xfe\xf2P8N\xee\xd4Dt\
-1Xr\x808>~\x07`]\xd9MNh\x5c\x0b\
-\x13H\x9a\xf2z\x09!-\xde\xa1\x87\xbdY\xb6\xf7\xbd\
-\xe7\xf4\xf5\xe7.0{y\xf9#g\xdc\xbd\xe0/\xd7\
-\x02t\xb85/\x96\x89\xd1\x0a\xaa\x96Ka\x18\x04\x94\
-\x9aJ\x9a\xc20\x00'\xa7\xcb\x11J&j\xb9=\xd4\
-_\xb1\xe33'\xee\xd8?\xb7\x8f\x1au\xb2\xf5\x1d\xdb\
-j\x7f\xff\xe9\xa2[[\x02;\x96\x038\x9c\x18\x88.\
-'\x83\x11\xaf!\xdf\x01\x18125\xa2;\x8a\xc4\x09\
-)?\xba\xdd B\xc8\x99\xb8\x9e\x0d\xf6\xdd\x05\xebI\
-\xec\x0f\x13\x88D\x22\xb0\xbex\x13\xef\xbb\x95~\xb14\
-\x05\x85\x01\xe1\xb8\x09\xfd\xd1\x97\x87\x95_\xe2\x0b\xb4\x8d\
--.\xcf\x1b\xa7\x0bd\x81xU3;\xfe\xfbk\xb3\
-\xf3\x85\xe3i\xf0\xbb)4\xd2\xe1G$\xe4\xa5&\x8d\
-\xd101\x89\xa7\xb2\x91\x14NY`\xf8\x0f{\xcbS\
-\xf6\xab\x07s\xedl\x99\x05W\xdf\xf0\xa7\xe0\xea\xbf]\
-M)\x8a\xb8\xd7Db2e\xff$\x8d\x97j4\xdb\
-\x98\x93\x06\x92\xd2x\x01\xb4\xf8w\xbe\xee\xda\xe2\xc9\x97\
-\xfc_\xb6\xe6 \xd7\xf6\xfc\xd2{\xcf\xbd\xef\xbb\x1b\xaf\
-\x060\x5c%Qg=\x96m\x13\x9d\xaa\x93\x93M\xb6\
-N^\xde\xe7)Zs\xc5\x8eO\x9e4\xa1b\xe6\x9c\
-L\x8d\xbb'\xf6\xf1\xa6e\xfb\xfc\xe3\xab\xae\xcb\xc2\x91\
-\x8a\xa3l\xd4\x09\x81\x0c\xa3\x09=\xf1Z\xf9\xb1}4\
-\xf9\xd6\xa6\x04\x1a/\x08{\xbe\xae\xd8\x9e@\xc4i\xd1\
-x\xa5\xf2\x8f\xfe|0}\xe6\xf0\xca\xc2\xd7{<\x99\
-i\xb4\xac;\xde\xdef\xe1\xfa'O\x0e\xae\xb9\xe1\x9a\
-H\xe7\xaa:\x02Rd\x11.#S3\xc6C\xa6L\
-\xa8|?(\xfb\x0bZ\x15\x15\xc8\xd6\xa9^\x0a\x10*\
-\xd7\xeb)\xaa^V\xba\xefc\xbf\xf4\x0e\xdc}n\x0e\
-\xa7&\xab\xf6\xe8\xf7\xff\xfc\xdd\x13K\xfe\xf5[\x80\x0e\
-O\xecL\xe3;Y\xc3@\x02\xe2\x8dW\x9e\xa7\x8b\xbc\
-%+\xae\x9a\xf2\xd4Ic\xfb\xe5\xe7\x1b\x99\xef[<\
-\xff\xdc\x97\x96\x0e8\x96\x10\xe30\x89L\xa5/\xb8x\
-(\xa2\xe5\xd4\x0cN\xb6R9\xa2\x943\x0c\xeb\xce\x0e\
-\xda|\x81\xa0\x11]\xe7\x91p\xd8\xee\x9c\x8dxi\xde\
-\x8eAb\xed\xc5\xdd_N\x1b$\xf2\xf0\x83\x13\x8a\x7f\
-\x95\xc6iM\x8be\x5cj\xe8\xad\x16\xde\xfa\xd2q\xc1\
-\xd5\xd7^gv.\x1b\x0d\x8a\xa2\xe89'\x0a\xfc$\
-\xfa#\xe9\x18\xc8\x22v[\xcbHX\x8a\xe3e_ \
-\x08\xb7s\x0c\x01x\xbd\xe0\xf5R^ot\xe9Y\x0d\
-\xb4\xf9\xaa\xf7\xfd\xa0d\xaf\x87~e\x14U\xf5\xe9\xa7\
-\x8b\x89v\xc3\xdc_\xdf\xf5\xd1\xba\xd7\x0fgNW\xfd\
-\x826j\xaa3\x81CZ\x95wtiy\xbb\xbd\x1d\
-\x0a\xbf\xb7l\xd9\x1f\xa7>\xf7\xb3\x1d\xca\xa6\xce\xcf\xf0\
-\xf0\xbbe\x97~:\xf7\xf6\x1f\x1a\x86\x8e\x07\xc8aT\
-r\xae`\x03\xb3>E\xa7\x0a!\xdf\x1er\x87\xd8\xf2\
-\x16\xe5\x1c\xbe^\x99\x0c\xc3\xf3\xc1\xe5\x04\x82\xa8\xd3e\
-\xe7\x87H\xae\xb2N!\x7f\xa1\xa6I;\x97\x87u\x1e\
-\xb2\xfd\xa7\xf73\xf3&\x84L4\xd7\xf1*\x16iz\
-\xfb\x90\xe0\xda\xbf^\x1bi\xfbj\x1a\xa1\xa4H\x0a\x14\
-\x14\x17\x81\x19[$\x8e\x1aolm\xc7\xd1x\x09\x89\
->\xe7'I\x8d\xb7\xcd\xbf\xeb\xcdW\x14\x8d\xbb\xe0\xbf\
-\xd9\x9f\x95\xdcX[\xb0\xb9\xe2\x8a\x8f~\xf9\xd8\x8fM\
-\x0b\xa6D\x9d\xaeL\x9e\xcc\x09\x8a\x96\x8c\xc6\xcbI\xb7\
-{\x1ao\x89\xb7b\xe95;?\x7f\xfc\x88\xd2\xc9y\
-\xf7e\xe6\x86\x8e\xf6\x9a\xcb?Y|kc\xfb\xd0J\
-b\x90\xc3\x00\xbe\x8ed\x0d\x17\x80F\xe3\xb5\xb6\xdb4\
-^\xc17\x8a\xf3'i\xbc\xfc\xe2\xa7:\xcbH(b\
-A\x84\xa8\xd1F\xfb\xc3z\xcfI\x9bk\xbc\x02\xf1j\
-4^\xb9<\x94\xf2\xe4\xd1\xd3\x06\x97\xe4\xf4m3N\
-\xe6:\xde\x98\x99\xadsf\x06\xd7^s}\xa4u\xce\
-\xcc(\xe1\xf2/\xfc\xf89\xa7#S\xe6$\x052\x15\
-\x16E\xb4\x1c\xabG$^\x81h\x15g\xceH:\xb6\
-C\x9b\xa7|\xe2\xc2\xd2\xbd\x1e\xfe\x95\xa7<\xff\x9f\xe3\
-\x9a.[\xdf\xb6\xaa\xee\x8a\x0fO}bs\xc7\xba\x99\
-\xd6\xc9\x1f\x97D\x999\x13\xafLp\xf1\x88W <\
-\xfe\x05\x1a\x00\xa0\xdc7`\xd1\x9fw~\xf1\xf8\xda\x92\
-\xfc;\x16\x1flX\xb5\xdf?\xe6\x05.\x8fD\x06\x1f\
-.\x91kl=\x022\x81\xca\xa1Z\x88\xe5\xc3Z\xaf\
-<\x1fJ\xbe:\x8fl\x07\x99X\x81\xa836C\x91\
-\xe8w\x13D8_\x88\xda\x1e//\xf5[\xed\x87\xad\
-<\xd1\x94\x8fV<\xb1\xb4\xf3{\xbf\xa70/\x7f\xae\
-\xbd\xdd;\xdeH\xeb\x87\xfb\x857\xdevY\xb8\xe9\x9d\
-\x83\x00\xfe\xc5\x99\xf83EN\xb0Nd\xca|dl\
-\x7f\xe56M\x22c\xa7zM\x95\xa4\x01\x02\xb4\x15M\
-\xb8\xf4\x9f\xfe\x9d\xae\xbb6G\xd3\x93\x13\xfb\xa6~\xce\
-\xcc\xbf|z\xde=\x1d\xe1\xd6\xc9\xf1\xb4W\x95Dy\
-ZO\xbc\xec\x9c\xd6i\xbc,-\xb6\xc3\xeae\xe9\xca\
-\xc2!\xf3\xff\xb4\xf3\xb3?\xab\xf1\x8f\xce\xc9+\xc1\xe3\
-\xd9\xdf\xbf\xfe\xfc\xca\x0fW\x0f\xd9\x97R\xffa\x16\x01\
-\xb2\xf9\x82L\x8c6\x0d\x15\xdc\xb9Z\x04)j\xbcj\
->\x83\x08E\xe3\x15e\x046\x9f\x91p\x04\xa0\xd1\xd5\
-.\xb6okO(\x0fA\x13\x8e\xd6\xc3\xfaoh\xca\
-\xf3\xf1\xf0\xf2\x00@\x1f\xbdhhE\xde\xc6\xb4o\xb7\
-\x8e7\xdc\xf8\xe4\xc9\xe1\xcdw\xfc\xd6l_0\x85R\
-\x14Yr@\x1c-\xd6\x89L\x13i\xbc0\xa9\x8d\x14\
-\xc4z5$\xdd\xe6)\x1b\xb5\xa2d\xfa=\xe7y\xab\
-\xb6\x9f/\xd0\x00\xe0\xdd\xd5\xb3\x8e\xf9\xdb\xdcK\xee \
-\x04\xb1\x18]\xbb\xf6\x1a5\xbd\xf6\xdas\x8dWO\xd6\
-ue\x93g_5\xf5\x89S*|\xf9\xf5\xc0\xa1\xc6\
-\xae\xce\xcaK>\xfc\xea\x8e\xfa\xb6\xe1\x83\x00\x1c\xc2\xae\
-\x19\xfc\x8eI G\xc8\x84\xa9\x92$\xa0\x94S\xc86\
-\xbaC<\x8dW\xce\x8f\x84c?\x90\x88\xd5o\xb5\xa3\
-\xec\x1fO\xa3M\xa4\xf1:\x95\xdf\xa1\xb4}\x95\xdfS\
-\x94\x97\xb4\x0blg\x8e\x97\x86\xb7V\x85\xb7>tF\
-x\xcb]\x17\xd0\xe0\xfaZ\x80\xf8\xc4x[B\x08L\
-K\xb3\x95\xc9\x14p\x22S'\x8d\x97\xd7\xeb\xa4\xf1B\
-w\xd2\x9b\xb4\xadh\xc2\x157\x17O\xfe\xd3\x0d\xb9\x99\
-\xa5\xdc\xd9=\xf3o\xfa\xe33K\xee9\xcf0\xc8p\
-Q\x1ep\x22Q\x9d\xf3\xcd@\x1c\xef\xa6\x9d\x06\xec\xff\
-\xc1e;>pV\xa1'\xbf\x9e2\xf6E\xfd\xf2\xe9\
-\xd7\x7f\xd6rM(<\xfcHKk\x8d\x11\xa4\xe4L\
-m\x1a/lZj\xba\xe3x\xcd\x88\x09\x1a\xa1\xd1\xf2\
-\x8c\x8c%\x8d\x96\xef\x9f\x818\xdeG/\xac\x19\xf0\xef\
-\x0cO\x7f\x8fl\xbbp\xbc\x91\xd67\x0f\x8b4>\xfc\
-\xabH\xd3\xacc(\x85\x8f{=N\xa6\x84 \xe6T\
-\x11%T\xe6\x1c\xadK)\xc0\xc4\xd9\x9ek\xbc\x22\x19\
-[\xce\xa1\xcd\xd3\x7f\xb7/Jv\xbb\xf7<\xa3t\x87\
-\xbc\xbb\x95\xcd\xa45u5V^\xf3\xf1\xb9\xf7}\xdf\
-\xf0\xd54B\xc8\xf0TH\x94\x19!b\x8d:\xe2\x15\
-\xb5G}}\xd6a\xe5D\xb6i\xff\x9a\x93\x9e\xbe`\
-\xe2?/\xcd\xd2T$m\xff\x98\xff\xe6\xef\xdf\xf9q\
-\xfc\xc10*\x0f!\x12\xd1\x0a\x9a\xa7V\xe3E\x12\x1a\
-\xafB\xbc`g\x81\xa2\xc1\xb2y\xb3z\x15\xddn\x9a\
-&\xccp\xecWi\xd2\xbc\xcb\xf3\xac\xf6']\x1a\xef\
-\x90\xa2\xe6MU\xbeAy\x1d\xf5\xd3g\x1d\xaf\xd9\xf9\
-\xf9\x8cH\xcb\xcbGG\xb6=\xf3s\x1aZ_KM\
-\xf8\xf8\xdd\x88\x13\x99\x12\x16f \xff\x82\x0e\x02At\
-C\xe3\x95\xf7\xb7k\xbcFA\xf9\x86\xa2\xc9\x7f\xbb\xba\
-p\xe4\xe9\x0fgy\x9arn\x0b\x1b\xbe\xda\xf5\xdaO\
-~}gcg\xfd\xf4T\xe3kE\xe2\x15OnN\
-\xbeN\x1ao<\xe2\xb5\x9c\xf5\xa6\x13w\xb8\xfc\xd6\xe3\
-G^\xfa\xcfl\xceG\x22[\xd7^_\xfb\x87\x8f\xbf\
-\xbd\xb5\xa1u|\x15!\xe4 \xe9\xa2n\xc8\x1a.\xf3\
-j\xb2\xc6\x0bKSu\xd6x9\xd9\xca\x1a/sr\
-\x9c\x88E\xa7\x0e\x10\xd0\x08\x7f\xc4\xa3STB*\x1a\
-\xaf\x5c>)\x8d\xf7\xf1\x8bk\x07\xe65\xed\x02}\xcc\
-\xf1\x9a\x9d\x9f\xeee\xb6\xcc::\xd2\xf2\xe2q4\xb8\
-\xae\x96R\xf8\xb8L\x00\xee$ud\x1a#]\xbb\xc6\
-\x1b\xb5\xe8\xb9\xceo\x97\xa2N\x9a\xd7\x1bO\xe3\x8d\x13\
-\xc7\xdbV8\xe2\xd4\xc7\x8b'\xfd\xf5ZR\xd8\xf7\x9f\
-\x9b\xab\xda3\x8b\xef?\xfb\xee\xf9\x7f\xbb\x1a\xa0u\xf1\
-\xb5W\xfdv\xbb\xc6\x0b\xc59\xeb\xd2\x894^\x80R\
-\xba\xe9\xb7;\xfe\xe7\xc2\xbd\x87\x1c\x97\x17\x0f\xcdf\xf6\
-\xfc\xf2\xcfNx`~\xc9Y\x91\xc8\x98\xc3\xc4\x8b\x8f\
-\x1c7\x0bACU\xf2!\x13-'K.KH\xa4\
-L\x95zc\xf9N\x1a/5MD\xc2\xd1\x9f]\xea\
-5Z\x08\xfb\xdb\x09\x9cU\xd4\x938\xde\x11%\x1d\xab\
-\x86\x16\x16\xad\xcb\xdcQH\x8f\xf5j\xc7KC\xcbG\
-\x9b\xed\xb3\x0f2;f\x1f\x18i\x7f\xff\x00\x98\xad\xa5\
-Q\xb2\x15nKR{\xf6\x81]\xe3\xa5\xc2Q\x95\xf6\
-\xb7\x93q\x0aq\xbcm\x9e\xca\x19s\x8b\xa7\xfc\xf32\
-O\xbf\x1d\x17d\x7f\xe6rk\x1d\xa1\xf6\xd2\x1b\xe6\x5c\
-z\xfbg\x1bf\x1fD)w\xba\xf6\xe8\x02\xbd\xc6\xab\
-#^f=\x8d\xe3-\xf2\x94,\xfb\xe3\xb4GN\x9f\
-\xd8\x7f\x8f\xbc\xf9\x09p{(Pz\xd5\x9cwnZ\
-\xb2y\xc7\xf1\x94\xd2\x83,\x0d\x97]l\x18\x19\xc6\x9c\
-\x9b!]\x9c\xf8\xba\x975\x5c\xa45\x8e\xd74iT\
-^\x00z\x10\x87\xcbI\xbb{\xe5\xf1\xf8\xa5\xc3\xfa\xdf\
-\x9e\xf1\x03\x92\x06\xeb\x15\x8e\x97F\xd6\xd7\xd2\xd0\x92\xf1\
-4\xb8h\x22\x0d.\x19G\x83K\xc6\xd3\xae\x85\x93i\
-d[%(\xf1RJ\xc1\x9ee`\xdd~H\xf2\x81\
-x\xa5\x87\x80\xa8v2e\xfbe(\x8e\xb7\xc3S2\
-bU\xd1\x84\x1b\xaf.\xa89fV\xd6&0\x8fl\
-e\xf3\x8fc\xaf\xfe\xf0\xdc{6\xb4\xad\xde\x0f\x90\xb5\
-\xbe\xf8$\x9a\x88x\x999\x13o\xa28\xde\xa1%\xa3\
-?\xbab\xea\x83g\xd5\x94\xe4\x8f\xc6\xfe\xd9\xe6\xc53\
-o\x9a\xb3\xf5\xaa\xce\xe0\xe4#\xad\x8b\x0f\x15\xd6\xb3!\
-@\x04\xe4\xf5\xac\xd7x\x99\x5c \xcc\x07T\x8d\x17\x0a\
-yB\xc9\x97\xe7\xd1\x8cPD\xc2\x91h\x9eD\xd2\xc9\
-h\xb4\x00o\xa0g\x1a\xef\x84\xd2\xe0\xe2\xca\x82\xa2\xbc\
-}\xe3\x87hy\xe3xix\xd9h\x98\x1bjhx\
-\xedp\x98\x1bj\xcc\xe0\x0f\xe3\x10\xfea\xac\xd9\xb5h\
-\x22hk95\xa9W\xfb\xec\x03E3\x058\xe9\xca\
-d*,\x1e\x9d\x16\xeb\x18} \x12\xacB\xbcIj\
-\xbc \x040J\xea\x8bF\xff\xfe\xd6\xc2\xd1\xbf\xffG\
-\x96\xa76ol\xd6\xd2'N\xfd\xef\xd7\x7f\xbb\xaa+\
-\xd29\xd1\x22)Is\xe5\x84\x9b\xaa\xc6+\xa7\x13i\
-\xbc\xb6v6\xec=\xe4\xd8Y\x17L\xba\xe5\xf2B\x8f\
-?o\x22\x17\xae\x9e\xf3\xbf\x1b?_=i\x06!C\
-\x0f\x00\xa8=\x8a\xc0r:\x8cP\x93\xd1xy\xbe\xb3\
-\xc6\x0bN\xb6\xa0q\xe3x\xad/\xd2\xa25jI\xda\
-\x10\xebIQ\xe3M6\x8e\x97\x80>~\xd1\xb0\xb2\xbc\
-\x8d\xdbU-\xab\x8e\x97\x86\xde8\xdc\xec\xbc\xf5r\x98\
-\x9dE0[\xca\xa9\xd9\x5c\x01\xb3\xb9\x9c\x9a\x9d~\x80\
-\x980\xa3\xfd\xa1\x14\xd1\x03@!\x90lR\x9ai\xac\
-!g-V\x22Sk?p\xa7\xebP\xafL\xd2\xf6\
-z\x9d4^\xe2)n\xf0\xd5]\xf8\xdf\xc2Q\x97\xdc\
-N\x0a\xf2\xe3Ik\xd9\xb6\x86\x8e\xcd\xd5\x7f\xfd\xf4\xd2\
-\xdb\xe7o\x9e;\x83\x10\xd4\x01:\x12MD\xbc|\xbf\
-\xa8\xa9\xc4\xabs\xce\xd0\xa4m\xf5n8g\xc2MW\
-\x1d6\xfc\xb4\xbc\xf9i\xe9\x9c\x8d\x8bf\xfe\xfd\xb3\x86\
-\xab:\xba&\xf9\x09\xc1\x01\x5c\x16S\x89\x8fA\x81\x83\
-\xc6\xab\x92#d\xc2\xeci\x1c\xaf\x191\xf9\xeb\xd8\x85\
-\x86\xed\x1a-\xe4v\x04b\x15\xae\x95\xbc\xfe\x144\xde\
-X\xf9\xc7w\xef\x8f\xcf\xcb\xbc\xa4\xd7<\x1a5\xebO\
-'\x0bo\x1b\xb5\x12\x915u\xb1\xfbx\xcdS\xb9\x04\
-\xedFx\x84\xa2E\xa0\xd2\xa3\x13\xe5\xfd\x01HDl\
-\x7f\xda\x17O3o\xa9>E\xcc\xd2x)\x95\xdaO\
-\xb5\xbf \x85\x8d\xbe\xe1\xe7\xdc_8\xea\xf2[\x89/\
-7\xef\x82\xcb\x07{m\xd9s?\xff\xf7\xbc\x1b\xaen\
-\x0f\xb5NQ\x89\x95\x11';\x87R\xd5xuN5\
-\xde~b\x1c/@1\xc8_\xfb\xc5\x95\xd3\x1e8k\
-Ty\xfe<s\xe1\xf2\x8f_\xb9\xf5\x9b\xb5\x93\xa6Q\
-\xe0\x00%\xca\x22\xaau\xda\x88\x15\x96S\xd2?}\x0c\
-\xb2\xd3b\xf9\xa2\x96J\x0cM\xbeF\xe3\x15\xf2iD\
-\xf8\x22M\xfbt\xb0h\xbdV\xbf\x85\xfa\xad8^i\
-\x7f\xa7\xf2\xb0\x91\xbeZ\xde\xeb\xa1\x8f>\xbcc\xc9\xe9\
-\xe9\x98\xfflY\xd6\xa5\x06O\xc9\xbf.\x8e\xb4\x1c\xf3\
-2\x00#\x0d\x9a\xa9@\xa6\x88\x91\xa63\x99\xc6\xd3x\
-I\x8c\xa4\x09AO\xe3x;|\xc3\xce\xb9\xb7p\x87\
-+n&\x85\xf9\xfb\xb2\xc3L[cgC\xd5_?\
-\xf9\xdd\xed\xf36~:\x93\x10\x8cR5Y\x9d\xd6\xd7\
-\x13\x8d\x97\x10\xb1u\x1d\xf1\xf2z\x00\xbaa\x97A\x07\
-\xbcw\xd9\xd4\xff^\xe8\xf7\xe6\xc7\x0bA?\x5c\xff\xdd\
-~\xb7\xcci\xba<\x10\x9cT\x04\xc1\xe9FM&I\
-\x89h\x85\x8b\x92,?@&^K\x86\x83\x86xU\
-\x8dW%Wv\x16\xc4\xb6GLDB\x11\x80\x10\xb9\
->\x8bH\x15\xd2\xa6\x82S\xd7\x1cw\xde\x00\x15\x17\x82\
-\x86xu\xe5\xc9\xe3'\x0f)|\x22\xfdG$\xb3\x96\
-u\xc7K|G\xbeJ\x0a\xf6\xfd\xc0\x0c~x@w\
-5Sy\x7f\x07-6\x19\x8dW\xbcM\xebY\x1co\
-\x07|\x83\xea\x0b\x87\x9e\xf9\x90\xaf\xf6\xdc{I\xe1\xe0\
-\xed\xd6\xe1\x02\xc0[+^>\xe6\x9f\x9f\xff\xe5\xda\xf6\
-P\xcbT\xb6M\xfc\xf1\x82\x98N\x97\xc6\x9bB\x1c\xef\
-\x86\xd3\xc6_u\xd3\xf1;\x5c\x94\x17z`{(P\
-\xfa\xe79o_\xf7\xcd\x9a\x09\xd3\x88Q\xb3\x1fw\xa2\
-\xdcY\xb2;\xb4\xf4h\xbc\xe8Q\x1c/\x8d}\x91\x06\
-i\x7f\xd6\xcbX\x7f\x12D%\xa43\x8e\xb7\xcc\xdb\xd5\
-vHU\xf1\xdb\x1998\x19\xb4\x9c<\x08\x9dF\x16\
-M\x8c4N\xf9\x8eR\x18\xe2C\xbe\xd9\x9b\x17t\x1a\
-/\xa8\x05\x9c\x19\x7f\x87Y\xfcz\xa5\xfevx\xcaw\
-\x9bWP{\xc1]\x05\xd5'>\x9d\x89\xb9\xeaM\xb6\
-\xb5\xb3~\xd0\xad\x9f]{\xdd\xc7k\xdf>\x04\xc0(\
-Y\x02\x00\xf4o\xffu\x92\x0b\xd4\xb2\xf6\xed\xbaw\xa1\
-\xe9\xcbG\xd3\x95E\x83\xbf\xbe|\xe7\xff^8\xb12\
-?\x9e\x7f\xf1\xec\xd2O\x7f\xfe\xe0\xd7\x9e\xb3\x82\xa1\x01\
-\x87\xb0\x0eKZ+#Jk\x83\x9a\x8f\xe8\x7f\x88\xb2\
-\x1d$A~\xacn\xb6A\xc8\x8f\xed\xaem\x8fR\x1a\
-%]\xab~\xb9\x7fl\x9bUNj\xd7)-\xf61\
-\xe5\xf2O^?\xb6\xe8\x9a\x91~cE\xea\xb3\x9f[\
-\xcbIT\x03\xf1L\x5cD\x8a/\xfe\x17:\xffs\x89\
-=.\x96sL\x9a\x9e}\x00N\xa6\x82\xd3TI:\
-\x958^Oq\xa3w\xc0\xd1\xaf\x14\x0c\xbb\xf8\xdf\x9e\
-\xb2\x9d\xbf\xce\xfa\x04\xe6\xa1=\xf4\xed\x9d\x17=\xf6\xdd\
-\xdd\xe7\x05\xc2\x1d\x939\xd9\xb2\x03\xc5\xd3\x22\x89\x8a\x1a\
-o\x94|\xf9v\xe6,\xd3\x14\xc7\xbbn\xff\xa1\xc7\xbf\
-x\xee\xe4\x1b\xae\xf6{K\xdb\xb27+z[\xd1\xbc\
-q\xd45\x1f\xcd\xbb~\xe3\xb6\xf15\x14\xd8\xcf\x92\x0f\
-T-\x13\x82\xac\xc2\xc8O\x22>\x85\x0cY9\xe1<\
-`\xf9=\x8d\xe3\x8d~\x91fF\xb3\x0da\xf6Y}\
-\xb1\x96`\xa5\x9d\x897]q\xbc\xa3K\xc3\xcbF\xfa\
-\xfd\xbd\xce\xe9\x029\x22^\x00\x00\xddV\x19\xde:\xf6\
-\x07\x1a\xd9V\xc5\xbd&4d\xca\xfe)\x04\xca\xbcl\
-\xfa\xdea\x16\x9fxIQ\x93\xb7\xff\xa1oz\x07\x9e\
-\xf0\x82w\xc0\x11\xaf\xc2(\x0adrzz\x8b}\xb4\
-f\xf6Aw|~\xe3\xd5\x1b\xda\xd6\x0e'\x04\xa3\xa2\
-[\xa3'+'RYf\xe0d\xaa\xa7V=\xb1\xda\
-\xc9X_V&\xeb\xd2\x82\xf2E\xbf\x99\xfa\x8f\xcb\xf7\
-\xa8\xfeI^\xbcs\xeb\xba9\xaf^\xf7\xe1\xb2\xe1\xfb\
-P\x14\xef\x078\x10(8\xe1E\x13\x0a\xe9\x89\xe5\x0c\
-M9V\x86m'1\xe7\xac\x90\xad\xd8\x0e\xdbW$\
-P\x96o\x9a&\xcc\x90\xa9\xf4C\xec\x97L\xac:\x92\
-\xb6\x13\xab\xbd\xbdT\xca\x1b\x06\x1e\xbfwJ\xc9y\xc5\
-\x06\xf2&\xfc/\x15\xcb]\x1c/\xe9\xdf\xe8)\xfd\xc7\
-\xe5\xe1\xe6\xb3\x1e \x84\x18:2\xed\x8e\xc6\x0b\xf0\xfc\
-\x84\x1a\xafB\xbc\x1a\x92\x0ex*\x0f\x7f\xdd[u\xc2\
-s\x9e\xca\x9f\xbeJ<%9\xa7\xa5|\xb1\xb5-\xab\
-\xean\x9es\xedu\xf36|\xba\x17!d\x14\xcf\x91\
-\x9dl\xd4\xa4/\xb6\xa2{\xa5Y\xe3\x95\xd3\x04\x94\xd2\
-uS\x07\xee\xf5\xc9e\xd3\xfe\xf5\xdb\xfey\xf0s\xec\
-\xd9k\xe6\x1f\xf4\xcf9M\x97u\x04\xc6\xf8\x09!\xfb\
-HO\x13\x13\x91_\xa3\xf1r\xad3\x1d\x1a\xaf\x1a\x15\
-\xa1\xd3xa\x91g$\x12\x01e\xa4k\xd3h\xf5\xc4\
-\x9a\x858\xde'\xf7\xab2?\xec\xadN\x17\xc8%\xf1\
-\xc6,\xb2\xed\x80\xf7\xcd\xae\x8f\xf6\x03H\x9a5^\xbd\
-v\x9c@\xe3\x0d\x90\x82A\xf5\x9e~\x87\xbc\xed\xa98\
-\xfc\x0dO\xc5\xc1o\x13O\xeeoM\xf3\xc9:\xc3\x9d\
-\xfe\xfb\xbe\xfe\xd7o\x9e\xf8\xee\xfe\xb3\x00\x8c\xd6\x11j\
-2$\xaa'\xdbx\xc4+\xd6\xcf\xeb\xb3\xd7O\x00\xd0\
-u\xe7\xed\xf8\xd7k\x7f:\xf2W\x0f\xa6o\xe4\xdd\xb3\
-\xd5\xad\x9b\xeb\xae\xffd\xce5?n\x9a8\x9a\x00\xfb\
-\xd8\x094\xb6\xa3\x8eh\x09I\x90\x0fpZ\x14IX\
-)\xa7\xc9\xb7\x11\xafJ\xd2\x84\xc0\x0cG`F\xa8\xf3\
-~:Zv$\xdcx\xe5\x85<\xc7~\xf1t\xb17\
-\xf2\xe0\xfdS\xca\xcfJ\xfdh\xe4\x8f\xe5\xdc\xf1\xd2\xc8\
-\xaa\xba\xc8\xd6)\xdf\xd1HG)@\x1c\xe3b3\x18\
-\xc7\x1b\xf4\x14O\x9do\xf4\xfb\xc9\x9b\xde\x8a\xc3_3\
-Jw\xcb\xcb7\xc6\xe6\x83=\xb7\xe8\xf1S\x1f\xf8\xe6\
-\xce\x0b\xb7\x05\x1af\x00\x0c\xb4dM\xd6N\xa8&\x9c\
-\x885\x03q\xbc\xeb\xc6VLY\xf0\x87]\xffs\xe1\
-\x90\x92\xbaU\xd9\x9a\x17\x9dm\x0d4W\xdd\xf8\xe9\x07\
-W\x7f\xb5\xa6n\x1ah\xd1>\xdc\x89(\xa1U\x10\x9c\
-\x8b\xf4\x0c\x04\xc5\xe9@\xd6x\xa1\xe4\xa7;\x8e7\xdc\
-\x15\xb6H\xa7gq\xb8\xb4\x87\xe5\xa1\x92\xfe\xd3\x7f\x9d\
-\xe0\xbff\xb4\xdf\xc8\x9b\x9fuw\xc7r\xfe\x93a\xe2\
-\xa9[e\x94\xfc\xf5\x9aH\xeb\xe5\xb7\x82\xc2k\xc9\x09\
-\x80 \x1f\xc8\xceU\xba\xbd\x22\xf2\xf6\xe8\xed\x8b,3\
-(q\xbcA\xe2\x1b\xb5\xccS\xba\xdf\x07F\xe9\xbe\x1f\
-z\xca\xf7\xff\x80xs\x7f+\x9a\xcf\xf6\xe2\xe2\xa7\x7f\
-\xf1\xc07\xff\xbd\xb0\xbe}c5!\x18\x0dX\xd3\x0f\
-\xf1\x8b\xac\xa8\xa9\xb2\x82\xec<\xac\xbd\xac\xdbl\x96\xb6\
-\xd7g\xfb\xa2T\xd9.\xd6W\xe8)Zv\xca\xf8K\
-o?aLn_\x06\x1a2\xbb\x8an\xf8\xf4\xad\xab\
->Z>d\x9fHd\xdc~\xd6E\x02V\xc7\xf9\xb8\
-\xc0\x89^]\xcf\x84O\xa8\x95\x9f\x8d8^\x80\x22\x14\
-\x08[\xfb\x88\xf3\x0f\xe8\x8f\x9bU\x1fs\xaeb\xbb)\
-\x94\x17\xe7AW\x9e\x02O\xef9\x80|\xda\xdb\x9d.\
-\x90\x07\xc4\xcb,\xdc0\xf33\x1a\xfar\x86\x15\xd5\xc0\
-\x08\x95\x93\xa9E\xbc\xfa_\x8eq\xd9@ \xde E\
-Q\xc0\xf0\xed\xb0\x8c\x14\xee\xb4\xc0Sv\xf0;F\xe9\
->\x1f\x91\x82\xa1y\xff\xd8\xb8|\xb0\x97\x7fx\xfe\x84\
-\x07\xbe\xfe\xef\x85\x1b\xdb\xd6\xd5RJG'zGY\
-\x1c\x12\x8d\xbb_w5^&+\xec9\xf4\xb07/\
-\x98r\xfd5\x03\x8ar\x1b?}\xfb\x97o\xfd\xee\xd5\
-\xefK\x8e\x08\x85\xab\x0e\x90\x9c\xa1\x8d05\xc4\xa7D\
-\x11\xe8\x89\x97E-\xc4\xc9\xb7\xda\x11\x09\xdb\x88C\xc4\
-\xbc=P \x1c\x0cK\xe5\xb4\xedj\x0951\xf1\xa6\
-V^!}P\x94\x16\xd0\xfb\xef\xdb\xa9\xfc\x9c\x9e\x1f\
-\xa9\xdc[\xde8^\x1a\xfe~r\xb8~\xea7\x00\xbc\
-)h\xbcaPb\xc2\xa8j \x9e\xa1\x1b\xe0\x1d\xb1\
-\xca\xf0\xed\xb0\x82\x14\x8c\xfe\x91\xf8\xc6.%\xbe\x1dV\
-\xb8N6u{m\xe9\xcb\xc7\xdc\xf7\xd5\x7f.\x5c\xdb\
-\xb2\xbaN$\xdcd5\xd9\xd44^''\x9d\xb0\x9d\
-5CJ\x86\xad\xfb\xcd\xce7]\xb5\xf3\xa0\xbd?J\
-\xdf\xe8S\xb7G\xbf\xfb\xf0\xb4\xc7\xbf\x09\xff\xb230\
-\xa4\x08\x84\xece\xd7p\x09\xfb\x7fl\x82\xd4|X\x7f\
-\xa4U\xe3u\xcc\x8f\xd5-\xf4\x87\x9a\x14\x91`Xn\
-G*'\x8fG\xd7?\xb6-~y}}\xd6\xdfN\
-\xfb\x1bx\xfa\x96\x89%\x97\xd7\x16\x1b}\xe2|\xce\xb9\
-\xd4\xc0\x8cx'-\xf4\x94\xfd\xe9o\xe1\x96\x1b\xfeH\
-\x00\xc0\x18\xb2\x89\x18\x95\x8d\x94\x0ch Fe#H\
-e#\xf1\x0cl\x80Q\xb5%\xeadk6\x10\xcf\xd0\
-u\xa4 \xb7Z^_\xb2W~x\xf1\xb8\x07\xbf\xbe\
-\xe7\xbc5\xcd\xab\xea\x00:V\x8e\xb3UI\x14\xd2v\
-\x91D!D\x17d(\x8ew\xcdi\x13\x7fw\xfb\xc9\
-\xe3\x7f\xfb\x7fY\x9e\x22\xc9\x1eZ\xf0\xfe\x99O\xcf\x0f\
-\x9c\xd8\x1e\x18Q\x0a`\xa6\x18% \xcac\xb2\xf3\xd4\
-\xe5s\x22\xceE\x1c\xaf\x19b\x8fu\xe4\xfd\x10\xe5\x11\
-9\x8e6'q\xbcO\x1f^m\xbc\xd6W\x9c.\x90\
-G\xc4\xebZn\xac)\xd0T\xf1\xec\xc2'O~\xf6\
-\xfb'O\xd9\xda\xb1\xa5\x8a\x10\x8cM\x8dD9\xddZ\
-\x0e&V>\x03q\xbckv\xab\xde\xf7\xa3\xdfL\xfb\
-\xdbU\x83\xfd\xb59;\x09\x1f\xfc\xf6\xfd3\x9f\xf96\
-xb[Gm)!\x98\x19\xed\xa7\x88\xfcv\xc2$\
-\xca\xc4\xf1\xdbiX\xdb\x89\x98O\x18\x22\xc3N\x8ab\
-\xb9\x1e\xc6\xf1F\x82\x11P\xd3\x94\x88U*\xe7H\xac\
-b\xbfdbM\xbe|rq\xbc\x03\x8a\xc2\xff\xfd\xcf\
-\x8e\xfd/L\xe6\xd8\xf4\x16\xcb\x1b\xe2u-\xbb\xb6\xbc\
-q\xd9\xe8G\xe7?\xf4\xabY\x8b\x9f?\x81\x102V\
-$L\xf5\x0b-\x9d\xf6\xcaI\x94\x9dL\xfc\x1bN\xf5\
-\x8b/N\xba|{\x8aq\xbck\x06\x16\x0f\xd9p\xe1\
-\xce\xd7];\xb3\xe6\x90\x9c\xfd.\xff\xfeo\xde;\xfb\
-\x99o\x83'vt\x0e\xf3\x03t&'uQ[\x15\
-HM L)\x9f\xcd+!\x12\xd1f3\x8e\x97\x9a\
-\xd1\x9f\xffR\x93*\xc4*\xf4#a\x1cn\xe6\xe3x\
-\x09\xcc\xa7\xff:\xae\xdf5\x99;\xaa\xb91\xd7\xf1n\
-g\xf6\xe1\xaa\x0f\xf6{\xe2\xdbGO\x9f\xbbv\xce\xcc\
-(\xdd\xcaN\xd2\xf6\x85\x8dp\xdbj\x8f6\xd0o\x97\
-\x9d\xaeU\xb3U\x9f\xbd~\xe7v\xca|\xfd\x16\x9e6\
-\xe9\x92\xdb\x8f\x1dsf\xcebr\xef\xfb\xe6\xbds\x9f\
-\xf9&tbGg\x8d\x9f\x102\x03\x84}\xeb\x0e\xa1\
-\xdf\xb0\xfe\xb0n\xa3!o\xe7\xf9\x90\xf3!G-\xd8\
-\xbe\xf5\xb7\xf2\xa1\xe4\xc7\xe4\x1b(\xe5t\xfd\x11\xfak\
-\x86cO\x17\x03\x04\xefG\xec\xfd\x90\xea\x95\x9d='\
-\xf5t\x94\x87D\xf7B\xf9gO\x1fQ\xfcH\xa5\xcf\
-\xe8\x15o\x95H\xc5\x5c\xc7\xbb\x1dXCGC\xd5\x8b\
-\xdf\xbfp\xc2\xcb\x8b_<vM\xf3\xea\xba\xa8\xc3e\
-&j\xb22\xf1\xe6X\xe3]s\xc2\xb8\xb3\xef;e\
-\xc2E\xff)\xf3\xe5\xe6\x01\xf2\xb7|\xfa\xce\x1f\xdeX\
-D~\xd2\x15\x1c\x5cD\x81\x19\x9cD\x99\xf6\xc8\x89\x8f\
-G\x198h\xb8\x80@\xa0\x9a|\x8b\x8c\x858^$\
-\xaf\xf1J\x04-\xf5\x87\xe7\x13B\x10\x0eF@#\xa6\
-L\xcc\x8e\x1a\xad\xd0\xae\xd5_\xb9\x7f\xf1\xcb\x1bI\x96\
-\x17&](?\xac$\xb2\xe6\xb0A\xbe7\xd3|X\
-\xf3\xc2\x5c\x8d\xb7\x8fZW\xb8\xabh\xf6\xf2w\x0ez\
-y\xf1\xacc?]\xfd\xe9LB0\x9e;F\xd8t\
-V\x95\xb0\xba\x13m`Q\x8cM\xe3\x15\x09\xcd\xde\xb6\
-R\xdf\xaa\xfd\x86\x1d\xf1\xfa9;]ySuI\xf6\
-u\xdc\xd6\xaeH\xf9\xdf?~\xff\x8a\x8f~\xf4\xef\x13\
-\x0e\x97zA\x88\xf5c\x11\xdeIE\xabd\xdf\xf2\xb3\
-\x0d\xb6|\xd5\xf9B\xd0<y9\xa2\xc9W\xdb\xee\xb6\
-\xc6K\x09\xc2\xa1\x90\xf5\x03\xa4h\x9dl\xff\xd8\xce\xb1\
-\xb4T\xce\xd6_\xa1}\xa2<\xdb\xa1\x87\xe5\xadm\x00\
-<\x06\x9e|x\xd7~\xbf*0\x10\x8c\x7f\xc4z\xa7\
-\xb9\xc4\xdb\xc7\xec\xab\xf5_\xef\xfa\xf2\xe2YG\xbf\xb1\
-\xf4\x8d\xc3:B\xed\xbb\xdaI\x94\x93Y\xd4\xec$\x9a\
-\x9a\xc6\xabj\xba:\x8d\x97\xd7\x1bG\xe3]5\xb1j\
-\xea\xfc\xdf\xecr\xdd\xb5\xe3*\xa7d\xfd\xcd\xcb\x1b[\
-\x8257}\xf8\xf1U_\xae*\xdf\x95\xd2A3\xac\
-yS4I\x00\x9c\x04\xad\xfe\xab\xc4\x9b\x84\xc6+}\
-\xab/ \xbfF\xe3E\x0f5^\x98\x04\xc1\xae \xbf\
-\xefp\xd0h\xad\x1fy\x08\x1a\xaf\xd4n\x02\x8d6\x8d\
-\xcf\xe3}\xf6wc\xfd\xb7\xf7U\xa7\x0b\xb8\x8e\xb7O\
-\xd8\xa2\xfa\xc5\x13\xdf[\xfe\xde\x01/~\xff\xe2\xf1\x1b\
-[7V\x03\x9cn\xd9m\xbc\xe8Le\xa7\xa8\x92\xad\
-\xec\x9c\xed\xe5\xd3\xad\xf1\x92UCK\xebV\x9d\xbd\xd3\
-\xefo\xddw\xd8\xe1Y\x7f\x82\xd8\x97\xeb\x1a\xa6\xdf=\
-w\xc1y\x0b\xd7UN\x06\xa9\x9a\x1e\x050Q\xc3\x15\
-\xb5SE\xcbt\xc8\xb7k\xbc\x10\xbc\x8c\x22\x13\x88\xdb\
-\xd3\xad\xf1\x82\xc2\x0cS\x84C\xa1h\x7f\x88\x9a\xef0\
-\xae\xb8\x1amw\xca\x8b\x1a3\x89\xed&\x8e?6?\
-\xd1\x8cg\x8f\xad%/\xedR\xe1\x9d\x97\xe6C\x9dW\
-\xe6:\xde^js\xd7|1\xe3\xdd\xe5\xef\x1d\xf4\xee\
-\xb2w\x0f\xdc\xd0\xba\xa1\x86R\x1ew\x9b\xe8\x17e\xb2\
-9\x13o\x865\xdeU;\xf4\x1f\xb7\xf4\xe4\x89\xe7\xdf\
-uP]v_u\x1f\x0c\x9b\xbe\x87\xbe\x9e\x7f\xe6K\
-\x0b\x9a\x8eml\xe9_I\x8c\xca]\x99\xd4h9E\
-AS\x95\x9f-\x10\xdbS!\xcc\xf8\x1ao\xaca\xc7\
-|\xc25^\x81h{\x1a\xc7\x1b\x09E`\x86\x22\x0a\
-\xb1\xa6\x12\x87+\xb4\xdb\xad\xf2)\xc7\xf1>;\xa9_\
-\xf8\xfb\x13\x87\x0e\xe8\xf3/\x15p5\xde^b\x81p\
-W\xd1\x87+>\xdeo\xf6\xb2\xf7\x0e|\x7f\xf9\x07\x07\
-\xb4t5\x97Cz:\x98J\x94\xb0\xa5\xc5m\x963\
-\x00\xd03\x8d\xd7\xae\xdb\xda5^\xc9\xe9\xaf\x9aX5\
-u\xfe\xa9\x93/\xb8k\xaf\xda\x83\xb3\x1a\x1a\xb6|k\
-\xc3\xe8;>\xfd\xf2\xb7_\xae,\xdb5\x12)\x99!\
-\x0eD\xd4\x17\xa1\xfe\xcd4\x5c\xe9o\x22\x16\xb7\x08\x0e\
-:-S\xcd\x07wV\xa2S&R\x7f\x08D\xa5!\
-\x958^J)\xc2]a\xe1\x0e\x87\xd7\xa7\x8f\xc3\x8d\
-\xb5/\x8d[\xdd?^y\x96\x97jyY\xe3\xedW\
-\x18\xbe\xff\xbe]\xaa\xfa\xc4O\x82\x13\x99\xebx\xf3\xd4\
-\xda\x83\xed\xa5\xdflX0\xf5\x9b\xf5\xdfN\xfbf\xc3\
-\xfc\x9d?\x5c\xf1\xf1>\x84\x90Q@\xa2g\x1b89\
-O1\xed\xb4]\xbf_\xb2\x1ao\x02\xa7\xbdj\xf7\xa1\
-\xfb|t\xf2\xc4s\xef\x99V=sNV&1f\
-\x8f\xcd\xff\xf4\xb4g\xbf\xd9\xf2\xb3M[\x87WS`\
-W\xab\x7f\x86\xa8a\xaa\xce\x8dJ\xcfX\xd0\xe63\xc2\
-\xb4i\xb8\xca3\x17\x1c\x9e\xd5 ?s\x81\xa6\xe5Y\
-\x0d\x91P\x04\x91\x90i\xf5\x83\x82\x13{r\xcfJ\x10\
-\xfb\xd1\x9d\xf2\xf2<$[\xdekD\x9e~xz\xe5\
-\xe9>\x83\xf4Y]W4\xd7\xf1\xe6\x89\xadl\x5c=\
-\xea\xabu\xf3\xa7}\xb3\xe1\xdb\x9d\xbf^\xff\xed\xb4%\
-\xf5K\xc7\x13B\xeb\xec\x84\x09$G\xa2N\xfb\xc9\xd1\
-\x06\xd1O]\xb4A\xf7\xdbQ\xea_\xb1\xf7\xf0\x83f\
-\x9f\xbe\xe3Ew\x8e\x1f\xb0c\xd6\xbe4[\xb2e\xed\
-\xf8\xff~\xf6\xf9\x85_\xae,\xdf5\xd85\xc0G\x08\
-\xa6q\xc2\x82\x860\x11\x03/b\x11ot\xbb\x86\x5c\
-m\xc4\xab\x89j\x10)Pm\xcf!\xdf\xd6\x9e\xd2_\
-{>X\xa7A@\x10\xee\x0a\xc14)\xdfOK\x9c\
-B\x7f\xad\xbe\x08m9\x12\xaa\x9eX\xd3Q\xde x\
-\xf6\x96\xa9\xe5W\x8c\xf0{V\xc5;\xa6}\xc9z\x9d\
-\xc6\xbbh\xe3\xca\x89w\xbf\xfb\xc6\x05\xfbO\x9a\xf0\xfe\
-\xd4\xe1\xe3\xe6\x8f\x1cP\xd3\xab\xde\xb9\xd4\x1e\xec(\xfd\
-\xa1~\xd9\xd8\x1f\x1b\x96\x8f]\xbae\xf9\xd8\xa5[\x96\
-\x8d\xf9v\xe3\xc2\xa9\xcd\x81\xe6rB\xc8pU+\x95\
-\xbf\xb8R5X;yRjvK\xe3e\xdb\xd3\xa8\
-\xf1\xae8x\xe4Q\xaf\x9c\xbe\xe3\x85w\xd6U\x8c\xce\
-\xdac\xfc\xfe=g\xf6o^]\xd8t\xc4\x96\xc6\xba\
-A\xc4\x1895J\xb4\xb1\xfeB\xd4L!\xbc[\x8c\
-i\xaa\x82v\xea\xa0\xf1\xe6c\x1c/\x8d\xd0X\xd4\x82\
-B\x9c\x10\xc7\xc7\xdb\x135Zk\x1e\xd8\x0c\xc5\xd1x\
-3\x14\xc7\xfb\xfcEcK\xef\xdc\x9e\x9c.\xd0\x0b\x1d\
-\xef\xc4!#\x17\xad_]\x5cs\xc2kw?G\xfa\
-\xafB\x7f\x7fy\xe3.\xc3\xc7}\xbd\xcb\x88\x89\xf3&\
-T\xd7-\x1e_]\xb7d\xdc\xe0\xba\xa5eE\xfe\x96\
-\x5c\xf6s}\xf3\xa6\xda\x8d-\x9b\xab\x975\xac\x1c\xbd\
-t\xcb\xf2\xb1?\xd4/\x1b\xb7\xb4a\xc5\xd8\x8d-\x9b\
-j\x00Z#\xd2\xa5\xce)\xda\xd3\xf2v\xee\x8c\xe5\xd0\
-\xaf\xf8\xd1\x06\xb1\xd6\xc4/|\xc0\xeb\x93\xeb\xe7\xe5\xd9\
-v\xfbE\x00\xea~+\x86\x94\xd6\xae;f\xdcIO\
-\x1d5\xf6\xc4g\xfb\x15\xf6\xcf\xca/\x8e>^\xb5h\
-\x9f\x07>\xff\xee\xac\x85\xab\x07O6\xcd~\x06\xd0o\
-*\xe1^K\xfeV>:\x03\x963s\xcag\x03T\
-\xa3\x0c\x808Q\x04b\xd4\x82\xf5\x19k\x0f\x0e\xed\x11\
-\xa7\xf6\xf8\xf1b\xf9\x96f+\xb4\x17\x95\x16\x22\xd1|\
-\xa2\x8c\x8b\xf5C\x8aB\x90\xa3\x22\xac\x8b\x10\x815.\
-{yY+\xb6E]8\x96\xa7\x89\xca?\xbf\x7f\xb5\
-\xf9\xfe\xde\x03\x0br\xfat\xb9\x5cX\xaf\x95\x1av>\
-\xef\xceo\x16\xacY3\x85\xd4~a\x10_\x07\x14m\
-28\xa4\xdf\x80M\x13\x87\x8cZ4\xbe\xbanIm\
-\xc5\xa0\xb5\x03J*\x1a\xabJ+\x1a\x06\x94T4T\
-\x95V4T\xfa\xfb5V\x96\xf4\x8b\xeb\x18\xda\x83\x1d\
-\xa5]\xe1\x90\xaf+\xdcU\xd4\x15\x0e\xfa\x82\xe1\x90\xaf\
-+\x12\x8c\xfd\x1d\xf4\xd5\xb7m\x1d\xb4\xa1yS\xcd\x86\
-\x96\xcdC74o\xae\xd9\xdcZ?h]\xf3\xc6\xda\
-\xfa\xb6-\x83(\xa5\x86a\x90A\x0e\xcf\x1e\x80\x93\x0c\
-\xd0S\xed5\xb9\xfaz\xde\x8eB\xda\xcb\xf6\x1e~\xe0\
-{\xc7\x8d?\xf9\x89\x19C\xf7\xc9\xcaI4\x7f\xe3\x8a\
-\xa9\x8f\xcd\x9b\xff\xcb/V`z[\xfb\xb0R\x80N\
-u\xd6\x5c\xbb\xa9\xa9\xb2t2\x1a\xaf\xb4=9\x8dW\
-\xd2Di\x8a\x1a/\xa5\x08\x07\xc2\xd1\xb7b\xc7\xd1h\
-m\xe5X{j\xfbi+/\x8e3\xee\xf3x_\x1c\
-V\x1a^s\xfb\xce\x83.\xed\xe6\x12\xe8\xd5\xd6k\x1d\
-/\x00\x8c\xf8\xc5\xff\xad^\xb7\xb2\xb4\x96\x0c\xfe\xce \
-C\xe6\x83\x14t\xc6qjb\x1a \x04\x1d\xb1\xed\xa6\
-\xb2\x9f\xa9\xecW\xde3M4q\x7ft\xf5\xb2\xb4\xa6\
-\xdf\xc9\x8e\xcf\xb1?ijgY\x95\x7f`\xc3\xd1\xe3\
-~\xfe\xccq\xe3O~\xb2\xca?(\xe3o\xf1\xf8p\
-\xc5\xf7\xfb=;\x7f\xd1\xcf\xbeY\xe5\x9b\xd6\xd1Q\xed\
-\x070\x05D\xf3\xeb'\xa8\xb7\xf7\xb1\xb4\x90\x0f\xa2\xd3\
-x\xe5\xa8\x06\xb1\x1e\xa9\x5c\x82|\xbb\x86\xcb\xb69\xe5\
-;\xd4G\xf4\x1a\xaf\x191\xa3\xaf\xe6\x11.\x0e\xda~\
-\x11\xc5y\x0b\xfd\xd1\xd5\x9f\x9d\xf2\xd1tYa\xe8\xe1\
-\x87v\x1f\xfc+l\xa7\xd6\xab\x1d/\x00T\x1d\xfd\xcf\
-\xad\xdb6\x95W\xc2\x08\xc3\x18\xf2\x1d\xc8\xe0oA\xbc\
-!\xe8\x08N\xaf\x89\xf6\x84D\x09\xc4w\x8a9\xbfC\
-\x8c\xd7g\x8f\x06p~'Y\xa2\xfe\xd8I49\x8d\
-7\xd9\xf1\xc9\xe3\xb1\xd2\xcbv\xaf\xdds\xceq\x13N\
-z\xea\x80\xbaC3\xfe;\xfa7\x96|s\xf8\xf3\xf3\
-\x97\x1e\xff\xddj\xff\x94\xae\xae\x81>\x0aL\xb1\x13&\
-?\xb9\xf5$\x998\xdf\x89\x88uq\xbc\x12\x09Z$\
-\x9b\xa0?$\xb9\xfeJq\xbcj\x7f\x88\x81P (\
-\x7f\x81\xc6\xc6a\xf5\x0b\x12Y\xf3zy}\xc9\xbf\xf3\
-\x8c\xa5eb\xed\xee;\xd7X\xf9\xc2\x82\xc8\xd3\x0f\xcd\
-\x18\xf8\xabB\x83\x04RZ\x0c}\xc8z\xbd\xe3\xdd\xd2\
-\xd2:h\xe4\x09\x0f\xac\xecl)\xf5\x03\x04\xa4\xa0\x0b\
-F\xf5|\x18\x83\x17\x02F8\x0e\xb999!\x9e\xb6\
-\xae\xe6\xb1\xed<O\xd6dy\x9e\x8e\x1cU\xba\xb4\xd7\
-\xa7#Q\xb6\x9f\xda\x97\x9e\x8fGm\x9b\x8d'n}\
-\xcb\xc6UMXt\xc8\x0eG\xbcv\xc8\x0eG\xbc>\
-\xa44so\xf5h\xeal\xabx\xea\x9b/N~w\
-\xc9\xe6\x03Wl\xec7*\x14\xea\xef%\x04\x939I\
-\x01\x16q\xf1\x0d\x0a\x91q'`\xcb\x8f\x16\xd7\xe4G\
-\xff\xc3\xf2\xa5\xbf-\xc2\x13\xff\x16\xfb\xa3\xd4'\xd4\xef\
-\xd8\x9f\x14\xe3x\xa9I\x11\x0e\x84\xac\x0d\xac?:\xe2\
-\xb5\xea\x91\xfa\xa1\xe9W\xda\xca\x0bs\x9f\xa0|\x81'\
-\xf2\xec]\xd3\xab.\xe8\xdf\x07\x9f8\x96\x8a\xf5z\xc7\
-\x0b\x00?n\xa8\x1f\xbb\xe3)O}\x17\x0e\x94\xfa\x80\
-\x18Ix;\xe0\x19\xb4\x04d\xc0b\x90\xa2V\x88N\
-\xa8gq\xa9\x89\xb5R=\x89:\x91u\xea\xdak\x96\
-\xe2x\x97\xd5\xf5\x1f\xb9\xe2\x90\x1d\x8ex\xed\xf01G\
-\xbd2\xbc_\xe6\xde\xf41o\xdd\xb2]\x9f\x9a\xf7\xdd\
-I_\xad\x0a\xee\xda\xb0\xb5\xb6\x8a\x18dbB\xcdU\
-\xd2Lem4%\x8d7\xdf\xe3x)\x10\x09\x86\x11\
-\x0eG\x92$NY\xa3\xcd\xa78^\xaf\xc7|\xfe_\
-\xbb\x0d\xb8\xb8\xba\xc8\x93\xd3w\xe3\xe5\x83\xf5\x09\xc7\x0b\
-\x00s\x16\xaf\x98\xb9\xefyo|HCE^QC\
-\x03! %\x9b`\x0c\xf8\x11F\xff\xe5\x88~\x11\x17\
-\x8f\x1c\xc54#\xc5\x9eh\xa2\xc4a\xbbX?\xaf\xb7\
-\xfb\xed$\xdf\x9f8\x9a\xf5\xd2\xc1\xa5\xd5\x9b~2\xe6\
-\xc8\xd7\x0e\xd9\xe1\xf0\xd7'\x0c\x9c\xb4\xd0a\xba{d\
-\x9bZZ\xaa\x9f\xffv\xde\x09\x9f.\xdb\xb4\xe7\x0f\xeb\
-\xfd\xe3\xbb\x02U>\x1021\xda\x07\x81\xa8X:\x8a\
-PZ\x92\xb4HM\xd1T\xc5|\xeb\x83(\x9a\xa4-\
-_^7q\xfb#m\xcfL\x1co$l\x22\x12\x0c\
-\xf3(\x00a\xac\xac\xbfb\xbdD\xed\xb74_\x9a\xf9\
-\xb1\xfa\x92Jyy>\x93-\xef\xf1\xd0\xe7o\xdb\xa5\
-\xf2\xb2\xe1%\x9e5p\xad\xef8^\x00\xf8\xdf\xe7\x0b\
-\x8f:\xf6\xb2\x8f_\x22f\xa1a\x85\xb6@\xb9\x12\x97\
-l\x84\xd1\x7f%\x8c\xfe?\xc2(j\xcb\xa0\xc6\x9b|\
-\xdck:4^\x8b\x94R\xd7x\x97\x0e,\x19\xd8\xb0\
-\xff\xc8\x03g\x1f>\xf6\xa8\xff\xed<d\x97\xb4?\x9c\
-d\xd9\xe6\x8e\xd1\xb3\xbe\xfb\xfa\x98\xb9+\xea\xf7X\xb9\
-\xd9\xa8\xeb\xec\x1c\xe0\x070^\xd68\xed\x04\x1a%,\
-\x0d\xd1\x12\x12{\xe0\x8b8N@\xae\x0f\xbdS\xe3\xa5\
-\x14\x04@0\x10\x02L\xa4@\x9c\x895^\x96\xee\xae\
-\xc6\x9bz\xf9\xe8<\x19\x1e\xbc\xf8\xb7\x9d\xfb_5\xb6\
-\xdc\xbb4\xa9\x05\xb3\x1dX\x9fr\xbc\x00p\xef\x9bs\
-\xce\xfd\xf5u\x8b\xef\x22\x84\x18\x5c#\xe3D\x22.z\
-R\xb2\x19F\xe5\x8f0*\x7f\x00\x0fI\xb3\x8ap\x1a\
-\x81\xb3\xc6kw\x8ab:\xba\xaf\x9c\xb6\xd7\x97m\x8d\
-\x17\xc0\xd2]\x87\xee:o\xaf\x11{\x7f\xbc\xd7\x88}\
->\x1aW5aQr\xb3\x9b\xd8\xda\x02\xe1\xd2\xafW\
-7N\xfb\xe0\xc7\xe5\xfb}\xb1b\xeb\xee\xab7\xfb\x86\
-\x87\xc2\x85>B\xc8Xq\x22,\x82\x03$2\x92t\
-\xd4\xd8\x8e\xea\xbe\xd1\xcd\xf2D\xf7\x5c\xe3\x95\xf3y{\
-r\x7f\xa1\x94'\x9a\xfe&\xa5\xf1*\xfd\x05! \x14\
-\x08\x05\xc3\x88\x84\x226b\xd4\x8eO\x1dG,M\x9c\
-\xfaA\x88\x92f\xf9\xb1\x81\xc7-\xefT\x1f\xe2\x967\
-\x08^\xbcf\xa7\x8a\xeb\xa7V\x16\xcc\x87k\x96\xf59\
-\xc7\x0b\x00\xffz\xe5\xe3\xdf\x5cv\xcb\xe2\xdb@\xbd^\
-@!\x0aP\x18D\xbe\x82\x13B@J7\xc0(\xdd\
-\x0c\xe2\xdf\x0c\xa3d\x0bH\xd1V\x85P\xbaG\xa2y\
-\x12\xc7\xbbd\x80\x7f@\xe3\xdeu{\x7f\xb4\xf7\x88}\
->\xdes\xc4^\x9f\x94\xfa\xcaz\xfc\x03\x93\xf6\xaeH\
-\xe9\x825-S\xde\xfba\xe9\x01_\xad\xdc\xba\xcb\xea\
--\x18\xde\xdaQ\x5cN\x08\x19\xcd\xe651\xd1B\x19\
-\x17\x12\x93d:5^!_\xbeCr&F1?\
-]q\xbc\x91`8\xfa\xe2I%\x9eWl?;q\
-\xb8=-/\x8c\xd3 \xb3.\x9f\xdc\xef\xd6=\x06\xfa\
-\xb2\xfal\x8e\xde`}\xd2\xf1\x02\xc0\xc3\xef~~\xc6\
-\xb9\xd7\xcd\xbf\x0f\xa6/\xfa\xeb<\x85<\xb8V\x17\xcd\
-T\xc9\x84xBQm\xb8l#\x8c\x92\x0d0J7\
-\x80x\xbbb\xfb\xf4\x8a8\xde%S\xaa\xa7,\xd8\x7f\
-\xd4~\xef\xef5b\xafO&\x0d\x9e\xdc#\xbdvE\
-}\xc7\xa8O\x97\xad\xd8k\xc1\xba\xfa\x1d\x97\xac\xef\x18\
-\xbf~+j[\xda\xfd\xe5\x84`\x948o\x9c\x14\xe5\
-\xbf\xed\xc4\xc7\x92\x04\x8e\x84)\xe6\xc7\xd1p\x89-_\
-\xd7\x9e\x9c\xafmO\xe9\xbbX\x8f\xad\xbd8\xf9v\x0d\
-\x97m\xb3\xe7S\xd3D(\x10\x8e\xbetR\xad\x97(\
-\xf5\x0bc%\xc4>\xaf\xf1\xcbk\xe6\x8f\xe8\xef,\xd2\
-T~\xd6\xf9\x13\x0b\xef9tHy\x9f|uOO\
-\xad\xcf:^\x00x\xe9\xb3o\x8f\xfb\xc5Us\x9e\xa2\
-\xe1\xa2h\xb4\x03\xd3\xd0\xd4+\xb4DR\xfa|\x0a\xc0\
-\xe3o\x04)Y\x0b\xa3\xa4\x01\xa4h\x0b<\xfe\xad\x80\
-\xa7\xc3r\xae9\x8c\xe3]J)\xc5\xae\xb5\xbb\xcc\xdb\
-\xb9f\xea7\xd3kw\xfbb\xda\xd0i_\x97\xfaJ\
-\xdbR\x99\xaf\xa6\xce\x8e\x8a\xafW\xaf\x9c\xb6d\xd3\x96\
-\xf1\x0b\xd64\xec\xb4\xb2>T\xb7\xb9\xd1S\xdd\xdaZ\
-YJ\x01\xc30H\x9dz\xa7\xd0]M\xd5\x9e\x9f\x82\
-\xc6\xdb\x07\xe2x\xa9I\x11\x0eF\x10\x09\x85c\x84)\
-\xb6\xcb\xca\xa7\x12U\x90X\xe3\xcd^\x1c/f\x9d?\
-\xa1\xe8\x9eCk\x5c\xa7\xebd}\xda\xf1\x02\xc0\xfb\x0b\
-\x96\x1ep\xf8\xa5\xef\xbc\x16\x09\xfa\x8b\x00\xfb\x15<\x9a\
-\xd08\xe1\x04\xf9\xd6\x15\xde\xdb\x09\xa3\xb8\x01F\xf1V\
-\x10_3\x8c\x82N\xc0\xd3\x09\xa3\xa0\x13\xc4\xdb\x09R\
-\xd0\x01\xe2m\xd78O\x81\x92\xba\xa1\xf1\xfa}~\xec\
-:tg\xecR;\x0d\xbb\xd6\xee\xb2\xfb\xf4\xda\xdd\xbe\
-\x887\x0f+\x1b\xb6\x8cZ\xd9\xd0P\xb7zkc\xdd\
-\x8a\xfa\xc6\x91k\xb7\xb6\x0d\xdf\xb8\xad\xab\xba\xb1\x15\x95\
-m\x1d\x05\xa5]\x81\xd2\x223Rd\x10B\x86\x03\xfc\
-d\xd2i\xaa2\xb9\xc9\xf3c#\xa6$\xf3%\xda\x84\
-JO\xca\xdf\xda\xa8\x05\x91\xc8\xba\xd3\x1f\xa5\x0f\xda\xfe\
-8\xf4MmOZ/J>\x08\xc21\x1d\x97\xcd/\
-\x9bO=q\xb26\xd5\xb4}\x1c\xf2\x18\xd4~h\xfa\
-\x95\xb6\xf2\xbco\x84`\xd6\x1f\xa7\xf6\xbfi\xb7*_\
-\xdc\xf5\xb8\xbd[\x9fw\xbc\x000\x7f\xe5\xda\xa9{]\
-0\xeb\xd3PG\x99_&)\xbe\xa8\xa4\xed\xaa\xc6\xa6\
-\x92\x97\x96\x88e\xc2`\x9a\x1e\xab\x17F\x17HA\x00\
-\xc4\xdb\x09\xc3\x1b\x889\xe7\x00\xe0\xed\x80\xe1\x09\x03$\
-\x04\xe2\x89\x80\x90\x10\x88'\x0c\x90pt\xbb\x11\x8a9\
-d\x8a\xd2\xc2R\xd4U\x8c\xc6\xb0\xf2\x11\x18P\x5c\x8d\
-\xaep\x04\x81P\x04]\xe1\xc8\xfd]\xa1\x88/\x186\
-}\xcd\xed\xa1\x8a\xe6\x0e\xb3\xbc\xb5\x1d\xe5\x81\xae\x82\xa2\
-\xae`\xa1\xcf\x0c\x97\x1a\xb1\xfe\xd4\xc6\xd3T\x1dI2\
-\x91\xa6*\x91\x98\x13\x81\xc6\xd1\x0cu\xed)\xf3\x9b1\
-\x8d7\x8bq\xbcf\xc4D(\x10Bt/\xc8\xebE\
-\x9a\x9f\xf8\x1ao\xbe\xc6\xf1z<t\xd6\xf5\xbbT^\
-3\xa9\xc2\x97\x910\xc4\xbed\xdb\x85\xe3\x05\x80\xe5\x1b\
-\xb7\x8c\x9ev\xf6\xd3_\x05Z\xcb\xca\x01~\x05G4\
-\xa1%\x17N?\xeaI\x07\x1b\x09qMO\xcc\x17I\
-\x8bhHJG\x1cB\xbdJ\xbe\x8e\xe8\x1c\xfb\xa3\x1b\
-\x87C\x7f\x00\xa5^V@%,\xc7|\xa7yK\xa4\
-\xf1\xca\xf1\xa8\xf2\xb8\x9c\xda\x93\xf3\xf9\xb1\xd3\xf7Wj\
-\x8f\xc8\xdb\x89-_7/\x0e\xfd\xd1\x8d\x83m\x90\xd6\
-C\xd4\xe1Z\x0f\xb4\x89w\x9c\xa49\xd3\x8cW\x18\xab\
-8oD)/\xf6\xd3N\xacby\xd6\xd7T\xca\xcb\
-\xfda\xe5\xbd^\xfa\xe2\xed3\x06^:\xbc\xc4\xeb\xc6\
-\xe9&aF\xe2]\xfa\x86\xed0d\xe0\xb2\xc5\x8f\xfd\
-rBieK#\x08@\xc1/8\x04\x88\x92\x0d\x89\
-j\xb4|\x03\xcb'\x9a\xfc\xe8\xba\xa3\xb1\xfc\x98(\x00\
-\xf1B\xc6H\x18\xe0\x9f`\xf9T\xc8g\xed\x89\xcdj\
-\xfaC\x10-N\x10%,8\xf4\x07B>\xa4|}\
-\x7f\x88&\x9f\xb5\xc7\xfa#>\x02\x92uT\xd7\x1f\xa9\
-=\xe8\xfbC4\xfde\x8fDd\xf9\xd4\xa1?,\xce\
-\x95\xb2\x0a`\xef\x0f\xd8\xa7\xda\x9e\x95o5 \xb7'\
-\x1cG\xfe\x88F\x9e\x0fb\x9f7Jyu\xac?$\
-\xd6\x1f\x1a1\xd1\xd5\x1eD\xb0=\x88H\xc4\xe4\xedK\
-\xc7\x89\x8aW\x11a\xfehl^\xc5\xfe\xd9\xcb[\xe3\
-\x00\xcf b?\xac\xf2\xd4\x9a\x17>\xef\x10\xca#N\
-y\x22\x94\xa7\xb6\xf2\x85\x05\xf4\xf9\x07\xf7\x1e|\x96\xeb\
-t\x93\xb7\xed\x86x\x99mk\xeb\xa8\x9cx\xe6\xfd\xdf\
-o\xdb\xdc\xaf\x12\x04>\x00\xf6+;\xfb\x14\xd6\xa3V\
-\xe3\x8d\xe5%$:@\xd1L\xf5q\xc5\x09\xdb\xd3\xe4\
-\xdb\x08I\x93o}h\x09T\xdf\x1fN@\x9a\xedI\
-\xb5\x97\x9e\xfe\xd8I\xd0\xde\x1f\xa9\xbdD\xf9I\xf6W\
-\x1a\xa7\xd0_u\xfe\xd5\xe3\x0cB`\x9a&\x22]\x11\
-D\xc2\x11!_\xd3?\xa5\x9d\xe4\x89\xd5\x9e\x0f!M\
-\x94\xb44\xdfR\x9a\xe5\xb3\xbe\xc4+\xaf\xad\xef\xd5\xb2\
-\xc2H\xcb\xfd{\xd7\x9cS\xec%\x1dp-i\xdbn\
-\x88\x97Y\xffR\x7f\xe3\xc6g\x7f3\xa4zX\xf3&\
-\x00A\x00Z\xa2\x95\x89\x98\x91\x9e3\x11S\x01\xb5\x18\
-\x80H\xe4&\x91.x{\x008I\x89\xf5\xb1|\xa1\
-\x80\xda\x1f\x8909\x09\x8a\xfd\xb5\x11_\xec/\xb5?\
-T\xe9\x8fD\xe0D V\xa1?D\xea\x0f\xcf'J\
-\x7f\xa0\xf4W\x22\xb88\xfd\xb1\x91\xa0C\x7fDB\xa3\
-\xda\xfc\xe8\xf1\xd4\xf6\x07\x0a\x11\xda\xdaS\x08\x0fl\xbd\
-\x88\xedE\xf3M\x93\x22\xd8\xde\x85`[W4ZA\
-\x1c\x8fH\xe4D$kq\xbe\xd9\xfc\x08\xf3Ki\xdc\
-\xf2\xe2<\xb1~\xf1\xe3\xa3\x99ok}\x8b\xe5\x91D\
-y\xaa\x96\x7f\xb5\x7fQ\xa4\xf1\x89\xfd\x87\x9e\xe2:\xdd\
-\xd4m\xbbs\xbc\xccV=\xfe\x9b\x11\x93&w,\x04\
-\x10d\xb7\xfb\xd2\x13\xfe-\xb7\x12[t\xe2I\xcen\
-Wm\xf9\x80\xb8\xca\x99O\x8c\xde\x1es\xef\xc7}\xa2\
-pr\xd9\xea\x13\xca\x89g\x87\xd8\x9et\xdfH\x04g\
-\xc6\xfb\x0b\xe6\x84 \xf8h\xa9\xbfB5b\x7f\xa4|\
-v1\x11\x06\x06v\xf2\xf3\xfeZ\xdb\x95\xfe@\xe9\xaf\
-%O\x08\xf9\xd0\xf4\x87\x1b\xe5\xceF\xf2\x0d\xc2\xc5\x90\
-\xd5\xa7\xe9\xaf\xae=\xab?V\xbe\xd5\xbc\xbe?l\xbb\
-\xd2\x1fB\x80p0\x8c`[\x17\xbaZ\x03\x88\x84M\
-i\xfc\xd2:\x00\xef\xb75<q^\xad\xe3E5\xe5\
-\x89P^\x1c\x07+/\xf4\xdb*\xaf\x99ok}\xf7\
-\xa8\xfc\xab#\xca\xcd5\x8f\xec7\xf4t\xb8\xd6-\xdb\
-n\x1d/\x00|\xf5\x9f\x0bv9\xf1\xa8\xc2\xa7\x09H\
-\x80k\x95\xec\xa4\xd2\x10\xa6J\xbc\xb6|Hg\x99D\
-\xbc\x12A\xb2Oaq\xc7%^]{\x10P5\x9a\
-/\x13\xa8HPr\x7f\x9c\x08S\x22\xf08\x84)\x12\
-/U\xfb\x13\x8fxu\x04\x15\xcb\x87\xda\x1f\xe9Hq\
-\xc2\xb4\x13q\x0f\x89W!Z\xa9?\x9ay\x13\xfbc\
-\x86\x22\x08\xb4\x04\x10\xec\x08!\x12\x8e\x08\xe3\x13\x89U\
-\xba\x16\xcb\xf3\xcc\x1a\x8cK\xbc\x90\xfbo;\x8e\xac\xbc\
-\xd8oN\xacT\x9do-\xf1\xa6T\xfe\xf5=\x87\x92\
-O\xff\xb3\xe7\xd0\x0b\xe1Z\xb7m\xbb\xd3xu\xf6\xd4\
-G_\x9d|\xce\xdf\xbe\xba/\x12,\xf2\xbbQ\x0d\xc4\
-\xaa\x8b\xb7\xe7F5\x88\xfd\x09\x07\xc3\x08\x07#\xa0\xa6\
-\x09\xfb\xf1K-*\xa17E5\x10\x82W\xcf\x9e\x5c\
-\xf2\xc0\xd1#\xfa\xcd\x82k=2\xd7\xf1\xc6l\xd9\xc6\
--\xa3\xf7\xfa\xed\xb3\x9f67\x94\x95\x13\x83\xd8\x7fl\
-\x01h\x7f\xd9F\xe1\x10\x8fJX\xbe\x18\xd7\xa9\x8b\xcf\
-\xa4\xf6v\x92m\xaf[\xbf\x14\xd3\xf4\xc71_i7\
-#\xfd\x11\xe6-\x9f\x9fNF\x81H0\x82P\x17{\
-\x18\xb9\xd2o\xc7\xf9D\x828XV^L\xb3\xfc\xf4\
-\xfer\x8d\xa5\xbb\xf3\xcb5\x8f\x11y\xe5\xef3\x07_\
-5\xa1\xc2\x97\xb6\x07*m\xcf\xe6:^\xc5\x0e\xb8\xea\
-\x81\xf7\xe7~\xe1\x9bA\x08)\x12\xef,\xed\x84\xe9F\
-5\xc4o/=\xfd\xb1\x93\xa0\xbd?R{\x89\xf2\x93\
-\xec/k\x8fR \xdc\x15\x8a>\xc0\x06J\xfdR\xbf\
-\x9c\x88\x91\x8dG\xd3\xbf\xa4\xca\xc7\x19\x9f:\x8eX\x9a\
-(ii\xbe\xa54\xcbg}\xd1\x96\x7f\xbd\x7f\xb1\xd9\
-t\xcf~\xb5\xe7\x95xIJ?Aw\xcd\xd9\xb6k\
-\x8dWg\xef\xddt\xd6\xfeW\x9f_}#\x8c\x90\xf5\
-M\xad\x1b\xd5\xb0\xfdE5D\x82at\xb5u\xa1\xb3\
-\xa9\x03\xe1\xae0L\x9aJT\x02\x1f\xbfN\xa3M\x5c\
-^\x98_\x9b\xc6*\x97\x17\xe7)\x03Q\x0d\xafO\x1f\
-\xe2\x99\xf7\xf8A\xc3Nq\x9dnz\xcd%^\x07\xfb\
-\xe8\xfbe\xfb\x1cs\xf5;/w\xb5\x97U\xe8\x094\
-\xfa\x1f\x0e\x0c*\x81\x80\xef/\xe4K\xc4'\xd5\x97\xa4\
-\xc6\x1b\xab\xbb\xa7\x1a/\xdfW\xd3\x1f\xab\x11\xb6=y\
-\xcdYjOK\xb4\x0e\xed\x89\xa4\x95B\x7f\xacy\x83\
-s\x7f\xa4\xe3 \x96S\xda\xa3\x00\x22]a\x84\xbb\xc2\
-\x96C\xd2k\xacb}\xea\xf1S\xdb\xd3\x95\x8f\xaf\xf1\
-f\xa6\xbcf\xfe\x88f\x1ec\x1b<\x1e\xbc\xfe\xbb\x9d\
-\x07\xdcv@\xad\xff=\xb8\x96vs\x1do\x1c\xeb\xec\
-\x8a\xf8w\xbe\xe8\x9eo\xd6\xad\xeeWK\x01\x7f|\x8d\
-35\xcd\x14@\x8f\x9f\x96\xe6\xd4\x9f\xa45U\xb1_\
-D\xdf_Q[44\x9atw5Um\x7fr\xf4\
-t2jR\x84\x02!DB\xa6\xe6\xf8%\xab\xd1\xe6\
-\xbf\xc6\x9b\xe4\xd3\xc5\xde\xec\xefG\xd3\xed\xfb\x0c\xb9t\
-p\xb1w\xbb\x7f7Z\xa6\xccu\xbcI\xd8\xe9\xb7?\
-\xf3\xc8\x0bo\x86O\x00 G=X\xb4\xe0@|*\
-)\x12\x87\xedb\xbeR_Z5^-)9\xf4\xa7\
-\xaf?\x9d\x0c\xd1\xe8\x84PW\x184b\xda\x88/\x11\
-!\xa6\xae\xf1\xea\xca\x8b}JE#\xeeNT\x84\x9a\
-\xd6\x96\x7f\xf3\xd0\x91\xfe\xb7.\x99Z\xf5\x7fp-\xa3\
-\xe6:\xde$\xed\xf5\xaf\xbe?\xfcW7\x7f\xfcP{\
-sY)1\x88\x1f\x90\x17u\xa2\xa7\x939\xe7'\x88\
-\x22\xd0\x91\xb2H>\x8eD\xac\x10\x98\xd0\x1f\x1b)n\
-GO'\x0b\x87\x22\x88\x84\x22\x88\x04\xc3\x88\xba<\x91\
-X\xe5\x8bNj\xc4(\x8e\xaf;O\x17\xebiya\
-\x9eR\x7f\xba\xd8\xdb>/\x0d\xfem\xcf!WM\x1e\
-\xe0>Y,\x1b\xe6:\xde\x14\xed\xa4\x7f<\xf9\xd4\xab\
-\xef\x85\x8f\x04\xf5\x96J\xe4\x91\x82\xc6K\xd4|@ \
-\x96h\xa6\x96\xdc4D\xa7%W\x95d\x12\xf4\x07P\
-\xea\xe5Xh#L}\xbeC{\xc2\xdf\x89\x08\x1c\xca\
-x\x9c\xdb\x93\xf39E\xea\xfb\x0bB`F\xa2o\xeb\
-\x0d\x07#\xd6\x97t*\x01:\x13\xa3~^\x93//\
-\xf4W\xe8k\xea\xc4\xaa//\xee\xcf\xf6\xd1\xf5\xcf\x89\
-\xc0A\xf0\xf6\xb8*c\xe9\xbf\xf6\x1dv1\x5c\xcb\x9a\
-\xb9\x8e\xb7\x1b6o\xf9\xea]\x8f\xbb\xee\xb5\x97\x9a\x1a\
-\xfaWP\xa0\xd4\x8d\xe3\xcd\xbf8^jRDB\x11\
-\x84\xbbB\xa0&\xcd\x82F\x9b\xff\x1a/K\xb3\xfa<\
-\x1e\xbcy\xf1\xb4\xaa\x7f\x1f^W\xfa:\x5c\xcb\xaa\xb9\
-\x8e\xb7\x07v\xc9\x83\xb3\xeexxV\xd3\x19f\xa4\xb0\
-<.\xd1\x81\x9f,9\xd5x\xb5\x04\xaa\xef\x0f'(\
-\xcd\xf6\xa4\xdaKO\x7f\xec$h\xef\x8f\x98\x8e\x84\xa2\
-Q\x09\x91\x90\xa9%<i\x9cI\x11c\xba\xca\x8b\xe9\
-T\xca\xeb\xea\xb3\xe7CH\x13%-\xcdw4={\
-D%]u\xf3\xde\xc3\xaf\xa8,\xf44\xc2\xb5\xac\x9b\
-\xebx{h\xcb6\xd5\x8f>\xee\x86\x17_Z\xb5\xb2\
-_\x1d!\xa4\x14`d\x07\x0d\xb9\x09\x84\x12Os\x95\
-H\xc9\x89@eB\x94\xca\xa9\xa4\xe8\x18\xd5 \x10Q\
-75^\xa9\xdeD\x1ao\x06\xde2LM\x13f\xc8\
-D8\x18\x86\x196\xf5Q I\x13\xabp|\x92.\
-\xaf\x99\x97\x1e\x97\xcf\xd8[\x86g\x17x\xcd\xe0U3\
-\x86\xdc\xb4\xd7P\xff'p-g\xe6:\xde4\xd9\xed\
-\xaf\xbe\xf7\xbb\x1b\x1eZyu$XZ\x09@&3\
-\x82\xf8\x9ajl\x03'L7\x8e7^\x7f\xcc\xb0\x19\
-\x95\x11\x82\x91hD\x824\x7f*\xe1\xe9\xe7%\x9eF\
-\xab\xcbw\x22\xde\xee\x95\xcf~\x1c\xafa`\xf6~u\
-\xc5\xef\xffq\xf7!\x7f\x83k97\xd7\xf1\xa6\xd1\x1a\
-Z\xdb\xaa\x8e\xf9\xdb\x93//\xfc\xbe\xdfd\x00\xe5\xf1\
-4S\x80\x91\x9b\x1b\xc7\x9bH\xe3\x05\xa2\xbf$\x8b\xc4\
-\xc8\x96\x99N\x13\xcd\x9dF\x9b\xb7\x1a\xef{\x83\xca\x8c\
-\xfa[\xf6\xab\xbd\xbc\xb6\xac`\x1d\x5c\xcb\x0bs\x1do\
-\x06\xec\x91\x0f\xe7\x9e\xf1\xc7\xfb\x17\xdc\xd8\xde\x5cQJ\
-\x08\xe4w\xbc9\x10dV4^-)9\xf4'\xc7\
-q\xbc4bFC\xbf\xd8+\xd0m\x04H\x94r\xf1\
-4V\x96\xce\xa5\xc6\xab+/\xceA\xfa\xe3x\xbd\x1e\
-\xfa\xf6\x05\xbb\x0c\xba\xeb\x981\xe5\xb3\xe0Z^\x99\xeb\
-x3h\xd7=\xf7\xfauw\xbd\xb4\xe1\xfc`G?\
-\x1f\x05\xad\xd0k\xbcn\x1c/\x10\xfdR\x8c\x86)\xc2\
-\xa1\xa8|`=\x94\x1e\xb0\xed\x9f\x8c&*\xcdG\xdc\
-8\xd8>\x19\xc7\xfb\xde\xae5\x85\xf3\xae\xdd\xab\xe6:\
-\x7f\x81\xe1\xbe\x1d\x22\x0f\xcdu\xbcY\xb0\x8b\x1fx\xe1\
-\xdfO\xbf\xdd\xfa\x8bH\xb0\xa4J&;\x1d\xb1D3\
-U\x02\xb5\xe8H%S\x1d\xb9\xaa$\xa4\xb6G\x10_\
-s\xb60U!,\xc7|\x87\xf6\x84\xbf\xc5|3b\
-\xc2\x0cG\x10\x09E?\xcd\xb0\xee\x97c\xc2\x9c\xa4\xa8\
-\xd12\xe2\x8bG\x88\xd9+\x9f\xdcx\xba[^\xdc\x9f\
-\x10|P[a\xac\xfb\xf3\x9e\xb5\xd7\x8d\xae,\x5c\x06\
-\xd7\xf2\xd6\x5c\xc7\x9b%k\xe9\xec,\xbf\xe0\xde\x97\xee\
-z\xf3\x13\xf30D\x8a*\x01\x08\xc4k'V+\xbf\
-\x97\xc7\xf1F\xc2f4\xa66\x1c\x01\x0d\x9b\x08\x87\x84\
-_\x8c\xc5\x89\x02\xb0\xb5\x0b\xae\xf9\xc6\xd3D\xb7S\x8d\
-\xf7\x83~~\xb3\xe5\xca=\x86\xdd4c\xa8\x7f.\x5c\
-\xcb{s\x1do\x96mcSS\xcd\xd9w\xce\xba\xef\
-\xf3\xf9E3\xa8\xe9\xad\xcc\xaa\xc6\xab%\xd0\xe8\x7f\xb4\
-\xe4\xca\xa8J\xdd\xaei/J\xb1&\xcc\x08\x85\x19\x8e\
-\x80Fh\xf4\x95\xe6\x0a)'\xd6hY\x7fD\xe2L\
-\xa5\xbcJ\xa4\xc2\xf8\x08\xb1\xd5\x97\xbd\xf2\xfa\xf1$.\
-\xaf\xab\xcfJ\x7f\xe4/\x22\x1d\xbf\xde\xb5\xfa\xce#G\
-\x97\xbf\x0a\xd7z\x8d\xb9\x8e7G\xf6\xc3\xc6\xcd\xe3\xcf\
-\xfd\xef\xab\xf7,\x5c\x5c1\x99\x10R\x99\xefq\xbc\x91\
-\xb0\x09P\xc04#\x80I`\x9a1\xe7\x1a\x8e\x80\x9a\
-\xd4\xaa\x9f\xed\xaf\xa6\xd3\xa9\xd1\xa6\xa7\xbc\x8eX\xbbS\
-^\xd7\x9f\x9e\x96O\x18\xc7\xfbQiQ\xb8\xed\x8c\xa9\
-\xb5\x8f\xfclB\xbfg\xd5\xb5\xe5Z\xfe\x9b\xebxs\
-l\xff|\xee\x8b\xdf\xdd\xf0\xd0\xb7\xd7\xb4\xb7\x15\xf8\x0d\
-\xaf\xe13\xbc\x06\x0c\x8f\x01\xf6\xe9\xf1x@<\x04\x86\
-\xd7\xa3%\xdaT5^f\xd1\xc3N\x01\x1a\x0b\xd92\
-)L\xd3\x04L\xc04MP\x13\xa0f\xf4K.j\
-\xca!gV\xbbj;\x12\xb1\x09\xdb4\xfb\xa7V\xbe\
-;q\xb8=-\xaf\xf67\xfexR+\xdf\xed8\xde\
-O\xfa\xf9#M\x97\xce\x18~\xfb\x01#\xcb\xdc\xe7\xe4\
-\xf6bs\x1do\x9e\xd8\xad\xcf|\xfe\x87\xbf?\xb2\xf0\
-\x8a\xa6\xad\xb4\x82\x18\xd1\x80LF\xb6\x86\x11\xd3\xfa\x88\
-\x01\x10\xc0\xf0\xc44AO\xf4\xa44\x8c\xd8v\xc3\x00\
-%12\x8a\xbdI\x80\xbd\x90\x91\xbd*\x9e&\xd0D\
-\x01\xd8\x09Z\xab\xb1fB\xa3M\xa6\xbc\x8eX\x9d\xc7\
-\xd3G4\xdeO\x06\x95\x87\xeb/\xdfs\xd4\xad\xbb\x0f\
--q5\xdc>`\xae\xe3\xcd3\xfb`\xfe\xfa\xfd\xce\
-\xbe\xf9\xdd\x07V\xad\x0a\xd5\x81\xc0p\x224\xae\x11\x22\
-\x16\xa1\xa0\xd1d\x93 NN\xc4\x9a\xa8\x8a\x9c\x96g\
-\xfb\xa7Z^\x9d\xaf\xf8\xf3\x91\x5c\xf9\xdc\xc4\xf1\x12\x03\
-\x9f\x8c\xac2W\xfdy\xdf\xd1\xd7\x8d\xae,r\xa3\x14\
-\xfa\x90\xb9\x8e7Om\xed\xe6\xf6\xe1\xbf\xbc\xe9\xad\xc7\
-\xe6\xcck\x9a\x09\x10\xaf\xac\xd9&\xd6$YZ\xab\x15\
-\xa7P\x9e\xa5\xbbK\xbc\xf6\xf2,?\x9d\xe5\xfbT\x1c\
-\xef\x1c\x8f\x97\x98Sk\x8d\xf9\x7f\xdew\xccuU~\
-o\x83fy\xb8\xd6\xcb\xcdu\xbcyn-\xed\xa1\xf2\
-\xcb\xfe\xfb\xe9mO\xbd\xb9\xea\xe4`\x90\xfa\x08!^\
-@G\x5c\x10\x88*\xb1\xa6i\xd7(\x85:\xbbU>\
-\x7f4^F\x90v\xe2\xccE\xf9$\xc7c\x909\xfd\
-J\x83-\xc7L\xaa|\xe9\xdciu\xf7\xc6[\x13\xae\
-\xf5~s\x1do/\xb2G\xdf\x5cv\xdau\x8f|~\
-\xed\xba\x0d\xa1Z\x00\xbe\xd4\x88W$V\x96\x9fK\x8d\
-\xd7\x8d\xe3%\x84\xcc\xf5z\xcd\xf0\xce\xc3\x8d\xf9W\xec\
-5\xee\xe6\xa1\xe5>\xf7Y\x0a\xdb\x89\xb9\x8e\xb7\x17\xda\
-\xc6\xad\x9d5\x17\xfe\xe7\xc3;?\xf8r\xcb~\x1d\xed\
-\xa6\x9f\x80\xf88qE\xf7ID\x98\xf15V\x96\xdf\
-W4\xde<\x8b\xe3%\xe4\x8b!\xfd#\x1b\xce\xd8\xa5\
-\xee\x91\xa3'\xf4\x9f\x95\xdcQw\xad/\x99\xebx{\
-\xb9}\xb5t\xeb\xaeW=0\xf7\xa6\xcf\x174N\x0f\
-\x05\xe1\x03P\xa4\xd7(\xa3Q\x112q&&f^\
-^G\xac\xdd)\x0fU\xd3\xdc^\xe2x\xe7\x15\x17\xa1\
-c\xbf\xd1e\x1f\x5c\xb2W\xdd\x1d\xfd\x8b\xdc\x07\x90o\
-\xcf\xe6:\xde>d\xaf~\xb6\xee\xc8\xbf?\xfd\xcdU\
-\xdf.i\x9eb\x9a0@\xf8[\x91\xb7'\x8d7=\
-\xe5\xd5\xfe\xc6\x1f\x8fC\xf9y\xfe\x22\xda1\xa5\xb6h\
-\xc1\xe9\xd3\x86?\xb2km\xe9\xbc\xa4\x0f\xa6k}\xda\
-\x5c\xc7\xdbG\xed\x959k\x8f\xfa\xef\xff\xbe\xbf\xf0\xcb\
-E\x8d\xbb\x06\xbb\xe0\xa3\xd6\xbb\xe1\xf2E\xe3\x15\x893\
-\x95\xf2:bu\x1eO\x965\xde\xaf\x09\xa1fU?\
-4\xec?\xba\xea\xfd\xd3w\xadytpY\xc1\xa6n\
-\x1eB\xd7\xfa\xb0\xb9\x8ew;\xb0E\xab\x9b'\xfe\xfd\
-\xd9o\xaez\xff\x9b\xcd\xfb57\xd3\x0aPZ\x9ay\
-\x8d\xb6\xa7\xe5\xd9\xfe\xa9\x96W\x89U,\x9f\x11\x8dw\
-\xbe\xd7C\xc3\xa3\xab}\xcb\x8e\x99<\xf4\xa5\x9fO\xad\
-r\x7f\xc2\xebZBs\x1d\xefvf\x9d\xc1\x88\xff\xae\
-\xd7\x16\x9e\xff\xc2'+\x8e_\xb668:\xd0A\x8b\
-\x88A\xf8\xc3\xda\xa1\x12\x1d\xdc8^\xb9\xfc\x02o\x01\
-\x09\x0f(7\x1bf\x8e\x1c0\xf7\xf8)C\x9e\x9b<\
-\xa4da\x0f\x0e\x89k\xdb\xa1\xb9\x8ew;\xb7\xc6\xd6\
-\xae\xcaW\xe6\xae9\xea\xa5\xcf\x7f<\xf6\xfb\x15m\x93\
-\xb75\xa3\xc2\x8c\x10\x83\x10T\xf4V\x8d\x97\x11l\x9a\
-\xe2x\x17\x14\x16\xd2\xe0\x90\xfe\xd80mD\xd9\xfcc\
-'\x8f|aJM\xc9\x82\xb4\x1d\x00\xd7\xb6Ks\x1d\
-\xafk6[\xb6\xbeu\xf4\xfd\xef~{\xceG\x0b7\
-\xef\xb3fcxx\xa0\xd3[\x14#\xbe\xca>\x1e\xc7\
-\xbb\x90\x10\x8a\xca~\xa4q\xe2\x90\x92E\x07\x8e\x1f\xf2\
-\xeeO&V\xbe\xee\xf7y\xdc\xb78\xb8\x96Vs\x1d\
-\xafkI\xd9\x17?l\x9d\xfe\xca\xbceG\xcf_\xb1\
-u\xea\x9a\xfa\xc0\xf0\xe66Z\xde\xd9i\xf8c\x84X\
-\x95\xdf\x1a\xaf\xd4\x9f%\x00\xe0) \xe1\xe2B\x1a\x18\
-\xd8\xcfS?aH\xbf%\xd3G\x0c\xfc|\xc6\xc8\xf2\
-\xb9\xc3+\x8b\xd6dv&]s\xcdu\xbc\xae\xf5\xd0\
-64v\xd6\xac\xa9\xef\x18>\xfb\xfbe\x07-\x5c\xb3\
-m\xc7\x95\x9b;\xeb\xb6\xb5\xa0\xb2\xa3\xd3\xf0\x9b\x91(\
-\x9a\x12\x83Tg1\x8ew\x191\x88ix`\x16\x15\
-\x22PRD:\xaa\xca}\x0d\xc3*\xfdkv\x1cZ\
-\xf5\xdd\xe4\xa1\xa5\x0bg\xee\xd0oN\x16\xa7\xc85\xd7\
-l\xe6:^\xd72j\x1b\x1b\x035\x8dm\xc1\xca\xd6\
-\xcePiSG\xb8\xa2\xa1\xad\xb5j[G\xa0r[\
-GWEKg\xa8_{W\xc8\xdf\x16\x08\x97v\x84\
-\x22\xfe\xce.\xd3\x1f\x8cP\x1f\xa5\x04\xa6\x09\xc30\x88\
-Y\xe05\xc2>/\x09\xfa\xbc\x9e\xa0\xaf\xc0\x08\x16\x15\
-x\x02\x85^O\xa0\xc8\xe7\x0d\x14\x17x\x03\xfeBo\
-{eIQ\xe3\xe0~%\xf5\x03\xcb\x0a\xebG\x0c(\
-^3b@\xd1\xaa\x5c\x8f\xdb5\xd7\xe2\x99\xebx]\
-s\xcd5\xd7\xb2lF\xae;\xe0\x9ak\xae\xb9\xb6\xbd\
-\x99\xebx]s\xcd5\xd7\xb2l\xae\xe3u\xcd5\xd7\
-\x5c\xcb\xb2\xb9\x8e\xd75\xd7\x5cs-\xcb\xe6:^\xd7\
-\x5cs\xcd\xb5,\x9b\xebx]s\xcd5\xd7\xb2l\xae\
-\xe3u\xcd5\xd7\x5c\xcb\xb2\xb9\x8e\xd75\xd7\x5cs-\
-\xcb\xf6\xff\x8f\xcb\xd5E/\xf4\xa7\xcf\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00ih\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00i/IDATx\xda\xed\x9d\x07x\x5c\xe5\
-\x95\xfe\xcf\xa8Y\xd5\xb2\xdce[\xb2\xdc\x8d\x0d\x98^\
-\x13B \x94dI\xb2\x1bv\x97\xec&d\xd9\x14H\
-\xb2d\x97\xe4\xbf!\x90Mo\x94\xa5\x87P\x96j:\
-\x06\xdb\x80\x81Pm\x08\xcd4\x03\xee6\xee\xbdK\xb6\
-z\x99\x99\xff\xf7^\xeb\xda\xa3\xf1\xadS\xee\xdc{\xe7\
-\xfd\xf9\xb9\x8fdI\xa3;\xba\x1a\xdd\xf7=\xe7;\xe7\
-|\x22\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08\
-!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\
-\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\
-\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10\
-B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\
-\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08\
-!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\
-\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\
-\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10\
-B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\
-\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08\
-!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\
-\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\
-\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10\
-B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\
-\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08\
-!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\
-\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\
-\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10\
-B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\
-\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08\
-!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\
-\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\
-\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10\
-B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\
-\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08\
-!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\
-\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\
-\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10\
-B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\
-\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08\
-!\x84\x10B\x08!\x84\xd8\x10\xe1%\xe0\xef\x9b\x10B\
-\xf2\x808/\x01\x05\x81\xbf[B\x08!yo\x0a(\
-\x12\xfc}\x12B\x08\xc9C3@\xc1\xc8\x9f\xdf!\x7f\
-\xd7\x84\x10\x8a<\x8d\x00E!\x0f~w\x11\xfe\xee\x09\
-!\x14\xfc\x94?\x1fz#@\x11\x08\xd7\xef-\x92\xe6\
-\xd7\x12BH>\x88\x7f\xdc\xe1\xd7\x86\xda\x04P\x04\xc2\
-)\xfc\x91\x14M\x01!\x84\x84\xdd\x08X\xfd?\x9eO\
-&\x80B\x10\xec\xdfU$\x8d\xf7\xf9\x1a \x84\xe4S\
-\xf4o$\xf4q\x87F \x94&\x807\xff\xf0\x08\xbf\
-\xd5\xc7\x22\x0e\xb3\x05\x84\x10\x12\xe6\xa8\xdf\xe9\xdb\xbc0\
-\x01\xbc\xf9\x07W\xfc\x93E=\xf9\xe3\x05\xbdG\xa4\xf7\
-\xad\xd3\x8c\x00_#\x84\x90 F\xf8N#~\xfd\xfd\
-X\xc2\xe1\xc4\x10\x84\xce\x04\xf0\xe6\x1el\xf1\x8f\x98\xbc\
-\x0f\xc1/VG\x89:\xfa%\x98\x01\xa7\x06\x80\xaf\x0b\
-BH\x90\x8d\x80\x95\xf8\xc7{E\xbf[\x1d\x1d\xea\xe8\
-\xea\xfd\x7f\xb2A\x08\xbd\x09(\xe2\xeb'\x10\xe2o\x15\
-\xedG\x92>V\xd8+\xfe\x15'?}\xce\x15\xa5\xa3\
-*.\xe5\xe5$\x84\x90C\x99w\xec\xaca\xbd\xe2\xdf\
-c`\x1a\x22Io\x13\xef\xc1\xa10\x014\x00\xc1\x11\
-\xff\x88\x03\x03P\xd4+\xfe\xe5'\xcf>\xfb\xe7J\xfc\
-\x7f\xc0\xcbI\x08!\xa6 K\xda.\xc6YO+\x13\
-\xc0\x0c\x00\xc9\x99\xf8G,\xc4\xbf\xe2\xa4Yg_Y\
-Z_\xf9}^NB\x08\xb1\xd5@}\x894fb\
-\x02\xcc\xee\xd5\xf10\xfc\xf0$\xb8\xe2_p\x88\xf8\xcf\
-<\xeb\xca\xb2\xd1\x95\x97\xf0r\x12B\x88-\x05\xd2\xb7\
-F*f\xf2u\xa1\xcc\x02\xd0\x00\x04S\xfc\x13\xab\xfb\
-\xb1\xe6_\xa2\x89\xff\x93g]Q\xd6PE\xf1'\x84\
-\x90\xd4\x0c@\xa2\x09\xb0[\xf7\x0f\xbc!\xa0\x01\xf0\xb7\
-\xf8'\xbf_`\x10\xf9\xef\x17\xff'\x94\xf8\x8f\xa9\xba\
-\x98\x97\x93\x10B\x1cS\xd8{D\x13\xa2|\xa3V\xeb\
-xXD\x9f\x06 x\xe2_\x90d\x02\x0a\x12\xc5\xff\
-\xc4'\xce\xfaY\xd9X\x8a?!\x84\xa4\x91\x01\x88'\
-e\x01\x22a\x16\x7f\x1a\x00\x7f\x8b\xbfU\xda_\x17\xff\
-\xca\x13g|\xe1g\xe5c\xab\xbe\xc7\xcbI\x08!)\
-g\x00t\x03\x10O\xba\xef\xc6m\x8c@\xa0M\x01\x0d\
-@p\xc4_7\x00\xc5\x07\x22\x7f\x88\xff\xb8\xfe\x14\x7f\
-B\x08\xc9L\x06\xc0\xcc\x04\x84\x12\x1a\x80\xe0\x88\x7fr\
-\xe4\x7f9\xc5\x9f\x10B\xd2\xce\x00$\x1a\x80\x98\xc9}\
-X$\x84\x9d\x00\x05\xfc\xfd\x07R\xfc\x19\xf9\x13BH\
-f3\x00\xc9\xd9V\xbb\xfb7\x0d\x00\xf1X\xfc\x1f\xd7\
-\xc4\xff\xbb\xbc\x9c\x84\x10\x92Q\x03P`q?\x0e\xa5\
-\x19\xa0\x01\x08\x9a\xf8\x8f\xa7\xf8\x13BH\x86\x0d\x80\x91\
-\xe0;\xdd95\x12\xe4\x1f\x9eP\xfc\x09!$\xdf3\
-\x00f& \x12\xe6\x1f\x9e\xf8W\xfc\xfbQ\xfc\x09!\
-$\xab\x1a\x98\xdcjm&\xfc\xac\x01 \x9e\x8a\x7f\x05\
-\xc5\x9f\x10B\xb2z\x9f\xb6\x13~\xbb{;\x0d\x00a\
-\xe4O\x08!\x01\xbcW\xdb\x1d\xa1\xcd\x02\xd0\x00\xf8W\
-\xfc/\xa7\xf8\x13B\x88'\xf7k\xab\xc8?\xb4u\x00\
-4\x00\x14\x7fB\x08\xc9\xf7\x0c@(#|\x1a\x00\x8a\
-?!\x84\x10{\x13\x90\x17\x95\xff4\x00\x14\x7fB\x08\
-!y\x16\xf1\xd3\x00P\xfc\x09!\x84\xd8\x1b\x81\xd0g\
-\x02h\x00(\xfe\x84\x10\xc2\xfbx\x1e\xa5\xfei\x00(\
-\xfe\x84\x10B\xf2\x18\x1a\x00\x8a?!\x84\xf0^N\x03\
-@(\xfe\x84\x10Bh\x00\x08\xc5\x9f\x10B\x08\x0d\x00\
-\xc5\x9f\xe2O\x08!\x84\x06\x80\xe2O\xf1'\x84\x10B\
-\x03@\xf1\xa7\xf8\x13B\x08\xa1\x01\xa0\xf8S\xfc\x09!\
-\x84\xd0\x00P\xfc\x09!\x84\x10\x1a\x00\x8a?!\x84\x10\
-B\x03@\xf1'\x84\x10Bh\x00(\xfe\x84\x10B\x08\
-\x0d\x00\xc5\x9f\x10B\x08\xa1\x01\xa0\xf8\x13B\x08!4\
-\x00\x14\x7fB\x08!\x84\x06\x80\xe2O\x08!\x84\xd0\x00\
-P\xfc\x09!\x84\x10\x1a\x00\x8a?!\x84\x10\x92\xa7\x06\
-\x80\xe2O\x08!\x84\x06\x80\xe2O\xf1'\x84\x10B\x03\
-@\xf1\xa7\xf8\x13B\x08\xa1\x01\xa0\xf8S\xfc\x09!\x84\
-\xd0\x00P\xfc)\xfe\x84\x10Bh\x00B \xfe\xe2@\
-\xfc+(\xfe\x84\x10Bh\x00\xc2!\xfe\xe2@\xfcK\
-z\xc5\xffg\x14\x7fB\x08!4\x00\xc16\x03\xc9Q\
-\x7f\x81\x85\xf8WR\xfc\x09!\x84\xd0\x00\x04;\xfa7\
-\x12\xff\x08\xc5\x9f\x10B\x08\x0d@x\xc5\xdf*\xe5\x9f\
-\xf8\x7f\x8a?!\x84\x10\x1a\x80\x90\x99\x01\xbb\x8a\xffb\
-\x8a?!\x84\x90|\xa2(\xc4\xd1\xbf\x95\xf8\x1b\xa7\xfd\
-g(\xf1\x1fG\xf1\xcfG\x06\x14U\xcb\xc0\xe2\x012\
-\xb8x\xa0\xf6\xb6\xba\xa8\xbfT\x14\x96KyA\x99\x94\
-\xab\xb7e\x05\xfd$\x12)\xd0>v\x08\xf1\xb8\xb4D\
-[\xb5w\xdbb\x1d\xd2\x16m\x93\xd6h\xbbz\xbf]\
-\x9a\xba\xf7JcO\x93\xec\xeen\x94=\xddM\xd2\xd4\
-\xb3\x97\x17\x9b\x10B\x03\x90E\xf17\xfbX\xb2\x11(\
-\x14\xbd\xda\x7f\x86j\xf5\xa3\xf8\x87\xfb\xc5\x1e)\x921\
-e\xf52\xbe\xacA\xeaJG\xca\xa8~\xb52\xb2\xf7\
-()(\xf6\xe49t\xc5\xbaeS\xe7\x16\xd9\xd2\xb9\
-M\xbd\xdd*\x1b;6\xcb\xaa\xf6\xb5\xb2\xb6}\xa3\xf4\
-\xc4{\xf8K\x22\x84\xd0\x00d8\x13`\x14\xfd\x17&\
-E\xfe\xdf\xe3\xcb!\x5c\x0cR\xd1\xfcQUSeZ\
-\xe5T\x99T>^\x89\x7f\x9df\x02r\x09\x8c\xc6\xd8\
-\xb2\xd1\xda\x91HO<\xaaL\xc0\x06Y\xde\xf6\xa9,\
-jY&\x1f7/\x96]\xdd{\xf8K$\x84\xd0\x00\
-\xa4\x11\xfd\x9b-\x01\xc0\x00\xf4;\xf1\xc9\xb3~Z>\
-\xa6\x8a\xe2\x1f\x92\x08\x7f\x9a\x12\xfcS\xab\x8f\x97\xe3\xfa\
-\x1f\xa5E\xf8\xc1y\xee\x852\xa1|\x8cv|y\xf0\
-\xd9\xda\xc7\x90%xo\xdfG\xf2\xf6\xde\xf7\xe5\x93\xe6\
-\xa5\xd2\x1d\xef\xe6/\x99\x10B\x03\xe0\x22\xfa\x171\xae\
-\xfe\x87\x01(U\xe2\x7f\x09_\x06\xc1\xa5@\xad\xcb\x1f\
-\xaf\xc4\xfe\xac\x81\x9f\x93\x13\xfb\x1fc\xbcF\x1fPF\
-\xf4\x1b.\x7f?\xe4\x8b\xda\xd1\xa6j\x0a\xde\xdd\xb7@\
-^\xde\xf3\xba\xbc\xbf\xefc\x89\xaa\x8c\x01!\x84\xd0\x00\
-\x18\x9b\x00\xb3\xc8?1\x03P\xc4\x97@0\xa9\xed7\
-L\x8b\x94\xcf\x1ax\x9a\x96\xea\x0f;\xe5\x85e\xf2\xf9\
-\x9aS\xb5\xa3Q\x15\x13\xbe\xd2\xf8\x86<\xb3\xf3\x05\xd9\
-\xac\xb2\x04\x84\x10\x92\xaf\x06 b\xf2~\xf2\xc7\x8c\xa6\
-\xfe\x15\xf2%\x10,&\x96\x8f\x93\xf3\x87\xfe\x9d\x9cQ\
-\xf3\x19)\x8c\xe4\xe7\xaf\xafFu)\xfc\xd3\xd0/\xcb\
-?\x0e=O\x164/\x92Y;\x9e\x93\xf9{?\x94\
-\xb8\xfaG\x08!\xf9\x9e\x01H\x16\x7f\xb3\x16\xc0\x02\xbe\
-\x04\x82\xc1\x91\x95S\xe4\xbb#\xbe!\x87WN\xe6\xc5\
-8\xf0\xa2\x8e\xc8\xb1UGj\xc7\xe2\x96\xe5r\xf7\x96\
-\x87ea\xcbR^\x18BH\xde\x1a\x80D\xb17\x12\
-\xff\x083\x00\xc1\x01\xd5\xf2\x17\x8f\xbcPN\xe8\x7f4\
-/\x86\x050F7M\xfc\xbdV4x\xc7\xa6\xe9\xb2\
-\xaecc^^\x87\xb9\xc7\xcc\xf4\xf4|g,8\x9f\
-/>B\x03\x90\xe3\x08?\xf9}#3\xc0\x0c@\x80\
-\xe8\xa7\x06\xef|}\xd8\xdf\xcb7\x86\x7f-\xe7\xad{\
-A\x02F\xe9\xd8\xc3\x8e\x94\xa7U}\xc0=[\x1e\x91\
-v5\x98\x88d\xf3\x06\x14\xe1\xd2\x0b\xa1\x01\xf0y&\
-\xc0\xca\x08\x10\x9fq\x5c\xffi\xf2\xdf\xf5?\x94\xa1%\
-\x83y1R\x00\xb5\x11_Su\x12\xa7\x0c8^\xae\
-^\xf7g.\x0bd\x11t\xa1\xb0#\x83\x04\xf6\xf5\x1b\
-b\xd17\xfaxr\xf4\x1f\xe1K\xc0_\xc2\xf5o\xb5\
-\x17\xc85\xe3\x7fI\xf1\xcf\x00\xc3K\x86\xca\x8d\x13\x7f\
-'\x97\x8e\xfa\xb66g\x80d'\x03@\x083\x00\xcc\
-\x00\x904\x80\xe0\xffn\xec\xe5Z\x95?\xc9\xac@!\
-\x1b0\xa1|\xac\xfcz\xcd\xb5j/\x82}\xbc(\x19\
-\xcd\x00\xa8[\x09W\x00\x083\x009\x17{7F \
-\xb1\x18\x90\xe4\x18L\xbf\xfb\xf3\xa4?Q\xfc\xb3\xc8\x11\
-\x95\x87\xc9_&_#\x0d\xa5u\xbc\x18\x19\xbd\xf1\xf0\
-\x16Bh\x00\xfc(\xfa\xc9_c\x96\x09 9\xe4\xb4\
-\x01'\xc9\x9f'^%C\x8a\x07\xf1bd\x99Z\xb5\
-$p\xab2Zh\xa9$\x99\xba\x81\xf2\x16Bh\x00\
-\xfcl\x10\xccZ\x02i\x00r\x0c\xa6\xda\xfdr\xccO\
-<\xdb\x89\x8f\x88\xb6\xb5\xf15\xe3\x7f!\xc7\xaaBK\
-\x92\x81\x9bL\x84\xb7\x10B\x03\x10\x84\xcc\x80\x99\x09 \
-9\xe0\xec\x81\xa7\xcb\xff4\x5c\x96\xb7\xd3\xfcr\x09Z\
-,\xff0\xf6\x0a\x9a\x80\x8c\xdclx\x0b!4\x00~\
-\x11\xfe\x88C\xd1\xa7\x01\xc8!'U\x1f+?\x1d\xfd\
-C\xad\x85\x8a\xe4\xca\x04\x94\xc8o\xc7\xfcT\xab\xbf \
-\xe9\xdc@\xf9\x1a&4\x00A\xcd\x08\xd0\x00x\xcc\xa4\
-\xf2\xf1\xf2\xab1\xff\x8f\x91\xbf\x0f\xc0\x06C\x7f\x1a\xf7\
-?2\xacd\x08/F\xaa7\x17.\x01\x10\x1a\x80@\
-d\x03\x84\x91\x7fn\xc1\xae}\x7f\x1aw\xa5\x94\xaa\x14\
-4\xf1\xcb\xef\xa4Fk\xbf,\x8e\xb0\x0e#\xb5\x1b(\
-o%\x84\x06 \x88\x86\x80F\xc0C\x10\xf1\xffr\xcc\
-\x8f\xb5\x9d\xec\x88\xbf\xc0\x8c\x80\x1f\x8e\xba\x88\x17\x22\xa5\
-\x0c\x00\x97\x00\x08\x0d\x00!\x96|\xbb\xf6_\xd8~\xe6\
-c\xbe:\xe4\x5c9\xbd\xe6\x14^\x08f\x00\x08\x0d@\
-^f\x04H\x96\x98R1I.\x18\xf6U^\x08\x9f\
-sY\xdd\xc52\x90\x19\x9a\x14n%\x84\xd0\x00\x04A\
-\xe8)\xfc\x1e\x83j\xf3+\x1a.\x0d]\xc5\x7fK\xb4\
-U\x9a\xa3-\xa1\xfa\x99\xfa\x17U)\x13p\x09_\xb4\
-\xcc\x00\x90<\x81\xfb\xac\x92\xacrQ\xed\xd7eT\xbf\
-\x11\x81y\xbe\xdb\xbbv\xca\x86\x8e\xcd\xb2\xa5s\x9bl\
-\xd6\x8e\xad\xda\xfb\x1d\xb1Ni\x8b\xb6Kg\xbcS\xba\
-b\xdd}\xff\x88\xd4v\xc5e\x05\xa5RVX\xaa\x15\
-8\x0e/\x19&#\xfb\x0d\x97\x11\xea\xc0\xdbQ\xa5#\
-\xd45\xa8\x0d\xc4\xcf\xff\x99\x01'\xc8\xe7\xd4R\xc0\xeb\
-\x8do\xf3\xc5\xeb$\xc2`\x17\x00\xa1\x01\x08t\x86\x80\
-d\x09\x88\xdf\xf9j#\x1a?\xb3\xa7\xbbI\x16\xa9\xed\
-r?l^(\x1f\xee\xfbD\xb6v\xedp\xfd=z\
-\xe2=Z6@\xcf\x08\xc0@$3\xa0\xa8Z\xa6U\
-M\x95#*&\xcb\xe1\x95\x93\xb5\xc2;\xbf\x0e\x91A\
-A\xe0\xbb{?\xd4L\x0f\xb1\xcb\x00\xb0\x8c\x8a\xd0\x00\
-\x10r\x08?\xaa\xfb\x8e\x16\x1d\xfb\x0dD\xf2\xf3\x1a\xdf\
-\x94gw\xbd\x22+\xdaVyr\xce\xa6\x9e\xbdZT\
-\xadG\xd6\xc8\x08\x9c9\xf049{\xd0\xe9\xda\x8c~\
-?\x81}\x19\xbe>\xec\x1f\xe4\xfe\xad\x8f\xf1E\xcc\x0c\
-\x00\xa1\x01 \xc4\x1d'\xf4?Z\x1d\xc7\xf8\xea9\xad\
-i_/\xb3w\xfeU\xe6\xeeyC\xdac\x1d9}\
-.\x9b\xd4\xd2\xc2\xf4\xad\x8f\xcb\x03[g\xc8\xa9*\xed\
-\x8e\x22\xc9\xa9\xaaX\xd2/\xe0\xf9<\xbb\xeb%\xd9\xd5\
-\xbd\x87/f\xcb\x0c\x00\x0d\x00\xa1\x01 \xe4`T\xa4\
-\xfe}{\xc4\xbf\xf8\xe6\xf9 \xad\x7f\xcf\xe6\x87U\xd4\
-\xff\x96\xda\xba\xdd_\x9b\xb7\xe3\xf9\xbc\xd9\xf4\xaev\x9c\
-\x5c}\x9c\x5c<\xf2B\x19]:*\xe7\xcf\x0b\xc5\x9b\
-\xdf\x1c\xfe\x8fr\xd3\xc6\xff\xe3\x0b\xda\xf2\xb5\xce%\x00\
-\x12d\x03KH\x869u\xc0\xf12\xb1|\x5c\xce\x9f\
-G4\x1e\x95G\xb7\xcd\x96o/\xbdL\xe6\xaa\x94\xbf\
-\xdf\xc4?\x99w\xf6~ \xdf[\xf6\x13\xb9g\xcb#\
-\x87\x14\x1a\xe6\x82/\x0d>S\x154\x0e\xe5\x0b\xda\xca\
-\x000\x01@h\x00\x089\x18\xfd\xa3\xf2?\xd7\xa0\x9a\
-\xff\xb2\x95\xbf\x94\xbb\xb6<$\x9d\x01*f\xebQ\xa6\
-\xe5\xe1m3\xe5\xd2\x15W\xaae\x82-9}.\xa8\
-\xdf\xf8\xd7\xe1_\xe3\x8b\xda\xf2\x06\xca[(\xa1\x01 \
-D\xe3\xf8\xfeG\xc9\xd8\xb2\xd19}\x0eK[W\xca\
-\x0f\x96_.KZW\x04\xf6:\xaej_+\x97,\
-\xfb\xa9\xaa\xc6_\x90\xd3\xe7q\x8e*R\xe4p k\
-\xc3K\x08\x0d\x00!\x8a\x7f\x1c\xfa\xe5\x9c\x9e\xff\xad\xbd\
-\xef\xc9O>\xfd\x95\xaa\xba\xdf\x17\xf8k\x89B\xc5_\
-\xae\xb9Z[\xbe\xc8\x15\xd8$\xe8\xcb\x83\xcf\xe1\x0b\xdb\
-\xec\x06\xca\xbd\x00\x08\x0d\x00!\xa2E\xfe\xc7\xf6?2\
-g\xe7\x7f\xb3\xe9=\xf9\xed\x9a\xeb|\xb1~\x9e)\xb0\
-$p\xd5\xba[r:\x98\xe7\xabC\xce\x91\x92\x02\xee\
-\x16\xc8\x0c\x00\xa1\x01 \xc4\x84\xaf\xa8H1W7\xc4\
-\x15m\xab\xe5\x8f\xebn\xd2\x043l\xa0\x98\x11?\xdb\
-\xc7\xcdKrr~\x0c1\xfaL\xf5\x89|\x81\x1bf\
-\x00h\x00\x08\x0d\x00\xc9s\xfa\xa9\x11\xb8g\x0e\xfcl\
-N\xce\xbd\xb3{\xb7\x5c\xb9\xea\x8f\x81*\xf6K%\x13\
-\xf0\xbb\xb5\xd7i?k.\xf8\xd2\xe0/\xf0En\x98\
-\x01\xe0-\x94\xd0\x00\x90<\xe7\xf3j~|Ea\xb9\
-\xe7\xe7Ek\xdf\xd5\xeb\xfe\xacM\xda\x0b;\xa8k\xf8\
-\xe3\xda\x9b$\x16\x8fy~\xee\xa3\xab\x0e\xd7\xf66 \
-\xc9\x06\x80\x10\x1a\x00\x92\xe7\x9c;\xe8\x8c\x9c\x9c\xf7\xc9\
-\x1d\xcf\xcaG\xcd\x8b\xf2\xe6:/T\xfb\x16<\xbd\xeb\
-\x85\x1c\x08]D\xbe\x90\xa3\x0c\x8f\xaf\x0d\x00\x8b\x00\x09\
-\x0d\x00\xc9g\x06\x15\x0f\x94#*\x0f\xf3\xfc\xbc;\xba\
-v\xc9\xfd[\xf2o^=\x06\x05\xed\xce\xc1\x88\xde3\
-jh\x00\x0e\xbd\x812\x07@h\x00H\x1e\xf3\xf9\x9a\
-SsR\xfc\x87Y\xfa\xb9\x9e\xe9\x9f\x0b\xb0\x99\xd1\xc3\
-\xdbfy~\xde\xfa\xd2\x91\xd2PZ\xc7\x17|b\x06\
-\x80\x06\x80\x04\x18\xee\x05@\xd2\xe6t\xb5\xfe\xef5\xdb\
-\xd4|\xff\x97\xf7\xbc\x9e\xb7\xd7\xfc\xf9\xdd\xaf\xc87\xd4\
-\x94>d_\xbc\xfd]\x9f\x9a\xd1]\x02\xe7\x1e33\
-\xd0\xbf\x87K\xd5\x8e\x97-\xd1V\xed\xfdB\x15O\x95\
-\x17\x96Y~}YA\x99\x9a\xb0Xh\xfa\xf9B\xf5\
-\xb9\xb2\xc2R\xcb\xefQQP~`\xfe\xc0\xf5\x1bn\
-\x97\xe7\xd4\xae\x96\x84\xd0\x00\x10\xcf\x19T\x5c#\x87U\
-L\xf0\xfc\xbc\x98\xf1\x1f\xc6\x96?\xa7`\xd6\xc1\x8c\xed\
-\xcf\xc8\x0fF]\xe4\xe9y\xb1a\x11\xb7\x09>\xc8\xa4\
-\x1c\xefy\x11\xcdAA(\x09\x0f\x5c\x02 iqR\
-\xf5\xb1\x9e\xa7A\xd1\x0a\xf7\xc2\xeeyy\x7f\xed\x9fQ\
-\xdb\xf5z\xdd\xfd0\xbe\xbcA\x06{\x9cu \xe6\xc4\
-\x85\x06\x80\xd0\x00\x90\x1cqb\xffc<?\xe7\x9c\x9d\
-/Jw\xbc;\xef\xaf=\xe6\x1e<\xbf\xebUO\xcf\
-\x09\xb3wb\xf51|\xe1\xfb\x84\x183\x00\x84\x06\x80\
-\xe4\x02\xec\x16wL\x95\xb7\xa3\x7f\xd1\xf7\xffR\x1e\xaf\
-\xfd'\xf3\xd2\x9e\xd7<?\xe7\x09\xfd\x8f\xe6\x85\xf7\x8b\
-\x01\xf0\xf9\x16\xd7\x84\x06\x80\x84\x94)\x15\x13m\x8b\x9e\
-2\xcd\x02\xd5\xf3\x8f\xf6?\xb2\x9f\x0d\x1d\x9bey\xeb\
-\xa7\x9e\x9e\xf3\xa8\xca\xc3Y\xfd\xce\x0c\x00\xa1\x01 \xf9\
-\xccQUS\xbd\x8fx\xb9\xf6o\x90\x05\xf06#R\
-UT\x99\xf3-\x9f\x093\x00\x84\x06\x80\xe4\x90i\x95\
-\xde\x1a\x00\xf4\xfc\xbf\xd1\xf4./|\x12\xd8.\xd8\xeb\
-\x8e\x88\x5c\x98?\xc2\x0c\x00\xa1\x01 >\x00\xfb\xc4O\
-\xa9\x98\xe4\xe991\xf2\xb7#\xc4\x1b\xfe\xa4\xca\xbe\x9e\
-fY\xda\xba\xc2\xd3s\x1eY9\x85\x17\xde\x07\xb0\x0b\
-\x80\xd0\x00\x10\xcf\x99P>F\xed\x00X\xe2\xe99\xdf\
-\xdd\xfb\x11/\xbc\x09\x1f\xec\xfb\xd8\xd3\xf3M*\x1f\xcf\
-\x8b\xee\x038\x07\x80\xd0\x00\x10\xcf\xc9\xc5\xf0\x9f\x0f\x9a\
-?\xe6\x857\xe1}\x8f\x0d\xc0\xd0\x92\xc1R]\xd4\x9f\
-\x17>\xe7\x19\x00\xd6\x00\x10\x1a\x00\xe21\x93\xcb\xbd5\
-\x00\xeb;6\xc9\xd6\xce\xed\xbc\xf0&\xacl[\xe3\xf9\
-P\xa0q,\x04\xcc9\xac\x01 4\x00\xc4{\x03\xe0\
-q\x06\xc0\xeb\x14w\x10#\xc1\x05\x1eo\x8b<\xbe|\
-,/|\xae\x0d\x00k\x00\x08\x0d\x00\xf1\x92\x8a\xc2r\
-\x19\xd1o\x98\xa7\xe7\x5c\xd8\xb2\x8c\x17\xde\x86\xc5-\xcb\
-==\xdf\x84\xb21\xbc\xe8\xcc\x00\x10\x1a\x00\x92O\xa0\
-\x07\xdc\xebA0+\xdaV\xf1\xc2\xfb\xec\x1aM`\x06\
-\xc0\x07\x19\x00\xd6\x00\x10\x1a\x00\xe2!c\xca\xea==\
-\xdf\x9e\xee&N\xffs\xc0\xea\xf6uj\x1e@\x8fg\
-\xe7\xab+\x1d\xa1\xb6\xb7-\xe5\x85g\x06\x80\xd0\x00\x90\
-\xbc\xc9\x00\x94z[\xfc\xc5\xe8\xdf\x19\xd8\x22xm\xfb\
-\x06\xcf\xce\x87,\xd0\x18\x16\x02\xe6\x14v\x01\x10\x1a\x00\
-\xe2)\xa3\xcbF\xd1\x00\xf8\x94\x15m\xab==\xdf\x98\
-\xb2:^\xf4\x1c\xc29\x00\x84\x06\x80xJm\x89\xb7\
-\x05\x80^\x8bZ\x90Y\xe9\xf1\xb5\x1aV2\x94\x17=\
-\xa7\x19\x00\x1a\x00B\x03@<\xa2(R(\x83\x8b\x07\
-zz\xce\x0d\xed\x9bx\xe1\x1d\xb2\xb1c\x8b\xc7\x06`\
-\x08/z\x0ea\x0d\x00\xa1\x01 \x9e\xde\xf0\x0b\x22\xde\
-\xbdl\xba\xe3\xdd\xb2\xbd\x9b\x05\x80N\xd9\xd4\xb9\xd5\xd3\
-\xf3\xd52\x03\x90[\x03\xc0\x1a\x00B\x03@\xbcb\xb8\
-\xc7\xfd\xff\x9b;\xb71\xcaq\xc1\x9e\xeeFO7L\
-\x1a\xde\x8f\x06\x80\x19\x00B\x03@\xf2\x02\xaf#\xbeM\
-\x1e\xa7\xb4\x83\x0e\xaa\xc2\xb7(\xd3\xe4\x15\x83\x8ak\xa4\
-\xa4\xa0\x98\x17>\x87\xbfoBR\xa5\x88\x97\x80\xb8\x8a\
-\xf8<6\x00\x1b;i\x00\x5c\x9b&\xb5\x0c0\xd6\xa3\
-\xf6<\xb4\x02\x0e-\x1e\xec\xf9\xd2C\xd8\xe9\x8cuI\
-W\xbc\xcb\xf0s\xed\xd1\x0eU\xfd\x1f\xd5\xde\xef\x8au\
-\xf1b\x11\x1a\x00\xe2\x91\x01\xf08\xe5\xbb\xb9\x83\xc2\xe2\
-\xf7k\x86\xd7D\xaa\x06\xe0\x8c\x05\xe7g\xf4\xb9\xcc=\
-f\xa6\xa7?\xfb\xf7\x97_\xae\xbdm\x8d\xb6\x1a\xae\xc7\
-\xc7\xe3q\xf5\xb96\xc3\xc7\xa2\xbe\xc5\xcb\xe5\x1aBh\
-\x00HZx\xdd\x02\xb8\xbdk'/\xbaKvx\x5c\
-49<\x8f\x0b\x01W\xb2E\x95\x04\x18\xd6\x00\x10W\
-x\xdd\xf6\xb5\xa7\xa7\x89\x17\xdd%\xbbU!\xa0\x97\x0c\
-e+ !4\x00$\xdc`\xbd\xb7\xba\xa8\xca\xd3s\
-\xee\xea\xde\xc3\x0b\xef\xd64u{k\x9a\xaa\x8b*y\
-\xd1\x09\xa1\x01 a\x06\xdb\x00\x17\xaaA@^\x81\x8d\
-mZzZy\xe1]\xd2\xe8q\x06\xa0\xaa\xb0\x8a\x17\
-\x9d\x10\x1a\x00\x12f\xfa{\x1c\xfd#\x95\xcd6\xa7\x14\
-\xae[\x8f\xc7\x06\x80\x19\x00Bh\x00H\xb8\xa9*\xf4\
-\xf6F\xef\xf5ZvX\xc0\xae\x80f\x95\xe7Y1\x86\
-\x854\x00\x84\xd0\x00\x90p\x1b\x80\xa2\x0aO\xcf\xd7\xc8\
-\x02\xc0\x94\xf1\xb2\x0e\x80\x19\x00Bh\x00H\xc8\xa9.\
-\xea\xef\xe9\xf9\x9a\xb9\xfe\x9f2-Q\xef\xae\x1d3\x00\
-\x84\xd0\x00\x90\xb0g\x00<\xbe\xd1\xb7y\x98\xc6\x0e\x1b\
-^^\xbb\xb2\xc22m\x97HB\x08\x0d\x00\x09m\x06\
-\xc0\xdb\x22\xc0\xb6X;/z\x00\xae\x1d\xdaC+\x99\
-\x05 \x84\x06\x80\x84\x97J\xcf3\x004\x00\xa9_\xbb\
-\x0eO\xcf\xd7\x9fu\x00\x84\xd0\x00\x90\xf0\xe2u\x11`\
-+\x0d@\x1a\x19\x00o\x97O0#\x82\x10B\x03@\
-BJI\xa4$\xd4\x22\x16\xae\x0c\x80\xb7\xe6\xa9(\xc2\
-mE\x08\xa1\x01 \xa1\xc5\xebB/.\x01\xa4c\x9e\
-\xbc\xbdv\xc54\x00\x84\xd0\x00\x900\x1b\x00oo\xf2\
-\xdc*5\x8dk\x17\xed\xf4\xf8\xb5Q\xcc\x8bN\x08\x0d\
-\x00\x09+^Gy\xd1x\x94\x17=\xd5k'\xde^\
-;\xb6\x01\x12B\x03@BL\xa1\xc7\x06\xa0\x87\x06 \
-0\xe6\x89K\x00\x84\xd0\x00\x900g\x00\x0a\x98\x01\xa0\
-\x0103\x87\xcc\x00\x10B\x03@B\x8b\xd7i\xde\x98\
-\xd0\x00\x04&\x03P\xc0\x0c\x00!4\x00$\xc4\x06\xc0\
-\xeb\x0c@\x8c\x17= \xd7\x8em\x80\x84\xd0\x00\x10\x1a\
-\x80\x8c\xd1\x13\xef\xe1E\x0f\xc8\xb5\xa3\x01 \x84\x06\x80\
-\xd0\x00d0\x8a\xe5\x12\x003\x00\x84\x10\x1a\x00\x92\xfb\
-\x17K\xc4\xdb\x97K\x9c\x97<eb\xe2\xad\x01(P\
-\x1b\x02\x11Bh\x00Hh\xa3Jo\xd3\xca\x85\x11\xbe\
-<\x83r\xed\xa2\xc2z\x0dBh\x00Hh\xf1\xba/\
-\xbfP\xd8Z\x16\x94k\x17c\xc1&!4\x00$\xcc\
-\x06\xc0\xeb\x0c\x00\x0d@P\xae\x1d\xeb5\x08\xa1\x01 \
-a6\x001\x1a\x80\xe0\x18\x00o\xff\xb4c\x5c\x02 \
-\x84\x06\x80\x849\x03\xe0\xf5t9\xbe<\x99\x01 \x84\
-\xd0\x00\x10\x1f\x18\x00f\x00h\x00\xcc\x0c\x003\x00\x84\
-\xd0\x00\x90\xd0\xd2\xed\xb5\x01`\x11`\x1a\x7f\xd8\x1ew\
-\x010\x03@\x08\x0d\x00a\x06 S\x14q\xbe|`\
-2\x00\x9d\xb1.^tBh\x00HX\xf1:\xca+\
-+(\xe5EO\xf5\xda\x15z{\xed:b\x1d\xbc\xe8\
-\x84\xd0\x00\x90\xf0f\x00h\x00\x02c\x00\x0a\xca<6\
-\x00\x9d\xbc\xe8\x84\xd0\x00\x90\xb0\xe2u\x94W^X\xc6\
-\x8b\x1e\x10\xf3\xc4%\x00Bh\x00H\x88i\x8e\xb6z\
-k\x00\x0ah\x00\x82b\x9e\xb8\x04@\x08\x0d\x00\x09\xb3\
-\x01\xe8i\xf16\x8a-\xe4\x12@\xea\xe6\xc9\xeb\x1a\x00\
-.\x01\x10B\x03@B\x9c\x01\xf0\xd8\x000\x03\x10\x18\
-\xf3\xc4%\x00Bh\x00\x083\x00\xcc\x00\xf8\xc1\x00x\
-h\x9e\xe2\xea_\x8b\xc7\xcbC\x84\x10\x1a\x00\xe2!^\
-\xdf\xe4\xab\x0a+x\xd1S\xc4\xcb\x1a\x00\xbc.`\x02\
-\x08!\xc1\x82\x93V\x88c\xf6y\xbc\x040\xa0\xa8\x9a\
-\x17=\x00\xd7n\x9f\xc7\x99!B\x88#\x22\x16\x9f\x8b\
-\xd3\x00\x10w\x91\x9e\xc77\xfa\x9ab\x1a\x80\xd4\xfe\xea\
-#R]\xd4\xdf\xc3\x0c\x00\x0d\x00!>\x17|\xc3\xaf\
-\xa5\x01 \xbe\xcd\x00\xd4\x14\x0d\xe0EO\x81\xfeEU\
-R\xe4\xe1(`f\x00\x08\x09\x84\xe8\x1f\x02k\x00\x88\
-\x8bH\xcf\xdb\xb5\xde\x8a\xc2r))(\xe6\x85w\xc9\
-\x00\x0f\xa3\x7f\xd0\xcc\x0c\x00!\xb9\x10\xfeH\xba\xdf\x84\
-\x06\x808&\xa6\xb6|\xf5\xba\x10\x90u\x00\xee\xa9\xf6\
-\xda\x000\x03@\x88_\x84?bq@\xef\x91\x1a,\
-\xea}?B\x03@\x5c\xb1\xb3k7\x0d\x80\xcf\x19X\
-\xec\xed\xd2IcO\x13/:!\xde\x88\xbf\x9d\xe8[\
-=\x16z_|\xed\xb5\xd76\xdcq\xc7\x1d\x93\xf0\x7f\
-\x1a\x00\xe2\x8a\xed];==\x1f\x0b\x01\xfd\x9f\x01\xd8\
-\xddM\x03@H\x0e\xa2~\xa3\x8f\x9bE\xfeXK-\
-\xbb\xe1\x86\x1b>7~\xfc\xf8\x1b~\xfd\xeb_\xaf\x13\
-a\x11 q\xc9\x8e\xae]\x9e\x9eoX\xc9\x10^t\
-\x97\x0c-\x1e\xec\xb1\x01\xd8\xc3\x8bN\x88\xb7\x11\xbf\xd3\
-\xff\x17\xf4\xea|\xd9m\xb7\xdd\xf6/uuu\xd7.\
-]\xba\xf4+\xdb\xb7o\x8f\xeb\x9f$\xc4\xb7\x06\xa0\xb6\
-d\x18/\xbaK\x86\xf7\x1b\xea\xb1\x01h\xe4E'$\
-\xfb\xe2\x9f\x1c\xf1'\xfe\xdf(\xea\x87\xf0\xf7\x1b<x\
-p\xf5\xf4\xe9\xd3\xffX__\xff\xe7\xd6\xd6\xd6g\x7f\
-\xf6\xb3\x9f}(\x9c\x03@R\xc1\xeb%\x80\xda~4\
-\x00\xeeM\x93\xd7\x06\x80\x19\x00B<\x10\xff\xe4\xf7#\
-\x16Q?\x8a\xfdJ\xbe\xfc\xe5/\x8f\xbc\xf0\xc2\x0b\xff\
-\xaf\xbc\xbc\xfc\x94x<\xde\xf6\xdcs\xcf]\xa5>\xde\
-\xad\x8e(\x0d\x00q\x9f\x01\xe8\xf6:\x030\x94\x17\xdd\
-u\x06\xc0;\xd3\x84\xce\x90\xa6\x9e}\xbc\xe8\x84x/\
-\xfc\x11\x13\xf1\xd7\x22\xff\x1f\xfd\xe8G\xd3N?\xfd\xf4\
-{\xfa\xf5\xeb\xd7\xa0\x05o\xdb\xb7\xdf\xf1\xe0\x83\x0fn\
-\xd0\xc5\x1f\x8f\xa3\x01 \xee2\x00\x9d\xdef\x00\xbcN\
-g\x07\x9d\xd2\x82~\xaa\x08\xb0\xca\xb3\xf3\xa1\x03\x00&\
-\x80\x10\xe2\x99\xf8GL>\xa6\x17\xfb\x95^w\xddu\
-\xff<q\xe2\xc4\xab\x0a\x0a\x0a\xb4\x0dU\xba\xbb\xbb\xb7\
-\xdex\xe3\x8d\xb7\xa9w\xb1mg\xbc\xf7\xeb\xe3\xac\x01\
- \xae\xd8\xdd\xd3(=\xf1\xa8g\xe7\xab*\xac\x94J\
-n\x0a\xe4\xdc0\xa9\x8cI$\xfd\xf9 \x8e\xd9\xda\xb9\
-\x83\x17\x9d\x90\xf4\x84?b\xf1\xb1\x88\xd8\xf7\xf6\xebQ\
-\x7f\xe9\xf0\xe1\xc3k\xee\xbd\xf7\xde?L\x9e<\xf9f\
-]\xfc\xc1\xaaU\xab\xae^\xb2d\xc9^\xf5n,\xf1\
-\xfb2\x03@\x5c\x81hoW\xf7nMh\xbcbD\
-\xbf\xe1\xb2\xb2m5/\xbe\x03\xbc\xae\x99\xd8\xda\xb5\x9d\
-\x17\x9d\x90\xccG\xfd\x11\x9b\xc8?\xf1\xd0R\xfe_\xff\
-\xfa\xd7'\x9c\x7f\xfe\xf9\xb7\x95\x95\x95MK\xfc\x86\xed\
-\xed\xed\x1f\xff\xeaW\xbf\x9a-\xfb\xd7\xfe\xe3\x89\xe7\xa5\
-\x01 \xae\xd9\xd2\xb9\xddS\x030\xb6\xac\x9e\x06\xc0!\
-\xf5\xa5#=~-l\xe3E'$s\xc2\xefT\xf4\
-\xfb\xf4\xf7+\x81?\xeb\x98c\x8e\xb9\xa1\xa8\xa8h`\
-r\xcc\xf6\xce;\xef\xfc^\x99\x80\x8ed\xf1\x17a\x1b\
- I\x81\xb5\xed\xeb==\xdf\xb8\xb2\x06^t\x9f^\
-+\x1a\x00B2.\xfefi~\xfd\xd0\xc7\xf9\x96V\
-WW\x0fPS\xfd~q\xc2\x09'\xdck \xfe\xb2\
-{\xf7\xeeg\xd4\xf0\x9f\xf7%\xa1\xf0\x8f\x19\x00\x92\x16\
-kh\x00h\x00\x0e\x18\x00.\x01\x10\xd2+\xaaq\x0f\
-\xa2~]\xfc\xfb\x9ds\xce9\xf5\xdf\xfe\xf6\xb7o\xae\
-\xa8\xa88\xc9\xe8\x84\xb1X\xac\xfd\xc9'\x9f\xbc^\x0e\
-\xa6\xfe\x93\xcfC\x03@h\x00\xc2B\x91*\xe9\xa9+\
-\x1d\xe1\xad\x01\xc8\xf3\x1a\x00\x14\x5cz\xb9C&\x09u\
-\xd4o&\xfa\x89Y\x80\x12\xd9\x9f\xf2\xff\xa2J\xf9\xff\
-IE\xfd\x83\xccN\xbaq\xe3\xc6{\xe6\xcc\x99\xb31\
-)\xfa\x17I\xe8\x02\xa0\x01 \xaeY\xd7\xb1Q+\x06\
-,\xf0h/\xa9\xaa\xa2J\x19R<Hvv\xef\xe6\
-\xc5\xb7\xa0\xa1\xb4N3\x01^\x81\x9d!\x9b\xba\xf7\xe6\
-\xf55/T\x7f\x03^v\xc5\x90\xd0\x09\xbf\x95\x01(\
-\x90\xbeS\xfdJ&L\x980\xe8\xf2\xcb/\xff\xef\xda\
-\xda\xda\x7f\x13\x8b%\xfc\xae\xae\xae-\xaa\x15\xf0.\xe9\
-[\xf8\x17I\xcaV\xb0\x0b\x80\xb8\xa73\xd6%\x9b\xd5\
-\xda\xaf\x97\xd1\xe6\xb8\xf2\x06\xd9\xb9\x97\x06\xc0\x8a1\xaa\
-X\xd2K\xd6\xb6o\xc8\xfb\xe8\x17\x86\x8b\x06 \xaf\x05\
->n#\xf8\xe9F\xfdH\xf9k\xbd\xfd\xdf\xfb\xde\xf7\
-\x8eRi\xff\xebKKK'\xda=\xb1\x85\x0b\x17\xde\
-\xbcv\xed\xda\xe6$\xf1\x8f$\xfd\x9fs\x00Hj\xac\
-\xe9\xf0v\x19`j\xc5$^t\x1b&\x95\x8f\xf3\xf6\
-5\xe0\xf1R\x90\x13\xbc6$E\x8c\xa1\x883\xa3\xe0\
-\xb6\xaf\xff\x80\xf0\xabI~\xfd\xaf\xbf\xfe\xfa\x8b\xbf\xf2\
-\x95\xaf<\xe9D\xfc[ZZ\x16\xfd\xe9O\x7fzN\
-\xf6\xa7\xfe\xe3\x06\xe78\xf8\xfa\xe5\xef\x86\xa4\x16\xfd\xad\
-\x97\xcf\x0d8\xd9\xb3\xf3M\xab\x9c\xca\x8bnw\x8d\xaa\
-\xbc\xbdFk\xda7\xf8\xee\x1aDU4\xee\xa5(\x17\
-E\x0a\xf9\xc2#Y\x8b\xfaQ\xe8\xf7\xado}\xeb\x1a\
-U\xed\xff\x19\xa7\x1e\xf8\xf5\xd7_\xbfA-\x01t\xca\
-\xfe\xa1?\xa6\xe2O\x03@\x02\x13\xfdM\xae\x98\xa0\x8d\
-\xb9\xed\x88u\xf2\xe2\x1b\x80\x89\x89c\xcbF{k\x02\
-;\xfc\x97\x01\xf0\xde\x00\xf0\x16J\x1c\x09\xbf\x95\x01\xd0\
-\xd7\xfa\x0b{\x0f\x14\xfa\x95\xff\xe67\xbf\xf9\xca\xb4i\
-\xd3~S\x5c\x5c<\xc0\xe9Iw\xed\xda\xf5\xfa\xed\xb7\
-\xdf\xfeao\xf4o6e\x90\x06\x80\xa4\xc7\xaa\xb6u\
-\x9e\x9e\x0f\x91\xd6\xd4\xca\xc9\xf2\xe1\xbeOx\xf1\x0d8\
-\xa2\xf20OG\x00#\xd5\xbe\xae}\xa3/\x0d\x80\xb7\
-\xafK\xdeBC.\xde\xc9\x1f\x8f\xdb|\xccn\xf3\x1e\
-\xbb\xa8\xbf\x9f\xea\xe9\xaf\xfd\xfe\xf7\xbf\xff\xf3\xa1C\x87\
-\xfe\x83\xab\xbf\xc9x<:{\xf6\xec\xbf\xc8\xc1y\xff\
-F\x99\x07f\x00H\xfal\xeb\xda\xa1\xed\x03?\xa8\xb8\
-\xc6\xb3sb\x19\x80\x06\xc0\xe4\xdax\x9c\xfeG\x11(\
-\xba\x00\xfc\x86\xd7\x05y\xc8J\x91\xbc5\x09q\x0b\xc3\
-\x90R\xd4\xaf\xda\xfb\xfe\xee\xe8\xa3\x8f\xfe\x95\x8a\xfa\x87\
-\xb8}B\x9b6m\x9a\xf3\xf4\xd3O\xaf\x92\x83\xf3\xfe\
-\x8d\x9e[\x1f\x03\xc3\x22@\x922KZWxz\xbe\
-c\xaa\x8e\xe0E75GS\xbc\xfd\xdd\xb7\xac\xf0\xe5\
-u\xf0:\x03P]\xd4\x9f/\xbe\xfc\xca\x028\xf9\x9c\
-\xdd4\xbfBIh\xed\x83\xf0\xab\xa8\xbfNm\xe2s\
-\xbdz\xfb\xe7T\xc4_\x0d\xfd\xe9x\xe0\x81\x07\xee\x91\
-\xfdm\x7f1\x83\xe7\x19g\x06\x80dX\x04\x96\xcbi\
-\x03N\xf2\xec|\x87\xa9:\x00\xecA\x80\xec\x039\xc8\
-\xd0\x92\xc12\xa1|\xac\xa7\xe7\x5c\xdc\xba\xdc\x97\xd7\xa2\
-+\xde\xed\xb1\x01\xa8\xe2\x0b0?\xcc@b\x0b\x9d\xdb\
-\xc8\xbf@\x0e\x9d\xe6\x87\x03\xe9\xa3\xb2_\xff\xfa\xd7\xe7\
-!\xeaWC}\x06\xa7\xfa\x04?\xfd\xf4\xd3'\xd4\xcc\
-\xff\xadr\xe8\xd0\x1f\xa3\xe8?\xae\x1f\xcc\x00\x90\xc0\x88\
-\x00\xd6\xb8O\xab9\x99\x17>\x89\xd3T7\x86\x97\xeb\
-\xff`i\xab?3\x00^/K0\x03\xc0\x0c\x81\x83\
-\xc8?y\x9d\x1fQ\x7f\xe5\xb9\xe7\x9e;\xfe\xc1\x07\x1f\
-\xbc\xf3\xf8\xe3\x8f\xbf%\x1d\xf1\xef\xee\xee\xde{\xeb\xad\
-\xb7>\xa4\xde\xed\x11\x83\x0d\x7f,L\x003\x00$u\
-V\xb6\xad\x91\xd6h\x9bT\x14\x96{v\xce3jN\
-\x95\x19\xdb\x9f\xe6\xc5O\xba&^\x8b\xac\x1f\x0b\x00A\
-s\x8f\xb7\x06\xa0?3\x00a\x15t\xb3\xaf\x89'\xbd\
-5\x8b\xfc\x8d\xd2\xff\x9a\xf8\xab\xbe\xfe\x0aU\xe1\xff/\
-S\xa6L\xf9\x7f\x85\x85\x85\xd5i\x07b\x8b\x17?\xac\
-\x86\xfe4%D\xff}\xa2|\x93C\xfb\x1a\x1a\x00\x92\
-2Xo\xfd\xb8e\xb1\x9cZ}\x82g\xe7\x9c\xa8\x86\
-\xdd\x8c\xeaW+\x9b:\xb7\xf2\x17\xa0\xc0\x92\xc8\xa4\x8a\
-\xf1\x9e\x9es\xb1Z\xfa\xf1\xeb\x04\xc0\x96h\x8b\xa7\xe7\
-\x1b\xc0\x0c@\xd8MA\xc4\x81\xf8\xdbe\x00\x8az\xc5\
-\xbf\xec\x92K.9\xf6\xcc3\xcf\xfcMyyyF\
-\x0a\x9a:::\xb6\xdft\xd3M\xb3\xa5\xef\xda\x7f\xdc\
-\xa9\x11\xe0\x12\x00I\x8b\x0f\xf7-\xf4\xfc\x9c_\x18\xf8\
-9^\xf8^>\xaf\xa2\x7f\xaf\xd3\xff\xef\xed\xfb\xc8\xb7\
-\xd7\xa3\xd9\xe3%\x80\x11\xfd\x86\xf3E\x18\x9e\xe8\xdf\xac\
-]\xceI\x1b\x9fQ[\x9f\xb6k\x9f:\xca'M\x9a\
-T\xfb\x97\xbf\xfc\xe5\xe7\xe7\x9dw\xde\xe3\x99\x12\x7f\xed\
-o\xf1\xbd\xf7\xa6\xab-\x7f[z\xc5\xbfOto\x15\
-\xf9\x0b\x97\x00HF\x0c@\xb3\xf7my_\x1e|\x96\
-<\xbcm\xa6t{\x5c\xf0\xe57\xb0\x19\xd3y\xeaZ\
-x\xcd;{?\xf0\xaf\x01\xe8\xf16\x030\xbat\x14\
-o\x02\xe1\x8f\xfc\xc5&\xf2\x1794\xdd\xaf\x8b\xbfV\
-\xe4\xa7\x06\xfa\x5cYRR\x92Q\xb7\xa8F\xfe\xae\xbb\
-\xe1\x86\x1b^\x94\xfdk\xff1\xa7Q\x7f\xe2\xd7\xd1\x00\
-\x90\xb4\xd8\xd8\xb1EK\xc7#-\xef\x155j0\xd6\
-Y\x03O\x93\xe7w\xbf\x9a\xd7\xd7\xfe\x94\xea\xe3\xa5\xb6\
-\xdf0O\xcf\x89\x0d\x80\xb6w\xed\xf4\xed5i\xeci\
-\xf2\xf4|X\x82\xe9WP\xa2m\x90EB\x9d\x19\x10\
-1^\xf3O\x14\x7f\xbd\xba_K\xf7_t\xd1E\x87\
-\x9fu\xd6YW\xaa1\xbeY)\xd2y\xf5\xd5W\xef\
-\xe9\xe9\xe9\xc1h\xd4\xa8\x89\xd0\xc7\x84K\x00$\xdb\xbc\
-\xdd\xf4\x9e\xe7\xe7\xbc\xb0\xf6\x9f\xa48R\x9c\xc7w\xa6\
-\x88|c\xf8\xd7\x18\xfd'\xe1\xb59A\x16fT\xbf\
-\x11\xbc\x09\x84K\xe4\x9dT\xf4'\xa7\xfa\xf5\xea\xfe\x0a\
-U\xdc7\xf2\xb6\xdbn\xfb\xf9\xf9\xe7\x9f?;[\xe2\
-\xbfg\xcf\x9e%w\xddu\xd7;rp\xbb_+\xd1\
-73\x02\x1c\x04D\xd2\xe7\xcd\xbd\xde\x1b\x80a%C\
-\xe4\x1f\x86~)o\xaf9\xda!'\x95\x8f\xcf\x8b\xdf\
-\xb5\x9f\x0d\x00\xc0>\x15$T&@\xc4\xf9@\x1f]\
-\xfc\xcbUu\x7f\xcd\xd5W_}\x91\xda\x89\xef\xd5\xfa\
-\xfa\xfa\x8b#\x91\xacE(\xf1\xa7\x9ez\xean\xf5V\
-\x8f\xfec\x06\x82\x1fK\x12\xff\xe4\xaf\x11f\x00HF\
-\xc0T\xb8\xc6\xee&\xcf\xcf{Q\xed\x05Z\x0a6\xdf\
-@\xdb\xe5\x7f\x8c\xfaw\xcf\xcf\x8b\xf4\xff\xf2\xd6Oi\
-\x00\x928\xae\xeaH\xde\x04\xc2a\x02\xec\x04?\xf1\xd0\
-\x85\xbfT\x1d\xfd\xff\xfb\xbf\xff\xfb\xac\x87\x1ezh\xce\
-\xe1\x87\x1f\xfe{\xd5\xd3\x9f\xd5\xf9\xe8\x9b7o~g\
-\xd6\xacYK\xe4`\xdf\xbf\xd9a\xb7\x04\xc0\x0c\x00\xc9\
-\x80\x1dU\xff^kz\xdb\xf3\xf3b\x0e\xfb\xe5\xa3/\
-\xd5\xd2\xb0\xf9\xc4\xa5\xa3\xbe#\x83\x8b\x07z~\xde\xbf\
-\xee\x9e\xeb\xfbk\xd3\xd8\xbd\xd7\xf3\xf5\xf8\x93\xaa\x8f\xf3\
-t\x16\x06\xc9\x8a\xf0\xbb\x89\xfau\xe1\xaf\xba\xe0\x82\x0b\
-\xa6a\x98\xcf\xe9\xa7\x9f~_YY\xd9\xa4l?Y\
-5\xf27\xf6\xf8\xe3\x8f?\x98\x14\xfd\x9b\x1d\xb6\x9d\x00\
-4\x00$#\xbc\xb4\xfb\xf5\x9c\x9c\xf7(\xb5\x09\xce\xbf\
-\xd7~=o\xae\xf3\x17\x07\x9d!\xe7\x0c:\xdd\xf3\xf3\
-\xf6\xc4{\xe4\xe5=\xaf\xfb\xfe\xfa\xc0\x8cz=*\x1a\
-E\x80\x7f7\xf8\x0b\xbc\x09\x84'\xfa7\x8a\xf8\xf5\x0d\
-{4\xe1?\xe5\x94S\x1a\xee\xbc\xf3\xce\xdf|\xf3\x9b\
-\xdf\x9cSSSs\x96\x887\xbd\xb8\x1b7n\xfc\xdb\
-\xdc\xb9s\xd7\xc8\xc1\xca\xff\x98\x1c\x9a\xfa\x8f\x99\xfc\xff\
-\x90N\x00v\x01\x90\x8c\xb0\xa2m\x95\xac\xef\xd8\x94\x93\
-\xb6\xa8\x7fU\xc5p\x9bU'\xc2\x0b\xbb\xe7\x85\xfa\x1a\
-\x1fUu\xb8\x5cV\x7fqN\xce\xfd\xa6*\xf4\xdc\xdb\
-\xb3/\x10\xd7iU\xdbZ\xcf_\x87\xdf\x18v\xbe\xcc\
-\xdb\xf3\x96\xec\xec\xde\xcd\x9bA0\xc5?\xb1\xb0/\xd6\
-\xfb6\xb1\xedO3\x00\x87\x1dvX\xcd\x0f~\xf0\x83\
-\x7f\x1f=z\xf4Ej\x8a_\xa5\x97OT\x05\xff\xd1\
-G\x1f}\xf419t\xed\xdfM\x06@\x84K\x00$\
-+Y\x80=\xaf\xe5\xe8/8\x22?\xa9\xff\x81|n\
-@x\xf7\x09@\xa1\xd9\xef\xc7\xfe,g\x9d\x0fO\xec\
-x&0\xd7jU\xfbZ\xcf\xcfYUT)\x7f\x1c\
-\x7f\xa5\xd6\xa2J\x02\x1b\xfd\x1b\x15\xf8\xa1\x97\xbfb\xe8\
-\xd0\xa1\x83\xae\xbd\xf6\xda\xef\xaa\x02\xbf\x97\xc6\x8e\x1d{\
-i*\xe2\xaf\x06\x00IEEE\xcaOt\xdd\xbau\
-\xaf\xbf\xf9\xe6\x9b\xebz\xa3\xff\xa8\x8d\xf0\xdbF\xff\xc2\
-%\x00\x92I\xfe\xba\xeb\xd5\x9c\x0d\xe7)\x8a\x14\xca/\
-\xc7\xfcD\xceU)\xf2\xf0E\xfeS\xe5\xba\xf1\xbf\xce\
-\xd9:\xf3\xc7\xcd\x8be\x99\xcf\x8b\xff\xfa\x1a\x80u9\
-9\xef\xf8\xb21r\xcfa7\xc8W\x86\x9c#\xe5\x85\
-eY9Gea\x85\x0cT&\x03\xf3\x1f\xc6\x94\xd5\
-\xf3\xa6\x93\xf9\x0c@\xe2\x86=\xe5jx\xcf\x005\xb7\
-\xff\xeb\xaa\xad\xef9\xd5\xde\xf7s\xb5U\xef\xa0T\x84\
-\x7f\xc2\x84\x09\xd2\xbf\x7f\x7fimMmR\xa5\x8a\xfe\
-{T\xad\x01\xa2\xff.\xe9\x9b\xfe7\x12z'\xd1?\
-'\x01\x92\xcc\xd2\xa4R\xc4\xaf5\xbe\xad\x86\xf4\xe4f\
-T/\x8a\x01/\x1f\xfd\x1f\xd2PZ'wmy\xc8\
-\xf3\xbd\xe1\xb3\xc1\x97\x07\x9f#?\xaa\xfb\xb628\xb9\
-\xfbS}t\xfb\xec@]3,\x01\xe4\x8a\x01E\xd5\
-rY\xdd\xc5\xf2\x83\x91\x17\xa9\xcd\xb2Vk\xd9\x88\x1d\
-]\xbb\xb4M\xb3\xdac\x1dJe\x0a\xb4\x9a\x01\x98\xb9\
-\x12\xf5\x16\x85\xac\x15\x05\xe5R\x5cP,\xe5\x05\xa5R\
-VX*%\x91\x12\xcd@\xf4S\x9f\xc3\xd7T\xaa\xaf\
-\xed\x17\xc1\xfb}\xb3?\xf8\x9e_\xfe\xe4B\xdex\xd2\
-\xbcmH\xdf\xca~\x08c\x81\x12\xfa\x92\xcb.\xbb\xec\
-\xf3j\xa7\xbe\x8b\x95\x80\xa7\xd4o\x0b\xe1\xaf\xab\xab\x93\
-\x81\x03\x07\xca\xf2\xe5\xcb\xa5\xb1\xb11\xf5\xd7\xf4\xaaU\
-\xf3\xde\x7f\xff}\xec\xc0\xd5-\xd6\x85\x7fv\xcb\x00}\
-\x03'\xfe\xfeI&yj\xe7_sf\x00t\xfey\
-\xd8W\xe4\xf0\xca\xc9r\xd5\xba\x9bUm\xc0\xb6@^\
-G\xa4\x94!$\x9f\xf7x\xa7\xbfd>U;>\xbe\
-\xbf\xef\xe3@];\xd4*x=\x9d2\x19\x88\xfc\x11\
-\x95\x87iG\xb6\x80I\xc0\xf2\x97_7f\x0aP\x06\
-@/\xf0\x13%\xfc\xc5\x97^z\xe9i'\x9dt\xd2\
-\xb7U\xba>%\xe1G\x9a\x7f\xd4\xa8Q2d\xc8\x10\
-\xe9\xea\xea\x92\x85\x0b\x17\x1e\x88\xfc\xe3\xf1\xb8\xa8\xf9\x00\
-\xda\xfb\xaak@\xa2\xd1\xa8\xf656\xd1\x7f\xf7\xc3\x0f\
-?\xfc\x84I\xf4\x1f\x15\xf7k\xff\xdc\x0d\x90d\x07\xa4\
-\x8a?iY\x22\xd3*\xa7\xe6\xf4yL\xa9\x98(w\
-\xabt\xec#*z}|\xfbS\xd2\x15\xeb\x0e\xc8\xdd\
-(\xa2\x19\xa8\x8bG^\xa8\xa5zs\xcd\xffmy(\
-\x90\xaf\xc3\x05j\x93\xaaQCjC\xfd\xb7\x86\xd7\x0a\
-2\x06m\xd1v\xdexRG\x1b\xe2\x031\xbc\xf8\xe2\
-\x8b\x8f?\xe3\x8c3\xbe[YY9.]\xe1\x87\xc8\
-C\xf4\xd5V\xbd\x9a\xc0C\xe8\xd5\xd8^Q\xc3\x82\xf6\
-\x1b\xfc\xaa*ihh\x90E\x8b\x16\xd9\x9b\xf0O?\
-}\xf5\xc3\x0f?\xdc\xd4k\x00\xa2b\xdf\xfe\xe7(\xfa\
-g\x06\x80d\x85\x07\xb7>!\xd3&L\xcd\xf9\xf3@\
-\x0a\x15-\x82_\x1at\xa6<\xb2m\x96\xd6\xc7\x8ev\
-6\xbf\xde\xccO\xaa>V\xbeU\xfb\xcfj\xc2\xdf8\
-_<\xa7\xf9{?T\xbb=~\x12\xc8\xd7\xe0\x07j\
-\x93*\xac\xc5\x87\x9d\xf2\x822\x1a\x804@1\xdf\x0f\
-\x7f\xf8\xc3\xd3N>\xf9\xe4\xaf\xa95\xfa1\x99\x10~\
-\xb0k\xd7.Y\xb1b\x05\xa2wl\xd9\xabE\xfe\x88\
-\xf8\x81*(\x14UH\x88\x96>\xdb\xef\xad\x8cC\xd7\
-\xfd\xf7\xdf\x8f\xe8?\xb9\xef?*\xa9U\xfe'\xfe\x9f\
-\x06\x80d!\xfaj^$KZW\xc8\xd4\x8aI\xbe\
-x>\x18\x1b\xfc\xe3\xfaK4q}e\xcf\xdf\xe4E\
-\xd5.\xb8\xaec\xa3/\x9e\xdb\xa0\xe2\x1a9s\xe0g\
-\xe5\x9c\x81\x9f\xf7UQ\x17\xea'\xee\xd8<=\xb0\xaf\
-A\x14.\xe2g(\x8c\x14\x86\xfao\x0d\xb5\x04\xbb\xba\
-\xf7\xf0\xa6\xe3\x92\x02U\xff>\xb9}\xac\x5c\xf2\xf0\xc3\
-\xd7\xab\x88?\xa5]\xfa\x8c\x84\x1fl\xd9\xb2E\xd6\xac\
-Y\xa3\x89~SS\x93\x16\xf5\xeb\xe2\x8f\x9a\x00\x1c\xf8\
-\xdc\x8e\x1d\xf6\xf3*T\xed\xc0\xcb*K\x80u\xccn\
-\x03\xd1\xb7\xeb\x04\xb0\x8c\xfei\x00H\xd6\xb8g\xcb#\
-r\xc3\x84\xdf\xfa\xea9Al/\x18\xf6U\xed\xc0\xdc\
-\x02\x0c/Z\xd0\xbcP6tl\xf6t\x1d\x15S\xfc\
-\x8eQ\xe3c\xcf\x18\xf8\x195Fv\x9a/'\x19>\
-\xbd\xf3\x05\xed\xba\x04\x95\x96h\xab,jY\xaeuP\
-\x84\xdd\x00\x10\xe7\x14\xc7\x8a\xe4\x88\xf6\x89r\x5c\xeb\x11\
-R\x15U-y\x95\xe2Z\xfc\x95a\xd0D|\xf0\xe0\
-\xc1}>\x0eQ_\xbdz\xb5l\xdd\xbaU{\x7f\xdb\
-\xb6mZ\x01 \x0c@AA\x81\x8c\x1b7N3\x0b\
-\x00\x05\x81\xdd\xdd\xddv\xd1\x7f\xe7\xf4\xe9\xd3g\xaaw\
-;\xe4`\xeb_\xd4e\xf4o\x96\x0d\xa0\x01 \xd9\x8d\
-\xc00<\xe63\x03N\xf0\xe5\xf3\xc3F:\xfaf:\
-\xe8^X\xdc\xb2L\xd5.,\xd5j\x18\xb6\xa8\xc2\xc1\
-\xa6\x9e\xbd\x19\xbbA\xd7\x96\x0c\x93I\xaa\x9e\xe8\x08U\
-\x98xD\xe5\x14\xf5\x7f\x7f\xef_\xb0\xb5s\xbbf\xe0\
-\x82\xce\xcbj.E\xd8\x0d@\xb6\xda\x0dCw\x9db\
-ert\xebar\x94:J\xe3\xfdR\xfa\x1ejg\
-?-\xe2\x87\xa8\x1b\x88\xb5\x96\xf2\xdf\xbd{\xb7\x96\xf2\
-\xdf\xbe}\xbb\x8c\x1c9R\xd4\xbe\x00\xda1y\xf2d\
-\xad\x0dPg\xe7N\xfb=+\x96-[\xf6\xe2\xd2\xa5\
-K\xd3\x8d\xfe\x93\x893\x03@<\xe1N\x95B>\xa9\
-\xfa\x98\x9c\xb6\xb09a@Q\x7feTN\xd4\x0e\x9d\
-\x8eX\xa7f\x04\xb6vm\x97m\x9d;\xa4K\xcd7\
-@T\xd9\x13\xeb\xd1\xda\xb9p\xc0\xe5\xefo\xd7*9\
-\xd0\xba\x85\xb6\xad\xa1%\x835\x91\x87\xf0\xa3\x9a?H\
- \x13r\xed\xfa\xbfh?_\xd0AK\xea\xa5u\xdf\
-\x91\xb2\x82\xd2\xf0f\x00\x0a\x98\x01\xb0\xa2\xa6\xa7Z\x89\
-\xfed9\xb2}\xb2\x14\xc5S[\x0e\x1a0`\x80\xa8\
-\xc9\x7f}\x04<\x11\x14\xf9-Y\xb2DZZZ\xb4\
-\x94?\x0e|=\x96\x05JKKE\xcd\x0f\xd0\xde\xea\
- \xf2W\xdb\xf9Z\x9eS\x15\x0c\xb6\xab\xed~\x11\xfd\
-[\xf5\xfd\xa7\x12\xfd\xf7\xf9s\xa7\x01 Y\x03-x\
-\x8fl\x9b\xad\xd6\xde\xff)p\xcf\x1d\xfd\xd9c\xcbF\
-kG>1{\xc7\xf3Z\x17G\x18\x80\x89y\xb3\xe9\
-\xdd\x9c\xb7\xa5f\xd5\x00p\x09\xe0\x10PP[\xdfY\
-\xab\x22\xfe)2\xb6\xb3N\xfb\xbf\xeb\xef\xa1\xc4\x1b\x91\
-\xbe\xda\xd6WK\xf9\x9b\x81J\x7f\x88?\xa2~\xb5K\
-\x9f\x16\x14\xa0\xba\x1f\xa0\xd2\x1f\x91\xbf\xea,\xec\xf3\x18\
-D\xff\xf8:+T\xf7\xc0\x0bj9a\x97\xf4\xad\xfc\
-\xb7[\x02p\x15\xfd3\x03@\xb2\xceC\xdb\x9e\x90S\
-\x06\x1c\xa7MI#\xfe\x06Ck\xee\xda\xf2p\xa8~\
-\xa6'w\xcc\x91/\x0c<-%\x11\x08\x02\xe54\x00\
-\x07\xc5L\xc5\xb3S\xda\xc6\xcb\xb1mSe\xa0\x8a\xfc\
-S\x01k\xf5X\xa7\xc7\x1a\xbf^\xb8g\x06\xd6\xf1U\
-\x9a^:;;\xb5\xa2?\x18\x85\x11#Fh\x9f\x1b\
-4h\x90L\x9c8\xb1Oq`\xa2\x01\xb0\x8b\xfe\xef\
-\xbe\xfb\xee\xa7\xc4\xd9\x8e\x7fN\xb3\x00\x86f\x80\x06\x80\
-d\x95\x1eU\x89}\xcd\xba[\xe5\xb6\xc9W\xe7l\x8e\
-=\xb1\x07\xc3s~\xb5\xfaZ\xb5\x95ng\xa8~\xae\
-O\xd5T\xc0\xb7\xb4Z\x94\x13C\x9a\x01`\x0d@M\
-O\x7f9\x5c\x15\xf6\x1d\xd96IJc\xa9\xad\xefC\
-\xf8kkk\xb55~5\xfe\xd7\xf6\xebQ\xe0\xa7\xa6\
-\xf3Iss\xb3\xac]\xbbV[\xef\xd7k\x03\xf0>\
-\x96\x00\x8c\xc02\x81\xdd8`e*^Qs\xff\x11\
-\xfdc\xed\xbf\xc7$\xfa\x8f\x8a}\xeb\x9fe\xf4O\x03\
-@<a\xb5\x9a\xcd~\xeb\xc6{\xb5V<\xe2?b\
-\xf1\x98\xfcIMM\xf4z\x1b]\xaf\xb8o\xebcr\
-\xaa*F\x0dc\x16\xa0\xac O\x0d\x80\x92\xb3\xd1]\
-#\xd2J\xf3k\x02\xa8\x0a\xf4\x10\xb5\xe3HN\xd5\x1b\
-\x9eV\xa5\xee\x958\xcb\xa6M\x9b\xb4H\x1e-\x7f\xa8\
-\xeeG\xf4\x0f\x13\x81\xfe~\xf4\xf9\x9ba\xd7\xfa\x87\xbe\
-\xff\x07\x1ex@\x8f\xfe\x9d\xac\xfd\xa7\x1c\xfd\xd3\x00\x10\
-\xcf\x98\xb3\xeb%mG\xbb/\x86p\xb3\x9e\xa0s\xeb\
-\xa6{\x037\xee\xd7\x0dk\xdb7\xc8\xb3\xea\xf5\x87}\
-\x15\xc2\x97\x01\xc8\xaf%\x80\x8ah\xb9*\xe8C\xb4?\
-Y*\xa3\xa9\xff\xec(\xcaC\xa4>|\xf8pM\xb8\
-\x1d\x19e5\xd4g\xe5\xca\x95Z\x85?L\x00\xa2\x7f\
-\xa4\xf9\xb1T\x00#1i\xd2$\xadS\xc0\xea\xf1\x18\
-\x10d\x85\x9a\xfa7Oe\x00\xb6;\x88\xfe\xed6\xfd\
-\xb1\x8d\xfei\x00\x88\xa7\xdc\xbc\xf1\xff\xb4\xf9\xec\xd9\x9c\
-\x8fN\xdc\x81v?\xec\xdf\x10vn\xdf4]\x8e\xae\
-:B\xbd\xfeF\xd0\x00\x044\xdaG\x8a\x7f\x5c\xc7h\
-5\xb8?\xf5\xb9\x19\x88\xd4!\xfc\xc9\xc3{\xec@\xe5\
-\xbej\xc9\xd3\x22x\xa4\xfea\x1aP\xdd\x8f\xac\x01\xcc\
-\xc4a\x87\x1df[3\x80\x16A\x8c\x03\xb60\x08=\
-\x0f=\xf4\xd0,9\xd8\xf7\x9f\xd5\xe8\x9f\x06\x80x\x0a\
-\xe6\xf1_\xb9\xfa\x8fr\xe3\x84\xdf\xc9\x84\xf2\xb1\xbc \
-9\x06\x05r\x0fo\x9b\x99\x17?+\xda:\xafV\xb5\
-(7M\xfc\x9d\xef\xdbRi\x00\xf6\x83A=\x87\xb5\
-\x8f\x93i*\xda\xef\x1fM\xbd\x9dV\xaf\xe8\xc7\xfa\xbe\
-Y+\x9f\x15mmm\xdaL\x7f\x88?\x8a\xfd\xb0\xcb\
-\xdf\xf8\xf1\xe31FX3\x14\x10\x7f'\xcb\x07v\xc5\
-\x7f\xaa\xea\xffo\x1f\x7f\xfc\xf1\xe6^\xf1\xcf\xea\xda?\
-\x0d\x00\xc9\x09\x98[~E\xaf\x09\xa8/\x1d\xc9\x0b\x92\
-#fl\x7fZ\x8d\xfa} \xaf~\xe6\xa5j<\xf5\
-\xef\xd6\xde \xbf\x1e\xf3\xffB3\x228l\x83\x80P\
-\xc9?AE\xf9G\xb4M\x94Q]\xc3\xd3\xaa\xdb\x80\
-@#\xd2\x87\xf0\xdbE\xe7f\xa0\xa7\x1f\x91?Z\xfc\
-\xb0\xee\x8f\xea~\xb4\xf9\xc1T\xe0\xfd\x09\x13&8Z\
-B@\xa7\xc0\xde\xbd{\xad\xa2\xff\xe8c\x8f=\x067\
-\x8e\xb5\x7f\xbb-\x7f\xe3\x99\x88\xfei\x00HNh\xec\
-n\x92\x1f\xad\xfc\xb9\x5c5\xee\x7f\xb4]\xfb\x88w`\
-\xd0\xcf\xdd\x9b\x1f\x96G\xd5.\x89\xf9\x08\xe6\x02\x5c\xbb\
-\xfeV\xb9\xa2\xe1?CQ\x14\x18\x8a\x0c\x80\x92\xa5\x91\
-\xdd\xc3dJ\xfbxm>\x7fI<\xbdn!T\xf1\
-\xa3\xa2\x1f\x85}X\x9bO\x15\xac\xf5c\xba\x1f\xd6\xfb\
-\x91\xbe\x1f6l\x98f& \xfe\xf8\xde\xfa\xb0\x1f'\
- {`\xd5\xfb\xbf~\xfd\xfa\xb7\xdf}\xf7\xdd\x0dr\
-p\xea_\xaa\xd1\x7f\xdcD\xf0\xd9\x05@\xfcCsO\
-\x8b\x5c\xbe\xeaw\xf2\x87\xb1W\xa8q\xad\x87\xf3\x82x\
-@g\xacK\xab\xf6\x7f\xa3i~^_\x87\x97\xd5\x86\
-P;\xd5\x06:\xbfh\xf8\xb1/\xb6\x5cN+\x03\x10\
-\xe0.\x80A\xdd\x03dJ\xc7x\x99\xda6A*b\
-\xe9\xff\x1cH\xefC\x981\xa3\xdf\xcd\xfa\xbe\x11\x10}\
-\xcc\xf5\xc7\x81\xb6=\x88\xbd^70f\xcc\x18\xadx\
-\xd0\x0d6\xe9\xff\xf8\xacY\xb3\x92g\xfe\xa7\x1a\xfd\x9b\
-\x8a=\x0d\x00\xf1\x15X\x0e\x80\x09\xf8\xe1\xa8\x7f\x97\xbf\
-\x1f\xf2E^\x90,\x82\x16?\xa4\xbf\x97\xab\xbd\x0e\xc8\
-\xfe\xbd*\xbe\xbf\xfc\xa7\xf2\x8b1?\x96#\xd5\xfe\x0c\
-\xcc\x00x\x03\xd6\xf2\x11\xe5\x1f\xde>A\x1b\xd3\x9b.\
-H\xbfc}\x1f\x85}\xa9\xac\xef'\x83J}U\x89\
-\xaf\xad\xf5\xa3\xd8\x0f\xff\xc7z?\xc6\x01#\x9b\x80\xaa\
-\x7f\xbc\xef\x06\xa4\xfe1)\xd0\x0c\xb5-\xf0{\xf3\xe6\
-\xcd[-\xe9\xf7\xfd\xbb\x8a\xfei\x00H\xce\xc1\xa0\xa0\
-[6\xde\xad\xed\xcewY\xdd\xc5j\xae~?^\x94\
-\x0c\xf3\xba\x9a\x89\x7f\xdd\x86\xdb\xa55\xda\xc6\x8b\x91\x00\
-\xb6\xd1\xfd\xf1\xca_\xc9i5'\xcb\xc5#\xbe)\xb5\
-\xfd\x86\x05/\x03\xa0j\x00\xb0\x94\xe1\xe5n\x96n\xc1\
-\xe6;\x13\xdb\x1b\xb4)}#\xba\x87fd\xe9\x05;\
-\xec!\x0aG\xaa\xdfI\x01\x9e\xa3{\x91\xaa\xd0\xc7z\
-?\x84\x7f\xc3\x86\x0d\x9a\xb9\x80\xe0\xa3\xd0\xcfi\xa5\xbf\
-\xa1\xf9\xde\xb6\xcd2\xfa\x9f={\xf6\x93r\xb0\xef\xdf\
-\xb3\xe8\x9f\x06\x80\xf8\x86\x17w\xbf&KZV\xaa\xb5\
-\xd9KU]\xc0$^\x90\x0c\x01s\x95\x0fm~\xa9\
-\x02\xe1\x84Azg\xef\xfb\xda\x9c\x80\xaf\x0e9Wk\
-U\x0d\x0a\x10\xd3\xb2\xc2R-\x9b\xe6'\xfa\xc5KT\
-\xcb^\x9d\x8a\xf6\xc7\xc9\xe8\xce\x11\xaaq/3[^\
-#\xfa\x86\xe8\xa3\x00/\xdd4\x7f\x22\x88\xd0\x17-Z\
-\xa4\xf5\xf9c\xbd\x1e\x06\x03\xe2\x8f\xb7n*\xfd\x93\xb1\
-\xdb\xf8G\x0d\x12\xfa\xf8\xa5\x97^Z!\x07g\xfe\xc7\
-$\xb5\xbe\x7f\xd7\xd1?\x0d\x00\xf1\x15\x9b:\xb7\xc8\x7f\
-\xae\xfc\x85\x5c0\xf4\xab\xda\x06B\xcc\x06\xa4Oea\
-\x05/\x82\x03\xd0\xa2:s\xc7\xb32k\xc7s2M\
-m!|\xde\xe0\xb3\xe4\xe4\xea\xe3|\xb5\x93 \xb2e\
-\x1b:6i\x83\x8d\xd6\xb4\xafW\x136\xd7\xab\xf7\xd7\
-\xfbF\xfc\x11\xe9\x8fm\xaf\x93\x89\x1d\x0d\xd2\xd05R\
-\x0a\xe3\x99\xe9\xb4@\xea\x1d\x05x\x10\xfeT\xab\xf9\xad\
-@\x8a~\xe1\xc2\x85Z\xc1\x1f\x86\xfbTTTh\xd5\
-\xfd8\xaf\x9bJ\x7f#PHhU\xfc\xf7\xec\xb3\xcf\
->!\x07\xd7\xfe\xed2\x00\x19\x8d\xfei\x00\x88\xef\xc0\
-XZT\xa8\xbf\xbc\xe7u\xf9\xde\xc8o\x86z#\x17\
-/\xb8\xb0\xf6\x1f\xe5\xf5\xa6\xb7ec\xc7\x16^\x0c\x87\
-\x19\x01\xd4\x07\xe0(R\xad\x82S+&\xcbq\xfd\xa7\
-\xc9\xb1UG\xaa\x9d!\x1b\xd4v\xcf\xd9\xdf\xcf\x02\x82\
-\xbe\xb9s\xab2\xc4[\xb5\xb7\x1b:6k\xa2\xbf^\
-\x89\x7fO\xbc\xc7W\xd7\x0b\x93\xf9&v6\xc8\xf8\xf6\
-z\xa9\xeb\xaa\xcd\xe8\xdf*\x22o\x88>F\xeb\xa6*\
-\xc0v`2\x9f\xea\xbd\xd7\xc4\x1f\xdb\xfa\x22\xc3\x80q\
-\xbe8\x9f\xdbJ\xffC^KJ\xf8a\x00\xccP\x85\
-\x81\x8b\x9fy\xe6\x99%I\xd1\x7f\xcc\xc0\x04d%\xfa\
-\xdf\x9fA\x0a.\x91\xa4\xf7\x13\x8f\x82\xde\xa30\xe1\x80\
-\xd9)N8`%\x07}\xfe\xc3\xaf\xcd\xe5m\xcf\xbf\
-`j\xe0\xbf\xd7~\x9d\x9d\x02i\xf0\xc1\xbeO\xb4b\
-K\x92\x1e\x98\x1d0\xb2\xdfpm\x8b\xe81\xa5\xf52\
-\xb4d\x88\xd6E0\xa8\xb8F{;\xa0\xc8\xbe\xa8\x0d\
-\x9d\x18-\xd1\x16\xd9\xd9\xb5[\xf6\xf44%\xbc\xdd%\
-[;whY\xb0\xdd\xdd\x8d\xbe\xbe\x0e(\xe4\x1b\xdf\
-Q\xaf\xd6\xf5\xc7\xc8\xc8\x9ea\x92\xc9\xf2\x03\xb4\xf0A\
-\xf0\xb1\xbe\x9f\x8dh?\x11\xcc\xf1\xff\xe0\x83\x0f\xb4\x82\
-?\x885\xce\x8b\xed\x7fS\xad\xf4OF\xdf-\xd0\x0c\
-\xd5\xf7\xff\x075\xf9\xef\x0d\xf5.v\x07\xd2\xfb\xff\x13\
-\x8f\x9e\xa4#*\xf6\xdb\xff\xd2\x00\xd0\x00\x84\x0fTj\
-_\xa8\x96\x05\x10\x89\x11\xf7\xfca\xed\x8d2\xb7\xf1M\
-^\x88,\x83\x1d/K\xd5\xd2Ua\xa4@\xad\xcd\xef\
-\x17\xb0\xf6h\x87t\xc7\xbb\x03]\x84Y\x1d\xad\xd2\xd6\
-\xf4!\xfa\x99*\xe4;p\xf3V\x82\x8b\x19\xfa\xd9X\
-\xdb7\x8b\xccQ\xe9\xff\xc9'\x9fh\xc3}\x80\xbe!\
-\x10\x86\x07a\xed\xbf\xa6\xa6&\xed\xf3,_\xbe\xdct\
-\xfd_\x0d\x18Z\xf7\xcdo~\xf32\xf5.\xa6\x03u\
-\xf4f\x01\xac\x0c@\xd4\x223 r\xe8\xf0\x1fG\xb6\
-\x8cK\x00$\x10,lY*?\xfd\xf4\xb7\xda,\xf7\
-/\x0e>C\x15l\x9d\xcd\xf5m\x17\xfc\x87j\xb5\xc4\
-\x86?\xcd*\xfa$\xd9\x03B\xdf\x1d\xed\xde\x7f\x93W\
-[,\x07\x15\x14\xed\x8d\xe8\x1c\xaa\xed\xb47\xae\xb3^\
-\x06f\xa0e/\x19\x8c\xd4\xc5\xda>\x22o'[\xf0\
-f\x02T\xfa/Y\xb2D\x13\x7f\x0c\xf7\x81\xd9\xc0d\
-?\x18\x0f<\x07\x14\xfb\xa1\x06 ]\xb0\x9c\x80\x0c\x80\
-\x19o\xbf\xfd\xf6\xd3\xf0\x86b=\xf8'kk\xff\xcc\
-\x000\x03\x10h\xd0\xfet\xda\x80\x93\xe4\xcc\x9a\xcfj\
-\x9b\xbc\x14D\x0axQl\x98\xb3\xebE\xb9q\xc3\xff\
-\xf1B\x10CJc\xfd\xa4^m\xba\x83\xaa}\xa4\xf8\
-\xcbc\x99O\xc1\xa3\x92\x1eb\x0b\xe1\xcfD\xdf\xbe\x1b\
-P\xe9\x0f\xe1G\xb5?\x8a\xfd\x10\xed\xa3\xc7\xbf\xaa\xaa\
-J\x13}\x88\x7f\xa6\x8c\x88\xea\xed\xd7\x0e#\xd4\xde\x02\
-;T\xf4\xff\x03e\x12\xf6\xa4\x19\xfd\x9b\x8d\xfe\xe5 \
- \x12nP(\xf5\xc2\xeey\xda\x81\xf5\xd7\xcf\x0c8\
-QN\xec\x7f\x8c\x1c\xa3\xcc\x00\xbb\x07\x8c9OeM\
-\xd0n\xb9\xb4u%/\x06\xd1\xd0S\xfbc;Q\xc4\
-\xa7\xb6\xc6\x8dg\xdeHCh\x91R\x87\xe8\xe3m\xb6\
-S\xfcF@\xf0\x17,X\xa0\xf5\xf9\xc3\x08\xc0\x88\xa0\
-\xba\x1fY\x08\x0c\x12B\xda?S\x85\x86v\xc5\x7f\xef\
-\xbd\xf7\xde3J\xfc[\xa5\xef\xba\xbeY\xe4\x1fwp\
-\xa4\x0c\x0d\x00\x09<{\xd4\xde\x02\xcf\xec|Q;P\
-\xa5=\xadr\xaav\xa0\x80pR\xf9xO*\xb7\x83\
-\x00\xd6m\x7fR\xff}\xb9DM\xc0\x8b\xc6\xa3\xbc \
-y\xfa\x1a\x18\xd1\xd5\x9b\xdaWQ\xfe\xa0\x9e\xec\x8cB\
-\x86\xc8C\xec\x91\xdeG\xc4\x9f\xad*~' \xd5\x8f\
-b?\xf4\xf8c\x09\x00\xc5\x85\x10|\x98\x80t+\xfd\
-\x8d@\xea\x1fK\x00F\xa8M\x81\xf6\xdd{\xef\xbd/\
-\xf7F\xfdF\xd1\xbd\x93\xf4\xff!\x9e#\x95\xe8\x9f\x06\
-\x80\x84\x0e\xf4sc\xad\x1b\x07@Q\x16\xb6\x1e\x1e\xa7\
-Z\xb8\xc6\x977\xa8\xb7\xa3\xa5AUp\xe7r\x17\xb5\
-\xed];e\x98\xaa \xcf\x05\xa8`\xff\xc7\xa1\xe7\xc9\
-\xe3\xdb\x9f\xe6\x8b%O\xa8\x8c\x95KC\xc7H\x19\xd3\
-U'\xa3;FhCz\xb2\x01D\x1ei}\x08>\
-\xe6\xe6gjB_:\xa0\xd2_m\xb2\x83\xcdv\xb4\
-\xc8\x1c\xcfo\xdc\xb8qZ\x8f?\xd6\xfeQx\x98i\
-\xb6n\xddj\xfa9\xb5\xad\xf0\x0b\xaa0p\x9f8\xeb\
-\xf9\xcfj\xf4O\x03@B\x0f\x8a\xb2\xb0\x0d,\x8eD\
-j\xd4\xb2Am\xc90\xd5\xd65L\x1b\x01[S\x84\
-v\xae\x81\xea\xe3\xd5\xea\xfdj\xa9*\xaa\xd4\x8a\x0cS\
-\xa9v\xeeT{\xcf\xb7\xaa%\x8a\xb6X\x9b\xecR\xcb\
-|\x98\xc3\x8fc]\xfbFY\xdc\xba\x5c\xcbX\x5c=\
-\xfe\x7f\xe4\x04\xb5d\x91\x0b\xfe\xad\xf6\x02yMM\xbf\
-\x83\x11!\xe1\x8c\xf2\x87v\x0f\xd2\xd6\xf2\xc7\xaa\xf4~\
-\xa6\xab\xf6\x93E\x1f\xbd\xf3\xd8\x80\x07\xc2\x8ft\x7f.\
-R\xfc\x87\x84\xc4J\xec1\xd2\x17i\x7f\x98\x00\xa0o\
-\xe5\x0b\xf1G\xfa\x1f\xa9\xffL\xd3\xde\xden\xba\xed\xaf\
-\xca>\xb4\xdfs\xcf=\xcf&D\xffFS\xff\xd2\x89\
-\xfei\x00\x08q\x02\xb6$\xc6\x91l\x0c\x92AK\x17\
-\xb2\x05\xa8+\xc0MT\xef<\xc0\xc0\x98\x96h\xeb\xfe\
-?z\xd5\xe6\xa5\xa7\xd4[\x95\xe8c\x98\x91\x1d\xb7l\
-\xbcG\xee=\xec\x88\x9c,O\xe0g\xfa\xcf\xba\xef\xca\
-\xff\xac\xbe\x8a/\x84\x90P\x16+\xd5\x06\xf1h\xeb\xf9\
-\xea\xc0T\xbel\x01\x01\x85\xe8CP!\xa2\x10\xfdd\
-\xf1\xcd\xa5\x09\x88F\xa3Z\xa5\xffG\x1f}t\xa0\x0d\
-\x0f\xf5\x07uuuZ\x91\xdf\xe4\xc9\x93\xb5!C\xd9\
-\xc0*\xfaWK\x10s\xd5\x1e\x03\xbb\xa4\xef\xa6?\x89\
-Bo\xb7\xe1\x8f]\xf4\xcfI\x80\x84d\x92\x0e\x15\xcd\
-\xe3\xc84[:\xb7\xa9\x89\x87\xb3\xb4h<\x17`\xcc\
--\x0a'\xdflz\x97\xbf\xe4 \xa2n\xf5\xb5=C\
-d\x0c\x04\xbfk\x94\x0c\xeb\x1e,\xd9\xdc\x0f\x083\xf1\
-\xb1\xa6\x0f\xc1G\xcf\xbe\xbe\xa6\xef\x87h?\x11\xb5\xc6\
-\xae\x09?\xaa\xfdU\xb5\xbd\xf61\x0c\xf7A-\x02*\
-\xfd!\xfe\xf8Y\xb2e<\xcc\xb6\xfdU\xbb\x0a\xf6\xa8\
-\xa1?O'E\xffv\x9b\xfed\x5c\xf0i\x00\x08\xf1\
-\x09\x8fl\x9b-g\xa86\xc6\xba\xd2\x1199\xff\x7f\
-\xd5}O>j^\xc4]\x02\x03\x02\xa2\xfa\xfa\xce\x11\
-\x07R\xfbX\xdb\xcf\x16\x10vD\xc9\x10|\x08?\xaa\
-\xe5\x8d\xc4>\xd7\xd1~\x22---\xf2\xe1\x87\x1fb\
-\x9d]+\xc2\x83I\xc1z?\x0c\x0b2\x16\x93&M\
-:$[\x91I\xb0\x89\x10L\x80\x11k\xd7\xae}S\
-\xed7\xb0Y\xec\xfb\xfe\xe3b?\xfe7cf\x80\x06\
-\x80\x90\x1c\x81\xfa\x84?o\xba[\xae\x1d\xff\xab\x9c\x9c\
-\x1f#l/R\x19\x88\xbfl\xba\x8f\xbf\x0c\x1f\xa2\xad\
-\xe5\xf7\x0cT\x05|\xa3T\xa4?*\xabk\xf9\x00E\
-{\x10J\x08>\xde\x22\xd5\x9f\xaa\xd8{m\x0cPy\
-\xff\xfe\xfb\xefk3\xfdQ\xe9\x0f\xa1\xc7:?L\x0c\
-\xd2\xff\x18\xed\x8b\xe7\xa3o\xcc\x93\x8d\xe7f\xd1\xfa\x87\
--\x7f\x13\xa3\xff\xa8\xcb\xc8?+\xd1?\x0d\x00!9\
-\x06s\xfa_ozG>7\xe0\xe4\x9c\x9c\xff\x1f\x86\
-|I^R\x1b/}\xda\xb6\x86\xbf\x0c\x1fP\x14/\
-RQ~\xad6}oL\xe7(\xa9\x8afo\xda%\
-\x22d\x0c\xc1\xd1#\xe4\xc4\x09x~K\xed[\xb1m\
-\xdb6\xad\xcd\x0fE\x7f\x10x\xa4\xf8!\xfeh\xf7\xc3\
-\xba\xff\xc8\x91#\x0d\x0dJr\xc6#\x1d\xd4h\xdf\x03\
-K\x0e\xc9\xa8\x22\xc4\x8f^{\xed\xb5Ub\xbf\xe9\x8f\
-Y\xf1\x9fd\xcb\x0c\xd0\x00\x10\x92cn\xdbx\x9f\xea\
-\x088:'[\xcfb\x82\x22f\x03\xfc\xc7\x8a+\x1c\
-\x15/\x92\xccS\xddS\xa9\x09>\xfa\xf2G\xaaa<\
-\x85\x92\xbd\x9ey\x88#\xd2\xfa\x10|\xb4\xc4A\xf8\xd2\
-M\xed\xe7j\x19\x00\xe7]\xb7n\x9dV\xe9\xaf\x8a\xeb\
-\xb4\x8f\xc1\xc4`\xba\x9fn\x02\x9cV\xfa\xa7k\x08\xac\
-\x06\xff\xcc\x9d;\xf7\x19\xd9\xbf\xd9Ob\xdf\x7fT\xcc\
-w\xfe\xb3\xcb\x00d\xac\xda\x83\x06\x80\x90\x1c\xb3\xb3{\
-\xb7L\xdf:C\xbe?\xf2[99\xff\xa4\xf2q\xf2\
-\xd5\xc1\xe7\xca\xec\x9d\xcf\xf3\x97\xe1\x11\x83\xba\x07\xc8\xc4\
-\x8e1J\xf8\xeb\xb4\x96\xbdl\xa5\xf6\x91\xd6G\x84\xaf\
-G\xf9\xe9\xf6\xe6\xfb\xc5\x18\xa8\xa2:m\xa7=\xac\xf7\
-\xebm~\xfaV\xbe\xa5\xa5\xa5\xdaz?\xcc@\xaa\xc2\
-\xee\xe6q(<\xb4\xda\xf4G\xed\xfa\xf7QB\xf4o\
-\x17\xf5\x9b\xed\xf0\xc76@B\xc2\xca\xcc\x1d\xcf\xcaY\
-\x03O\xd3\x06\x16\xe5\x82\xef\x8c\xf8Wy\xa3i\xbe\xec\
-\xea\xde\xc3_F\x16(Rq\xfd\xc8\xceaZ\xf1\xde\
-\x84\xce\x86\xac\xa5\xf6!TzZ\x1f\x87\x93\x8dm2\
-!\xd4^f\x01P\xe0\x87y\xfeh\xf5\xc3\x94?\x80\
-9\x04\x98\xe8\x87\x9f\x17\xe2oV\xe9\x9f\x0dC\x80\xd6\
-\xbf\xe4\xcf\xeb\xbc\xf3\xce;\x88\xfe;\xc4\xdd\xe0\x1f\xbb\
-\xde\xff\x0c\xbe.\x09!9\x07s\x04n\xd9x\xb7\xdc\
-4\xf1\xf7Y-\xf42\x03\xb3\x0e\xfe\xa3\xee\xdb\xf2\xdb\
-5\xd7\xf1\x97\x91!\xb0\xb9\x0e\x04_[\xcfW\xadz\
-\xc5\xb1\xec\xdcn!v\x10{\xa4\xf4\xf1V\xaft\xf7\
-Cj?\xd3\xc6\xa0\xb5\xb5UT5\xbd6\xd3\x7f\xdf\
-\xbe\xfd\xbb-\xea[\xf9\xe2gG\xda?\xb9x\xd1\xa9\
-\xb0\xbby\x9e\xfa\xe3\x90\x89@\xf5\xbf\x11\xaa&`\x97\
-\x1a\xfb\xfb\xba\xf4]\xfb7\x1b\xfcc\xb5\xd3\x9f\xd9\xce\
-\x7fl\x03$$,,jY&/\xed~]\xce\x19\
-tzN\xce\x8fBD\xcc\x07xg\xef\x07\xfce\xa4\
-zC\x8d\x17j\xadzS\xdb\xc7\xcb\xf8\xce\xd1Y\xd9\
-\x5c\x07\x02\x07\xb1\xd7\x05\x1f\xc3m\xbc\x14\xea\x5c\xad\xf9\
-\xa3\xd0\xee\xe3\x8f?\xd6*\xfdQp\x87\xe7\x80\xea~\
-\xac\xf3c\xf4pr\xa5\x7f&\xa3|3\xd0\xf7\x8f\xae\
-\x03#\xd4,\x82\xbf\xaa\xc9\x80m\xd2wW?\xab\xea\
-\xff\x98dh\x9b_\x1a\x00B\x02\xc8\xed\x9b\xefW\x22\
-|\xac\xf4/\xaa\xca\xc9\xf9\xf5\xd9\x00\xd9\x18~\x14Z\
-\xd1W\xe9\xfdz5c\x7f\x92Z\xd3Gz?\xd3\x91\
-\xbe\xde\x93\xafG\xf9N\xf7\xab\xf7:\x82\xcf\xa61@\
-\xa5?\xd2\xfe\xd8\xd0G\xef\xf1G\xb1\x1f\xae\xc7\xa8Q\
-\xa3\x0c+\xfd\xd3\x11v\xa7\x8f3\x9b\xfc\x87\xb1\xbf\xd3\
-\xa7O\x7fQ\x0e\x16\xff\xb9\x19\xfac\x14\xf9g<\xfa\
-\xa7\x01 \xc4g\xec\xebi\x96{\xb7>*\x97\xd5]\
-\x9c\x93\xf3\x0f-\x19,\x17\xd6\xfe\x93\xdc\xb5\xf9!\xfe\
-2,(T\x91>\x06\xf2@\xf4\xc7w\x8c\x96\x92x\
-fG:#\xca\xc7Z>\x0a\xdbp\xd8\x0d\xb0\xf1s\
-j?\xdd\xf3\xa1\xc2\x1f\xc5~h\xf3\xc3\xa0\x1dd<\
-\xf4\xad|Q\xf4\x87\x91\xc4n\x9fO&\x0c\x01f\x0f\
-`\xf6\xbf\x11*K\xf1\xea\xa6M\x9bPP\xd3-\xf6\
-\xe9\x7f\xb3e\x80\x8c\x8a=\x0d\x00!\x01`\xce\xce\x97\
-\xe4\xec\x81\xa7\xcb\x94\x8a\x8999\xff?\x0f\xfd\x8a\xcc\
-\xdd\xf3\xa6\xacn_\xc7_F\xa2P\xa8\x7f(\xe4;\
-\xbcc\x82&\xfa\xfdb\x99\xddU\x0f}\xebz\xb5\xbe\
->y/h\x11|&\xb3\x00X_G\xc4\xff\xe9\xa7\
-\x9f\xca\xea\xd5\xab\xb5\xef\xado\xe5\xab\xbfM\x9c\xe9\xef\
-e\xea\xdf*\xfaW\xcf;\xfa\xf8\xe3\x8f\xcf\x91C[\
-\xff\xdc\xec\xfa'\xd9\x8e\xfei\x00\x08\xf1!\xd8h\x08\
-\x05\x81\xb7M\xbaZ\xeb\xd3\xf7<\xba\x8d\x14j\xb3\x01\
-.]q\xa5\xf6\x5c\xf2\x9d\x8ah\xb9\xb6\xa6\x7fD\xfb\
-$\x19\xd0\x93\xb9\xa5\x19\xbdb\x1f\x82\xaf\xaf\xe5\x871\
-\x82O\x85\xee\xeen\xad\xca\x1f\xc2\xaf\xf7\xf8\xeb[\xf9\
-B\xf4Q\xe9ow\xbd\xd2-\xf0\xb3z,j\x10\xf4\
-\x22\xc4d6n\xdc8_\xcd&\xd8,\xe9o\xf9\x9b\
-\xd5\xe8\x9f\x06\x80\x10\x9f\xb2\xb2m\xb5\xcc\xd9\xf5\x92|\
-u\xc8\xb999\xffa\x15\x13\xe4K\x83\xbf \xcf\xed\
-z9o\xa3}\x0c\xe69\xb2m\xa24\xa8\x89|\x99\
-\xea\xccH\x9e\xbegW\xb1\x1e\x96\xd4\xbe\x9b\xafEZ\
-\x1d)\xff5k\xd6\x1c\xe8\xf1\xd7\xdb\xfcp\xdd`\x02\
-p\xdd\xbcH\xfb\x9b=\xd6j\xd7\xbf\xe7\x9e{\x0ec\
-\x7f\xf5\xd6\xbf\xc4\xa9\x7f\x99\xd8\xf27\xa3\x86\x80\x06\x80\
-\x10\x9fr\xd7\x96\x87\xb4\x1d\xfb0\xb3?\x17\x5c<\xf2\
-\x9b\xf2V\xd3{\xd2\xd4\xb37o\xae9\xb6\xd5=B\
-\x89\xfe\xb4\xb6\xc9\xd2?\x9a\x99-c\xb1~\xaf\xf7\xe5\
-#\x8a\x85\x09\x08sj?\x9d\xf3\xed\xdd\xbb\xf7@\xe4\
-\xbfk\xd7.\xedcz\x9b\x1f*\xfda\x02\x12\xbf\xb7\
-\xd7i\x7f=;\xa1?\xb7dTW\xc0\xd2\xe7\x9f\x7f\
-~\xb9\x1c\xba\xe9\x8f\xdb\xe8?\xeb3\x00h\x00\x08\xf1\
-1m\xd1v\xad\x18\xef\x8a\x86\x1f\xe5\xe4\xfcU\x85\x95\
-\xf2\x83Q\x17\xc9U\xebn\x0e\xfd\xb5\x1e\xa26\xdd9\
-\xb6\xe5p\x99\xd4>F\xab\xea\xcfT\xa4\xaf\x17\xf1\xe9\
-\xdb\xe7\x86E\xa8\xb3\xf1\xdc\xd0R\xb7|\xf9rm\xcd\
-\x1fF\x00_\xdb\xd0\xd0\xa0\x15\xf9\xa1\xd2\xbf\xb6\xb66\
-k\xc2\xee\xe6q\xe8H0\x1b\xfc\xf3\xc6\x1bo$\x0e\
-\xfe\xe9\x11w\x03\x7f<\x8d\xfei\x00\x08\xf19/\xab\
-\x8dz\xce\x1d\xf4y9\xaa\xea\xf0\x9c\x9c\x1f\xd3\x09_\
-\xda=O>l^\x18\xca\xeb;\xb2k\x98\x1c\xdfr\
-\x84\x8cU#y\xd3M\xf3C4\x10\xe1\xebs\xf6\x83\
-:\x90'\x17&\x02\xeb\xfcH\xf9\xa3\xe8\x0f\xc3~\x90\
-\xe2G\xaa\x1f\xd7Q\xef\xf5Oe'\xbfL\x1b\x02\x14\
-&\x9a\xcd\xfdW\xdb\x11oU\xad\x7f\xf3\xe5\xd0M\x7f\
-\x9c\xb6\x00\x8a\x97\xd1?\x0d\x00!>\x07Ex7o\
-\xbcK\xee:\xec\x06)\x8a\x14\xe6\xe49\xfcW\xfd\xc5\
-\xf2\xdde?\x96\xaeXw(\xae\xe9\xfe\xf5\xfd:9\
-\xb1e\x9a\x0c\xef\x1e\x92\xb6\xe8\xa3b_\x8f\xf4\x836\
-k?\xd7\xc6\x00\x82\x8a\x88_\xb5\xcci\xe2\xdf\xd1\xd1\
-q`#\x1f\x14\xfb\xa1\xd7?\xb1\xd2?\x1dQ\xcf\x84\
-!\xc0\xd4?\xb3\xc1?jG\xc29\xaaM1y\xec\
-\xaf\xd9\x12\x80\xa7\x9b\xfe\xd0\x00\x10\x12P\xd6wl\x92\
-'w\xcc\x91\xaf\x0f\xfb\xfb\x9c\x9c\x7fT\xbfZ\xf9\xd7\
-a\xe7\xcb\xfd[\x1f\x0b\xfc\xb5D\xef\xfeg[\x8e\x93\
-a]\x83\xd3\xfa>hC\xab\xa9\xa9\xd1\x8eL\x16\xf2\
-\xf9)*\xcf\xf6s\x83\x90b\xa4/R\xea\x10\x7f\xac\
-\xad\xeb\xbb\xf9a\xf9\x04o\xb1\xb1O\xb6D\xdd\xedc\
-\xf1\xb5x\xaeF(\xe3\xd2\xac\xc6\xfe\xbe*}7\xfd\
-1\xdb\xfa\xd7\xcd\xf0\x9f\xac\x9a\x01\x1a\x00B\x02\x00v\
-\x0b<\xbd\xe6\x14\x19^24'\xe7\xff\xd7\xe1\xff \
-\xf3\x1a\xdf\xd4\xccH\x10\x19\xa5\xb6\xd9\xfdL\xf3\xb1Z\
-\xca?U\xf4b>\xa4\xa3\xf5>\xfd|\x8f\xe0S\xfd\
-\x1e\x88\xf4Q\xec\x87t\xba>\xe0G\xdf\xcdO\x17\x7f\
-\xbd\xd2?\xd5h=\xd3\x86\x00;\xfea\xe7?#T\
-\xed\xc2K\xea\xf3\xcd\xb2\xbf\xf8\xcfj\xf2\x9f\xd5\x8e\x7f\
-\x9eS \x84\x10\xdf\xd3\xa9F\xf3\xde\xbeiz\xce\xce\
-_\x14)\x92\x1f\xd7_\x92\x93\x8d\x8a\xd2\x01\xbb\xee}\
-\xb1\xe94\xb9`\xf7\x97R\x12\x7f}\x0c/\xaa\xcf\xa7\
-L\x99\xa2\x15\xa3A\xfcS\x11\xc3l|m\xa6\x22x\
-/\x9f\x1b\xfa\xe71\xd3_\xf5\xcbk\x91?\xc4\x7f\xd8\
-\xb0a\x9a\xe8\xa3\xd2\x1f=\xfeFY\x15\x9c;\xf1p\
-\xf3\x9cSy\x5c\xf2c\xcd\xa2\x7f\xb5\x8c\xd1\xad\xd6\xfe\
-\x13\x07\xff8\xad\xf8Oe\x08\x103\x00\x84\xe4#\xd8\
-\xae\xf7\xdd\xbd\x0b\xe4\xc4\xeacrr\xfe\x89\xe5\xe3d\
-|y\x83|\xda\xb6\xd6\xf7\xd7\xaa(^\xa4\x15\xf7\x9d\
-\xd0rdJU\xfdH=#\xd2G\xc4\x0f1J7\
-\xda\x0f[\x04\x9f\xea\xd7\xa2\xd2\x1fk\xfe\x10S}\xc0\
-O}}\xbd\x0c\x1d:T\xab\xf2G\xbb_&\xa2\xf5\
-L?\x0e]\x09(N4b\xed\xda\xb5o\xa8\x9fi\
-\xa78\xdb\xf5/\xd1\x10d]\xe0i\x00\x08\x09\x11\x7f\
-\xdet\x8f\x1c]u\x84\x94\x14\x14{v\xce\xd6h\x9b\
-\xbc\xa8:\x01\x1e\xd9>K\xf6t7\xf9\xfe\x1aaL\
-\xef\x99\xfbN\x96\xca\xa8\xbbH]\x9f\xcc\x87\xb63\xa3\
-\xc23\xa6\xf6\xd3;\x1f\x86\xfa\xa0\xd2\x1f\x05\x7f0\x00\
-h\x8dD\xa5?R\xff\xc8\xb0$V\xfa\xbb\x15\xf5l\
-\x1b\x02\xb3\xe8\x1f\x0f\x7f\xea\xa9\xa7\x9e\xe9\x8d\xfe\x13\xc5\
-\xdfwc\x7fi\x00\x08\x098[:\xb7\xc9\xa3J\x88\
-\xff\xad\xf6\x82\xac\x9fk{\xd7Nyf\xe7\x8b\xf2\xcc\
-\xae\x175\x13\xe0wJc\xfd\xe4\xb3\xcd\xc7\xa9\xe9}\
-\x93\x5c=\x0eB\x04\xf1\x81\xf0\xa3\x8a\xdf\xad\xe8\x84\xad\
-8/\xd3\xe7\xc3\xc7\xf5\xa9~*Z\xd6\xd6\xd2q\x9d\
-\xf5\xdd\xfc\xf4u\xffL\x8az&\x0d\x01&\x13\x9a\x8d\
-\xfdU\xc6\xe0\x93y\xf3\xe6\xad\x96\xbe\x83\x7f|9\xf6\
-\x97\x06\x80\x90\x10\xf0\xc8\xb6\xd9rF\xcdg\xa5\xaet\
-DV\xbe\xff\xda\xf6\x0d\xf2\xf8\xf6\xa7en\xe3\x1b\xd2\
-\x13\x8f\x06\xe2\x9a\x8cUm}g\xef;U\x9b\xdb\xef\
-F\xf8\xb1\xe6\x0c\xe1O\x1c\xd4\xc3\x08>s\xe7\xc3\xfa\
->\x86\xfb@\xf4Q\xec\x07!E\x07Eb\xa5?\xda\
-\xfe\xb2-\xea\xe9<V\x1fGl\xc4+\xaf\xbc\x928\
-\xf6\xd7N\xfcs:\xf6\x97\x06\x80\x90\x10\xd0\x1d\xef\x96\
-[6\xdd-\xff;\xfeW\x19\xfd\xbe\x8b[\x96\xab\xec\
-\xc2l\x99\xbf\xf7\xc3\xc0l\x02\x84\xf5\xfd3\xf6\x9e\xa4\
-\xc6\xf7\xba\x8b\xfa\xd1\xbe\x87ug\xb3\xf5\xfd\xa0\x89\xaf\
-\x1f\x9f[WW\x97\xd6\xe6\xd7\xd4\xd4\xa4\xad\xfbc\x03\
-\x1d]\xf4\xf5\xc8_/\xf6\xcb\xc5H_'\x8fE\xd5\
-?\x9e\xbf\x11\xea\xe3\xeb\x1f{\xec\xb1\x05b\xbf\xe5o\
-\x5c\x9c\x8d\xfe\xcd\xc1\xdf\x0f!$p|\xb8\xef\x13y\
-\xbd\xf1m\xf9\x9cj\x0dL\xeb\xa6\xaf\xfeA\xf0!\xfc\
-0\x00A\x02\x15\xfe_m:\xd3UO?\x84\x07\x15\
-\xe7Nv\x92cj?\xf5\xf3577\xcb\xb2e\xcb\
-\xb4\xb7\xa8\xf4\x87\x19\xc02\x0bF\xfbbc\x1f\x14\xfe\
-\xd9\xf5\xdc\xe7\xd2\x10\xe8\x8fC\x9b\xa2Y\xe7\xc0{\xef\
-\xbd7\xa77\xfa\xb7J\xff\xdbU\xfb\xe7,\xfa\xa7\x01\
- $\xc0\xdc\xba\xe9^9\xbe\xffQR^\xe8\xbe-\
-\x0d\xa9}\xf4\xf5?\xaa\x96\x13\xd6ul\x0c\xdc\xcf>\
-\xae\xb3^\xcem\xfa\xac\xb6\xee\xef\x04\xf4\xf0\xa3\xc2\x1c\
-\x06\x80\x11|vM\xcb\xee\xdd\xbb5\xd1\x87\xf8#\xf2\
-\xc7\xc0\x1f\x98.\xb4P\x22\xeb2r\xe4\xc8\x94~6\
-/\x0d\x01\x1eg\xb5\xe9\x8f\x9ac\xd0\xa8\x06\xff\xbc&\
-}\x07\xff\xc4\xc4y\xff\xbf\xe4:\xfa\xa7\x01 $\xc0\
-\xec\xeen\x94\x07\xb6=)\xdf\x1f\xf9-\xc7\x8fi\x8f\
-u\xc8_w\xbd*3v<#;\xbav\x05\xf2\xe7\
-F\x91\xdfYj\xbd\xdf\xe9m\x13\xa2\x8f\x163}6\
-\x7f\x90\xc47h\xcf\x0d\xdb\xe4\xae[\xb7N\x1a\x1b\x1b\
-\xb5\xc2?|\x0d*\xfc!\xfcuuuZ\x16 \xd3\
-\xd1z\xb6\x0c\x01*\xff1\xaa\xd8\x88\x85\x0b\x17\xfeU\
-\xcd\xfeG_\xa0\xdd\xda\xbfo\xc6\xfe\xd2\x00\x10\x122\
-f\xeexV\xdb\xb0g\x5cY\x83\xe5\xd7\xed\xed\xd9'\
-O\xed|Af\xed|N\x9a{Z\x02\xfb\xf3\x1e\xd3\
-6UN\xdf{\x82\xe3\xa8\x1f\xc2\x9f\x18\xf53\xb5\x9f\
-\x9d\xf3\xe1\xf3\xa8\xf0\x87h\x22j^\xbf~\xbd\xf6\xf5\
-X\xef\x87\xe8cC\x9f\xe4\xd6\xcaL\x89z6\x0c\x81\
-U\xf4\xaf2\x1a\x1d\xf7\xdf\x7f\xff_{\xa3\xff\xc4\xc1\
-?F\x99\x00\xab\x8a\x7fO\xc7\xfe\xd2\x00\x10\x122\xa2\
-*\x95\x7f\xcb\xc6\xbb\xe5\xa6\x89\xbf7\x9c\xd2\xb7\xadk\
-\x87f\x12\x9e\xdd\xf5\x8a6M0\xc8`\xa8\x0f\xda\xfc\
-\x9c\x805~D\x9cN+\xcc\x99\xdaO\xfd\xb9\xe9\x1b\
-\xfa\xa0\xd2\x1f\x15\xf38\xd0\xe67q\xe2Dm\x90\x12\
-\x8a\xfd\xf0{p\xbb\x9b_.\x0d\x01\xd6\xfe\xcd\xa2\x7f\
-\xd5\xcd\xf0\x9a\x1ab\xb4G\xcc\xe7\xfe[U\xfe\xe7,\
-\xda\xa7\x01 $\x84,jY\xa6\x06\xf5\xbc\xa6m\x1b\
-\xac\xb3\xa6}\xbd\xcc\xd8\xfe\x8c\xbc\xaaZ\xf9\xa2\x01i\
-\xe5\xb3\x02s\xfc\xb1{\x9f\x13\xb0\xa1\x0c\xd6\x9b\x13[\
-\xfb\xfc&\xbeaYv@\xa4\x8c6?\xac\xf7c\xb2\
-\x1f&\xfd\xa1\xcdO\x17\x7fD\xfe\xc9c}\xfdR\xe0\
-g\x06j\x16\xcc\xa2\x7f\xf5}bO>\xf9\xa4>\xf8\
-\xc7*\xfd\xeff\xc3\x9f\x9cM\x05\xa4\x01 $\x04\xdc\
-\xb1y\xba\x9c\x5c}\xacl\xec\xd8\x12\xb8V>;\x8e\
-l\x9d\xecX\xfcQa\x8e\xc3.]\x1d\xe6\xd4\xbeW\
-\xcf\x0d\xa3q!\xfe\xd8\xd8g\xf5\xea\xd5\xda\xb8\x5c,\
-\xb7`\xba\x1ff+ \x03\xe3\xc4\x84\xe5\xa2\xc0\xcf\xea\
-q\xd8\xf2\x17\xf3\x0b\x8cPS\x0c?\x98?\x7f>f\
-\x18w\x8b\xbb\x0d\x7f\xec\x84\x9f\x19\x00BHj\xec\xeb\
-i\x96\x8b\x96\xfe\x97\xb6\xd6\x1f&\xc6u\xd4\xcb\x17\xd4\
-X_'\xa0\xd2<\xb1\xc8\x8c\x11|\xf6\x9e\x1bz\xe3\
-Q\xe9\x0f\xf1\xd7{\xfca\xbcP\xf0\x87\xe1J\xa8\xbd\
-\xc0\xe3\xdd\xa6\xfdsm\x08\x90\xf6G\x16\xc3\x0c5\xf8\
-\xc7(\xfaw3\x01P\xfc\x12\xfd\xd3\x00\x10\x12\x22\xc2\
-&\xfe\xb5]C\xe5\xbc\xc6\xcf;\xda\x81\xd0H\xfc\xc3\
-*\xbe\xb9~n\x10HT\xf8C\xf4a\x02\xb0\x0c\x80\
-\x16K\xb4\xf7\xe1-\xa2\xffL\x89\xb3\xd7\x86\x00k\xff\
-f\xd1\xbfjo\x5c5s\xe6\xcc\x85\xd2\xb7\xef?*\
-\x01\x19\xfbK\x03@\x08\x09\x04\xa5\xf1~r^\xd3\xe9\
-\xb6;\xf9\xe1\xa6\x0e\xf1\xc7\x862L\xedg\xff\xb9a\
-#\x1f\x1c\x18\xe9\x8b\xb4?\x22f\xac\xf3#\xeaG\xf4\
-o6\xd3?[\x86 \x93F\x02\xc2o\x15\xfd\xbf\xf5\
-\xd6[\xfa\xd8\xdfn\xb1\xdf\xf67&>\x1c\xfcC\x03\
-@\x08\xf17\xeaV\xf8\xa5\xc6\xd3\xa4\x7f\xb4\xd2Q\xe4\
-\x0f\xf1g\x04\x9f\xdd\xe7\x06\xa1\xc7,\x7fT\xfa\xebm\
-~h\xb3D\xb1\x9f\xde\xe6\x97X\xe9\xefE\xb4\x9e\xe9\
-\xcc\x02\xc4\xdf,\xfaW\xf5\x0e\xdb\xa7O\x9f\xfe\x96\xf4\
-\xdd\xf2\xd7n\xfd\xdf\xe9\x0c\x00f\x00\x08!\x04\x9c\xd8\
-:M\xc6t\xd6\xd9~\x1d\xd6\x9c\x93\xc5\x9f\xa9\xfd\xcc\
-?7\xa4\xf8\x91\xeaG\xd4\x8fA?h\xf3\x83\xd8O\
-\x980A\x13\x7fD\xfe\xc9\x95\xfe\xb9\x12\xf6T\x1fg\
-\xb7\xf6\xff\xc1\x07\x1f\xccQ\xfb\x02\xb4\x89\xb3\xb5\x7f\xb7\
-c\x7fi\x00\x08!\x04s\xfdOi>\xda\xf6\xebP\
-m\x0e\x03\x90\x95\x04\x04\x87\x05\x1d\x00\xeb\xfc+V\xac\
-\xd0\x8a\xfd0\xe1\x0fc~\xd1f\x89\x01?X\xebG\
-\xbb\xa5\xd9\x84\xc5 \x19\x02T\xfe\xa3\xfd\xcf\x08%\xfc\
-{\xef\xb9\xe7\x9e\x97\x93\xa2\xffD\xe1\xb7\xdb\xf8G\xfc\
-j\x06h\x00\x08!\xbe\xa0@\xfd;k\xef\xa9\xda[\
-+\xd0g>|\xf8pF\xf0Y>\x1f\xda\xfa\x90\xf6\
-\xc7F>z\x9b\x1f2.\x18\xec\x83\xd1\xbeX~I\
-\xac\xf4w+\xce~1\x04\x10~\xab\xe8\x1fc\x7f\xd5\
-\xd2\x07*l\xbb\xc5\xfd\xe8_\xdfD\xfb4\x00\x84\x10\
-\xdfrB\xcb\x112\xacg\x90\xf5\x0dK\xa5\x9aQi\
-\x9e\xa9>\x7f\x1a\x03\xe3\xaf\x85 b\xb4/\xc4\x1f\xe9\
-\xff\xf6\xf6vM\xf0\xb1\x8b\x1fZ\xfc\xac:.\xfcX\
-\xe0g\xf58\xab\xca\x7fe\x0e\xda\xd5\xd8\xdf\xe7\xe4\xd0\
-\xb1\xbfv)\x7f\xbb1\xc09\x8f\xfei\x00\x08!\xbe\
-\xa0\xa6\xa7ZNl>\xca\xf2kpS\x87\xf8\x98\xad\
-7\xfbM|\xfd\xfc\xdc\xac\xbe\xc7\xe6\xcd\x9b\xb5J\x7f\
-\x88>z\xfca\x02 \xfc\xc8\xba \xe5\x8fJ\x7f\xb7\
-\xcf\xd7\xcb(\xdf\xcdc\x11\xfdcY\xc3\x0c\xb5\xa5\xf1\
-\xcb\xaa\xe0q\xb7\x1c\x9a\xfe\xb7k\x01\xf4\x85\xc0\xd3\x00\
-\x10B|\xcf\x99j\xd8\x8f]\xcb_MM\x8d\x94\x97\
-\x973\x82\xcf\xd2\xf9\xf0x\xf4\xf7\xa3\xca_o\xf3\xc3\
-\xc7\xb0\xde\x8f6?\x98\x80\xd2\xd2\xd2\x9c\x09{6\x0c\
-\x81\xd5\x8e\x7f\xea\xe3\xdd\x0f>\xf8`\xf2\xe0\x1f\xa7\x03\
-\x7f|9\xf8\x87\x06\x80\x10\xe2+\xea\xbajet\xe7\
-\x08\xcb\xaf\x81\xf0\xb8)\xfa\xa31p\xf7\xb5\x88\x84\x91\
-\xeaW[\xdcj\xe9\x7f\xcc\xf5G\xa6E/\xf6\xb3\xaa\
-\xf4\x0f\xaa!@w\x03\xda\x1a\xcdPf\xe8oK\x97\
-.\xdd*\x07\x07\xff\xa42\xf6\xd7\xd7u\x004\x00\x84\
-\x90\xdc\xa1n\x8b\xa7\xef\xb3\xde\xde\x177v\xa4\x9f\xfd\
-\x22\xbe~\x8d\xe0S=\x9f\xaar\xd7*\xfd\x91\xf2\xd7\
-\xdb\xfcPh\x99X\xe9\x8f\x99\xfen\x9f\x9f\xdf\x0d\x01\
-\xd6\xfe\x93\x1f\x93\xf8\xed\x9ex\xe2\x89\xa7\x12\xa2\x7f\xbb\
--\x7f\xcd\x0a\x00\xc5\xaf\xd1?\x0d\x00!$\xa7L\xe9\
-\x18'C\xbb\xad\x0b\xff\x90\xfa\xc7\xf6\xbe\x8c\xe03\x0f\
-\x22~D\xfeX\xe7G\xfa\x1f3\xfe\xb1\xc6\x0f\xf1G\
-\xa5?\x8e\xc4s\x07\xad\xc0\xcf\xecq0=\x8d\x8d\x8d\
-\xa6\x8fU\x19\x90w\xd5\xe4\xbf\xb5\xe2l\xec\xaf]\x06\
-\x80]\x00\x84\x10\xd2\xe7\x86\xac\xfe\x9dl\xd3\xf3\x8f}\
-\xe5\x13g\xcb3\xb5\x9f\xb9\xafE\xfa\x1b\x95\xfe\x10C\
-\xb4\xfbaw?}\xaa\x9f]\xa5\x7f\xae\xa2\xfcL\x9d\
-\xd3.\xfa\x7f\xf6\xd9gg\x89\xb3-\x7f\x033\xf6\x97\
-\x06\x80\x10\xe2\x1b&\xb67\xc8\x80h\x7f\xcb\xafI\x8e\
-@s\x11%\xfb9\x82O\xf5|H\xf3\xa3\xda?\xb1\
-\xd2_o\xf3C\xca\xbf\xb2\xb22\xa5\x88=\x08\x86\x00\
-C\x8d0\xd3\xc0\xe2\xda|\xf4\xfc\xf3\xcf/\x93C\xc7\
-\xfeZ\x19\x81\x988\x1f\xfc\xc3\x0c\x00!$\xbf9\xbe\
-\xf5\x08\xcb\xcf\xa3\xe2\x1fS\xe7\x18\xc1g\xee\xb9\x01\xcc\
-\xf1G\xa1\x1fD\x10i\x7fT\xc1\xa3\xc8\x0f\xf3\x15 \
-\xfe\x89\x95\xfe\xb9\x12\xf6l\x1a\x02T\xfe[D\xff\xa2\
-\xa2\xff'\xe5\xd0\xca\xff\xa8\x89\x09p\x92\xf2\xe7\x12\x80\
-O\x89\x0b!\xc4sP\xf5?\xac\xdb\xba\xaa\xdfh[\
-\xd9 \x8bo\xae\x9f\x1b\x86\xdd \xd5\xdf\xdc\xdc\xac\x8d\
-\xbeE\xa5?\x8a\xfb\xf4\xf5\xfe\xba\xba:m\xc9\xc5\xad\
-\xc8\xfa\xb900\xf9\xb1X\xe6\xc0\xcfo\x86*\x82\xfc\
-\xe4\x99g\x9eY\x9c\x10\xfd;\xdd\xf8\xc7\xf7c\x7fi\
-\x00\x08!\xbe\xe0\xd8\xd6\xa9\x96\x9fG\xe4\x8fH\x94\xa9\
-\xfd\xcc<7\xac\xf3#\xd5\x8f\xf47\x84\x1f\x06\x00b\
-\x8f\x0d}\xd0\xe3?r\xe4\xc8\x03\x95\xfe~\x8a\xd63\
-\xf98<\x06]\x0eV\xcc\x993\xe7q\xd9\xbf\xe5\xaf\
-\x9bM\x7f\xec\xaa\xff}K\xbe\x19\x80@\xccg&$\
-\xccTE+\xa4\xa1s\x94\xe9\xe7q3\xb7\x8b\xfe\x99\
-\xdaw\xfe=\x10\xf5\x22\xf2\x87\xf8c\xb8\x0f\x86\xfc`\
-yE\x17\x7f\xb3\x16\xcb\xa0\x16\xf8\x99=\x0eU\xff\xb8\
-\x06f\xa8\xa5\x81\x85\x09\xd1\xbf\xdd\xe0\x1f\xab~\x7f_\
-\x8e\xfd\xcdG\x03\x10\x884\x0c!\xf9\xc4\xe1m\x13\xb5\
-\x0e\x00\xab\xe8\x1f\xdb\xcd\x86A|s\xfd\xdc\xd0\xd6\x87\
-J\x7f\x08\x1f2\x00(\xfa\xab\xae\xae>\x90\xf6wR\
-\xe9\x1f\x06C\x80:\x07d=\xacx\xee\xb9\xe7f\x18\
-D\xff\x89GT\xcc\xfb\xfe\x03\xa9+\xac\x01 \x84x\
-\xfa\x17wx\xfb\x04\xcb/\xc1\x8es\x19?m\x1e\x0e\
-\x0b\x82\xe0a\xa6?\xd6\xbc\x91\x01\xc0\xb4?\xbd\xd2\x1f\
-\x05\x7f\xa8\xf4\xcf\x85\xb0\xe7\xc2\x10`\xbc\xb1\xd9v\xbf\
-\xbd\xd1\xff\xa2\xd9\xb3g/\x14\xe73\xff\x9d\xac\xfb\xfb\
-~O\x80\xa2\xfc\xb9\xed\x04\xab=\x83\x9002\xa6k\
-\x94\xf4\x8fV\x9a~\x1e\x91?\xa6\xd01\x82O\xfd|\
-x\x7f\xe3\xc6\x8dZ\xa5?\xd2\xde\xa8\xf4\xc7\xc7\xf4\x9d\
-\xfc\xcc*\xfd\x8dD6H\x05~f\x8f\xc3\xc8_\xab\
-\x0d\x7f\x80j\xfbK\x8c\xfe\xedz\xff\xcd\x96\x01\x02\x17\
-X\xe6c\x0d\x80\x91) \x84x\xc0\xe4\xf6q)E\
-\xffL\xed;\xfb\x1e\xa8\xf4G\xca\x1f\xa9\x7f\x0c\xbbA\
-\x06 \xb1\xd2\x1f\x91\xbf\xd3J\xff\x5cE\xeb\x99~\x1c\
-2!f\x1b\xfe\x00e\x94\x16\xcf\x9a5+9\xfa7\
-k\xf9\x0b\xe4\xa6?\xf9f\x00\xac\xc4\x9d\x85\x80\x84\xe4\
-\x80\xc2x\xa1\x8c\xeb\xa83\xff|a\xe1\x81\xb4t\xae\
-\x85:#7!\x8f\x9f\x1b*\xfd\x11\xed\xa3\xe8o\xdd\
-\xbauZ\xd4\xabW\xfac#%\x88?\xcc\x80\x1f\xa2\
-u\xaf\x0c\x81\xdd\xd0\x1f\xd0[\xf9\xdf\x9e\x14\xfd\x9b\xf5\
-\xfd\xbb\xd9\xf9\x8f\x19\x80\x1c\x08\x7f\xc4@\xec\xcd\x8e(\
-o\xcb\x84x\x03z\xff\xfb\xc5\xcdg\xfac\x06=n\
-\xeeL\xed\xbb\xffZ\x14\xf7\xa1\xc2_\x9f\xec\x87\x19\xff\
-\xa8\xf4\xd7\xb7\xf2\xc5\xda\xbf\x9f\xc4\xd9\xabs\xda\x8c\xfc\
-\xc54\xc4\x0fT\xf4\xff\x89A\xf4\x1f\x9a-\x7f\xf3\xc5\
-\x00$\x8b\xbf]\xe4\x1f\xedu{\x84\x10\x0f\x98\xd41\
-\xc6\xf2\xf30\x00A\x14\xdf\x5c?7\xb4\xf5!\xed\xdf\
-\xd6\xd6v\xa0\xd7\x1fK)c\xc7\x8e\xd5\xc4\x1f\x95\xfe\
-~\xdf\xc9/\x1b\xe7\xc4uA6\xc4\xea\xa1j\xc7\xbf\
-G\xe5\xd0\xb5\x7f\xb3\xe2\xbf@n\xf9\x9bO\x19\x00\xab\
-,\x80\xfe~,\xc1\x00\xb4\xcf;v\xd6)\xea-z\
-\x8e\x8a{\x0f\x5c\x93\xc2\x84\xa3 \xe1\x88$\x1cb`\
-8\x22BH~\x101x?\xf1m\xe2\xdfI\x91*\
-\xee+\xbf\xf4\x91o\xfcF\xfd\xa5\x19V\xf8a\xb7?\
-/Z\xff2r\x83\xf1\x911@u;\x0a\xfe v\
-\xa8\xf4G\x0d\x80^\xe9\x8f\xb7\x89\xa6*H\xe9\xfb\xe4\
-\xc7\xba}\x9c\x93\xb6?\x951\xf9\xdb+\xaf\xbc\xb2\xd2\
-E\xf4\x1f\xc8-\x7f\xf3\xcd\x00\x98\x09\x7f\xe2\xa1\xff\x22\
-\xf1\x8bo\xe9}[\x94p81\x00\x11\x0a?\xc9c\
-\xd1\xb7\x13~\xfd\xc0\xdfM\xf1\x99g\x9e9^\x09|\
-Y\xaa\xd1\x7f\x98#\xf8T\xcf\x85\x02?T\xfa\xe3\xc0\
-t?\xd0\xd0\xd0\xa0\x09?\xd6\xfb\xad*\xfd\x83f\x08\
-\xdc>\x0e\xc6\x08\x1b\x1c\x99\xa1\x0cB\xf7\xf4\xe9\xd3\x11\
-\xfdwf \xfa\x0flAy\x90\x0d\x80U\xca?\xf1\
-sV&\x00\xbf\xe4n\xfd5\x91\xf0\xb1\xa2\x04\xf1/\
-L\xb8\x91Ye\x00h\x02H>G\xfef\xe2\x8f\xbf\
-\x9f\xa2\xe3\x8f?~\xb2\xd57u[\xfc\x97\xcf\xc6\x00\
-\xd1-\x8a\xfcP\xdc\x06\x13\x80\xcdmP\xdc7n\xdc\
-8-\xe5\x0f\xf1/**: \x9aa-\xf03{\
-\x1c\xda\xfe\xb0\xd5\xb1\x15K\x96,ya\xc1\x82\x05\x9b\
-\x12\x0c@\xdeE\xffa\xca\x00\x18\x99\x013\x97f\xf4\
-K\x8d\x9a<\xbe\xa0\xf7\xf3\x05\x0974a\x06\x80P\
-\xfc\x1d\x89\x7fL\xff:\xb5\x1e}\x98\xd97E\xa5\xba\
-Qk\x1a\xf7\x018\xf4|\x18f\x83b?\x14\xf9\xa1\
-\xe2\x1f\xed~X>A\xb1\x1f*\xfd\x11\xfd\xa3\x9b\x22\
-\x97\xe2\x9ckC`\xb7\xdb\x9f2\x08mw\xdey\xe7\
-L1\xde\xf1/o\xa2\xff0\x19\x00'f \x96t\
-cJ\x14~\xb3\xafO\x8e\xfe\x0b\x0cn~B#@\
-h\x00\xfa\x08\x7fA\xc2\xdfOL\xadGW\xaa\xd9\xfe\
-\xa6\xfd\x7f\x18\xfd\xcbq\xbf\xf6\xa0\xc2\x1f\xa2\x0f\xf1\xc7\
-z?\x8a\xfep\xed\xd0\xe6\x87B?\xf4\xf9\xfbQ\x9c\
-\x93\x1f\x9bM#\x81k\x83\xc3\x0a\x15\xf9?\xad2(\
-;\xc5x\xea_&\xa2\x7f\x1a\x80\x1c\x8b\x7f\xdc\x22\x0b\
-\xa0\x1b\x81h\xc2[3\xf1O\x8c\xfe\xb9\xfeO(\xfc\
-}E_\x92\x84?\xd1\x00\xe8f\xb9H\xad\xffO\xb2\
-\xfa;\x81\x88\xf9]|s\xfd\xdc0\xce\x17\x95\xfez\
-\xb1\x1f2\x015552f\xcc\x18-\xf2\xc7\xfbA\
-\x99\xe0\x97\xad\xcc\x02\x96F\xd0\xf6gc\xa2v\xdf|\
-\xf3\xcdO\x19D\xffV\xc3\x7f\xdcF\xff\x9c\x04\xe8#\
-C`$\xfe\x11\x97\xe2_ \xc6k\xff\x14\x7f\x12v\
-\xb1\xb7\xca\x00\x18E\xfe\xc9\x06\x00\x11\xeax\xb3o\x88\
-\xb5\xeb\xc4\xea\xff\xac\xdc\x04\x02\xdeQ\x80\x81>X\xeb\
-\xc7[\x98\x00<F\xaf\xf4G\xd4oT?\x11\xe6\x02\
-?\xb3\xc7\xe2\xfa`\xfd\xdf\x8a\xb7\xdf~\xfbIe\xa2\
-\x9ae\x7f\xed\x97]\xe1_\xa8\xa3\xff0\x18\x80\xe4b\
-\xbf\xe4\xc2\xbf\x88\x85\x0903\x0b\x89\xeb\xfeV\xd1\x7f\
-\xc4\xe5\xcd\x93\x90\xb0\x18\x83\x88\x8d\x01H\xec\x9e\xc1\xec\
-y\xd3\xdd\x7f0\xf7?q\x86=\xc7\xfd\xf6\xfd\x1eX\
-\xcf\xc6\x1e\xf6\xfaX_|l\xf4\xe8\xd1\xda\x16\xbe0\
-\x01n\xf6M\x08\xb3!pR\xf8\xa7\x8a&\xd7\xdfr\
-\xcb-/Jz\x85\x7f\xa1\x89\xfe\xc3\x9a\x010\xeb\x00\
-\x88Y\x08u\xbc\xf7\xa6\x15O\x12\xfe\x02\x07\xe2O\xd1\
-'\xf9(\xfeb\xf0w\xa2\x0b\x7f\xbc\xf7\xde\x12\xeb\xdf\
-\xbf\x7f\xb1\x1aJSoe\x00\xfc*\xbe\xb9\xfeZ\xb4\
-\xf6A\xd4\x10\xf5\xe3\xad^\xe9\x8f\x94?\x0c\x00\x0a'\
-\xf3\xad\xc0\xcf\xecqv\x13\xffd\xff\xd0\x9f\xbb\xd5\x9c\
-\x84v\x9b\xe8?*\xf6S\xffB\x11\xfd\x87\xd1\x00\x18\
-\x89\x7f\xb2\x11H6\x03\xc9\xd1\xbfS\xf1\xa7\xf0\x93|\
-\x11}#\xf17Z\xf7\x8f%\x18iP|\xf6\xd9g\
-\x8fU\xc2U\x94\x8e\x01\xf0\x8b1\xf0\xea\xb9a}\x1f\
-m~\xa8\xf0\xc7z?\xa6\xd9\xa1\xd2\x7f\xe2\xc4\x89\xda\
-Z?\x22\x7f}\xa6\x7f\xae\xc59\xf9\xb1\xb90\x12\xb8\
->6\x13\xff\xd09\xf1\xc6SO=\x85\x91\xbf\x1d\x0e\
-\xc5?\xf4\xd1\x7fX\x0c\x80Y\xd5\x7f\xc4\xe0\x17\x133\
-\x10\xfd\xe4\xe5\x81D\xe1/0\xb9\xf11\xfa'\xf9\x1a\
-\xfd\x8b\x18\x17\xfe%F\xffzv \xaeD\xcbt\xfb\
-?\x88Xr\xfb_\xbe\x8f\xfb\xc5\x18_D\xfc\xe8\xf1\
-\xc7X_\x0c\xb3\xc1\x1a?\xda\xfc0\xde\x17\xd1\xbf\x99\
-\xf8\x07%Z\xcf\xe4c1\xf9\xd0\xae\xf0\x0fm\x7f\x7f\
-\xf9\xcb_\xa6K\xdf\xc2?\xa3Vp'3\xffC\x13\
-\xfd\x871\x03\x90(\xfef\xbf\x9cX\xd2\xcd,Y\xfc\
-c\xe2|\xdd\x9f\x06\x80\xe4\x9b\x010[\xfb\xd7\x97\xd1\
-\xf4\xaf\xd3\xdeW\xfb\xcf7\x98}cL\xaa\xe3\x9a\xff\
-\xc1\xef\x81\xb6>}\x17?\xb4\xfbA\xdc\x10\xf1c\xa6\
-?\xda\xfc\xf4\xad\x92\xf3\xb1\xc0\xcf\xec\xb1\x98\x82\x88\x8c\
-\x89\x15\xef\xbe\xfb\xee\xcc\x95+Wn\x17\xe7}\xffy\
-\x11\xfd\x87\xc9\x00\xd8M\x0542\x01\x89\xa2\x1eOz\
-k\xd4\xe6D\xd1'\xf9\x22\xf4f\x9f3\x1b\xf6Sh\
-\xf0\xf5\xda\xdf\x98\x12\xae\xd1f\xdf\xd4\xac\xfa?\x1f\xf7\
-\x01hll\xd4\x8a\xfc\x10\xcd\xeac}\xf5J\x7fD\
-\xfdV\x93\x12\xf3\xd5\x10`.\x02\xda\x22\xadP\x9f\xdf\
-\xac\xda\xfe\xe6\x88\xbb\xa1?1\x09\xd1\x8e\x7f\xf9\x96\x01\
-\x10\x03A\xb7\xca\x06$\xde\xd0\xe2&\xc2O\x03@\xf2\
-\xd9\x08\xd8\x0d\xfd1\x12\xff\xb8\xea\xef/T3\xfeM\
-\x07\x00a];L\x11|\xaa\xe7\x83\xe8\xa3\xda\x1f\xc2\
-\x8f\x88\x16\x9f\xc3L\x7f\x8c\xf5E\x9b\x1f2%n\xbf\
-\x7f&D\xd6\xefF\xc2.\xf5\x8f/S\xeb\xfe\xf7*\
-\xa3\xa0\xef\xf7\xd2#\xeeZ\xfeb\x12\x82\x1d\xff\xf2\xc5\
-\x00\x18\xad\xfb\x9b\x99\x80\xb8X\xa7\xf9\x9d\x14\xfc\xd1\x08\
-\x90|2\x04F\xc5\x7f\xc9\xe9P}\xb6\x86f\x0a>\
-\xfb\xd9\xcf\x8eR\xeb\xd5\xc5V\x06 \x9f\xd7\xfc\xf19\
-\xec\xe4\x87\x8dk0\xde\x17\xc3~0\xc6\x17\xeb\xfdH\
-\xfd\xa3\xd2\x1f3\xfd\xc3\x10\xadg\xfa\x9c0Jv=\
-\xffj9e\xfe\x8c\x193>\x14\xe3\xc2\xbf\x98\x98\x17\
-\xffYe\x01B\x13\xfd\x871\x03\xe0\xc6\x04\x18\x99\x01\
-q\x11\xf5\xd3\x00\x90|3\x00\x89\x99\xb2\x82\xa4\xaf\xd1\
-#\xff\x03\x1f\x9f4i\x92i\xf4oT\x00\x98i\xf1\
-\xf5\x83\x890\x03\xeb\xfbX\xefG{\x1f\x8a\xfdP\xfc\
-\x87%\x11\x8c\xf5\xad\xae\xae\xb6\xac\xf4\xcfwC\xe0$\
-\xf5\xaf\xea\x02:\xee\xb8\xe3\x0e\x14\xfe\xb5\x8bq\xe1\x9f\
-Q&\xc0*\xf2\x0f]\xf4\x1fF\x03`g\x02\xcc\xbe\
-6\xee \xea\xa7\xe0\x93|\x14~#\x13P`\x10\xf9\
-G\x92n\xa4\x11%b\xa6\x06 Q\xfc\xf3m\xdc/\
-*\xfb!\xfe\x88b\x11\xf9\xc3\x0c`\x1c2\x22\x7f\x88\
-?\xd6\xfc\xf1}\xdc>\xff|0\x04\x18\xf7\xbbc\xc7\
-\x0e\xbb\x9e\x7fy\xef\xbd\xf7\x9e\x5c\xbcx\xf1f1N\
-\xfd;]\x02\x10q^\x07@\x03\x10\x00\x13`g\x08\
-\xac>O\x03@h\x00\xfa\x0e\x01\x8a\xc9\xa1\xd36\x0f\
-\x04\xf9*\x8d=\xca\xec\x9b;Y\xff\x0f\xa31@\xf4\
-\x8a6?}\xcd\x1f\x9f\xd3+\xfd!\xfe\xa8\xf4O\xfc\
-\xbe\xac\xf8\xef\x0b2&0PV\xa8\xafYu\xcd5\
-\xd7`\xde?R\xff\xdd)\x8a\x7f\xa0w\xf9\xcbw\x03\
-`f\x02$I\xdc\x937\x0e2\x1a%\x1c\xda\xf4\x0f\
-!\x16\xc2\x9f\xfc7\x92\xfc\xb7\x10\x93\xbei\xff\xe4\x1b\
-gD\x15\x00\x8et\x92\x01\xc8\xeaM\xc0G\x1d\x05\xe8\
-\xedG\xa5?\x84\x1f\x06\x00`\x9d_\x8dJ\x16\xb5[\
-\xa2e\xa5\x7f\xa6E\xd6\xcfF\xc2\xec\xb9vvvj\
-\xdd\x12V\xa8lJ\xd7\xed\xb7\xdf~\xabz\xdb*\x07\
-w\xfb3\x1b\xfac7\xf5/\xd4\xd1\x7f\xd8\x0d\x80\x91\
-\x0903\x02b\x12\xf5\xc7\x19\xfd\x93<#n`\x04\
-\x92_\xff\x89\xa2ot3\xd4\x96\x09\xca\xcb\xcb\x879\
-5\x00a\x1f\xf7\xabo\xe8\x83\x94?\x8c@b\xa5?\
-R\xfez\xa5\x7f\x98\xa2\xf5L>\xcea\xd5\xbf\xcc\x9f\
-?\xff\x89w\xdeyg\x8dX\xa7\xfe\x9d\x14\xfd\xe5\x05\
-EyrC\x8b8\xbc\xd1\x99ED\x8c\xfe\x091\xce\
-\x12\x18\x89\x7fD\xa5\xb2U\x96\xbf\xa4\xc6\xf4\xc6S\xe4\
-\xec\xd6\x13\x06c\xb0y\xf3fM\xbc0\xd6\x17\xc3~\
-\xf0\xb3c\xa6?R\xff0\x00F\xd9\x10V\xfc\xf7\x05\
-\x9d\x12\x0eR\xff\xab\xaf\xbf\xfez=\xf5\xdf%\xe9\xa5\
-\xfeC\x1f\xfd\xe7\x8b\x01\xb0\x8b\xe4\xed\xd6\xfa)\xfe$\
-\x1f\x05\xde.Sf\xf5w\x119\xfa\xe8\xa3\x87\xca\xa1\
-3\x02\x5c\x1b\x00\xbf\x18\x83T\x9e\x1b\x0a\xd6\xf4t?\
-\xc4\x1f\x13\xeb\xf4J\x7f\xb5I\x92\xd6\xe3\xeft\xaco\
->\x1b\x02\xcc\xf9\xb7\xab\xfaG\xea\xff\xce;\xef\xbcU\
-\x99\x04\xb7\xa9\x7f\xa3\x0c\x80\x9dF0\x03\x10B#@\
-\xc1'\xf9\x1e\xd1\x1b\xfd\x9dX\x15\xd4\x9aQ\xa0\x8a\xda\
-\x86\x9b\x9eL\xdd\xd8\xd1\xef\x1e\x94\x08>\x95\xe7\x86\x1e\
-\xf5\xf5\xeb\xd7k[\xf9b\xac/\x1e\xaf\xcf\xf4W\xb5\
-\x11\xda\x9a\xbf^\xe9\xef\xd7\xa8\xdb\x0f\x86\x00\xa6\x09\xdd\
-\x12v\xa0\xea\xff\xad\xb7\xdeZ-\xd6\x13\xff\xcc6\xfb\
-\x89I\xc8G\xfe\xd2\x00\x98\xff\x12\xb9\xbeO\xf2\x1d\xb3\
-,X\xdc$\x03`e$\xb4C\xa5\xb6\x87\x9a}\x11\
-\xc4?\xcck\xfe\xa8\xf4\x87\xf8c\xc8\xcf\x96-[\xb4\
-\x8f!\xdd?f\xcc\x18\xad\xd2\x1f\x87\xd1\xf7\xcf\xe7\x02\
-?\xb3\xaf\x83\xf8\xa3M\xd2\x0a\xa4\xfe\xaf\xbe\xfa\xea\xd9\
-r\xb0\xea\xbfG\xcc\x07\xffD\x1d\x8a\x7f^\x04\x84E\
-\xbc\xf7\x19\xfe\x82i\x0aH\xbe\xffMD\x5cD\xfc\xc9\
-\x7f;\x18\x01\x9c\xd2\xfa\x7f\xd0\xf7\x01@\xaa\x1a\xc2\x8f\
-V?\x14\xfe\x81\x11#F`S$\xcd\x04 \x0b\xc0\
-\x02?g\x8fC\xb1$\xcc\x94\x15j\x99\xa5\xe7\xbe\xfb\
-\xee\xbb#\xa1\xea\xdfM\xf4\xeft\xda_h\xcd\x00\x0d\
-\x80sS@H\x18\x8980\x01N\x1e\xdfgn\x80\
-Z\xeb\xae2{\x80\x9b\xedls\x11\xc1\xa7\xfa\xdc\xd0\
-\xa3\x0e\xf1W;\xcfi\xc5~\x89\x95\xfe\xd8\xcd\x0f\x95\
-\xfe~\x13Y\xbf\x1a\x02'-\x7f@U\xfc?6o\
-\xde\xbc\x95\xb2?\xf5o%\xfcQa\xe1\x1f\x0d\x00!\
-\xc4\xd4\xec\xa6\xaa\x84\xc9\xfb\x04\x14(\x03\xd0\xdf\xec\x8b\
-\xf5\xf5\xff\xb0\xac\xf9\xe3kQ\xe8\x87j\x7f\x8c\xf5E\
-\xb5\xba^\xe9\x8f\xc1>h\xf3\xb3\x1b{LC\xd0\xf7\
-k\x91\xfa\xb7\x9b\xf6\xa7\x96W\x16]{\xed\xb5\x89\x03\
-\x7f\xec\xa2\x7f\xab\xf4\x7f^\x06\x814\x00\x84\x10\xb7Q\
-\xbf.\xf6\x11\x93\xffG\xac\x0c\x80\x9dh\x04i\x1f\x00\
-T\xfaC\xf8\xd1\xe3\x8fb?\xacW'V\xfa#\xf2\
-7*xt*\x96aY\xcfwsN,\x9d\xd8m\
-\xf4\xa32\x04\xcd7\xdcp\x83>\xf0G/\xfcK\xa7\
-\xef?o\x0a\xffh\x00\x08!\x99\xc2\xd0\x08\xa8\x19\x00\
-\x8e\x96\x00\x82<\xee\x17\x22\x05\xe1G\xc1\x1f\xda\xfd@\
-b\xa5?\xd6\xfc\xf5\xc7\xe7\xfbz\xbe\xd3\xc7\xa2\xe5\x0f\
-\xbb\x22\xda}\xf9\xec\xd9\xb3o[\xbe|9*,\x93\
-\xd7\xfd\xcd\xb6\xfc52\x01yY\xf8G\x03@\x08I\
-U\xecE\xccw\xc7<\xb0O\x80JyW:1\x00\
-^\x8b}\xa6\x8c\x01\xd2\xfc\x10~\xf4\xf7cH\x0d@\
-\xaa\x7f\xf4\xe8\xd1\x9a\xf8#\xfa\xb7Ks\xd3\x10\x1cj\
-\xa8\xf4ki\xc5\xa2E\x8b\xfe\xfa\xd0C\x0f\xcd\x17\xeb\
-Y\xffV\xd1\x7f^\x17\xfe\xd1\x00\x10B\xd25\x01f\
-F\x00\xea\x1eQ\x06 \xa3E\x80\xd9\x88\xe0S\xfd\xda\
-\x96\x96\x16M\xfc\xb1\xde\xafG\xab\xa8\xf4\xc7\x815\x7f\
-5\x029\xa5\xf3\xe7\xb3!p\xba\xcb\x1fZ\xfe\xfe\xf8\
-\xc7?>(\xfb\xb7\xf95k\xf93[\xfb\x8f;0\
-\x02y\x95\x09\xa0\x01 \x84\xa4\x9b\x0d8d+m\xb5\
-\x04\xe08\x03\x10\xa4\x99\x00MMMZ\x8b\x1f\xc4\x1f\
-\x95\xea\xf8Y\xd0\xdf\x8f\xc1>\x10\x7f\xbd\xd2?(Q\
-\xb7_\x9e+\x22\x7f\xbbu\xff\x8e\x8e\x8e\xe6\xeb\xae\xbb\
-\xee\x06e\xc00\x16\xd0i\xea\x9f=\xff4\x00\x84\x10\
-\xaf\x0c\x81\xaa\x80/TGZK\x00~4\x06\x10)\
-\x88\xbf>\xd6\x17\x95\xfdX\xefG\xba\x1f\x06\xc0\xc9x\
-\xe3|/\xf03\x02\xfd\xfeh\x9b\xb4\xfb\xb6O<\xf1\
-\xc4\xad\x0b\x17.\xdc(\xce\x8a\xfe\x12\xa3\x7f3\xf1\xb7\
-\x12~v\x01\x10BH\x92\xc0\x9be\x01\x0e|L\x15\
-\xc2\xa1\xe7\xad ]\x03\xe0\x17c\x80\xf44&\xfa\xa1\
-\xd0\x0f\x06\x00\xff/++\xd3\xc4\x1fE\x7f(\xf6\xd3\
-\xa7\x1b\xe6C\xb4\x9e\xc9\xe7\x8aA?0\x00v\xa8Q\
-\xbf3\x1f\x7f\xfc\xf1\xf7\xe4\xd0\x96?3#\xe0\xa6\xf7\
-?/\xa3\x7f\x1a\x00BH\xbaf y\x06@D\x15\
-\xc1\xb9\xbe\xaf\xf8u&\x00\x22}\xbd\xc5O\x1f\xeb\x8b\
-\x88\x1f=\xfeX\xebO\xac\xf4\xf7\xab\xc8\xfa\xd5\x10\xe8\
-E\x7fv\xeb\xfe\xaa\xcd\xf2c\xb5\xee?C\xf6\xaf\xfb\
-w\xd9D\xff\xc9U\xffN\xb6\xfa\x8d\xe7c\xf4O\x03\
-@\x08q\x22\xf6\x11\x87\x19\x01\x8d\x8a\x8a\x8a\x92L\x9d\
-<\x97\xc6\x00k\xfc\x98\xec\x87\xf5~}\xac/\xa6\xfa\
-\xd5\xd7\xd7k\x91?\x8c@\x10\xa3n?<\x0e\xf3\x12\
-0\xec\x07\xd9\x14+T\x91\xe5\xd6\xdf\xfe\xf6\xb77'\
-\x8d\xfaM\x8c\xfeS\xad\xfc\xcf\xeb\x01@4\x00\x84\x90\
-\xacd\x04Td\x9c\xd2}\xc5O\xfb\x00\xa0\x1f\x1d)\
-\xff\x15+VhU\xff\x00\xc2\x8f-|!\xfc\x88\xfe\
-Y\xe0\x97\xda\xe3\xf09D\xfe\xc8\xaeX\xa12\x04m\
-7\xdf|\xf3u*\xf3\x82\xde@\xac\xfb'\xb6\xfcY\
-\x99\x80\xe4\xc2?\xa6\xfei\x00\x08!Y\xca\x06\xf4\xf9\
-\x9c\x9a\x84\x97\xd1\xfb\x8a\xd73\x01P\xe9\xaf\xb7\xf9\xa9\
-\xcas\xadf\x01)\x7f\xa4\xfb!\xfe\xc9\x95\xfeF\xa2\
-\xc7\x02?\xf3\xc7!\x9b\x82\xec\x8a\x15*3\x10\x9b1\
-c\xc6-\xf3\xe7\xcf\xc7\x16\xbf\x89\xfd\xfeV\x95\xffn\
-\xd6\xfc%\xdf\xa3\x7f\x1a\x00BH\xa6\x0dAD\x09d\
-\xb1\x1b\x11\xf1\x931\x808\xad[\xb7\xee@\xa5?\xc6\
-\xfa\xea\xc5~\xd8\xc6W\xb57\xe6U\xb4\x9e\xe9\xc7\xc2\
-\x5c9\xa8\xf8\x97\xb7\xdez\xebQ\x05\x8a\xfe\x8c\xfa\xfd\
-\xed\xd6\xff\x9d\xb6\xfb\xe5u\x0b \x0d\x00!$\xe3(\
-\x91L\xf9\xbe\x92\xab}\x00\xf4\x0d}\x10\xf9\xeb\x95\xfe\
-\x10}D\xfe\xa8\xf8G\x8f\x7fb\xa5\xbf\x9fE\xd6\xaf\
-\x86\xc0\xe1\x98_d^^\xbf\xe6\x9ak\x9e\x12\xe3\xa2\
-?3\x13\x10\x13g\xdb\xfd2\xf5O\x03@\x08\xc9V\
-F \xd3K\x00\xd9\x8a\xf6u \xf6(\xf6K\xac\xf4\
-\xc7&>\xd8\xca\x17\xe2\x8f\xb4\xbfY\xeb\x22\x0d\x81\xb3\
-\xc7\xa2\xdd\x0f\xdb%\xdb\xb1u\xeb\xd6EW^y\xe5\
-\x1d\xea\xdd6\x97\xe2\x1f\x15\xfb\xa2?\xb3h?o\xcd\
-\x00\x0d\x00!$%\xa17\xfb\xbf\x12\xcbB7\x82\xe2\
-\x95\xd8\x1b}\xad\xbe\xa1\xcf\xca\x95+\x0fT\xfac\xa4\
-omm\xadV\xe8\x87\xb9\xfe\x5c\xcfO\xefq\xa8\xa3\
-p\x22\xfejy`\xc3\xcf\x7f\xfe\xf3\xeb1\xf1O\x0e\
-\x16\xfd\xb9\x15\x7f\xa3\xe8\xdfJ\xe8Y\x04H\x08!\x99\
-B\xb5l\xc5r\xfd\x1c\x9c\x18\x03D\xa5\x89\x95\xfe\x88\
-\xf2\xb1\x99\x0f\xa6\xfa\xa9VF\xed\xc8\xc7h=\x93\xe7\
-\xc4\xa6I\x10\x7f;\xd3\xa7D\x7f\xef\xff*Tk \
-\x5cX\x87C\xf1O\xa5\xe5\x8f\xa9\x7f\x1a\x00BH\xb6\
-P\x15\xde=6\x06!k\xa2\xee\xf4{`-\x1a\xeb\
-\xfd\x88\xfc\x11\xa1b\xac\xef\x84\x09\x134\xd1G\xca\x1f\
-\xc5\x7fA\x11Y\xbf\x1a\x02}\xd0\x8f]\xaf?\xda\xfd\
-n\xbb\xed\xb6\xab?\xf9\xe4\x13\xa31\xbfN\xda\xfd\xec\
-\xd6\xfd\xcd\xa2\xfd\xbc7\x034\x00\x84\x90t\x88\x18D\
-s\xddn\x84%]\xb1wk\x0cP\x89\x8e\xf5~\xbd\
-\xd2\x1f\xeb\xfc\x10\x7f\xb4\xf7\xa1\xd2\x1f3\xfd\xbd\xd8\xc9\
-/\xcc\x86\xc0\xa9\xf8+3\xd8\xfd\xe0\x83\x0f\xde0w\
-\xee\xdc\xe5rh\xc5\x7f\x8f8\x9f\xf9\xef6\xeag&\
-\x80\x06\x80\x10\x92I\xf1\x07\xaa\xcd\xab\xcb\xeaAv\xa2\
-\x90-c\x80\xffc\xcbY\xb4\xf9\xe1\xc0\xf3\x80\xe0\x8f\
-\x1d;V\x8b\xf8\xf1~b\xb1\x1f\x0b\xfcR{\xacS\
-\xf1W\x9f\x8f\xce\x9c9\xf3\xd6Y\xb3f-\x90\x83\x15\
-\xfff\xa9\xffd#`\x17\xfd'\x0b}\xde\xb7\xfc\xd1\
-\x00\x10B\xb2M\x5c\x19\x80\x9et3\x00\x996\x06\x10\
-#5S^\x13~\x14\xfd\x81a\xc3\x86I]]\x9d\
-\x96\xfe\x87\xf8\xdb\x89\x1f\x0b\xfc\xec\x1f\x0b\xf1G1\xa5\
-\x03\x93\x17\x7f\xf5\xd5W\xa7?\xf0\xc0\x03oJ\xdfv\
-\xbf\xe4\x0d~\xecR\xffq\xe1\xba?\x0d\x00!\xc4\x1f\
-\xec\xdb\xb7/#\x19\x80L\xad\xf9#\xcd\x0f\xf1\xd7+\
-\xfd\xf1=1\xd6\x17s\xfd\x91\xf6G\xbf\x7f*\xe7\xe3\
-(\xe0\xbe\xa0\xe0\x0f\xd7\xd7\x89\xc1S\x83~\x1eWc\
-~\x9f\x97C\xdb\xfd\xecv\xf9sj\x04\xcc\xa2}\x9a\
-\x01\x1a\x00BH\xb6P\x05v\xdd\x990\x00\x990\x06\
-(\xf0C\xc4\xbf|\xf9r\xad\xd2\x1f\xeb\xfb\x18\xee\x83\
-\xf6>\xb4\xf9\xe1\x08\x92\xc8\xfa\xf5\xb9b\xb4occ\
-\xa3#\xf1\x7f\xff\xfd\xf7g_u\xd5U3\xc5<\xed\
-of\x02\x92\x05\xdf\xed\xa0\x1f\x8a?\x0d\x00!$\x8b\
-\xc4\xd5\xfe\xee\xdd\xbd7\xdbH\xba\x06 \x9d5\x7f\x08\
->\x06\xfc\xa0\xcd\x0fF\x00\xeb\xfcz\xb1\x1f\x0c\x80U\
-\xa5?\x0d\x81\xf3sb\xb4\xaf\xfa\x9d;\xfa\xfa\xc5\x8b\
-\x17\xbf\xa4v\xf7{\xb47\xf2\xef\x10\xe3\x82?\xbb\xe8\
-\xdf\xcc\x04$\x0b=\xd7\xfdi\x00\x08!^\x89\xbf\xfe\
-\x8e\xaa\xee\xeeT\xa3s\x0dw\xcd\xb1\xdb\x05.\x13\xc6\
-\x00\x82\xa4\xb7\xf9\xe1|H\xf3c\xa6?f\xf9C\xfc\
-\xf5J\xff G\xdd~x\xae0YN\xc6\xfb\x82\xa5\
-K\x97\xbe|\xc5\x15W\xdc\xa3\xde5\xdb\xda\xd7\xe9\xf6\
-\xbe\x1c\xf5K\x03@\x08\xf1\x8b\xe0'\x7f\x5c\x89n\x9b\
-\x99\x01Hu\x0e\x80S\xe1B\x05:\xe6\xf9\xe3\xc0\xff\
-\xb1\xd6\x8f5\x7f\x14\xfbA\xfc\x8d\xc6\xfa\xb2\xc0\xcf\xdd\
-s\xc5\xffU\xad\x87\xa3\x8d}\x80j\xb9|S\x8d\xf8\
-M\x14\xff.\x9b\xe8?\xd5\xe2?\xa3\xd7%\xcd\x00\x0d\
-\x00!\xc4#\x13\x10\xc7p\x17\x95b\x1f\x98\x09\x03\xe0\
-t\x19\x00K\x0b\xdb\xb7o\xd7\x84\x1f\xa9\x7f\x80*\x7f\
-T\xfb\xeb\xe2\xef\xd7\xa8;H\x99\x05\xfc\xfe0K\x01\
-E\x7fNX\xb6l\xd9<\x15\xf9\xdf\xa9\x1e\xd7\x22\x07\
-G\xfc\x1a\xb5\xf7\x19\x09\xbf\x93\x88\x9fE\x7f4\x00\x84\
-\x10\x9f\x18\x02d\x00Z\xad\x84\x07bm\xb6\xc1N*\
-\xc6\x00i~l\xe4\x03\xf1\xc7\xae~\xf8\xde\xe8\xef\xc7\
-.~X\xeb7\x1a\xeb\xcb\xf5|\xf7\x8fC\x9b\x1f\x8a\
-\xfd\x9c\xd6q,\x5c\xb8\xf0\x055\xdf\xff>\xd9\xbf\xe6\
-\x9f8\xdf\xdf*\xe2w\x12\xfd\xc7\x84E\x7f4\x00\x84\
-\x10\xff\x99\x00%\x14\xadvQd\xba\x06@\x07\x15\xe8\
-j\x179l#\xab\xcd\x9d\xc7:\xff\xc4\x89\x13\xb5b\
-?L\xf9\xc3\x11\xf4\xa8\xdb\x0f\xcf\x15\xd7\x19\xb5\x15\x0e\
-\xe78\xc4\xe7\xcf\x9f?\xf3\x0f\x7f\xf8\xc3\x0c\x87\xe2\x9f\
-J\xda?Y\xe8Y\xf4G\x03@\x08\xc95*=\xdc\
-bg\x00\x90\x96O%\xdaO\x04{\xcc#\xf2\x87\xf8\
-\xa3\x18\x0d\xc5~h\xf3\xc3\xf7F\xd4\x0f3\x90m\xa1\
-\x0cRf!\x95\xe7\xaa\xaf\xf7\xa3\x93\xc2\xe9)\xd4\x90\
-\x9f\x07n\xbc\xf1\xc6\xe7\x5c\x88\xbf\x93\xb4\xbfQ\xd4\xcf\
-\xa2?\x1a\x00B\x88\x97\x11\xbeA\xb4\x95\xf8\xff\x98\x12\
-\x0b\xcb\x0c@&:\x01 J\x88\xfcQ\xe9\x8f\x9d\xfd\
-\x06\x0e\x1c(\x0d\x0d\x0d\xa2\x8a\x0f5#\x80J\xff|\
-\x8d\xd63\xf58\xa4\xfc\xb1\xde\xef4\xe5\x8f\xd9\xfe\xcf\
->\xfb\xec]\x8ayrp\xc8\x8f\x93\xf9\xfeN6\xfb\
-a\xd1\x1f\x0d\x00!\xc4\xe7\xc6\x00K\x00\x96\x19\x00\x08\
-\x8b\xebo\xde\x9b\x05\xc0[L\x9cC\xc1\x1f\x22\x7f\x14\
-\xa3\x8d\x181B;t\xf1\xb7Z^\xa0!\xb0\x7f\x1c\
-\xde\x22\xbb\xe2\xb4\xca\x1f(\x13\xd6t\xcf=\xf7\xdc\xf4\
-\xc2\x0b/,\x96C\x87\xfc\xb8\xed\xf7\xa7\xf8\xd3\x00\x10\
-B\x82h\x02\x94p4e\xda\x00\xe8\xc2\x04\xe1\xc7\x81\
-\xdd\xfc\xf0\x7f\x0c\xf7\xc1,\x7f]\xfc\xdd\x8e\x0f\xa6!\
-8\xf4w\x83\xec\x8a\x9bn\x0d\xd5z\xb9\xf6\x7f\xff\xf7\
-\x7fo\x5c\xb2d\x096Z\xe8\x10gm~F\xf3\xfe\
-\xddT\xfdS\xfci\x00\x08!9\x8e\xf8\x93\x89\xa9b\
-\xb1\xddV\x0fLe\x09\x00\x82\x04\xe1\xc7\x8e~\x10\x7f\
-\xac\xf3c\xb8\x0f\xc6\xf9b\xad\x1f\xc5~\xba\xb0\xb1\xc0\
-\xcf\xfd\xe3\x90\xe6\xc7`\x1f\x17k\xfd\x1aj\x83\xa5\xf7\
-\x7f\xf1\x8b_\xdc\xd6\x84\xb5\x82\xfd\xe2\xef$\xea7\x13\
-\x7f\xabI\x7fq\x9b\xd7\x22\xa1\x01 \x84x,\xf8\x92\
-\x14\x95\xc5U\x8a~O&\x0d\x00\xd2\xfcz\xe4\x8f\x1d\
-\xfdP\xe0\x07\xf1\xc7:?\xaa\xfdqx!\xb2a+\
-\xf0\xd3\x1f\x83\x1a\x0a\xa4\xfc\xdd\xec\xd4\xa8\x0cC\x8f\xda\
-\xd4\xe7\xc9k\xae\xb9\xe6i9X\xec\xd7#\xc6\xb3\xfd\
-\xad\xc4\xdfI\xd1_\xdc\xe0uF\xf1\xa7\x01 \x84\xf8\
-\xc0\x18$\xbe\x8d\xa9\x0dxv\xdbE\xf3Ng\x01@\
-\x9c\x10\xf5\xa3\xbf\x7f\xc3\x86\x0dRSS\xa3\xf5\xf8C\
-\xe0\x10\xf5#\xfa\xd7\x85\x8b\xeb\xf9\xce\x1f\x87\xcf\xa3\xb5\
-\x0f\xc2\xefv\x83&\xd5q\xb1\xfd\xfe\xfb\xef\xbf\xfd\xc5\
-\x17_\x5c\x22\x07S\xfe\xdd\x16\xa2\x1f\xb5\x10\xff\xc4\xb7\
-f\x9b\xfc\x98\x89?\xa1\x01 \x84dY\xdc#&\x1f\
-7\xcc\x12\xa8\xca\xfc]v\xdf\x18k\xcdv\x1b\xf2\xa0\
-\xb5\x0f\xa3}!\xfe\xd8\xd5\x0f\x85~\xb5\xb5\xb5\x9aq\
-@\xea_\xaf\xf4\xf7\xab\xc8\xfa\xd5\x10 \xa3\x82\x02\xbf\
-T\x96bV\xaf^=_\xf5\xf7\xdf\xbds\xe7\xceF\
-1N\xf9Gm\x22~#\xf1ON\xf9\xc7\x1c\x8a?\
-\xcd\x00\x0d\x00!$\x07\xa6@Ln\xd0q\x15\xa9\xb7\
-\xaa\xa8\xb2S\x09\xb5\xa9\xc2C\x84\xac\x0c\x00\x96\x941\
-u\x0e\x9b\xfa\xa0\xea\x1f)\x7fL\xf6C\xb1\x1f\xc4\xdf\
-I\xf6\x80\x86\xa0/\x88\xf8!\xfc\xa9\xec\xc7\xa0~_\
-\xads\xe6\xcc\xb9\xff\xbe\xfb\xee{S\xac\xb7\xf25\xfb\
-\xbf\x95\xf8;\x99\xf2G\xf1\xa7\x01 \x84\xe4H\xf4\xcd\
-\xb2\x00Fo1\x0b\xa0Q\x09\xf5p+\x03`&h\
-*\xba\xd4\x0a\xd2\x90\xf2\x87\x11\x98<y\xb2&\xfa\xba\
-\xf8\xeb\xed\x80A\x8a\xbas\xf5\x5c\x13\x85\xdfm\xaa_\
-g\xcd\x9a5\xef\xddz\xeb\xad\x0f\xaa\xcc\xce6\x83\xa8\
-?*\xf6\xa9~\xbba?\xc9\xe2/\x14\x7f\x1a\x00B\
-H\xf0\x8c\x02\x8e\xa8Z\xbb\xdfne\x00\x8cZ\x01!\
-PH\xf7C\xb0\x10\xf9c\xfd\x7f\xca\x94)Z\xc5?\
-\xd2\xfd\x10\xffl\x89l\xd8\x0a\xfc\x90\xde\xc7u\xc4\xe1\
-\xa6\xb8/\x11U\x1f\xb0\xeb\xe9\xa7\x9f~\xf0\x91G\x1e\
-y?!\xea\xb7J\xed\xdb\x09\x7f\xa2\xf8'\xaf\xf9\xc7\
-\xc4\xd9\x94?\x8a?\x0d\x00!\xc4'\x82\x9f|\xc3\xd6\
-\xb4\x5c\xf5\x92o\x1b4h\xd04\xa7\x19\x00\x18\x02T\
-\xf9\xe3\xad\xbe\x95\xef\xa4I\x93\xb4T?\x0a\xfd\xec*\
-\xfd\xc3\x10\xad\xa7\xfb8\xbd\xb0\x0fG:\xd3\x16\xd5\xf7\
-\x89-]\xba\xf4u\xd5\xdb\xff\xa8\xaa\xc1\xc0Z\x7f\xe2\
-8\xdf\xa8\xcd[\xb3\xe1>\xc9\xa9\x7f\x8a?\x0d\x00!\
-\xc4g\x82\x1eq)\xf8\xc9)[-\xc2S\xa9\xfb\xad\
-V'\xc2:4D\x0a\x91=\x04\x0b\xe2\x8f\x8fA\xfc\
-\x11\xf1\x8f\x1c9R\x13\x7f\xd4\x09\xe0\xff\x5c\xcf7\x07\
-fJ?R\x8d\xf6u\xd4V\xca\x0b\x1f~\xf8\xe1\xc7\
-\xdf|\xf3\xcd\xd5\xbd\xc2\xdf%\xd6\xe3{\x9dF\xfdv\
-\x05\x7f\x14\x7f\x1a\x00B\x88O\xcd\x80\xfe\x7f\xb3\xadW\
-\x13o\xde1U\xb8\xb7\xcd\xee\x04\x10~\x0c\x9eA\xa5\
-?\x84K\x89\x8fV\xe8\x87V?\xbd\xcd\x0f\xeb\xfe~\
-\x8e\xbas\x15\xe9#S\x82#\x13\xa2\x0fT\xc1\xe5\x86\
-Y\xb3f=>{\xf6\xec\x8f\xe5\xd0i~fs\xfb\
-\xcdD\xbf'A\xf4\x9d\xf4\xfaS\xfci\x00\x08!\x01\
-4\x09\xc97g\xed&\xaf\xd6\xf079\x10\x9d\x03\xb5\
-\x000\x01j\xc9\xe0@\x85?R\xfef\xe2o'\x96\
-AZ\xcfw\xfaX\xd4G\xe8\xa2\x8f\xccI&D\x1f\
-\xa8V\xcb\x9dj\xf7\xbeY\xa8\xeeW\x19\x183\xe1w\
-b\x02\x9c\xcc\xf4\xb7\x9a\xf0G\xf1\xa7\x01 \x84\x04P\
-\xf8\x93\x07\xb7D?\xf8\xe0\x83M\xdf\xf9\xcew,\xbf\
-\x89.\xfe\xc8\x02\xf4\xef\xdf_[\xeb\x87\xe8C\xfc\x13\
-+\xfd\x83\x1c\xad\xa7j^ \xf8\x10z]\xf0S\xad\
-\xe07C\x8dk\xde\xaa&\xf9\xbdp\xef\xbd\xf7\xfe\xad\
-w\xf7\xc6\xc4a>f\x87[\xe1\xb7Z\xef\xa7\xf8\xd3\
-\x00\x10BBb\x04\xfa\x98\x00\x95\xceoQ\xe2\xd5\xac\
-\xd6\xef\xab\xec\xc4\x0f\xeb\xfc\x10\xbeD\xf1\x0fr\xb4\xee\
-\xf6q\xf8Z\xbd&B\x7f\x9b\xa9\x08?\x19U\x9b\xb1\
-\xe9\xed\xb7\xdf~\xf9\xce;\xef|]\x9d\xab\xdd\xa1\xf0\
-\xdbm\xddk\xb6\xd6o\x15\xf5S\xfci\x00\x08!\x01\
-\x8e\xfc\x8dn\xd6\xfa\xcd>\xaaz\xcf\xb7\xa9\x9d\xfa,\
-\x0d@\xa20B\xfc\xd0\xaf\x8e%\x80\xc4\x03_c4\
-\xf8'h\x86\x00\x07\x22y\xfc\x9c\xba\xe8\xebc\x91\xb3\
-\xfd{S\x86l\xd1\xbcy\xf3^\x991c\x06\xd6\xf8\
-;\x0d\x84?\xe6\xc2\x04X\x09\x7fr\xd4\xefd;_\
-\x8a?\x0d\x00!\xc4\xa7\xa2\xafi\x9d\x81\x11\xb0:\xa2\
-\xaa\x8f|\x872\x00\x13\x5c\x9d,A\x18\x93\xd1\xcd\x80\
-n\x08\xf4\xf7\xcd\x0c\x82\xd7\x86@\x17\xf9d\xb1\xc7[\
-\x1c\xd9\x8a\xea\xcdP\xa9\xfd\xe6\xe5\xcb\x97\xbf\xa3\x8a\xfb\
-^]\xb0`\xc1f\xe9\xbbaO,\x0d\xf1\x8f\xa5\x11\
-\xf5S\xfci\x00\x08!\x014\x02\x11\x8b\xac@\xe2\xa1\
-\x89\x80*\xf2\xdb\x84\xf9\xfd\x99\xc2I\xa4\x9ch\x0a\x12\
-\xff\xaf\x1b\x88D\x81\xb7\x13\xfadqO|\xab\x0b\xba\
-~\x18\x19\x89\x9c\xfc\x92T\x0f\xff\xd6\xad[\x97\xab\x1a\
-\x8c\xb7\x1ez\xe8\xa1\xf9*\xa3\x92<\xc0'f\x11\xb9\
-\xdb\x89\xbdU\xc4\xefD\xf8\x8djG(\xfe4\x00\x84\
-\x90\x80e\x04\xec\x0a\x01{\xd4T\xbf\xb5S\xa7N\xf5\
-Z\x00}!\xc4^\x83\xc1K\x8b\x17/~g\xe6\xcc\
-\x99o\xacX\xb1b\xa7\x1c:\xb5/Y\xac\xed\x0c\x80\
-\x9d\xf0[\xa5\xfb\xcd\x0a\xfd(\xfe4\x00\x84\x90\x80D\
-\xfaNf\x01\x18\xa6\xffq\xa8\xf4\xf3\xa7g\x9ey&\
-\xafh\x96~Oj\xd6\xc2\x86O?\xfd\xf4c\xb5-\
-\xef\xfc\xf7\xdf\x7f\x1f)\xfen\xe9;\xb1\xcf(B7\
-\x13~\xab%\x01\xb3\xefc'\xfcN\xb7\xf3\xa5\xf8\xe7\
-\x80\x08/\x01!\xc4\xe6\xde\x10I:\x0a\x12\x8e\xc2\xde\
-\xa3(\xe1(\xee=\xcaTE\x7f\xf5\x83\x0f>\xf8\x88\
-\x1a\xe83\x82\x974}TWE\xe7\x96-[\x96/\
-[\xb6\xec\x93\x17^xa\xc1\xaaU\xab\xf6\xc8\xa1\x1b\
-\xf3\x98\xad\xc9[e\x00\xac\xd6\xf5\xed\x22~'\xe9~\
-\x8a?\x0d\x00!$\x04\x06 \xe2\xc0\x00\xe0m\x09L\
-\x80:*\x8e9\xe6\x98\xfa\xd3O?\xfd\xd8\xfa\xfa\xfa\
-\xc3\x07\x0f\x1e<A\x15\x06\x8eR\xeb\xef\x05\xbc\xcc\xd6\
-\xa8\x02\xc2\xee\x1d;v\xacS\xbb\x22\xaeX\xb8p\xe1\
-\xd2\x97_~y\xa5Z\xd3O\x9e\xcbo&\xf6V\x06\
-\xc0\xe9[\xab5~\xb7\xed}L\xf9\xd3\x00\x10B\x02\
-h\x00\xc4$\x03P\x90`\x00\x0a\x93\x0c@q\xaf\x09\
-\xc0\xd1O\x1d\xa5\xfa\xfbj\xd4o\xe5\x19g\x9c1Q\
-1a\xf8\xf0\xe1\x0d\x03\x07\x0e\x1c\xa5L\xc1pU\xa4\
-\x97\xd7\xcb\x92J\xdc\xf7\xaa\x89\x88\xebU\x94\xbfn\xd1\
-\xa2E\xcb\xe7\xce\x9d\xbbJM\xea\xeb\x90C'\xf3\xc5\
-,D\xd9N\xfc\xed\x84\xde\xcaP\xd8\xb5\xf6Y\xed\x11\
-A\xf1\xa7\x01 \x84\x04\xdc\x008Y\x06H\x5c\x0a\xd0\
-\xb3\x01\xc5\x06\x06\xe1\xc0\xd7\xa8\xe5\x82\x92\x13N8a\
-\xd4\xe4\xc9\x93\xeb\xeb\xea\xea\xea\x95)\x18\xa6\xa6\x03\x0e\
-\xc1\xa1\x06\x04\x95\x84\xe9\xe2\xa2R_\x09\xfb.\xd5%\
-\xb1Um\x82\xb4Ym\x80\xb4N\xad\xe1\xafV5\x13\
-\xbb\xe5\xd0a;v\xd1\xb7\x13\x03\x10u\xf0\xbe\xd1\xc7\
-\xccR\xfdvE~L\xf9\xd3\x00\x10BBd\x02\x92\
-\x0d@\xa4W\xf8\xedL@\xe2[=SP\x9c\xf0\x18\
-\xb3C\xff\xbe\x05\xca\x14\x0cR\xc7p\xb5\x840\x5c-\
-!\x0cQ\xd9\x82\x9a\x8a\x8a\x8a\x01j\xdf\x80j\xbcU\
-\x06\xa1\x9f\xdf.\x9ej\x13\xc4\x1c\x84\xc6\x96\x96\x96\xdd\
-\xaaB\x7f\xb7\x12\xfb]J\xec\xb7\xaf\x5c\xb9r\xb3\x12\
-\xfb-\xbd\xa9|\xa3\xb5x\xab\x14\xbb\xd1X]3\x83\
-\xe0\xa4\x0e\xc0\xc9\xe1\xb4\xad\xcf\xae\xca\x9f\xe2O\x03@\
-\x08\x09\xb0\x01\x90\x04\xf17\xca\x02\x18\x99\x00\xa3#Y\
-\xe8\xf5\xef\x91\xf8}#&\xe7:\xe4\xf3C\x87\x0e-\
-\x9f0a\xc2\xa0\xda\xda\xda\x1a\xb5\xa1\xd0\x80\xca\xca\xca\
-rUxX\xa6F\x0c\xe3m\xb9\xca.\x94\xab\xf7\xf1\
-\xff25\x9a\xb8L-5\x14 \xab\xa0\x8e>K\x0e\
-X\x82P\x1f+N\x8c\xd4\xd5X\xdeN\xf56\xae\x0a\
-\xf0\xda\x95\xa8ko\xd5.\x868\xda\xd4N|\xda\xfb\
-*\x9aoV#v\x9b\xd4|\xfd}*}\xdf\xa8\xda\
-\x1f\xf7*\xa1oRk\xf8=6\xd1y\xdc&\xb26\
-\x13}7\xd1\xbf]V n\xf3\xbc\xec*\xfb\x99\xf2\
-\xa7\x01 \x84\x84\xdc\x00\x88X/\x03\x18\xd5\x03$\x8b\
-~\xe2\xdb\x82$\x03`$\xfcN\x0e10\x0bf_\
-\x93\xfc\x7f\xab\x9f\xd9L\xc4\x8c\xf6>\xb0\x12q}z\
-\x91\xd1[\xbbi\x8af\xd1\xbfYz\xde\xad\x09\x88;\
-\x88\xf6cb\xbe\xe7\x83\x9d\xf0S\xfc}\x0c\xe7\x00\x10\
-B\x9c`4\x050Y$\x22I\xefG\x93\x047\xf9\
-q\x85\xbd_\xeb\xd4\x00\x88\x89\x80[}\x8d\x98|}\
-\xba\xd7\xc2\xca\x10$~,f\xf29'\x87S\xf1w\
-c\x04\xec\xbe\x87\x93\xe7%\x14\x7f\x1a\x00BH~\x8a\
-~\xa2\xb0\x1a\x99\x80\xc4#j\x22\x921\x13\xf1/0\
-\xc82\x88K3 6\xef\xa7c\x02\xacR\xdbv\x86\
-\xc0\x89\x090\x8b\xbe\xdd.\x038\x11z\x0a?\x0d\x00\
-!\x84\xa4\x1d\x09'\xa7\xbb\xcd\xd0\x85\xc8m\xf4\xef$\
-\x95\xef\xd4\x0cd\xc3\x008\xcd\x0a\xa4\x1b\xfd\xbb1\x03\
-F-{\xa9\x8a\xbeS\xe1\xa7\xf8\xd3\x00\x10BB\x98\
-\x050\x1a\x03,&\xc2o\xb6s`A\xc2\xd7\xa7\xb3\
-\xf6o\x97\x01pb\x02\xdc\x18\x01\xb7\x91\xbf\x9d\xf8\x8b\
-M\xe4oUW\xe0\xd4\x10\xa4\x22\xf8N\xab\xfa\x19\xf5\
-\xd3\x00\x10BH\x1f\xc1\x88\x99|>\xd1\x008\x11\x7f\
-7\x85|n\xc5?\x92\x81\x9f5U\xf1w\x92\x09\x88\
-\x89\xbbe\x017\x9d\x04n\xa2|F\xfd4\x00\x84\x10\
-\x0a\xbcm\x16@\x12\x84=f\x22\xfeq\x1b\xe1w\x12\
-\xfd\x9b\x99\x80t\xb2\x00V\x1f\xb7\x8bt\xcd2\x01\xe9\
-.\x01\xb8\xc9\x0e\xa4\x12\xe1S\xf8\x09\x0d\x00!$m\
-C\xe0\xc6\x04\xc4\x5cF\xfd\xd9\x8e\xfes\xb1\x04\x90i\
-3\x90\x8e\xe0\xdb\x89=\x85?\xc4p\x0e\x00!$\x95\
-\xfb\x85U+\x9e\x99\xb0\xbb\x15}\xa7Q\xbfW\x9d\x00\
-~1\x01\x22\x99\x13|\x0a?\xff\xa0\x09!\xc4\xf5\xfd\
-\xc2\xce\x04Dl\x84\xbe \x8dh?\xd5\xb4\x7f\xc4\xc5\
-\xcf\xe7T\x04S\xe9\x04pc\x08\xc4\xc5\xc7\xed\x84>\
-\xd5\x1d\xfa(\xfc4\x00\x84\x10\xde3\x1c\x9b\x00;S\
-\xe0\xa6\xc2\xdf\xedz\x7f6Z\x00\xd3\xc9\x02X\x09s\
-<\x85\xff\xbb\x89\xee\xd3\x1d\xd5K\xf1\xa7\x01 \x84\x10\
-\xc7&\xc0\xa9\x19\x10\xc9|\xa4\x9f\xa9\xd6\xbfl\x99\x00\
-\xa7\xd9\x81tD\x9e\xa2Oh\x00\x08!\x9e\x9a\x00\x11\
-gc{\x9d~>U\xb1w\x12\xf5\xa7[\x03`%\
-\xb0\x994\x05\xa9\x08<\x85\x9f\xd0\x00\x10Brj\x02\
-2!\xeeN\xbe\xaf\xd3\xe7\x95i\x03\x90\x8a\x08\xbb\x11\
-s'\x9fs\x22\xf2\xf1\x14\x7f6B\x03@\x08!\x8e\
-\xef!n\x04\xdbM$\xef4\xc2\xcfF\xda?\xdd\x8c\
-@:Q{\xaa\x91}<\xc5\x9f\x81\xd0\x00\x10BH\
-Z\xf7\x91T\x04\xdbm4\x9f\xadh?S&\xc0\xee\
-\xff\xa9~\xce\xe9\xb9)\xfa\x84\x06\x80\x10\xe2\x0b#\xe0\
-4Bw\x1a\xc5\xa7\x12\xedg\xba\x080\x15Q\xce\xa4\
-\xb8S\xf4\x09\x0d\x00!\xc4\xf7\xf7\x147\x82\x9dJ4\
-\x1f\xc9\xc0sLWL\xe39\xfa8E\x9f\xd0\x00\x10\
-B\x02qo\x89d\xf9\xf3^\xdd\xe3\xd2\x8d\xc03Y\
-\xa0G\xd1'4\x00\x84\x90@\xdeg\x22Y\xf8\x9e\xd9\
-\xb8\xdf\xc5\xb3\xf4\xf5q\x0f\x9e\x0b!\x1a\x85\xbc\x04\x84\
-\x90\x00\x04\x1d~\x0cV\xe2\x01|,!\xcc\x00\x10B\
-By\xff\xf1\xcb=-\xee\xd3\xefE\x08\x0d\x00!\x84\
-\xf7%\x9fA\xa1'\xfcC#\x84\x90\x10\xdf\xaf(\xf4\
-\x84\x7fP\x84\x10\x12\xb2{\x1b\xc5\x9d\x10B\x08!\x84\
-\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84x\
-\xca\xff\x07\xbd\x8c\xa3\x8c\x16\x8fX\xe7\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x01\x8b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#0\
-00000\x22><g><rect \
-fill=\x22none\x22 heig\
-ht=\x2224\x22 width=\x222\
-4\x22/><path d=\x22M20\
-.41,8.41l-4.83-4\
-.83C15.21,3.21,1\
-4.7,3,14.17,3H5C\
-3.9,3,3,3.9,3,5v\
-14c0,1.1,0.9,2,2\
-,2h14c1.1,0,2-0.\
-9,2-2V9.83 C21,9\
-.3,20.79,8.79,20\
-.41,8.41z M7,7h7\
-v2H7V7z M17,17H7\
-v-2h10V17z M17,1\
-3H7v-2h10V13z\x22/>\
-</g></svg>\
-\x00\x00\x01f\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#000\
-000\x22><path d=\x22M0\
- 0h24v24H0V0z\x22 f\
-ill=\x22none\x22/><pat\
-h d=\x22M19 3H5c-1.\
-1 0-2 .9-2 2v7c0\
- 1.1.9 2 2 2h14c\
-1.1 0 2-.9 2-2V5\
-c0-1.1-.9-2-2-2z\
-m0 6h-4c0 1.62-1\
-.38 3-3 3s-3-1.3\
-8-3-3H5V5h14v4zm\
--4 7h6v3c0 1.1-.\
-9 2-2 2H5c-1.1 0\
--2-.9-2-2v-3h6c0\
- 1.66 1.34 3 3 3\
-s3-1.34 3-3z\x22/><\
-/svg>\
-\x00\x00\x01\x9e\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#000\
-000\x22><path d=\x22M0\
- 0h24v24H0z\x22 fil\
-l=\x22none\x22/><path \
-d=\x22M20 13H4c-.55\
- 0-1 .45-1 1v6c0\
- .55.45 1 1 1h16\
-c.55 0 1-.45 1-1\
-v-6c0-.55-.45-1-\
-1-1zM7 19c-1.1 0\
--2-.9-2-2s.9-2 2\
--2 2 .9 2 2-.9 2\
--2 2zM20 3H4c-.5\
-5 0-1 .45-1 1v6c\
-0 .55.45 1 1 1h1\
-6c.55 0 1-.45 1-\
-1V4c0-.55-.45-1-\
-1-1zM7 9c-1.1 0-\
-2-.9-2-2s.9-2 2-\
-2 2 .9 2 2-.9 2-\
-2 2z\x22/></svg>\
-\x00\x00\x01w\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#000\
-000\x22><path d=\x22M0\
- 0h24v24H0z\x22 fil\
-l=\x22none\x22/><path \
-d=\x22M18 17H6v-2h1\
-2v2zm0-4H6v-2h12\
-v2zm0-4H6V7h12v2\
-zM3 22l1.5-1.5L6\
- 22l1.5-1.5L9 22\
-l1.5-1.5L12 22l1\
-.5-1.5L15 22l1.5\
--1.5L18 22l1.5-1\
-.5L21 22V2l-1.5 \
-1.5L18 2l-1.5 1.\
-5L15 2l-1.5 1.5L\
-12 2l-1.5 1.5L9 \
-2 7.5 3.5 6 2 4.\
-5 3.5 3 2v20z\x22/>\
-</svg>\
-\x00\x00\x01?\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#fff\
-ffff\x22><path d=\x22M\
-0 0h24v24H0V0z\x22 \
-fill=\x22none\x22/><pa\
-th d=\x22M20 2H4c-1\
- 0-2 .9-2 2v3.01\
-c0 .72.43 1.34 1\
- 1.69V20c0 1.1 1\
-.1 2 2 2h14c.9 0\
- 2-.9 2-2V8.7c.5\
-7-.35 1-.97 1-1.\
-69V4c0-1.1-1-2-2\
--2zm-5 12H9v-2h6\
-v2zm5-7H4V4l16-.\
-02V7z\x22/></svg>\
-\x00\x00\x04\x22\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#0\
-00000\x22><g><path \
-d=\x22M0,0h24v24H0V\
-0z\x22 fill=\x22none\x22/\
-><path d=\x22M19.14\
-,12.94c0.04-0.3,\
-0.06-0.61,0.06-0\
-.94c0-0.32-0.02-\
-0.64-0.07-0.94l2\
-.03-1.58c0.18-0.\
-14,0.23-0.41,0.1\
-2-0.61 l-1.92-3.\
-32c-0.12-0.22-0.\
-37-0.29-0.59-0.2\
-2l-2.39,0.96c-0.\
-5-0.38-1.03-0.7-\
-1.62-0.94L14.4,2\
-.81c-0.04-0.24-0\
-.24-0.41-0.48-0.\
-41 h-3.84c-0.24,\
-0-0.43,0.17-0.47\
-,0.41L9.25,5.35C\
-8.66,5.59,8.12,5\
-.92,7.63,6.29L5.\
-24,5.33c-0.22-0.\
-08-0.47,0-0.59,0\
-.22L2.74,8.87 C2\
-.62,9.08,2.66,9.\
-34,2.86,9.48l2.0\
-3,1.58C4.84,11.3\
-6,4.8,11.69,4.8,\
-12s0.02,0.64,0.0\
-7,0.94l-2.03,1.5\
-8 c-0.18,0.14-0.\
-23,0.41-0.12,0.6\
-1l1.92,3.32c0.12\
-,0.22,0.37,0.29,\
-0.59,0.22l2.39-0\
-.96c0.5,0.38,1.0\
-3,0.7,1.62,0.94l\
-0.36,2.54 c0.05,\
-0.24,0.24,0.41,0\
-.48,0.41h3.84c0.\
-24,0,0.44-0.17,0\
-.47-0.41l0.36-2.\
-54c0.59-0.24,1.1\
-3-0.56,1.62-0.94\
-l2.39,0.96 c0.22\
-,0.08,0.47,0,0.5\
-9-0.22l1.92-3.32\
-c0.12-0.22,0.07-\
-0.47-0.12-0.61L1\
-9.14,12.94z M12,\
-15.6c-1.98,0-3.6\
--1.62-3.6-3.6 s1\
-.62-3.6,3.6-3.6s\
-3.6,1.62,3.6,3.6\
-S13.98,15.6,12,1\
-5.6z\x22/></g></svg\
->\
-\x00\x00\x01S\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#0\
-00000\x22><g><rect \
-fill=\x22none\x22 heig\
-ht=\x2224\x22 width=\x222\
-4\x22/><path d=\x22M20\
-,6h-8l-2-2H4C2.9\
-,4,2.01,4.9,2.01\
-,6L2,18c0,1.1,0.\
-9,2,2,2h16c1.1,0\
-,2-0.9,2-2V8C22,\
-6.9,21.1,6,20,6z\
- M14,16H6v-2h8V1\
-6z M18,12H6v-2h1\
-2V12z\x22/></g></sv\
-g>\
-\x00\x00\x00\xc0\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#000\
-000\x22><path d=\x22M0\
- 0h24v24H0z\x22 fil\
-l=\x22none\x22/><path \
-d=\x22M10 20v-6h4v6\
-h5v-8h3L12 3 2 1\
-2h3v8z\x22/></svg>\
-\x00\x00\x01\x86\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#0\
-00000\x22><g><rect \
-fill=\x22none\x22 heig\
-ht=\x2224\x22 width=\x222\
-4\x22/></g><g><path\
- d=\x22M20,4H4C2.89\
-,4,2,4.9,2,6v12c\
-0,1.1,0.89,2,2,2\
-h16c1.1,0,2-0.9,\
-2-2V6C22,4.9,21.\
-11,4,20,4z M20,1\
-8H4V8h16V18z M18\
-,17h-6v-2 h6V17z\
- M7.5,17l-1.41-1\
-.41L8.67,13l-2.5\
-9-2.59L7.5,9l4,4\
-L7.5,17z\x22/></g><\
-/svg>\
-\x00\x00\x01\x8b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#D\
-9D9D9\x22><g><rect \
-fill=\x22none\x22 heig\
-ht=\x2224\x22 width=\x222\
-4\x22/><path d=\x22M20\
-.41,8.41l-4.83-4\
-.83C15.21,3.21,1\
-4.7,3,14.17,3H5C\
-3.9,3,3,3.9,3,5v\
-14c0,1.1,0.9,2,2\
-,2h14c1.1,0,2-0.\
-9,2-2V9.83 C21,9\
-.3,20.79,8.79,20\
-.41,8.41z M7,7h7\
-v2H7V7z M17,17H7\
-v-2h10V17z M17,1\
-3H7v-2h10V13z\x22/>\
-</g></svg>\
-\x00\x00\x01f\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#D9D\
-9D9\x22><path d=\x22M0\
- 0h24v24H0V0z\x22 f\
-ill=\x22none\x22/><pat\
-h d=\x22M19 3H5c-1.\
-1 0-2 .9-2 2v7c0\
- 1.1.9 2 2 2h14c\
-1.1 0 2-.9 2-2V5\
-c0-1.1-.9-2-2-2z\
-m0 6h-4c0 1.62-1\
-.38 3-3 3s-3-1.3\
-8-3-3H5V5h14v4zm\
--4 7h6v3c0 1.1-.\
-9 2-2 2H5c-1.1 0\
--2-.9-2-2v-3h6c0\
- 1.66 1.34 3 3 3\
-s3-1.34 3-3z\x22/><\
-/svg>\
-\x00\x00\x01\x9e\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#D9D\
-9D9\x22><path d=\x22M0\
- 0h24v24H0z\x22 fil\
-l=\x22none\x22/><path \
-d=\x22M20 13H4c-.55\
- 0-1 .45-1 1v6c0\
- .55.45 1 1 1h16\
-c.55 0 1-.45 1-1\
-v-6c0-.55-.45-1-\
-1-1zM7 19c-1.1 0\
--2-.9-2-2s.9-2 2\
--2 2 .9 2 2-.9 2\
--2 2zM20 3H4c-.5\
-5 0-1 .45-1 1v6c\
-0 .55.45 1 1 1h1\
-6c.55 0 1-.45 1-\
-1V4c0-.55-.45-1-\
-1-1zM7 9c-1.1 0-\
-2-.9-2-2s.9-2 2-\
-2 2 .9 2 2-.9 2-\
-2 2z\x22/></svg>\
-\x00\x00\x01w\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#D9D\
-9D9\x22><path d=\x22M0\
- 0h24v24H0z\x22 fil\
-l=\x22none\x22/><path \
-d=\x22M18 17H6v-2h1\
-2v2zm0-4H6v-2h12\
-v2zm0-4H6V7h12v2\
-zM3 22l1.5-1.5L6\
- 22l1.5-1.5L9 22\
-l1.5-1.5L12 22l1\
-.5-1.5L15 22l1.5\
--1.5L18 22l1.5-1\
-.5L21 22V2l-1.5 \
-1.5L18 2l-1.5 1.\
-5L15 2l-1.5 1.5L\
-12 2l-1.5 1.5L9 \
-2 7.5 3.5 6 2 4.\
-5 3.5 3 2v20z\x22/>\
-</svg>\
-\x00\x00\x01>\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#FFF\
-FFF\x22><path d=\x22M0\
- 0h24v24H0V0z\x22 f\
-ill=\x22none\x22/><pat\
-h d=\x22M20 2H4c-1 \
-0-2 .9-2 2v3.01c\
-0 .72.43 1.34 1 \
-1.69V20c0 1.1 1.\
-1 2 2 2h14c.9 0 \
-2-.9 2-2V8.7c.57\
--.35 1-.97 1-1.6\
-9V4c0-1.1-1-2-2-\
-2zm-5 12H9v-2h6v\
-2zm5-7H4V4l16-.0\
-2V7z\x22/></svg>\
-\x00\x00\x04\x22\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#e\
-8eaed\x22><g><path \
-d=\x22M0,0h24v24H0V\
-0z\x22 fill=\x22none\x22/\
-><path d=\x22M19.14\
-,12.94c0.04-0.3,\
-0.06-0.61,0.06-0\
-.94c0-0.32-0.02-\
-0.64-0.07-0.94l2\
-.03-1.58c0.18-0.\
-14,0.23-0.41,0.1\
-2-0.61 l-1.92-3.\
-32c-0.12-0.22-0.\
-37-0.29-0.59-0.2\
-2l-2.39,0.96c-0.\
-5-0.38-1.03-0.7-\
-1.62-0.94L14.4,2\
-.81c-0.04-0.24-0\
-.24-0.41-0.48-0.\
-41 h-3.84c-0.24,\
-0-0.43,0.17-0.47\
-,0.41L9.25,5.35C\
-8.66,5.59,8.12,5\
-.92,7.63,6.29L5.\
-24,5.33c-0.22-0.\
-08-0.47,0-0.59,0\
-.22L2.74,8.87 C2\
-.62,9.08,2.66,9.\
-34,2.86,9.48l2.0\
-3,1.58C4.84,11.3\
-6,4.8,11.69,4.8,\
-12s0.02,0.64,0.0\
-7,0.94l-2.03,1.5\
-8 c-0.18,0.14-0.\
-23,0.41-0.12,0.6\
-1l1.92,3.32c0.12\
-,0.22,0.37,0.29,\
-0.59,0.22l2.39-0\
-.96c0.5,0.38,1.0\
-3,0.7,1.62,0.94l\
-0.36,2.54 c0.05,\
-0.24,0.24,0.41,0\
-.48,0.41h3.84c0.\
-24,0,0.44-0.17,0\
-.47-0.41l0.36-2.\
-54c0.59-0.24,1.1\
-3-0.56,1.62-0.94\
-l2.39,0.96 c0.22\
-,0.08,0.47,0,0.5\
-9-0.22l1.92-3.32\
-c0.12-0.22,0.07-\
-0.47-0.12-0.61L1\
-9.14,12.94z M12,\
-15.6c-1.98,0-3.6\
--1.62-3.6-3.6 s1\
-.62-3.6,3.6-3.6s\
-3.6,1.62,3.6,3.6\
-S13.98,15.6,12,1\
-5.6z\x22/></g></svg\
->\
-\x00\x00\x01S\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#F\
-FFFFF\x22><g><rect \
-fill=\x22none\x22 heig\
-ht=\x2224\x22 width=\x222\
-4\x22/><path d=\x22M20\
-,6h-8l-2-2H4C2.9\
-,4,2.01,4.9,2.01\
-,6L2,18c0,1.1,0.\
-9,2,2,2h16c1.1,0\
-,2-0.9,2-2V8C22,\
-6.9,21.1,6,20,6z\
- M14,16H6v-2h8V1\
-6z M18,12H6v-2h1\
-2V12z\x22/></g></sv\
-g>\
-\x00\x00\x00\xc0\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4px\x22 viewBox=\x220 \
-0 24 24\x22 width=\x22\
-24px\x22 fill=\x22#e8e\
-aed\x22><path d=\x22M0\
- 0h24v24H0z\x22 fil\
-l=\x22none\x22/><path \
-d=\x22M10 20v-6h4v6\
-h5v-8h3L12 3 2 1\
-2h3v8z\x22/></svg>\
-\x00\x00\x01\x86\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 enable-ba\
-ckground=\x22new 0 \
-0 24 24\x22 height=\
-\x2224px\x22 viewBox=\x22\
-0 0 24 24\x22 width\
-=\x2224px\x22 fill=\x22#F\
-FFFFF\x22><g><rect \
-fill=\x22none\x22 heig\
-ht=\x2224\x22 width=\x222\
-4\x22/></g><g><path\
- d=\x22M20,4H4C2.89\
-,4,2,4.9,2,6v12c\
-0,1.1,0.89,2,2,2\
-h16c1.1,0,2-0.9,\
-2-2V6C22,4.9,21.\
-11,4,20,4z M20,1\
-8H4V8h16V18z M18\
-,17h-6v-2 h6V17z\
- M7.5,17l-1.41-1\
-.41L8.67,13l-2.5\
-9-2.59L7.5,9l4,4\
-L7.5,17z\x22/></g><\
-/svg>\
-\x00\x019\x98\
-G\
-IF89a\x96\x00\x96\x00\xf7\xcf\x00\xef\xef\xef\xbf\
-\xbf\xbf\xdf\xdf\xdf\xcf\xcf\xcf   \x9f\x9f\x9f\x7f\x7f\
-\x7f\x0f\x0f\x0f\x10\x10\x10???\x09\x09\x09___\
-\xaf\xaf\xaf\x8f\x8f\x8f\x1f\x1f\x1f000ooo/\
-//OOOBBB@@@jjj\xc0\xc0\
-\xc0\x80\x80\x80```\x95\x95\x95\x11\x11\x11ppp\
-\x02\x02\x02<<<PPP\x08\x08\x08\x90\x90\x90\xfe\
-\xfe\xfe\xa0\xa0\xa0\xf6\xf6\xf6\xbd\xbd\xbd\x1d\x1d\x1d,,\
-,NNN\xfb\xfb\xfb\xb0\xb0\xb0bbbuuu\
-\xdb\xdb\xdb\xce\xce\xce\x8a\x8a\x8a\x9d\x9d\x9d\xf7\xf7\xf7\xc3\
-\xc3\xc3\xb1\xb1\xb1\x1c\x1c\x1c\xfd\xfd\xfd\xbe\xbe\xbenn\
-n\xd3\xd3\xd3\x9a\x9a\x9a\xe6\xe6\xe6\xee\xee\xee\xe2\xe2\xe2\
-\xad\xad\xadWWW999UUU\xf0\xf0\xf0\xf3\
-\xf3\xf3ggg\x88\x88\x88\x85\x85\x85\xf9\xf9\xf9\x9c\x9c\
-\x9c\xab\xab\xab\xe7\xe7\xe7\xf5\xf5\xf5\xfc\xfc\xfc\xcc\xcc\xcc\
-\xf8\xf8\xf8\xe0\xe0\xe0aaa\xdd\xdd\xdd\xec\xec\xec\xd8\
-\xd8\xd8\xea\xea\xea\xd2\xd2\xd2\xb4\xb4\xb4zzz\xa1\xa1\
-\xa1\xe1\xe1\xe1\xfa\xfa\xfaTTT\xe9\xe9\xe9yyy\
-\x87\x87\x87\xf2\xf2\xf2QQQ\xa9\xa9\xa9...\xd0\
-\xd0\xd0\xe4\xe4\xe4+++\xf1\xf1\xf1\xf4\xf4\xf4\xba\xba\
-\xba\xeb\xeb\xeb\xaa\xaa\xaa\xbb\xbb\xbb\xb2\xb2\xb2\xe3\xe3\xe3\
-\x98\x98\x98\xc1\xc1\xc1\xd4\xd4\xd4xxx\xda\xda\xdak\
-kk\xd9\xd9\xd9\xd1\xd1\xd1HHH\xc8\xc8\xc8\xb6\xb6\
-\xb6\x89\x89\x89GGG\xe8\xe8\xe8\xde\xde\xde\x16\x16\x16\
-\x96\x96\x96\x92\x92\x92\xc2\xc2\xc2\x17\x17\x17\xa3\xa3\xa3\xd7\
-\xd7\xd7\x8b\x8b\x8b\xe5\xe5\xe5\xcd\xcd\xcd\xc4\xc4\xc4\xb3\xb3\
-\xb3JJJ\xa4\xa4\xa4\xc6\xc6\xc6\x91\x91\x91EEE\
-\xb7\xb7\xb7***!!!\x12\x12\x12hhh\x8d\
-\x8d\x8d\xa6\xa6\xa6\xbc\xbc\xbc\x83\x83\x83111||\
-|\x8e\x8e\x8e222YYY\x97\x97\x97\xa2\xa2\xa2\
-\xa7\xa7\xa7\xca\xca\xca\xcb\xcb\xcb\x22\x22\x22\xc5\xc5\xc5\xb5\
-\xb5\xb5888666{{{&&&dd\
-d===FFFSSS\x9b\x9b\x9bqqq\
-\x93\x93\x93\xa5\xa5\xa5\xd6\xd6\xd6\x81\x81\x81rrr>\
->>tttmmm\x86\x86\x86[[[55\
-5\x9e\x9e\x9eMMM\xb8\xb8\xb8~~~\xd5\xd5\xd5\
-\xc9\xc9\xc9AAA\xdc\xdc\xdceee\xc7\xc7\xc7\x5c\
-\x5c\x5cLLL'''VVV\x1b\x1b\x1b\xed\xed\
-\xed;;;sss\xae\xae\xae\xb9\xb9\xb9\xa8\xa8\xa8\
-lll\x00\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00!\xff\x0bN\
-ETSCAPE2.0\x03\x01\x00\x00\x00!\
-\xff\x0bXMP DataXMP<?x\
-packet begin=\x22\xef\xbb\
-\xbf\x22 id=\x22W5M0MpCeh\
-iHzreSzNTczkc9d\x22\
-?> <x:xmpmeta xm\
-lns:x=\x22adobe:ns:\
-meta/\x22 x:xmptk=\x22\
-Adobe XMP Core 7\
-.1-c000 79.eda2b\
-3fac, 2021/11/17\
--17:23:19       \
- \x22> <rdf:RDF xml\
-ns:rdf=\x22http://w\
-ww.w3.org/1999/0\
-2/22-rdf-syntax-\
-ns#\x22> <rdf:Descr\
-iption rdf:about\
-=\x22\x22 xmlns:xmp=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/\x22 xml\
-ns:xmpMM=\x22http:/\
-/ns.adobe.com/xa\
-p/1.0/mm/\x22 xmlns\
-:stRef=\x22http://n\
-s.adobe.com/xap/\
-1.0/sType/Resour\
-ceRef#\x22 xmp:Crea\
-torTool=\x22Adobe P\
-hotoshop 23.1 (W\
-indows)\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:40632FEA7A531\
-1EF8546B12B78DFF\
-E24\x22 xmpMM:Docum\
-entID=\x22xmp.did:4\
-0632FEB7A5311EF8\
-546B12B78DFFE24\x22\
-> <xmpMM:Derived\
-From stRef:insta\
-nceID=\x22xmp.iid:4\
-0632FE87A5311EF8\
-546B12B78DFFE24\x22\
- stRef:documentI\
-D=\x22xmp.did:40632\
-FE97A5311EF8546B\
-12B78DFFE24\x22/> <\
-/rdf:Description\
-> </rdf:RDF> </x\
-:xmpmeta> <?xpac\
-ket end=\x22r\x22?>\x01\xff\xfe\
-\xfd\xfc\xfb\xfa\xf9\xf8\xf7\xf6\xf5\xf4\xf3\xf2\xf1\xf0\xef\xee\
-\xed\xec\xeb\xea\xe9\xe8\xe7\xe6\xe5\xe4\xe3\xe2\xe1\xe0\xdf\xde\
-\xdd\xdc\xdb\xda\xd9\xd8\xd7\xd6\xd5\xd4\xd3\xd2\xd1\xd0\xcf\xce\
-\xcd\xcc\xcb\xca\xc9\xc8\xc7\xc6\xc5\xc4\xc3\xc2\xc1\xc0\xbf\xbe\
-\xbd\xbc\xbb\xba\xb9\xb8\xb7\xb6\xb5\xb4\xb3\xb2\xb1\xb0\xaf\xae\
-\xad\xac\xab\xaa\xa9\xa8\xa7\xa6\xa5\xa4\xa3\xa2\xa1\xa0\x9f\x9e\
-\x9d\x9c\x9b\x9a\x99\x98\x97\x96\x95\x94\x93\x92\x91\x90\x8f\x8e\
-\x8d\x8c\x8b\x8a\x89\x88\x87\x86\x85\x84\x83\x82\x81\x80\x7f~\
-}|{zyxwvutsrqpon\
-mlkjihgfedcba`_^\
-]\x5c[ZYXWVUTSRQPON\
-MLKJIHGFEDCBA@?>\
-=<;:9876543210/.\
--,+*)('&%$#\x22! \x1f\x1e\
-\x1d\x1c\x1b\x1a\x19\x18\x17\x16\x15\x14\x13\x12\x11\x10\x0f\x0e\
-\x0d\x0c\x0b\x0a\x09\x08\x07\x06\x05\x04\x03\x02\x01\x00\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,\x00\x00\x00\x00\x96\x00\x96\x00\
-\x00\x08\xf1\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\
-\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\x8b\x183\
-j\xdc\xc8\xb1\xa3\xc7\x8f C\x8a\x1cI\xb2\xa4\xc9\x93\
-(S\xaa\x5c\xc9\xb2\xa5\xcb\x970c\xca\x9cI\xb3\xa6\
-\xcd\x9b8s\xea\xdc\xc9\xb3\xa7\xcf\x9f@\x83\x0a\x1dJ\
-\xb4\xa8\xd1\xa3H\x93*]\xca\xb4\xa9\xd3\xa7P\xa3J\
-\x9dJ\xb5\xaa\xd5\xabX\xb3j\xdd\xca\xb5\xab\xd7\xaf`\
-\xc3\x8a\x1dK\xb6\xac\xd9\xb3h\xd3\xaa]\xcb\xb6\xad\xdb\
-\xb7p\xe3\xca\x9dK\xb7\xae\xdd\xbbx\xf3\xea\xdd\xcb\xb7\
-\xaf\xdf\xbf\x80\x03\x0b\x1eL\xb8\xb0\xe1\xc3\x88\x13+^\
-\xcc\xb8\xb1\xe3\xc7\x90#K\x9eL\xb9\xb2\xe5\xcb\x983\
-k\xde\xcc\xb9\xb3\xe7\xcf\xa0C\x8b\x1eM\xba\xb4\xe9\xd3\
-\xa8S\xab^\xcd\xba\xb5\xeb\xd7\xb0c\xcb\x9eM\xbb\xb6\
-\xed\xdb\xb8s\xeb\xde\xcd\xbb\xb7\xef\xdf\xc0\x83\x0b\x1fN\
-\xbc\xb8\xf1\xe3\xc8\x93+_\xce\xbc\xb9\xf3\xe7\xd0\xa3K\
-\x9fn8 \x00!\xf9\x04\x05\x02\x00\xcf\x00,J\x00\
-\x13\x00\x17\x00\x0c\x00\x00\x08k\x00\x9f=\x0b\x81\xa2\x88\
-A\x14JB\x84p\xe6L\xa0\xc3\x87\x02C\x14\x19A\
-\xb1b\xc5\x22(h4\x84(\x10\x8b\xc5\x8f\x16\x0d&\
-\xdc\xf8\xcc\xd9D\x90(+b\x09!\xd0Y\xca\x97\x14\
-\x8b\xb0t\x09\xf3e\x91\x92\x1ek\xa2,\xd2P\xa2N\
-\x907#b9\xf9s\x04\x0a\x88\xce\x14*)H\x14\
-(K\x8e\x0f\x93\xd2\x18\xfa\xf1(\xd4\xabI\x95`A\
-\xb1P`@\x00!\xf9\x04\x05\x02\x00\xcf\x00,J\x00\
-\x13\x00%\x00\x14\x00\x00\x08\xad\x00\x9f\x09\x1c(\xd0\x19\
-\x0d,4\x08*\x5c\xc8\xb0\xa1@%R\x04\x08@\x82\
-\x84L\x11\x1a\xce\x1cjdH\x03\x89\xc4\x8f\x1f\x91\x00\
-\xc0\xb2\xb1\xe4\xb3  S\x86\x0c\x92\xd0$\xc3\x88*\
-c\x22\x912\x22\xa3\xcb\x81\x1ec\xea\x9cX\xf3\xe6\xb3\
-\x9c;u\x22\xe9i\x12e\xd0\xa0H\x8a\x98\x0c\x01\xf3\
-\xa8P\x00!J:\x83\x01\x05\xa8\xd3\x94Im\x96T\
-2\xa2\xea\xd5\x94P\xa2\xfa\xc4\x02\xc0\xaaS)b}\
-\x86\xa0jv'\x14\x9f\x0a\x95x=\x8a$-\xdc\x87\
-s\x85\xb6\xbcK\x10KS\x95R\xf82tF\xa6-\
-\x12\x92\x82\x19\xfa\x0594\xb1Cg#(J\x81\xe1\
-\xb8\xe4^\x81\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-P\x00\x13\x00-\x00#\x00\x00\x08\xf9\x00\x9f\x09\x1cH\
-\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0!B\x18\x00\xce$\
-\x09\xe1\xb0\xa2\xc23KHh\x5c\x82\x04\x86\xc5\x8f\x03\
-ad\xd4Hr\xc9\x14\x00\x14A:\x8cB\xb2e\xc9\
-3)U&t6\xd2\xa5\xcb%0e\x22Da\xb3\
-\xe7\xc6.\xcet\x16\x0cQ\xd3\xa7\xcb(X\x84\x12|\
-b\xd4\xe7\x92\x1dJ\x05:{R\xb4)\xc9)(\xa2\
->\x83A\xd5\xea\xcd.Z\x9f\xa1\xc0\xe8\xb5\xe4\x8e\xa0\
-ZC\x00\x98RV\xe3\x13\xb4Z\x9d\xc1\x88R\xd5\xe7\
-\x14\x1aa\x07&a\xeb\xf5n^\x81!v\xd4\xb5\xe9\
-\xf7\xef\xb3\xbd}\xf1\x1a\x0e<\xb8e\x14\xb8\x7f\x934\
-&\xf9\xd6\xb0@\x91V\xcfX\xbe<\x99\xc4\x12\x8f\x9b\
-1\x1b]\xa2\xd8\xb2h\x9f\x8f7o\xed\x0c@\xf5\xea\
-\xd1YU\xe7h\xfa\xc4\xb53\x96N\x93\xb8F19\
-\x8a\xebg]\x1a/\x89\xad\x9ai\xcf\xe1\xbfi\xf0=\
-\xfa\x9b\xf3\xcd\xa4\xcd\x0f\x8f\x5c\x12\xa5tt\x1a\x00\x00\
-\x80\x16\x18\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,V\x00\
-\x15\x00.\x009\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10\x1d:\xc3\x12\
-\xb1\xe2Ag\x81\x8e\x1c\xa1\xa2\xc7\x99\xc5\x8fu2\x88\
-\x14I%\xc8\xc7\x88b\x8e\x8c\x1cyd@\x88\x93\x0e\
-\xa9\xac\x9cyD\x0a\xcc\x85ET\xce\x5cy\xa4\x86\x92\
-\x9b\x08\x8b\xec\x1cZ\x12\xa8Ag2\x87\xd2\xb4i\x94\
- \x0c\x9dJY\x06jJPI\x8d\xa83\xeb\xbc\xa4\
-\xfa\xcc\x99\x14\xa8X\xa9\xfc\xe4\xfaL\xc9\x00\xb0Jk\
-x$\xfbLGR\xacu\xd6\x92u\x96\x08\xab\xc8:\
-l\x05:{\x82v\xe7\x80\xbc\x02\xbfb=\xa2\x07\xf0\
-\xb3 o\x87\x1e1\x09XI\xdf\x95T\xb6\xe6\x0d\xf2\
-x\xe4_\xc3\x94\xa3\xd64|\xb8r\x86#c\x01\xf3\
-\x8d\x8a\x97s]\xa5\x9b\x0d+I<\x93\x8a\xdc\xbc:\
-<35< \xaak\xceH\xa3\xce\x06,E\xb3\xe4\
-\xbc\xb9\x95\x8a\xe1\xfcL\xf0\xd0\x1a\xc4\x9f]U\x0c\x83\
-x\xe6\xa1O\x92\xb3f\xf9:\xef\x93\xa8\x8cUW.\
-\xcdy\xf9\xce#\xd5\xd9\xeaP\x88Z\x84x\x88\xca\xbb\
-\x01{\x9fy\x99\xf3u\xc5\xc9\x83\xa0.\xcf\xd9\xb1R\
-\x1d\xd2\x95\xa6\xcf[{h{\xc3\xef\xf9\x95\x5co\xc7\
-\x0d\x88ZrB\xc1G\x5c\x82\xdf\xd1g\x983\x8f\x81\
-\x96\xdfw\xc9=#\x06t\x15\xd2\x05\xd5\x11\x89\xfc\xe6\
-\x9c\x14\x03H\xd1\x9c@\x01\x01\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,^\x00\x18\x00&\x00R\x00\x00\x08\xff\x00\x9f\
-\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\
-\x10#J\x9cH\xb1bB\x1ay\xf2\xd0\xb0\xb80\xcf\
-\x90\x0a\x15\x86\xec\xe0\x88P\xceG\x90!S\x90,\x88\
-\xe2$J\x90)\x9c\xad\x14\x08\xea\xa5\xcd\x14(f\xa6\
-\xb0i\x93MN\x925y\xbed\xb3\x12\x86K\xa1\x15\
-T\x92\xd4qTh\xcc\xa5My\x02[\xc9\x14)\xc8\
-!y\xa8F}9\x04\x86V\xab\x15\xd8\xc8\x84\x0av\
-\xeaW\xa4C\x82\xcc\x94\x03V\xecJg;\xad\xca\x99\
-\xd9\xd2\xea\x90\x8d+=Z\x9d4\xf3Y\x1a\xbb^W\
-\xd2\xe0\xb3\xb7oU\xa1C~\xaeDd5\x8c\xe1\xad\
-a\xc7\xae$\x8cTG\xdf&V\x95\xbe\xa5\xcc\xf3n\
-\xdf0V\xb3\xce\xa4\x019M_\xbfhOc\xae\xdc\
-\xd7(\xd2\xb9}!k^\xf9\x17\xb1j\xb4\x81W\xd6\
-\x15*z&g\x9bMN\xd7\xe6\xe9\xb8\xefp\x9b\xa6\
-/#M>s5OD\xb7m\xb7N=\x1d1\xde\
-\xa2\x90s\xaf\xcc\xde\x9a\xfbL\x18h\xaf\x93y\x0cB\
-\xbdy\xf9\x95\xceo\x9e\x06-\x949\xed\xe5\xa7\xe3\xf2\
-\x0c>\xd3\x19d\xfaT\xadZ\x9e\xc9\xbe\xb3d\x92l\
- 5\x1bG\xbb\xcd\xa7\x1cb\x8a\x91t\xdcK|\xf4\
-E\x1aR\xa0|\xa6_}\x01Zg\x9e\x80\x14\xa2\xb5\
-\x1fI\xe9\xd9\x04\xdd[\x15v\xb6!G\x1d\xbe\xf4\xe1\
-b\x13\xae\x14\x04d|\xfcgQ\x89(\xe1G\x16O\
--\x0a\xd7\x99\x8co\xa5\xe1\xd2\x10\xc5\x9d&\x90\x0e\x88\
-\x0c\x81\x08\x8e\x05\x05\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,Z\x00\x1e\x00*\x00b\x00\x00\x08\xff\x00\x9f\x09\x1c\
-H\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#\
-J\x9cH\xb1\xa2\xc5\x8b\x183j\xdcx1D\x8c*\
-B\xd0\x14\xe1x\xb0H\x95\x09('\x08\xd1B\x92 \
-\x8d\x93)Q\x0a\x19\xd9\xf2\x19\xa1\x981U\xd5|\xf6\
-\x05gJ!Qj\xf6\xf4)3I\xcb$B\x88\xa2\
-\x14\x14\xa2\xe5P\xa5AI\xd2x\xa3tB\x15\x1a-\
-\xaf$U\xea\xa7&\xa3\xaa3[\x86\xa0\xaa\x14MM\
-\xadJ\x85`my\xa7j\xd7\x96@\xb6\xfa\x14\xd2\xd4\
-i\xd5\xa8$\xe3*\x15\xb4\xb3-\xd1\xb0Y\xab\x12\xaa\
-9v\xefN?ii\x92\xd4r\x97\xb0\x5c\x9c_v\
-~\xfd\xbb\xf3J\xe2\x9aH\x95\xb2\xac\xf98\xe6\xe0\x9a\
-8\x94F\xae\x89\x98\xe8\xe8\x96Q\xd2VV\x8d9\xed\
-Z\x92I\xaa\x1a=*\xbb\xb5\xd2\xd9\xb0k\xd3\xbem\
-\x9b(n\x8e\xb1y\xef\x9e[\x97\xa4e\xca5S#\
-oy\xd3\xf4\xce\xa7\x90wvN\xf9Y\xeat\x94\x9b\
-\xf3\xa6\xfd\xbd\xb1\xf9\xdc\x9d\xaa\x94\xe2\xd8\xa8I\xe3\xfa\
-\x84\xb7\x8b\xabf\xe78\x99\xb8X\xf3\xe3\x03C\xad)\
-\xe82l\xf3wj\xa2\xa9z\xe5\xa8y\xba-\xed\xc7\
-\x95\x7f\xdb\x91\x14B}\xa21\x07\x16w\x18e\x96 \
-G\x07.HR{D1BR\x14\xe6M\xf0Fq\
-\x19i\x91\xe1J\x1c\x99T\xd5\x04\xa7e$bUo\
-\xbc\x86\xd1\x89i\xadw\x11\x100\xa5\x85\x17F;d\
-\x88\x92\x85\x1a\xc5`\xe3\x048pX\x11\x0d\xaa\xec\x98\
-bF;\xc4\x88\xa2b?\xa2\xb1\xa3\x86HRT\xe4\
-\x88)\xbd\xd1\xa4DR\x08\xb2$\x8f*Ri%\x94\
-21\xe2#D@l\xc9\xa5J\xd5MD\xc8\x952\
-\xb9\x18\x91\x83\x5c\x0a\x81\xc3\x94\x11)\xd7\xe6\x8c\x15\xc9\
-\x09\xd6\x9b\x1a\xb1I\xd4\x1btb\xe4\x97O|~\xb9\
-bg\x81\xee\xf4\x8c\x16w\x08!D\xa1\x86\x0eT\x04\
-\x83-\x05\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,7\x00\
-'\x00M\x00]\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\
-\xb1\xa2\xc5\x8b\x183j\xdc\xc8\xb1\xa3\xc7\x8f C\x8a\
-\x1cI\xb2\xa4\xc9\x93(S\xaaL\x18\xc4\x90\x01\x03b\
-B\xac\xd4\x18\x02P\x07\x028\x09\x00\x9a\x99\x11P\xce\
-\x9c\x1d\xe4\xf0\xb4\xc8\xe4\xe6O\x9cY\x86V\x0cr\x14\
-(\x14\xa5\x13\x95\x18mj\x05\xeaDHMqv\x90\
-i\x15\xa2\x9a\xac8\x85v}\x08e\xeaQ\x03c!\
-z\x01\xbb5\xad\xc3\xaf`\x9f\xbaeX\x16\xac\x9a\xb9\
-\x0d\xcd\xfe\xac\x80\x97\xa1\x15\xb6J\xfa*\x5c\x03\x96\x80\
-\x5c\xc1\x07C\xe8\xcd\xd9\x02qB\xacY\xab:>\x08\
-\x02,\xda\xc9\x06\xfff\xed\x80\xd9`\x0b\xc0\x9d\x09~\
-\x06\x1b$\xf4@(\x85K\x9b~\xc6\x94\xf4\xeagR\
-\xe3\xbe~\xb6\x18g\xe3\xd7\xb5\x09\xacy]\xd4\xf5\xea\
-\xd6YU\x9bF\xed\xdb\xf4\xe8\xe0\xaf\x8f\x1fm\xbbZ\
-sS\xce\xaf+g\x051\xdb\x00X\xc9\xa6cg\xbd\
-mZN\xe1\xdd\xcdA\x9b\xffV\x0c\x16\xd2k\xe2Y\
-\xdb\xbc\x86\x9b\xf5p\xe8,ly\xe7\xb6\xf4\xba\xcd\xf7\
-\xd5!\xe0o\xe6\x1a\x9a\xf0\xf5\xd7\x15\xb0\x05^\x7f\xb9\
-y\x01`a\xdcu\xd6B\x81\xfcu\xa6_Vw\x99\
-\xc6\xdes\x81\x85\x16Dn\x04D\xf8^a^T\xd8\
-\x99Ol%8\x99\x1c\x18\x9a\x17Z]l\xb9\xe7\x18\
-\x13\x0fF\x16\x1a\x8b\x85\x11\xe0E\x83\x88\xc1XX\x07\
-\xc2\xad\xd8\xe2s\x22\x0a\x06\xc5\x8eM\xd1\x87\x19\x1c\x18\
-\xe2$\xa4c!\xf4Q\xa4\x8cLL\x16\x04\x90My\
-\xd1$b!\x18\xb2$\x01\x1d\xa88\x17\x1cPF9\
-e_bTp%\x93\x82\x859&\x01\x90|\x99\x16\
-\x13mdqf\x07 \xd08\x11\x13A\xc8I\x91\x12\
-p\x18p\xa6V=J\x14\x84\x98XV`\x08\x1cj\
-:\x14\x02\x14m\x00\x1acV^\xe4x'\x94\x1dt\
-\xd0G\x0b-\xc0\x11\xc4\xa5\x02\x85pi\x10p\xb4\xd0\
-\x87\xa2\x8bnf\x85\x9d\x12M\x18j\xa4\x91\x86\xaa*\
-\x96\x908jQ\x97\xab\xc6Z\x0a\x96\x17}Z\xb4\xa7\
-\xac\xa7\xaa\xe1\xa1F\xda\xe1\xea\xebO^\xe8\x0a\x92%\
-\xbf\xfe\xda\x01\xad#1\xb1V\xb1\xabv`\x85\x96 \
-)\xa1\xc6\xad\xcdZ\x22\x07\xa9\x22i\xda\x02\x08^P\
-\xfbS\x07\x90\xb4\x01\x05\xb6)1\xb1F\x1b X\x82\
-\xeab\x91z\x01\x82\x1a-\x04\xb1k\x8d\x9bn:\xaf\
-R\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x1a\x002\
-\x00j\x00R\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\
-\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\
-\xa2\xc5\x8b\x183j\xdc\xc8\xb1\xa3\xc7\x8f C\x8a\x1c\
-I\xb2\xa4\xc9\x93(S\xaa\x5c\xc9\xb2\xa5\xcb\x970c\
-\xca\x9cI\xb3f\xcb\x10y\xa6\x00\x09a\xf3f\x15\x0d\
-\x0a\x82\x82\x01\xd2s\xe5\xa1\xa0H\x15\x80\xe1Y\xf4\xe4\
-\x13\xa0I\x83\xceiz2FT\xa4\x91\xa8\x9a\xb4z\
-U\xc1\x16\xad%\xb9^\xd5\x00\x96\xe4\x9c\xae\x0a\xc8\x96\
-\x15\x09\x04\xad\xda\xb5 \xdbv\xd5@\x14\xeeG\x14h\
-\x15\xd4\xb5\xdb\x11F\xde\xbd|7\xca\xed\x0a8p\xc6\
-\xc1W\x0b\x1b\xbe\x888\xaa\xe2\xc5\x15\x1b'}\x0cy\
-\xa2\xe4\xa0\x1a`T\xcexv\xee\xe6\x8cb\xa3\xbe\xfd\
-\x5c\xd1\x0a\xda\xaf\xa4-:9\x9d\xda\x22\xd4\xab\x86Z\
-S\x04\xf2:\xea\x13\xd9\x13;\x8f\xd5\x8c;b$\xb4\
-czG\x0cQ;)j\xe1\x0e\x9f\xe4\x8d\x81\xfc\xe1\
-\xef\xb9\xbc\x9b/\x0c\x01\x06-\x1e\xe9\x0du\xc3\xc6\xce\
-\xf0(t\xee\x0a\x9fZ\xff\x07\xaf\xb0\xcar\xf2\x08\x91\
-\x14G\xaa\x81\xa9A\x18@P`\xf7\xde\xd5\xcaA\x18\
-?\xd3Vq\x8f;\xc6z\xcc\xf2\x15\x04CuI9\
-\xc1_k\x04vu\xdc@\xd4u\xd5@o\x0d\xe4\x95\
-\x99A\xda%\xa5\xc1T\xad\xcd\xf1_P\xf6\x19\x14\x9a\
-h\xd1m\x86B\x82W\x8d\x11`A\xb4\xe5e i\
-\xab\x9d\x87P\x8bhuX\x99\x15\x1b*\x80\xc7\x81\x04\
-\xa5\xe8\xd6m\x90i(!e\x03\xf9'!\x8f\x81\x89\
-\xe7\x16s\x0cm\x91WZD\xc25\xe0\x92N8\x84\
-\xc2\x18Kj\xd0$XO\xe65F\x88\x0b\xa9W\xe5\
-\x95M\x01A\xe2X`.dH\x8diM\x01\x96\x91\
-n\xc9\x08\x11\x8cm\xe28\x93\x90Kf5Q\x08p\
-\xa2\xe5\x04\x9725\x80\xa6\x02+R\x84\xe7\x92B\x95\
-\xd9\x12\x10\xf4iy\xa2\xa0y\xce\xd5\xc0\xa2-Q\xf1\
-\xa7\x02[f4(\xa1iQ!\xa7I\x88bJ)\
-\x9f\x15]\x8a)\x18j\xa6\x04D~\x98\xee\xd9Q\x08\
-[L\x9a\xd6!zl\xcd\xda\xd1\xa9\xae\x02*\xebE\
-gz*\x94\x15\x90n\x14\xc2\x14\x87\xd4\xaa\x81\x9d!\
-!A\xa5\xaei91E\xaf\x14\xa1\xa0\x87\x9f\xc8\xa6\
-\x85\xe4H(4\x8a\xa9\x06\x87P\x91\xc7\xad\x08\xa1\x90\
-\x07\x15N\xd4\x9a\xd4\x18H\x9c\x14B\xae\xd1\xb2\x07F\
-\x15T\xc4\x00\xc4\xbb\xf1\xc1\xf7\xae\x1e1P\xf1\x93\xb8\
-\xa2m\xc1\xecH@\xb4\x9a\xee\xbf\x00#5\x86\xa1&\
-=\x81G\xc0\x08{:,\xb7%\x85\x10\xc3\xb1\x09G\
-\xcc\xde\x16@\xae\x84\x02\x8d\x12'\xac\x01\xc5E9\x8c\
-\x07\xbe\x19k`E\xc53!\xe1o\xc6U:1\x07\
-\xc35\xa10G$ +\xecD\x0c\xa0\xf2\x85\x84\x15\
-\x1f#\xac\x81\x06NXQno!\x001\x87![\
-\x8c\xb1\xf3\xce\xa2\xed\xec\xc4\x161<Ars\xf0\xc2\
-[sK\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00<\x00r\x00H\x00\x00\x08\xff\x00\x9f\x09|\x86\x02\
-\x00\x00\x14\x03\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9c\
-\xc8\xd0H\xb3\x8b\xcdz\x00\xa0\xc8\xb1\xa3\xc7\x8f \x9f\
-\xd5\xc0H2G\xc8\x93(SRt@\x12c\x0f\x95\
-0c\xc2\x04\xd0\x92\xa4\xcc\x9b8;\x8e\xacy1\xa7\
-\xcf\x9f\x0dy\xf0l\xe6\x03\xa8Q\xa36\x86\xda8\xca\
-4gR\x9e<\x9aJ\x8d9\xb4Y\x8d\xa9XQV\
-e\x91\xb5\xab\xc7\x11U7z\x1d+\x91\xe6P\xb1d\
-\xd364\xcb\x13\xad\xda\xb7\x03\xd9\xd6D\x08\xb7\xee3\
-\xb9-\xed\xda\xc5kS/\x5c\xbe\x18\xe9\xfaM\x0b\xf8\
-\xa2\xdb\xc1F\x010\xd8\xc0\x85E\x88\x81(\xc2\x22f\
-\xda\xa2\xa5\x03\x93\x02\xb7N6\x1a\x99'\xdd\xaaW7\
-\xff\xac\xcc3\xf4\x8c\xa18D\xff|Z34\xeb\x96\
-/U\xe7dYZ\xa0\xd0\xa1\xb2q\x82\x1d\xdaB \
-\x8b\xaa#r\xcb\xfc}V\xe0n\x9e\xbd\x85\xc3\xbc\xcd\
-3aU\x22\xcaa\xf6P\x9a\xf0G\xd5\xc7\xd1Ov\
-\x86\x9a\x904O\xcc\xd9Az\xff\xaf\xc9u\xe0\xf1\x9a\
-\xa9\xc3\x83$r]\xa1\x8f\xf6\xea=V]\xaa\x10G\
-\xd5\xe4\xf1)\x8eo\x89\x7f`\x8e\xaa\x1d\xe4\xc7Q\x07\
-U\x09\x96\xd0{\xc5\x09\x18\xd1\x7fC\x15\xc5\xd0~$\
-m\xa0`D\x1b\xdc\xd7P\x08U5S\xde\x84\x0c\x15\
-\xd6\x93C\xf6\x0d\x15 \x87\x0cU\x88\xdaC\x1e6\xd3\
-\x1f\x89\xcf\x107Tp\x0f\xb17\x94\x03\x06\x92H \
-u\x10m\xc7\x93\x84,>\xc3\x5c[\x12\x85\xc8\x1b\x8b\
-)\xd2\x17\x91\x8e5\xd1\xc8a\x087\xbeH\xd1NC\
-\xc5\xa6\xa0EU\xa5G\x91uU\x19\xa1 \x94<\xcd\
-PcD\xe7!\x97\x9f\x8bCz\xc4\xe5w\xea\x85Y\
-\x93\x91\x1d\x85\x80\xe0\x8c0*7\x02mC\xcd\x80\xdd\
-G#\x9cV\x95\x03q\xca6g\x86\xcd\x80\x07\x12\x99\
-<\xf1\x99\x1b\x0bt\x9e\x98\xd2\x8f\x85n8\x19\x845\
-A\x07\xd3kC\x050Y\x08Tf\xf8\xc3\x9d*a\
-\x99\xa1\x11\x9c\xc2\x85\xc2t\x80zyS\x9e\x806\xd3\
-\xc1ai\xb5\x90h\x9d}\xc6\xeb\x84j\xaa\x0c\xbc5\
-\x02\xa9\xa5\xc6*\xd3\xac\x80v (V!0\x90\xea\
-E3\xe8z\xaa\x9e\xa9n\xc0\xeaQ94\x09\xe8\xa6\
-L\xa1\xe0i\xb2\xbf\xfa\x14\x02\x0b\xce\x02\xca\xe6Q!\
-\xc88\xac\xaa-\x84\x1a\x13\x0a\x0c\xbc\x0ahTY\x09\
-\xf9m3\x5c\xacxR\x089p\xb1.\xb1\x8eb\x95\
-\x03\xb2\xf3\xf6\xc0\x00\x0b_F\x04/\x03\xb8\xce\xfb\x83\
-\xb1S\xa1@\xe9\xbc\xcd8\xb0\x01\x03\x01\xb0`\x10\x00\
-\x8f\x8d`\x10\x0b\x01\x04\x000\xc2$\xcd\x10\xda[-\
-\xe0\x8b\xf1\xc7\x08\xdb\xd0/Y(\xa8\x0b\xf2\xc9\x19\xce\
-Pm]#\x1c\x8c\xf2\xcb\xcd\xf0 \xae_\x00\xb8\x0c\
-3\xc28\x10\x8c\xd8\x08&\xdf<\xac\x0f5\xcc,[\
-\x08-\xbc\xe9\xf3|\xf5\xe6\xd7\xc2\xb4G\x13\x95s\x8f\
-\x03\xb1\xc0\x03\xd3\x1f\xfb\x80\x03\xbfP;\x04@\x0b<\
-\xd8@uM?\xd8`\x03\x0f9\x8c\x9c5D\x0f\xa7\
--\xf4X\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00\x1c\x00q\x00h\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xa0A\x82\x016802\xe2\xa0\xc3\x87\x10#J\x9c\
-H\xb1\xe2\xc1\x11\x1d\x9ail\xe6\xa0\xa1\xc5\x8f C\
-\x8a\x9c\xc8\xc2\xc1\xc6\x8d\x0eB\x8c\x5c\xc9\xb2\xa5\xc4\x00\
-'c\xd6pI\xb3\xe6\xca\x10\x5cb\xc6t`\xb3\xa7\
-O\x89#z\xe8\xd4\xf9\xb3\xa8Q\x81!2\x0e=I\
-\xe4\xa8S\x9b!\x84.\xdd8\xc3\xe3\xd3\xab#\xa3N\
-\xa5j\x15\xabW\x8bZ\xb76\xfb\x81\xe2\xab\xd9\x8aa\
-\xb7\xe2Py\xb6mD#b\x9b\xb5pK\xf7!\x0b\
-\xb13\x00\xd4\xdd[p\x84\xc9\xad9\xf8\x0a\x16(u\
-*\x8b\xc1\x82y\x88=\x8cx/\x80\xc5\x8d\xf9\x16\x1e\
-\x8a#\xf2\xde\xbbS\x7f\xb0\xb5\xdc6\xc4\xdf\xa1U9\
-\xd3\xad\xb1\x95\xb1\xe8\xb3(\xb66=\xdd\x16\xc7\xd6\xb2\
-\xac\xcd\x86\xd8:3\xb6Y\xd2Kgl\xb6\x8d\xf5\xb3\
-N\xd3\xbc\xafb\x1e\xea#\xf8\xd7\xc91\xe7\x1a\xbf\x9a\
-z*\xec\xe5N[L]\x0d\xdd)\xf2\x93\xc0\xab\xff\
-l\x0eZ{\xf4\xa9<\xbc\x1f\xff%\xd2\x8c\xe0\xc9\xae\
-\xe2{\xf2486}\xd1\xd4\x07\x9b\xd5v\xdf3;\
-\xc1\xc0\xf4{\x86w\x88>\x7fK\x1b\x0e\x95\xe7\x9fM\
-\x1d8\xf4\xc3\x806\x09h\x10u\x08\xb2\xb4[\x83?\
-\xe9\xe5\x10~\x10\xae$\xe1E\x15fX\xdds\x1a\xda\
-ta\x875}\x08bE\xf6\x0d$\xe2\x88,\x9d\x88\
-\xe2\x8aX\xf57\x10\x85,\xae4_\x8c#\xedG\xa3\
-D\x07\x1e\x04\xe0\x8d\x12U\x16\x1f\x8f\x12\xcdX\x90\x8a\
-@\x9a\xf8\x90\x90E\x12\xf4 A;&yPq?\
-:y\x90\x8f\x07\x11\x99$\x8c\x05!)\xe5\x92\x03\xf5\
- \xe5A\x0c\x16\xc4\xe1\x97\xcf(w\x90\x8dd>3\
-&A\xeb\xa5)P\x98\x04\x95\xe8$\x96\x04\x15\x08\xe2\
-\x08\x5c\x08\xb4\x81\x95\x04\xcd\x00$\x0am\x0a\xc4\x80D\
-h\xc6\xe8\xa5AZ\x12\xb4f\x9c\x19\x16:P\xa0\x0e\
-Qy\x10\x97\xee=V\x94\xa3\xee%\xf5\x10\x94\x16\x22\
-\x88\xe9@\x9fZ\xd4\x01\xa5\xd5Y\xea\x90n\x14Ij\
-\x90\x11\xf9i\xfa\x90\x99\x12\x85\xfa\xe0\xe7\xab\xf4\x85\xfa\
-L\x8e\x15\xd19d\x87|:\x04'\x9b.\xf2&\xe7\
-@\xaaR\x84\xc2\xac\x08\xde\x05\x11\xa7 );\xa0\xb3\
-\x0f\x05K\x91\xad\xd5)\xe8\x10\xac\x225\x99\xde\xb0=\
-\xc9\xea^\x00_\x8d\x80\xecCyZ&mA\xa4\x1a\
-\xe5\x80\xaet\xc1\x14\x1b\x17\xe9b\xb5\xa8h\x0e\x04\x10\
-\xefQ-@j[\x07\xdc\xfe\x14\x02\x0b\x87J\x14Z\
-c\xfc\xde\xdb\x12\x0a\x0c\xe8\xfb\xd0\x0f\xe7\xd6\xb5\xd0\xbc\
--\xe5\x90\x93E\x9a\x99E\xedA\x1b\xd84B\x0bv\
-V\xd4\xcc\xc5E\x01\xc0\xecG\xbd\xf2\xd7\x02\x17\x0a\x0b\
-\xcc.V!\x80\xfcP\x07\x5c\x04\x90\x83^\xfd)\xb7\
-\x81\xb5\x1f5c\x83\xc1O\x89\xcc\x9a\x0f\xfd\x9eU\xc3\
-\xb8\x83\xc9\xc7\xb3l.c\x85\x03\xc4\x83\xa1Pl[\
-LG\x16B\x0d#_5\xc3\xd2\xde\xb1\xa0\xedx\x08\
-n]\x93\x0d-\x1c\x0d\x1d\x11D\x834\x03\x11-4\
-<`Y5\x10\xf1\x03\xce:>\x83C\xda_Z\x85\
--b\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-\x12\x00k\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13*\x04\xc0\x90\xe1\x08\x85\x10#J\x9cH\
-\xb1\xe2\xb3\x11-\x02l\xd8\xd8\xac\xa3\xc7\x8f\xcdzl\
-`\x90\xc3\xa2\xc9\x93(\x11b\xe4\xe2\x00\xa4\xcb\x97\x1e\
-{\xa0HI\xb3\xa6B\x14-X\xc2\xdc\xb9s\x83\xcd\
-\x9f?sp\xe1I\x94\xe7C\xa0H+\xa2\x08\xd0\xa1\
-\xa8S\x98\x00\x92J\x85\x88\xc2\xc8\xd3\xab/\xa3N\xdd\
-J0D\x00\xac`Ar\x1d\xfb,@\xcb\xb0hq\
-\x90\x9d\x0a\xa0)Z\xb4>B\xacM\xca\xe0m\xc7\x19\
-6p\xd4\xa8\xc1\xc2\xe1\x88\x86,j\xf0\xb0A\xa4\x85\
-\xdc\xb9?Q\xf4 xuF\xe1\xa3\x88#G$\xfa\
-\xa3\x05d\xc9\x98\x05\x1aI\xf8r\x06\x8e\xcb\x99C+\
-\x04\xe9\x83\xc5a\xd1\x99O\x8fnV\x1a\xb5\xeb\xc5\x10\
-\x9b\xcd\xa8\xa1\xda\xb5d\xd0\x08\x9b\x11\xa9m[r\x07\
-\x89,z\x0bW\x88{\xf8\x5c\x9f\xc6\x93W\x0c\xae\x5c\
-r\x8d\xd8\xcc\x9bGn\x061\xba\xf4\xb5!~\x13\xbf\
-\x1ey3w\xe1%\xbf\xf7\xff\x0e\xe1@|o\x1e\x0a\
-m\x98_\x8b\x82z\xc2\x99\xeb\xc7\x22G\x18>\xfeV\
-\xad\x08\xd1\xdb\xe7:\xdf\xe0\x0c\xde\xfb\xfd\x84\xdfA\xd6\
-\x05\x88\x94Z\x08\xa9g\xa0T\xed%4\xe0\x82?\xe9\
-w\x90\x82\x10\x22\xa5\xddA\x0fVHSq\x02\xf9\xa0\
-!R\x12\x1aT\xe0\x87)]X\xd0\x0c$\xfe\xc4\xe1\
-3\x08\xa6H\xd3s\xf4\xb9\xc8\x15\x8a2nED\x8d\
-8\xda\x97a\x8e\x12\xc1\xc8#P-\x16\xf4\xc3\x8f&\
-QX\x90\x91DJd\x22A>&\xe9do;>\
-i\x10|\x18JIS\x94VJ\x84e\x96\x5cv\x89\
-\xd9\x96^\x86)\xe6\x98d~Hc\x99\xe9\xa1\x09Q\
-\x88\x04-\xa9\xe6\x9b\x15\x81i%\x95\x065I\xe6\x99\
-G\xbey#B\x00z\xd9BB\xf5\x91IgAA\
-\x92\xe9!\x9fj\x16J\xd0\x88ab\x09\x1b\x9a\x87V\
-\x89\xa6\x9d\x04\xf57f\x83\x08\xc9)%\x92\x95\xaa\xb9\
-e\xa0cr\x0a\xa7@\x9a\x96)\xea\xa8[\x96\x87&\
-\x9b\x05=:jA\xac\xbe\xfc\xfa\x0c\xa3]\x9e*P\
-3\xb4f\xd9\xe7@\xb8\x96\xb9\x22\x9c\x7f\x8e\x96\xab\x95\
-\x8a\x16\xd4\x8cwc\x0e\x09Q\x0f\xbb\x0eW\xeaI!\
-(\xabP\x07\xbf\xa2\x16\x82w\x0e0\xc0U\xb4\xc0)\
-\xd7\x82\xaa\x03!+U\x08\x91*d\xc4\xa0\xa2\xad8\
-lM\xe5rf[\x08u%\xe4&R\xdcJ\xe4@\
-\xb0\x98\xe50oA\xe8\xd2k\xebA\xa0n\xcb\xc2\xbe\
-\x06UkS\xb1\xf22`0JU\x81\x1b\xd1\xbfH\
-\xe1KQ\x07\x0a\x03\x85B\x0e\x96F4\xc3\xc2*\xa2\
-\xf4[\x0e\xcf\x0e\x84\x02\x0bF\x10\xac\x90\x0f\x1c#\xb5\
-'J\xcdt0R\x00\xcf8\x84BT9\xc0,\x90\
-\xc9\x10\xcd\x86Z\xc0\xcd\xd9\xd0\xafdr\xb9\xa7\xdc\x0c\
-<\xa7\x0bqf<4+\x1a\x00G\xa3\x09\x00\x0eB\
-K\xe6\x83a\xf1\x85\xd0B\xbbc\xd9P\xb4y#\xf0\
- \xadT?\xf0\xf0s\x80\xf0amQ36\xd4\x90\
-\x83\xd2\x15\xca\xd5\x02\x0e6@|(\x115\x84\x8c\xe3\
-Qv\x8f\x15\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00\x12\x00g\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x13\x22\x1c\x01\xa0 \x0a\x85\x10#J\x9c\
-H1b\x08\x00\x01\xb8\xf4h\xd6\x0cb\x87g\x01X\
-4\xacH\xb2\xa4\xc9\x82!Xp\xe9\xd0\xf1$\xc7\x1e\
-\x01F\x9c\x9cI3a\xcb\x9a\xcf8r\xec\xc0 \x07\
-\xce\x9f\x14Y\xf4\x00ZP\xa7N\x07\x5cX\x84 \xca\
-T\xe0\xd2\xa6E\x8d\x1au\x10\xe0)T\x9a\x0c\x1c\x5c\
-%(\xb5+U\xab[)\x1a\x09\x1b\xb5\xab\xd4\xafd\
-#\xb6H\xcb\xd5\xac[\xb4l\xe3\xdatK\xb7\x99\x03\
-\x9frC\x8c\x9d\xe9\xe3Y\x0d\x91\x0d\x1f\x12l\x88#\
-g\xdd\xc3\xcd\x18\xc4\x1d\xf1\xb1\xe4\x8f\x1a\x00\xc0ND\
-\xc1\x02\xc7\x0c\xc4f{\x08\xde\x1a\xe0f\xc5\xcd5s\
-\xf0\xf0\x81y*\xde\xa6!6\x90\xac\x01\x9a\xe9\x88\x1a\
-\xa4K'\x86:\x94\xe2Z\xb6!j\x5c.\xddC\xf2\
-\xcc\x11Z\xe5\x96\xcc\xbd\x1bq\x07\xdf%\x01\x04\x17n\
-\x928\xe6\xde5=+l\xcd|`\x08\x1c\xcf\x91K\
-\x04.\xf1tu\x84,\x8a\xd3\xff\xadM\x92;D\x1b\
-\xd4\xbf\x1b\x1c\xf1\x03\xf1^\x8a!\x96'\xac\xa1~\xe2\
-u\xf7\x15\xc9#\x9cQ\x9fd\x0b\xfc\x12\xf1\x00\xd1\x0c\
-2\xf5WQ\x0e\x88\xb1\x10\x91w\x07\x11h`I,\
-\x1c\xe6\x80v\x02\xa1 \x9fA\xfc=hR\x84u\x8d\
-\x84\x90j\x099\xa8\xa1I\xff\xd1\xa5 x\x10y8\
-bI\xd8\xb9\x95\x9eD\xb7\xadxR\x8bR\x09h\x12\
-\x112\xd6D#G\x85-\xa4\x90\x0f\x14\xe68Q\x0b\
-\xed\xd9\xa0byB\xc6\xf5b\x92\xcc\xf5\xc8d}K\
->)\xe5\x948\xc5\x97\x10\x83T\x12u\xe2A}e\
-y\x15\x8e(z\x89\x9a\x98\xcc\xc5h\x90\x8dd\x12e\
-\x03B\xcdD\x99&I\x14\xfe\xf0&QX\x0ed\xe6\
-\x9c4\xa1Y\x94\x9bxN\xa4\x1fA\x19\xf6I\x13\x85\
-k\x0aJ\xd3\x91\x04\xd1g\xe8U\x88.\x8aS3A\
-:jR\x97\x92\x96t\xe1@`V\x0a\xd4\x9d\x9aF\
-T`\xa785\x0a\xea\xa8\xa4\xe2\xc9i\xa9\x15\x9d\x8a\
-\xea\xaa\xac2)j\xab\x0a\xbd\xff\xfa*\xab\x9f\x1a\xb4\
-%\xacE\xe1Z\x11\xa5\xbaFT\xa8A\xd2\xf5\xaaP\
-\xad\xbd\xaa\xfa\xcc\xad\xbd\x12K\x90\x9e\xc26\xeblZ\
-\x8a6\xab\xec@\x8d={\xe5\xb3\xc6f*\xec\x92m\
->\xfb\xeb\x99\xcf\x22K\xd0\xa5\xb8\x86\x10\xa8\xad\xcfF\
-k\xd0q\xce\x9a\x9b\x10\xb3\xba:\x09\xec\xb4\xadF\xf9\
-\xa7\xae\xf0\x12d\xec\xaa\xee&\xc4'\xa9u\x12\x14i\
-\xa9\xdf\x1a\xf4^\xaf(\x9c\x0bn\xb3\xeaZk\x90\x9c\
-\xb1:,qA\xe2N\xecWD\x014+/B\x07\
-[,\x10t\x1e\xeb\x9b\xac\xc2\x1f\xd2+\xb1b!S\
-[q\xa9\x1bCT\x15\xac\xf9&\xa4\xd5\xbf\x8b\xae\xac\
-P\x0f-\xd0\xfc\xac\xceo6L\x92\x03\x1b0\x10\xc0\
-i(<\x05@C\x00\xf0\xac!\x0a\x05_\xe5\xc0\xbe\
-L\xe6@2T\xb32\x19B\xccDiK&\x0a<\
-L\xfd\x13\xb9b\xe6\xc6k\xc8,@\x9c\xf23)i\
-=#\xa8K\xe1`6I>(\x8d\xa7\x80\xc1\x16\xf5\
-\x03\x0f\x03\x93Z+\x00&\x87\x02\x15\x10\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,\x12\x00\x12\x00r\x00r\x00\x00\x08\
-\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\x1e\x0c\x01\xc0\
-`\x08\x85\x10#J\x9cH\xb1b\xc2\x16\x0c6\xf4\x98\
-\xb8\x81A\x0e\x14\x16C\x8a\x1c9\x91\xc1F\x92\x02;\
-\x18a\x01\x12\xa5\xcb\x97\x10O\xc2$\xd8L\xe5\x88\x99\
-8G\x86\x08\xd0!g\xc2f\x1b|\x0a\x858\xc2H\
-\xb3\xa1\x12[\x22\x15\x0a`\xc3\xd1\xa5\x11\x9b\x19\xb9\x09\
-\x15\xe6\x88\xa0U)6c\x90\x95$\x0a\xa3]C\xe6\
-\x08[\xb1\x85\x03\xb2\x227(E{\x10\x05\xd6\x913\
-\x9e\xf1\xa81\xf6Y\xc3g-\xc7\xd6\xe0\xf1\x03e\x00\
-\xb6\x07s\x9c\x15\xc9\x83e\xc8\x109\xf8\x8a\xec@\x15\
-\xf03#!\x89\xe4D,\xd9\x22\x0b\xc7\x16}\xb4x\
-8\x14\x05\x8f\xb8\x98#\xae\x8dh\xa3nV\x16}C\
-\xbf\xb4q\x17m\x0e\x1f\x13e.m\x0c\xd1\x87i\xc7\
-<\x9eBt@[\xe8`\x885T\x0f\x1caC\x22\
-\xef\xce\x12}\xb4\x16.\xb0\x85\xf1\xde/C\xc8F\x88\
-\x833s\x82\xa3\x11:\xb0\x0es\xfaA\xe7\xd7I\xf6\
-\xff\xe0\x8e\x92Gx\x97\x97!\xbeE\x99\xfe<{\xd0\
-\x09!\xa3\x1c\xf1\xdb=\xc9\x11\xf0\x0f6\xbbm1D\
-O\xfb/\xe1\xa7\xd0v#\x99\xf7\x13\x7f\x00&\x04\x1d\
-M\xebQ\xb4 A\xed%\x18Q\x84\x055\xd3\x0cx\
-\x15yG\x10\x0e\x12V\x14\x9cA\x166\xe3@v\x0a\
-}\x88\xd0\x0f\xe4uhQ\x88\x16r8\x11\x89\x03\xcd\
-\x00\xa3\x8a\x08\x85\xe0\xc3Q,\xb2\xf8\xa0A.\x22\x84\
- \x8d\x10\x01\x90c\x8e\x0d\x8aT\x1c\x90\x16\xe56d\
-\x88\xcb\x894#\x92\x09\xdd\xb8$PA*\x84!\x94\
-\x14\xb10\xa5\x85;\xd6\x86\xa5\x91[\xf6\xa8_B\x14\
-~)\x91\x90[\xa6\xd8\x5cB\xa9\x99i\x91\x0d[^\
-I\xd0\x7f\x075\xe9\xa6D9l\xa9\xa1\x9dw\xba$\
-\xe5\x92\xd9\x89Y\x90\x9c}J\xd4B\x9c\x06\xd1\xe9P\
-\xa1\xfd\xe9Y\xd0\x8e\x822*\x11\x11i\x12D\xe8@\
-?Jj\xe5\x96\x11\x1e\xa9\xe9K(li\xa0@\xba\
-\x15T\xd9\xa7\x14\xfd0\xa5\xa7;^\x8ajBJ.\
-\xff9P\x99\xc3\xbd\x9a\xe5\x96|\xda:R\xa8S\x82\
-\xe7iAm\xea\x1a\xd1\x0cS~X\xdf\x86\xc2N\x04\
-\xe7\x92G\x96J\x90\x89\xc9*\x84\xc3\xaa\x10e\x1a\xed\
-\xb3S*z\xadH5l\xb9-Jh.\xa9\xe6@\
-On\x1b\xee\x90\xb9~\x1b\xd1\xb99\x02\x90\xae\xba\x09\
-\xb1\xcb\xa2\xbb\x09\x95{\xad\xbcL\xc2\x1b\x12\xbe\x16\xbe\
-\xabo\x9d\xb8\xfe[\x11\xbf\xcdtI+\xbc!x[\
-\xa2\xc0\x05\xfd\xc9be\xbf\x22\xcb0\xa6\xc4\xe6HU\
-\xc4\x13#4\x02\x0e7\xce@Dc\xa3\x16tl\xc6\
-\x08\xb9J\xb2D]\x9e<R\xa4*\x13\x84\xb1@\x1a\
-\xb6,\x10\xb4\x05\xd9\x9b\xb1\xb5&\xab<\xee31\xcb\
-\xfc\xb2@)\x93|\xb0\x5c2/\x94\x90\xb6E\x0bt\
-\xaaAC'\x9d\xa8\xd3PG\xedX\xceR?3b\
-\xd5\x0a\x15Y4\xcb\xb3J]\xee\xce'\xd3\x8c5\xb0\
-ck\xec\xec\xa0e\xa7=\x90\x8d\x105Mr~ \
-\xba\xadv\xd1!#$7\xc3K\xcf\x0d6vs\x17\
-Cd\xed\xc4!\x04\xab\x90\xcd\x08\x0b\x9e\xd0_}\x13\
-\x14\xb4\xbe\x86\x93\x998\xb9N\xc3\x8d\x90\xd8*7^\
-\x10\xe5'\x87P\xb7A\x8b3\xbc\xa3\xe5E\x13:C\
-\xe7'\xe3\x00\x9amz\x03@\xfa\xe3\xac\xb7\xee\xfa\xeb\
-\xb0C\x19\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-\x12\x00r\x00l\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13\x22\x0ca\x10\x00C\x85\x10#J\x9cH\
-\xb1bA\x14,\x18lx\xd6!b\x8fg\x0cZ\x00\
-\xb0H\xb2\xa4I\x89(\x9e\x19\xe9xR\xe0\x06\x06\xcf\
-\x1e\xb6\x9cI\x13\xe1\x88\x955\x0f\xf6h\x912\xa7O\
-\x93,6\xfeL\xd8!\x80\xcc\xa1H\x0d\xa2\x08\xe0 \
-)\xc4fFF8uzs*\xc5\x0d#\xad\xd6\x0c\
-\x01Sk\xc5\x0dR\xbd\x9a\xcc\xd1TlE\xa8=\xcd\
-\xa2\x14\xaa\xd6\xa2\x83\x16m!\x06h\xf9\x83G\x0d\x82\
-=\xb3\x0a\xe4acF\xcb\x0dG\xe3\x0a\x1c\xc1\xb2d\
-\x8e\xc0(Y\x9ct\x90C\xf0@\x16e+6\xce\x89\
-\x02\xaeE\xa8\x8e\xbbN\x9c\xc1#\xed\xd0\x10-||\
-E<\x95t\xc2\x1f,L\x0f\xcda\xa3\xa2\xe7\xa9(\
->J\xf41\xb9-\x80\xd6\x12\x1d\x84u\x5c\xb0\x19\x0f\
-\xd5^Y\x88\xe6M\xd2\xc6n\xe2\xcf\xee\x12?\x9ep\
-\x86e\xe4\x04\x01\x0c\x87\x08\xbc$\x8a\xc8\xa7_C\x17\
-\x18\x02\x87\xc7\x9f\xd5\x05\xe2\xff\x08O\x5c\xb9Y\xb6\x08\
-\x9bm\xcf\xc9\xa3\xa6\x91\x88\xb5\xd7+d~Pq\xcb\
-\x1c\xea\xe5\x8b\xd5}\xf2\xba~\xb5\x85\x91\x84\x9eA3\
-\xd0\xf7\x9fB\xf6%d^E\xcf\x1dh\x96\x81\x0a\xf9\
-\x97P\x83\x0eN\xe4]B\xb2Qt!B\x1bVH\
-Q\x08?(\xb4 D\x10\x0a\xe4\x03y\x1e^\xe4W\
-B\xda!4`Az\xa5XQ\x82\x07u\x98P\x8c\
-\x06\x8d(#E\xb8!\xd4bA/\x0e4\xdd\x8e\x16\
-\xa1\xb0b\x8d$*\x14\x1f\x91\x0c&\xd5#\x93$\x0d\
-\x99\x13\x8ePRD#E:\x0e\xf4d\x95\x16I9\
-\xd3\x92\x5cRD\xe5@\x01\x0e\xf4c\x98SQI!\
-\x9aZ\xd9\xf8L\x86lzU\xe6\x99D\xc4i\x92\x9b\
-\x03\x1dw%Ak\xda)\x11\x98\x035\xd8\x9e\x8f~\
-\x92\xa4\xda\x93p\x12\x14b\xa1\xc5\xa5'\xd1\xa0\x8c6\
-i\x93@c\x0a\xb4g\xa4I\x22d_\x9f\x02\x9d\x89\
-\xa9E\xcae\xf9\xcc\x91\x9fN\xb4\xa8A\xb8m\xa9e\
-\xa9\x15\xe1\xf9LY\xaa\x0a\xffT'\xab\x13\x89\x9a_\
-\xa2\x03\x89J\xabA\x97>\x93\x9f\x82\xbbJT\xe93\
-\x9e\x02\x1a\xac\x98g\x0e{\xec`&)\xbb\xecI(\
->[\x91\xb3\xd2Vk\xed\xb5\xd8N\xc4\xa9\xb4\xbdf\
-[Q\x0d\xbf\x12\x94\x9f\x97\x02\xe9\xfa,\x0e\xcd\x84+\
-P\xac\xde\x1edC\xba\xe9\xfa\x9a.\xbb\x03\xa9{-\
-\xbc\xf8\xa6\xab\x5c\xb7\xed\x8e\x90/\xbe\xdb\xb6\x1b\xe8\xbf\
-\xf0\x968\x10\xa4\xd7\x12Ap3\xa4\x0a\x8c\x90\x03\x0b\
-\xcf\xba\x97\xc3\x05\xf9\xbbp\xc0\x04\x99K+\x0b\x0b7\
-s\xdc\x99e>\xdbC\xc7\xd3Zk1\xc1\xf4\x22Y\
--\xba\x17\x1f\xd4\xf0@\xd8\x1d\x1b\x02\xc4\x0b\xb7\xe8\xaa\
-\xb5\x1c/\xec\xea\xb07\x7f\xdaA\xc7\xc3\x92\xfb\xcc\xa9\
-\xc1\xe2\xb7\xb0\xd0\x10\xa5\xcch\x08?\xb7\xcc\xa2\xa6\xcb\
-\x82\xdbqu`\x22L+\x0a\x1d7\xd3\xf3c\x8b\x12\
-Am\xa1\x1bdmpA\xd1\xfai\xf4\xc2VS<\
-\x18\xcd\x04\xcfP\xb6\xb4!\x8c\xdc1\xbf\xedr\x91\xb5\
-\xd2\xde\xf2\x90\xb5\xc7j\x17H\x94s\xc7iS|\xf2\
-\xc2?\xbc\xbdl\xdcY\x17\xd87A\x7f/l\xac\xc3\
-R;\xbd\xf8c\x1do-p\x083\x10L\xf4\xe4y\
-\xfe{\x22\xe7\x07\x8d\xe0\x03\xbc6\x18\xeem\x089\xd4\
-\xf05\xe8\xac\xb7\xee\xfa\xeb\xb0\xc7.\xfb\xec\xb4\x83\x1e\
-\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x00\x00\x00\x00\x96\
-\x00\x96\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\
-\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\
-\x8b\x183j\xdc\xc8\xb1\xa3\xc7\x8f C\x8a\x1cI\xb2\
-\xa4\xc9\x93(S\xaa\x5c\xc9\xb2\xa5\xcb\x970c\xca\x9c\
-I\xb3\xa6\xcd\x9b8s\xea\xdc\xc9\xb3\xa7\xcf\x9f@\x83\
-\x0a\x1dJ\xb4\xa8\xd1\xa3H\x93\x1a\x05`\xa1\xe9\x85\xa6\
-M\x95\xf2\x1c\x00\x02\x03\x05\x02\xcd\xb2j\xdd\xaa\x95\x00\
-\x85\x0b)\x04H\x85i\xe1\x82\x07\x04\x5c\xd3\xaa\xe5\x8a\
-\xc0\x83\x08\xb1cM\x02\x00Aa\xad\xdd\xbb\x5c\x1f\x80\
-\x80\x1b\xd7#\x00\x11\x1e\xf0\x0a\x1e\x9c\xf5\x81\x88\xbe\x1b\
-\x05`@K\xb8\xb1`\x02\x17\x00 \xae\xa8\xd8\xb1e\
-\xc2\x086\xf0\x9d\xdcp@\xdd\xcb\xa0\x09c\x90\xccY\
-!\x80\x0d\xa1Sc\x06Q\x1a\xa1\x08\xc6\xaac\xe3}\
-\x10\xa0\xf5@\x01\x9fS'0`\xa0@\x80\x00\x03n\
-\xff\x0e`@\x82\x03\xd5\xa3[3\x80\xed\xd8\x81\x84\x06\
-\xc1%\x06h\x10\x014\x81\xe8\x88Q[\x8e\xd0`\xb3\
-E\x01\xd4/\xb3\xff\x8e\x0b\xe0As\x08\xde\x13\x1b8\
-\xe0\x98\x02\xe9\xa4\x03\x98\xe3uP\xa0$\x80\x06\xc7\x09\
-?xo4>\xe1\x04\x0c\xa8T@~\x82!\x80\x1d\
-Q\xfe\x09v@},\x01\xb0\xde`\x06\x16\x15\x00a\
-\x10\xf0\xc7\x92\x00\x12\x10v\xe0O\x09\xde\xe5\xc0\x86/\
-1\xc0\x1e^\x11\x02\x05\x80|jI`aL\x02$\
-P \x889\x95'X\x03:\x19\xf0\xd8\x8a8\xe5\xb6\
-\xd6\x01\xb5\xedT\x80`\x0f\xf4d\xe3]\x07\xc0x\xd3\
-\x00#\xda\x05\xc1N\x03\xe0U$PH\xe2\x15 N\
-\x00`e\xd7\x93AEi\x17\x02\xe9\xc9\x84\x01\x91F\
-N\x95\xa4Z\x14\xdc4\xe1]\x0c\x12u\xa6]i\xce\
-d\xe5Z\x06 \xd5\xc0]\x08\xe0\xd8\xd2\x9cv%\xa0\
-T\x86J\xcet\xe2\x95v\x0a\x05\x00\x81j\x85\x99\xd2\
-\x02wM\xa9T\x93vI\xc0\xe2]\x8e\xc6\x05\xc1]\
-]\xa64\xe9\x8e\x95.5&W\x0b\xbc\xf4'\x9c\x93\
-\xfdhW\xa6%\x0d\xa9\x96\x03\xa5\xb9\xb8V\xa7\x0d\xa2\
-\xa8U\x9b}\x89\xff\xaa\x16\x02-\xc9\x9a\x16\xaa\xad\x11\
-\xca\x15\xac'\xf1\xa9\x16\x8d\xad\xd9\xcaU\xa4)\x01\x00\
-\xa8m\xce\xe8\xbaU\xa0!\x09\xbbU\x9c\xc8^\xfa\xab\
-J\xbe\xa6E\xeaX\x8c\xaa\xa5'J\xc6\xae\x15\x01\xb2\
-\x03U\xb7\x16\xb3\x1e\xad\x99\x16\xb0\xe0\xe2\xa9\x96\xa2%\
-\xa9k-\xb8\x02\x09\xd0\xe7I\x0cx\x0b\xef@\x9bj\
-\x15\xe4I\x00\xe4\xdb\x0c\xaf\xb6\xa9\xaa\x16\xb9\x1di\xa9\
-\xd5\xb6\xf7:cjZ=\xa2T@\x02\x0e\xecF0\
-b\xf5\xae\x85n\xc2\x9e\xce\x8b1L\xcaf\x85\xf0\xc6\
-.U\xbb\x15\xad \xbf\xb40W%\xbfd.W\xd7\
-\xa6,\xd2\xca[5\xecrJ0k%\xf3\xcc'\xd5\
-\x9c\xd5\xcd8\x97\xa4\xf3\xbf=\xd3\xccf\xd0(\xfd\xcc\
-3\xd1!\x19\x8d\xb4IJ/MR\xd3N\x8b\xe4.\
-\xcbQ\x8f\x84\xe8ZU\x8fd\x9eZ\xdff\x1dR\x9e\
-^\x83\xf43\xb4aw4\xf5V\x17\x97\xad\xd1\xd5\x85\
-\xaa\xdd\xd1\xd6i\x1d\xe06G\xdd\xa68\xf7F'o\
-\x05\xf0\xdd\x13\xbd\xff\xf9.\xdf\x17U\xcc5\xe0\x18\xe9\
-\xc8U\xda\x84G$\xef\xa8\x89W$mZ\x1f7\x0e\
-\xd1\xa7j\xed-\xf9B\xceju\xc0\xc4\x97\x13T\xa5\
-]dw\xeeP\xde\x9as.\xba3\x8b\xaf\xb5\xe4\xe9\
-\x0e\x19N5\xeb\x0c\x09\xae\xd6\xea\xb0+\xd4a\xdc\xa6\
-w.\xe3\xd0\xb5+\xf4%\xd8\xbd't6W\x86\xd6\
-\x9e\xf9V\xb4\x07_\xd0\xf1ZE\x90\xbb\xe4\xccg\x85\
-\xa5\xf2\x04E\x9f\x15\xbb\xd4;\x03\x82`\xc9S\x0f\xc0\
-\xefwE\xae\xbc\x00p\xdb\xe5|\xf6\x02\xbd&\xd8\xf9\
-\xd9\xe36\x18\xfb\xd4_@\x18\xfc\xc1\x8b\xe0\xf7]\xf4\
-\xc3>\xd7\xfd\xe1?\xef\xf6\x00\x1bp\x95\xc6X'\x00\
-\x10\x94o0\x0bb\xdd\x00D\x80\x81\x03\xce\xafxj\
-\x13\x00`\x04H\x18\x03\xf8\xcfi\xb7\x03M\x04 \xe8\
-6\xfe9\xe6\x00\x88k\xdc\xcf\x06\xb3\x80\x96\xddm\x84\
-W2\x80\x09\xf9\x86\xc2\xb8YPyu\x13\x8c\x04\x0a\
-p\xc1\xbb\xb1m-3\xac!\xe0\x06\x059\x030@\
-\x87\x92k\x00o \xa0\x83\xbe\x22\x1a\xf1\x88HL\xa2\
-\x12\x97\xc8\xc4&:\xf1\x89P\x8c\xa2\x14\xa7H\xc5*\
-Z\xf1\x8a\xb6\x09\x08\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-\x14\x00\x12\x00p\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\
-\xb0\xa0\xc1\x83\x08\x13\x1at6@\xa0\x05\x81\x03\x9c)\
-\x9cH\xb1\xa2\xc5\x8b\x18\x0bZ\xb8\xe0\xe1\xd9\x03\x8a\x04\
-<\x5c\xb0\x00@b\xc6\x93(S&\x1c b\xc3\x83\
-f*\x9f\x85\x1c\x09 \xa6\xcd\x9b\x08\x05\xc8\xc4\x89P\
-DM\x9e@3\x9a\x0c\xaa\x10C\x00\xa2H\x13nH\
-jQ'S\xa2?\x9fVl\xe6\xa1\xa1T\x9b\x00.\
- \xb8\x8aq)\xd7\x93\xceDl\xfd\x9aQ\x04Y\x8b\
-\x03\x08\x9cEI\xc1\xe9\xda\x85\x05b\x1e\x90 \xb0\x81\
-\xc0\x00\x00\x04\x048\xca\xc0\x80\x04\x070U^x[\
-\xd0\x99[\x8c\x09 08\x5c\x11@\x80\x06\x0b\x08\xdb\
-t\xe6\xcc@\xc6\x02Q\xb1>s\x90\x11A\xdc\xb3\x94\
-)[\xa6x@\xea\x80\xc8\x18\x0b\x0c\x95\x1a\x9a\xf2g\
-\xc9\x06\x0bD\xb8\x88au\xd2\xd6\xa19\x1f<`\xf7\
--\x03\xda\x99\x89\xe2\x0e=\xa0tA\x03\xc1\xdf\x06\x9e\
-\xf8 9\xce\xe1\xad\x0b\x18\x7f\xb6\x80\xb1\xe4\x01\x09*\
->\xb0>\x19:n\x06\x8ba#\xff|\xad\x90\x80\xf3\
-\x94\xde\xbd\x8bO\x08`6\xf3\xf3B\xd3\xe3^?\x11\
-\x00\xdd\x89\x1el\xa3\x94\xdf\x9a~E\xd4Eu\xc7\x9f\
-~\xfe!d\xc0r\x08\xf5\xb6\xdf\x80\x04\x168\x1e\x82\
-\x07Y\x15\xdf\x80\x0eb\x14\x00\x84\x05\x99\x07\x16\x85\x15\
-\xa6\x86!A\x18L(_\x87')\x88\xd0o\x17q\
-HbF\x00\x0a\x98\xde\x8a)e\xe7\xe2\x8b0\x9e$\
-\xc0t\x07qW\x18\x7f5\xa6\x84\x22B\x14L\xa4b\
-\x8fD\x1d\x95\xd0\x90D\x02\x15$BH&\x09\x94\x91\
-\x0b\x8d\xe8\xa4J\xee\xa5\xc8\xe3\x94)AiP3\xd6\
-]\x89e\x8c\x09A\x10%\x8d_\xa2\xa4e\x86;J\
-Y&Q\x12>\xe3\xe5\x9a'\x91W\x90\x98\x03\xbd\x09\
-'F\xf0\xa9%\x90\x9dwbt_\x84{\xaa\xd9\xe7\
-e\x09\xf5\xc6\xe7\xa0\x8d%t\x9f\xa0\x88\x22\x86\x90\x9e\
-\x8c6j\xd1h9\x06:\x9c\xa4f&\xf4\xa3\x9b\xf3\
-a\x9a\x11|\x94zz\x933U\x16\xd4\xa2\xa86\xc9\
-\x88\xeaSt\x1a\xa4\xe7\xaa\xb0\xf6\xff\xb8ia\xb12\
-\x05_\xad\xb8\xe6\xaa\xeb\x99\xba\xda\xc4k\xaf\xc0\xfa\xd7\
-f\xb0*5HllG\x1e[Q\xa8\xb4*;Q\
-\xab\x05\xe1\xe8,B\xaa\x16T\xed\xb4\x07\x8de\x10\xb4\
-\xd86{\x90\x89\xdd\x12\xf4\xeb]\xe1\x1e\xc4,A:\
-v{m\xb9\xec\xf24k\xbb\x09\x9d\x0a\xefA\xf0\xe9\
-6\xaf\x9c\x04\xc9\x1b\xae3\x1f!4.\xb6\xff\xda\xdb\
-\xae3K\x9a;\xef3\xffr9/\xc1\x09\xad\x1b\xee\
-\xbb\x035\xf3\xaf\xb3\x00hk\x90\xc3\xdd\xea;\xd0\xc4\
-\xcaN\x8c\xf1\xb4\xb7J\x0c\xaf\xb1\x02q\x1b\xae\xc9\x04\
-\x1dp\xeb\xb1\xf8\x16\x04\xf1\xc1\x03\xfd\x09\xb3A\xd2v\
-;\xec\x963'\xd4\xb2\xb3!N\xa4\xb1\xb2\x05'\x14\
-\xc1\xca\xbd\xde\x9c\xf33/\x1f\xad\xb4@D\x0f\xe4\x80\
-\xd1\xc1&\xddc\x0a\x1e\x84d\xd6WW[\xb4\x00\xc9\
-g5\xd0\xcc\xd7_#\xb0A\xba7\xf5|\x11\xb8\xe2\
-\x0d\x00\xf6\xda_? \x02\xd9e\xa1$\xf5[\x12\xb0\
-mw3\x04l\x90B\xd3\x06\x81\x82\xe0\x81\xc5\x83\xde\
--x\xd8\x14l\x00\x82\x05\x88\x93$@\xe2\x22\x5c\xb0\
-A\xd0(\xa1\xbc\x1e\x00\x83Wn\xf9\xd7\xa9\xd6x\xc0\
-\xe5\x9c\xb3m\xd3\xce\x05z\xddy\xe71A\xc0\xb7x\
-\x0dl>\xba\xe5(5\xb3\x00\xd4+\x0a\x00\x81\xea\xab\
-\xdf\x9d\x91\x03hc\xc9@\xdd\xb5{~Q\x00\x5c;\
-)@\x03\x09\xf4\x0e\xf6D\x094\x007\x9c\x000\x00\
-\x01`\xb5G+A\x03\xc0\xf7\xeaX\x03\x10$@\xfb\
-\xe0\x11$6\xafc{\x85\xbf\xfc[\x01\x01\x00!\xf9\
-\x04\x05\x02\x00\xcf\x00,\x1c\x00\x12\x00h\x00r\x00\x00\
-\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x11:[\xc8\
-\xd0Y\xc2\x87\x10#J\x9cH\xb1`\xc3\x8b\x18\x19\x0a\
-H\x01\xc2B\xc5\x8f C\x1e\xccH2\xe3\x06\x82\xcd\
-(\x08t(\xb2\xa5K\x8b%c6d\xf0\x90\x02\x88\
-\x978A\xca\xdc\xc9\xf0\x81D\x0f)r\x0aU\xc8\xb3\
-(\xcb\x89\x08N\x0e\x1dj\xd4h\x80\x90\x18\x00,u\
-\xd9\xb4\xe9\x00\x91\x08.L\x0dY\xb5j\x04\x97Z\xb7\
-J\xec\xdau\xc0\x01\x97\x0f\xae\x8aMH\x96\xac\x00\x08\
-\x0e^\x1e];\xb0m\xc3\x8f\xce\x04\x14x\x16\x17\xa4\
-O\xba\x04\xdb\x0a\x15\xf0\xeck\xc5f\x80\xeb6\xa5\x0b\
-\xe1\xa3R\xbaE\x13\xaf\xe4K\xd1\x83T\xc81%\x1b\
-\xdc;\xf1\xef\xda\xcc\x9a\x0d:kp6\x22\x02\xb5b\
-3\x86~HX\x22\x81\xcb\x9f\x17\xae\x96\xd8@\xa2\xe7\
-\xd9\xb8\x0d\xb6\xce\xcd\x1b\xef\x82\x88\x0f`\xf7\xe6m`\
-\xb8q\x89\x05J'\xe4|<7j\x84\x08v7\x9f\
-\xcd\x1c\xe1\x83\xb9\xd3\xb37\xce\x8e\xbb\xfa\xc1\xa7\xdcg\
-o\xff\xb7\x8e=<`\x00\x86\x11z7\x0f\xf8\xb9A\
-\x04\xc2\xd9\x03^O\xb0\xb8|\xcd\x12X\xdf\x97,\x00\
-1\xc2\xdf\xfb%f\x1fB\xf1\x058\x15\x00\xca\x194\
-\xa0\x81b\xd1'\x10\x01\xe518T_\x079(!\
-N\xb5Yw\xa1X\xfd%$\xdd\x86B\xe5\x87P\x86\
- \x0ee\xe1m%\xe6\x94`A\x1f\xa6\xe8\xd2x.\
-\xd2\xe5^\x8cb\xa5G\xe3\x8d%\xd2\x84\xa3X3\x0e\
-\x04\xe3\x8e \xf9gP\x02@\xb6d#A(\x16I\
-\x91\x88\x06\x09\xa9\xa4P\x05>\xd9\x12xRN\xd4\xa3\
-@TV\x19Q\x84Z~te\x97`\x86)\xe6\x98\
-\xdf\x91\x09R\x96fJ\xd4b\x9al\xe6\xe4d\x9b\xcf\
-$)\xd0\x91l\x02\xf0\xe6@\x00\xc2\xf9\x0c\x9az\x1e\
-\xb4`\x9f\x07\x11I \xa0w\x0aD!\x9c|\xe2\x09\
-\xe8\x9f\x04\xe9\xa8\xa7\x9c\x93\xe9\xf9%\x93p\xfeH\x10\
-\x89p\x22\xe0a\x9f\x16R\xda&\x01\x099\xda\xa6\x85\
-\x0ep9&\xa8\x08Yj\xa6\x85\xcf\xac\x09\xa8@y\
-\x1e\xff\x94\xc2\x05A\xb5\xe9*\x03\x044\xa3kpi\
-\xc6JP\x01\xba\x06\xdb\x0c\xafE\xa2\x8a\xd0\x9a\xfd\x09\
-\x1b,\xb18z\x10R\x03\xca\x0a\xab\x12\x8e\x98Vd\
-@\xb4\xc2bpc\xa2\x13\x01\x8bm\xb0\xd5n8\x80\
-\xa6-%\xf0m\xb0\xac\xde7.D\xae\x0ed\xd6\xb9\
-\xcd\x9cV\x22\xb9\xcbI\xc4\x00\xbc\xf1\xa6\xcb\xdd\xba\x0f\
-\xa9\xaa\x1e\xbe\xcd\x84\x15`\x01\xf4\x22$(E\x0b\x00\
-l\xd9}\xce\x08\x9c\xd0\xa1K\x02\xfc@\xbb\xc3\x01\xe0\
-,D\x07|\xf9\x10z\x00#\xc0m\x80\x19\xb7\x04\x80\
-\x03\x007\x83\x01\xc5\xa1Y,Q\xc8.\xbd[\xf2\x05\
-Q\xaeVpB+\xb6$@\x04%\xc7{\x13n\x22\
-P\xc4rN\x00$\x9c\xb3\xb1\x92\xed<Q\x04(\x87\
-t-\xbc\x06aP\xebVI\x1b$A\xcc81p\
-\xc0\xb7\x09!\x80\x81\xc6\x1f\x19MQ3\xfe\x0e5\x00\
-\xc9\xd1N$\x02\xd7\x07\x01`\xc1\x06DS\xe4\xc0\xc7\
-K\x01`\xae\xb0\x1f!\x86\x01\xad\x8a\xb5f\x81\x08Z\
-\xb5Nm`\x00d\x17\xda\xdc\xdb\xbd\x15@\xb6y\x8c\
-\xe2\x06\x80\x015\x0f\x97xoA\x0b>[\xd4\xbcA\
-\x1c\xda\xe3\xe1\x0d\x00\x97f\x09\x88\xca\xa03\x0c,\xd0\
-\xf8\xab\x91\x1e,R3\x07,P\x00\xd5.:3\x00\
-\x03\x98\x17\x84\xd8\x02\x06\x04\xc0z\x95\xe5\xc1\xcd[@\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x13\x00\x13\x00q\x00\
-q\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\
-*D\xe8\xac\xa1\xb3\x85\x10#J\x9cH\xb1\xa2B\x87\
-\x18\x1bZ\xdc\xc8\xb1\xa3\xc7\x81\x19C:\xfcH\xb2\xa4\
-\xc9g\x22S><\xc9\xb2%D\x950]\xca\x9c\x09\
-\xb3\xe6\xca\x998I\xda\xb4\x99\xb3g\xc7\x9d5}\x0a\
-\xa5\x08\x94\xe7\xd0\xa3\x17\x8b\xc6D\xca\x94\xa1\xd2\x94M\
-\xa3\x1e|\x9aQ\xaa\xd5\x82T5^\xdd*0+W\
-\xaeT\xbf\x82U*v\xeb\xd3\xb2f\x8b\xa2\xbdJv\
-\xadU\xb5n\xa5\x02\x8d\xfbVd\x00\x0a\x02=\x0c\xa0\
-+7c\x01\x83{\xf96\xc5\xc8\xe0 \x01\x00\x82\x07\
-7$\x80\xd0@b\xc5\x0a\x03?>\xea\xec\xc0d\xb1\
-\xce\x1c'lp\xf9(b\x85\x02:\x7f] zh\
-\x82\xd2\x5c-#\x84\x80\xfa*\x82\xd6=\x9d9\x80\xed\
-\x16\xc1g\xda\xb8s\x0f\xfc\x8bP\x82n\x97\x95\x13\xde\
-\xfem\x925B\xde\xc4MJ6\xe8;\xf9\xc9\x08\xc2\
-\x9d\x9b\xe4\x8c\xb0\xb0t\x92\xa1\x1b_\xcfyz\xfbG\
-\xd2\x0c\xbd{\xffD\x0eX\xbcL\xf2\xe6\x8b\xa7\xe7\xd8\
-\xdd`\xfb\xf5\x14\x8d\xbb\x87\xcf\xf2&\xfd\x88\xe8\x09\xda\
-\xbf\xbf0@\xc2\xe5\xfc)\xe4_\x80\x1e\x0dH\xe0\x81\
-M\x0d\x87 Q\x0bn\x94]\x83\x10\xe6d\xe0B\x16\
-\x5c \xc2\x83\x07\xe6g\xd0\x05\x084\xe3a3\x1b,\
-\xa8YB\x10|h\xa2u\x04\x82g\xd0l\x00\x98h\
-\xe2\x03\x07:\x03\xe3A\xa7\x05\xe0\xa2\x89\x18\xd2\xb7\x1f\
-A\x8e\xd9x\xa3\x87\x1a\xa67aA\x7f\xb5\xf8c3\
-\xcd\xf1G\xddA\x81Epd3\x04&Y\x10\x94\x02\
-\x95x$\x8a\xf0)HP{\x0c<\xa9\x22|X\x16\
-\xb4\xa4\x91?2v\xdf\x97\x05-\xe7\xe4\x91\x00\x8a\xa7\
-\xe5@\xb3\x11\xd4\xc0\x93#\xa6\xb7\xa4A\xf2\x09$\xc0\
-\x93f\xae\xd7\xa7AC>\xb3\xe6\x8fA:\x17&A\
-q\x8a\xc9\xe7\x9b\xce\xcdx\xd0\x9d\x03\x91\xf9c\x9d\xfc\
-5\xc3\xe8\x02O\xdav \x9a\x04\xedI\xa7w\x90\xa6\
-\xa9P\x02\x992\x8a[\x8e\x15\xf9x$\xa5\xbf\xe1\xe5\
-\x11\xa9.\x0e\xff\xd4L\xa0\xb8\x85j\xd1\x00&\x1a\x84\
-@\x9b\xb0\x09\xf0\x1aB\xaaE\x84)\x95\xde\x01\xe0\xe8\
-A\xac\x0aw\x00\xb1\x06y\xa0\x1b\x06\x0aE\xb0\xa3B\
-s*\x94lg\xb6\x12\xc4\xebB\xef\x1dThb\x05\
-0k\xd0\xb5\x0b\x01\x10\xecA\xbb^'-G].\
-\xf4-j\x07l+Q\x9e\x075sAr\xefF\x04\
-\xddB\xd0>&.\x9e%\x01\xb0\xafB\xc7\xb6\x96\xc0\
-\xb4\x1b\x99\x0b\x11\x01\xf2^\xd5o\xb4\xa6n4\xc0\xb9\
-\x09\x89\x80V\x00\x7fF\xd7\xd2\xc4\x11Q\xd0\xf0Q!\
-^\x16rT\xce\x88\x90\xb1T\x11\x1bd1Sw\xad\
-50D0\xa6\x5c\x923)\xb8\xea\x16\xa7\x0bm\x80\
-\xaaI\x00\x80p\xf2Z\xf9\x1aD\x81\x08\x08s\xe4l\
-E8\x0f\xf5\xf2D0\xa6 \xb3A\x02X\x5c\xb0D\
-\x07\x1c\xca\x14\xb9\x11\x11\x80\xc1\xbd+\xef\x05\x80\x05\x02\
-\x89pA\x88\xbf\xb2'\x96\x00\xdd\xaeu@\xb6VY\
-\xcdU3\x0b\xec,\xd6\xbfV%\xf01W\x02H)\
-U\x02\xb4\xf24\x855Np\xdfMW\x01\xa4\x0a\xe5\
-@\x03O'&\x00\x04\x0e\xd0M\xd2\xd2\xc9\x09P\xc0\
-\x02\x90[\x94\x00\xbd\xe6\x01\xc0\x00\x04\xa7%\x9a\x10t\
-\x10pV4\x7f\x89_\x15\x10\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x12\x00(\x00r\x00\x5c\x00\x00\x08\xff\x00\x9d\
-\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\
-\x10#J\x9cH\xb1\xa2\xc5\x8b\x183j\xdc\xc8\xb1\xa3\
-\xc7\x8f C\x8a\x1cI\xb2\xa4\xc9\x93(S\xaa\x5c\xc9\
-\xb2\xa5\xcb\x970c\xca\x9cI\xb3\xa6\xcd\x9b8s\xea\
-\xdc\xc9\xb3\xa7\xcf\x9f@\x83\x0a\x1dJ\xb4\xa8\xd1\xa3E\
-\x01X\x00\x91\x02\x00R\x92\x0c\x104\x9b\xda\x8c\x82\xd3\
-\xa7\x1f\x05H\xa5:\x95\x00\xd6\x8f\x0d\xb8r-\xf0\xb5\
-c\x02\xb1T\x0d\x94\xe5\xf8\x00\xedT\xb5k5\xba}\
-\x1bW\xee\x5c\xb2u/\x02\x98\xdb,@\xde\x8b\x01\xf8\
-\xfa\xfd[1\xf0\x5c\x01\x84\x0b\xf3M\xac\xf80\xe3\x89\
-\x86\xdd\x0e~\x0c12\xda\xc9\x94\x0b\x82h\xdb\xec\x01\
-\x85\x0d\x17\x04X\x16\x8b9\xb3@\x03s\x03\x0c\x10l\
-\x9a\xa0\x00\xbe\x88\xf96h=\xb0\xc0bg|\xe1\xd2\
-\x860\xd7\x81\xc0\xb3n!\xd0\xfe=7\x01q\xb7\xc6\
-\x87\xe7\x16\xc8{\xee\xf0\xd7w\x05\xdaNM\x9b\x01k\
-g\xab\xe7\xcen\xdd\xdc-A\xbe\x12hs\xffF\x1b\
-\x81 p\xb7W)Cw\xbb\x80 \xea\xb9\x0cLO\
-w\x1b\x7f`v\xf6\xa6%\xf0M/\xd0\xc1\x5c\x04\xfc\
-\x11\xb6\xd7\x5c\xe5\x15\xd4\x1dZx1\x16\xd6\x5c\xba\xd9\
-\xc7\x97W\x8f\x11\xc0\xd7\x00\x07\x1d\xc0W}\x84\x8d\xc6\
-U\x81\x06\xbd\xe7\x16\x05\x8cQ \x1bB\x03\xc2\x97!\
-_\xcd\x04H\xd0\x02\x0f\x12&\xe2\x5c\xed%t\x9f[\
-\xdb\xc5\xa5!W\xa5\x19t\x1eZ\x00\xc6\x05\x80\x84\xc5\
-1t#U\x1e\xc4u\xe0e\x0d\xb18\xe2WCN\
-\x95\x1cC\x02X\xf8\x1fbO\xfd\x88b\x8e\x09y\xe8\
-\xd6\x03Xy\x80bx\x0f\x01\xe0\x1f_\x18 \xa5%\
-Z\x07\xa8\xb8P\x93S\xd58\xd4|\xd1It$Z\
-\x18\x06\xc5f3OJ\x14\x01\x8a\x08P\x18\xd4\x00[\
-\xcdu\x00\x95\x13\xcd\xe8V\x9f@\x01\x8ab3uN\
-\x04\xe7\xa1~\xf2T@\xa0\x0cf\xa4$_\x084z\
-\x13\x08\x8b6\x03fF\xfa-z\x81N\x18t\x1a\x81\
-\x9a\x14\x01\xb0\xe7\xa2\x1e\xa0\xea\xd2\x00\xe3\xf1\xf6uj\
-GQv\xfa\x00\x96-]\xd0i3\x07D\xca\xd1\x00\
-R.\xba\x81\xab'\xc1\xbak\xaf!\x01\xbb+\x01\xb8\
-\x9a\xa4\xeb\xb1\xbe~\xa4\xec\xae\x144\x1b\x92\x08\xb1\xa2\
-\x18\x01\xa1\x22\xa9\xba\xebT\xd5\x96\x04\x00\x08@\xee*\
-\x01\xb1\x1d\x01\x10\xea\xb7\x04\x80\x80nE\x02\x5c@i\
-\xa71\xa6t\xe6\xae\x1e\x88\xc0\xadE\x00\xa4P\xea\xb7\
-S\x1d\x90\xa0J\x0c\x04\x0bpg\x1b\xa4\xb0oC\xfd\
-n\x90\xed\xb7\x09,\x9c\x92\x00;\x1eL\xd5g\x17\x88\
-`\xc1\xc6Nm\xbc\xd4\x05\x17x\xf00\xc0\x07\xb8\xf9\
-R\x03\x06[\xac\xf2\xca\x11\xd7\xa4\xee\xca0\x1f,p\
-N\x01T\x1c\xf3\xcd\x5c-\xf0.L5\xe3\xec\xf3\x01\
-\x0bHL\xf3\xa5>\x1f\xec\x80\x01;\xdf\x04@\x03c\
-\x16\xbd\xa8\x03\x03\x1b5\x80\x01\xab:\xbd!\x04\xd6&\
-U\xc0\x02U\xc7\xec\x00\x04\x0c$\xfdT\x00\x05\x18\x90\
-@\xd7\xc5%\x90\x80\x01\x05\x08M\xdb\x00\x01\xc4\x1dw\
-\xb41\x05\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-2\x00r\x00R\x00\x00\x08\xff\x00\x9f\x09\x1c\x08@\xc4\
-\x83\x07\x18\x02\x0c\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\
-\xb1bC\x0f\xcd2f\xf4\x00\xc0\xa2\xc7\x8f C\x8a\
-l\xa0\xb1\xa4\x07\x91(S\xaa\x0c\x89\xa0d\xc9\x01+\
-c\xca\x9c\xf9\xac\x80\xcb\x92\x0ai\xea\xdciQ\xc2M\
-\x8d\x02x\x0a\x1d\xda\x10\xc0\xcf\x8c\x0e\x88*%J\xf2\
-(\x84\xa5Pw>8\xda\x8cA\xd4\xab1\x8d\x1e=\
-\x80\xb5kJ\x9bG\x17x\x1d\x0br\x01U\xabd\xd3\
-R$\xb0U\xad\xdb\x88\x02\xa8JxK\xb7!\x83\x8c\
-\x0b5\x16\xa8\xcbW\xa0\x81f\x0d3v\xec[w\xae\
-\xc3\xa4\x84\xeb>x\x98 q]\xc0\x0e\x0d;V\x1b\
-t\xf2\xe4\x9c\x0e\x0dXV\x8by\xb3\xe7\xcfn\xd1:\
-\x1c\x0c\x1a\xab\xe6\xd2u\x1b@t\x86\xba.\xcc\xd6\xb0\
-cOtF\xbbv\xed\x88\xa2e\xab\xb4\xcd\xdbYg\
-\x86\xa7u\xa7\xec\xcd\xbbrf\xe1\xbb\x89\xd3\x96(\x16\
-9J\xe5\xcb#6v.\x12:\xebg\x92\x19.\xa6\
-\x1e\xd2\xba_\x88\xc6\xb9W\xff\xb4~=\xe2^\xf1\x16\
-\xc9\x0b\x0c\xcf0;z\x89\xde\x07\x22\x0e\xfc~<\xf4\
-\x85\xcd\x1d\xe6\xae\xefP\xfd\xc0\xf3\x0e\xe5\xc7_\x7f\xf1\
-\xad\x07\x11\x02\x03\xaeV\xa0@\x11<\xd4\xcck\x09.\
-\xe4\xdfB\x006\xf4T\x84\x12.(\x10i\x0d!\xc0\
-a\x84\x13.\xe4\x1e\x85\x18\x0a\x14\x22\x89\x0f\x11P\xe2\
-3'.\xc4\xd5C\x15\xf2G^y\x0d\x05\xb7\x22C\
--.\x04\xc0\x8b7\x0e4#s=\xfa\x98#C\xec\
-1$\xa0x?\xaa\xf4\x9bsI\xae\xf4\xa1p3\xd2\
-\x98\xd2I\xdc5\x19\x93jLZI\xd1~v!\x17\
-eH#.\x84\x00\x84\xb0}\x19\xd2\x8e2\x9a\x19\xd2\
-\x92Yj\x09\xd2\x85\xdc\x15tA\x0a\x00\xdc\xb7R\x83\
-\x12\xb1I\x18\x03\x08\x0a\xf4@\x9d\xbd\xc9\x04\x00\x9e\x11\
-\x81`\xd9\x93\xcf\x10\x00\xa8m3\x0d\xc0#z\x10\xf0\
-\xa6\x13\x99\x07\x12fhD\x8c\xeet\x17E\x18\xd0%\
-\x00\x95\x11\x05\x10\x1dOzvx\xe9X\x1d\xf5)Q\
-\x9d|\x11 \x82W \xa8\xa0*Q\xa4P\x0d0\xdf\
-D\xaeB\xe5\xcc\xab\x16% \xa5R\xd3U\x84\xc0\x06\
-\x946\xda\xa9Gpz\xf6\xc0\xa9+\x09\x00\x82\x8a\x1f\
-qyU\xa9\x12\x11\xd0)\xa2\x12\x0d\x00\x02\x06\xd0\xc6\
-\x06@\x98\x16\xa9j\xc1B\xc6\xa5\xf0\xcc\x06\x14\xc8\xfa\
-Q36\xba\x15\xc0\xad\x899@\xedX\xce\x18\xf0h\
-\x90)\x09p\xa4Z\x07\xb4;\x99\xbe\xf7v\x05\x18\xb6\
-\x93\x01`\xefX\x10\x14Y\x9a3\x0c\x80\xbb\xd3\x02\xd2\
-\xca\x06\x00\x96B\x15@\xb0s\x0c$+\xd2\x01\x09\x18\
- j\x8f\x1d5\xf0\x14\xbc\x0e5\x08A\x03\x03\xfc\x8a\
-\xaf\x8e\x0c\x05P\xac[\x01\x01\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x12\x00'\x00`\x00]\x00\x00\x08\xff\x00\x9f\
-\x09\x1cHp\xe0\x00\x0a\xcd\x10`\x00P\xb0\xa1\xc3\x87\
-\x10#J\x9cH\xf1a\x81f\x181\x22\x18P\xb1\xa3\
-\xc7\x8f \x1d\x0e\xc8H\x12\x81\x80\x90(S\xaa$\xf8\
-\x80$I\x08+c\xca\xa4\x08\xc1%\xc9\x043s\xea\
-\x1c\x18\xc0\xe6\xcd\x9d@c\x02 \xe03c\x80\xa0H\
-Q\x1a(\x8a\x11g\xd2\xa7\x1d\x05 `z\xe0$\xd4\
-\xab\x12\x170m\xd6\x00\xab\xd7\x87#\x99J\xf8J\xb6\
- \xc2\xa2\x07\x18\x96-;\xb2 \xc9\xaek\xcb.p\
-\x88\xd1A\xdc\xb2\x00\x9a=l\xc6\xe0.Y\x03\x10\x9d\
-\xfa\xf5J\x00b\xdf\xc1X\x8f\x22F\x0c\xf3!\xdc\xc5\
-P\x0b;L\x0b\x19*\xc7\x87s+?\x05\xfc\xf0\xb0\
-f\xa4\x82\x1b\xaa\xfd\x1cT\xaf\xc3\xb1\xa4\x83^v\xf8\
-8\xb5\xce\x02\x10\x15\xbb\xd6\xd9\xd8\xa1\xb3\xd9;C\x13\
-\x8c\x80\xdbk\xed\xde\x9b\x81\xcf\xbc\xedX\xb8\xcc\xd5\x0d\
-e\x1b_\xce\xbcyL\xe5\x05\xa1;\xef(\x9d\xe7\xf4\
-\x90\xd5\x05\x8e\xbe.s;\xf7\xefd\xad:\xff\xcc\x0e\
-\xde6D\xd8\xe5)\x12O\xafR\xf7\xc0\xdf\xec\xe3\x07\
-\x85?\xd0\xb4\xfc\xf3\xf7\xb1\x1b\xce\xffp}C\xfa\xfc\
-\x09\xc4\x9bC\x0f\x04\xf8\x91x\x06N\x84^\x82\xdaA\
-\x84\x1a\x83\x13yg g\xacA(\x10r\x05\x11\xe0\
-_\x82v=D\xde}\xad\x99e\xa1@\xf6%7b\
-f\x0eQ0bO\xb1\x8d\xe8\xde@\x92A\xf8!\x80\
-\xfc\xbd8\x22O%f8\xe2\x8376$\xc0\x01\x11\
-Q\x98`\x88=\x12dc\x8f\x08\x16I\xd0\x82J~\
-\xe4\x19p\xceD\x19\xa5G<\xd2\x05\x82pRf\xb9\
-\x13\x06\xb8e\xe9\xe5\x861=\x90$d_z\x19\xd4\
-\x05\x9f\x95i\xa6G\x03\x009\xd1\x03\x18\xc6\xa5f\x99\
-\x1f\xc5\xb9\xd7\x05\x12z5\xa7\x9a!\x0d8\xdb\x9et\
-\x86\x04\xc0\x91\x0e\xe1\x89\x15\xa0\x81\xa2\xe4\x0c\x8a\x15a\
-0\xe6p\x88&\xaa\x12\x93\x15Q BN\x91\xce\x99\
-\xd3\x00\x84J$\xc2\xa3\x12e\x0a\xe8N\xce4\xe0f\
-H\x85y\xf0\xcc\x05W>3\x80\xa8\xb0\x82U\x99\x93\
-\x00\x9d\x86\xf4\x00\x03\xb1\x8e\x0a\xd5\x9395\x90\xab\xa4\
-P\xe5\xb9\x12\x02\xbf\xaeY\x16\x8d(\xbdZ,b\x05\
-t\xb8R\x00\xbf~V\xabD\xcaf:\x9b\x00\x06L\
-\xdb\xd0\x01\xa2\x1a\xe7L\x00\xd9vd\x80\xae\xd7\xddf\
-\x80\x01\x12$\xe0\xde\x01\xe3\x02{\xdf\x94\xcf\x08 %\
-T\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x1e\
-\x00>\x00f\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0A\
-g\x02@\x80\x10p\xb0\xa1\xc3\x87\x10#^hF\xb1\
-\x19\x88\x88\x183j\x04\xf0\xa0bE\x08\x1aC\x8a$\
-\xc8\xd1\xa3\xc7\x01#Sb\x1c\xd0\xd1dE\x09*c\
-6\x1c\x80\xc0\xa5\xc7\x072s\x0e\x14P\xd3f\xc5\x05\
-:s\x96\xf4Y1@\xd0\x98C\x896+p4&\
-\x05\xa5\x14\x996Mi\x00\xea\xd2\xa9)\x03@=`\
-\x14\xabH\x00=}\x1e@\xe9U\xe4S\xa5R\xcbj\
-l\x005\xadZ\x8c`\x956x\x1br\x81R\x98t\
-3j%\xea\x00@\xde\x8cg}v\xfd\x0b\x91\x81R\
-\x03\x841\x06v\xd971\xc4\xbd>\x198\x86(\x81\
-h\x82\xc9\x0f\x05(%\x8b\xf9 \x04\xcb\x9d\x1d\x12 \
-:84\xc1\x01D#\x98\xf6L\xd4\xedj\x81\xa3}\
-\xfa}\xbd\x93(^\xda\x02\x0b\xb4\xc6=\xd0\xael\xde\
-\x02[\xba\xbc\x0c\x1c\x00Q\x90\xc0!\xbb\x94\x0c\xbc\xea\
-\xef\xe6>\x1d\x00\x17\x98\xc0'q\xe0\xc2M\x02\x9dN\
-\x141\xf7\xc8\xd3\x9d\x91\xe9\x9e\x8eZ\xf0t\xe5&K\
-\xd3F\x7f\xf2<\xd1\xf0\xec+r\xc6\x1d\x9f\xa2\xfa\xd7\
-\xe5m\xde\x7f=\xfe\xbbM\xd7\xb4u\x17^\x04>\xdd\
-\xc6[e6\xe14\x9ds6\x85\xa7\x9bO\xf3\xadG\
-\xd4\x5c\xfe\x0d\x17\x1e\x82\x0dN\xc7\x16x\xc0\xe5\xe7\xd2\
-v\xc0\x1d@\xd4l\xbc\xf9\xf6\x9f{>)\x08\x9c\x03\
-\xfd\xf1\xc6\xa0K\x14L\xa7Y\x8b\xb8a\x08#\x8a>\
-Q\xc8[u>!@\xa2\x84Dy0\x1d\x8f\x1c\xe2\
-6c\x8f\x0c\xb9\xa8\xd4\x03?\xae\x06\x00\x8bDa\x90\
-\x5c[\xc0\x99\xe8\x13\x80\xa1\x01@ Z\xbc\x0d \x22\
-Q\x08\xec\xd7\xd9\x83\x5c\xe2f\xa5O\x17\xe1\xb6\xa5R\
-R\xd2\xa6\xa5Um\xbe\xf6&T\xcc\xc9\xf9%Q \
-\xe2\xb7\xa6My\xca\xb9\xa7IX\x9a\x06\x80\x8d\x15I\
-\x17\x9e3g\x8eu\xa8@\x0c@\x99@\x84\x87\x0a\xd0\
-\xe4\xa2\x94Vj\xe9\xa5\x98f\xaa\xe9\xa6\x9cv\xdai\
-@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x18\x00&\
-\x00a\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x04\
--\x00@\xc8\xb0\xa1A\x00\x18\x104k\xe6a\xa1\xc3\
-\x8b\x06\x19H\x9c8\xf1\x01\xc6\x8f\xce\x04x\xe0H\xb2\
-\x19\x04\x90\x0eAl,9\x11\x01J\x84\x02(\xb0d\
-\x19\xe0eA\x953i\xda\x1c\x88!'\xcb\x03\x16_\
-B\xf4\xc9\x92\xc1N\x00\x0f\x88\x92t0\xe0hR\xa5\
-\x13!\x04E\x89\x14j\xb3\x08Mw\x0eXI\xd4\xc0\
-N\x81\x02\xb8\xe6\xc4\xfaU\xe0S\xa2\x0b\xca\x0a\x84\x00\
-\xb5\x81Zg\x0c\xa0\x16x\x1bV\xe9\xdc\xb7gg\x1e\
-0\xfa\x96\xad\xcf\x03Y\xd5\xc6%z\xf7-\x01\xb4o\
-\x05\x16 \x1aaj\xd9\xc39\x01'v\xb6\xd8ga\
-\xb5\x00\xc4\x92L;\xd9\xc0_\xc7_3\xfb\xf4\xda\xf9\
-\xf3dg\x9a9\x92N<X/\xe8\xaf\x0bF\x9fF\
-\x1d\xf9\xf5\xce\xd6,O\x9e\x8e\x9d3p\xe2\xd4\xcd\x1c\
-\xcc\x1e\xe0S\xf7d\xbf3k\x9e\x86\xfcs6\x00\x9f\
-\x9c'\x07\xf0\xc9w2\xee\x92\xb6wz\xce9\xdb\x19\
-o\x96\x09\xba'\x8f\xc8)\xa1;\xf0\xd5\x93-\xcf\x9e\
-\x9eS\xb9t\x9f\xd9m\xb2\x9f\xe9\xfb\xed|\x9d\xa7\xef\
-\x97t\x9fX\x80O\xfe\x89\xfd\xd7\x9d\x80\xb3\x11x\x9a\
-On\xcdv@N\xd1M6\xdeL\x1e\xcd\xb6\xddL\
-\xdd]G\x12\x80j\xf9\x97S\x82\xa79\xc0`w\x12\
-\xe4D@w\x13\xb2\xd4\x9d~$\xd5\x87\x99O*\xaa\
-\x15bs\xdd\x11W\x92d\xdd\xc1\xb5\xe0D\x0b\x08P\
-#A\x03`\xb8\xe3\x8f@\x06)\xe4\x90D\x16i\xe4\
-\x91H&\xa9\xe4\x92L6\xe9\xe4\x93PF)\xe5\x94\
-TV\x89R@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00\x15\x00.\x00J\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x05\x0a\x00\x81a\x83\x88\x84\x10#&L\
-\xe1\xa1\x99E\x8b\x18$j\x84\x08\x00\x04\x81\x8b \x9b\
-\x15\xd8Hr\xa0\x00\x0c!S\x12(\xb9\x11\xc0\x85\x94\
-0\x9b\x01`\x19\x11\x04\x82\x980\x03\xd0D\x18\xe0#\
-N\x98\x02v\x1a\xdc\xf03f\x04\xa1\x04\x05<(\x0a\
-3\xc2L\xa4\xce\x0a\xdcd\x0a2\xc2H\xa8\x00PR\
-\xb5x`\xc1\x00\xa8\x02\x01,\xdd\xea\xa0\xc0S\xb0b\
-\xb7\x1e\xb8\x0a6\xec\xd8\xa2\x07\x0c\x9cm\x9b\x96\xa9\x84\
-\xa0m\x07\xd6\xfd\xb96/\xc1\xbd8#|\xf5;\xb0\
-bQ\x08\x84\x09B`\xca6q\x01\xc6\x89\x07\x0e\x98\
-\x8a\xb31a\x00>+G\x1eh\xa0(\x83\xcd\x02\x07\
-\x14m\x00Z\xe0[\x98\x0bJ;k\xf0\xd3ii\x01\
-\x94S\x1e\x98\x1by\xc1O\xcb\x89\x05\xfcL\xa0\xda\xd9\
-\xe2\x98\x07\xf0\x82\x06\x10;\xa4\x81\xde\x9dc:\xe8M\
-\x5c\xb3\xea\xc7\xca{;\x93\x80\x93\xb4j\x008g\xf7\
-\x86\x0e\xf3xo\xea1\x85\x0fG\x0f,\x9d\x01N\xef\
-\xaa\x93\xc3\x1c\x9c>z\xf9\x98\xd6\xa5G\x90M\xbb4\
-\x00\x03\x07.\x1e`/}`\x80\x06\x01\xd4\xd7\xdf\x80\
-\x04\x16h\xe0\x81\x08&\xa8\xe0\x82\x0c6\xe8\xe0\x83\x10\
-F(\xe1\x84\x14Vh\xe1\x85\x18f\xa8\xe1\x86\x17\x06\
-\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x14\x00\x13\x002\
-\x000\x00\x00\x08\xf6\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\
-\x11Z\x00aA@\xc2\x87\x10#\x0e\x00\xe1\xa1\x99\xc5\
-f\x08\x0aD\xdc\x18\x11\x80\x08\x0c\x04.\x8a\xb4\x18\x80\
-\xa3\xc9\x82\x22\x1e\x8c\x5ciq\xc1I\x93\x00@\x84d\
-\xc9\x12\xc1\xcb\x8e\x17\x10\xd0\xdc\xd9\xecfB\x01\x18x\
-\x0a\xf5y\xf0\x82P\xa1\x12\x88\x12\x1c\xa0\xf2\xe8\xce\x03\
-\x03\x94\x0a4\xea\x94\xa6\x03\x08\x00\xa4\x0ahZ\xf5\xe2\
-\x01\x09\x0d\x1cJu\x06Bg\xd7f\x11\x0c\x94\x1c;\
-0h\xd7\x03\x10\xc4\xb2m\xdb\xd5\x81\x81\xacs\x07\x02\
-\xa0P\xd5\x81\xc6\xbc\x04\x01p\xe5y\xa0\x01\xe0\x82\x82\
-\x9d&\x90{\xd8Yb\xa1\x85\x1b\x07\x1eL3BT\
-\xc9\x03!\x1cu\x89y\xe0\x80\xa3\x7f;\x0b, 4\
-\xb4hg\x0cx\x9a>\xed\xec\x00\xcd\xd5\xac\x07\xb8\x1e\
-\x09\x9b\xb5\xb3\x01\x0e\xbc^\xb6m\x10@\x01\x08\x05\x18\
-\xf3\x1eN\xbc\xb8\xf1\xe3\xc8\x93+_\xce\xbc\xb9\xf3\xe7\
-\xd0\xa3K\x9fN\xbd\xba\xf5\xeb\x9d\x03\x02\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,\x1f\x00\x13\x00-\x00\x1b\x00\x00\x08\
-\xa9\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x05-\x5c\xb8@\x81\
-B\xb3\x87\x0f\x18 \x9cHq\xa0\x80\x14\x1b\x1e<\xdc\
-\xc8\xf1\xa1\xc4\x8a \x05\x02\x00\xa1\xb1\xa3\xc9\x8d\x04B\
-R\x04 \xc2\xc3\xc9\x97\x1c\x01\xa84\x08\xe0\x02\x02\x98\
-8\x1f\x06\x98i\x11C\xce\x9f\xcdv\xf2\x04q\x13(\
-\xce\x032g60\xfa\xd3\x00OgE\x99\x9e<\xe0\
-\xf4\xa9\xd4\x8d\x07\x12,0P`\xc0\xd3\x81\x07\x8cF\
-\x80P@\xc0W\x84\x0brFh`\xf6,\xc5\x01a\
-MRm\xeb\x16$\x83\x8e\x0e\x0a$\xad\xab2\xc0\x82\
-\x04\x12>\xf2\x1dL\xb8\xb0\xe1\xc3\x88\x13+^\xcc\xb8\
-\xb1\xe3\xc7\x90#K\x9e\x5c1 \x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,/\x00\x12\x00 \x00\x10\x00\x00\x08r\x00\
-\x9d\x09\x1cH\xb0\xa0A\x82\x16,\x0c8\xc8\xb0 \x00\
-\x0b .P \xd0\xac\xa2\xc5f\x18\x00448\x00\
-\xc3\xc5\x8f\x1f)l$(\x00\x01\xc8\x93\x16\x17\x8et\
-\x06\x01\xa5\xcb\x06+\x9d%p\x89\xd2@\xcc\x994A\
-\xc2\x5c)!'H\x95#\x0b\xf8\xbc(!\xa63\x00\
-\x11\x86:\xb0i\xd4\x99\x00\x9c\xcd\x0e$X`\x80A\
-\x80\xabM\x0f\x06\xd0\x98\xb5\xab\xd7\xaf`\xc3\x8a=\x18\
-\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,<\x00\x12\x00\x17\
-\x00\x0c\x00\x00\x08X\x00\x9d\x09\x1cHP\xa0\x05\x0bF\
-@\x1c\x14P\xb0\xa1\xc0\x00\x0f\x9aI\x9c(\x11\x81\x07\
-\x86\x0e\x9d\x05\xa0\xc8q\x22\x02\x8c\x0d%t\x1c\xb9 \
-\xe3\xc8\x91\x09L\x9e\xe4\x88 \xe3\x81\x95\x14S:\x14\
-\x09S\x22\x84\x8c\x03j6;\x00\xb2a\x00\x07+#\
-\x04\xc8X0\x80\xd1\xa3\x01\x00\x10]\xea0 \x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,D\x00\x12\x00\x14\x00\x0b\x00\
-\x00\x08Y\x00\x9d\x09\x1c(p\x80\x05\x01\x04\x13&\x04\
-\x80\xa1\x99\xc3\x87\x0f(`H\xa1P \x85\x87\x181\
->\x18\x90p@\xc6\x8f\x0e\x09$l\x00\x12$\xc7\x81\
-\x06J~\x0c@0\xa5J\x8c,\x07\x06x\x89\x11@\
-\xc2\x044\x9b%\xa8h\xe0\x80\xca\x03\x08+:\x03\x10\
- \x00\x03\x03\x10\x12Hh`\xd3Y@\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,H\x00\x12\x00\x1c\x00\x0f\x00\x00\x08\
-w\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x01\x80\xd8p\x01\
-\xc4\x00\x84\x10\x09\x0e@\xd0\xac\xa2E\x0a\x17R\x00\x88\
-h\xf0\x81\xc5\x8f\x1f=\x88\xd8\xc8Q\x00\xc8\x93!S\
-Dl\x80\xb2eE\x04 \x10\x1apI\xf3\xc1\xc1\x02\
-4i\x1a0\x08\xe0@\xce\x96\x09\x0e\x06\xf0\xf9\x13d\
-\xd0\x83\x02\x1aH Zt'\xc7\x01\x05\x16D\xa0y\
-@\x00\xc7\x82I\x1d\xa0lp\x15\xe1\x00\x08Z\x9b\x1d\
-\x80\xd0\xf5i\x00\x82\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\
-\x00,N\x00\x13\x00'\x00\x19\x00\x00\x08\xb2\x00\x9d\x09\
-\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\x00\x0b\x00\
-\x1aJ<\x08\x80B\xb3\x8b\x14DL\xdc\xe8\xec\xc1\xc5\
-\x8f\xcd\x08\x5c\x88\xc8Qa\x01\x90(\x9ba\x10P\x12\
-a\x82\x94)7\x90l9\x10\x01\xcc\x94\x08@\xd0\x1c\
-x\xf3&\x81\x00;%\xf4\xbc\xb9\x81\xa6\x80\x03Ca\
->\x18\xd0R\xc0\x82\xa48\x0b\x18]\x80\x14\xeaG\x0c\
-;\x014p`\x15\xe3\xcc\x96\x05\xb8Z}\xf0\xb5$\
-\x00\x03U\x93\x92\xdd)P\x80P\xa8\x08X\xb2uV\
- m\xcf\x07s\xdbF\x80*5\xaf\xb3\xa7C\x17\xf8\
-\x15x\xb2'\x84\xc1\x84{\x02E\xec\x8c\x81\xdd\x8b\x87\
-\x19\x0b\x1c \x16\xb2d\x82g\x13,`00 \x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,X\x00\x15\x00*\x00.\
-\x00\x00\x08\xf7\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\
-\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\x87\x00\
-.B\xdc\x80\xa0\x19\x82\x0b\x195*\xc4\xd0\xacd\xc9\
-\x07\x03D\x224`\xb2%\x82\x02*\x0b\x02\xe8\xd8\xb2\
-%\x86\x98\x03\x03\xd4\xdc\xf9 \xa4J\x9d;k\xf6\xc4\
-\xe9 hM\x04)U\x160z4\xa9\xc8\x01\x07\x98\
-\x9aD\x1as@Q\xa9\xcd\x08\xf8\xd4\x08 \x02\xd6f\
-Cc.\xf8J\x01\xa7\xb3\x06_\x0d\x98e\x10Uj\
-\x00\xb3\x03\xb0\x22\xd8*r\xa9\xd4\xb2f!`e`\
-\xd6\x99\x04\xa9s\xcdv\x95\x0a\xa1\xaf\x80\xb6F\x05\xf4\
-\x05jtA_\xbfR\x15\x9b\x15 \xd5q_\x96L\
-%\xe3\x04\x80xg\xe1\xbeh\x8d\x22x\xec\xecjP\
-\x98}\xed\x06\xc5\xdb\xb7sM\xcd8\xc7\x1am\xf0\x98\
-\x01S\x09\xa4]\xb7\xa4\xabRvP\xbe}\xe3\x1aU\
-\xfb\xd8tM\xdc\x8f\xf5\x06\xb5\x1c\xdc(\xea\xc7\xbeM\
-2\x7f\x0c\xc0@[\x09o\x9d\x05\x04\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,c\x00\x1b\x00!\x00I\x00\x00\x08\xff\
-\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\
-\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\x8b\x183j\xdc\xc8\
-\xb1 \x80\x0b\x1e@\x08\xd8X\x00A\xb3\x93\x08\x06d\
-,p\xb2e\xb3\x94\x17\x05\xb8t\xf9\xe0b\x83\x99.\
-\x0dX4\x80\xd3\xe5H\x8a\x01z\xb6\xa4`q\x81\xd0\
-\x93\x0d*\x0a8p\x14\xc1\xcf\x897\x8f.\xb0\x98\xe0\
-h3\x00\x15\x07X\xd5Y\x91\xa7P\x04X+:8\
-\xca\x95\x22\xcb\xafa)\x8e\x15Z`\xe7Q\x09\x16\x01\
-0\x15\x9av\xa2\xd7\x9em\x95\xbe\xbd\x18\xe1h]\x89\
-wq2\xb0\xa8U\xe8T\x8bkq&\xb8\x08\xe1\xe8\
-E\x06GUf=:\xd8\x22Y\xbeB\xe1\x16\x15J\
-\xe0b\xe0\x99\x17\xcf\xf6\xbc\x18T(i\xc7\x16K\xf7\
-\x94\x0c\xf4h\x00\xc2\xaeS\xc7\xae\xa8\x1a\xe7\xd3\x89\xb5\
-A\xbb5\xbd\x1b\xe7\x01\xc6B\x17S\x0d~\xf1(\x04\
-\xd8l-\x8a\xc6\xc9zbc\xde\x15\x1f\x10\xd7+\xf4\
-x\xc5\xe7=+S$\xe0wrf\x8b\xd8q\xe6\x1f\
-\xdd\xde\x9d\xa2L\xc3\xb2\x85j\x9f\x08@\xe8o\xcf\xd9\
-3\x1a\x98{RsF\x01\x0d\x12,X?0 \x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,[\x00'\x00)\x00X\
-\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\
-\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\x8b\x18\
-3j\xdc\xc8\xb1\xa3\xc7\x8f C\x8a\x1cI\xb2\xe4F\
-\x01\x03H\x02\xb8@\xa0Y3\x04\x17B\x02x\xe0\xb2\
-f\xb3\x06 \x17\xd8\xac\x89\x00$\x82\x9d5\x19|<\
-\x00\xd4\xa5\x81\x8f\x09\x8a6K\xf0QgQ\x02\x1f\x1b\
-(m\x06\xc0c\x80\xa9\x01<\x02\x98\x8a\xd3\xa3\x03\xa5\
-\x0b\x90*e\xea\xd1\xc0\xd4\x8f\x0c\xceZU\xdb\xf1\xaa\
-\xd2\x8fn\x8b\xc2e\xcb1.\xd0\x94m\xb1\xaeU\x9a\
-5/\xdf\xbdE\xfbr4\xab\xb4jG\xa7@\x1d|\
-\xa4YT\xc2\xc7\xa9G\xfd\x16\x15\xda\xb1\xc0T\x01\x1e\
-!\xd0\xdd\xc8\x18(Y\x8e\x02\xa6B\xc8<\xb5\x80\xc7\
-\x9f\x85;\xa6U\xea\xb8\xa3\x84\xa9\x947nUz\xc0\
-\xa3T\xa5\xa3;\xb6T\x8ay\xf0\xd4\x08\x1d\x05\xa0.\
-j\x9a#\xe2\xa2\x865\xda\x05\x1a\x96cg\xa0\x07\x92\
-g\xb4\xcc\x95#\x80\xe1\x89\xad?\x07*8#\x86\xa9\
-\xcdZk\x87\xd4\x0c\xbe\xf7t\xf0\xcd\x22g\x5c\x9eX\
-\xba\xc5\x01\xd8\xa1\xe3\xc5X >\xd0\xe2\x18/\xa0O\
-\x9f\x11\x80\x87\xfd\xcd]$\xc0vE\x01\x87Q\x00\xf6\
-\x01\x15\x81{\x12\x0d@\xc1~\xcd\x1c0\xdfD\x00|\
-\x07\xa1\x84\x15\xad\x94`\x81\xe6I$\xc2n\x10.\xc0\
-\xa0C\x02<\x08\xa1Q\x16\x118\xd5\x01\xb1M\xb4\x1a\
-\x84\x11L8\x11a\x00\x8e\x18\xd1\x8bS% c\x86\
-\xe09\xd0]F4\xdat\x00~\x1d%e\x93\x016\
-\xf6W\x80\x04\x094\xd0aG\x01\x01\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,1\x008\x00S\x00L\x00\x00\x08\xff\
-\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\
-\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\x8b\x183j\xdc\xc8\
-\xb1\xa3\xc7\x8f C\x8a\x1cI\xb2\xa4\xc9\x93(S\xaa\
-\x5c\xc9\xb2\xa5\xcb\x970c\xca\x9cI\xb3\xa6\xcd\x9b8\
-s\xea\xdc\xc9\xb3\xa7B\x0b@}B\x1c@\xa0\x99Q\
-\x04\x18\x00\x08]\x08\x00\x81\xd1\xa7\xcd\x1e,U\xd8\x00\
-*T\x06S\x11J\xb0\xfa\xd4@\xd6\x83N\xb96\xf3\
-\xfa\x95\xa0\x00\xb1F\x1b\x94%X\x00m\xb3\x00k\x07\
-Bp\x1bw\xe0\x03\xb4\x09\xea:;\x8b\x16\x82\xde\xaa\
-h\x0b\xe8M\xe0Vi\x5c\x00n#\xfcu\xab\xb6n\
-Q\xb4\x02\xea2H\xac\x97\x82[\xb2k\x03\xb8mf\
-x\xade\xb4\x0b\xea\xb6u;\xc0\xb1\xdb\xbcq\xe7\xba\
-\x85\x9by3\xea\xb2\x00\x1e\xa3-\xbd\x16\xc3\xe6\xd0k\
-\x0dl>\x10\xb9\xech\xc6k\x07ln\xf6:\xeb\x80\
-\xb0h\x0ft\x9ez|8\xd6\xaf\xbf\xdd\xe2\xce\x0ab\
-x3\x09_\x01\xd8\x1e\x1ea\xb9O\x01w\x87+\xd5\
-\xa7\x8e\xdc\xed\x01\xdaB\x07|\x16\x8f\xbe'\x80\x0d\xd6\
-\x8d:h\xcf\x93A\xf9\xcd\xdd+\x02\x10q!E\xc9\
-\xfd\xb2Y\x97\x80w\x10E\x87\xc0\x06\xf4m$\xc0\x06\
-\xf7\x0d\xe7WE\xcdqE\x00\x08\xbda\x04@\x0a\xeb\
-\xc5\xd7\xcc\x01\x82Y\x94\xa1X\x04`\x00B\x82\x0c]\
-\xb8Ax\x1a>5\xdfE|i\x88\x00\x05\x18\x5c \
-\x02P\x16(5\x00P\xfc]pb\x8abaf\x91\
-f<\x06)\xa4Q\x09Tx\x11\x90C&9\x9c\x03\
-\xcfi\x04@\x04JF)\x16\x04\x04b4\x80\x03R\
-f\xb9\x00\x89N\x1ap@\x96B:`\x80\x91\x221\
-\xb0\x00\x98\xf1%\xd0aJ\x00\x14@\x18\x9aV9\xb0\
-%L\x00\x04`\xc0\x9bQ\xcaY\x00\x993\x0d\xd0\x00\
-\x04\x09@\xb9d\x02\x09@\xc0\x00\x9f=\x05\xa0\xe8\xa2\
-\x01T\xe9R@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x14\
-\x00N\x00o\x006\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9c\
-H\xb1\xa2\xc5\x8b\x183j\xdc\xc8\xb1\xa3\xc7\x8f ;\
-\x02\x10\xe1\x81\x82\x07\x06!S\xaa\x14X\x00A\xb3\x97\
-/\x0d\xac\x9c\xd9q\x00\xcc\x9b\xcd\x04\xd0\xdc\x89\xd1\x00\
-N\x982y\x0a\x9d\xb8\xe0\xe7K\x02C\x93B\xf4i\
-\xb4\xd9\x00\xa5P\x172h\xda\x0cB\xd4\xab\x08\x0f4\
-E\x8a\xb5\xeb\xc0\xa2MQz\xed:\xb5\xe9\x82\xb1^\
-\xb5\x1aE\x80\xb6+X\xa3\x05\xda^\xb5\xb9U\xeeU\
-\x07T\x1b\xd8\x85\x0a\x81*\x02\x00{\x93\x0a\xa0\xda,\
-h`\xa1o\x8d\xea<\xcc\x13\x80Z\xa3g\x19O\x14\
-`a\xf1R\xc2\x01$C\x04\xf0\x00&\x06\xc0\x0f\x01\
-\xe0m\x8a\xc0\xb2f\x85\x9cq\x22x\xfa\xb0\x00\xe1\x07\
-\xa0O#L\xfd\x93\xeb\xc3\xd1M=\xc8N\x88\x81\xaa\
-X\x87\x01\x08\x17\xdem\xb0\x01\xe1\xdf\x0e\x13\x08\x8fK\
-\x5c`Y\xaa\xacC\xe3^\x1b]\xf6\x00\x97T\x13L\
-\x1c\xf0\xb8)\xf3\xd3\xd7\x09\x1f\xff\xa8\x0e\xf19U\x10\
-\xe0\xb1S\xfd>\x91)a\x0c\x92[\x0a\xb7z1q\
-\xee\xd8r/\x08o\xa6\x1d#\x80\x08\xfb=`\x9aW\
-\x00\xf4&\x5c\x04\xf8Y$@w\xa4\xa17V\x00\x04\
-\xecw\xc0\x80\x17\x0d0\x1dU\x0f\x90\x97\x14\x00\x1b\xec\
-\xd7\xccx\x1e\xfd\xe7a3\x17$\xc8\x13\x03\x11J\xa8\
-\xa1F\x00\xd8G\x15\x01\x99\x09\x15\x00\x05#\x82\x98\x92\
-\x8b/\x8a`\xe2G)\xd08b\x04\x14~\xe4\xda\x88\
-\xcd \xb0A\x90\x19\x01\x00B\x8a#J\xb0#H\x05\
-0\xb8\x9f\x07)<)\x91\x00 x@$L\xf4\xf1\
-4\x00\x80[\xbe\xf4\xc0\x06U^\x99\xc2\x06\x9d\x85\xf9\
-!rB\x19 %\x91\x0f`p\xc1\x05\x22X`\xc1\
-S\x00\xd8i\x81\x08\x17l@\x81zj\xf2\x87\xe4N\
-\x02(\x17\xe8\xa1j\x1e\xa0\x97W\x0c\xbc\x89\xe8\xa38\
--0\xa8R-Bj)N\x09\xac\xe8\xd5\x008^\
-\xbae\x0212\x06\x80\x01\x17z\xba\xdf\x02\x9a\x1eV\
-\x00\x98\xa6R\xe5@\x03Vj/\x16\xc0\x02\xa5z\x1a\
-A\x03\xa96\xe7\x8c\x00\x05\xd0ji\x04\x0b\x14\x10\xab\
-\xae\x06\xf1\x0aA\x02\x09\xb0\x9a]\x02\x10\x14\x10*\xb1\
-\x1a\x05 \xed\xb4\xcfb\x15\x10\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x12\x00$\x00h\x00`\x00\x00\x08\xff\x00\x9d\
-\x09\x1cH\xb0\xa0\xb3\x14\x1b.\x080\xc8\xb0\xa1\xc3\x87\
-\x10#J\x9c\xd8\x10\x00\x86f\x18\x9bm\xa0\xc8\xb1\xa3\
-\xc7\x8f\x11\x1fd\xcc\x88\x01\xa4\xc9\x93(\x1dB\x189\
-\xb2@\xca\x970=2`9RB\xcc\x9b8\x1b\x0a\
-@@3c\x82\x9c@\x81\x8a\xec\x89qA\xd0\xa30\
-W\x12mv`!\xd2\xa7 g.m\xe6\x12\xaa\xd5\
-\x8e\x04\xa6\x1a\xbd\xcaUb\x83\xa9\x11\x00t\x1d\xeb\x10\
-\x00O\xa2\x07\x06\x90]k\xd0\xc0\xd4\xaal\xe3\xee\x5c\
-j3\xae\xdd\x05K\x9b\xda\x95;\xd5\xc0\xde\xb8J{\
-\x1e\x10\xfbwmV\xa2p\x0bw\x95\xda\xd3\x81\xe2\xb5\
-x\x11?\x1e\x0b \xef\xe4\xb1\x05\x96n\xbd|uh\
-O\xb5\x9c\xadV&\xea8\xb4\xd5\x00K\x1b\x98\xb6\xea\
-\x96\xa8\xd3\xd5H\x13\x90\x86\x0d\xf5,\xcd\xcd\xb4\x81\x0e\
-H\x9d\xfbhf\xa2\xa0{\xe7\x8c\xdcSxP\xd9=\
-\x7f\x1a\xcf\x89\x9c&\x84\xe59=\xb3\xf4\x0b\xfd\xe6R\
-\xea\xd5a.e\x90\x1d\xe6\xe8\x9e\x01\xba\xbf\xffDM\
-4\xbcx\x94\xe4{\x12>o2=\xcd\xe0\xec?\xba\
-gi>\xfe\xc7\xef4\xeb\xdb\xf7\xb8T\xff~\x8e\xbc\
-\xfd\xc7\x1fQ\xd8\x09HQ\x04\x04\x1a\xd8Qs,)\
-\xa7\xe0D\xc4\xd1\xf4 E\xbf}6\xa1D\xbbIv\
-aD\x9am\x18\x11\x83#=\xe0!D\xad\xf5\xf4\xda\
-\x88\x061FS\x81(\x12$\xc0R\x04\xb4\xd8\x10\x88\
-#\xf9'\xa33\x15\xdevcA\x00\x1c@\x14\x02\xeb\
-\xed\xe8L\x84,%\xb6\xe3|#\xc5(\xe4@\x0e,\
-e\xe4\x8d%\xd2\xa4\xe4\x92/\x06\xb8$\x91#\x01\xb9\
-\xa43U\x12\xe5\xc1\x96CN\xc5\xdd\x92=\xc2\x18$\
-\x94S}If\x93\xd7m\x89$Kc\x0a\x89e\x96\
-\xf0\xc9X\xe6R\x08\xd4\xd9\xa2\x8a=\xe5\xb9d\x94}\
-\xea\x89\x22\x8d,!\x10\xa7\x9dlN\x05\x82\x90\x03\xf8\
-8U3\x1e\x9c9b\xa3\x8f6C\x80\x8d\x1eRZ\
-\xe9\x06\x92n\xa8\xe9\xa3\x08,*c\x00\x8eVJ\x80\
-\x082\x0e\x80`\xa5\x18\x9d\xdaiN\x22x\xb1@\x80\
-\x07\xa8\x92\x05\xc0\xaa\xac6\x83\xc0\x06'\xde4\x00\x06\
-\xb6a\xa4\x1ad\xb9&\xb9A\x0a0\x09 \x82t,\
-\x09j\x15\x03\xa5\x16\x8b\x91\x07 \xf4:\x11B\xcc\xf6\
-T\xd7Z\x00H \xad\x94\x14$t\x81\x05\x16\xbc\x06\
-\x00\xb9)\x5c\xe0A\xb6\x8f\xee\x05\xed\xb7\xf0\xc6\xdb\xcc\
-\xab\x5c\x01`@\xb4\xf2\xe6+\x98b\x02\xcc\xa9\xaf\xbe\
-\xc3\xf2\xeb\xef\xbf\xd2\x1e\x10\xf0d\xf6&Jp\xb1\x0e\
-\x18`\xede\x05x\xbbp\xa5\x12\x1c\x9a\x1b\x00\x11O\
-LS\x04\x0d<,\x1c\xc6\x0b\xe0\x9a\xaf\x03\x0b\x14@\
-ov\x000`\x80\x04\x84\xf6\x14\x81\x04\x060\xe0\xac\
-\x82\x00\x04`s\x00\x0d\x18ps\x00\x1e\x1f\x15\x10\x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\x00T\x00r\
-\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13&\
-\x1c`\xa1a\xc3\x01\x0a#J\x9cH\x11\xa1\x00\x11\x17\
-<P\xa0\x80\xa0\x99\xc7\x8f \x9b\x11\xa0\xb0!E\xc5\
-\x93(\x15\x02H\x81\x81@\xc8\x970A>\x80\x98\xb2\
-f\xc5\x14\x1b\x1e\xc4\xdc\xc9\x93\x80\xcd\x9f\x0aE\xb8\xe4\
-It'M\xa0H\x01\x5c\xe8X\xb4)\xcc\x00H\x81\
-\x0a\xc0\xc0\xd4\xa9U\x90P\xa3\xa6\x9cz\xb5kH\x00\
-ZQ\x82\xa8\xea\xb5k\x82\xb0\x15\x05P(\xcb\xf6\x80\
-\x00\xb4\x13\xc7\xb2m\x16A\x82\x81\xbb\x01\xf2\x0a\xcc\x1b\
-\x80\x81\x01\x08\x09$4\x00\x0bW\xa1\xda\xb2\x11 0\
- \x5c\x18\xad\xdc\xab\x0b\x0a0n\x0c\x17\xc3\xd5\x03\x06\
-&SF\x0b\xc0\x83U\x07\x927S\x06\xa0\xb3i\x84\
-\x02\xa27\x0f \xcb\xd3@j\xd5\xaccF8\xfa\x1a\
-\xae\x80\xd80]\xd7nL\xba\xe8\xec\xdd\xbcK\xf3\x5c\
-\x00\x9c\xf2Z\xa2\x0d\x8a76@\xf4\x00j\xe5p\x19\
-4\xa7\x0d=\xeam\x9e\x07\xa8WGz|'\x83\xed\
-h\x1b\x10\xff}\x0e>*\x00\xdc\x1fu\x97\x8f\xeay\
-\xa7\x84\xf5Z\x03\xf0t\xa0\x19~\xcd\xee0\xb5\xdbG\
-)\x7f'\x84\xfd\xdc\xedD\x1f\x80?\xf5\x17\xd3w\x04\
-\xda$\xc1Ng%X\x93\x00<e\xe5 J\xe2\xc5\
-\xd4\xe0\x84(\x0d\xf5\x14\x86(\x0d\xb0S\x04\x1c\xa2\x04\
-\xc1N\xc9\x85X\x91p/\xd5g\x22B\x00\xb8\xb7\x22\
-E\x05\xecD\xde\x8b\x0a-\xb0\x93\x8a4\x16\xa4aH\
- \xe6\x18\x91\x7f>*d\xe0K\x08\x06yP\x8c1\
-\xe1h$s0\x1d`dB\x09X\xf8$B;\x82\
-D\xdc\x94\x06\xed\xa4\x1e\x96\x03\xc9\xc8eA;I\xf8\
-\xe5\x90!\x89\xc9%\x99 \xe9\xf7$\x9a\x1f}I\x10\
-\x9b\x1e\xbd\xe5\xa63p6c&\x96u\xde9e\x9e\
-s\xd2\x19f\x9f\xce\x90\x08\xa8\x96\x80F\x09\xd3\x95s\
-\x1a\xfa\xd2\x85n2\x09\x13\xa0\x15n8\xa7\x871\x95\
-8\xe7\x011\xbd\xd7\xa7\xa2!!\x00\xa8\xa3D\xf6I\
-\xe9\xa1\x80:pc\x9f#\xc64#\x97\xa3\xbe\xe4S\
-\x9f\xa6\x1e\xdf\xd8'\xa8!Q\xd0'\x84\x7f\xceic\
-L\xaf\xba\x89k\xa5\x9b\xee\x84\x80\x92>\xd6\xd9\x8c\x07\
-}.\xe8\xa5\xaf\x98\xc6\x84\x80\x9c_\xd2\x1a\xd2\x03s\
-\x02\x10kL\x18\xccil3\x96r\x99\xea\xb2_F\
-\xc0\x13\x02j\xfa8@\xb3\xce\x96\x9bc\xa4\xce\xae\xfa\
-\xe4\xae<\xb9k\xa4\xb2<]\xf0%\x00\xe2\x12\xe5\x01\
-\xb1+\x02\x80\xeeN\x04\xa8\xbb\xe2\xb9Mm\xc0o\x88\
-\x04\x17E@\x91F\xe2\xeb\x14\x05z\xbe\xe8\xf0\xc3\x11\
-\x9b\x08\x00\xbdM=\x00\xc2\xc1\x0eJ[\x94\x07\x22p\
-\x0c \x03\xffZ\xf5@I\xd0\x86(\x00\xa7eQ\x80\
-\x01\x08\x02\xafW@\xc9l\x05\xcc\xe1\xc5s\x814l\
-\x88\x01\xb0\x5cV\xb7\x18\xf6\x9c\xf3\x96<c|\x15\xd1\
-\x167\x90\xafU@\xd38\x00\x04K\x13\x95r\xc3\x0c\
-,p\xedKH\x9fY\x80\x01\x098\xe0@\x02\xf2\x02\
-*Z@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\
-\x00n\x00q\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\
-\x83\x08\x13\x22\x14`\x81\xa0\x00g\x0a#J\x9cH\xb1\
-\xa2\xc5\x81\x00,\x80\xb8\xf0\xecA3\x85\x04(<\xc3\
-pA\x84\x80\x8b(S\xaa\x5c(b\xe5\xc0f\xcd\x08\
-lH\x01\xc0\xa5\xcd\x9b\x06\x07<#\x80S \xcc\x9f\
-\x0f.4\xecI\xb4\xa2\x00\x10E\x09\xfe\x5cJ\x00D\
-\xcd\xa4P\x09\x06\xf0\xf01\xea\xb3\xa5X\x11\x5cxj\
-\xb5g\x00\x0aU\xbbb\x1d\x8b`\xc3\xc9\xae.\x03<\
-@\xabt\xac[\x0cg\xd9V\x04\x80!,[\xb7x\
-ar\x94;\x11\x04\x02\xbe>\xf3\xe6}\x10\x17pA\
-\x00`W\x1eH\xb0\xe0\x19\x03\x8cO\x19\x18\x18\x18A\
-\xb0e\x04H\x0dK\xfd\xab\x19\x00\x03\x08\x0e,\xe3\xf5\
-\xc0\x15\xf0\x05\xbb\x13%\x14\x15P`\xc1\x01\xd1K\x11\
-<\xe6\x8b\xd8b\x84\x02]\x01\x18x\x0d\x1b\xe6\x06\xbe\
-k)&\x08\x00\x91-\x80\x06\xa1{\x93\xeeZ8\xe2\
-p\xcd\x02\x0b$\x17\xfd\xa04\xf4g\x0ef_\x17\xd8\
-\x80\xb7\xe5\xea\xdb\x9f\x19\xff\xb0\xbe}@e\xea\xcd]\
-\x02\x08\xae\xd0\x81\xce\xf0\x07\x0d\xc0F\x90\xbe\xab\x04\xf2\
-\xf0\x07\x06\x98>\x18\xbfEg\x22E\xd4@~\x11\x01\
-\xb0\x80h\x1e\xd8\x84\x81D\xb8\x11\xc8\xa0h\x10\xac\xd4\
-\xa0\x838\x15 \xda\x84\x16\x0d\xc0\x19\x85\x15\x8a\xf6\xde\
-\x5c\xec\x1d\xd4L\x00\x1cZ\x14\x80wn\x11\xe0\x1fB\
-\x0b*\x84a\x89\x13Y(\xd8d\x14\x91\x08cR\xf2\
-\x09\xf6\xa1B\xce\xf0\x94Pc7\xa2t\xe0`\x13\xd1\
-\x88\x90\x03+\x06\x99\x10\x00\xe7\xe15\xa0B\xf5\xbdd\
-\xa3\x92\x17\x01\x80bVQN\x14!\x95)5 \x18\
-\x90(E\x90$\x97\x0a%\x90\x17\x02c\x8a\xb8#\x99\
-\x16\x09p\xe5RF\x12\xb4fAq\xb2yQ\x8en\
-\xa1i\x10\x98\x06E`\xa7K\xfcaUgD/\xfe\
-i\x91\x8cy\x966\xe8@\x0e\x18\x0ah^\xdaE\xb4\
-\xa8\xa3\x14\xe19\xd6\xa4\x055\x93&\xa5\x08Y\x89\x97\
-\x91|\x16\x14*\xa7\x16Y\xba\x94v\x1b\x1a\x94%\xa9\
-\x05\xbe\x09\xe6\x9c\x03%\xff\xc0\xeaJ\x03xw\x00\x86\
-O\x1e\x14\xe9\xacUJ6\xe5@\xaa!T\x1c\xafE\
-\xa5J,Z\xb0\x0a4\xea\xb1.\xedJP\xae\xcc\xde\
-\x84i\xb2\xd1\xa2\x14\xacA\xa8U\xbbR\x88\xdaB\x95\
-\xad@[v+.\xa5\xbf\x8e{\x11\xb5\xe6\xa6\xfbg\
-\xb9\xea\xda\xc4n\xbb+\xbd\x0b\xef\xbc\xf4\xda\xb9i\xbd\
-<&\x04-\xbe(\x85\xcboB\xb2\x1e\x14\xf0\xbf(\
-\x19KpA\xfe*u\xef\xc1R1|\x90\xbc\xcf\xec\
-\xeb\xf03+&<\xf13~\x1e\xc4\xed\xc5\xcb^\xb5\
-\xea\xbf\x12\x0f\x84)\xc1Y\xfax1e\x09\xa1{\xf2\
-@\x1d\xafL\x90\xc1.\x1bTh\xcc4\xd7\x8c\xd3\xc2\
-\xf0B,^\xcc\x19\xabi\xf3A\x01\xae<\xf0\xcf\x03\
-\x0d\xf0-F.\xb7\xfcL\xd0\x17\xbbItA3\x13\
-\xd4\xe2\xc9\xd7\x22d\xf1\xc1V*\xd4L\xd4\xff2p\
-\xb4O\x5c\xf3;\xf2UO\x17\x84\x80\xca\xf5\xf6\x8c\x10\
-\x02\xc3N\xdc\xa8B\x038\xd3\xf6\xc1\x03\xbc\x8d\x10q\
-r_\xcc\xe4\x92r\xf7L=\xf1\xde\x06\x19\xd0\xf7\xe0\
-5'0\xf8\xe1s\xff\xbb\xe5\x01\x10 \xee8\xc3r\
-\xe3\xed\xf8\xe4\x89\xd3K\xf9\xe5~\xf3\x8b\xf9\xe6y[\
-\xce\xf9\xe7\x95w\x0b\xfa\xe7\xed\x8e\xce9\xbc\xa6_\xee\
-y\xea\x87\xe3\xcb:\xe1\x9a\xbf\x0e\xb9\xe9\x17\x93N\xf3\
-\xe4T\x06\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-\x12\x00r\x00e\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13\x22\x04`\xa1\xe1\x85\x86\x16\x06(\x9cH\
-\xb1\xa2\xc5\x8b\x18\x0f\x0e\x10\x81\x81\x02\x81f C\x8a\
-\x0c\x89\x80\xc2\x85\x14\x022\xaa\x5c\xc9\x92\x22\xc3\x0b\x14\
-\x10\x8c\x9cIsdI\x10)[\xea\xdcYQ\x04\x85\
-\x9a@\x83\x8e|\x80\x93\xa7Q\xa3\x036\xc8\x14\xca\xb4\
-\xe9\x03\x11\x00\x8eJ\xbd\x08@\xc4\x83\xa6X\xb3\x22\xb8\
-\x10u\xaaW\x83\x030,\xcdJ\xb6\xe9\xd6\x9c_\xa7\
-\x02\xd8P\xb6mY\x0c]\xd3\xf2\x141\xd6\xad]\xa6\
-\x08@\xc8\xd59\xe0\xe7\xdd\xbfX\x1f\x04\xd8\x9b\x11\xc0\
-\x05\xc0\x09\x0c\x18`\x10 \x80D\x81\x03\x1a\x070 \
-\xc1\xc1_\xb8\x84+2\xf8\xd8\xd6\xc1\x82\x06\x8f3\x06\
-h\x10\xc1-\x81\xd0\x99\x0f\x82\xe8l\x00\xedN\x01\xa4\
-\xdb\xeaMm\x10CY\x09\x0c\xe4\x0a0p\x80\xac\x87\
-\xb8\xb4mcu\xd0\x00\xb8\x5c\x00\x06,\x076~\xfc\
-jS\x07\xb9i\x13,\xa0\x1c/\xea\xb4\x00\x9c35\
-\xc0\x5c\xba3\xdef\xafO\xff\x1d\xc0Yh\x02\xf1\xde\
-\x07\x0a\x90`6\xbaW\x01uk\x1e(\x90\x9e\x22\x83\
-\xdeB\x11\xa0\xd7\x99\x9d\xa9\x84\xee\xf5\x19$@i\xf9\
-\xed\xc7\x92pA-\x10 F\x060\xf5\x00\x80*\x15\
-\xb0\xdd\x82\x19I(\xd4\x83<\x0d\xc0\x14}\x14f4\
-\x00~@A\xb0\x13\x00\xf1\x8d4_\x87+}(\x94\
-{+\xf9%\x9f\x81(N\xa4\x22P\x08\xb8\x86\x11\x04\
-+\xc6\xd8\xd2\x8c5Q\xb0R\x00B\x89\xa8cK\x0c\
-\x08\xc5!F.\xd2\x94\xc0\x90;YX\x13\x02\x10\x1e\
-T$P\x07D\xc9dE\xec\x85\x88Qy4\xc1x\
-eE\x00TG\x93\x8d\x099I\xd3\x91_\xee\x18\x94\
-\x8f.\x95\x18\x92\x04i\x1a\xd5 P^~\x17\x14\x99\
-q\xaa\x04\x00\x883)\xa8\x10\x89@\xf9\x99g\x93w\
-*\xb4\x00\x95V\x0ej\x11\x814\x09\x89\x90\x9b \x19\
-\xa0\xa8Q@>\x09\xa0\x99&&:iEb\x8e\x84\
-&AY\x9e\xb9\xa9Q\x98\x8a\x04\xa7A\x00\x00\xe5\xc0\
-\xa8Gu*\x12s\xa5\x86\xff\xe4(\xab:\xe1X\xd3\
-\xa7\xce\x84:S\x9d\xb4R$\x00Pl\x0e\x94jM\
-\xab\xf6\xca\x13\xa33\x01\x17+H\xb3\x1a\xcbR\x03@\
-\x0d6\x90\xae#\xf1\xea\xacB\xbf\xd6$\xe9@\x90\x16\
-{\xadN\xae\x82\xb4\xe4@Z~\xab\xd3\xa15\x0dT\
-)M\xd2\x9a\xcb\xd2\xb2\xcd<6%M\x9a\xba\x8b\x90\
-\x8655 \xd0\x9c4\xd9\xab\x13\x9f\x22m\x8b\xeeL\
-\xe3\xfa\xbbR\x025\x8d\x8b0M\xa7\x1a\xac\xd2\xc0#\
-\x8d\x0b\xd4\xb6\x0eg\xc4\xafM\xce\x0c+j\xc5\x19A\
-\x9b\xee\xba3\xb5\xcb\xb1E \x8f$@\xc9\x22\x89<\
-2E(\x87\xd4X\xb4+_\xd42H\x01h\x1cr\
-\xcc$\xc3\x0c3\xce,\xeb\x5c\x93\xca<\x1f4s3\
-\x83\xed\x1ctBC\x17\xfd\xf3\xd1\x0a\x0d\x9d\x12P\xfa\
-2\x8d\x10\xbc\x02M,5B\x17\x8f$P\xb8\xcd\xb0\
-x\xf5\xb4\x09\x0b\x04\xb1H\xd6\xc6\xbc\xf0L\xa7\xb6\x1c\
-\xc1\xd7\x07Y-\x90\xc7!%Po\xcc\xd9n,\x90\
-\x00\x0c\x18P\x00\x9el\xc3\x92\x0b4\xdb\x86\x0257\
-\xe0\x5c\x8aT0\xe0\xbe\xba\x8d8Ep\xdf\xbc8E\
-\xda\xcd\xf48E\xf8*9\xf9Dc\x8b\x14\xf5\xe5\x8f\
-\x0a\xce\xf9\xd4@5\xfcyA\x85\x8b\xe4\xf5\xe8\xce\xc0\
-\xeb-\xea\x02\x01\xaa-\xeb\x04em2\xecwC\xda\
-\x8c\xa0\xb0'\x99)\xed\xce4>\x13\xc5\xac\x0f`{\
-\x95\xbcG\xfe;\xef\xbe\x8f\xb46\xed\xae\xd7T\xf6\xd7\
-C7\x03<\xebC/\xcf\xbb3\xe1\x1e\xc0\xf7\xe8<\
-\x86\x84+\xed\x03\x88\xf9=\xef\x004 \x01\x04\xcf_\
-\xaf\xfe\xfa\xec\xb7\xef\xfe\xfb\xac\x06\x04\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,\x12\x00\x12\x00r\x00r\x00\x00\x08\xff\
-\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13&\x14`\xa1\xa1\
-\x05\x00\x0a#J\x9cH\xb1\xa2\xc5\x84\x03Dl\xa0@\
-\xa1\x99\xc7\x8f \x9b=\xe0\xb8\x01\xc4\x80\x8b(S\xaa\
-\x9c\x08\xc0\xc2\x05\x0a\x08B\xca\x9c\x09\x12\x81\x07\x93+\
-s\xea\xac(\xc2\x03\xcd\x9f@k\xde\x14\xb0\xb3h\xd1\
-\x00\x18b\x06]\xca\xd4C\x0a\xa3P-\x0a\xd8@\x80\
-\xa9\xd5\xab\x086\x10\x8d\xca\xd5 \x00\x0cW\xc3\x8a\xc5\
-\xb0\xb5kT\x00\x17\x94\x8a]k\x95\xacY\xa3\x22\xd4\
-\xb2\x9d\xcbt\x03\xc4\xb7*\x19T\xa5\xcb\xd7*\x02\x06\
-xQn\xe8\x9b\x00\x82\x81\x06\x01\x12\x03\x00\x90\x98\x81\
-\x01\x03\x10\x12\x1c\xe0K\xa1l`\x85\x02\x1e\xb0\x8d\xb0\
-\xa0\xc1\xc9\x8b\x03\x1aH\x98\xbc\xf6\xefe\x85\x0c\xe42\
-u`\xc0r\xce\xd0\x11\xd6n8}p\xf0\xd5\x03\x0b\
-\x02\xbc\x1d\x00\x81\xb4U\x0awi\x03\xd0l\xd5A\x01\
-\xda\xce\x0a8\xc0\xfa\xf9\xf2p\xab\x07\x1a '\xa8\xdc\
-o\xf3\xb7\xcf\x97\x1e0\x10|\xfa\xc0\x02\xbe\x81\x22\xff\
-\xb8\xce5{P\x09\xdd\xbd\x13\x04\x00\x81\xe9x\xb3\xe6\
-\x7f\x1e8\xae^a\x80\xd8A\xdf\x9f%\x0e4\x02\xf9\
-\xfa\x07\x01 \xc1R\x08\xb8\xa6\x13\x7f?-\x90\x1e\x80\
-\x095\xb0\xd4\x03\x0b\xaad\xc0R\xf41HQ\x00\xe1\
-\xcd\xe4\x81Q\xaa\xc9T\xa1\x85\x14\x0d\x90\xa1L\x06\xec\
-4@P\x1f\x82\x18\xe2\x88!\xe9\x96\x93\x00@\xa5\xa8\
-\xe2\x8a@\x11\x10\xa1E\x09\xd0$\xe3\x8c4\xfe\x04\x81\
-N\x00\xe0\x07\xd2\x8e<RT@P.\xae$@\x8e\
-\x1e\x1d\x00X\x91+M\xf8\x13\x01G\x19P\x80\x81P\
-^\xc4$M\xd2e\xc9#\x00,z\x84\xc0\x8d^\xaa\
-\xc7\x00P?\x969\xe3\x80?a\xa9\xa6w`&\xf8\
-\xa6\x8aR\xd2D\xe6\x9c\xa7\x01\xb0\x1cM%\xe2\xc9\xe0\
-\x914!\xe0\xa7\x85{\xceD\xe4\xa0\x97\xd5)\xd3\x03\
-\x88\xd6\x07c\x9b\x8d\xaa\xc7\xe6L]F\x8a\x1c\xa03\
-1j\xe9ta6\xe3\xe6\xa6]\xb5\xc7%\xa8\xb4=\
-:\x93\x04\xa4\xd2&dHT\xa6\x9a(\xa4\xae\xe2\xff\
-\x85\xa9\x87\xb1\xe2u\x22Mi\xd6j\xd6O\x09\xe8\xfa\
-\xd6\xaa i\xea+W\x93\xca4lW\x8a\x86t\xe7\
-\xb1(\x05\xf0S\x92\xcc\xeed\xaaL\xd0F\xfb\xe2\xb3\
-\xd6\x1e\x85m\xb6:9KS\xb5\xdc6\xbbm\xb8*\
-yk(\xb9+\x99K-\xba\xe5\x8e\xcb\xaeE\xea\x86\
-\xf4\xe9\xbb\x09%\x0b\x12\xbd(\x89:\x13\xbe\x17!\x08\
-R\xaf\xfcR\x04\x80\x9c\x01Ot\xe6\xa8\x05Kd\xef\
-G\xe0&l\xd0\x962-\xeb\xf0O\x0e8\x1cQ\xbc\
- \xe5j\xf1A\x0e\xd2\xf4\xe4\xc6\x07\xed\xb5/\xc8\x07\
-a\xfc\x11\xaa$\x1bTlH\x95\xa6,\xd0\xb4\x11\xbb\
-L\x90\xbe2- \xf3@\x00t\xf8\xd1\x7f$\xcf\x1a\
-\x12\xc07;#2\xadA/\xecQ\xc5A\xdf\xcag\
-\xd0\xce\xf8\xabl\xd0\x1d\xd3d\xf3\xcd\x02\xe8\xdc\xe4\xbc\
-\x09w\xf4S\xcb)\x1b\xed\x11\xd0.\xfb\x1c\xd2\x01X\
-\x07,6\xcb7\x9f\x0dR\x04i/\xc5\xb3\xc3j\x83\
-\xd4g\xca ,55\xc9\x00\xf8\x14\x14\xd8\x1b\x07\x92\
-`\xf5\xda\x12\xbf{\x01S\x11\x04\x8e\xae\x00Z\x07U\
-8\xc8h\xfd\x0d\xf8\xc6\x8d[\xb5\xb8\xc5\x22\x0c\xbd\xb7\
-\xe1\xd6\x0e@UXs\xf3+\x00\x08N\x07\xe5\xc0\xdb\
-\xdc\x0a\x90\xc2Kl\xa1\x17k\x00\x17xp\xc1\x05)\
-8$\x90C\xa7\xb7\xeexP\xd1\xd5\xeau_3\xf9\
-W\xab\xc9\xbc\xcf\x94\xbb\xae\x0b\x04\x8f;w\xc3Bl\
-<H\xdba\x8e\xa8\xf2\xcb\xe3V6\xa8\xd0\xf3.\xc1\
-\xc7\xd6\xc6\xbdV\x04\x0d8\x9fj\xf1tqv%\xbf\
-\xbc%\x00\xac\xf0\x09H`@\xc3\x0e'\xe6~be\
-\x06\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x16\x00\x12\x00\
-n\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\
-\x08\x13\x16t\xc6P\xc0\xb3\x01\x0a#J\x9cH\xb1\xa2\
-\xc5\x85\x0c3f\xbc\x80\xa0`\xb3\x81\x22.\x8a\x1cI\
-R\xa1\xc6\x93\x1a\x0dLlFa\x83\x08\x00%c\xca\
-4\x89\xb2\xa6\xb3\x8e\x16?\xbe\x9c\xc9\xb3\xa4\xcd\x9f\x10\
-KR\x08\xd9\xb3h\xc4\x9fH\x9d\x05\x98I\xe0\x02L\
-\xa3P\x05&M\x1at&\xce\xa8=\xa7j=`t\
-\xc3S\xac$\xb5jm\x00\x15\x01\x08g`/\x8a]\
-\xcb \x02\xd4\x07K\xd3N\x5cK\x97!\xc4\x00d\x05\
-~,\xe9Un\xc2\xba6G\x16\x80\xe0`\xe4\x83\xaa\
-~\x07\x02\xd6\xd8\xd3\xa1H\x04\x05\x12+^\x0cV\x80\
-J\x8b\x1b\xd0\xca\xa5\x9c\x18@^\x8a\x0f\xbeF\x05,\
-\xb9dh\xac\xa4K\x17\x04``o\xc4\xd3F\xeb\xaa\
-N(@\xc2D\xd8<\xe9\xce\x96\xc8\x80\xebk\xc72\
-u\xef\x968\xc0\xedk\xd1a\xc5\x0e\xa7\x08`\x81D\
-\x0f\x9a\x93O]~\xb1\x80k\x84\x97\xa5#\xa5.\xd2\
-z\xc4\xc8#\xb5r\xff\x17|\xdd \x02\xc4\x15\xa7\x8f\
-'\x8f\xfa\xe7\xfa\x92\xde\x13f\xb7\xe8\xfe}\xc9\xf9\x07\
-\xd1S\xaci_\xa6\xf3\x84\x0f\xf8\x94Q\x7f2\x01`\
-\x1cv\x04\xae\x07\x1cB\x0b&8\xdcg\x07\xfd\xe7 \
-u\x09Lha\x83\x16\xf6\x07\xa1Aqe8[t\
-\x11z\x98`3\xc8\x89\x98\xd8\x81\x06mh\xa2_\x0c\
-$D\xc0\x8a\xaa9S\x18B\x1d\xc2\xe8\x97\x8a\x03A\
-`\xa3d%\x0e\xf4\xe2\x8e\x89Ih\x90~@B\xd5\
-b\x91\xcb\xf5(P\x85H\xa6e\xdbA\xe55i\x14\
-\x8e\x02\x11)\xe5LV^\x09\x16\x88\x05\xe1\xa7%O\
-(~)\x97\x90\x04\xfd(fO^\x9e\x19\x15x\x07\
-q\xa9fT\x18\xbe)R\x8dr\xd6i\xa3\x9bv\xf2\
-\xa4d\x9e|\xdaHg\x9f\x80\x12\x98e\xa0\x07\xb1i\
-\x10\x9e\x84&\x9a\x16\x99\x031\xa9\xa8D\x8e>*\xd2\
-M\x08\xe9(\xa9B\x83^\xaa\x90\xa1\x9aVdi\x9b\
-\x9d\x22\x14\xe0A\x91\x86:P\x9c\xa6\x0aV\x90\x00 \
-P\x80A\x0a\x97>\xffy\xd0W\x00\x5c\xd0\xcc\xad\xb7\
-~J\xe8\x9e(B\x80\xeb\xaf\x7f\xf2\x99\xe6\x90\xbf\xfe\
-j&\xa0\xce\x1c\xbb\xea@\x01\x14\xfb+\xa7y\x1ey\
-\xd0\x8cU:\x8b\xab\xb2v:CAB\x1b\x1e`\xed\
-\xad\xd0\xca\x19\xac^\xc8\xb5\xf6-\xb6rn\x8b\x10\xa3\
-\x00x\xfb\xed\xb0b\x86\xab\x17\x91\xe6Z\x8b\x00\xaaZ\
-\x02\x80\xee\x92\x08\xb5\xfb-Kv\xea\xcaaB\xbe\xfe\
-K\xa5\x94\xe3\xf2K\x9b\xbb\xf6\xe2[\xa4\xbe\x095\x93\
-i\x03\xff6\x83\x9b\x96\x18(\xc4\xe8A\x11T\x9c1\
-\xa0\x078<\xd0\x00\x157s\xb0\x98&WT\xef\xb7\
-\xf2\xae\x98i\xa9\x129P\xf1yH\x0ep\xd5A\x07\
-\xec\x89\xd0\x00\x0c\xdb\x9b\xa9\x836G$\xadE\xd6\xcd\
-\xfc\xf3\x8e\x1bST\xf0\xbf\x90\x9d)+I\x09\x94\xdc\
-\xcc\x05\x22~\xacP\x04:Od\xa0\xd4\x18d\xbd\x9c\
-\x00\xa3*\xe4\xdbL\x02\xf4|n\xc2\xcb\x81p3B\
-\x07\x1cM\x11\xcfR7\xb3\x81}\x03\x84-\xb6\xdb\x15\
-\xc1-5\x01DQ\xb5\xb7A\x948\xe3m\x91\xdeR\
-S\x806j\x0c\xec\xbb\x9b\x00\x1d\xc7\xcd\x12\xac\x9dM\
-\x08\x80\x04\x8e\xdfJ\x00\x08^\x93\xe4\xd0\xda\x11\x09<\
-f\xe5\xb8z\x00\x82\xc8\x15\x01\x90\x82\x07\x17\x1d\xd02\
-X\xbd\x81\x8e\xeb\x03.\x91n\x10L\x1b\xd8]\x91\x03\
-\x82\x17%@\xd4\xae\xff\x8a@K\xcf\xf4\x0dSPD\
-\xd5\x1e\x13\xbc\xa55`\xb6\xe3\xaa% {b\x02,\
-\xe0\xbajC\xd3\xcd{\xdc\x895\xe39\x81\x01\x5c_\
-\xb1\x5c\xcd,\x90\xfbr\x03H\xff=V\x0e\x18\x909\
-\x81\x9e\xc9lmT\x09\xac\xbe\xa2\x00\x0d4\x8ekQ\
-\x0e\x88\xff&\x00\x83\xf1\x1e\x13\xb5\x81\xc2\x8b\xc2\xae\xf6\
-\x8c\x04@\x80\x01\xeb{T\x02K\x13\x10\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,\x12\x00\x12\x00r\x00r\x00\x00\x08\
-\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x14\xe8\xac\
-\xe1\xc2\x87\x10#J\x9cHqa\xc3\x8b\x181V\xdc\
-\xc8\xb1\xa3\xc7\x8c C:\xf3H\xb2\xa4\xc9g\x22S\
-f<\xc9\xb2\xa5B\x9505\xba\x9c\xe92\xa6\xcd\x8b\
-4s\x92\xbc\xc9s\xa4\xce\x9f\x14{\xf2\x04J\xf4\xa1\
-\xd0\xa1E\x93\x1e<\x8aT\xa9\xd3\x81Lm>\x9d\xba\
-4\xaaL\xaaX\x09Z\xf5\x99\xb5+C\xa6^\xc3\xa2\
-\x04+\xd6\xeb\xd1\xb2f\x85\xa2M\xdbt-\xd6\x9en\
-\xbb\xc2\x8d\xfb\xf6&]\xb9R\xef\xd6\x8dY\x12\xc4\x03\
-\x04\x1e\x02\xe8\x95\x98R\x00\x08\x10\x02\xb8n\xc4\xd0\xac\
-qc\x10\x83#\x82\x04\xb0\x81 \x06\xc5\x13!8\xde\
-l 2D\x8c\x00\x1e\x18\x84\xb0q\xc0\xe6\xcd\x08\x00\
-x6\xda\xb0\xf3A\xc1\x14)\x9c\xde\x0c{\xf5Kg\
-\x08\x10R\xa0\xc8`\xf6\xe6\x01\xb6-b.X@\x22\
-\x00\x02\xbe\x1b'\x08nt9B\x02\xaa!\x1aH\xde\
-\xb86\xf3\x84\xd6\x0d\xba^(\x00\x01u\xe7\xd7;\xe6\
-\xff~\xb8\x80z3\x01\xe1!6\xeb(\xc0<\xe9\xf4\
-\x0f\xdf#D\x9fpz\xf2\x03\xd1\xe1+\x04p\xa0\xbe\
-B\xe4\xc9\x15\xa7\xdfC\x0d$D\xc0p\x02\xf5\x96\x9c\
-\x03\x03F\xc4 B\x0c $\x01u\x026\xb8P\x85\
-\x06-p\x10\x00\xd4\xe1g\xe1C\xfc%\x94\xdf@\x0d\
-P\xa7\xe1\x87\xe4%T`A\x0fP\x07\x1c\x8a\x0b\xbd\
-x\x90h\x04q\x98\x5c\x040B\x84#B#\x06@\
-a\x8e\x04&\x14\xe1@\xf6\xf96\x22\x90\x14m\xf7L\
-\x02\x0b\x22\xf9\xd0\x83\x06\x81\xf7\x8c\x89N.t\xe2R\
-\x02\x99\x16`\x95\x0a\xadx\xd0\x8b%&'#\x97\x06\
-\x8dI\x9c@\xe5\xf9\xd6\x1f\x99\x09\xadw\xd0\x89L\xfa\
-&%\x9b\x05\xcd9\x90sq\xce\xa6$\x9d\x109\xd7\
-\xa2o{\xf2)P\xa0\x02\xd1H\x1d\xa1|\x22\x8a\xd2\
-\x94[\x0az&B#Q\x97\x9d\xa3\x93B\xa5\xa5o\
-\x95\xf2\x99\xe93\x03\xf8\x98\xdc\xa6l\x82\xea)\xa6\x8e\
-N4\xeal\xa0\x96Z\xd0\xa5\xa8\xaa\x0a\x11p\x92\xba\
-\xffj\x14\xa3\xa4\xca\x9a\xea\xa1\xb2B\xe4@r\xf2\xa9\
-\xda+A\x0f\xe6y\x9a\x9d\xb9f\x98\x1c\x01\xb9\x22\xab\
-P\x91\xb3\xc9\x8a\xe0\xa0\x09\xc6\xaaj\xaa\x9c\xe2\xaa\xaa\
-\xa2\xf4=s@r\xc4\xb2\xd9\xed\x9a\x02M\x98\x9c\xaa\
-\xcf>#\x01Aa\xfa6\xa4\xa0\xeb\x1a\xe4e\xb5\xc9\
-\x9d[,Afn\xdbXA\xcd\x1c)+\xb8\x03\xa5\
-y\x10\x86d\x02L\xd0\xaf\xd5\xea&\xe8n\x08\x99)\
-\x10\x94\x06Qk\xa1\xc3\x05\x11<\x10\xc2\xb9J\xfcL\
-{\xd8\x15\x9bm\x94\x09Q\xac\xaa\xbc\x08\xf9\x98\x90\xc0\
-\x9a.\xd4\xad@\xfa~8\x1eG\x22#d\xf1\xbcK\
-*\x04\xb1m\xedvd\x1a\x9f\xdd\x9d\xf42C\x1f\xd2\
-\xe8\xf2D!&\xb4\xb3mC\xa7\xac\x10\xc9\x04!\x8d\
-b\xcd\x11\x81\x0c\xa4\xd2\xe1rd\xf4@\xcd\xcc\x8cV\
-o\x0a1\xbc\x91\x9bB2\xc7t\x99$\xbd{P3\
-P_'6GW\x22\xc4\xf5`e?\x936I;\
-*T\xd9]\xce\xcc\xadP\x02\xe5\xe6\xf4\xc0\xc6\xcc\xc5\
-\xc6\xcd\x12\x00~#\xb4rY_\x1b\x14\xc1\xd4\x1e\xf1\
-\xbd_X\x94E\xa48K\x02\x04.\xb8\x5c\x22\x0c\x9e\
-P\x04\x8f\xb7\x04\xf8`\x01x,\x16\xe2\xaf\x15\xe5L\
-\xe7t\xbf\xbd\x10\x05\x22\xe8\x04\x80\x08>CdzQ\
-gC\x94B\xde\x13\xd1\xaev\xecI\x0d\xa0uD\x14\
-\x5c`\x81\xed\x069c\xc1\x05\x9e\x07\x07\x80\xd3\x15)\
-\xfb\x8c\x05\x03Y\xe0\xbc@\xcco@\x81\xf2\x155#\
-\x01\xe8J\xb5\xed\xd5\x01\x85g\x05\xc0\xd0X5\x03\x01\
-\xf60\xdf\xa9p\xf9\x08%`uX\x01\x9c\xfc\x93\xf5\
-\xeb\xa3%\x00\xf8,9\x00A\xe6\xd7\x0d\xb0\x00\xbf-\
-\x1d@\x7fz\x03h\x80\x04\xf8\xb7\x91\x03H\xa0\x01\xe7\
-s\x12z\x5c\xb3;\x830\x08\x02\x06\x08\x00\xfe\xc85\
-\xa6\x01\x00\xcf)\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,\x12\x00\x12\x00r\x00r\x00\x00\x08\xff\x00\x9d\x09\x1c\
-H\xb0\xa0\xc1\x83\x08\x13&\x1c`a\x80\xc2\x87\x10#\
-J\x9cH\x11\xe2\x00\x11\x1b(Ph\xc6\xb1c3\x0f\
-\x02*\x8a\x1cI\xb2$\x00\x11\x18\x1ex\x5c\xb9\x92B\
-\xc9\x970c\x0a<\xe9\x81\xa5M\x96\x0cd\xea\xdc\xf9\
-P\x84\xca\x9b@=\x1a\xe0I\x94(\x80\x0b\x04\x82*\
-\xed8\xb4\xa8\xd3\x97\x020 XJ\xb5Y\xd3\xa7X\
-'\x02\xd8P\xb5k\x80\xac`!\x82\x98\xda\x95j\x82\
-\xb0h\x0f\x06\xf8YV\xa9\x03\x03\x00\xd2\xcau\xb6\xb5\
--\xcb\x04\x10\x0c4\x08\xc0w\xae\xdf\x01l\xcb:\x80\
-\xc0\xc0\xa1\xdf\xc3\x04\x0b\x90\xed\x1a\xa1AH\xc4\x90\x07\
-b({\x00\xc2\xe3\xc8\x91\x01\x04v\xdb .f\xcc\
-\x9a\xab:(\xf0\xb9th\xaapK\x7f>\xadT\xc2\
-e\xd5\x90\x07$Uz 'l\xd0\x9bmFx}\
-\x1bqM\xa5\x0b<\xf7\x86l`)\xe9\xe1\x91\x0b\x18\
-G\x1ey\xc0\xe2\x9b\xc7\x99\x1f\x060\xfb\xe6\x81\xe8\xd2\
-\xfdBPj;\xfb_\xa5W\xbd\xcf\xff\xcd\xedq\x81\
-\xf8\xc3\xc5\x81F\x10~\x1e\xad\x80\xa0\x07x\xb7\x07\xbb\
- (\xf6\xf9`\xdf\x03=\x8b?\xedo\x9b\xf1\xf5\x87\
-V\x00A5  Z\xf5\xdd\xe4\xc0\x81a\x01`\x1f\
-\x83`5\xa0\x1e\x84`U\xc7\xd2W\x14>\xc5\x00P\
-\x0bf\xf8T\x826\x19\xe8\xa1S\x16\xae\xc4\xde\x88:\
-\x0d\x00\x94y(\x12%\xe1M\xdd\xb5\xa8\x13y\x1c\x9d\
-(#L@Ip\xe3N*\xde$\xe2\x8e1)w\
-\x93a@\xc2\x94\x9eME\xca\x94\xc0M\x11$\x19\xd3\
-s\xe59\x89\xe3M\xe1I)\x12P1ZI\x91~\
-6a\xa8eE\x04\xde\xe4\xe5\x97\x13\x85i\x93|d\
->d&Ki\x82\x09T\x9b\x14\xad\xb9\x12\x9ap\xaa\
-\x05\xd4\x98u&$\xa7Gx\xe6yP\x8f]\xfa\x09\
-\x11P\xf7\x09j\x10PU\x1aZ\xd0\x926A\xa0h\
-B\x8c\xde\xf5(B\xdb\xd9\x84\xc0\xa4\x07\xbdx&\xa6\
-\x05\xed\xd9Q\x96\x9c\x02\xe5(\xa7\x04Ep\xd3\x03\xa4\
-\x12T\xe9\xa6\xa9:#d\x88\xad\xd2\xff\x95c\xac\xce\
-\x98z\x93\x8dN2\xf0\x1b\x05}\x12\xa4)K?Z\
-)\x00\x94\x1e$\xc4%K\x04\x90I^\xa2\x039\x80\
-\xa5\x96\xaf\xaet)B\xbf\xb6\xa4e\x89\x1e%\xe4\xe0\
-\x9dRF\xbbR\x93\x09\x81\xc8\x92KNb\xdb\xd1\xa8\
-\x08\x01j\x13\xa8-\x1e\xc9*\xa4@%\x0b\xe4\xb0\x88\
-B\xe4\xe9\xb9@nd\x1d\xae\x06E\x1a\xa8\x8c\xd5\xae\
-\xc4\xec\x9fA\x11\xc0\xef\x81\xf4\xee;\x91\xb8,a\x80\
-\x22k6\x0d\x8c\x90\x00\x07\x04%1~\x93MXQ\
-\xc0+\x15\xda\x1f\xc7\x1e\x11I\x91\xbf,! r\x7f\
-\xde\xb2t\xb1B\x14\x07e\xf2\x81\xea\xda\xd4!I\x1b\
-\xba|\xb2x\xce\xc1wsE\x0c\x97\xec1s9?\
-\x18\x93\x04K\x81p^\xca,\xa1\x0b\x13\x00\xb6\x06\x85\
-\xc1\xc1\xa5]\xb0\x14\x7f:\xb5\xac\xd4\x03t\x82\x96q\
-P\xeb\x115@\xc5J!`\xf4m\x01\x98\xbb\xd2\x01\
-P\x97\xf45U\x0f\xec|\x18WK\x1d\xe0\xb6Lk\
-S\xb5A\xdaY\x89`\xf6\xd9sW\xc7\xdd\xb4R\x04\
-\xb0\x0bV\x00\xfa\xc6\xdd\xf7N\x00\x90\x5c\xb0\x08x\xcb\
-\x94B\xe1Ku-\xd7\xaaT!\xb0A\xd6K\x83\xb0\
-\xb7M\x124NT\x01`w\xe5A\x0a\x9eC$\x00\
-\x08\xffu\xc5\x22b\x038k\xd7\x03\x1b\x90.\xd2E\
-\x1b\xd0H\x9b\xe0s\x19\x10\xfa\xeb\x1b\x5cp\x81\x08\x16\
-4DW\xf0\x16\x88pAFP\xb6\x95@\xe9\xf9)\
-n\xd7\xf3]\x1d\x10,l\x0c\xec\x0e\xfd\xf5A-\x80\
-9h\x94c\xef}G\x09\x1c\xaeZ\x00=\x7foW\
-\x02\xbdf'\x80\x01\xae\x9b_\xd6\x02\xe2gW\x80\xf3\
-\xee\xaf\xe4@g(\x0e\xb0@\xfb\xf5s\xd4\xd8\xf6\x10\
-\x12@\x01\xf6\xf7=\xbc\x14\x80y\x19\x12\x00\x03 \x90\
-\x80\x04\xfc\xed&\x0d\x84\xc0^8\x05\x00\xbeX\xb0/\
-\xbd\x09\x08\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\
-\x00m\x00r\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\
-\x83\x08\x13&\x04`\xa1\xa1\x05\x01\x0a#J\x9cH\xb1\
-\xa2E\x82\x03@l\xa0@\xe1A\xb3\x8f C6\xe3\
-\xb8A\xc4\x80\x8b(S\xaaL\x98\xd1\x03\x02\x910c\
-\x86D@\xe1\x82\x05\x00+s\xeaD(\x00\x84K\x99\
-@\x83\x86\xf4 b\xa7\xd1\x95)<\x08]\xca\xb4\x19\
-\x02\x0c\x01\x8eJ\x8d(`\xc3\xcb\xa6X\x97\x12\xb8\x00\
-q\xaaWg\x020d\x1d\x8b\x15\x03\xce\xaf;\xc3\x92\
-]\xdb\x14\xc1\x85\xb3hQ\x02\xd8\xc0\xb6n\xdb\xa2q\
--2\xb8j\xb7\xafP\x02\x0c\xf2J\x14@\xc1\xee\x81\
-\x04\x10\x0c\x18`\x10 \x00\x00\x00\x8d\x034P\x9c\xa0\
-\xef\x06\xc1\x09\x0b\xf0\xcdz@B\x83\x93\x17\x074X\
-\xe0`\xed\x83\xae\x98\x07\xd2\x1d\x1b\xe1\xf3Q\x01\x06J\
-gE\x1085\x00\x8fX\x0f@@\xed5\xc0\x82\x03\
-Y/\x0b\x1e\xb0Y\xa8\x83\x02\xa9\x05\x16\x90\xcd\x94\x02\
-\x5c\xaf\xc4\x9b\x1eO^\xb0\x01p\xa6\x0f\x9e\x1f\x8d\xbe\
-\xf4\x00r\xea\x06\x01\x18\xff\xb8.4\xfbT\xeeB!\
-h\x07OP\x80\x04\xec\xebU\x0e`\x1a!*\xfb\x88\
-\x05\xc8\x035\xafS@\xf1\x98\x12\xc4w\x9fA\x03D\
-\xb0\x14\x7f*\xdd\xb6T\x03\x03V\x04\xc0\x02\x07\xe6T\
-XP\x07\xd8\xd7`E\x0d,e\x80J\x10\x08u\x00\
-h\x17ZT\xc0R\xbcQ\x14\x80\x87 \x86(\xa2P\
-\x16R\x04\x00\x01\x14\xa6\xa8\xe2\x8a@\xb58Q\x87@\
-}8\xe3J#\xc6t\xc0E\x0c\x08\xf5\xdd\x8e*\xf5\
-\x18\x92\x8e\x16\xc1\x08\xd4\x86D\xe6dd3\x0e\xd4V\
-\x91\x01AI\xd0dZ\x06x&\xe0B\xff\x81t\xc0\
-\x96W\xa6\x86\xa3LR\x86y\x9f\x00U\x9ay!\x84\
-2}\xa9\xe6\x80\x00\x04\xc5\xe4\x9b\xecQ)\x93\x03`\
-\xd2\x89V\x97\x1f\x0d\xa9grO\x8a\xe4\xc0\x9f\xec\xe1\
-\x16\xd3\x9c\x84b\x86&P%&\x1aW\x862Y\xe9\
-hj\x86\xc2T\xe6\xa4h-\xea#\xa6\x98A\x1a\x13\
-\x04\x9c\x0a\xf6\x9eL\x8d\x86*\x15\x9f\x11\x98\x1a\x97\xa6\
-0!\xaa\xaaT\x81\x86\xfft\xe9\xabF\x8d\x09\x93\x8c\
-\xb4\xeeT\x99L\xb9zUiH\xa9\xf6*\x15P\x0b\
-\x08{T\x9c2\xb9j\xacJ'\xcad\xe3\xb2)5\
-\x1bS\xa9\xd0Z$-LyV\x1b\xd1\xb5\x22=\xab\
-mE\xdc\x86\xe4\xed\xb7\x13\xc5\x0a\xd2\xb8\xe4\xe2Wc\
-\xba(\x85{.\xbb\x17\xb9\xfb\x11\xba\xf0\x1e\xc4j\xb7\
-\xf5Z\x04\x94\x9f\xf9F\x04\x14\xa8\xfdNd`L\x0f\
-\x04<\x11\x9b1e\x1b\xb0\x9d1\xd1k\xb03\xf26\
-\xa3\xec\xc3\x04!\x1bS\x02\x14+\xc4\x1cL\x19'd\
-+\xbe\x1d\x1b\x14\xa4L\x0c\x86l\xd0~&\x1b4j\
-\xc3)\x13\xe4)L\xc5\xb6,\x90\xc5\xd3\xca,\x10\xc2\
-\xad\xda\xec\xcc|2!\xa0\xb33\xbb\xc6\xc4\xaf\xc9\xe6\
-~D\xc0\xcf\x1b\x8b4q\xc7\x0c\xc7\x84k\xc74\xc3\
-D\x81\xce8\xc3Tr\xcb\x02\xe8'\x12\x02\xd4R\xfc\
-\xb2\xd4:\x07\xfd\xa9\xcd\xf7\xc244\xd3B\xda<\xf0\
-\xbe2\xf3\x1c\xd4\xd9\x147\xed\xac\xccU\xc7\x04\x82\xcc\
-+\x03\xe5\x81\xc2\xec\x02\x98\xb06P\x088\x5c\xaf\xdf\
-L]\x902\xe1KQ\xd0u\xbe\x88\x0b\xe5\x16\xdf\xdf\
-f\xdd\x96\xe1P\x8b\xfd\x17^\x19\xcb\xed\xf8\x06O\xd7\
-;@\xd2\x07\x82\x00\xb9\xb1\x00\xe4\x8d\x15\x05\x1b\xa4\xb0\
-x\xb5_\x8f\x85\x80\x07\x17\x5c \x82C\xce0\xd4P\
-\x0a\xb1\x83\xb0\xfa\x9f\x9f\xfb\xd5\xd4\xd2\x93\xe6\xe7\xfbR\
-\x82\xff)\x9e\xd6\xc3\x87$i\xae\xe2%\x1f\x93\xcf\xc6\
-\x0a\x00\x01\xf2\xc3k\xcb\x80\xe9~\xfd\xf8-\x00\x0d\xfc\
-m\x17\xf0\xc6\x0eP\x00\x04\xdeg\x15\xc1\xe8\xbd\x06\x90\
-e\x02\xa0\xc3\xe4\x80\x04pS\x1cYd\x9d\xb3\x17\x10\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\x00r\x00\
-r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\
-\x1e\x1c`\xc1\xc2\xb3\x0b\x02-\x00PH\xb1\xa2\xc5\x8b\
-\x183\x1e\x14\x90\xe2\x02\x05\x04\xcd\x9aQ$\xf0\x0c\x83\
-\xc6\x93(Sb\x14\x00\xe2\xa3H\x950c\xca\xd4\xf8\
-\xe0\xe5L\x82\x14n\xea\x84\x09@\xc4\x83\x9d\x0a7\x0c\
-\x00JT!\x00\x88E)>\x1011i\xd2\x0b\x08\
-\x9cZ\x8c*@\xea\xcd\xa6V16\xdb\x90U\xa53\
-\x10Q\xbb\x8a\x95\x1a\xe0\xe7\xd8\x93\x14\xaa\x9eM\x08\xc0\
-\xa4J\x07\x12\x0c\x04\x98+\xc0\x99\xdd\xa1\xcf\x18\xdc\xbc\
-\x80u\xed\xc0\x01$OFh\x10\xc0\xd9Z\x02z\xfd\
-\x0a\x04\x91R\xad\xe2g\xcd\x0a(\xf6\xa0\xd1\x80S\x06\
-\x12lZt+V\x80\xd9\x8b\x06\xfa&\x05\xd0 #\
-\x06\xc3\x8fS\x1fd\xe0@\xb5J\xcb\xaa5?N\x5c\
-Q\x82\xe3\xd4\x03\x12X$\x80\x97hX\x85\x07h\xbb\
-\xce\x88\xe0\xf6\xcc\xde\x0a\x13\x18\x1f\xfe\x0c\x80\x04\xbf\x81\
-\x15\xc2fn\x105E\xce1\x01|F\x18\x99\xbaB\
-\x08\x15%{\xff\x1f\xaf\x109J\xe1\xe4\x93\x12\x10\x9d\
-Q\xc0\xef\xf4*\x07\x1cH\xd8,gJ\xfb\xf0c\xa2\
-\x1f\x18\xb2\xd9\xf4\x8c\xe2%\xb4_~\x08\x81WP\x7f\
-!\x05\xa0\x11\x00\xef\x19\x14 \x81\x15\xe9\xc6\x1f\x82\xf5\
-id \x842\x01p\x00\x85\x14\x0e\x88\x90\x00\xb2\x11\
-\xd4\x1a\x86\x18\x0d\xc0!\x82\xd1U\x84\xdfB$f\xd4\
-\xc0\x89\xfd=\x98\x90y\x05\xfd\xd7\xa2E\x99\xc1\x88\x00\
-{7J\x05\x22\x8c\xfeQ\xb4\x1cA2\xf6X\xd1\x02\
-@\xee\xf8]B\x09Xg\xa4E\x02l\x08\xe3\x85\x06\
-\xf18\x90\x82Ofd@\x92Yv\xa5!\x90\x1e>\
-\x87P\x91]R\xf4\x22\x8c\x0b\x1cd\xe53\x0e8Y\
-\xa6E\x0e\xe8x\x10\x99\x02\xd9\xf8fE\x10\x80\xd9\xde\
-\x9d\x19\x99\x08\xa3\x98\x03\xad\x19\x01\x9f\x1a\xc5\x09c_\
-X\x1eT\x1a\xa1\x18\xe5\x09\xe3\x83v2\x8a\x92\x9f'\
-\x02\xfa\x8c\x84\x06\x8d(\xe9E\x86r\xf8\x9b\x9b\x04\xa5\
-\xb9\xe9E\x8e\x9exeBt\x8ejP\x00@b\xb9\
-\xe8F\xaaB\xff\xa9\xe73\x91>3_\xac\x16\x01\x09\
-\x1b\xa6\x05\xf1\x8a+\x93h\x0a\xe4\xeb\xaf\x19\xe5\xc8\xa1\
-n\xce4H,F[\x9e\x18\x15\xa8\x03\xa5\xba\xec3\
-\x05\x00\xf9\x0c\x8d\xa7N\x8b\x10\xab0&z\x90\xb7\xda\
-\x12\xc4\xed\x89\xe0\x86k\xd1\xb8\x1c\x96k.E\xe8R\
-\xf8\x8c\xba\xebnk-\xbc\xf1\xaejm\xbd\x17\xb5\x8b\
- \xbe\x171`-\xb4\x02I\xbbl\xb3\xa6J\xc7/\
-\xad\xf7\x0e+\x90\xa8\xf8\x12L\xe1\x88\x96\x12\xa4p\xb8\
-\xfe\x9e(j\xad\x08\x00\xacm\xa7\x08\xba\x9a\xd0\x90\xe1\
-\x0a\x10\x01\x85\xb5\x16$\xf0\xb4\x034`@\x03\xb7i\
-\xcc\xf0\xc1L\x22\x94\x22\xcc\x07\x95\x0c2\xcd8\xa7\xb4\
-f\xce\x09\x0d\x8a\x10\xb6<'De\xd0\x14eL4\
-A\x11\x13y\xf4@\x1e>33\xd1\xb7.\xbd\xa4\xd4\
-\x0a\x81\x98\xd0\xabG\xbf\x5cPqTGMu\xcd_\
-\xb3\x15vB%?C\x99\xd4>o+5\xd0uj\
-L\xb5\x01v\x8d]\xd0\x00v\xb9}\xb0\xd7\x0b\xd7\x1d\
-\xf7\xd1\xf2\x11b\x04\x81\xdeu/-\x00\x04\x09@P\
-\x17\xe0\x81\x1f\x8d\xf8\xe2{\xf3\xcc8\xe3D?\xbex\
-\xe4\x92#\x1et\xe5\x93\xe7\x8c\xb9\xe5\x9ao\x0e\xb8\xe3\
-\x9e\x7fNs\xe8\x99\xf3K\xfa\xe3\xa6\x9f\xbe\xf93\xa8\
-3\xaa\xfa\xebzo\x0a;\xec\xb2\xcf~\xba\xaa\xb6\x87\
-\x8ek\xee\x98/\xcb;\xe4\xd3\xfe.z\xb8\xc2\xdbM\
-,\xedK\x97N]@\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,\x12\x00\x12\x00r\x00e\x00\x00\x08\xff\x00\x9d\x09\x1c\
-H\xb0\xa0\xc1\x83\x08\x13&\x14`\xa1aC\x01\x0a#\
-J\x9cH\xb1\xa2\xc5\x83\x02D\x5c\xc0@\x81\x02\x81f\
- C\x8al\xf6\x80\xc2\x05\x10\x16\x00\x5c\x5c\xc9\xb2\xa5\
-D\x00)6|\x1cI\xb3\xe6\xc8\x07\x18D@t\xc9\
-\xb3\xa7D\x0b\x17\x1e\xd8\x1cJt$\x81\x0d\x03|*\
-\xf5\x09\x00\xc4\xcc\xa2P\xa3\x12\x00\xb1s\xa9\xd5\x89\x00\
-. \x88\xca\xb5k3\x0f\x01\xae\x8a\xc5\xb8a\xab\xd7\
-\xb3Q)\x84\x1d+V\x00\x06\xb4p\xbb\xaae\xbb\xf4\
-B\xdc\xbb]1\xa8\xa4\xdbR\x80P\xbc\x80\xa1\x22\x00\
-\xc1w%\x08\xb3p#$\x80`\xc0\x00\x83\x00\x01\x00\
-\x00\x80\x1c\x80\x81\x81\x05\x09\x0e\xe0\xa5\xb0\xb7pD\x00\
-\x1e\xe0:\x80\xc0\xa0sE\x00\x0c D\x80\x8b`\xad\
-g\x84\x0c\x10G=\xb0\xa0@\xd5\x9e\x00\x0aH@{\
-\xe1\xf5\xc1\x0d^\x0f\x180}5\xf7j\xb9\xc4\x0b\x83\
-\xee\xea\xa0Ar\xb6\x01\x12t}\xf0|,\x80\xbfP\
-\x1d\x14\xf0]0:W\xea\x9e\xaf\xcf\xffn\xc0\x1d\xb6\
-\x83\xa8\x08\x92\xd2\x1d\x80\x9dh\x84\xdb\xe5\x0b\x020\x80\
-^\xbdX\x00\xb2\x87\x1a\x88/1\x80\xe6\xa2\xe0\x15\xd7\
-\x9eM\x0e\xd8\xc7\x9fB\x00H\x07`u-\x85V\xd4\
-\x02\x0c\x1eh\x10}EQ`\xd5[Em'\xa1E\
-\x05@\x85\x81R\x1df\xb8\xe1J\x05\xfc7\x94\x86.\
-\x0d\x00\x15\x8a#Z4\x80\x895\xa5\xc7\xd3\x80#\x1d\
-``\x8b\x16\x05\xb0`K\x14\x9e\x88\xa3K!\x0e\xf5\
-\xe1J*\x12E\xde\x8f@\x16\xe5ZE4\x8a\xb4\x00\
-\x92=-@\x14\x01\x17\xf5XS\x02P\xe2v\x9e~\
-\xa7\xe5'\xd2\x01\xf0e\xb9\x92\x8eD\x85\x89\x90\x954\
-\x1d)&O\x10\x10e\xe1K^\x86\x84\xe5\x9aZ\x12\
-\xb5$Bm\xda\x04&\x9d>\x15i\xd3\x93\x0a\x09`\
-$\x9fJ\xa19\x92\x99\x03\xe5Y\x93\x03\x84.u\x5c\
-M\x80\x22\xf4\x14M,6\x9a\xe4P\x88:3\x14\xa3\
-\x96*\xb5eMj\x1a\xe4c\xa7>\x19\x1a\x12\x95\x08\
-IIS\x04\xa4*\x05\x00Q7\x0e\xff\x94`\x8d\xb1\
-\xb6\xca\x92\xaa\x90*T\xc0q\x110`\xabR~\xd2\
-\x84\xc0K\x99\xfe\xba\x92\x825\xd5j,]A\xa6\xb9\
-,w\xaf\xda$\xc1\xb3\xdc=:\xd2\xb0\xd4\xbe\x86+\
-M\xcafkU\x03C\xf9\xea-_d\xd6\xb4\xdf\xb8\
-|\x0d5-\xbat!;\xd2\x9c\xec\x8e\xa5(M\xf1\
-\xb2e*H\xf5\x8e\xd5\xecH\xf9\x8aU.M\xc5\xf6\
-{\xd1\xbf#\xdd)\xb0K\x04\x8bd\xf0\xc1,%\x1c\
-\xd2\xc2\x0c\x0f<\x14\xc4\x11W\xe40H\x14W<\xd1\
-\xc5\xcdd\xacqD\x1c\x7f\xec\x12\xb86\x89\xdc\xd2\xbc\
-\xfc\x9a|\xacM\xf0\xaa\x5cQ\x9c\xcd\xb4\xec\xf2K\x5c\
-\xceL\x11\xc7\xe7\xda,\x11\xc95y\xac\xb3@(\x8b\
-\x14\xe1\xcf\x025\xd9\x0c\xabD\x07:T\xa4I\x1ft\
-o3\xa16]\xd0\xa4\x87J}\x10\xc7H[]\xd0\
-\xb6#\xe5\xac\xf5@07\xd3m\xd2\xfb\x8a\xc4\xe9\xd7\
-\x03QP3\xda\xcep\xdcL\xc0:\x03@\xb5\x93l\
-\x0b\xf4\xb4\xd8u\x07K\x93\xccZ\xabX=q\xdd<\
-_Y7~e\xd6\xed\xf7\x9fuc\xa8'\xdc3+\
-n\x93\xb8_;^\xd3\xba_\x97]\xe3\xd03[^\
-0\xda\x9a\x8b\x14u\xd3\x03\x84\x0d\x12\xd3V\x8b~4\
-\xdbn\x1f\x8d\xf9\xcc\x0c\xb8\xb7\xfa\xcc\x82\xda\x14\xc1\xeb\
-6\x07\xadz\xdd\xb2\xba{;\xee\x04)\x0a\x01\xedR\
-\xfb\xacP@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x17\x00\
-\x12\x00m\x00q\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13\x0e\x1c`\x81\xe0\x00g\x0a#J\x9cH\
-\xb1\xa2E\x81\x00@\x0c$\xd0L!\x02\x0a\xcf<\x5c\
-\x10!\xe0\xa2\xc9\x93(\x0f:[\xe9l@J\x81\x04\
-6\xa4\x00\xf0\xb2\xa6\xcd\x82,sB\xbc\xf9\xec\xc1\xb3\
-\x14<\x83V\xd4IT\xe8@\x11;\x8d*\x15H\xb4\
-i\x82\xa5\x08.\xd0\x5c\x1a\xb4\xa9U\x09T\x9f!\xc0\
-P2kJ\xab`\x1bx\x15\xc8u\xecE\xb0`\x01\
-\x1c0\x8b\x00DR\xb3\x09\xd1\xcae\xb0\xd6,\x85\xae\
-pU\xca\x95\x0b\x80\x81\x81g\x0c\x020M\xfa\xd7\x80\
-\x84\x08)\xdb\xbe\xcd\xbb\xb7q\xde\x81w\x1f?k\x0c\
-V\xe8\x82\x8bm\x19S\xd6IU\x80\x81\xba\x141,\
-6\xba\x99\xf3X\x00\x0d\x1cT\xf4\x90\xb5\xf4J\xc9\x02\
-\x0b\xa8\x86M\xd05m\x82\x06:\xd2\xb6}\xdb!b\
-\xc9\xa5{#\xcc-\x11\xc1\xcd\xe0\xc2\x11\x0e\xf8=v\
-s\xf2\x88\x97#>\x98z\x92\xf2\xf3\x89b#\xb2\xae\
-\xee\xf8:\xcf\xbfg\xbb{\xff\xbf\xd9\x8cAx\xb9\xe3\
--\x0e\x00}\x10\x01^\x89\xe2\xd3\xf3\x0491\xbe|\
-\x9e\x05\xea\xa3\xbfo\x12<B\x04\xd4!\xb4\x17\x7f\xd5\
-=\x95\xd0v\x02\x0eH\xa0I\x00\xcc\x86\x90`\x09\xa2\
-\xb5 J.\x99\xa4\xe0\x84\x16B`\xe1~\x182\xe8\
-\xa0A\xf4\xd5\xc6a\x87&\x99\x97\x10\x84\x03\x8dH\xa2\
-I\x06\x1e\x84\x95\x88\x95\xad\x88\x12\x8a\x07\x05(\xa1\x8c\
-)\xb5\x18\xd1\x8d8\x9eDcA>\xa5hU\x8f_\
-1\xa7P\x8cD\x9e\x94\xddA\x1a\xc2\xc8R\x92)\x05\
-\x08\xa4^P\xd6\xf4b\x8dUJfb\x96pE\xc7\
-\xa5Y\x04|)T\x93*\x89\xc9\xd3\x96\x06\xfdh&\
-J\xef\x15\x94\xdf\x9aY\xf9\x07\xe7\x9c\xfcyYP\x98\
-t\xe6\xa9\xe7\x9e\xf0\xf1\xe9\xe7\x9f\x5c\x8e\x06\xe8\xa0\x84\
-\x16j\xe8\x89\x87\x22\xfa`\xa2\x08-\xc9(Er\x12\
-\xa4\xdb\xa3\x05]I\xe9\x8e:\x12\x94)\xa5\x82^z\
-\x90\x9a\x03\xbd\xe9\xe93\x91:4\xaa@\x96\x12\xc4\xde\
-\xa5\x00\x18w\xd0\xa6\x8f\x8a\xf5jP\xa9\x8f\xa6j\xea\
-\xa8R\x12\xf4\xe1\xa5\xb2\x16D\xa6\xa7x\x9e*\xec\xb0\
-\xc4\x9a\xd5i\xb1\x0a\xb5\xc9h\xab\xc8\x16\x84`\xb3\xcf\
-\xf4Z\x90\x9d\x8f*\xab\xea\xa9A\x0e\x07\xed@\x0e\x1c\
-K\xa8\xa3\x9fz*\xad\xaf\x9eV\x98P\x04\xde\x02:\
-\x80\xab\x08\x1d`\xee\xb6\xbcN\xda\xec\x05\xf2\xbaH)\
-\x00\x14\xd4K\xec\x00\x1c\xe9{\xed\xb2\x1b4#\xb0\xbf\
-\x02\xb9\xcb(\x03\xfd\x0e\xec\xaf\x03\xef\x12\x1a@\xbe\x0a\
-+<\xea\xc3\x11W<\xa9\x91\x80\x0a\x00\xc2\x03\x16w\
-\xdc\x8c\x04\xb9\xea\x09\x80\x08\x1ex\xec1\xads\x0a\x90\
-\xc2\x06\x1c\x9b\xdc\xf1\x01h\xc29\x00\x08\x18@\xec\xb2\
-\xc9\x09X\xfb%\xbf7\xf7|\xc0\xb8b\xb6\xda\xf3\xcd\
-\x0b\x84lf\x03C\xe3\x0c*\x9c\xb9%]q\x02K\
-\xcf\xd9\xb4\xd3\x02K\x105\x9dH;\x1dA\x03F\xef\
-9\xc0\xd0\x11@\xd0p\xa1\x10x\xec\xc0\x02\x0ct]\
-h\x01\x098\xe0@\x02\x06\x14p\xb5Y\x01\x01\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,0\x00\x12\x00T\x00r\x00\
-\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\
-\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\x8b\x183\
-j\xdc\xc8\xb1\xa3\xc7\x8f C\x8a\x1cI\xb2\xa4\xc9\x93\
-(S\xaa\x5c\xc9\xb2\xa5\xcb\x970c\xca\x9cI\xb3\xa6\
-\xcd\x9b8s*\x1c\xa0\xd3\x22\x00\x0c\xcd\x9a\x11(\xd0\
-S\xe2\x00\x04A\x93b(\xfa\x10\x00\xd2\xa4I\x892\
-e\xd8\x00*T\x04\x02\xa6.\x94`\x15*\x05\xad\x0a\
-\x0dt\x85j\x00,B\x01c\xa1\xf24kPl\xda\
-f\x0f\x00\xb05\x18\xe1m\xb3\xb2s\x09\x0e\xb0\x8b@\
-n\xde\x81U\xdf\xe2\xfd+0\xc1\xdb\xbe\x84\x05\x0a8\
- 8\xb1@\xb7c\x11'\x06\xc08\xed\x02\xc7\xce\x02\
-G\xc6\xec\xcc\xc1[\x06\x98\x0b\xbc\xbd\x8c\xd9sZ\xbf\
-\x89!\xbc\x95\x9axoZ\x09\x9cM\x8fEM\x18r\
-W\xd0\x8e\xd1\xa6\x1d\x9c\xb8\xee\xd8\x04\x9c\x17\xa4E\xc0\
-Ys\xd7\xac\x8e]\x8f\xc5\xed\xb81f\xc3\xbf9\xab\
-\x8e\x8e\xd9\xf6U\xce\xd6\xa1rf\xf0\x96s\x80\xee\x98\
-\xbf\xa7\xff]\x9bX\xfc\xd8\x00\x98\x01\xbcE\xef\xd8|\
-W\xf6\xe5\xdf\x22\x8f\x9f\x16;x\xc7\xd9\x83\x1e\xb0O\
-\xdd1\xf4\xae\xc0a6\x1af\xcau\xd5\x00f\xc6Y\
-E\x1ea\xc2\xd5\x87\x19\x01i\x05\x98\x98nc\xf1\xf6\
-W~A1G\x18\x84\xa7\xb5\xf7\x96\x84\x0c\xae\xe6\x98\
-Si\x1d@[^\xa2Y\xf6\xe0z\x8e\xa58\x96\x03\
-+\xee\xe6X\x82V\xcd\x97\x17\x89*&\xe6\x81]6\
-\xce\xc5\x9ds\x7f\x01\xc0\xe1X&&F\x81]\x16\xb2\
-\x85aP0\x12\xf6#\x8b\x7f\x1de\x17iyI\xf9\
-V\x91U>\xf5Y\x94Z\xca\x98\x17\x03]\x8e\x05[\
-^ \xd8\xc5\xe4\x89S\x01\xb0\xa3\x99\x07,\xa8U\x00\
-a\x12\xe9&S\x00l`\xa6~s\x16\x05B\x9cr\
-\x9a%\xc2\x90l\xe6\xe9\x90\x08\x1e\x10\xe0\x81\x08%\x01\
-\xf0\xe7\x9dIE hC\xd6!\x80\xc1\xa3\x17\x09\xb0\
-\x01\x9f\x1f\xa2\xf9P\x81V= B\x8f\x15\xa5\xb0\x01\
-\xa0\x8c6C%E\x5c\x99\xf9\xc0\x06\x16L$\x00\x08\
-k\x96\x87\x0a\xd5\x01\x1aR$kP\x0fxpA\x0a\
-\x16X\x80\x9a\x00\xbd^p\xc1\x06\x14\x90zk3\x12\
-h\x1a\x91z\xc76\xeb,\xad\x1bU\xe6\xec\xb4l\x1a\
-\xa0,E4R\xabmP\x0b\x80\x9aQ\x03\xd2nK\
-m\xb7\x22\x09`\x80l\xe2\xca\xea\x80\xb5'1\x90j\
-\xbafJ\xc0ZJ\x024\xe0\x1b\xbcP\xc9{-J\
-\x00\x14\xb0\x00\xba\xd3F\xb0@\x01\xfb\xba4\x00\x03\x06\
-Hp\xaf\x99\x09H`\x00\x03\x05\xdf$@\x00\x14\x07\
-`@\x03\x15\x07\x10\xf1I\x01\x01\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,\x1c\x00%\x00h\x00_\x00\x00\x08\xff\x00\
-\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\
-\x87\x10#J\x9cH\xb1\xa2\xc5\x8b\x183j\xdc\xc8\xb1\
-\xa3\xc7\x8f C\x8a\x1cI\xb2\xa4\xc9\x93(S\xaa\x5c\
-\xc9\xb2\xa5\xcb\x970c\xca\x9cI\xb3\xa6\xcd\x9b8s\
-\xea\xdc\xc9\xb3\xa7\xcf\x9f@\x83\x0a\x1dJ\xb4\xa8\xd1\xa3\
-H\x93*]\xca\xb4\xa9\xd3\xa7P\xa3J\x9dJ\xb5\xaa\
-\xd5\xabX\xb3j\xdd\xca\xb5\xab\xd7\xaf`\xc3\x8a\x1dK\
-v\xa4\x00\x0c\x14(l\x10\x10\x16\x00\x82fp\xe1n\
-\x00\xbb \xae]\x08^\x05\xd8\xb5\x8b\xc0\xab\x81\xbdv\
-\x01t%\x008n\xd7\x00\x85\xe1J\xe8Z7q\x01\
-\xae\x00\x127; xk\x03\xc9\x0b\xba>\x90<\x80\
-k\x01\xc9\x11 \xbfM\xdc\x80+\x04\xc9\xcd*g\xd5\
-\x8bY\xa1\x00\x0bl\x9dR@\x1d\xdb\xe0\xd9\xb8\x0fT\
-'e\x80\xda\x00\xc2\x01\xa3q\xeb6\xeaV2e\x84\
-\x84\x01?H\x0a`\xb3\xe4\xc7\x07y'\xc6\x80\xd4\x03\
-\xea\x04\x09?K.]\xf44\xea\xce\xbfQ7\xff\x0b\
-@T\xbbd\xbc\x0a\x13\xa0F\x00\x1e\xe8\x00\xf1\xc7\x15\
-\x0e8\xb0\xbe}\xcf\x02\xc1\x0b\x1f\xb0\x9f]<{\x9f\
- \x88\xd7\x0ct\x0dy'\x19\x02\x04\xe6\x84\x81\x80\xbe\
-A\xa4\x9ex\x17\xe4\x04\x80u\xe2e\x16\x11\x00\x0e\x08\
-\x88\xc1p1\x09\xe0\x1cj\xa1M4\x9f\x80\x04\x907\
-\x13\x08\xf9%\xe6\x00\x87\x0f\x8d(\xe0\x06,\xa64\xc0\
-\x87\xa8\xedw\x91\x8b\xe2\x11\xc0@K\x00l  \x5c\
-\x11\xc4\x18\x11\x8e\xe2Q`\x22J\x01$'\xa0\x04B\
-J$@\x04?\xc2EA\x0a%\x01 \x82\x92\x02Z\
-\xc8\x11\x00\x12D\x09\x17\x01 4i\x91\x00\x1b\xa4(\
-^\x82\x1d\x19\xe8\xa5\x07 \xd4v\x11\x00)P\xe8\xe5\
-\x01;\x8aT\x00}^\xe2\xb6A\x0an:\x04\xe7\x06\
-4z\x19\x01\x7f \x09\xf0`\x9e|\xa9u\x81\x08\x16\
-4*\xd8\x00\x8d\x8ap\xc1\x05\x18\x04\x9a\xe7\x01\x0d\x9e\
-\xd4\x00\x9e\x88v\xea)\x5c\x09\xf4i\x92\x00\x8d}j\
-\xaa\x80t\xbe\x14\xc0\xa1\xa7\xb6z\x97\x98'\xadH\xea\
-\xaa\xab\x0b\x10\x0a\xd3\x00\xa5\xce\xea\xa5\x03\x06\xc0\xea\x12\
-\x00\x0dd\xa8\xabx\x09\xa0\xb9\xd3\x00\x0d@9\xac]\
-\x0e,p\xa4P\x00\x14\xb0\x80\xb2\xa76[\x80\xa8G\
-\x05\xd0\x00\x04\x09P\x0bZ\x02\x09@\xc0\x00\xb6Q\x05\
-`\xee\xb9\xcf\xca\x14\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,\x13\x00N\x00o\x006\x00\x00\x08\xff\x00\x9d\x09t\
-f\xa1\xe0\xc0\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#\
-\x0e\x04\x80\x01A\xb3\x8b\x04\x06H\xdc\xc8\xb1\xa3\xc7\x8e\
-\x0f.\x8al\x86\x00\xc0\xc7\x93(SJd0rd\
-\x03\x950c\xc64\xd0R\xa4\x04\x998sr\xa4Y\
-\x93\xa4\xce\x9f@\x176\xe8yQ@\xd0\xa3A\x03\x10\
-mV\x00\xa9S\x9dK!<\x9d\x1a3\x02\xd1\x07T\
-\xb3\xa2\x84\xb0\xd4\xa8\xd6\xaf\x1b\x0b,}\x09\xb6\xecC\
-\x01Ko\x9a]\xcb\xd0*Q\x93l\xe3\x1e\x1cJ\x94\
-\xac\x5c\xb9h\x89\x12\xb8\xcb\xd7\xc1R\x06|\xe5\xf2\xec\
-I!p\x5c\x00K\x9b\x050\xccv\xc1\xd2\xc2\x8c\xcd\
-\x0eH\x0c8r\xd9\x04K\xf7Z\x06\xabt\xa9\x81\xcd\
-`1/]\x0c:\xeb\xe4\xccpKOu\xbc\x14\x83\
-j\xaa\x02\x0e$\xb6\xfb\x1a)\xdd\xa5Mk;\x15\xbd\
-T\xa3\xee\xa3\xb1\x13#\xf0\xfd\x1b(K\xe1\xc4\x8b\xeb\
-d\xbd\x14An\xe5:y\xe3\x86\xae\x13\x80\xdb\xc4\x18\
-RS\x87\x19<q\xb3\x07^\xb7\xc3\xd2\x1c \xdb;\
-\x02\x10\xe2c\x92\xf7~\x91B\xf2\xf4\x1f\xd7\xb3o\xb6\
-A;\xfc\x8e\xd6\xe77#P\xf9\xbe\xc7\xfc\xfa= \
-\x82}\xfeE\xc4\x95~$m\x10^N\x02\x80\xb0\xc1\
-\x05\xa4\x19V@y\x08z\x90\x02\x81\x1f5\x18\xd2H\
-\xcf\x056\x80_\x08\x8a\xf4\xc0\x06\x17v4\x80\x08\x1b\
-\x100\x9ae\x83\x85(\xe2\x83\x17\x88P\x90Q\x00\x14\
-d\x81\x08\x17`@\x81E\xec\xa9\x15\x99\x00\xd2\xb9(\
-${\x08\x94\xc6\x00\x85C&I\xd4\x82\x91\x01p\xa0\
-\x92P\x8eT\xdb\x00\xccE\x99\xe4\x02\xbf\x09`\x00\x88\
-V\x86\x98\x00\x86\xaa\x15\x10d\x97DI\x10!uT\
-rI\xa6M\x05\x80I\x9d\x00\x05,\xa0f\x92\x09@\
-\xc0\x80\x9b\xfe\x09\xc0\x00\x04\x09$0gO\x11\xd4\xd9\
-\xc0\x99\x05r\x04@\x00\x88&J\xe8Z\x01\x01\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,\x12\x008\x00Q\x00L\x00\
-\x00\x08\xff\x00\x9d\x09\x1c8@\xc0\xc0\x83\x08\x13*\x5c\
-\xc8\xb0\xa1\xc3\x87\x02/ h\xd6\x8c\x00\x08\x00\x103\
-j\xdc\xa8\xb1\x01\xc5\x8f\xcd\x1e`\xe4H\xb2\xe4F\x00\
-\x13AR\x5c`\xb2\xa5\xcb\x85\x0cT~$\xf0\xb2f\
-M\x032):\xb0\xc9\xd3d\x82\x9c\xcd\x12\xf4\x1c\xba\
-\x91\x00P\x96D\x936\x04\x00\xb4Y\x03\xa5P\x15\x06\
-h\x1a \xaa\xd5\x818\x81^\xdd\xba\x00\xe8\xce\xadV\
-\x1f\x00\x95\x00\xd6jS\x03e\xa36e\x90\x16*\xd5\
-\xb6J\xdf\xc2\x1d*@\xee\x5c\x9eS\x81V\xbd\x8b\xd7\
-.\xdf\x97ys\xee\xfd\x0b\xd8/a\x93\x81e\x0e>\
-lr\xc0Z\xc6/\xcfBv\x19a\xec\xe4\x96\x12\x80\
->\xb8l2kN\xce%c\x02\x1d\x00\x9a\xa3c\xa0\
-lKol\x0aA\xf5\xc6\xca9i\xba\xce\xd8u\xf4\
-l\x88\x05X\xdf~\x08\xe0\x00P\xd9\xbb\x1b\xd6\xce\x99\
-:8\xcc\xa6H\x8d/\xf4\x9d\x13\x81r\x86\x10\x9a\x16\
-x\xae\xf0t\xf3\x91\xd4\x0f:\x90\x9c\xfd`t\xa0\x08\
-\xb0w\xb0\x17\xc0<g\xf2\xee\xce<\xe74\x88\xdeY\
-\xef\xa6\x14\xda\x0b\xf4\xf8X\xfev\xf0\xa4\xdb\x8b\xd6,\
->\xfb\xcf\xa6\x1e\xc8\x97XNh\xb57\x1cj\xed\x01\
-\x00\x1b~\xed\x0dP^s\xc5e\xb7\x9ft\xed\xa9\x07\
-\xd4\x06\xede\xd6\x14E\x18\xa0\xa7\xe0\x86\x14Q\xc0\x1e\
-u\x0e\x82\xd8\x0c\x02 tW\xa2\x89\x0f\xe4\xf7\xdc\x87\
-&6\xb3A\x7f\xbb\xc1h\x22\x02\x11\x1aw \x88\x18\
-\xd0x\xdb\x8e\x1b\xb6F]n163\xa2r\x01,\
-\xb8\xe1b\xcf\x19\xf0`N>\x1a'\x80\x869\x91%\
-\x9f3\x0c\xdc\x07\xd2\x01.\xca\x07\xc0w\x1fMw\xe5\
-A\x024\x90\x00\x04]\x8e\xa9\xe6\x9al\xb6\xe9\xe6\x9b\
-\x0c\x05\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00'\
-\x00'\x00W\x00\x00\x08\xff\x00\x9d\x09\x1cHp\xa0\x00\
-\x10\x1e.\x00(\xc8\xb0\xa1\xc3\x86\x03\x104\x9b\x88\xa0\
-\xc0\xc3\x8b\x18\x9dE\x9c\xc8\xb1\x99\xc5\x8c \x09>\xe8\
-\xd8Q@\xc8\x90\x06Hvlp2\xe3\x00\x95\x1d\x0d\
-\xb4\xc48\x12\xe6\xc4\x013\x1f6\xb09qAN\x87\
-\x02$\xda<`\xf2'\xc3\x05<\x9b\xb14Z\x10@\
-\xd2\x04L\x19\xa6\x1cZ4\xaa@\x00Ba\xca\xb4:\
-p*L\x07\x5c\x07b\xe5\xf91l\x01\x9e`\xc3\x0a\
-\x94@V\xad3\xa7C\xdd:;ks\xabZ\xb66\
-\xabr\x85\x0b3\x82\x5c\xba0\x97\xaa\x85\xc0S/\xd7\
-\x046\xfd\xca\xe5\x09A\xeeK\x9be\xcd\xf2\xc4\xe9\x96\
-\xb0M\xb9\xce\x10\xc3\x84*W\xb3\xca\xc6r\xb3\x92\xb4\
-\xab\x96\xa7\xe0\xd26\x038\xe6\xa9\xdam\x00\xd6r_\
-\xe7\x8d\x0d\xdbum\xb5\x02n\xa3\x86\xd9\xda\xad\xee\xb0\
-<I\x87u`\xd3gg\x9b\x9c\xddzU\x89\x19\xb0\
-J\xc3Ve\xc3d\x80\x99\xa7q\xb7\xc4a\x12\xc0l\
-\x19&e\xb5\x0cLcD>`\xf3\x01f\xbc0\x9b\
-\xff\xb6\x9a{\xf6q\x95i\x1d\x93\xefx\xe0\xbb\x5c\x06\
-\xd9\x0f\x18X\x88\x99\xa0\x00\xfb\xfd\x05(\xe0\x80\x04\x16\
-h\xe0\x81\x08&\xa8\xe0\x82\x0c6\xe8\xe0\x83\x10F(\
-\xe1\x84\x14Vh\xe1\x85\x18f\x08R@\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,\x12\x00\x1b\x00!\x00G\x00\x00\x08\
-\xff\x00\x9d\x09\x1cH\xb0\xa0A\x83\x00\x0e*\x5cX\x10\
-\xc0\x05\x04\xcd\x10l`H\xb1\xe0\x80\x07\xcd2f\xc4\
-P\xb1b\x00\x88\x1a5\x1a\xe8\xb8\xb0@\xc8\x93\x08\x12\
-\x92,\x88\xe1\xa4\xcb\x00+\x07\x02\xc0\xe8\xf2$\xcc\x98\
-\x03\x08\xd4<\xe9 \xa63\x01 wj,\x10s\xa6\
-P\x8d\x07\x06\xf8\xa4y4\x82\xd2\x98-\x8f6K\xa0\
-r%\x04\xa9\xcd\x16\xf8tfR*Q\x9f\x0c\xa4&\
-\xdd\x0a@\xe7Q\x06[\x9d]=\xfa\xd5\xe7\x00\xa9\x10\
-\xd2:\xa3pTk\xda\xae;#\xc8\x05\x10\xd4\xe5\x81\
-\xaa>\xd7\xeel\xeb\xf6h\x02\xb9\xce\x16\x1c\x15\xb0\xb7\
-\xef\xc9\x91r\xf1\xbat\x00x\xa9P\xb4r\xdf\xee\xec\
-\x89X\xf1\xce\x06\x88\xf9\x0a\xad\x1cS\xf2I\xbbr\x13\
-\x08\xbd)\xd7\xecd\xc4\x02\x1d|\x86\xedLB\xcd\xbf\
-\xb4\x01\xc8>\x19\x97\xb63\x00\x06\x0eh\xec\xed{`\
-\x80\x00\x8c\x8b+_\xce\xbc\xb9\xf3\xe7\xd0\xa3K\x9fN\
-\xbd\xba\xf5\xeb\xd8\xb3k\xdf\xce\xbd\xbb\xf7\xef\xe0\xc3\x8b\
-\x05\x1fO>z@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-\x15\x00\x15\x00)\x00,\x00\x00\x08\xc5\x00\x9d\x09\x1cH\
-\xb0\xa0\xc1\x83\x07\x01X\x10\x80\xb0\xa1\xc3\x86\x22(4\
-\x9bH\x01\xc0\xc3\x8b\x08\x05\x5c 0\xb1c\xb3\x07\x18\
-C\x0a\x14\x80\xc1\xa3\xc9f\x05D>\x04\xb0\xe1\xe4\xc9\
-\x04*\x11\x02\xb8\x80\xc0\xe5I\x041\x0d\x06\xe0h\xf3\
-\xe4\x81\x9c\x03Y\xf6\xb4)\x01\xa8\xb3\x01<\x87\x9a<\
-\xc00g\x01\xa5.\x174\x8dY\x12j\xc7\x03\x10\xa6\
-\xaa\x04 \xd1j3\x07\x05,\x02\x05\xf0\xc0+X\xa3\
-\x03\xbb*=`\x00\xed\xc0\x00V%\x88u\xeb\xcc\xc0\
-Z\x06t\x092\x18\x1aan^g\x00\x0e\xd8\x5c\xf0\
-W\xa7\xcb\x94\x85\x0d2\x10<\xd1A\x80\xc4\x19\x1b@\
-h\xe0\x17\xb2\xe5\xcb\x983k\xde\xcc\xb9\xb3\xe7\xcf\xa0\
-C\x8b\x1eM\xba\xb4\xe9\xd3\xa8S\xab^\xcd\xdaa@\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,#\x00\x12\x000\x00\
-\x18\x00\x00\x08\xab\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x07\
-\x0e\xb0\xc0P@\xc2\x87\x10\x07Z\x00qa\x03\x08\x00\
-\xce\x04xh\xc6\xb1#\x02\x0f\x0e#F\x04\x90b\xc3\
-\x83\x8e\x1e\x07\x10@\xc9\x12AH\x91\x06\x05\x80\xd8\xc8\
-\x92e\xb1\x9a,\x17\xc0,(\x00\x03\xce\x9f@9&\
-\xd89\x10\xc0\xca\xa0H[\x12\x15\x08!\xa9\xd3\x8eC\
-\x97&x\xfa\x14\xc2RgS\xa9\x1e8\x06\xf4\xc0\xcb\
-\x9d\x06\xb4\x06\x00\x00\xe1@\xcd\x08\x01\xaefLz@\
-B\x81\xaf\xce\x02\xc8\x1d\xabv`\xd3\x9a\x0e 0\x80\
-[7\xe2\xddf\x09\x1a\xf0\xedK\x14#\xe1\xc3\x88\x13\
-+^\xcc\xb8\xb1\xe3\xc7\x90#K\x9eL\xb92\xe4\x80\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,5\x00\x12\x00\x22\x00\
-\x0e\x00\x00\x08o\x00\x9d\x09\x1cH\xb0\xe0\xc0\x01\x16\x06\
-8ChA\x80\xc1\x87\x10\x17z \xd0\xac\xa2\xc5\x8b\
-\xcd\x08x\x00\xe10bA\x06\x080\x8a\xc4\x88 \x80\
-G\x82\x0fF\xaa\xb4H\xe0\xe4\xc0\x950\x9b\x99<)\
- \xe6\xca\x99'm\xaa\xc4\xe91\x82N\x91\x00\x5c:\
-c\xf0\xf3b\x02\xa1\x02\x0d\x1c\xc0\xc8a\xa5\x83\xa0H\
-\x05\x06\x98\x1a\x00*U\x06\x06\xb2\x16\x88\xca\xb5\xab\xd7\
-\xaf`\x03\x02\x00!\xf9\x04\x05\x02\x00\xcf\x00,A\x00\
-\x12\x00 \x00\x0d\x00\x00\x08q\x00\x9d\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x0f2x\xd0\xac!\x05\x0f\x17DX\x00\x90\
-\xb0\xa23\x06\x0d3jl\xf8`\x83\x05\x8b\x06\x09l\
-\x1c\xa9\xd1\x03\x08\x8a\x16\x05\x90\x5c\x99\x11\xc1\x05\x8b\x01\
-X\xcalf\xa0b\xcc\x99,+\x028\x80s\xe5\x80\
-\x8a\x06z\x92\x04i\x80\xa7\xd0\x86\x11@\x0a\x1cP\xc0\
-\x80\x84\x048\x0b(=\x08\xa0\xc0\x02\x07#\x13L\xb5\
-8\xa0\x81\x04\x07\x11\x0c\xa0\x0c\x08\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,J\x00\x13\x00%\x00\x14\x00\x00\x08\xa2\x00\
-\x9d\x09\x1c(P\x80\x05\x10\x16\x08*\x5c\xc8\xb0\xa1\xc0\
-\x02\x08\x9aIlF\xe1\x82\x05\x00\x0e32\x0c0\xb1\
-\xe3\xc4\x07 0j\xd4(\xc1\xa3I\x89\x1eR\x8ct\
-\x18\xf1\xe4I\x04\x18\x04\xacT\xe8\xb2\xa6\xc4\x983\x05\
-\xda\xdc\x89se\xc9\x9d6/\xac\x1cp\x00\xa8\xcd\x07\
-\x03F\x02\x80\xe0\xc0h\xcd\x0b\x225\x0a(\xb0\xa0\xa9\
-\xd3\x8e\x04\x92\xe6\x14\xd0 \xc2U\x89\x08\xb4\xe6t6\
-\x80\xe9U\x02c\x15\x16\xb0\x0aTl\xda\x87lk\x06\
-x\xbb\xb0AQ\x97\x07\xe82\x14\x90\xc0e\x03\xbd\x0d\
-\xedz\x5c\x00\xd8!\x80\x05\x12\x0f@(<r.\xc1\
-\x80\x00!\xf9\x04\x05\x02\x00\xcf\x00,P\x00\x13\x00-\
-\x00#\x00\x00\x08\xe6\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\
-\x13*\x5c\xc8\xb0!B\x11\x1b0\x80\x10\xe0\xb0\xa2B\
-\x0c\xcd2f\xf4 \xc2\xa2\xc7\x81\x054\x8al\x86`\
-\x03\xc5\x8f\x0e\x09\x8c\x5c\x89\xe1$\xca\x84\x00V\xcal\
-\xd6\xf2%\xc2\x003g^\x00`\xb3\xa0\x80\x9c3\x09\
-0\xe8I0\x02\xd0\x99\x14x\x12\x05`\xf4\xe8J\x04\
-\x01\x88\x0a,\xd0\xd4\xa9\xc8\x0bR\x05\x06X`Ud\
-\xd2\xac\xce\x04@8\xd0\xb5\xd9\x03\xa5Y\x01\x14p\xd0\
-\x15\xc1\x00\xb0\x03\x1b\x90u\xea\x16\xae@\x01\x09\xac\xd6\
-\xb5\xebL.\xdd\xb7|\xf1:%\x80\xd6n\x03\xa7g\
-\xf9Nu\x8aA\xf1\xe2\xa3\x05\x1c;\x0by\x14\xb0b\
-\xca9\x09K\xc6<\x13\x82\xe4\xc9G\xa3J\x96\x00\xf4\
-\xc1g\x00ls6\xf8\x8c3\xf3gg\x06\x80\x8a\x96\
-\x5cu\xe5l\xc7\x03\xe6\x8et\xf0\xfa\xf1\xc8\xa1\xbd\xfb\
-\x8at`9\xf8\x00\x08\x10\x22\x0f\x0c\x08\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,V\x00\x15\x00.\x009\x00\x00\x08\
-\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\
-\xa1\xc3\x87\x10\x1d\x02\xb0\x10\xb1\xe2A\x00\x1e\x9a5C\
-\x80\x01\x80\xc5\x8f\x0f4\x8aD \xe2cD\x08\x22S\
-6\xa3 \xc0\xa4C\x04*U^p\xb90@\xcc\x98\
-\x04\x06\xd0Dh\xf3\xa6J\x04\x05v\x1a\x04p\xc0g\
-\xcc\x99B\x0920\x1a\xd3\x83\xc7\xa4\x02\x078`\x9a\
-\xf2AK\xa8\xce\x00\x18\xa0:R'Vg\x03\x12p\
-mF\xe0\xe9\xd7\x06E\xa9>0\x8b\x15@\x04\xaek\
-\xbf\x0a\x04\xb0\x80+\x05\xb9\x03\xb7R\xc5\x80W`\x81\
-\xb4F\x83\xf6\x1d@\x15\xc1U\xbc\x05\xa8\xde\xed\xeb,\
-1S\x03\x8c\x1bS\xf5\xda\xb7\xae\xd1\x07\x91\x9d\xbd5\
-\x0a\x99\xf1\x00\xc01\x11\xb0\x95\xdb\xe0qf\xb1>E\
-G&\xca9\xb3^\x9f\x87\xf1\xb2\xf6\x09\xc1\xb5Q\x02\
-\x99\x9dM\xf5\xc9 \xb3\xe3\x9b\x0br\x83V9Z\xae\
-\xe5\x9b\x82=_\xce\xbd\xfbf\xf1\xb3F\x03d\x16\xd0\
-:ss\x95\x09r\x1f\x8f\x99\xfbwL\xe9\x91\x09\xfb\
-8l \xdcg\xe7\xc8\xa8cf\xcf\xbc=\xe5\xfa\xc8\
-\xafU\xe2\xb6\xed3w\xcf\x9b\xf6\xa3g\x06`\x942\
-\xe3\xe1\x22\xe5\xe6\x0cJ1\x05\x97\x9b[*E\x10\x9b\
-o\x06$`@o\x02\x05\x04\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,^\x00\x18\x00&\x00R\x00\x00\x08\xff\x00\x9d\
-\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\
-\x10#J\x9cH\xb1bB\x01 @\x08\xb0\xb8\x10D\
-\xb3\x8f\xcd.pD\x08\x01$\xc8\x07\x00F\x12\x1c`\
-\xd2$J\x95\x02%\xb4t9\x00\xe6\x83\x99&\x11\xd4\
-\x1c)\x13'H\x04)9\x06\xf0\xe92\xa8\xc5\x02D\
-O\x1a\xad\x884i3\x0f*\x9b&m\x10\xd5i\xb3\
-\x00U\x93\x02\xcdJ\x14*W\x9f\x0c`\x96$\xbau\
-$\x80\x08I!\xc0d\x99t\xa3\xca\x06I)\xc0t\
-\x96 )V\x95\x02\x0e\x10\x95\x0bS*\xce\x9d*\x1d\
-\x10]0\xd7o\xcb\xb2*\xf5\xfa,0\xd7\x00\xd1\x07\
-s\x01(\xc6\xe9V\xe5\x02\xa2Ta\x0a \x9a`.\
-]\xa2K9:^<w\xa8O\xb5s\x1f{\xae\xeb\
-\xd3\xf3h\x9cwU\xb2\xc5\x99\x19\xe6\xe4\x96\x06V\xfb\
-$<\x97\xf5\xcc\xce\x8d}\x02\x87\xf9\xba%\x01\xd7D\
-=\x9b\xc6\xa9\x9ch\xe5\x91\xcbg\xc6VIt\xba\xd0\
-\xea\xa5\x9d\xcfe\x90<xk\xef3#xs\xbe\x8c\
-s\xb8J\xdf-\xcd\x8f\xbc\x8937L\x00D\xdd\x7f\
-m\xc9\x18&y\x9c\xa1-\x22\xf0)~m|\xf03\
-\x016\x12z&\x1d0\xd7f>I0\xd7}3\xd5\
-g\xd6~>=gQq-\xf5\xf7 Q\x0e\x8aF\
-\x94\x03\xefA\x88S\x86\x13n8\x17\x01\x18\xc2\xc4\x9d\
-O\x07\xe4G\x11\x85&\xc97\x92a \xa5\xa8\xdbL\
-.\xaa\x04\x00\x81\xbcy&P\x01\x829PcA\x01\
-\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,Z\x00\x1e\x00*\
-\x00b\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\
-\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\
-\x8b\x183j\xdcx\x11\x00\x06\x04\xcd(\x0c\xe0xp\
-\x00\xc8f(\x9b\x15 IP\xc0\xc9\x94(G\xb2t\
-\x06\x01&\xcc\x073\x9d%\xb0\x09\xd3\xc0\xcc\x9d<S\
-\x06`\x19 hJ\x02\x00X\x025\xea\x93\xa4\x80\x03\
-F\x9b!\x10\xc0\xb2A\xd4f\x0bfJ\xb8*\x93#\
-\x00\xa8F)\xcc\xb4\x1a\x95*K\x07Q\xb3\xb2dp\
-5\xa9\xd2\xa8MI\xb25J 'Z\xa3]9\x92\
-\x0d\x0aa\xe6W\xba9\x17D\xcd\xbb\xb1\x00\x5c\xbfQ\
-\x13\xe4\xdcj4\xe7^\x9e\x845\x165\xbarf\xd4\
-\xbe3#\x18U<SpP\xce,\x0dDu<z\
-\xe6\xe4\xa0fI\x9e\xe69\x94h\xd4\xd6\xaa_\x9b\x96\
-\xed\xda(l\x8e\xabm\xde\xde\x98\x1b\xe6n\xc9Q\xdd\
-\x92|l3\xa7\xe8\xc63k~\xce\xb9\xd4&h\x92\
-\x97g\x0a\x88ZY.m\x92\xca\x83\xe6|`4\x82\
-\xf4\xb43\x0dS\xc1\xd6\x1a\x9c%\x80\xa8\xde\xab\x1ef\
-I`p\xed\xa0\x0efR\x88\xda\xe0}P\xe1\x1b\xe7\
-\x1bU\x8b\xfb\xea\xef\x8e\xedm\xc6RvA\xfdgQ\
-o0=\x97\x11\x00\x01\xdaF\x92\x07WI@\xd2q\
-F\x1d\x80\x1fF\xe2Q\xc7\x91IW)x\x11\x87Q\
-\x1d\x90\x1aF j\xa8\x11\x03/1\xb5\x11\x08W\xa1\
-$\xa1F\x18\xb4\xd8L\x04\x17R$\x00w-\x8a\x98\
-\x11\x08)V\x18\x99D\x02\xe8\x97\xe3\x8f\x11\xf1(c\
-3\x07\x10\xf9\x90\x08\x0d\xb6\x18\xc1\x88\x121y\xa4\x8b\
-5>\xc4@\x932bF\x11\x81GV7\x11\x82\xe8\
-)\xe9\x10\x852\xc6e\x11\x99a\x02w\xd5\x01ff\
-t\x17OlV\xf9!\x9c\x06\xc8\x99Q\x01w\xc5\x99\
-SA\x03\x18\xc8Q@\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,7\x00'\x00M\x00]\x00\x00\x08\xff\x00\x9d\x09\x1c\
-H\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#\
-J\x9cH\xb1\xa2\xc5\x8b\x183j\xdc\xc8\xb1\xa3\xc7\x8f\
- C\x8a\x1cI\xb2\xa4\xc9\x93(S\xaaL\x18\x00\xc3\
-\x83\x07\x22\x00\xac\xd4\x08\xc0C\xb3\x9b7=\xcc\xcch\
-\x13'\xce\x06;-\x0e\xf0\xe9\x13A\xd0\x8a\x01\x88\xfa\
-dpt\xa2\x00\xa58%4\x9d\xe8\x00\xeaM\x99S\
-!.\xb0\xda\x0ch\xd6\x87\x0c\xb8>\xf8\x0a\xf1\x00W\
-\xacd\x19n\xb5\xca4-\xc3\xb0V\x17\xb8m\xc8\x95\
-\xc0\x5c\x86\x12\xb8\x0a\xb8\xab\xb0\x00\xd7\xb6|\x0f\x02\xe0\
-j p\xc2\xaaP\xa5\x1a>\x98\xc0\xea\xd8\xc5\x06\xf3\
-Z\x85l\xd0\x80^\xca\x04-[\x0d\x80y \x5c\xa8\
-\x9c;;K\xbaY\xb4\xb3\xa7lM;#\xac\x9ak\
-\x01\xd3CK\x8b&\x0d\xda\xf4g\xa5\xa1;k\xae-\
-z\xb7R\xb4\x98%CU\xdd\x18j\x02\xd5\x0f\xac*\
-\xee\x8c\x1aja\xd1\x0d\x5c\x9b\x16\xaeto\xe7\xc1V\
-\x1d\xd8\xe6\x0a\xc1\xf4Z\xa8\x801#\xff8+:6\
-\xd4\x08\xa6!H\xbf>\xde*p\xc8~\x95\x9b&\xb0\
-\x1es|\xa8\x07\xe6\xb3\xd6\xcd\xf5\xc0{\xc3\x00\xb4\x07\
-\x95\x5c\x9d}\x07\x95u\x94\xd16 {\xfd!\x08Y\
-OV=GYt\x5ci\x87\xd9m\xe0a6\x80\x80\
-\x89i\xc8\xa1R\xfeQ\xb6!W7\xe5f\xd8\x88$\
-Jh\x18\x03\x1f*\x85\x1ed \x90xS\x04\xff\xb9\
-\x05\x00\x0526s\xc0\x00\x8b\x05\xd0\x22\x88<\x06\x06\
-\x00\x069\xde\x14\xde\x5c \xfc\x08d`\x22\xd0W\xe4\
-\x8e|5Y\xe4M\x0e\x04\x99\xd6\x00\x1b(iU\x02\
-5F4\x80\x05]J$\x00\x08\xc9M\x89\x93\x8a\x14\
-\x05\xe0d3\x04`\x00\x82\x95\x0f\x01\x90\xc2\x06k\x9a\
-\xa9\xa3\x89\x14\x09\xa0%\x05\x17\x5c\x00\x82\x05\x80\x0a\x04\
-\x00\xa0\x16\x80p\x01\x05u\xday\x93\x04aj\xa5\xe8\
-\xa39:\x80\xa7EZB\xaa\xe8\x01hbd\xe9\xa6\
->-\xe0`F\xcdqz\xa9\xa7 E \xaa\x9d\x98\
-6\x8a\xd1\x00f\x9d*\xa3\x04G\x862$\x80\x81\xae\
-\xe2\x14A\x03\xaa~\x04@\x00\x06$\xd0\xea\xa6\x0e@\
-\xc0@\xae&\x0dP\x00\x04\x09\x98*\xe3\x01\x09,`\
-@\x00\x9f\xf25@\x00\xd4V\x1bmP\x01\x01\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,\x1a\x002\x00j\x00R\x00\
-\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\
-\xc8\xb0\xe1@g\x10#:\x9cH\xb1\xa2E\x8b\x113\
-:\xbb\xc8\xb1\xa3G\x8a\x1a3~\x1cIrdH\x91\
-%S\xaatx\x12\xe5\xca\x970\x1f\xb6\x84\x18\xb3&\
-\xcc\x994m\xea$\x89s\xe3\xce\x9f\x1d{\x02\x1dz\
-Q(\xd1\xa3\x0d\x8d\x22]\x8aP)\xd3\xa7\x04qB\
-\x9d*\x13\x22\x80\x14 ,\x00\xc8I\xf5\xa9U\x0a\x04\
-\x11\x04\xf0\xd9\x95)D\x02\x06\x11\x00(\x0b\xb5\x00\xc2\
-\x06l\x9f\x1a@(!.\xd3\xb9\x07\x13\xd8\xb5Kv\
-/P\xb8M\xfd\x12\x0d\x90\xb0\xaf\xe0\xc3\x88w\x12N\
-\xacs@\xc2\xc5\x8ckB689\xf2\xcb\xca\x963\
-k\xae\x88y\xb3\xcd\xce\x02\x1d{V\x09\xf8\xa0\xe1\xd1\
-\x1f\xf1\xa2\xd6\xb9`\xf5S\xbd\xaeM&\x84\x10{$\
-\xe8\xda$K\x1b\x14\x8d\xbbh\xdd\x83\x07zw\x5c\x8b\
-\x10\xb6p\x8bn\x11\xaa>N\xf1\xf7A\xde\xcc\x1d\x02\
-@\x80\xd0A\xf4\x8a\xba\x0b\xd2\xbe\xce\x12-B\xe8\xdc\
-9Z\xff\x0f\xdf\x10\xacr\xf2\x0c\x19$lF|\xb7\
-\x05\x01\xe8\x15\xb6\xdeM\xa1\x99}\x0a\xed\xe3\x0fl\x06\
-\xbf\xe0\x00\x04\xf6\x05\xf8@~\xfa\x197\xd0t\x01&\
-\xe8At\x0b&\x04\xde3\x0d$(av\xb1Q\xc8\
-\x90\x01\x12J\xf8 j\xfdq\x96a\x82\x03\xe2\xf6\x00\
-G\x11|\x18 \x06\xb5\xa1\xa8\x10\x81\x04\x05`b\x80\
-\xc9\xa1fa\x8b\x0ba\xf8b31nV@3\x0a\
--\x97P\x027\xe2\x18]\x04\xa7\x1d$\xc0\x01A\xe6\
-X\xdb\x01\x1b\x22\xc4@\x90BFv\xdb@J2\x04\
-\x01\x94 0\xb6\xe3B\xf3UTb\x90\x18\xb0\xc8\xd6\
-\x05\x0cIP$C\x00|y\xe3\x03MN\xd5\xa0B\
-\x11\x88)\x9d\x9a/\x22P\xe5T\xde-\xd4!Gi\
-B\xd9\x8c\x07{>\xb5ACL\x92\xd4\xa7\x9f\x1b\xc8\
-\xf9S\x00y\x0eu(\x94\x08dyT\x00\xe61\x14\
-\xc1K\x00\x00\xe9g3\x04\x88\xa0\xa8J\x94N\x14g\
-LWn\xda\x0c\x02\x18\x04\x9a\x12\x00 4Z\xa6N\
-\x0c \x91ij3\x0f\x80\xa0jG\x22\xbci\x97\x00\
-tBI\xd0\x06)|\x8aP\x7f#^\xa4\x1eP\x00\
-\x94\xea\xebA\xd4\x0dj\xc1@\x02\x0c\xf0\xec3\x22\x5c\
-0(\x8f\x1d%p\xabN\x01h\xfa\xe2T\x07\xdc9\
-T\x01\x0e|\xcbT3\x12\x08\xfb\x13\x00\x06\xc8\x9a\xe0\
-kS\x22%\xc0\x02\x12\x22\xd5L\x02\xf1>\xc5n\xb9\
-\xf6\x0d\xd5\xcc\x02\xf9v\xc5\x80\xa6;E\xd0\x80\xba\xbb\
-6\xe0\xdcK\x06\xb4\x99\x19\x03\x0b\x94\xfbQ\x04]2\
-\x07@\x00\x80\x05\xb7\xd0\xa5\x06\xb8u&z\x95\x0d\xf0\
-\xf1R\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-<\x00r\x00H\x00\x00\x08\xff\x00\x9f\x09|&\xc0\x82\
-\x05\x01\x03\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9c\xc8\
-\x10C\xb3\x8b\xcd\x1e\x04\xa0\xc8\xb1\xa3\xc7\x8f \x9f\x19\
-\xc0H\x92A\xc8\x93(SRD@\x12\xe3\x03\x950\
-cvtF\x93f\xc2\x00-I\xca\xdc\xc9sa\xcd\
-\x9f\xce\x06\x8e\xccy\xb1\xa7Q\x9e@\x7f\x0a\x84@\xb4\
-\x99\x83\xa3PU&U\xfa,A\xd3\x04Q\xb3\x86\x9c\
-ZS\xa0U\xa2\x10\xb4\x8a\x9d\xc95\xe8\xb3\xa6\xcd\x0c\
-\x8c]+\xb1\xacY\xb4\x05\xd8\xcau\xe8\xf6\xd9\x00\xb4\
-\x1b\xe7\xeaMX\x17g\xd3\xbc{\xf7\xbau\xe6\x97(\
-\xe0\xc0s\x07\x17\xce\x89\x10\xb1^\xc5h\x1d\x0bv\xbb\
-\xb8\xa5\xe4\xc7\x94\xd16\xbe\xbc\x16\xf2_\xceli\x06\
-\xd8@\xc1\x83\x08\x005\x05\xe0\x05\xdd\xb9\x81B\x04\x0c\
-l\xc2e=v\xb3\xc2\xc6h\xd5\xd2\xd6\xea\x9a\xa1\xee\
-\x03M\x17\xec\xd6\x8a\xd5\xb7\xd7\xa6/\x87GE\xd0P\
-7\xd3\xa6\xca\xa1\x0ep\xd8\xbb\x00\xda\xe9\xd1{\xc6m\
-\x98\xf7n\xd3\xde\xd9w\x86\xffmh\xf6lS\x09\xe1\
-y&_X\x5c`\x04\xb4\x00\xd2\xc7\xb4\xadp\xbc\xc0\
-\x06hM\xcaW\x09~\xe1v\x81\xde\x11%\xdc~P\
-\xc5\x97\x90\x03\xf0\x11\x88R3\x0d\xb57\xd0\x02h\xf5\
-\xa7`L\x12>\xc3\x00Z\x04L\xc8\x13}\x02!\xf8\
-\x99\x86\x1c\xe9\xc7\x11~MQ\x00\x22L\x15\x0a\x04\x00\
-Z\xcd\xfcw\xe2C\x87q\x04aS\x19\xbe\x08\x91\x89\
-\x1fU\xc6\xa0@\xcd\xa4h\xa3@..\x84\x9dC\x12\
-\xe8\x94\x10\x02\x1c\xfe\xf8L\x8d \xa9V\xd4B8*\
-9\x90}\x0c\xc5\xd8\x10\x84RFdeB\x0e>\xa4\
-\x9aCHJ\x09\x00\x93\x0b53dD\xbae\xd9\x10\
-\x06\x0f\x0d\xa8&Ji2t@\x92\x0f\x9d\xc9\x90\x8f\
-\xf2\x05\xb9\x10\x9e'\x89\xa8\xa0\x9d\xec\x81\x04\xc0S`\
-\x02\xfa\xe3\x01\x06~d\xe8\x91\x8b\x82\xd8\x8c\x9f\x1f\xe9\
-\xf9Z\xa3\xacI\xaa\x90\x9bP!`)h D\x84\
-\x1eL]2tAy\xac\x01\xc0&D\x11$*\x16\
-\x06\xaa^&\xc0z\x0e\xcd\xd0\xb9\xd3\x00\x07DD\xc0\
-\x96{\x81\xc0\x5cD\x94\x86D\xabD\x1b\x90\xaa\xd7\x00\
-\xb0\x0e[\xab\xad\xb1\xe9\x05\xc0\x06;:\xf6\xabD\x14\
-\xe0\x0a\x15\x03dB\xd4\xaaQ\x02D@\x11\x05)\x08\
-\xdb\x13\x00\x22T\xfbP\xa8\x05~:\x11\x01 \x5c\x0b\
-\x93\x00\x1b\xec:\x11\x04\xdef\x85%G\x1e\xc8\x04@\
-\x0a\x1e\x1d\xb0iV\x0c\x1c\xdb\xd1K\x22\xd0\xf9\x90\xba\
-\x14E\xd0kV\x02\x90\xfb\x91\x08\x03\xa1v\xe6\x05\x1b\
-\x14\xcb\xd1\x01\x06\xc4;W\x03\xfe\xee\x96\x80\xc0z\x09\
-0/h\x07$\xbb\xdb\x00Vq\x06\x01\xc1\xa0\x05\xa0\
-\xf0Z\x0b\x1c\x0c\xda\x00\x1f\x8f\xe5\x80\x01(g\x07@\
-\x03\x84f\x95@\x01\x16k\xa8mO\x0e`\xfaf\x01\
-\x10\xfc|\xd2S\x05p\xac&\xa9FC\x94\x00\x04\x0c\
-(\xfd&\x8c\x0b\xd5<W@\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x12\x00\x1c\x00q\x00h\x00\x00\x08\xff\x00\x9f\
-\x09\x1cH\xb0\xa0A\x82\x17( \xc00\xe0\xa0\xc3\x87\
-\x10#J\x9cH\xb1\xe2\xc1\x01\x04\x9ail\x86\xa0\xa1\
-\xc5\x8f C\x8a\x9cX\x00\xc1\xc6\x8d\x08\x00\x8c\x5c\xc9\
-\xb2\xa5\xc4\x0b'c\x1apI\xb3\xe6J\x00\x1eb\xc6\
-D`\xb3\xa7O\x89\x03\x1e\xe8\xd4\xf9\xb3\xa8Q\x81\x00\
-2\x0e=)\xe1\xa8S\x9b\x00\x84.\xddx\xc0\xe3\xd3\
-\xab#\xa3N\xa5j\x15\xabW\x8bZ\xb76\x8b \xe0\
-\xab\xd9\x8aa\xb7.Py\xb6mD\x0cb\x9b5p\
-K\xf7a\x01\xb1\x07\x02\xd4\xdd[p\x80\xc9\xad\x0c\xf8\
-\x0a\x16(uj\x81\xc1\x82!\x88=\x8cxo\x80\xc5\
-\x8d\xf9\x16\x1e\xba \xf2\xde\xbbS#\xb0\xb5\xdc\x16\xc0\
-\xdf\xa1U9\xd35\xb0\x95\xb1\xe8\xb3\x02\xb66=\xdd\
-v\xc1\xd6\xb2\xac\xcd\x02\xd8:3\xb6Y\xd2K\x0fl\
-\xb6\x8d\xf5\xb3N\xd3\xbc\xafb\x1e\xea \xf8\xd7\xc91\
-\xe7\x1a\xbf\x9az*\xec\xe5N\x1bL]\x0d\xdd)\xf2\
-\x93\xc0\xab\xffl\x0eZ{\xf4\xa9\x10\xbc\x1f\xff\x95\xd0\
-\x8c\xe0\xc9\xae\xe2{\xf2486}\xd1\xd4\x07\x9b\xd5\
-v\xdf3;\xc1\xc0\xf4{\x86w\x88>\x7f\xcb\x04\x0e\
-\x95\xe7\x9fM\x048\x14\xc1\x806\x09h\x10u\x08\xb2\
-\xb4[\x83?\xe9\xe5\x10~\x10\xae$\xe1E\x15\x1a\xe5\
-L\x86\xefq\x18\xa1\x87>]\x08\xa2E\xf6\x0d$\xe2\
-\x88-\x9d\x88\xe2\x8a?9\xe3\xe2\x8b\x02\xf57\x10\x85\
-,\x0e\xf4\xe2\x8d\x1bB4_\x8d\xcf\xe0\x88#D\xfb\
-\xf1\xd8\xa3\x8f0\x1ex\x10\x80B\x0eI\xe4\x86\x95\xc5\
-\x97\xa4\x92D>\xb3cA*\x8e\xb8$\x8cU\x0a4\
-%\x8aW\xba\xf8\xcc\x83\x04!Yc\x97\x03\x15\xe7$\
-\x8fd\x0a\xd4\xe4AYf\xd8e\x8e\xcf\xd0X\xd0\x96\
-\x1e\xbe9\x10\x98\x03=0f\x9a\x021X\xd0s \
-\xdaI\x90r\x07\x05\x19(\x9f\x02\x01Z\xd0zV\x22\
-\xda\xa7]\x8d^y\x90\x9c\x04\x15\x08\xe2\x00\x1e\x08D\
-A\x00?\x1a\xe4\xcc\x01O\x0a\xc0\xa8@\x1b\xdc\xe8\x90\
-\xa15\xeai\x90\x01^:\xa4hA%\xe6\xff\x87\xea\
-@\x08\xb4\xea\xd0\x9a\x07\xe1\xe9\xdec\x0f\xc1\x19\xd2\xac\
-\xee%\xf5\x90\x03\xbe\x86\xd4\xa6v\xc0\x0e\x94\xacE\x04\
-\xe8Z\x1d\xaf\x0e\xe9F\x11\xae\x06aP\xacv\xc2>\
-D\xa8D\x00\x80\xaa-}\xcb>\x13\xc1\xb5\x10QJ\
-\xa5\x87\xc7:\xe4\xe7\xa22\xf2\x16\xeb@\xd4R$\x80\
-\xb7\x08\xde\x05\x91\x99!\xd9;\xa0\xbe\x0f\xb5KQ\xb8\
-\xd5)\xe8\xd0\xb6\x22\x89\x99\xde\xbb=u\x9b\x9e3\x17\
-|5\x00\xbd\x0fej\x99\xbf\x059k\x14\x02\xe6\xd2\
-\x05Sl\x1eX\x8c\xd5\xab\xa7!p\x81\xc7\x1a\x820\
-*o\x04\x88 \x9b\x08\xaaJ\x14Zc)\x93\xdc\x92\
-\x00\x1b\x9c\x0cQ\x04\x14\xd7\xb5\x10\xc8.\xa5\x90\x93E\
-\x9a\x99\x05\xf0A\x14\xd84\x00\x08\x96V\xd4\xcc\xd0E\
-\x05\x80/H\x16\x90\x1b\xd1\xd1\x1e\xd8<\xd1\x01\x19c\
-\x05\x00\xd3\x0f\x11\xe0\xc1\x05)X\xf0\xcc\x00\xb6>\x03\
-\x82\xa6\x02\x7f\xd4L\x022?\xe54k\x0e |\x96\
-3\x06@<\x98|m\xcb\xc65V\x0b\xf0=\x8c\x98\
-\x00\xf1\xb6\xe5\xb7e\x00\x18\xf04V\x07\xf4\xad\x9d3\
-\x05\x18<\x1e\x82\x8e\xd7\x94@\x03yC'\x81\xdd \
-\x1d A\x03d\xa3X\x96\x01\x12D\x90\xf6\x91\xcf,\
-\xc0\xb9\xd45ZE(\xeam\x05\x04\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,\x12\x00\x12\x00k\x00r\x00\x00\x08\xff\
-\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\xb4\xc0\x90\xe1\
-\x00\x85\x10#J\x9cH\xb1\xe2\xb3\x01 .P\xd8\xd8\
-\xac\xa3\xc7\x8f\xcd\x1eP\xd8\x90\xc2\xa2\xc9\x93(\x11b\
-\xf4\x80\x00\xa4\xcb\x97\x1e\x1f\x08HI\xb3\xa6B\x01 \
-X\xc2\xdc\xb9\x93\x82\xcd\x9f?Sx\xe0I\x94\xe7C\
-\xa0H+\x0a\xb8@\xa0\xa8S\x98\x01\x92J\x85(\x00\
-\xc3\xd3\xab/\xa3N\xddJ\x10\xc0\x05\xac`Ar\x1d\
-\xfb\xecB\xcb\xb0h\x17\x90\x9d\x1a\xa0)Z\xb4\x0e\x00\
-\xacM\xba\xe1m\xc7\x03\x09\x16\x180P @\x80\x01\
-\x03\xfc\x06(`\x00B\x02\x09\x0d\xe4\xce\xfd)\xe0\x01\
-\xc1\xab\x07\x10\x1f]L9\x22\xd1\x08\x0d&W\xde,\
-\x10C\xc2\x97\x07\x16h\xe6LZ!H\x07\x05\x14\x97\
-\xe6\xac\xdat3\xd4\xabc;\x86\xd8\xec\x80\x81\xd6\xb1\
-+\x8fF\xd8L\x02\xee\xdc\x95\x09H,\x00\xbc\xb8\xc2\
-\xdd\xc6\xd7:\xf3\x19\xd1Y\xf2\xe7\x03\x89C\xafl\x80\
-\xb6\xf4\xe9\x94\x9bA\xbc\x8e}-\x00\xe1\xc7\xbbS\xff\
-\xf6,\xbe8\x83\xf2\xc5\x01 @\x0f\x1c\x82\xc2\x04\xce\
-\xd9\x8f\x15\xa0=\xe1L\xf9c\x99#<\x8f\x9f\xabV\
-\x84\xee\xf5\xc7\x95~\x06\x1d\xf0\x9b\x80?\xfdw\x10w\
-\x08\x22\xa5\x16B\xf05(\x15}\x09)(\xe1O\x01\
-\x1e\x94\xc0\x85R\x81w\x90\x85\x1c\xd2\x84\x9c@\x0e\xc4\
-\x17\xa2M\x19\x1a\xc4\xe0\x89)yX\xd0\x01&\xb2\x98\
-\xd2\x88\xcf<(#M\xd5\xedw#W0\xee\xb8\x95\
-\x04>\x06\xd9\x1f\x88BJ\x94\xe3A1\x169\x91\x8d\
-\x05E\xa0\xa4I\x1bj\xf8\xa4E.\x12t\xe4\x94\xcd\
-aiS\x92\x04\x11\xa9\xa5A\xf7}\xf8%M^\x8e\
-)Q\x99f\xa6\xa9\xe6fh\xae\xe9\xe6\x96oR\xc4\
-e\x9ct\xd6t@\x9d\x11E\x89gB)\x12T\xe5\
-\x9e\x06\xcd\x09\xa8@m\x8e\x19\xa6AW\xd2y\xa7\x94\
-{\x02\x89\xd0\x81k6\x90\x10\x7fu\x1eZ\x10\x93t\
-:\x90\x10\xa4jbJ\xd0\x8an\x969\x1b\x9e\x9a\x22\
-T\xe8\x97\x89\x12D\xe0\x93\xce\xb4\xea*\x98\xf5\x89\xff\
-9\xa5\xab\xb4r\xa9\xa7A\xab\x0aY+\xad\x05\xa1I\
-\xa9\xae\xbb\xbeZ\xd0\xadc\x06\xcbk\xafj\x1a{\xec\
-\xb0i*+,\xb2\x09\xad\xb7\xa3\xb3\xcf\x16\xd4gA\
-\xa3\x9eHm\xab)]+\xe1\xb65\x81*\xe0\xb6\x82\
-\x12DlA\xcd\x88+\x1f\xb9\x12q*P\xba\xdf\xb2\
-+\x11\x8d\x1c\x92[\xeeA\x92\x9a\xa6\xeet\xf6\x9a\xe4\
-)\xba\xe4\xa1\xd7\xefINB\xf4\x80\xbb\xc09c\x81\
-\xbc&\x01P\xb0B\x04\xd0\xbb\x1a\x00\xe4!\xb0\x81\xb3\
-49<\x1ct H;\x10\x06\xc6\xda\x04@\xa9\x10\
-a`ii4\x16\xb0+R$\x9b\x96\x1b\x00u%\
-D@\xadIi,\x11\x02 p\xe6\x0c\x03\x7f\x82Y\
--P\x00\x9c\xab\x10\x03\xf7\x02-B\xcf\x07\x0d\xc0\xed\
-V\xce\xfc+\xf3\x06\x12\xa7T\x95\xc7y.=V\xbe\
-\x15\x11\x005P\x02\xa4\x90+D\x07D\x0d\x94\xd8\x07\
-\x09\x97\x82\x05&\x09 \x02\x06HC\xe4\x00\xd9H9\
-\x8aR3\x04\x8ct\xc13\x0e\x09\x80v\x0aw\x0b]\
-\xd4vD\xb6\x15\xcd\xd5\xaf\xdd%p\xf2fr\xc5\xfa\
-\xdc\x01D\x1b7\x80\xd0\xb1A\x800i\x01@>\xe8\
-3\x01,\xa08e\x0e$\x86\x1f\x00\x0d\xb4LV\x02\
-\x84\xf77\x00\x04\x0fK\x15\x01\x04\x877x\x9f\xe8&\
-5\x93\x80\x01\x0cL~\xa1\x5c\x0d,\x90\x80\xe5$\x0a\
-$\x81\x01\xa7\x16\xe9\xccQZ\x09\xbeV@\x00!\xf9\
-\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\x00g\x00r\x00\x00\
-\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\x22\x1c`\
-\xa1\xa0\x00\x85\x10#J\x9cH1\x22\x00\x0b\x17<<\
-h\xd6\x0c\x22\x81g\x17D4\xacH\xb2\xa4\xc9\x82\x00\
-Dx \xd0\xf1$\xc7\x07\x17\x06\x9c\x9cI3a\xcb\
-\x9a\xcf8r$\xb0!\x05\xce\x9f\x14E<\x00ZP\
-\xa7N\x04\x1eD\x00 \xcaT\xe0\xd2\xa6E\x8d\x1aE\
-p\xe1)T\x9a\x1b\x10\x5c%(\xb5+U\xab[)\
-b\x08\x1b\xb5\xab\xd4\xafd#\x82H\xcb\xd5\xac[\xb4\
-l\xe3\xdatK\xb7\x19\x02\x06r\x9f\x01\x18;\xd3\xc1\
-3\x03\x05\x02\x04x&\xc0\x99\xb3\x81\x83\x17\xe4\xac\xcb\
-\xb8\xd9\x86\xb8\x03>\x96\x8c` \x00\xd8\x89\x02\x0a,\
-8\xd0\xd8\xec\x83\x87a/\xdc\xac\x08\x1a'\x03\x08\x0e\
-:O\xc5\x0b\x15\x00\x05\x92\x06J7\x1d` \xb5j\
-\xc7P\x87Rl\x10\x17\x80\x01\xce\xaa\x1f\x5c\x9e9@\
-k^\x92\xbe\x817&0\xbcd\x00\xe3\x12\x0f\x1f\x1f\
-\x98\xbc\xb3\xf0\x9a\xa3\x15\xca\x9eN}\x81\xf5\xe6\x12\x8b\
-K\xffd\xcd\x1da\x01\xe5tu\x93\x14\x0f1\xc1\xf6\
-\xf2\x06\x07Dh\xcc\x97\x22\x00\xe8\x09\x0d\xc0\x97\x08\xc0\
-;\xe3\xfa\x12\xa9\x87\xd0\x01\xfbU\xd4\x00}\x13A\x00\
-\xd1\x012\x15H\x11\x03\x8d\x15\x10\x11y\x036\xe8 \
-E\x050\x86\x00x\x02\x09\x80\x9fA\x04^XR\x86\
-u\x0d\x96\xd0k\x091(\xa2I\x07\xd2%\xa1y\x10\
-\x99\xb8bI\xfe\x99\xf5\xdeD\xbc\xcdxR\x8dF)\
-h\x92\x04:\xd2\xc4c3\x8a-\xa4\x90\x03\x1c\x06)\
-Q\x03\xf3% cI\x16*\x19\xd6\x8dR\x1eWd\
-\x95\xe5Q\x89\xe5\x96\x5c\xd2t_B\x14vI\xd4\x8b\
-\x07\xf9%&T@\xc2x&SI\xae\xd9T\x8e\x07\
-\xf9\xe8&P\x09 \xd4\x8c\x96s\x22\x97P\x04y\x02\
-\x15&Ap\xf6I\x93\x9cE\xe1)\xe8D\x02\x12\x14\
-\xe2\xa13qX'\xa33=Y\x90~\x90B%i\
-\xa585\xd3&\xa6$\x99\xc9)I\x1f\x0e\x94\xe6\xa7\
-?\x05JjDQ\x9e\x1a\xa9\xaa\xac\xb6\x0a\xa9\xa9\xae\
-\x1a\xff\x18\xeb\xac\xb4ryi\xad1&tk\xad\xa9\
-\x12D&\xae\x5c\x01K\x91\xa7\xc2\xb6gg\xb1\x13\xf5\
-\x8a+\xac\x03\xfd*\xac\xb2\x02\x11\x8a\xec\xb4\xd4nE\
-)\xb2\xd0>#Y\xb5\x08\xfd\xb9lB\xa3\x16\xab\xe5\
-\x9d\xd4>\x1a'\xb5\xce\x12\x14*\xae\x00,jP\xba\
-\xb8^k\x10s\xd3\xb6\x9b\x90\xb4\xc0^iP3\xd9\
-\xc6\x8ag\xa2\xc0\xe2\x0bh\xbd\xee\x1adh\xab\xde\x12\
-\xb4\xa9\xaa\xce\x98{\x10\x80\xc0\x0aPpA\x02\xd3*\
-/\xb7\x049\xc3\xa7B\xbbb<-\xbc\x1e_|\xd0\
-\x05\xc5:\xa3/B\x10+)\x1dQ++t]\x90\
-\x86\xc5\xdcr^k\xcd(\xb3\xccL\x0d0\xf1A\x14\
-\xf4+\xd7\xcd@\xc3\xf7\x18|@\x17\xbd\x1f\x01\x22p\
-W\xf4\xd2P\x9d\x0cQUl--\xf5\xcc@U\x8c\
-\x90V\x07\x9f4\xb5\xd4a\x81\xec2\x08YG\xb7\xf5\
-\xd4[\x86\x9d\xf1\xd8cG-rE\x08P\xb0\xc1\x05\
->u\xf8\x94\x05\x0dYP\x18\xdad\xe7%\x80\xc3[\
-!S\xd0\x00\xdeLO\xe7\x0c\x03;7\x15\x00\xe08\
-\xef\x07\x80\xd5@I\x80\xb8a\x22\x0a\x00A\xe18!\
-\x80x\x90\xbe\x11\xcb2\xdaX:S\xc0\xc6\x9bs}\
-&\x00\x05\x84;\xd3\x02\xa2\xe7\xb9\xd4\x02\xa0wzw\
-\xe2\x98J\xa7`v\xfbF\x00\x01\x00\x90\x03\xebL\x94\
-\x01\xf8|U@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00\x12\x00r\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x13\x1e\x04`\xc1 \x00\x85\x10#J\x9c\
-H\xb1\xe2Ag\xcf@l\xa0\xf0`\x22\x85\x0d)\x04\
-X\x1cI\xb2\xe4\xc4\x0d\x1dM\x0a$\x80A\x84H\x95\
-0cBL)\x93`3\x96\x03j\xea,\x09\xe0\x02\
-\x81\x9d\x09\x9bQx\x86\x11\xa8Q\x84\x0304;*\
-\xf1%S\xa3\x01(,}\x1a\xb1\x19\x86\x9cTe\x0e\
-\x18\x9a\x95b\xb3\x0d]M\x0aP\x1av$\x83\xa2e\
-%\x82@\x90\x96$\x05\xa7m\x0f\x0a\xe0Z\xf2\xc03\
-\x08\x06\x18\x08\x0c \xf0\xa5^\x03\x10\x22\xa8\xbc\x10\xf7\
- \x03\xb6$!\x14\x80;\x11\x00\x83\xc0$\x09`-\
-\xfc\x0c\xc3H\x09;\x1dc\xb6X\x80\xb2E\x07\x0d\x1e\
-\x1e\x15\x00\xc1\xae\xe7\x88\x8c!&8\x1b\xb6\x80\xe0\xd3\
-1\x13\xf0m\xeb\x8c\x81\x83\x894\x9fN\x86\xe8@\xef\
-i\x08S!\x22\xd8m\x141D\x03hO\x0fH \
-q\xf8h\x89\x0ef\xc3&\xd8\xa09\xf1\x98\x00r#\
-\x5c zz\xc1\xd4\x07\x11t\xff\x8f\xe9L\xfb\xc1\xea\
-\xdeU>\x18\xaf\x12B\xfa\x98\x9d!\xd2U\x19\xff=\
-\xcc\x02\xa6\x13ZV9\xc0\xb8}\xfe\xf9\x1d\xd4\x8co\
-$\x01\xf0\xd3\x7fZ\x05h\x90x%\xb9\x17\x14\x81\x08\
-Ft\x9dM\xf3Q4!A\xf5E(Q\x86\x055\
-\xd3\x0cz\x14\x95\xa7\xd0\x02\x1aZd\x80\x80\x1e\x22\x00\
-^B'&\x14\x01{%\x8e\xe4\xe1\x8c$N\xb4\xa2\
-@\x07\xdc\x18#B\x008\xb0\xd4\x8c@6s\xa1A\
-5\x22\x04\xe1\x8e\x13\x05\x10d\x90\x15\x92\xc4\x1c\x92#\
-\x01\xb7\xe4\x8c\xd2\x95\xa4#\x94\x09\xf98\xa5P\x10U\
-i\x10\x88XVT\xc0\x96\x1e\x0e\xc9[\x98%%@\
-f\x91\x02&\xc4!\x9aI\x92\xd9\x0c\x8c\x02\x81Y\xd0\
-kp\x8e\xa4\xe6\x96v\x0et\xe0A^\xe69\x11\x03\
-d\x9a\xf7L\xa0\x82\xc6\xa4\xe5\x94\xa9\xb1YP\x9f\x89\
-J\xd4\x00\x99}\xfe\xe9P\xa4#\x01PhAC:\
-\x8a\xe9D\x12\x909\x1e\xa4\x02\x1d\xf9\xa9\xa4df\xf8\
-\xe4E\xa7Z$\x00\x99\x0e\x0a\xff\x14\x5cA\x9b\xb5Z\
-Q\x04[\xae:$\xa9\xb6&$\xe5\x94\x03\xbd9\x90\
-\x99\xbd\x1a4\xe6\x96\x88\x16\x94\x5c\xb1\x10\xbd\xca\xa7@\
-\xab\xde\xb9,\xb3\x0a\x1d\xb0e\x8b\xfe\x11\xe4)\xb5\x09\
-\xed\xb9\xe4\x93\xb3\x12\xd4\x22\xb7\x11-\x90+D\xa6\x92\
-{\x90\x01[Z\xaanI\xecn\xf9.LJnI\
-\xe7@W\xbe[\xef\x94\xc9\x0a4\xed\xbc\x04\xed\xbbd\
-\x00\xfd\xfe\x0b\xf0^d\x12\x9cP\xbe\xea\x0a\x1cd\xbf\
-\x07+\xe40\x90\x10G\x8c\xd0\xc4TZl\x11\xc6e\
-\x1a\xfc\x8c\xb0\x11k*\xaf\xc7\xe3j<\xd0\xa2@n\
-\x16\xad\xb6&\x17\xc4\x80\xb5Ab\xb5r\xcb\x09\x0d\xb0\
-\x80\x8f\x07H0Y\xac\x05eKsB\xbc\xfe,\x11\
-\xb1B+\xe4\xf1\xb6E\x134\xb3@\x86&=P\xc9\
-\xdf9m$\xd0R/\x94P\xd3R/-\x10\xd1?\
-\x83|W\xd5\x97\x22D\x80\xc7I\xd7j,\xd8\x14\xb9\
-\x8b\xf6\xda2\x91\xcdv\x9do\x0b\xc7\xf0\xdaMV\x8d\
-\xb4@^\x17}\xe5\xbdIC\x96\x1d\xb7Ax\xfem\
-\xd0\x00\xe1>*\xf8\xe1\x05\xf5\x08Q\xdeB+\xd8!\
-\xe3\x88\x83\xcd3B\x90\xb7lv\xe4\xcf\xf0\x1d5\xe6\
-\x04\xa5+4\x00\x81+4\xf7\xc1\xa0OD\x18\xe7\x04\
-q\x1dq\xe8\x0a\x15\xe0\x8c\xdbl\x0b\xf0:\xec\x07;\
-\xbe\xee\xec\xb3'\xcd\xbaA\xc8\xe1\xee;\xcd\x00L>\
-\xb8\xef\xc4\x17o<\xeda\x0e\x19\xc1\xf1\xcc3\xcfl\
-\x9f\x07\x0c\xd0\xfc\xf4\xc5S\xbb\x80i\xbdQ\xaf=\xee\
-\xdc\x02\x10\x80\xf4\xdb\x87\x8f\xbc\xa0\xe2\x8b\x0fp\xf9\xd4\
-G\x8c\xbe\xf3\x1a\xafO|\xd1\xeb\xbf]\xfd\x7f\x01\x01\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\x00r\x00\
-l\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\
-\x1et\x06\xc0\xa0\x85\x86\x0a#J\x9cH\xb1\xa2\xc5\x82\
-\x02Dl\xa0\xf0\x8c\x80\xc4\x07\xcf6\x80\xb0\xe0\xec\xa2\
-\xc9\x93(%\x0ax\x86\xc1cJ\x81\x146<\x83\xf8\
-\xb2\xa6M\x84\x03Z\xde<\xf8\x00\xc4\xca\x9d@O:\
-\x13\xc11hB\x02\x17h\x1a]jP\xc0\x05\x04L\
-#6\xc30 j\xd4\x9cV+R\x08\x90u'\x00\
-\x99]-R\xa8\x1aV(\x03\xa8e-N\xfd\x99v\
-\xa2\x80\xa2m/\x22\x00\x11W\xa1\xb3\x0b/#@0\
-@\xf0'\xd7\x81\x10\x12\x1cxIAi]\x81\x03\x5c\
-\x9ed`\xd8m\x81\x94\x08\x18\x1c\x1eX\x00\xadE\x06\
-%o\x0ah`r\xeaag`)\x1e\x80\xc0\xd6(\
-\x80\x06\x0e\xc46\xb6\xba:a\x84\x02\xad\x83:c\x90\
-\xc0bi\xab\x02@Nt \xb9n\x80\xda\x13\x11\x90\
-\x9d\x5c\xb0\x19\x84\xd8]\x9d\x15HM\xdcd\x82\xe1\xcd\
-\x9d\xf1m\x0e=\xe1\x01\xce\xcd\x0d\x06`\x1e\x11\xf9I\
-\x01\x96]\xdf\xff\xce>\x10\xc0\x82\x8fA\xbd\x0b\x5c\xa0\
-\x9e\xb8\xf4\x89\x99m\xc2E\xd8\x8c<P\x0871H\
-\xecm_b\xf5\x83\x8f\xbd\xc4@}\xfd\xa5%\x5cJ\
-\xe0\x15\x18\x97b&\xcdg\xd0\x01\xff)\x18Q\x80\x09\
-Mw\x11v\x12\xc6\x15\xa1B\x09&\x84a\x86\x16\x9d\
-\x97\xd0\x03\xf1M$\x22B\x0b\x94\x08\x22E\x00D\xa0\
-\x90\x85\xfe)\xe4@{+65XB\xe3!\xe4`\
-A\x7f\xd5h\x12\x85\x07\x9d\xa8P\x8f\x07\xc1\xe8\xe3E\
-\xc0!\x94cA;\x0e\xe4\x80\x8aGV$\xc0\x8dA\
-F\xb4\xa1@\xfcEi\xd2\x87@%\xa9\xe5I\xdc\x01\
-E\xe4\x97\x17\x01Y\x91\x91\x04yI\xa6Ia\xda\x94\
-\xe5\x9a\x17\x8dI\x10\x83\x03-\x09gVrryg\
-XB\x0a\xa4\xdb\x9ei\xd1i\xa7\x04\x80\xa6\xd4'A\
-\xd0\x99I\x90\x9e\x85R\xf4\xe6\xa2\x04\xe1\xa7d\xa3'\
-\xc5\xe6\xe5\x9f\x05\xb9H\xe9Ij\x0eD\xe03P\x02\
-\xb6\xe9I\x8c\x22&\x90\x9c\x94\x8dj\xd2\x95\x01\x96\xfa\
-\x8c\x9d\xaa\x22\xff\x14\xaa@\xd3\xa1)\x10\x95\xb1V\xa4\
-\xa9A\xc0u*\x90\xaf\xb9*t\xa8@h\x01Kh\
-\xb0g\xd2\xe7'B\xb6\x22\x8b\x90\xa2\x02\xd57\xeb3\
-\xcd:\xab\x1d\x8e\xd3>jm\x9cv\xa2\xbamAW\
-F\xe4\xed\xb7\x03M\xdb\x1d\xb9v\xa14.\xba\xec\xd6\
-en\xbb&\xbd\x0b\xefN\xae\xa2\x0b\xed\xbc'\x19\xf0\
-)A\x04\xb69P\xb5\xe8.\xd0\xcc\xbe\xbf\xe2kQ\
-\x02\x03\x0f\xfcL\xc2\xc0zj\xb0\xa7\x09G\xdc\xcct\
-\xf7>\x8c\x98\xc4\x11\xd7k\xb1@\x0d`\x9cp\xb8\x02\
-I\x8a\xaf\x04\x1e7\x83\xeb\xc6\x08!P\xf2\xb1!\xa3\
-\x0cn\xc9\xcdh\xfc/\xbe\x05\xc0\x0c\x9d\x9dt\xa2\xfb\
-\x00\xcc\x16\xad\x1b\xec\x0007\x5ce\xbb\x02\x97\xcc\xe8\
-\xc9\x03\x85\xf7-\x00*\x97\x9c\xe3\xb0\xf3\xd6\x5c2\xd4\
-\xe3B\x1d,\x010{\xeb\x8c\xbf\x02E /\xa5\x03\
-\x96\xcc\xb5D\x09|](\x00X\x1b\xcd\xe1\xb3\xce\x98\
-\xbd\xa7\xbe0{\xf7(\x04m\xb7\xed\xac\x0007c\
-u\xb9\x05h\xbf*A\x00u\xdb\x8d,\x05y\x83,\
-P\xdb\x00\x04\xaex\xb0a\x97,rD\x8aG.\xf8\
-\xa8\x034\xed\xf1\x014\x82*\xf9\xe2\x9b\x02\xb03\xcc\
-\x15\xcb\xbay\xdd\xa3z\x90\xb7\xd0\xa2\x8f>9\xa0\x10\
-\xe4\xdd\x8c\xe1\x0b\xa9\xbe:\x9cR\xc3\xfc\xb8E\xb2\x93\
-~'\xd0yG\x90\xb9A\xb9\xcf\x1e\xa5\xe7yCX\
-S\xf0n\xdbW{\xc9\xda\xc6\x1b<\x99p\xab\xbd\x13\
-\xf2\xc9\x13\xb7\xbc\xc4{;\x8f\xfc\xf0\x07x\xbc+P\
-\xd4W\x7f\x18\xef\x11\xcf\xc8T\xf8\xe2k\xe8\x00\xc3\xbf\
-_\x84~\xfai\x01\xc0\x80\x01>\xdf\xf4\xbe\xcb\xe5\xa2\
-\x8f\x7f\xfe\xd4\xef\x7fx\xff\xfe\xd3\xdc\xf3\x02(@\xd9\
-\x11\x90\x7f\x9b;`AF\xa7\xc0\x05F\xae\x81\xb1\x83\
-\x9f\x96\x02\x02\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-\x12\x00r\x00q\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13*\x14xa\xa0\x85\x85\x10#J\x9cH\
-\x91\xa2\xb3\x01 0HlF\x80\xc2\x85\x14\x02*\x8a\
-\x1cI\x12\xa23\x0b\x17< ()\x10\x81\x87g!\
-Y\xca\x9c\x99\x10\x00\x08\x0a4s\xea\xdc)\x10\xc0\xb3\
-\x97<\x11>\x10\xe1,\xa8Q\x84\x1a\x8f*$p\xc1\
-\xa7\xd2\xa01\x9fBD\xb0!\xaaT\x96\x03p^\x9d\
-\x88\xc1\xe9\xd6\x8a\x0064\xfbJ\x11\x01\x88\xa2d#\
-\x8aX\x99\xb6\xe2\x83\x00m\x13\x0a\xd0J\xb2Y\x02\x81\
-\x05\x04\x0e\x10\xe8,d\x80\x00\x06$8`\x994.\
-A\x06l+:\x90\xd0`oEg\x01\x1a\x90$\xe0\
-\xd8\xb0\xd8\x8a\x11\x1aX\x9d\x19A$\x88\xb8\x00\x1eP\
-\x1c\xacT\x80\x81\x03\x86%\x0eH\x0cq0\xda\xa7\x00\
-\x1a\x90\x96\xe8\xf5\xe9j\x89w\xe3\x16\x98\x9dz\xe4\x81\
-\x02\xaf\xdb\x028\xdd{`\x80\xb1\x10!\xd4N-@\
-BD\xe4\xa9\x1dT.>\x90\x01j\x88\xd3i.G\
-(a;u\x98\xb9\x15\x22\xff\xc8~\xb5A\xf0\xef\x22\
-\x09x7z\x00.z\x99\xa2g\x1a\xc0\xfe\x9e&\x04\
-\x99\xe4\xeb\x1fm\xc6\xa0$\x00\x02\xfa}\x85\xc0f\x5c\
-\x05\xa8\xd3\x00\xd7!D\x17E\xee\x19\x98S\x83\x08\xe5\
-e\x11\x80\x09\xcd\xe7 E\x92%\x84\xc0z\x08e\x88\
-Px\x17J\xe4\x8cs\x09\xddG\x1bk\x05%\x18\xe2\
-D\x00\xf0fP~\x07-\xa0P\x7f+V\x04\xa3@\
-$.D A9\xd6H\x91\x89%\x01i\xd0\x01;\
-\xfa\xb8\x10\x87\x11\x01\x80\x22A\x16\x1aY\x91\x84\x08\x15\
-)P\x93\x06\xb9\xe8\xe4D \x96\x95\x10\x94W\xe6\x84\
-\xc0y\x03qY\x90\x95]\xce$\xe6@=\x16\xe4a\
-\x99\x14\x9d\x89\xe6A\x1c\x1e\x80$\x9b#m\xe7\xe6\x94\
-t\x8e$\xa4\x9a\x06\xa5I\x90\x94y&tc\x96\x1c\
-v\x16\xa8H\x86\xc2I\x10\x84\x87\xce\xb4fA4\x0a\
-\xf4h\xa3,I)d\xa4\x94\xce\xa4\x22A\xf1\xf5\xb4\
-)^\x99V\x94%AN9s\xd1\xa6\x09\x80\x19\xaa\
-BT\x16\xe4\x9e\xa9\xa6\x16\xff\x90\x80\x03\x09\x18\x00\x80\
-\xaa\xab\x22\x84)\x9f\xcf\xc0\xea+\xac\xb9\xb2\x08]A\
-&\xfe\xfak\xb0\x13\x91\xf9Ln\xc6\xfa\x8a\xacD~\
-\xb6\xc4W\xb3\xa6>\x1bQ\xab\x06Q[\xad\xb52i\
-\x8b+\xb7\x22z\x0b\xaeB\x8c\x16\xe4\xed\xb7\xe3\x96K\
-\xd0\xb9\xe3&\xa4.^\xec\xb6\xfbd\xbc\xf2>\xa6m\
-\xbd\x22\x89\x8b\xafDp\xe9\xbb\xaf@\xef>\xd3\xef\xbd\
-\xffJ*W\xaf\x04\x17\x9c\x10r\xfe\xfe\xdbiA\x86\
-6\xac\xb0A\xccJ,o\xc0\x16\xd2;1\xaf\x08S\
-[\xb0\x8c\x075S\x99\xc5\xed>L\x90\x8a\x1a\xb7\xcb\
-a\x8f)\x8f\x8bm\x98\xeb\x92\xcc-\x85\x07m\xd6\xb2\
-\xb5\xbb\x12\x94\xe8@7?\xbb\xa0I2\x07+\xc0\xb0\
-\x11\xf5\x9c\xeb\x9e\x04\x8d:m\xc2\xd6*\xb9eBA\
-\x87z\xe73rB\xcd\xf4\xbf/\xf3|5\xbe\x9ff\
-\xdb\xec\xc6H\x1fd\xec\xc60M\x84.\xd9h\xa7\xad\
-\xb6R\x85\xad\xbd\xd0\xa4n\xc7M\xd2\xd4r\xe3Et\
-\xdd\x04\x15p7\xde\x02\x81\xa2\xd0\xcc\xde\x03\x85\xad0\
-\x00\x18\xfc\x0d\xf8\xb2k\x0b\xf0\x80\xe1\x7f#4g\xbd\
-k1\xde8\xc4j\xcf%\xb9\xe4\x03\xed\xbc\xf1\x05\x97\
-w\xdeL\x04\x8f\x8f+\x02\x01\x9e_\x0e\xfa\xc66\x91\
-^\xba\xe4\x09\x84\xfe\xec\x00\x1b \xb0\xfa\xe5\x82\x8f+\
-\x00\x08\x8b\xcf.\xf9o\xfb\x0e \x02\x06\xb9\xeb.y\
-\x047\xe6*\x80\x08*\x09_\xba\xad\xf2\xae\xa6|\xe9\
-\xc4\xe3\xab\xfa\xf3\xbb\xc3\xcd\xedq\xd4K\xbe\x00\xa0\xcf\
-b\x9f\xfd\x01\x06po\xad\xf7\xca\x83\xef\xfa\xb3\x00<\
-/A\x01\xe7s\xbb\xc0\xec\xeb\xb7?n\x8b\x97\xd7\xca\
-\x80\xfc\xf86`\x80\x01\x8d\x15\x17\x10\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,\x14\x00\x12\x00p\x00r\x00\x00\x08\xff\
-\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\x1at6@\xa0\
-\x05\x81\x03\x9c)\x9cH\xb1\xa2\xc5\x8b\x18\x0bZ\xb8\xe0\
-\xe1\xd9\x03\x8a\x04<\x5c\xb0\x00@b\xc6\x93(S&\
-\x1c b\xc3\x83f*\x9f\x85\x1c\x09 \xa6\xcd\x9b\x08\
-\x05\xc8\xc4\x89PDM\x9e@3\x9a\x0c\xaa\x10C\x00\
-\xa2H\x13nHjQ'S\xa2?\x9fVl\xe6\xa1\
-\xa1T\x9b\x00. \xb8\x8aq)\xd7\x93\xceDl\xfd\
-\x9aQ\x04Y\x8b\x03\x08\x9cEI\xc1\xe9\xda\x85\x05b\
-\x1e\x90 \xb0\x81\xc0\x00\x00\x04\x048\xca\xc0\x80\x04\x07\
-0U^x[\xd0\x99[\x8c\x09 08\x5c\x11@\
-\x80\x06\x0b\x08\xdbt\xe6\xcc@\xc6\x02Q\xb1>s\x90\
-\x11A\xdc\xb3\x94)[\xa6x@\xea\x80\xc8\x18\x0b\x0c\
-\x95\x1a\x9a\xf2g\xc9\x06\x0bD\xb8\x88au\xd2\xd6\xa1\
-9\x1f<`\xf7-\x03\xda\x99\x89\xe2\x0e=\xa0tA\
-\x03\xc1\xdf\x06\x9e\xf8 9\xce\xe1\xad\x0b\x18\x7f\xb6\x80\
-\xb1\xe4\x01\x09*>\xb0>\x19:n\x06\x8ba#\xff\
-|\xad\x90\x80\xf3\x94\xde\xbd\x8bO\x08`6\xf3\xf3B\
-\xd3\xe3^?\x11\x00\xdd\x89\x1el\xa3\x94\xdf\x9a~E\
-\xd4Eu\xc7\x9f~\xfe!d\xc0r\x08\xf5\xb6\xdf\x80\
-\x04\x168\x1e\x82\x07Y\x15\xdf\x80\x0eb\x14\x00\x84\x05\
-\x99\x07\x16\x85\x15\xa6\x86!A\x18L(_\x87')\
-\x88\xd0o\x17qHbF\x00\x0a\x98\xde\x8a)e\xe7\
-\xe2\x8b0\x9e$\xc0t\x07qW\x18\x7f5\xa6\x84\x22\
-B\x14L\xa4b\x8fD\x1d\x95\xd0\x90D\x02\x15$B\
-H&\x09\x94\x91\x0b\x8d\xe8\xa4J\xee\xa5\xc8\xe3\x94)\
-AiP3\xd6]\x89e\x8c\x09A\x10%\x8d_\xa2\
-\xa4e\x86;JY&Q\x12>\xe3\xe5\x9a'\x91W\
-\x90\x98\x03\xbd\x09'F\xf0\xa9%\x90\x9dwbt_\
-\x84{\xaa\xd9\xe7e\x09\xf5\xc6\xe7\xa0\x8d%t\x9f\xa0\
-\x88\x22\x86\x90\x9e\x8c6j\xd1h9\x06:\x9c\xa4f\
-&\xf4\xa3\x9b\xf3a\x9a\x11|\x94zz\x933U\x16\
-\xd4\xa2\xa86\xc9\x88\xeaSt\x1a\xa4\xe7\xaa\xb0\xf6\xff\
-\xb8ia\xb12\x05_\xad\xb8\xe6\xaa\xeb\x99\xba\xda\xc4\
-k\xaf\xc0\xfa\xd7f\xb0*5HllG\x1e[Q\
-\xa8\xb4*;Q\xab\x05\xe1\xe8,B\xaa\x16T\xed\xb4\
-\x07\x8de\x10\xb4\xd86{\x90\x89\xdd\x12\xf4\xeb]\xe1\
-\x1e\xc4,A:v{m\xb9\xec\xf24k\xbb\x09\x9d\
-\x0a\xefA\xf0\xe96\xaf\x9c\x04\xc9\x1b\xae3\x1f!4\
-.\xb6\xff\xda\xdb\xae3K\x9a;\xef3\xffr9/\
-\xc1\x09\xad\x1b\xee\xbb\x035\xf3\xaf\xb3\x00hk\x90\xc3\
-\xdd\xea;\xd0\xc4\xcaN\x8c\xf1\xb4\xb7J\x0c\xaf\xb1\x02\
-q\x1b\xae\xc9\x04\x1dp\xeb\xb1\xf8\x16\x04\xf1\xc1\x03\xfd\
-\x09\xb3A\xd2v;\xec\x963'\xd4\xb2\xb3!N\xa4\
-\xb1\xb2\x05'\x14\xc1\xca\xbd\xde\x9c\xf33/\x1f\xad\xb4\
-@D\x0f\xe4\x80\xd1\xc1&\xddc\x0a\x1e\x84d\xd6W\
-W[\xb4\x00\xc9g5\xd0\xcc\xd7_#\xb0A\xba7\
-\xf5|\x11\xb8\xe2\x0d\x00\xf6\xda_? \x02\xd9e\xa1\
-$\xf5[\x12\xb0mw3\x04l\x90B\xd3\x06\x81\x82\
-\xe0\x81\xc5\x83\xde-x\xd8\x14l\x00\x82\x05\x88\x93$\
-@\xe2\x22\x5c\xb0A\xd0(\xa1\xbc\x1e\x00\x83Wn\xf9\
-\xd7\xa9\xd6x\xc0\xe5\x9c\xb3m\xd3\xce\x05z\xddy\xe7\
-1A\xc0\xb7x\x0dl>\xba\xe5(5\xb3\x00\xd4+\
-\x0a\x00\x81\xea\xab\xdf\x9d\x91\x03hc\xc9@\xdd\xb5{\
-~Q\x00\x5c;)@\x03\x09\xf4\x0e\xf6D\x094\x00\
-7\x9c\x000\x00\x01`\xb5G+A\x03\xc0\xf7\xeaX\
-\x03\x10$@\xfb\xe0\x11$6\xafc{\x85\xbf\xfc[\
-\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x1c\x00\x12\x00\
-h\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\
-\x08\x11:[\xc8\xd0Y\xc2\x87\x10#J\x9cH\xb1`\
-\xc3\x8b\x18\x19\x0aH\x01\xc2B\xc5\x8f C\x1e\xccH\
-2\xe3\x06\x82\xcd(\x08t(\xb2\xa5K\x8b%c6\
-d\xf0\x90\x02\x88\x978A\xca\xdc\xc9\xf0\x81D\x0f)\
-r\x0aU\xc8\xb3(\xcb\x89\x08N\x0e\x1dj\xd4h\x80\
-\x90\x18\x00,u\xd9\xb4\xe9\x00\x91\x08.L\x0dY\xb5\
-j\x04\x97Z\xb7J\xec\xdau\xc0\x01\x97\x0f\xae\x8aM\
-H\x96\xac\x00\x08\x0e^\x1e];\xb0m\xc3\x8f\xce\x04\
-\x14x\x16\x17\xa4O\xba\x04\xdb\x0a\x15\xf0\xeck\xc5f\
-\x80\xeb6\xa5\x0b\xe1\xa3R\xbaE\x13\xaf\xe4K\xd1\x83\
-T\xc81%\x1b\xdc;\xf1\xef\xda\xcc\x9a\x0d:kp\
-6\x22\x02\xb5b3\x86~HX\x22\x81\xcb\x9f\x17\xae\
-\x96\xd8@\xa2\xe7\xd9\xb8\x0d\xb6\xce\xcd\x1b\xef\x82\x88\x0f\
-`\xf7\xe6m`\xb8q\x89\x05J'\xe4|<7j\
-\x84\x08v7\x9f\xcd\x1c\xe1\x83\xb9\xd3\xb37\xce\x8e\xbb\
-\xfa\xc1\xa7\xdcgo\xff\xb7\x8e=<`\x00\x86\x11z\
-7\x0f\xf8\xb9A\x04\xc2\xd9\x03^O\xb0\xb8|\xcd\x12\
-X\xdf\x97,\x001\xc2\xdf\xfb%f\x1fB\xf1\x058\
-\x15\x00\xca\x194\xa0\x81b\xd1'\x10\x01\xe518T\
-_\x079(!N\xb5Yw\xa1X\xfd%$\xdd\x86\
-B\xe5\x87P\x86 \x0ee\xe1m%\xe6\x94`A\x1f\
-\xa6\xe8\xd2x.\xd2\xe5^\x8cb\xa5G\xe3\x8d%\xd2\
-\x84\xa3X3\x0e\x04\xe3\x8e \xf9gP\x02@\xb6d\
-#A(\x16I\x91\x88\x06\x09\xa9\xa4P\x05>\xd9\x12\
-xRN\xd4\xa3@TV\x19Q\x84Z~te\x97\
-`\x86)\xe6\x98\xdf\x91\x09R\x96fJ\xd4b\x9al\
-\xe6\xe4d\x9b\xcf$)\xd0\x91l\x02\xf0\xe6@\x00\xc2\
-\xf9\x0c\x9az\x1e\xb4`\x9f\x07\x11I \xa0w\x0aD\
-!\x9c|\xe2\x09\xe8\x9f\x04\xe9\xa8\xa7\x9c\x93\xe9\xf9%\
-\x93p\xfeH\x10\x89p\x22\xe0a\x9f\x16R\xda&\x01\
-\x099\xda\xa6\x85\x0ep9&\xa8\x08Yj\xa6\x85\xcf\
-\xac\x09\xa8@y\x1e\xff\x94\xc2\x05A\xb5\xe9*\x03\x04\
-4\xa3kpi\xc6JP\x01\xba\x06\xdb\x0c\xafE\xa2\
-\x8a\xd0\x9a\xfd\x09\x1b,\xb18z\x10R\x03\xca\x0a\xab\
-\x12\x8e\x98Vd@\xb4\xc2bpc\xa2\x13\x01\x8bm\
-\xb0\xd5n8\x80\xa6-%\xf0m\xb0\xac\xde7.D\
-\xae\x0ed\xd6\xb9\xcd\x9cV\x22\xb9\xcbI\xc4\x00\xbc\xf1\
-\xa6\xcb\xdd\xba\x0f\xa9\xaa\x1e\xbe\xcd\x84\x15`\x01\xf4\x22\
-$(E\x0b\x00l\xd9}\xce\x08\x9c\xd0\xa1K\x02\xfc\
-@\xbb\xc3\x01\xe0,D\x07|\xf9\x10z\x00#\xc0m\
-\x80\x19\xb7\x04\x80\x03\x007\x83\x01\xc5\xa1Y,Q\xc8\
-.\xbd[\xf2\x05Q\xaeVpB+\xb6$@\x04%\
-\xc7{\x13n\x22P\xc4rN\x00$\x9c\xb3\xb1\x92\xed\
-<Q\x04(\x87t-\xbc\x06aP\xebVI\x1b$\
-A\xcc81p\xc0\xb7\x09!\x80\x81\xc6\x1f\x19MQ\
-3\xfe\x0e5\x00\xc9\xd1N$\x02\xd7\x07\x01`\xc1\x06\
-DS\xe4\xc0\xc7K\x01`\xae\xb0\x1f!\x86\x01\xad\x8a\
-\xb5f\x81\x08Z\xb5Nm`\x00d\x17\xda\xdc\xdb\xbd\
-\x15@\xb6y\x8c\xe2\x06\x80\x015\x0f\x97xoA\x0b\
->[\xd4\xbcA\x1c\xda\xe3\xe1\x0d\x00\x97f\x09\x88\xca\
-\xa03\x0c,\xd0\xf8\xab\x91\x1e,R3\x07,P\x00\
-\xd5.:3\x00\x03\x98\x17\x84\xd8\x02\x06\x04\xc0z\x95\
-\xe5\xc1\xcd[@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x13\
-\x00\x13\x00q\x00q\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x13*D\xe8\xac\xa1\xb3\x85\x10#J\x9c\
-H\xb1\xa2B\x87\x18\x1bZ\xdc\xc8\xb1\xa3\xc7\x81\x19C\
-:\xfcH\xb2\xa4\xc9g\x22S><\xc9\xb2%D\x95\
-0]\xca\x9c\x09\xb3\xe6\xca\x998I\xda\xb4\x99\xb3g\
-\xc7\x9d5}\x0a\xa5\x08\x94\xe7\xd0\xa3\x17\x8b\xc6D\xca\
-\x94\xa1\xd2\x94M\xa3\x1e|\x9aQ\xaa\xd5\x82T5^\
-\xdd*0+W\xaeT\xbf\x82U*v\xeb\xd3\xb2f\
-\x8b\xa2\xbdJv\xadU\xb5n\xa5\x02\x8d\xfbVd\x00\
-\x0a\x02=\x0c\xa0+7c\x01\x83{\xf96\xc5\xc8\xe0\
- \x01\x00\x82\x077$\x80\xd0@b\xc5\x0a\x03?>\
-\xea\xec\xc0d\xb1\xce\x1c'lp\xf9(b\x85\x02:\
-\x7f] zh\x82\xd2\x5c-#\x84\x80\xfa*\x82\xd6\
-=\x9d9\x80\xed\x16\xc1g\xda\xb8s\x0f\xfc\x8bP\x82\
-n\x97\x95\x13\xde\xfem\x925B\xde\xc4MJ6\xe8\
-;\xf9\xc9\x08\xc2\x9d\x9b\xe4\x8c\xb0\xb0t\x92\xa1\x1b_\
-\xcfyz\xfbG\xd2\x0c\xbd{\xffD\x0eX\xbcL\xf2\
-\xe6\x8b\xa7\xe7\xd8\xdd`\xfb\xf5\x14\x8d\xbb\x87\xcf\xf2&\
-\xfd\x88\xe8\x09\xda\xbf\xbf0@\xc2\xe5\xfc)\xe4_\x80\
-\x1e\x0dH\xe0\x81M\x0d\x87 Q\x0bn\x94]\x83\x10\
-\xe6d\xe0B\x16\x5c \xc2\x83\x07\xe6g\xd0\x05\x084\
-\xe3a3\x1b,\xa8YB\x10|h\xa2u\x04\x82g\
-\xd0l\x00\x98h\xe2\x03\x07:\x03\xe3A\xa7\x05\xe0\xa2\
-\x89\x18\xd2\xb7\x1fA\x8e\xd9x\xa3\x87\x1a\xa67aA\
-\x7f\xb5\xf8c3\xcd\xf1G\xddA\x81Epd3\x04\
-&Y\x10\x94\x02\x95x$\x8a\xf0)HP{\x0c<\
-\xa9\x22|X\x16\xb4\xa4\x91?2v\xdf\x97\x05-\xe7\
-\xe4\x91\x00\x8a\xa7\xe5@\xb3\x11\xd4\xc0\x93#\xa6\xb7\xa4\
-A\xf2\x09$\xc0\x93f\xae\xd7\xa7AC>\xb3\xe6\x8f\
-A:\x17&Aq\x8a\xc9\xe7\x9b\xce\xcdx\xd0\x9d\x03\
-\x91\xf9c\x9d\xfc5\xc3\xe8\x02O\xdav \x9a\x04\xed\
-I\xa7w\x90\xa6\xa9P\x02\x992\x8a[\x8e\x15\xf9x\
-$\xa5\xbf\xe1\xe5\x11\xa9.\x0e\xff\xd4L\xa0\xb8\x85j\
-\xd1\x00&\x1a\x84@\x9b\xb0\x09\xf0\x1aB\xaaE\x84)\
-\x95\xde\x01\xe0\xe8A\xac\x0aw\x00\xb1\x06y\xa0\x1b\x06\
-\x0aE\xb0\xa3Bs*\x94lg\xb6\x12\xc4\xebB\xef\
-\x1dThb\x050k\xd0\xb5\x0b\x01\x10\xecA\xbb^\
-'-G].\xf4-j\x07l+Q\x9e\x075s\
-Ar\xefF\x04\xddB\xd0>&.\x9e%\x01\xb0\xaf\
-B\xc7\xb6\x96\xc0\xb4\x1b\x99\x0b\x11\x01\xf2^\xd5o\xb4\
-\xa6n4\xc0\xb9\x09\x89\x80V\x00\x7fF\xd7\xd2\xc4\x11\
-Q\xd0\xf0Q!^\x16rT\xce\x88\x90\xb1T\x11\x1b\
-d1Sw\xad50D0\xa6\x5c\x923)\xb8\xea\
-\x16\xa7\x0bm\x80\xaaI\x00\x80p\xf2Z\xf9\x1aD\x81\
-\x08\x08s\xe4lE8\x0f\xf5\xf2D0\xa6 \xb3A\
-\x02X\x5c\xb0D\x07\x1c\xca\x14\xb9\x11\x11\x80\xc1\xbd+\
-\xef\x05\x80\x05\x02\x89pA\x88\xbf\xb2'\x96\x00\xdd\xae\
-u@\xb6VY\xcdU3\x0b\xec,\xd6\xbfV%\xf0\
-1W\x02H)U\x02\xb4\xf24\x855Np\xdfM\
-W\x01\xa4\x0a\xe5@\x03O'&\x00\x04\x0e\xd0M\xd2\
-\xd2\xc9\x09P\xc0\x02\x90[\x94\x00\xbd\xe6\x01\xc0\x00\x04\
-\xa7%\x9a\x10t\x10pV4\x7f\x89_\x15\x10\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00(\x00r\x00\x5c\x00\
-\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\
-\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\xb1\xa2\xc5\x8b\x183\
-j\xdc\xc8\xb1\xa3\xc7\x8f C\x8a\x1cI\xb2\xa4\xc9\x93\
-(S\xaa\x5c\xc9\xb2\xa5\xcb\x970c\xca\x9cI\xb3\xa6\
-\xcd\x9b8s\xea\xdc\xc9\xb3\xa7\xcf\x9f@\x83\x0a\x1dJ\
-\xb4\xa8\xd1\xa3E\x01X\x00\x91\x02\x00R\x92\x0c\x104\
-\x9b\xda\x8c\x82\xd3\xa7\x1f\x05H\xa5:\x95\x00\xd6\x8f\x0d\
-\xb8r-\xf0\xb5c\x02\xb1T\x0d\x94\xe5\xf8\x00\xedT\
-\xb5k5\xba}\x1bW\xee\x5c\xb2u/\x02\x98\xdb,\
-@\xde\x8b\x01\xf8\xfa\xfd[1\xf0\x5c\x01\x84\x0b\xf3M\
-\xac\xf80\xe3\x89\x86\xdd\x0e~\x0c12\xda\xc9\x94\x0b\
-\x82h\xdb\xec\x01\x85\x0d\x17\x04X\x16\x8b9\xb3@\x03\
-s\x03\x0c\x10l\x9a\xa0\x00\xbe\x88\xf96h=\xb0\xc0\
-bg|\xe1\xd2\x860\xd7\x81\xc0\xb3n!\xd0\xfe=\
-7\x01q\xb7\xc6\x87\xe7\x16\xc8{\xee\xf0\xd7w\x05\xda\
-NM\x9b\x01kg\xab\xe7\xcen\xdd\xdc-A\xbe\x12\
-hs\xffF\x1b\x81 p\xb7W)Cw\xbb\x80 \
-\xea\xb9\x0cLOw\x1b\x7f`v\xf6\xa6%\xf0M/\
-\xd0\xc1\x5c\x04\xfc\x11\xb6\xd7\x5c\xe5\x15\xd4\x1dZx1\
-\x16\xd6\x5c\xba\xd9\xc7\x97W\x8f\x11\xc0\xd7\x00\x07\x1d\xc0\
-W}\x84\x8d\xc6U\x81\x06\xbd\xe7\x16\x05\x8cQ \x1b\
-B\x03\xc2\x97!_\xcd\x04H\xd0\x02\x0f\x12&\xe2\x5c\
-\xed%t\x9f[\xdb\xc5\xa5!W\xa5\x19t\x1eZ\x00\
-\xc6\x05\x80\x84\xc51t#U\x1e\xc4u\xe0e\x0d\xb1\
-8\xe2WCN\x95\x1cC\x02X\xf8\x1fbO\xfd\x88\
-b\x8e\x09y\xe8\xd6\x03Xy\x80bx\x0f\x01\xe0\x1f\
-_\x18 \xa5%Z\x07\xa8\xb8P\x93S\xd58\xd4|\
-\xd1It$Z\x18\x06\xc5f3OJ\x14\x01\x8a\x08\
-P\x18\xd4\x00[\xcdu\x00\x95\x13\xcd\xe8V\x9f@\x01\
-\x8ab3uN\x04\xe7\xa1~\xf2T@\xa0\x0cf\xa4\
-$_\x084z\x13\x08\x8b6\x03fF\xfa-z\x81\
-N\x18t\x1a\x81\x9a\x14\x01\xb0\xe7\xa2\x1e\xa0\xea\xd2\x00\
-\xe3\xf1\xf6ujGQv\xfa\x00\x96-]\xd0i3\
-\x07D\xca\xd1\x00R.\xba\x81\xab'\xc1\xbak\xaf!\
-\x01\xbb+\x01\xb8\x9a\xa4\xeb\xb1\xbe~\xa4\xec\xae\x144\
-\x1b\x92\x08\xb1\xa2\x18\x01\xa1\x22\xa9\xba\xebT\xd5\x96\x04\
-\x00\x08@\xee*\x01\xb1\x1d\x01\x10\xea\xb7\x04\x80\x80n\
-E\x02\x5c@i\xa71\xa6t\xe6\xae\x1e\x88\xc0\xadE\
-\x00\xa4P\xea\xb7S\x1d\x90\xa0J\x0c\x04\x0bpg\x1b\
-\xa4\xb0oC\xfdn\x90\xed\xb7\x09,\x9c\x92\x00;\x1e\
-L\xd5g\x17\x88`\xc1\xc6Nm\xbc\xd4\x05\x17x\xf0\
-0\xc0\x07\xb8\xf9R\x03\x06[\xac\xf2\xca\x11\xd7\xa4\xee\
-\xca0\x1f,pN\x01T\x1c\xf3\xcd\x5c-\xf0.L\
-5\xe3\xec\xf3\x01\x0bHL\xf3\xa5>\x1f\xec\x80\x01;\
-\xdf\x04@\x03c\x16\xbd\xa8\x03\x03\x1b5\x80\x01\xab:\
-\xbd!\x04\xd6&U\xc0\x02U\xc7\xec\x00\x04\x0c$\xfd\
-T\x00\x05\x18\x90@\xd7\xc5%\x90\x80\x01\x05\x08M\xdb\
-\x00\x01\xc4\x1dw\xb41\x05\x04\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x12\x002\x00r\x00R\x00\x00\x08\xff\x00\x9f\
-\x09\x1c\x08@\xc4\x83\x07\x18\x02\x0c\x5c\xc8\xb0\xa1\xc3\x87\
-\x10#J\x9cH\xb1bC\x0f\xcd2f\xf4\x00\xc0\xa2\
-\xc7\x8f C\x8al\xa0\xb1\xa4\x07\x91(S\xaa\x0c\x89\
-\xa0d\xc9\x01+c\xca\x9c\xf9\xac\x80\xcb\x92\x0ai\xea\
-\xdciQ\xc2M\x8d\x02x\x0a\x1d\xda\x10\xc0\xcf\x8c\x0e\
-\x88*%J\xf2(\x84\xa5Pw>8\xda\x8cA\xd4\
-\xab1\x8d\x1e=\x80\xb5kJ\x9bG\x17x\x1d\x0br\
-\x01U\xabd\xd3R$\xb0U\xad\xdb\x88\x02\xa8Jx\
-K\xb7!\x83\x8c\x0b5\x16\xa8\xcbW\xa0\x81f\x0d3\
-v\xec[w\xae\xc3\xa4\x84\xeb>x\x98 q]\xc0\
-\x0e\x0d;V\x1bt\xf2\xe4\x9c\x0e\x0dXV\x8by\xb3\
-\xe7\xcfn\xd1:\x1c\x0c\x1a\xab\xe6\xd2u\x1b@t\x86\
-\xba.\xcc\xd6\xb0cOtF\xbbv\xed\x88\xa2e\xab\
-\xb4\xcd\xdbYg\x86\xa7u\xa7\xec\xcd\xbbrf\xe1\xbb\
-\x89\xd3\x96(\x169J\xe5\xcb#6v.\x12:\xeb\
-g\x92\x19.\xa6\x1e\xd2\xba_\x88\xc6\xb9W\xff\xb4~\
-=\xe2^\xf1\x16\xc9\x0b\x0c\xcf0;z\x89\xde\x07\x22\
-\x0e\xfc~<\xf4\x85\xcd\x1d\xe6\xae\xefP\xfd\xc0\xf3\x0e\
-\xe5\xc7_\x7f\xf1\xad\x07\x11\x02\x03\xaeV\xa0@\x11<\
-\xd4\xcck\x09.\xe4\xdfB\x006\xf4T\x84\x12.(\
-\x10i\x0d!\xc0a\x84\x13.\xe4\x1e\x85\x18\x0a\x14\x22\
-\x89\x0f\x11P\xe23'.\xc4\xd5C\x15\xf2G^y\
-\x0d\x05\xb7\x22C-.\x04\xc0\x8b7\x0e4#s=\
-\xfa\x98#C\xec1$\xa0x?\xaa\xf4\x9bsI\xae\
-\xf4\xa1p3\xd2\x98\xd2I\xdc5\x19\x93jLZI\
-\xd1~v!\x17eH#.\x84\x00\x84\xb0}\x19\xd2\
-\x8e2\x9a\x19\xd2\x92Yj\x09\xd2\x85\xdc\x15tA\x0a\
-\x00\xdc\xb7R\x83\x12\xb1I\x18\x03\x08\x0a\xf4@\x9d\xbd\
-\xc9\x04\x00\x9e\x11\x81`\xd9\x93\xcf\x10\x00\xa8m3\x0d\
-\xc0#z\x10\xf0\xa6\x13\x99\x07\x12fhD\x8c\xeet\
-\x17E\x18\xd0%\x00\x95\x11\x05\x10\x1dOzvx\xe9\
-X\x1d\xf5)Q\x9d|\x11 \x82W \xa8\xa0*Q\
-\xa4P\x0d0\xdfD\xaeB\xe5\xcc\xab\x16% \xa5R\
-\xd3U\x84\xc0\x06\x946\xda\xa9Gpz\xf6\xc0\xa9+\
-\x09\x00\x82\x8a\x1fqyU\xa9\x12\x11\xd0)\xa2\x12\x0d\
-\x00\x02\x06\xd0\xc6\x06@\x98\x16\xa9j\xc1B\xc6\xa5\xf0\
-\xcc\x06\x14\xc8\xfaQ36\xba\x15\xc0\xad\x899@\xed\
-X\xce\x18\xf0h\x90)\x09p\xa4Z\x07\xb4;\x99\xbe\
-\xf7v\x05\x18\xb6\x93\x01`\xefX\x10\x14Y\x9a3\x0c\
-\x80\xbb\xd3\x02\xd2\xca\x06\x00\x96B\x15@\xb0s\x0c$\
-+\xd2\x01\x09\x18 j\x8f\x1d5\xf0\x14\xbc\x0e5\x08\
-A\x03\x03\xfc\x8a\xaf\x8e\x0c\x05P\xac[\x01\x01\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00'\x00`\x00]\x00\
-\x00\x08\xff\x00\x9f\x09\x1cHp\xe0\x00\x0a\xcd\x10`\x00\
-P\xb0\xa1\xc3\x87\x10#J\x9cH\xf1a\x81f\x181\
-\x22\x18P\xb1\xa3\xc7\x8f \x1d\x0e\xc8H\x12\x81\x80\x90\
-(S\xaa$\xf8\x80$I\x08+c\xca\xa4\x08\xc1%\
-\xc9\x043s\xea\x1c\x18\xc0\xe6\xcd\x9d@c\x02 \xe0\
-3c\x80\xa0HQ\x1a(\x8a\x11g\xd2\xa7\x1d\x05 \
-`z\xe0$\xd4\xab\x12\x170m\xd6\x00\xab\xd7\x87#\
-\x99J\xf8J\xb6 \xc2\xa2\x07\x18\x96-;\xb2 \xc9\
-\xaek\xcb.p\x88\xd1A\xdc\xb2\x00\x9a=l\xc6\xe0\
-.Y\x03\x10\x9d\xfa\xf5J\x00b\xdf\xc1X\x8f\x22F\
-\x0c\xf3!\xdc\xc5P\x0b;L\x0b\x19*\xc7\x87s+\
-?\x05\xfc\xf0\xb0f\xa4\x82\x1b\xaa\xfd\x1cT\xaf\xc3\xb1\
-\xa4\x83^v\xf88\xb5\xce\x02\x10\x15\xbb\xd6\xd9\xd8\xa1\
-\xb3\xd9;C\x13\x8c\x80\xdbk\xed\xde\x9b\x81\xcf\xbc\xed\
-X\xb8\xcc\xd5\x0de\x1b_\xce\xbcyL\xe5\x05\xa1;\
-\xef(\x9d\xe7\xf4\x90\xd5\x05\x8e\xbe.s;\xf7\xefd\
-\xad:\xff\xcc\x0e\xde6D\xd8\xe5)\x12O\xafR\xf7\
-\xc0\xdf\xec\xe3\x07\x85?\xd0\xb4\xfc\xf3\xf7\xb1\x1b\xce\xff\
-p}C\xfa\xfc\x09\xc4\x9bC\x0f\x04\xf8\x91x\x06N\
-\x84^\x82\xdaA\x84\x1a\x83\x13yg g\xacA(\
-\x10r\x05\x11\xe0_\x82v=D\xde}\xad\x99e\xa1\
-@\xf6%7bf\x0eQ0bO\xb1\x8d\xe8\xde@\
-\x92A\xf8!\x80\xfc\xbd8\x22O%f8\xe2\x837\
-6$\xc0\x01\x11Q\x98`\x88=\x12dc\x8f\x08\x16\
-I\xd0\x82J~\xe4\x19p\xceD\x19\xa5G<\xd2\x05\
-\x82pRf\xb9\x13\x06\xb8e\xe9\xe5\x861=\x90$\
-d_z\x19\xd4\x05\x9f\x95i\xa6G\x03\x009\xd1\x03\
-\x18\xc6\xa5f\x99\x1f\xc5\xb9\xd7\x05\x12z5\xa7\x9a!\
-\x0d8\xdb\x9et\x86\x04\xc0\x91\x0e\xe1\x89\x15\xa0\x81\xa2\
-\xe4\x0c\x8a\x15a0\xe6p\x88&\xaa\x12\x93\x15Q \
-BN\x91\xce\x99\xd3\x00\x84J$\xc2\xa3\x12e\x0a\xe8\
-N\xce4\xe0fH\x85y\xf0\xcc\x05W>3\x80\xa8\
-\xb0\x82U\x99\x93\x00\x9d\x86\xf4\x00\x03\xb1\x8e\x0a\xd5\x93\
-95\x90\xab\xa4P\xe5\xb9\x12\x02\xbf\xaeY\x16\x8d(\
-\xbdZ,b\x05t\xb8R\x00\xbf~V\xabD\xcaf\
-:\x9b\x00\x06L\xdb\xd0\x01\xa2\x1a\xe7L\x00\xd9vd\
-\x80\xae\xd7\xddf\x80\x01\x12$\xe0\xde\x01\xe3\x02{\xdf\
-\x94\xcf\x08 %T\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\
-\x00,\x12\x00\x1e\x00>\x00f\x00\x00\x08\xff\x00\x9d\x09\
-\x1cH\xb0\xa0Ag\x02@\x80\x10p\xb0\xa1\xc3\x87\x10\
-#^hF\xb1\x19\x88\x88\x183j\x04\xf0\xa0bE\
-\x08\x1aC\x8a$\xc8\xd1\xa3\xc7\x01#Sb\x1c\xd0\xd1\
-dE\x09*c6\x1c\x80\xc0\xa5\xc7\x072s\x0e\x14\
-P\xd3f\xc5\x05:s\x96\xf4Y1@\xd0\x98C\x89\
-6+p4&\x05\xa5\x14\x996Mi\x00\xea\xd2\xa9\
-)\x03@=`\x14\xabH\x00=}\x1e@\xe9U\xe4\
-S\xa5R\xcbjl\x005\xadZ\x8c`\x956x\x1b\
-r\x81R\x98t3j%\xea\x00@\xde\x8cg}v\
-\xfd\x0b\x91\x81R\x03\x841\x06v\xd971\xc4\xbd>\
-\x198\x86(\x81h\x82\xc9\x0f\x05(%\x8b\xf9 \x04\
-\xcb\x9d\x1d\x12 :84\xc1\x01D#\x98\xf6L\xd4\
-\xedj\x81\xa3}\xfa}\xbd\x93(^\xda\x02\x0b\xb4\xc6\
-=\xd0\xael\xde\x02[\xba\xbc\x0c\x1c\x00Q\x90\xc0!\
-\xbb\x94\x0c\xbc\xea\xef\xe6>\x1d\x00\x17\x98\xc0'q\xe0\
-\xc2M\x02\x9dN\x141\xf7\xc8\xd3\x9d\x91\xe9\x9e\x8eZ\
-\xf0t\xe5&K\xd3F\x7f\xf2<\xd1\xf0\xec+r\xc6\
-\x1d\x9f\xa2\xfa\xd7\xe5m\xde\x7f=\xfe\xbbM\xd7\xb4u\
-\x17^\x04>\xdd\xc6[e6\xe14\x9ds6\x85\xa7\
-\x9bO\xf3\xadG\xd4\x5c\xfe\x0d\x17\x1e\x82\x0dN\xc7\x16\
-x\xc0\xe5\xe7\xd2v\xc0\x1d@\xd4l\xbc\xf9\xf6\x9f{\
->)\x08\x9c\x03\xfd\xf1\xc6\xa0K\x14L\xa7Y\x8b\xb8\
-a\x08#\x8a>Q\xc8[u>!@\xa2\x84Dy\
-0\x1d\x8f\x1c\xe26c\x8f\x0c\xb9\xa8\xd4\x03?\xae\x06\
-\x00\x8bDa\x90\x5c[\xc0\x99\xe8\x13\x80\xa1\x01@ \
-Z\xbc\x0d \x22Q\x08\xec\xd7\xd9\x83\x5c\xe2f\xa5O\
-\x17\xe1\xb6\xa5RR\xd2\xa6\xa5Um\xbe\xf6&T\xcc\
-\xc9\xf9%Q \xe2\xb7\xa6My\xca\xb9\xa7IX\x9a\
-\x06\x80\x8d\x15I\x17\x9e3g\x8eu\xa8@\x0c@\x99\
-@\x84\x87\x0a\xd0\xe4\xa2\x94Vj\xe9\xa5\x98f\xaa\xe9\
-\xa6\x9cv\xdai@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-\x12\x00\x18\x00&\x00a\x00\x00\x08\xff\x00\x9d\x09\x1cH\
-\xb0\xa0\xc1\x83\x04-\x00@\xc8\xb0\xa1A\x00\x18\x104\
-k\xe6a\xa1\xc3\x8b\x06\x19H\x9c8\xf1\x01\xc6\x8f\xce\
-\x04x\xe0H\xb2\x19\x04\x90\x0eAl,9\x11\x01J\
-\x84\x02(\xb0d\x19\xe0eA\x953i\xda\x1c\x88!\
-'\xcb\x03\x16_B\xf4\xc9\x92\xc1N\x00\x0f\x88\x92t\
-0\xe0hR\xa5\x13!\x04E\x89\x14j\xb3\x08Mw\
-\x0eXI\xd4\xc0N\x81\x02\xb8\xe6\xc4\xfaU\xe0S\xa2\
-\x0b\xca\x0a\x84\x00\xb5\x81Zg\x0c\xa0\x16x\x1bV\xe9\
-\xdc\xb7gg\x1e0\xfa\x96\xad\xcf\x03Y\xd5\xc6%z\
-\xf7-\x01\xb4o\x05\x16 \x1aaj\xd9\xc39\x01'\
-v\xb6\xd8ga\xb5\x00\xc4\x92L;\xd9\xc0_\xc7_\
-3\xfb\xf4\xda\xf9\xf3dg\x9a9\x92N<X/\xe8\
-\xaf\x0bF\x9fF\x1d\xf9\xf5\xce\xd6,O\x9e\x8e\x9d3\
-p\xe2\xd4\xcd\x1c\xcc\x1e\xe0S\xf7d\xbf3k\x9e\x86\
-\xfcs6\x00\x9f\x9c'\x07\xf0\xc9w2\xee\x92\xb6w\
-z\xce9\xdb\x19o\x96\x09\xba'\x8f\xc8)\xa1;\xf0\
-\xd5\x93-\xcf\x9e\x9eS\xb9t\x9f\xd9m\xb2\x9f\xe9\xfb\
-\xed|\x9d\xa7\xef\x97t\x9fX\x80O\xfe\x89\xfd\xd7\x9d\
-\x80\xb3\x11x\x9aOn\xcdv@N\xd1M6\xdeL\
-\x1e\xcd\xb6\xddL\xdd]G\x12\x80j\xf9\x97S\x82\xa7\
-9\xc0`w\x12\xe4D@w\x13\xb2\xd4\x9d~$\xd5\
-\x87\x99O*\xaa\x15bs\xdd\x11W\x92d\xdd\xc1\xb5\
-\xe0D\x0b\x08P#A\x03`\xb8\xe3\x8f@\x06)\xe4\
-\x90D\x16i\xe4\x91H&\xa9\xe4\x92L6\xe9\xe4\x93\
-PF)\xe5\x94TV\x89R@\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,\x12\x00\x15\x00.\x00J\x00\x00\x08\xff\x00\
-\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x05\x0a\x00\x81a\x83\x88\
-\x84\x10#&L\xe1\xa1\x99E\x8b\x18$j\x84\x08\x00\
-\x04\x81\x8b \x9b\x15\xd8Hr\xa0\x00\x0c!S\x12(\
-\xb9\x11\xc0\x85\x940\x9b\x01`\x19\x11\x04\x82\x980\x03\
-\xd0D\x18\xe0#N\x98\x02v\x1a\xdc\xf03f\x04\xa1\
-\x04\x05<(\x0a3\xc2L\xa4\xce\x0a\xdcd\x0a2\xc2\
-H\xa8\x00PR\xb5x`\xc1\x00\xa8\x02\x01,\xdd\xea\
-\xa0\xc0S\xb0b\xb7\x1e\xb8\x0a6\xec\xd8\xa2\x07\x0c\x9c\
-m\x9b\x96\xa9\x84\xa0m\x07\xd6\xfd\xb96/\xc1\xbd8\
-#|\xf5;\xb0bQ\x08\x84\x09B`\xca6q\x01\
-\xc6\x89\x07\x0e\x98\x8a\xb31a\x00>+G\x1eh\xa0\
-(\x83\xcd\x02\x07\x14m\x00Z\xe0[\x98\x0bJ;k\
-\xf0\xd3ii\x01\x94S\x1e\x98\x1by\xc1O\xcb\x89\x05\
-\xfcL\xa0\xda\xd9\xe2\x98\x07\xf0\x82\x06\x10;\xa4\x81\xde\
-\x9dc:\xe8M\x5c\xb3\xea\xc7\xca{;\x93\x80\x93\xb4\
-j\x008g\xf7\x86\x0e\xf3xo\xea1\x85\x0fG\x0f\
-,\x9d\x01N\xef\xaa\x93\xc3\x1c\x9c>z\xf9\x98\xd6\xa5\
-G\x90M\xbb4\x00\x03\x07.\x1e`/}`\x80\x06\
-\x01\xd4\xd7\xdf\x80\x04\x16h\xe0\x81\x08&\xa8\xe0\x82\x0c\
-6\xe8\xe0\x83\x10F(\xe1\x84\x14Vh\xe1\x85\x18f\
-\xa8\xe1\x86\x17\x06\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-\x14\x00\x13\x002\x000\x00\x00\x08\xf6\x00\x9d\x09\x1cH\
-\xb0\xa0\xc1\x83\x08\x11Z\x00aA@\xc2\x87\x10#\x0e\
-\x00\xe1\xa1\x99\xc5f\x08\x0aD\xdc\x18\x11\x80\x08\x0c\x04\
-.\x8a\xb4\x18\x80\xa3\xc9\x82\x22\x1e\x8c\x5ciq\xc1I\
-\x93\x00@\x84d\xc9\x12\xc1\xcb\x8e\x17\x10\xd0\xdc\xd9\xec\
-fB\x01\x18x\x0a\xf5y\xf0\x82P\xa1\x12\x88\x12\x1c\
-\xa0\xf2\xe8\xce\x03\x03\x94\x0a4\xea\x94\xa6\x03\x08\x00\xa4\
-\x0ahZ\xf5\xe2\x01\x09\x0d\x1cJu\x06Bg\xd7f\
-\x11\x0c\x94\x1c;0h\xd7\x03\x10\xc4\xb2m\xdb\xd5\x81\
-\x81\xacs\x07\x02\xa0P\xd5\x81\xc6\xbc\x04\x01p\xe5y\
-\xa0\x01\xe0\x82\x82\x9d&\x90{\xd8Yb\xa1\x85\x1b\x07\
-\x1eL3BT\xc9\x03!\x1cu\x89y\xe0\x80\xa3\x7f\
-;\x0b, 4\xb4hg\x0cx\x9a>\xed\xec\x00\xcd\
-\xd5\xac\x07\xb8\x1e\x09\x9b\xb5\xb3\x01\x0e\xbc^\xb6m\x10\
-@\x01\x08\x05\x18\xf3\x1eN\xbc\xb8\xf1\xe3\xc8\x93+_\
-\xce\xbc\xb9\xf3\xe7\xd0\xa3K\x9fN\xbd\xba\xf5\xeb\x9d\x03\
-\x02\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x1f\x00\x13\x00-\
-\x00\x1b\x00\x00\x08\xa9\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x05\
--\x5c\xb8@\x81B\xb3\x87\x0f\x18 \x9cHq\xa0\x80\
-\x14\x1b\x1e<\xdc\xc8\xf1\xa1\xc4\x8a \x05\x02\x00\xa1\xb1\
-\xa3\xc9\x8d\x04BR\x04 \xc2\xc3\xc9\x97\x1c\x01\xa84\
-\x08\xe0\x02\x02\x988\x1f\x06\x98i\x11C\xce\x9f\xcdv\
-\xf2\x04q\x13(\xce\x032g60\xfa\xd3\x00Og\
-E\x99\x9e<\xe0\xf4\xa9\xd4\x8d\x07\x12,0P`\xc0\
-\xd3\x81\x07\x8cF\x80P@\xc0W\x84\x0brFh`\
-\xf6,\xc5\x01aMRm\xeb\x16$\x83\x8e\x0e\x0a$\
-\xad\xab2\xc0\x82\x04\x12>\xf2\x1dL\xb8\xb0\xe1\xc3\x88\
-\x13+^\xcc\xb8\xb1\xe3\xc7\x90#K\x9e\x5c1 \x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,/\x00\x12\x00$\x00\x10\
-\x00\x00\x08\x81\x00\x9d\x09\x1cH\xb0\xa0A\x82\x16,,\
-KhA\xc0\xc1\x87\x05\x01X\x00q\x81\x02\x81f\x18\
-3jD\xe0\xc1!\xc4\x82\x030h\x1cI2#\x02\
-\x8f\x1f\x9d\x09@P\xb2\xe5\xc8\x05)\x05BpI\x13\
-c\x82\x98\xce\x12\xd4\xa4\x89\x00\xa7\xce\x9d-o\xc6\x94\
-\x00\xb4%\x04\x9c\x05\x8a\x92<\x80\xf2#\x80\x08J3\
-F\x08\x80S\xa0\x80\x9f\xcd\x0e$X`\x80A\x80\xaf\
-\xce\xbe~\x05P\xd5`\x00\xb2e\xd3\xaa]\xcb\xb6\xad\
-\xdb\xb71\x03\x02\x00!\xf9\x04\x05\x02\x00\xcf\x00,<\
-\x00\x12\x00\x19\x00\x0c\x00\x00\x08X\x00\x9d\x09\x1cHP\
-\xa0\x05\x0bF@\x1c\x1cP\xb0!\xc1\x00\x0f\x9aI\x9c\
-8\x11\x81\x07\x86\x0e\x05\x06\xa0\xc8\x91#\x83\x8c\xce$\
-t\x1c\xd9\x8c\x00H\x92$O\xa2\xec\x88\xb1\xe1\x81\x95\
-\x1c\x01d\x14\x09Sb\x04\x90\x03jJ,\x00\xd2Y\
-\x00\x070\x0d\xf4|\x18 \xc0\x80\xa2He\x0e]J\
-0 \x00!\xf9\x04\x05\x02\x00\xcf\x00,D\x00\x12\x00\
-\x14\x00\x0b\x00\x00\x08U\x00\x9d\x09\x1c\xe8\xcc\x82A\x00\
-\x04\x13\x12\x14@\xa1\x99\xc3\x87\xcd\x1eP\xd8 \x02!\
-A\x00\x04 j\x84\x08\x82`\x83\x8d \x1d\x16\x18\x08\
-!$\xc8\x07\x03\x13\x98\x04Ir\xa5\xc6\x03\x03\x0b\xb8\
-\x84(\x81\xa0\x83\x99\x22/B8\xe02\x81B\x81\x00\
-\x02\x08e`\x00B\x82\xa3#\x9d\x05\x04\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,G\x00\x12\x00\x17\x00\x0d\x00\x00\x08\
-k\x00\x9d\x09\x14(\xc0\x02\x80\x81\x08\x13&\x04p\xa1\
-\x99C\x87\x04(P\xb8\x00b\x80B\x84\x10\x1ej\xdc\
-\xd8lb\x8a\x83\x03\x05p\x1c\xb9\x11\x83Eg\x01H\
-\xaat\x88\xc0\xa2\x81\x95+\x1f\xa0\x84\xb9\xd2\x99H\x9a\
-$\x05.\xc0\xc91\xc2\xc0\x06\x0ex>4\xb00@\
-\x00\x03\x06\x16$8@\xf2\x00\xc8\x8b\x08\x07\x14X\x10\
-\xe1a\x84\x93P\xa1\x02\x08 ``@\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,H\x00\x12\x00\x1e\x00\x10\x00\x00\x08\
-\x85\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x06/ h\xc6\x90\
-\x02\x85\x0b\x17, \x9c(\x10\x02\xc3\x8b\x18\x19>\xd8\
- \x02\x00\xc5\x81\x032\x8a\xcc\xe8\x01\x84\x00\x8a\x05F\
-\xaa\xc4HA\x04B\x03+c2Dp\xe1$A\x98\
-2sn\xf0(0@\xce\x9f\x04l:K\xf03'\
-\x85\x81\x00\x16\x14\x95i0@\x03\x08\x09\x0e,\xc5\xf8\
-\x11\x80\xd3\x05\x0e~F\xf8Xp\x00\x04\xa9+\x1bp\
-=\xc8@\xc2H\x09c'\x02h\x10\xe1b\x02\x9ei\
-'\x0e\x08 4 \x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-J\x00\x13\x00&\x00\x14\x00\x00\x08\xa2\x00\x9d\x09\x14\x08\
-\x82\x82\xc1\x0b)\x04\x0c\x5c\xc8\xb0\xa1C\x86\x0f\x9aI\
-\x9c(\x91\xc2\x06\x11\x00\x1ejt\xd8\x80\xa2G\x8a\x1e\
-0n\x1c\x99\xe0\xa3\xc9\x89!3\x8elx\xb2\xa5D\
-\x04\x17T\xae\x14\xe8\xb2&L\x99#\x1d\xd4\xb4\x19s\
-e\x81\x9d;a\xae4\x00t\xe7\x83\x01#\x01\x14\x80\
-P\xb2\xe8\xc9\x0b3\x05\x0eX\x1a\xc1)\xc5\xa3Q\x07\
-\x0ah\xa0\xd3j\xb3\x02Y\x17\x0e\x80\xd0\xb5(\xd8\xb0\
-\x0b\x0b\x94\xb5\x89\xb6\xa1Z\xa0\x01\xda6lp\xa0f\
-\x5c\xb9\x0c\x0545\xe9\x00'\xde\x81tM\x9e\xfd\xdb\
-P\xaf\xc7\x05\x847\x16\xa8\x1a\x81\xc1\xc0\x80\x00!\xf9\
-\x04\x05\x02\x00\xcf\x00,M\x00\x13\x00,\x00\x1e\x00\x00\
-\x08\xde\x00\x9d\x09\x1c8\xc0\x82\x05\x00\x03\x13*\x5c\xc8\
-\xb0\xa1B\x01\x14\x9aIl\xf6`C\x0a\x84\x0e3j\
-\x1c\x18q\xa2G\x8a \x04l\x1c\xa9p\xc0\xc7\x93\x12\
-\x1f\x80\xc0HR\xa3\x01\x940\x11`\x10\xd9\xd2\xe1K\
-\x988)\x04\xa8\xc9P\x02\xce\x9f\xcd<\xd0\xe4)\x90\
-\x01P\xa0\x18X\xf2\x5cp\xf4'\x02\x06D\x056\x88\
-\xd0\x14\xa7\x07\xa55\x054\xf0Y\xf5\xe3\xd3\xa8\x09\x19\
-@p\xd0u\xe2\x05\xb0\x0f\x0d\x1c(\x9b\x14mB\x00\
-j\xbb>\x18\xea\xd6\x19\xdc\xb5M\x11\x0c\xa8\xfb\xb6\x01\
-\xd9\xa3z\xf9\xbee\x0ax\xaf\xe0\x81\x05\xf0:\xa5+\
-x\x00U\xa0\x0f\xb0\xf2\x05@\xf8'\x85\xc3\x0a\x13#\
-\xc5\x9c\xb0\xc0Q\xa8\x9c\x05zv*Y\xf0h\x9c\x05\
-B\x0f\xbc\x09\xd3\x80\xea\x81\x95O\x82~\xed,\xf6\xc4\
-\x08\xb4\x13\xda\x8ePZ5\x04\xbc\x06z\xd3f\x1c\x10\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,P\x00\x13\x000\x00\
-+\x00\x00\x08\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\
-*\x1c`\xc1\x02\x00\x85\x10#&\x04\xe0\xa1\x99\xc5f\
-\x1eD<\x94\xc8\x11\x22\x84\x8b 1\xa6\xe8H\xb2 \
-\x80\x90(\x11\x5c\xd8X\x92c\x01\x940U\x0ah)\
-\xd1\x00\xcc\x9b\xcd0\xcc\xa4\x99\xd0&\xce\x98\x17x\x22\
-\x0c\xf0\x13\xe7\x83\x01B\x0d.(\x8aseR\x82\x0c\
-\x120\x85I\x00\xe9\xd3\x81\x02\x1a8\x98\x0a\x12A\x81\
-\xab\x05\x07@8\xc0\xd5\xe2\x06\xb0\x06\x0bl\xe5\xea\x81\
-%Z\x81j\xb9>p\xfb\xd6Y\x03\xb2L\xe7\xd6%\
-(@j^\xbau\x0b\xe0\xfd\xa9w\xef@\x00\x11\xfe\
-\x1a>\xbc\xb4\xe8\x83\xc5\x04}\xfe\x84\x00y \x03\xa6\
-\x0c*\xc3-\x8a\xc0j\xe5\x97\x84\x01\xef\x05\x8d\x93\xb2\
-fg\xa4o\x068\xed\xac\xf1\xcd\xc7\xa7\x11\xffl\xc0\
-z\xc0\xe0\x94\xa2\xf7^\xc6\xb9\x80\xb53\xbf7wj\
-\x160\xd9\xb7d\xdc\xac\x01\xac\x85i\xc0w\xea\x90\x04\
-|;[\x8e\xf2+\xeb\xe3!{'\xbf\x0d2\x82\xf4\
-\x8f0\x13H\x15\x17\xc0\xdd\x22m\xe9\xd8\x9bi\x97\xee\
-\xcc\x00^\x09\xab\xd9\xf3-\x18\x10\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,T\x00\x14\x000\x00:\x00\x00\x08\xff\x00\
-\x9f\x09tF\xd0\x99\xc0\x83\x08\x13*\x5c\xc8pa\xc1\
-\x87\x04\x1bJ\x9c\xd8\x10\xa23\x01\x1b(<\x13A\xb1\
-\xe3D\x8b\x03\x10 $\xe0\xb1\xa4B\x8b\x1a\x19\x020\
-Y\x12\x22\x03\x89\x08.\xacd\xf9\xf1\xa1\x01\x9a8\x13\
-BL\x90\xb3\xe7\xc0\x827M\x1a\xf4y\xb0\xe0\x80\x03\
-&\x1f\x10\xd5\xe9\x8c\x01R\x93 \x96&\x04\x10\xb4$\
-\x06\xa9S\x0d<\xc5\x8a\x93\xeaV\xae`\xc3b\x15 \
-\xf6`\x83\x8e\x08\xc8\x96}\xa6v\xad\xc7\xa1\x13\xaf\xba\
-}V\x80\xe2\xd9\xb9u'\x06\x98\xeb\xb1\xed\xda\x00_\
-\xf92|)xbU\x86\x03\x04K\x90\x98\xb2pC\
-\xc2\x8e\x17\x92\x8c\xcc\xf00\xe5\xcb\x89\x1b.(\x0c\xa1\
-a3\xc7\x81\x11\xde\xbdLz\x22\xe4\xb9\xa3\x15..\
-}\xb0\x99_\xb7\x9b\x176\xb3\xbcv\xc0g\x85\xcdx\
-\x16\xd6\x8d\xb0\x99o\xc7\x05~?\xf3M|\xaf`\x01\
-\xc4\x93\xfb\xa6\xbd\xd6\x81r\xe2\xbc\xf9.xN\x1c8\
-u\xdf\xc6\xf9\x22\xbf\xce\xbc\xacs\xea\xdd\xc5&7\xb8\
-\xbeZ\xf1\xf5\xe8s\x0d\x5cWZX\xfdu\xc7\x0c\xae\
-\xdf\x16\x1c@~\xf6\xb9\xdb\xa9\xdf\x9f{\xe0\xbd\xe3\xe9\
-\xcf\xa17\x17\x00\xdf\x11\xe7@f\x8e\x01\xd0\x80\x04\x09\
-H\xd0\xc0L\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-Y\x00\x16\x00+\x00K\x00\x00\x08\xff\x00\x9f=sF\
-\x90\xa0\xc0\x83\x08\x13*\x5c\xc8P`\xc1\x87\x06\x1bJ\
-\x9cx\x10\xe2C\x00\xce(jTh\x91\xe0\x05\x02\x02\
-7l\x1c9\xd0\xa2\x01\x85\x0cHR\xb4\x98r\xa1\x07\
-\x00*\x1bZ\x94\xd0\x10A\xcb\x98\x09-R\xa4 \x00\
-g\xce\x87>q>\x8c\x10T\xa8\xb3\x00\x076R(\
-\x8a\xd0\xd9\x00\xa2Lc\x020\xd0,j\xcc\xa7\x1ba\
-Z\x15H\x95\xe2\x03\xad[\x07l\x14\xbb\x95\xabW\xb0\
-e)BH;\xf2&\xdb\xb7\x14\x0bTmH!#\
-\xdb\x02I\x1b\x9e|\xeb\x16.\xc3\xb5\x0d\x09\xa0\xf5\xab\
-p\xef\xdb\xb9\x0b\x11\xf8m@\xd8'\x02\xbbl\x01\xe4\
-]X\xc0\xafa\x85\x04 7NX\x19\xee\xe5\xcd\x07\
-%7\xec\xfc\xf63\xe8g\x02\x10s<\x9d\xb0o\xd9\
-\x9e\x7f\x09;`\x08\xd2/\xe0\x85\xb0\xf96d\xecW\
-5B\x9a~\x81\xb3\x16\xc8{\xa1\xeb\xe1\xc8\x93+_\
-\xce\xbc\xb9\xf3\xe7i}\x1f\x0c\xe07\xf5\xc2f\xd4\xe1\
-\x06h\xe6\x9b{\xf6\xb7\xdb\xb9\x8ba\x17?\xb8,\x83\
-\xf1\xe8\x09SE/^={\xee\xb3-\xbfo\x96\x80\
-p\x82\xf9\xf5\xfd\x22\x98/\x9c\xed\x80\xf9\xcd\x14\xc7V\
-\x03\x00\x92\xf5\x96\x04\xf3Mv\x18\x7f~\x85\xf7\x9e\x80\
-i\xad\xf7\x9e\x81l\xdd\xf7^|p\x01\xb8@u\x00\
-\x92\xb6\xe0{\xb9\xbd\x05\xc1{\x1b66\xe2x\x07\x94\
-\xf7\x96\x00\x10$\x90\xc0\x02!>\x13\x10\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,_\x00\x18\x00%\x00[\x00\x00\x08\
-\xff\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\
-\xa1\xc3\x87\x10#\x16\x14 \x11b\x80\x07\xcd\x9aQ\xa0\
-XQa\x81\x8c \x9b\x15\xe8\x88P\x00\x82\x90 7\
-\x904\xb8\x00eH\x0a\x00V\x0e\xc4\xe8\x12\xe4\x83\x01\
-2\x9d\x1d\xa8\x19\x12\x01\xce\x95\x10x\xf6\xfc\xd9\x11@\
-\x04\xa1 }\xae4\x8a4#\x02\x8e$[6}\x10\
-se\x83\xa6\xcd<\xe4d\xb0\x13)\x84\x9c\x03\xba\x0a\
-\x1d)3,\xd2\xa7`\xc5\xd6\xa4\x90\xd3\xd9G\xa4\x0d\
-\xda\x1a8\x0bu\xa5\x04\xa4Zs\x02p\x804@\xdb\
-\x00H\xd9\xb6\x0d*\xd4\xaf^\xbe<\x05\xe7\x04\x5c\xb8\
-\xad\xb3\x04B\x178f\xcc\xb3jN\xc8<\xe3\xfe\x15\
-J\xc0\xb13\xc45\x89\xca\xbc\xca\xd3\x80c\x00B\x1f\
-x\xbe[\xd9\xf1\xdb\x9ads\x0a\x88\xec\xf9hM\xd5\
-\x8e\x09\xd7\xf4\xcc\xa0q\xdb\xd9<c\xe7\x14\xfa\xd51\
-f\x97\x09<\xebF\x99\xdc\xf1\x5c\x9e\x9eI\xef\x9e,\
-\xd4\xb2L\xca.\x0d/\xf6\xbd\x9d\xa7\xf6\xeb\xdc\xc1{\
-\xa3\xa7>~s\xf9\xee5\xebZ\x15\xea\xf9\xf9\xf4\xb6\
-R\x91{\xa6)\xdf1q\xf2\xb0\x1dKw)\xda.\
-\xfb\xb6\xa8\xf1\xd4\x5cN\xaf\xb9d\x1a|B\xf5W\xd4\
-I59\xa0\xdf}m\x11\x10\x1eI\xbd\xf1\xe4`[\
-\x14\x08u\xa0L\x05\xbad\x1dI\x12\xf2$YN\xee\
-\x85\xa6\x17\x835\x0d\xb8R\x86B\xa9W\xd1~.\x8d\
-\xb8\x92IB\x1d\xe0\xa2D\xf4\xd5\xb4!I\x18 \xe5\
-\xc0\x87\x12u\xc8\x1f\x87M\xedX\x11\x8dBE\x90\x13\
-\x8b\x09\xca\x14\xe0X`!%\xa3L\xa0\xa1\xa4\xa4k\
-5E\x00\xe4J%6\xa3\xa5g\x03\x05p\xd4\x01\x10\
-l\x99P@\x00!\xf9\x04\x05\x02\x00\xcf\x00,Y\x00\
-\x1c\x00+\x00d\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xe0\
-3g\x06\x13*\x5c\xc8\xd0\x99\xc3\x87\x0c#J\x1c\xf8\
-\xb0\x22\xc2\x89\x18\x0dZ\xb4\x98\xb1\xa3\xc0\x8d\x1b=b\
-\x04\x19RdD\x92\x0e-\x80\x18p\xd1\xa4B\x92\x03\
-\x1e\x0c\xa4\x00\xc0\xe5\xcb\x8d\x03\x10\x14$P\xd3\xa6\xc6\
-\x8a\x00\x08$|\xd0\xd3g\xc1\x87\x0c\x16zhi\x94\
-\xa23\x03\x0c14\xd5\x98\x94a\x83\xa9\x05\x01D\x88\
-8\x00k\xc1f\x0cyz\x1dX\x00\xecB\xa9c\x05\
-^eX5\xed\x82\x88E\xc7&`\x08!\xad@\x01\
-\x07\x18\x0a\xb0\xfb\xac-\xdf\x85o\xff2\xcc+Xa\
-\x81\xc2\x0b\xb7\x22\xf6\xb8wq\xc1\xba\x8e#K&x\
-X!d\xbb\xce\x08\x1b\x14\xfa7p\xc2\xae\x93\x9fA\
-\xe5\x1b\xb7\xa0\x04\xc1\xa7\x13r\xe6;:ac\xbb\x01\
-\x16\xfa\x1d[\x9a`k\xbb\x8a\x0dz\x0e\xfd\xf76\xc1\
-\xd5\xbc\xf9\xce\x0eN06\xf1\xe3\xc8\x93+_\xee\x92\
-\xe9\xd8\xca\x09\x9d{\xf5\xed\xf8r\xc1\xdcv\xe7\x86\xd6\
-\x99\xd0:\xed\x85k'\x1b\xca\xb7K}`m\xac2\
-\x13j\x96\x9c\xda\xeep\xb2\xbc_\xa75\xcb\xfcoz\
-\xc9\xe3\xeb\xc3\xd6\xcb\x97\xc2\xc2\xf6c\xbd7P~\xfa\
-y\xb4\x9bA\x04N\x95 A\xda}\xb7P3\x0b\x16\
-\xe6\xddb\xebE& ji\x955\xd8y61@\
-\x9fc\x1aJ\x06B3\x1f\x22\x86\x01\x89$.&\xc0\
-\x03(\xa6XX\x01\x08\xb4\x88\xe2_\x02x \xe3\x8d\
-\xcf4\x83\x9dM\x00\x5c\x10\xe3\x8d7\x1e\xc0aG\x22\
-\x10\x00$\x90\x11\x0c9\x11\x00E\x1e\x09\xa4\x04J\xc2\
-\xe5\xa3\x93@\x1e\xe8\xd1\x94T\xcax\x00t&5\x90\
-\xe5\x8d\x11\x80f\xd3\x8f_\x928\xa1Ie\x92\xe8@\
-\x84\x22\x95y@xSI\x90%\x04Q\x8a\x14\x80\x93\
-\x0b\xc87\xd6\x02Z\x1aP\xa7Q\x06$\xe0\x80\x04\x5c\
-\xfe\x15\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,@\x00\x22\
-\x00D\x00b\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\
-\x83\x08\x13\x0at\xc6P\xa1\xc3\x87\x10#\x0edH\xb1\
-\xa1\xc4\x8b\x18\x1dV\xdc\x98\xb1\xa3\xc7g\x1bC~\x1c\
-\x191$G\x92(\x13\x9a<\x99\xb2\xe5\xc4\x95\x15]\
-\xca\x84\xc9R&\xca\x95\x00@x\x001\xc0\x99\xcd\x96\
-!\x0b  X\xe0'P\x8a\x0d\x0c\x22\x18`4%\
-C\x01\x08\x09\xf8lJ\xd2\x99\x81\x84I\xa9\x8et\x96\
-\xf5 \x02\x00ZGBM\x08!,\xd5\xb1f3\xa2\
-=\xb8 \xad\xc7\xab\x09\xd7\xba\x8d\x08\xc0\x01\xd9\xb9\x19\
-\x8b\x22\xfc\x8a\x17\xa3]\x84p\xfbF\xd4+\xb8\xb0\xe1\
-\x82\x81\x0fw\x04\xd0L\xf1G\x09\x8e#K~\x96`\
-2\xc6\xa1\x96/2\xcd\x1c\xb1+g\x90w?\x0f\xac\
-|\x90\xb4\xe8gm\x0f>8\xed\xb01k\xc2\x06\xc1\
-\x9e\x0e\x90\x906\xeb\xdb\x097\xe368uw\xc1\xde\
-\xbe'\x06/({\xb8q\xcd\xacm\x1f_.0\xb5\
-\xc1\x03\xccq\xbb6\x98\x98\xb3\x5c\xa2\xac\x190w\xce\
-\x9b5\x01\x84\x11X_\xfd\x1fX\xf6\xb4\xe7\x82\xdaO\
-SPyz\xbc@\xd3\x9f\xab\x13<\x9f\xf9;B\xf7\
-\xb7\xe1\x0f\x87\x1d\xfc@\xf1\xe1\xdc\x0d\x87\x9fc\xf6\x19\
-W\x9eq\xba\x19\xb7\xdaq\x1e(\x14\xe0d\xf4\xed\xa6\
-\x1cB\xfcI6\x00f\x08\xe9g!\x86\xf7qv\xa1\
-C\xe9Y\xc6\x00\x87\x07\x1d8Y\x85\x06i\xb8\x9b\x7f\
-\xc7\x1d\x90\xa0c @\xe4b\x8b/*6\x9dC5\
-\x16v\x01\x89\x0a\xe5\x88\x17p\x10\x85\xa7\xd8\x00\x1b\x0c\
-\x97\xd3\x037B\x14aX\x02\x88\xb0\x01\x05\xcd$\x89\
-\x97\x05 \x5c\x90\x82\x05X\x02\x00\x00\x96T^p\x81\
-\x07\x08D)\xa6\x94i\x09\x80\xe4\x98h\xa6\x99\xa6D\
-B\xb6\x04\xa5\x9ap\xaa\x09\x91\x03(~4@\x9cx\
-\xae\x99\xd0\x01\xf2\xa1\xd4@\x9e\x80FI\xd6\x7f.\x19\
-\x10h\xa0\x06A0 I\x7f\x1ez\xe83!\x9e\xe5\
-h\x9e\x114@\xa8V\x8dN*f\x04\x10\x14\xb0h\
-S\x01@\xe0\x00\xa0\x11$ \x81\x01\x13Z\x18\xc0\xaa\
-\xab\xfa\xa8X@\x00!\xf9\x04\x05\x02\x00\xcf\x00,'\
-\x00*\x00]\x00Z\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x13*\x5c\xb8\xd0\x99C\x87\x0c#J\x9c\
-H\xb1\xe2\xc3\x8b\x153j\xdc\xd8\xf0\x22F\x8e C\
-R\xf4\xe8Q\xa4\xc9\x93\x08I\x96D\xc9\xf2\xa4\xca\x95\
--cn|\xf9Q\xa6M\x8b4!\xde\xdc\x191\xa7\
-N\x9e@\x13\xfat\x16\xb4\xa8A\x92\x010P\xa0 \
-\x82\xa8\xd1\xa7\x02\x1f\x02\xa0P\x10\x83S\xa8F\x1d>\
-8\x18\x00\xebSg]\x0fJ\xf0\xfa\xd4@B\x00d\
-\x8b2HX mP\x01\x09\xc7\xba\x05\x1a\xe1\xec\x5c\
-\x9e\x10\xd8\xde\xdd\xb9\x16\xe1\x82\xbd7\x014C\xb8\x15\
-\xb0\xcd\x04v\x0d\xc74\x8b0\xacb\x96\x03\x122~\
-\xcc\xf2\x00\xe5\xa2r\x0d\x22\xbe\xcc\xb9\xf3\xc1\xc9G=\
-\x8b\x04]0\xb2h\x90}O\xc7t\xac\x9a%\xeb\xd6\
-'_\xc3\x9e\xfd\xf8\xaa\xc1\xd4\xb4%\xc2E\x88;7\
-H\xd9\xbe\x136H\x08<\xb8q\x99\x9b\x0d\x0e>\xce\
-\xb0\xb0A\x07\xcc9&\x8f^\x914u\x82\xc5\x9f\xf5\
-\xbe>0/\xc2\xdd\xdc\x0b\x22\xff@h9|\xc1\xed\
-\x03\xff\x9a'\xa8\xfe`\xdb\xf5\x03\xc7#D\x0b_{\
-}\x86\x99\xef\x1f\x14\xac_/\xc2\xfc\xeb\x11\x90\x10z\
-\xd7\xbdw\x90\x03\xb6\x99' B\xd6q7\x5c\x7f\x08\
-\xc9wP{\xeby\x90\xd0\x01\xe0\x99G\xa0@\x0d^\
-'\xa1A\x07\xd0\xb7\x1eU\x92\xd5\xd7\xa1@\xd0\xc1\xb7\
-\xa1@\xd9\xe9\xe7\x1d\x84\x06\x89\x08\xa3~\xa6)t\xa2\
-q\x0c|(VF\x16\x88\x06\x02CuQ\xb4\x01\x02\
-\xcd4\x83\x81\x8c\x80\x01`aK\x18\x14\xe9$\x02?\
-\x1a\x16\xc0\x82,\x15\xe0\xe4\x95\xcdP\x90!Y\x00l\
-`\x13\x01XbyAZ\xce\x80\xa0#J\x02\x84\x19\
-&\x01\x22`%\x02\x95\x0b\x95W\xd1\x00j\xaaI\x00\
-\x08H\xca\x94'C5V\x14A\x9dj\x22\xb0A\x9f\
-,m\x19Q\x02{J4\xc0\x01\x80\xd6\xf9\x00\x08\x86\
-n\x94\x82\x97\x155C\xe1F\x038\xd0(\xa0\x0fl\
- \x02\xa1\x11\x0d\x00\x02\x05\xcbUt\xc0\x8a\xd5m\xaa\
-*\x05^\xb6)\x90\x00\xa6]o0\xe6Rpf$\
-A\xa2\x1c\x0d\x90\x80\xaa\x80\x06u\xeaM\x0d0\xca\xeb\
-\x95@\x1d`\x00\xae'\x09\xb0\xc0\xb0E\xf2di\xa4\
-6\x09`\x80\xb0\x9b\xee\xb4\x00\xb4<\x010m\xb51\
-9p\xec\x5c\x00\x14 A\xaf-\x19\x98\xa4\xb8a\x9a\
-\xe4\x00\x04\xa8\xde\x05\x00\x03\x10\xec\xda\xacF\x07HP\
-\x80\x00\x09\xaa6@\x01\xf1\x06\x89\x90\x03\x09$\x00\xc1\
-\x8d\xc7\xb16@\xbew\x05\x04\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x16\x004\x00n\x00P\x00\x00\x08\xff\x00\x9f\
-\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0!Bg\
-\x10!:\x9cH\xb1\xa2\xc5\x8b\x04#jt\x86\xb1\xa3\
-\xc7\x8f\x147j\x04I\xb2$I\x91#M\xaa\x5c9\
-\x11eJ\x960cft)Q\xa6M\x984k\xde\
-\xdci2'G\x9e@?\xfa\x0cJ\x14\xe3\xd0\xa2H\
-[\xe6L\xca\xb4\xe1\xd1\xa6P\x0dFd\xe0\x01\xc13\
-\x04\x18\x00\xfc\x8c\xcaU D\x08\x06\x1fl\xed\xcaU\
-\x00\xc2\x06d\xc9\x1a@(!\xad\xdb\xb0o\xe3\xca\xe5\
-\x8a\xf6\xe1\xdc\xa4\x01\x12\x8e\xbd\xcb\xb7/\xcc\x01~\xbb\
-\x02\x08\xcc5/a\xa8\x86\x0f&>,sqA\xc7\
-\x8c#KN\x08y \xe0\xc90\xebb\x0e\xbavs\
-\xd0\xb6\x07\x13xf\xf9`4\xcf\xbd\xa6\x91\x16H]\
-R\xb3\xc1\xcb\xac?\x82\x8e\x0ds0B\xd1\xb4=\xae\
-F\xd8y \x00\x11\x186\xc0\xce\x9dp\xf6k\x82 \
-\x104[\xde\x0c,q\x84\xb6\x0f: h\x80\xb9\xf5\
-\xca\xcfw\x1ft\xfe\x0c\x80u\xeb\x04\x9eK\xff\x0d\x8f\
-\x10v\x80\xef\xd6{\x8b_8\xdd2z\xe6\x08\xa2\x8b\
-\xa7\x90P\xfd\xb3\x03\xef\x97\xdb\xcf\x8d\xfdY3\xf9\xcf\
-T\x97_|\xeb)\xb4\x80A\x00\xe0\x97\xdf~\xac1\
-\xb8\x90\x80\xef\x11X\xa0A\xb8!\xa8\xe0{\x1eLX\
-P3\xfdA\xf8\x9ev\xa9\xb9f\xd0\x81\x09\x01\xe0@\
-~\xcd 0\x9cgf)\xd4bB\x05\xa0\xd8\xcc\x03\
-\x00bV\xdaG'\xa2\x88\x81i;*\x84\xdaA\x0c\
-\xc8\xd8\x0c\x88\x92\x89\xe8\x11\x04B\x12yX\x8c*E\
-\x90$q\x11\xfc\xe8\xe2\x85\xf9)\xe9\xd9\x01+:\x14\
-\xe4\x93\x81YY\x90\x97\x0d!\xc9%_L\x1a\xf8\x91\
-\x93BnPcZ\x170$\x81\x94\x13\x01\x80f~\
-\x02=\x90%a\x11\xaci\x91\x9c\xefm\xd8\xa6dz\
-^\xc4\xa7u\x08\xdd\xa8a\x89s6\x93\x90U\x81\xee\
-\xc4\x00yL\x0d\xca\x10\x02\x7f\x12\x15\x00}\x0d\xe5)\
-\x13\x9f\x13\x89\x00gO\x97R\xd4(I\x00H\xa0\xa8\
-C\xe1\xbd\xb8\x12\x00 @\xda\x90q71}\x10\x95\
-\x00\x22dX\x91\x83\x9bVX\xd1\x05)\xa8\xea\x90\x00\
-)l`(a\x0d\x1c\xd0\x91U\x95\x0a\x04@\x8b\x16\
-\x88\xf0\xcc\x8e\xa7b\x94\x80\xafE\x09\x10A_`\x16\
-\x85+T\xcd\xc0\xca\x15\x00\x06\x18KV\x02\xfdE5\
-*P\xe4\x1e\x8aQ\xb7\xe5\xaa\x9bP\x04\x0d\x9c\xdb\xd7\
-\xb5,5\x13\x01\x04wb&@\x03\x0b\xd0\xdbQ3\
-\x0e,\xc0\x80\xbc\x9e\x05\xc0\xef3\xed!\xb4\x5c\x04\xa2\
-e\xab\xae3\xe6\x05\x90oS\x01\x01\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,\x12\x00>\x00r\x00F\x00\x00\x08\xff\
-\x00\x9f\x09\x0c\xb0\x81\x02\x05\x10\x02\x04*\x5c\xc8\xb0\xa1\
-\xc3\x87\x10#J\x9cH\xb1\xa2\xc2\x02\xcd2j\x04a\
-\xb1\xa3\xc7\x8f C\x02@\xa0\xb1d\x80\x90(S\xaa\
-|\xe8\xac\xa5Kg\x17K\x96\x5c\xb0\xb2\xa6\xcd\x8f/\
-_*\x5c Sc\x82\x9b@\x83\xb2\xcc\xa9\xf3Y\x82\
-\x9e\x19\x7f\x0a]*\x94h\xd1\x07H\x9bA`J\xf5\
-\xa6S\x97\x02\xa363P\xb5\xab\xca\xab-\xb3F-\
-\xe0\xb5,H\xb00\x01h=i\xb6mE\xb4\xcf\x02\
-\xacuKW\x22Zgr\xa3\x0e\xa8\xcb\xd7\xe1\xdd\xbc\
-H\xfb\x0a^\xf8Wk\xc2\xc1\x82\x0bGe\x8b\x98\xaf\
-K\x00\x16,\xe4\x04\xdc\x93qc\xba\xce\x00xX\xe8\
-A@K\xca2-_n\xebl3C\x04\x9e\x07\xcc\
-\x1dM\xf7p\xc3\x050\xb56`M\x97\xacC\xa5Z\
-\xb9\xd2nK\xf3\xb6\xc0\xa3H{\xef.\xab\x14\x22\xf0\
-\x9e\xc5\x87wm\xf6P7\x04\xad\xca\xbd\xbanh\x1b\
-\xe3\xe2\xe8U\x19@d\xab:\xeal\xecL\xa7\xb2\xff\
-Tx \xaa\x04\xf0L\x1f<t\xb0\xf0xO\xf4B\
-\xa73\x14\xfe\xcc\x80V\xed\xf0\xcb\xe2\x17\xd8=x\xfe\
-\xb2\x000\xe4@I\x0b!\x10\xe0\x7f*\xc9\xb7P\x04\
-\x0d=\xc7\x1cu\x08\xaa\xf4]E\xaaEx\x19{\x0f\
-\xedgaG\xa2-\xd8\x1cD\x14\xc0\xb4\xa1M\x132\
-$\xc0\x83\x0eu8\xa2P\xf41D\x80\x88+JD\
-\x01D\xe7At\x22D%\xc6\x98bD*\xb6\xa7c\
-H\x04\xa4$\xd7\x8f\x1e\x89\x97R\x8bD\xf2\x18Qr\
-\x11\x09p@\x93I>\x03@\x90\x0f5\xd3\xa3C\xba\
-A\x04\xa3\x8e\xa6=TcE\x07F\xf9!D\x07\x84\
-Y\xd1\x95\x02\xe5h\xa1m\x10\xb1)fUL\xde\x84\
-\xc0^o>s\x80\x82\x16\xd1\x09\xd1\x9co6\xa3!\
-Hn:\x84\x00\x9a\x16fyd\x92\x1cI\xf4\xe5J\
-\x8b>t\xc1\x96\xbba0Q\x04f\x96\xe5A\xa5\x97\
-\x0d\xa0^]NN\xf4\x00\xa1t]\x80\x22\x94B\x0d\
-\xf0\xe4D\x1b`Z\x97\xa6\x8d\x99J\x11\x01\x01@\xa5\
-\xea\x96\xa8\xa3\xe99\x11\x05\xa0\x0a%\xc2\xa6+\xe2\x0a\
- \x08TR\xd4\xe8p \xa8Z\x93\x00\x17 \xd0\x11\
-lu\xd9\xe7\x91\x07\x22\xdc\x14\xa0\xa4\x1d\x1d\x10\xa8[\
-\x0c\x9c\xfa\xd1\x06\x22\xa5\x94\x00\x9en\x09p\x14J\xcc\
-q\xcb\x10\x8c\x17<s\x81\x07\xbc~t@\x03\xb2\xf6\
-\xd5\x80\xb6\xca}\xbb\x1b\x00\x12\x8c:\xda\xbb\xf1^\x16\
-\xc0\xb8\xa3I\x00.m\xff\xeaK\xd7\x01\x0b\x0c\xac\x5c\
-\x00\xf9\xd6u\x80\x01\xc6\xe6\xd7\x00\x83e9P@\xbf\
-\x16\x0e`$S\xb9n\x08\x00Y\x18\xaa\xb4q\x9dm\
-rE1\x99?%`@\x01\x0a\x93\x1c\xd1\x00\x96\x0d\
-\x80q_\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00#\x00q\x00a\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xe0@\x00\x06\x13*\x5c\xc8\xb0\xa1\xc3\x87\x10#\x12\x04\
-\xb0\x01A3\x02\x0c$j\xdc\xc8\xb1\xa3D\x00\x0f\x9a\
-\x89\x14\x89\xc1\xa3\xc9\x93(#R\x18\xc9\xd2@\xca\x97\
-0S6`I\x13a\xcc\x9b8\x1f\x0e\xa0I3@\
-\xce\x9f@'\x12\xe0\xc9r@\xd0\xa39=\x10\x1d\x19\
-\x01\xa9S\x983\x97\x8a4\xfa\xb4\xaa\xc7\x9dR\x9b5\
-\xb0\xca\x95\xe3P\xa9\x12\xba\x8a\x8dX \xeb\x01\x9bc\
-\xd3.\xfc\xba\xd4\xa7\xda\xb7\x06\xcbJu\x09\xb7\xee@\
-\xb6<\x13\xd8\xdd+\x97\xe8\xd9\xbdv\xf1\xd2\xa4\x0b\xf8\
-m_\x9e\x7f\x0b\xab\x05 \xb8\xa5b\xc3R\x13?\x1e\
-+a\xee\xe4\xb4\x00\x22\xa3\xbd\xcc\xf50M\x08\x9c\xc7\
-\x86\x5cJ5\xb4U\x01R\x1d\x98\xee\xea\x99\xe5\x82\xd5\
-\x5c\x17H\xcd\x08\xbbj\xe3\x91\xb5\xab\xa26(2l\
-n\xa7e\x136+\xf0\xdb)\xe1\x82\xcd\x04\x14G\xea\
-\xdb`\xd3\xe5\xd0\xa37l\xa6\xf0\xb5\xf4\x9c\xca\xaf[\
-u\x9b\xf0\xb8\xf6\x97\xdc\x0d\xd2\xff\xfeN\xbe\xbc\xf9\x98\
-[\xcf\x07\xf5N\xd0\x99z\x94\xc4\x15n~\xef\xd0\x99\
-}\xfa1\xed\xeb\xd7\x8f\x1f\xe5\xfe\xff\xe1\x15\xc4^\x7f\
-\xed\xfd\xb7_v\xdd\x11\xb8\x90\x81\xfb1\xd4\x9c\x82\x05\
-1\xc8\xdfs\x06\xe9\x05\xa1A\x12\xde\xf7 A\x04\x5c\
-\x88a\x86\xcf\x0c(\xd0|\x10fx\xdfxqy8\
-\x90\x89\xee!h\x90u*\x9a8\x90j\x09!\xa0\xa2\
-@2\x0a\x04\xa3x1\xe6\xf8L|\x09\xed\xa8\xa03\
-\x02\x5cp\x01\x08\x02\xfcw\xd0B6z8@\x93\x02\
-m\x00\x00\x7f\x03Q\x88\x1c\x8a\xfd\x01\x00\xe5@\x0f\xdc\
-GPzA^(b\x03\xeeM\xc4$\x84Z*\x04\
-A\x99\x04mH\x10\x90\xf8\xc1Y\x10h)*\xd4!\
-\x81w&\x84%\x8e\x07,$\xe7y\x7f\x0et\x00\x9b\
-\x02\xdex\xd7B\x22>\x03@\x9f7&*Y\x987\
-nY\x90\x90\x06\xb9\xf8\xa2z\x94\x12d\xe9F\x01\xf6\
-\x97\xe9F$F')A\x07l\xca\x91\x07\x10&\x8a\
-aC`F\xd7\xaaA\x0e\x10\xff\x8aR\xa7\xb9\xedY\
-\x90\xad\x0d\xb9I\x10\x02\xa5\xfd\xf6\xa4\x83\x1c-j\xa8\
-\xa2\x1d\x05@\x9d\x8a\xb4F\xa4\xaa@\xbdr\xd6lB\
-t\x9ad!\x93\xb8\x02\x16\xc0\xa8\x05Y\xe9\x91\xb0\x0d\
-\x81\xc0\xd9\x05V\x0d\xc0hq\x00P\xe0\xd0\x01\xcf\x9a\
-\x94\xaeA\xd8\xaau\xadN9\x1d\xdbPIp\x01\x80\
-\xaaC\xcdT{R\xa05\x82\x9b\x16\x08\xedv5n\
-C\x04\x88 V\x9e\x0d\xa1\x8b\xd4\xbav\x8a\x10\xeaM\
-\xce\x18\x1c\x91\x03\x0c\xe3\xa4mC\x08lP\xb1\xba\x1b\
-h\x94\xc0\xc3@E\x1b\x11\x01\x18\xa4\xf0\x92\x00 <\
-\xa0Q3\xcb\x02\x95,\xbe\x1eHl\xd5\x01/;\x05\
-\x80\xae\x11\xa9\x8c\xea\x05&'\xf9\x8c3\x08Y`\xb0\
-\xb9\x1e5#\x01\xc8V1@\xe3d\x0e\xd4,\x96\x01\
-\x03\xef\xd5\xf2X\x02|:\x96\xd5{U\x1duW\x22\
-\x9b\x06\x00\xd4\xc3\x9aT\x00\xce8I\xa0om\x00\xf0\
-\xfbR\x03HCg\xaaGX\x9f'@\x01\x06\x84%\
-\xafB\x22E\x10\xd6\xd9\x10\x0a\x0c\x10\x80[\x06\xb8\xf4\
-w\x00ow\x15\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-\x12\x00\x14\x00n\x00p\x00\x00\x08\xff\x00\x9f\x09\x1cH\
-\xb0\xa0\xc1\x83\x08\x0b\x02\xb0\x90\xc2B\xc2\x87\x10#J\
-\x9cH\xb1\x22A\x11\x1e\x9ailF\x01\x80\xc5\x8f \
-C\x8a$8\x00\x03\x82\x8d(=\x8c\x5c\xc9\xb2\xa5@\
-\x01 \x08\xa0\x9c\xa9Q\x80\xcb\x9b8#\x0a\xc0@\xb3\
-g3\x039\x83\x0a}\x06\xe0\xc2I\x9f4!\x0c]\
-\xdaR\xc4Q\xa4I\x99J\x05\x19\xe0\x01T\xa4\x0c\xa6\
-j\x95\x08 \xe3U\x9f\x0b\xb6\x8aM8@\xe6W\x9a\
-\x09\xb2\x8e]K\x90\xc1\xd3\xb3\xcd\x1c@\xb0\xc9\xb6\xee\
-\xb3\x0bp5\x1eX\x10\xc0\xae]\x00<\xe1F(\xe0\
-\xd1o]\x01V\xcf\x1e(`\xd8\xef\x80\xb7P\x0d\x14\
-n\xcc\x16@\xe2\xab\x12\xe8R\xaek\xf5\x19\xd4\x03}\
-7\xd7u\xa6\x92`\xcf\x08\x9aE\xaf\xc5pp\xa6\x84\
-\xc9\xaaEo\x04\x1a\x9b-\xe3\x84\xcd\x16\xd7f;\xa0\
-\xd9\xc3f\x03v\xb3}\xf0\xfb\xb6p\xb1J\x1f68\
->6t\xc2\xb0\xcc\xb7\xc2>\x08=\xbaV\xda\x08#\
-X\xdf*\x00A\xc2\x03\xa9\xb7/\xff\xad~p\xb9x\
-\xa9\xbd\x13J8?\x95\x02{\xc7\xbe\x11\x9a\x7f?\x94\
-|A\x07\xce\xe8/\x8d\x7fP\xad\xfe\xa0\xd8\x19\x94@\
-~\xff\x05E@B\xfe\x15xS\x82\xf7\x11\xa8\xe0M\
-\xc9\x95\xf7`N\x07\x1et\xc0t\x13\x8e\x14\x1cB\xf6\
-e8R\x84\x061\xe8\xa1H\x09$\x84\xe1\x88 \xf1\
-W\xd0z(\xae\xb4\xa1\x84-\x0e\xe5\x5c\x8c \x81X\
-\x90\x834~Tb\x8e9\x11G\x1d\x8f9\x05\x08\xe4\
-D8\x16d\xdc\x90\x13\xbdh\xd0\x8cH\x8e\xc4d\x93\
-!\x9d\x08\xa5EEN\x89\xd0\x93\x03Ii%AX\
-\x0a\xd4\xe5\x96\x03}\xf9%\x98d\x8a\x14^\x99\x12U\
-9\xd0\x91h\x0e\xa4f\x9b\x0f\xedh\x90\x8dp>#\
-g\x9d\x10\xd1)\x90\x8ax\xb2I\xd0\x99m~)b\
-\x9bo>\xa3g\x9b\xda\x1d\xe4#\x9e:1\x1a\x91\x9f\
-H:#\xa9\xa4\x14\xb18\xe5\xa4\x98\x16\xaa\xd0\xa5\x99\
-NJ\x90\x90\x04\xcd\x17i\xa7\x9e\x0a\xa4dA\x15\x8e\
-J*\xa5\x039\x90\xd0\x98#\xae\xffZ\xaa@\xa2\x16\
-\xe4\x9e\xaa\xab\x12\x04\x00\x9f\x5c\x0e)+\xab\x04u8\
-\xd0\xad<\xfeZe\x00\xbc\x86Y\xac\xb1\x07\xdd\x89j\
-\x8e\xc6\xbe9\xe6\xa1\x0fF\x9b\x90\xb3C\x02\xb0\x01\x01\
-\x04` @\xa7\x0f!\x9bP\xaa\x1e.*P\x01\x99\
-Bd\xe9A\xac\x95\xdb\xdf\xac\x09\x09p\xc0C\xa0\xea\
-\xd7\xaeA\x04\x00\x0bQ\xad\x06A\xca\x1e\xbf\xbajZ\
-\x10\xb6#2\x90\xac\x9b\x15\x01\xda\xa4\x04\x02\xf7K\xa6\
-\xc2yF4h\x81\xfeJ\xb4nk lW\xf1@\
-\xd4N\x94\xe8C\xf7\x168\xa0V\x0f@lXi\x0f\
-E\xa0\xa5P\x17\xd4F\xeeV\xf3F\xf4\xc0\xa9vm\
- \xd1\x014\xbb8\x91o+K\x15\xc0\xcbl}\x1c\
-Q\x0al\x05@\xaca\x00\x10L\x99\xd1\x14\xa1&\x95\
-3\x1d#d\xf2H\x00\xc4T\xd1\xc5Lm\x8c\x10\x06\
-)\xf4\x5c\x11F\x1fE\x1d\xd4\x00BS\xf4\xc0\x06]\
-\x7f4\xf5\xa3\xa35\x10sH\x18\xb4\x0c\x82C\xc1-\
-\xe4\x90\x08\x17\xd8|\xf0D\x09\xacN\xcd\x94\x00J\x8b\
-v\x00\xc0l93qc\xcdd\x16\x1b\x00X\x1b\x96\
-\x00\xac\x88\x1b\xd6\xcc\xe3\xe7\xb9\xbaV3|\xbd\x97_\
-\xd9K9\xd0\x80\xd7\xcc\x05 \xf6H\x06\xe4\x8c\xa7v\
-Z\x8f\x08A\x89\x81\x0f\x14A\x02\x10\x14\x10@\xc3\xcb\
-\x12\x18@h\x03\xe8[W@\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x12\x00\x12\x00h\x00r\x00\x00\x08\xff\x00\x9f\
-\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\x22\x04`\xa1aC\x85\
-\x10#J\x9cH\xb1\xa2\x05\x10\x17(<h\xc6\xb1\xa3\
-\xc7f\x04(P\xd8 B@\xc5\x93(S\x1et\xf6\
-,\xe3\xc7\x970?\x22\xa0p\xc1\x02\x00\x958s\x1a\
-\x04\x00\x82\x02\xc1\x98@\x836\xc3\x10@\xa7Q\x94)\
-<4;(\xb4\xe9\xcb\xa2G\xa3*\xdc\x80\x00\xa2\xd3\
-\xab\xcd\xaaJ\xdd\x9a\x12\xeb\xd5\x01\x5c\xc3R\xf4\xea\xd4\
-\xa4\xd8\x9c\x00.\xa0$\xdb\xf4l\xce\x01\x04\xba\xb2\x05\
-\xba\xc0mJgj\xe5:H\xb0\xc0\x00\x83\x00\x80\x05\
-\x0c\x00\xcc\xc0\x80\x01\x08\x09\x82\x82\xb5[Q\xc0\x83\x94\
-\x0e\x16\x140[1@\x83\x05\x0e:\x1e`\xc0\xb8\x22\
-\x08\x94\x11\x0aH\x05\x00\xb8sE\x0c'!,6\xcd\
-\xda\xa0\x07\x8a\x0e\x9e\xb1lM{\xe0\xcd\x89\xb1k\xeb\
->y`\xb7\xef\x01Z!&\xb8\xed\x9b\xb6\x80\xe0\x0a\
-\x1b\x14\xd7\x0d\xe0q\xc4\xd5\xcbY7\x8f\xb8`v\xf4\
-\xd6>!*\xbfN\xdb\x00\xf7\xef\x039+\xff\xec\x0d\
-\x9e\xf5\xf1\xf1\xd0\xcb\xdb\xcd\x9eP\xbcz\xc6\xdb\x13\x8a\
-~\xdf\x19\xb9A\xef\xf4\x19\xbfN(\xc1z~\xb1\x01\
-,\x85\x90\x03\xc4\xfd'\x16{\x07\xa5g\xe0VP!\
-\x04\xc1\x82\xbb\xe5\x06aX\x0d\x1e\xe4\xde\x84[I\x90\
-P\x02\x18\x86E\xd9A\x15vxT|\x22.\x17b\
-\x89o%\x14\x01\x8a,\x8a\xe8\x9cA\x02\xb6\xa8S\x81\
-\x05i(\xa3N\xf3\x1d\x94\xe3\x8d*\xd5\xc5\xa3Xq\
-\x1d\xb4\xe2\x8f*\xf9W\xd0\x83D\xa6tbxI\xa6\
-\xb4cA46)\x11~0J\x89\x12\x87\x07ai\
-%EA\x1a\xe4\xe3\x96:Q\x09&DF\x12\xf4\xe4\
-\x98\x08\x95\x89fTK\xae9Q\x9bnF\xa4f\x9c\
-\x11}H\xe7\x9dx\xb6\x06g\x9e\x06\xc1\xb9'\x9f\x04\
-\x91\x08h\x8c\x05\x89\x09hB_\x1e\xaaeA\x8b\x02\
-j(As\xd2)(A\x7f\xae\xa9\xe0@\x93\xe6I\
-\x9eA6\x1e\xfaL\xa3\x03!\x10i\x9c\x8f2\xe9\xe9\
-\xa5\x02%\x0a\xa8\x84\x9e:(_\xab\xb0\xe2\xfft!\
-\x9f\xa5\xc6\xfa\x8c\x9d\xb6J\xd4%\xa0\xb8\x06\x9a\xabA\
-\xf6\xfd\xfa\xcc~\x87v\xaa\xa3\x94\xce$\xab\xacB\x02\
-l\x0al\xaf,*+\xed\xa8\xb5\x0a\xf4\x22\x8f\xd3J\
-\x9b\x10\x00\xac\x1a\x84\x1a\xb6\xd9.\x9b\xd0\x9f\x99v\x18\
-\xee\xb4\x0a!\x89P3gbx\xae\xb6\x0a93$\
-\xb2\xef\x8a\xab\xd0\x00\xce\xfeX/\xbc\xdaE\xd4.}\
-\xfb\xdaK\x9d\xbf\x10\x06\x9clE\xce\x18\x8bP^\xf9\
-\x0d B\x0a\xfb\xa2\x04\xc0\xbc\x09Q\x10\xe5u\x1f\x22\
-0\xc0\xbb)]l\x10\x01\x95\xd2\x06\x82}\x1a\x87\xdb\
-\xd9\x06\x1e\xd36\xc0\xb5\x04=\x90-k\x0400\xaa\
-]\x00l@\xa8A2\x0b\x8cS\xca\x06Q\x102W\
-\x0c\xec\x8a\x90\x01:\xebD1D>\xcf|\x14\x00\x22\
-\x08-\xdf\xc1[\x01\xa00D\x04|v\x96\x00TQ\
-t\x00\x00J\xabTmB\x1e\x94\x14\x15\x00)\xa0t\
-\x00\xaaR1\x90\xefI\xd0*\xc4sD\x11\xa0\xbd\x95\
-\x00\x89\xe1\xd4\xccH\xcf\x88 \x90\x05\x02X\x5c\xf7\xd9\
-\x05\x1e\xb0\x5c\xd1\x01\x0dt-U\x01k\x97\x97@\xdb\
-4Kp3w\x9b\x19~V\x00\xa0.\x07\xc1\xdbz\
-V^\xdb\x02r\xfb\x16\xc0\x02\x8fw\xe6\x80\x01\x98/\
-\x07@\xb9b%P\x80\xe4\xd7\x0d\xf0\xb5Q\xaa\x96\x08\
-\x00gG\xab\x04\xc1\xac\xfa\x06P\xc0\x83\xb5\x1b\xc4a\
-\x02\xb7\x97\xdedz\x1b\xef\x16\x10\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,\x12\x00\x12\x00d\x00r\x00\x00\x08\xff\x00\
-\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\x22\xb4P\xd0\x02\x00\
-\x85\x10#J\x9cH1\xa1\x80g\x170<C\x00\xb1\
-\x19\x01\x8c\xcf\x18V\x1cI\xb2\xa4@\x00)6|4\
-)\xb0\xd9\x83g\x03\x9c\xb1\x9c9\xf3\xe2K\x9a\x079\
-\xa6x\x88\xb3\xa7O\x9a\xcd<\x88\xf8I\xb4\xa8\xc4f\
-H\x11\x5c\xe0i\xb4\xa9S\xa4I\x97:\x9d(\x00C\
-\xb3\xa9\x1d\xa1&\xc5p\x11k\xc2\xab^\x15j\x1d{\
-!,\xc1\x00f\xb3\x8e\xd5\xfa`@X\x00\x1epB\
-h\x80\x16\xa63\x9e\x01\xd0.P\xbbVk\xd9\xa9\x01\
-8\x96\x84\xc0\x80)E\x01\x05\x9e\x1d\x18\xd8\xb7\xb1\xcb\
-\xaeE/\x80Mk0\x00\x84\x08\x8e\x1b#\x00A\x14\
-\x00\x05\xca\x11\x05\x188\x90y\xad\xc6\x9e\x03\x04\x83\x8e\
-\x08`ti\xad\xa7g\xa6^=\xb2\x80\x83\xd7H\x1f\
-\x18\x9e\xda@&m\x81\x0dH\xbf\xd6]\x92\xc1D\x09\
-\xbf\x0d\x0aH\x80\x9bx\xc5\x01\x93\x13:\xa8\x9b\xdc`\
-\xf0\xe1\xbb\x15\xce\x86(!{\xf5\x81\x030\x97\xff\xbe\
-\xe9\xd3\xc0\xf7\x88\x0b^\x9b\x8fH\x1e\xe1\x01\xea\xe7\x15\
-\x1a\x18\x1f\x11BD\xb7\xf1%\x16\xc8\xbc8?\xe5\xfd\
-\x8d!\x97\x90w\xfe\xcd\x04\xe0X\x07\xe0\x87P\x5c\x09\
-%X\xe0H\x0c\x08\x87\xd4\x01\x89%d\x9cB\x17>\
-\xf8\x9c\x04H%\xa0`I\x15jH\x12\x81\x05\xad'\
-\x22m\x02\xa8fP\x7f'6\xb5WB\xf0\xb5\xf8\x13\
-d2R\xf6\xe2A,\xd6\xf8\x13\x89\xcf4\xa0cQ\
-&\x1a\xe4\xc0\x8fD9\xa3bA!\x12\x89S\x92\x05\
-\x0d\xa9\xa4O\x02\x1e\xc4\xe4\x93&\x91x\x00\x8fTN\
-4\xe5@AfiR\x94\x06}\xe8%QN\x8ei\
-\xd4\x8df\x12\x95a\x9a>5\x83%\x9b\x07\x91\x98\x00\
-\x9c$\xadY\x90\x8ftV\xd4%Ab\xe6\x09\xd1\x9c\
-\x07\x95\xe9\xe7\xa0iEG\x90}\x84\xb2\x96\xe8L1\
-\x12\xb4\xe7\xa2\x055:\x90\x9d\x90Vjir\x94\x0e\
-\xf4f\xa2\x8f\x0a\xe4\xdb\xa5w&\xf4)\xa8\x12\xf5I\
-\xea\xa98\xe1\x89\xea3$v\xba*A\x80\xbe\xff*\
-(\xac\xaf\x0a\x04&A\x86\xd6\xaa\xabA\x99\x0a\xd4\xeb\
-\xaeh\xeeJ\xd0\x91\xa7\x06\xcb\xd8\xaf\x95n)\x90\xb1\
-\xa0\x92H,\xa9\x11XX\xab\xaa\x061{)\x8d\x05\
-=\x0b\xea\xad\x04Q{\xea\xaf\x08l:\xa839\x96\
-X+\xa2\x075\x83\xad\xb0\xcb\xd6j\xed3\xcd\x98j\
-\xe9\xba\x04}\xf6\xea\xbb\xcfHzi\xae\xec*\x8a\xea\
-\xa8\x071\xd8\xef\xa1\xafr\xcb.\x00\xe5\x16\xc4\xaf\xa5\
-\x01,\xbc\xab\xab\xbb\xc6\x9a\xd0_\xa4\x02\x10-D\x1e\
-\x88\xfb\x9b3\x1c\xa3\x96\xb0Am\x89\xc8\xf1\xc8\x1d\xd3\
-$o\xb6\x1a\x92\xac2e\x1e\xd0\xbb\x9a\xca0\xf7\xa4\
-\xafA\xcdp\x95\x1c\xcc8\x03l\xd2\x00\x1f\xa7+\x15\
-h9\xe3\xec\x93\xcb\x08)\xa51KA\x07M\x94\xc4\
-\x11!\xb0\xc1\xc94\x01`\x81\x00I\x0b}\xde\x03\x9c\
-\xf9d\xc1\x05\xe4Q\x10S\xd5%\x175\xf3DG\x0b\
-4\x00\x08\x1e<\xab\x1b\xd8S\x01`0E/] \
-\x02C_\xc3$PY\x1bP\xb0\x92B\x05$Vm\
-V\x00\xb3V\x97\x80\xd2i93Z~V\xaf&\x00\
-\xbe\x85\xaf\x5c\xdd\xe2\xd5I@\xb2\x7f\xad\xf5<U\x82\
-a\x17\xe8\x0c\x03o\x9fIt\x81\x00x\xfb\x93\x03\x0b\
-\x14Pv\x81\x81\x8ft\x80\x04\x0d\xc4D\xa7\x00\x0c\x18\
-\x80\x9c\xc3\x02\xf5\xb7\x80\x01\x01\xe8L(\x00y\x09T\
-\xe1\xd8F\x05\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00\x12\x00p\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x13*,(`\xa1\xc3\x87\x10#J\x8c\
-\xe8\xec\x19\x88\x0b\xcf\x1e8D\xf0\x8c\xc2\x86\x14\x00&\
-\x8a\x1cIRa\xc3\x8e%\x07\x12\xc0 b@\xca\x97\
-0cNl\x86`\xc3I\x998%\x02\x00\xa11g\
-B\x0a>\x83&\x1c\x80\xa1\x99P\x876\x8f\x06\x0d\x00\
-T\xe9\xc3f\x1en:-9\xa0\xe9\xd4\x88\x17B^\
-\x9d(\x00\xc3V\x91\x04D|\x85\x08\x82\xe3X\x91V\
-\xcf\x1a\x14\x90V\xe4\x81g\x0b\x0c0\x10\x18\xe0\x99\xb3\
-\x93s\x0d,p\x90r\x83V\xb5\x02\xe7\x8e\x8c\xf0\xac\
-\x80T\x88\x00\x18@H@\xd2%`\xaf\x13\x134\xc0\
-\xe9\xac\x00\xe3\x89\x05\xd4\xf6\x84\xe8\xa0\xc1\xdf\xa0\x10D\
-~V\x0a`\xb3\xc3\x04\x82\xa7V&\x0c\xf1\xc1h\xc0\
-\x04\x13\xd4U\xdb\xe0-\xc4\xc3\xb0\x1d\xa4\x06\x0c\x00\x82\
-\xd1\x8d\x8e}\x06_h\xa0\x22\xec\x91\x08\x86\xc7\x14`\
-\xf68\xc9\x02\xbf\x15&\xc7Y\xda\xe1\x02\xe7\x0bmK\
-\x7f=\xd2\xf8\xc2\xcc\xd8\x15\x02\xff`\xad\xd05L\xc8\
-\x09\x9b\x81\x0f\xbf\xf0\xba\xc2f\xa6G\xaeg\x0fsr\
-\xfaf\xa1\x1b7\xa7\x0f3\x80\xf6\x82\xcd\x04\xb8\x9bD\
-\xf1\xf1\xf7\x92r\x02\x05\x18 \x02\xb89\x94\x1fB\xea\
-\x19\x88Yt\xcf(\xa8`[\x0e!X\xd0|\x12B\
-\xe4[\x82\x16*\xc8\xa1B\xce\x14H\x90{\x1dN$\
-A\x88!\x22\xc0\x9dH\xe4\xa5\xa8S\x04,Z\x88b\
-J\x0d\xca\xe8\x90\x00\x07\xd4\xa8\xe0l%\x0d\xa8cD\
-\x03\xf8\x18 \x86\x12]6\xe4H\x0b\x18\xd9\x0c\x90\x22\
-\xe5\xb8\xe4\x8eNJ\x90\x90\x94S\xbed\x80\x939\xde\
-\x98%u=\xfa\xe8\xa5@\x00P\xf8%N[\x1a\xf9\
-\x9a}g\x06\xe5\x80\x91#\x12\xd0\xa6P\xd0\xf9\xd8\x16\
-\x94\x059\xe0\xdd\x9c\x22\xbd\xe9\xa3Tc\x0e\xc4&\x9f\
-\x22\xf9\xe6\xe3\xa0r\x22\xf4\x22\xa1\x0e\x05`\xa4\x92\x1a\
-\x0a\x14(\xa3\x10\x85Y\xa3\xa0\x09\x09I)DM\xfa\
-(\x98\x92\x06\xed\xb9iD\x0c\x18\x99\x9f\x99\x03% \
-\xea\xa8\x95\xfa\xa8\x11\x9e\x04\x0d\xff\xcajD+\xfaX\
-\xd8P\xb3\x8aT\xe7\xa5$\xe6:Q\x995\xf2\x95\x10\
-\xa8\xbeBTk\x88\x06<\x93\xa8A\x93\x16\x9b\x10\x00\
-~*\xf8 B\xc9:\xabS\x03\x0bH\xd0\xc0I\xab\
-\x0e\x04\xab\xb5\x22E\xfa\xcc\xb7\xe0\xcaDn\xb90\x89\
-\x8bnJ\xdd\xae\xfb\xd0\xb9\xed\xba\xbb\xd0\xb9\x8b\xca\x9b\
-\xd0\xb9\xe7\xda+R\xbe\xfa\xf6{\xd4\xa2#\xfa\x8bP\
-\xbc\x02GD\xec@\xcd\x16\x1c\x9b\xc2%Uk\xd0~\
-\x0c\x1f$+A\xea2|\xee\xc4\x11\x0f\x14\xef\xc1\x19\
-\x0f\x14#A\xa8v,\xd0\xb4\x05\xf1+rA\x0e\x9f\
-\xec\x90\x89*#\x84e\xcb\x03\xa5\x0c\xf3\xb33?\xf3\
-1A2\x9f\x8cq\xcd\x03\xd5\x1bp\xc7\xcd\x12@\xb0\
-\xc2\xea\xfe\x9c1\xc7\x02\xb98s\xbe\x1e\xd4leB\
-;\xf3\x5ca\xc5\x05'\x5c3\x00\xff\x19\x84\x9e\xca\x9a\
-\x12d\xb4\xd4`'\xf4u\xc1]\x0f\x14a\xd8\x00b\
-\xd4\xf2\xd3\x0am\x8d\xb6@\x18\x0c\xdd\xefxo\x13T\
-\xaf\xd9j\xd7-\xd0\x03T\xdb\x9c\xdb\xb7@\x17\xc8-\
-/\xdd\x0f\x85%\xf8\xba\x00 }\xd0\xb2\x11;c\xf5\
-A/\x97\xe4\xcc\xe4K2\x90\xb5C\x1e\x88%\xd3\xe4\
-\x9cs>d\xe2#\xad$B\xe4\xa1vn\xba\xe7:\
-:S[Irbp\xc1\x05\x22X`\x81\x00\x00\xcc\
-~\xfa\xed\xa7O)\x80\xe2\xe7\x01\x80;\xee_F\x0d\
-\x13\x05\xbf\xdf~2\x03\xc5\x9b\xce\xa7\x01\x97k\x99|\
-\xe7\x8c6 lL\x0b<\x8f:\xa3\x05L\x9fRq\
-\xd6\xcf:\x80\x01\xbc;T\xc0\xf3\xd6:\x13\x80\x017\
-/\xa4'\xf0\xf6j\x95l\x02\x8a/\xe0;\xf4\x1dC\
-?\x1b\xe9c\x05\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\
-\x12\x00\x12\x00r\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\
-\xb0\xa0\xc1\x83\x08\x13\x22\x1c\xa0\xb0\xa1\xc3\x87\x10#J\
-\x848\x00\xc4\x05\x0f\xcf\x108\xa4\xf0\x0c\xc3\x05\x0b\x13\
-C\x8a\x1c\xf9\xd0\xc2\x05\x0a\x1aI\x0e\xf4\x00B\x80\xca\
-\x970\x15\xa6\xc0\x902fA\x02\xcf\x18\xda\xdc)R\
-\xc0\x86\x9a<\x0f\x22\xb8\xe02\xa8Q\x84\x01\x8e>l\
-\x86!\xa9\xd2\xa7P!\x12p\x1a\xf5e\xd1\xaa\x10\x9b\
-Q\xd0\x89u\x22\x80\x0d]'2\xbd\x1a\xb6!\x83\xb2\
-\x22\x11\x9cE\x8b\xf0\xab\xca\x04\xcf$<3\xd0@\xa0\
-\x00\x01N\x0b<\x83\x90\xe0\x80J\x8cl\x0b\x0e\xc0\x19\
-\xd2\xc1\x02\x06\x00D\x0600Rm`\x81z'\xca\
-\xdd\x99X\x82\xdf\x88\xcd.\xb0u\x86ab\x01gJ\
-\x01\x14p0\x11tX\x8e\x10\x1dD\xae\x1a`\xf2\xe3\
-\xb6\x0fR\xaf\x0e\x1b\x00\xeeC\x02\x5cC\xc7vx`\
-6Zg\x0cH;|\x90X\xf7\xc3\x04\xc5_?\x03\
-\x00\xe1!\xf1\xa3\xb9\x136c\xac\xbc`\x80\xcb\x0a\x9f\
-\x07%\xac\xf0\x00\xd5\xea\x04\x01\xb8\xffN\xb8\xbb,r\
-\xf0\x08\x9d-\xd8h\x1a+u\xf4\x09}\x1fl\x0e\xf3\
-=\xc2f\xf2\xe1\x1b\xfc\x8e0\xbfD\x06\xcd(\x84\x9f\
-~\x0f\x15\x10\xa0B\xd1M\x04\xd4Ak\x11\xe8\x90\x7f\
-\x03\x11\x90\xdcD\x80%\xc4\x9f\x83*\xd1\xe7\x19\x86<\
-\xd5\xa5\xd0\x85\x0d\x09\xb0`A\x1ar\x08\xd1z\x09q\
-w\xa2B\xe3\x99\x18S\x89\x0d\x05p\xe0A\x0eL\xe8\
-\xe2C6\x1aD\x96B\xa8!ucH\x0d\x1eT\xe1\
-\x87\x0a\xc1\xf8#D-\x86\xa4bA5\x1e\x19\x12\x00\
-\xd8\x19\xd4\xa3\x8f\x09\x05\xe9dD\x10>\x03\xe2qW\
-\x8a\xe4\x8cp\x13\xedh]\x97\x8a)$\xa6@\xf6\x15\
-\x94$\x99\x10\xd9vP\x9a\x03\x8d8\xd0\x96l\xc6\x98\
-\xe2A\x09\xd6\x09\x95\x95{\xc5\xa7\xa7H\x1e\xce\x17Q\
-\x94\x7fF\x04%BK\x9eY\xa8J(\xe2\x09Q\x96\
-\x8b\x22\xc4\xe7@\x81\xc6\x95P\x8e\x916\x84\xa9@n\
->\xb3d\xa6*\xad\xf9\xcc\x8c\x9b\xce\x05\xeaD\x95\x16\
-T\x14\x9dt\x9ez\x10\x9d\x93\x16\xffT\xaa\xab\x06\xb5\
-W\xd0t\x025\xca$\xad\x12\x81IP3\x93uJ\
-\x90\xb0\xbc\xb28\xa3@\xcd4c\x1b\xb1\x02\x19Y,\
-B\x06$+\xad\xb4r\x12\x04\xe7\xb3oN\xab\xed3\
-\xb6\x16\x04)\xb6\xcf\x00\xa8\xad\xb4\xcf(\x0a\xeeC2\
-\x8e\x9bl\x9es\x9e\xfb\xa1\xba\xc9\x06Pj\xab\xe7\xa6\
-\xabn\x00\xdd\x12D/\xb8\xf6\x8e\x8b\xaf\x85\xeeZ\x08\
-o3\xff\x06<Q\xbf\xda\x16lpD\x08O\xab\xf0\
-\xc2\xe8\x0e,@\xbe\x03\xc5\x1ap\x03\x03C<Q\xb4\
-\xea^F\xe8@\xce\x1a,\x01\xbc\xccj\x9cP\x02$\
-7t\xac\xc6\x08\xc0K\x9d\xc5&\x0b4\xc0\xc0\x1e\x9a\
-\xfbm\xb1\x06\xc2K\xd5\xc7\xcd\xc6\xbc@\xc6\x03\x95\x5c\
-\xf2\xb9\x04\xa4<\xd0\xb5\x02\xcd\xfa\xec\xc0H\x1b\x94\xaa\
-\xbb\x0dK\x1b$\xbb\x9ej<3\xbcJ\x13D\xf5\xb3\
-\x07\xa8+*B\xba\x06<@\xd7\xda&\x985\xc4\x02\
-\xfc\x9c\xac\x03\xb1\x86M\xd0\xcd\xc5\x06\xb05\x9d\x0fP\
-\x1csA_\xde\xadR\xd3\x08\x9c\xd6m\xb2\xb9\xcf\xb8\
-\xad\xb7\x9a\xd2\xed\x1b3\xe0\xe5\x0d\xfe\xa6\xe2\x22\x01\xe0\
-kA\x08\x00\xae\xb7\xe1\x8c\xe3\xfd\xf53SVn\x17\
-\xcf\x03u\xa6\xb9\xb5\x0d=\xcdx\xde\x0a\xc1|\xf7\xd8\
-\x0a!\xb0\xf5\xdd\xa6?\x037\xc4\xdf\x82\xf59\xb7\x82\
-\x17\xe4\x81\xdf\x06;s\xf9@\xb8\x1b\x1c\x81C\x08P\
-n\xb0\xdf\x14H\xae\xf1\xe3\x0a\xf5\xaey\xb5w\xd7~\
-\xd0\x03\x22h\xde4B\x18\xa4\xc0\xf8\xeb\x11\xca\xae7\
-\xea!Q \x823v\x9f\x0b\xc0\xcf\x22a\x00\xfe\xf9\
-\xe8\xa3\x8f\xad\xf0\x055\x90\xfe\xfb\xea\xe3\x8c|C\x12\
-\xc0o?\xb6\x00LoP\x02\xf6\xdf\x0f\xee\xc8\x0fY\
-@\xff\xe0\xe7.\xe3\x85k\x80\xef[\xd8\x00\x16\xc0\xb3\
-\x08 0\x81\x10\x03\xcex\x1c0\x80\x07\xa6\xefn\x00\
-8\x0b\xbe,\x18?\xc5q\xb0\x83\xb3#\xc8\x05\x1d\x14\
-\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\x00r\
-\x00p\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\
-\x13\x1e\x1c`A\xa0\x88\x81\x00\x14J\x9cH\xb1\xa2\xc5\
-\x8b\x07\x05\xa4xF\x01A\xb3\x89\x08\x9em\x101\xc0\
-\x19\xc6\x93(SN\x14\x00B%A\x04\x14.\xa4\x88\
-\xe8\xb2\xa6\xcd\x84,\x1f\xdc<\xe8A\x04\xcd\x9d@O\
-\x02\x00\xa13h\xc2\x9e?\x8d*5\x08\xe0B\xc8\xa5\
-\x0a\x11l\x10\x00\x15j\xd3\xa7U'b\xc8\x1at\x03\
-V\xae\x15\xa9\x82E\xe9\xcc\xe9\xd8\x93\x1b\x92\x9e\x95\x18\
-\xa0\xe8\xda\x93-\xdfVu\xb0\xc0@\x80\xbb%\x9d9\
-\x1b \x90\xc1\xc0\x8f*)\xc8\x0d\x9a\xc0.\xca\x01\x0d\
-\x16D\x18l3\xee\xc5\xc5@\x054\x88\x00\xd8\x22\x06\
-\xb5`\x01x\xb8x\xc0\x80X\xa5\x02\x0c\x1c\xb8\xf8\x00\
-s\xd5\x01n)60\xad\xb4\x00\xe4\x8a|\xc1\x0e\xf8\
-\xcax\xe2k\x89\xb4\x97\xce\xaeh\xa0\xb6\xc0\x02\x15\x11\
-\xc4\xd6\x9d\x1b\xe1g\xdf\xcfz\x83\x1c>\xf8\x80_\xe4\
-\x06\x1d,7\xba[b\x04\xd6\xd0\x17\x80<^\x13;\
-A\x08&\xa1'\xff\x04.\xb1\xf4M\x00\xa9\x0f:\x17\
-?\x91\xc1h\x85[m\xc6Ox\x809\xfb\x84\x03\xde\
-'l\xc0\xb5\xfe}\xd8\xfa\x816\x91}\xff)\x94\x1f\
-T\x82\xd1G`\x81\x06\x06\xb8\x13\x7f\x0a=\xc7\xa0E\
-\xe4\xe1\x87\x91w\xcfT8\xa1E\x10(\xf4@x\x15\
-u\x98\x90v\x1bb\x04\x22B\x10R\xc4]\x897\xad\
-\xf8\x12\x8b,\x92\xe8\x92r0\x9e\x94\x80B.\x16$\
-c\x8d\x91)\xb4cF\x0ai\xc8\xe3E4\x02\x99\x90\
-\x88\x07\xdd6$F\x0eV\x04@qK\xd6TdA\
-\x08\xb0&$AJFi\x11\x00M\x0et\xa5@\x12\
-\x8c\xa7eJ?\x12\x94`A\x18\x8e\x89\x92\x00\x95\x19\
-\xb4\xe2\x97\x02M\xa9\xa6Ea\xd2\x89P39\xce\xc9\
-V\x9b\x0aa\x97\xa5\x9e\x15\xfd)\xd0q\x12\x1a\x94\x22\
-\xa0\x17\xc1i\x90\x9c\x03\xe5\x89(N\x09\xd5)\xd0\x8d\
-I>\x8a\x92t\x07a\xe5\x0c\x94eZ:\x91\xa4\x06\
-\x050\xe8~\x9ebthA\xe4\x15Z\x90\xa8\xa5Z\
-\xb4`A\x8c>\xff\xc3g\xab\x13\xcd:\xa9u\xb4^\
-D\xa9A\x04\x08\xc4i\xae6\xd9\x0a,J\xaa\x12\xe4\
-\x1d\xab\xc3\xb2\x95P\x00'&\x1b\x14\xb3\xceB\xe5h\
-\xb4)\x15\x80,\xb5@]\x8b\xedM\xda\x1a\xbb\xedI\
-\xdd\x0e\xf4\xea\xb7\x16\x92kS\xb8\x03\x9dJ\xae\xa2T\
-ui\xaeE\x80\xedZ\x10\xa8\xe6\xcaK\x10\xa6\xf4\xbe\
-\x9biJPR\xcb&B\x22\xaa\x0b\x91\xbe\xe8&'\
-P\xc1\xfa\x1a,\x11\x00\xc2vJm\xbe\x95\xee\xfbn\
-z\xe0\x9a\x9b'\x92\xcf\x8c\x8b1\xb6\x1b'\xe4\x8c\xbb\
-\x14G\xdbkE\x0e?3m\xab\x034#\xacA\xc5\
-\xea\x0b\x81\xca\xb3*\x9a\xb0@O\xc2\x5c\x99\xca\xa6A\
-\x1c'\xb6\x0d\xd8\xec\xb3\xc3\x8aVI-\x01>\xdb\xdc\
-\xf2\xcc^\x16\x0d\xb3\xbb\xbf%D@\xb3\xb4\x12\xadt\
-3\xb1\x0a\xf41\xa9\xc3\xf6<\xf5\x01\x18V\x8d\xc0\xc9\
-j\x0a\xe0\xd1\xd4UC\xc4\xf4\x99\xadR05\xce\x14\
-u\xec\xac\xd6S\x97\x5c\xd0\xbf\xd8\xd6\xbc5\xd8;'\
-D\x01\xd4j\xa2\xcb\xb76\xd5\x18\x09*\xd0|\x80b\
-\xf0\xb7\xe0\xf8\xad\x9c!\xa2\x06\xfc\xdd\xcc\xb8.\xc9\x0c\
-c\x01\x8e\x97\x8dk\x90a\x8f=5\xa6*)\xde\x0c\
-\xc2\x1b>\xf0\xb7\x7f3\xe2v\xf4\x86l\xfe-9\xc9\
-\x13]\xb0d\x00\x7f[~\x91\xces\xaeM;J\x00\
- .\x10\x01\x90\xdf\xd7x\xd1\xd7\xd5\xb6\xbax\x0b\xf8\
-\x1c\x01\xde'\xe9\xfe\x1b\xdf\x056p\x80\xca\x0b\xa4\xa9\
-\x92\x00L\x13T\x80^5\xf6\xbe\x93\xf6\xcf<\x8d=\
-\xd2\x04\xddn\xb5^\xe4\x83/\x90\xc0\x039@\xfe\xfa\
-\xcc\x93[\xf0\xf5\xec\xb3\x8f\xb4\x00YF\x10\xff\xfd\xed\
-s\x8c%\x00\xf8\xdf?\xbf\x01\x10`\x00\xff\xfa\xe7?\
-\xa4\x11\x90\x80\xe6; \xfe\xcc7>\x05\x96\x8f\x81\x0d\
-T \x04\x0br\xc0\x09\x22d\x81\x16\xbc\xe0\x03\xe7\x14\
-\x10\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\x00r\
-\x00n\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\
-\x13\x1et\x06@\xa0\x85\x0b\x0e-(\x9cH\xb1\xa2\xc5\
-\x8b\x18\x0d:\x1b\x00\xc2\x03\x85\x07\x14\x9b\x11\xa0p!\
-\x85\x80\x8c(S\xaa\xa4\xe8\xccBG\x04+\x9f5C\
-\xe0AD\xcc\x9b8'6\xa4\x90\xf3\xe0\x03\x10'{\
-\x0aM\xe9L\x84\x87\xa1\x0aA:C\xca4\xa1\x00\x0c\
-M)\x12\xb8\xd00j\xd3\xa7\xcd\xacVD\xb0!\xa8\
-V\x9c\x030d\xfdzqCU\xb2(\x01l\x18\x8b\
-\xf6\x22\x02\x10K\xdbZ\x14\x01S.J\x02\x01\xec*\
-\x14\xc0s\xe5\x01\x09\xcf\x0c\x14x\x16 \xa8\xb3\x93\x01\
-\x02\x18\x90\xe0 &T\xbd\x06\x19\xd4\xcd\xf8\xb7\xc1\x00\
-\x94\xce\x024PI\xe02d\x81\x1bTz\xee\x99\x00\
-\xe5\x85\xb8r\x05\x80\xbc\xe8\x00\xc2h\xa6\x102\xf6\x95\
-;\xb9b\x01\xd4V\x014h|\xf1\xec\xe7\x83\xa5!\
-\x17\xe0\xfd{\xe5\xe0\xdf\x00\x0c\x1c\xb0\xc8\xc0j\xf3\x8a\
-\x10|\xff\x16\x00\xb8\xb8E\x07\xaf\xad\x0bd\xb0\x1c\xb2\
-W\x85\xd5\xb5\x1b\xff\x14\x10|bv\xb2\x9b\xc5'L\
-\xaf\x10\xc1\xf7\x95\xcef'<\xaf\xbe`\x01\xb6\x08W\
-\xdf4P\xbfm\xec\x98\xf4\xf5\x17\xd5s)\x01@\x80\
-\x80m\xb9\xa7\xd2c\x08\xa2%\xdfEy)t\x5c\x83\
-\x16\x058\x10\x81\x169s\xe0z\x14f\xc4\xdeA\x08\
-H7\xd1\x87\x06\x95\xd7\xe1E\xe1\x1d\xf4_E\x00\xd4\
-VPw'b\x04\x00q\x06\xe17\xd1\x8a\x07a\x18\
-\xa3E\x11\xc6\xf4^A)\xeex\x11\x8e)\x11I\xd0\
-\x01?\x0aI\x91\x882\xbaH\x10\x7fJ\xa24\xa1\x94\
-\x099\xc0d\x94\x14E@\xd4\x86\x07M\x89\xe5E^\
-\x16\x84\x1bA=\x1aD\xe3\x97\x179sfE\x0f>\
-\x89fJa\x0e\x14\xa4@I\x0a\xd4\xcc\x95o*\xa4\
-fB\x22\x92H\xd0\x02y\x16\xc9a\xa0ZYh\xe2\
-3c\x12t(\xa18\xe1V&\xa38\xf9y!A\
-F\x0ed!\xa4\x08Y\x88\xa3~\x05\xad\x89iH\xf9\
-\x0d\x04\x80\x8d\x9f\xae\xb4\xa8\xa8\x02=JP\x9c\xa5&\
-\x04\xe5A\x11\xbe\xffj\x10\x9e\xadF6h\x95\xb5\xf6\
-\x96\xd0\x7fs\x0atj\xae\x08y\xfaLp\xbf\x02{\
-\x11\xa0\xed\x19\x1b\x93\xa4\x02%J\x10\xb3\xcaZ$\xc0\
-\xa5\xd1\xc6\xa4j\xb59]\x8b\xad\xb5\xdb\x22e\x00\xb5\
-\xddf\xe4l\xaa\xe1\x8a\x9b\x90\xb6\xe5\x224n\xbaB\
-\xe9X.\xbay\x91\xca\xaeA\xd0\xd69oA\xc8\xd6\
-8\x11\xa7\xe9\xf2;\x90\x96\x0a\xc9\xbb\xed\xba\xc1\xb9k\
-\xe9\xbd\x14Yh0\xb6\xac>s\xdc\xba\x95b\x1b\xf1\
-3\xf6\x0e\xc4e\xb9\xbf\xd2\x98\xafA\xe0\x86\x9b\xe2\xc2\
-\x81\xa5+kA\xd0\x22L\xd1{\xbd\xb2\x0b2\xc0\xab\
-\xba\x1an\x9b\x03\x95\x8c\xb0\x00\x02S\x0c\x9c\xc9\xcfL\
-\x5clB\x04\xac[\xaa\x93\x035\x0c#\xce\xb3\xba<\
-o\x8b*\xd1:r\xab\x13\xdfT3\xa3\x01\xd4\xbc1\
-B4\xa7{\xf1x\x15M]\xed\xd2nZ4t\xb4\
-U\x07K+\xc9\x03\xc3<\x10\xba\x08\xed\x8c\xf6\xa7)\
-\xef\xa5\x90\x01>\x0b\xd9\xf4\x01c\xa3\x94\x803q\x13\
-*3\x9cx\xe7\xcf\xdd\xe0}\x0a\xed\xacR\x04\x00\xf4\
-\xedw\x7f\x0c<\xddL\xc5\xb6\x0dM\xb8\xe1xG9\
-\x00\xd0]\xdf4\xc0\x02\x07$p\x1b\xe4}\x0b\x09B\
-3Ok\x0d\x1f\xe7\xa4\x1f\x0e\x19\x00\x1e\x80.\xf5P\
-\xa5\x97\xde\xe0\x00\x04\xa8\x0e:p\xa6g\xd8:\xe7\x02\
-~.\xbb\xeaE3u;\xee\xe2\xa1\xbe\xfb\xf0\x02\xb1\
-\xdc\xd4\xef\x90[\x07\xc0\x05\x08\x0c\xef<\xdd_!\xdf\
-\xf9g\xcb7\xef\xfc\xf0\x07t\xdc\xa8\xf4\xa73\x7f\xbd\
-\xf3\x09\xd4\xcd\xfa\xefvU\xff\xbd\xf3\x5c\x93E~[\
-\x92\x9d\x8f\xfd\xdaZ\xb5.\xd7\xe4\xee\xef\x1e\xbev\xae\
-\xb7e@\xfd\xb2\xa7\xffY\xf2rY\x00\xff\x9a\xe1\x00\
-\x90\x89\xac~\x0eh\xd8\xbc\x06p\xbe\x04\x12\x0d8\xce\
-s\xe0\x03\x0f\x22\x80\x03\xc8N\x82\x13D\x88n\x12\xb0\
-\x00\x05\xf6$ \x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\
-\x00\x12\x00r\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\
-\xa0\xc1\x83\x08\x13\x22\x1c0\xd0\xc2\xb3\x01\xce\x9c)\x9c\
-H\xb1\xa2\xc5\x8b\x18\x0fZ\x10q\xe1\x19\x81\x89\x08(\
-P\xf0\xf0LD\xc6\x93(SV\x04 \x02\x03\x81f\
-*\x05\x12\xd8\x90\x22\xa6\xcd\x9b\x13\x07lx\x80\x13!\
-\xcd\x9e@S\x0a\x00\xc13h\xc2\x8fF\x93*\x0c\xe0\
-\x01\xa6R\x85\x08\x9eJ}\x16\x80\xc2T\x8b\x18\xae\xf6\
-\xac\xaa\x15#\x06\x01]S\x92\x0cKV*\x88\xb2(\
-)\x80E\xfb\xb4Y\x82\x05\xcf\x18\x08\x0c\x00\x80j\x80\
-g\x06\x0c<K\x10A%\x02\x10\x12\xd9\xe2\x8c\x00\x81\
-A\xdd\x8c\x00\x18@H\xa9V\xb0\xc0\x8e\x19%\x148\
-\x8c\xb3\x00\x5c\x8c\x7f\xd9\x02\xb0z1B\x03\xcaI\xf5\
-z\x0d\xdc\x15@\xd1\x8a\x09\xee:V8V\xab\x80\xd3\
-\x14U\xaf\x9e\xf8\x00\xf4l\x07r\x1dKtJ\x91\xe1\
-S\xdf\xb31\x0e\xe8\xbb\xdav\xf0\x8b\x06x+4n\
-\xd3\xf4\xf1\x94\xc3)\xd6\x06\xea\xacuB\xd1\xcf\x0f^\
-V8\x1dgV\x85\xcd\x0ad\xffW\xd8\x80\xa2u\x95\
-\xe5'\xe6\x1e\x9fP\xfcD\xecB\xa3\xb2\x9f_\xd0\x19\
-l\xfa\xf4\xe1\x1b\x0c\x8f\xbfb\x01\xe5=\x01\x87Pz\
-\xfdQ\xe4^{\x88\xddW\xd0v\x05R\xa4\x9fM\x0f\
-\x12D\x5c\x838\x9d\x17\x93\x80\x14\xda$\xdb{\xe4e\
-(\x9cB\x9cQ$\xdfA\x09x\x18\xd4\x86\x081h\
-\x10s&*\xe4@B!\x22$\x00\x80-\xc6\xb4\xde\
-A(\x16\xb4X\x8d@\x95\x88\x90\x04P\xf1\x08T\x8e\
-\x035\xc3\xe2\x8dB\xde\xe4\xe3A\x04\x16\x04$B\x07\
-&i\x11\x91\x02)\xf8\x0c\x8b\xcf\x1c@\x9a\x94\x16M\
-h\x10\x86\x13\xed\xc8\xe5EM\xeah\x90\x95\x02\x819\
-\xe6r\x09\xdd\x87\xa5\x97kV\xf4\xe4AX\xc6\x19S\
-\x94\x0aE(\xd0Zv\xae\x94\x10\x83K\xf6\x19\x13\x9c\
-\x03!\xf5\xcc\x96\x82\xaa$\xa6A\x88&jcL|\
-:\xaaP\xa4\x05\xe1i\xd0\x01\x92V\xd4\xe8@\xa2\x05\
-\x9a\xe9I\x9e~\xda\x95\xa1\xa2\xa6\xa4g\xa96Y:\
-\x903\x94\xa2z\xd3\xa6\xae\xc6\xff*+\x97\xb0\xda5\
-\xebV\xb7\xe2De\xae\x18\xed\xca\xebM\xaa\xfe*l\
-O\xb5>\xa3\xe2\xac\xa7\x0a\x14\xaa\xb2\xc2\xceY\xd0\xb2\
-\x04\x91z+\xb4\x03\x95IP\xab\xae\x16;\x17\x82\xb9\
-\xfaJ\xd1\xb1\xae\x9e\x0a\x1c\xb5\xbc:K\x10\xa6\x9c&\
-\x84\xad\xa8\x00\x8c\xb8TBH\xa2\x1a,^\x05\xd1(\
-P\xb2\x92\x9aK\x10\x86\xd0\x1a\xa0\xad\xa0X\xbeh\x11\
-D\xb2\xce\xbb\xa8@\xce\x10\xeaoD\xd9J\xbb\xefA\
-\x02,\x99ZD\x0c\xcb\x9b\x90\xc0\x8c:\x03\x00]\x14\
-S\xecj\x8c\x05\x9d\xda\xf1\xc8\x15\x7f\xbak3\xeb\x1e\
-Jr\xc7\xa2:\xe3\xf0@\xe0\xae\xba2\xcb\x99\x9e\x8a\
-\xf2D3\xd3\x9ch\xbb\x09\xe9\x9bq\xce\xff\x0ai!\
-A\xde\x22\x0ct\xd0-\xcek\xacEG\x97\x1c\xa7\xbb\
-\x05\x1d\x90\xf2\xcf9\xf7\x89\xe6\xbd\x195\x8d*\xc6\x17\
-i=f\xb2\xcd\x14}\xd0\xd1\xa5\x1e\x8c\x11\xd0\x5c\xc6\
-[\x10\xa1gW-%\xd4Q\xab\xd96\xc9R\xfe7\
-\x91\xb5(\x8d<\xec\xad\xce|\xa1\xb7\xf7E\xafQ\x14\
-A\x9d\xb7\xc2\xfd\xf7MR\x1f\xde\xd9\xd4\xd9\x9a\xd4%\
-\xe1\xa8\x8a\xf0\xf2\x8f\xc3\x0e\xe0\xb7E1\xa3:\xd4\x03\
-\xf6v8\xab\x00)\xb8\xd4\xcc\xe8\x18E \xf7\x98\x00\
-X\xa0\xba\xea)\x5c\x80\x01\x05\xa3\xc7N\xfa\xb0\x00`\
- \xfb\xed\xb8\xc7~\x91\xd8<\xbe\x94\xfb\xef\xbaOt\
-\x00\xbeR6\x00\xfc\xf1\x9d\x0b4<\xe4RB\x80\xfc\
-\xf1\x075\xb3\x00\xf3\x5c&\xf0<\xf4\x04\x19\xc0\xb8\x9d\
-\x0b\x5c\x8f\xbc\x04j\x7fj\xbc\xf7\xb8K\xd0\xc0\xf6\x8e\
-\x02\xe0\x00\xf9\xcd\x10\x16\xbe\xac\x11\x03\xef@\x02\x06\x14\
-\xc0\xfb\xac\x03\x04\xa0?\xfah\x05\x04\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,\x12\x00\x12\x00r\x00r\x00\x00\x08\xff\
-\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*$ha\xc0\
-\xc2\x87\x10#J\x9cHq\x80\x88\x0b\x1e\x9e5[\xb8\
-\xf1\xd9\x86g\x16\x00P\x1cI\xb2\xe4\xc3\x01\x17( \
-0I\xd0\x03\x08\x01,c\xcaT\x98\x02\xc3\xca\x99\x06\
-\x09<s\x88\xb3g\xc9\x0d7}&\xbc\x00S\xa8\xd1\
-\x84\x18\x8e>l\x86!\x80\xd2\xa7P#6{\xe04\
-\xaa\xcc\xa2V%R\xe0\x99ud\xd2\xae\x13\x99b\x05\
-\xbb\xb0*Y\x8a\x08\x0a\x9cM\x08\xe0\xa3\xc9\x04\xcf$\
-<3\xa0\xf6\x99\x00\x91\x02\xd5Bx\xe6\xc0d3\x0f\
-x\xd7\x0e\x1c\xa0s\xa4\x83\x05,\x0d\xc0\x1d\x89\xc0\xec\
-\xda\xba\x14\x1b\x8ce)R\xc2\x81\xb0\x17\xd6:\xfb\x1a\
-\xd1A\x01gJ\x01\x14\xe8+8\x22\x05\x89\x9e\xb3:\
-\x0b\xb0\x18\xe2\x83\xae\x81\x1f\xa6>\xcbZ\x22\xd7\xd0\xaf\
-\x1f\x1e\x80,xt\xc4\xd8B\x05\xe4^\xd8\xba\xb4@\
-\x00{\x1f>\x00\x8e\xf3v\xc2f\x06\x8c\x1f\x0cpy\
-\xe1p\x9f\x85\x15\x1ep,\x9d \x00\xb9g\xaf#\xff\
-L\xc0\xbc;E\x0a\xa0\xbbF7\xbf\x907\xc2\xe41\
-\xd7?w\xcf\x1e!\x83\x87\xf4)2\xe8\x88\xb0Y\xfe\
-\xfa\x07\xed\xa7\x10\x02\xceM\x04@P\x08q\x07\xa0B\
-\x05\xf0w\x10\x01\xe5A\x94\x91B\x0a.\xc8\x12|\x13\
-\xfd7\x90\x86\x16\x22\xd4@Y\x14\x09\x80\xa0A\x18v\
-\x18\x11b\x09ew\xa2B\xe0\x99h`\x04\x0a\x95H\
-\xa1\x83\x059\x10\xa1\x8b\x0a\x09P\x1dB\x93%tZ\
-B\x15\xe2\xf8\xd0}\x09MX\x16\x8d\x04\xc9(dD\
--\x96\xa4b\x8dK\x9a\xb4\xe3HA\x0aDd\x94#\
-q\xb8P\x93\x05%\x90\x1e\x96#\xc18\x92\x00H\x0e\
-T%\x98,\xf5(\x90|\x06q\x89&Nl\x124\
-\x22Ag\xbe\xe9\xe4t\x09\x89i'I\xa4\x05Hb\
-BZ\xeeI\x12\x8a\x04=9\xd0\x017\x0az'A\
-j\x0aD\xa8\xa2\x14=Z\xd0m\x1f\x22\x14(\xa4~\
-zH\x90\x9b\x03%\x8a\xe9H\xc5\x19*Pq\x9fJ\
-D\xea@\xfc\xdd\x18g\xa9\x10UzP\xa3t\xb2\xff\
-JQ\x95W\xb2%\xebD_\x1a\xb4\x1e\xa7|\xddJ\
-Q\x9f\x05\xf1\xeakI\xc2.\xb4\xea\xb0\x09\x1d\xfb\xcc\
-Me\x22\x9b\xd5\xa5\xce\xd6\xe9\xecS\x05N\xebS\xae\
-\x05ak-E\xce\x00;P\x04\xdan\x1bkB\xce\
-\xd4jf\xb8\xe2B\xe4\xccjz:\xc0\xc0\xba\xe9\x92\
-\xb4\xee\xbc\x01\xcc\x0bo\xbc\xdc\xda\xab/\xba\xf8\xf2\xf8\
-\xcc\xbe\xf6\xf6[\x90\xab\x06\x81\x06\xf0\xbc\x02\x13\xa4\xec\
-@\x07\xdf\x9b\xf03J>\xb3X\xc3\xfc\x8a{j\xb6\
-\x0d?,\xd0\x9c\x02%Gq\xc5\xd3\xc2\xca0\xc5\x0f\
-\x9b;\xee\xbf\x19k\x8c\xd0\x97$'|\xf13z\xa2\
-\x9cr\xbf\xcd>\xfa\xb1\xca\x06\x11,3\xc08\x174\
-Y\xcb=\xc3\x5c\xf0\xccA\x1ftp\xd1\x0a\xf1\xdc\xaf\
-\xb4+;\x8c\xf4\xd3P\x97\xf4c\xd4\x0cRH\xf53\
-\xa2\x0a\x14\xf3\xd3\x11_-\xd0\x99/\xe3\x9ch3\xd5\
-\xf6l\xe4A\x92zM\xd0\x01\x22?\xac%\xb4\xf8\x9a\
-\x1cl\xd4\x05p|\xa8\xa7\x027\xa8P3LC\xbb\
-\xbd\xb0\xdaO\x03p6B[\xe3L\x18\xe0\x06]z\
-@\xd9\x02\xb7\xfd-\xde\xf16k\x10\xe4\x88',\x9e\
-\x9d\x827\xd3\x0c\x01\x1b0\xbe\xd6\xdf\xa5\x01\xf0\x80\xe6\
-\xa47\x83\x00\x06)P\xaeT\xdfg\x19P\xfa\xeb\x9a\
-\xbb\xe4\xb8A\x03\x80\x90\xa6\x8b\x04\xc0\xae\xbb\xe6\x14P\
-\x80\xc1\x05\x17X`\x81\x00X\x89\xe0\xd1\xb2\x17\xe2H\
-\xe6\xee\xcc\x93\xaeT\xe1\x16\x0e\xd0|\xf3J\xc1-\xdd\
-\x01\xd3\xeb\x1et\x83\xd9\xbfn\xd4\xec\x0b\x8e\xd6\xbd\xf3\
-E\x8b&\xc1\xf82\xa5\x0d)\x00\x0dD0\xfd[\xcf\
-\xa8\xfe&\x00\x0c@\xe0\xbe\xf6\x11\x1d\x90\x80\x01\xac\x97\
-\x0a@\x00\x0d\x80@\x02\x1c@\xbe\x83\xc0\x08\x02\x0d\xf0\
-\x5c\xc2\xfeg\x96\x00\x80\x0f,\x01\x01\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,\x12\x00\x12\x00r\x00r\x00\x00\x08\xff\
-\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\x22\xb4`P\x80\
-\xc2\x87\x10#J\x9cH\xf1\xa0\x80\x14\xcf(\x10\x88\xb8\
-\xf1\x82\x88\x01\xce*\x8a\x1cI2\x22\x08\x0f\x1bK\x0a\
-|\xb0!EH\x950c&\x14\x00\x22\xa5\xcc\x82\x14\
-@8\xbc\xc9s\xa43\x11\x1ez*\xa4 \x02\x80\xd0\
-\xa33\x9f!@\xfap\xe9\x00\xa6L\x01l\x80:\x91\
-\x02U\x9e\x00.,\xbdJ1\x00W\x92?\xb7~\xa5\
-\xe8\xc1\xe8X\x89\x03l\x9e\xad(b\xadBg\x17T\
-FX`\xa0@\x00\xaf\xce\xf2>}\xe6u\xc1\xb3f\
-*)\xectK\x10\x80U\x91\x09\x0cx\x15\xe9\x10\x82\
-\x03\x92\x05\x08\x0fd Vb\x84\x02fc\x0ah\x90\
-\x000\xc5\xa9\x84AO\x840X\xa8\x00\x03\x15)d\
-\xfe\xfa@2D\x06\x14\x09\xecu}\xf0@\x03\xda\x11\
-+\xe3\x16h`\xb5\xdb\xc5\x11g\x1f\xf5\xbd\x9b'\x02\
-\xe1X[C\xbc]\x9c`\x04\x88\xc7\x8f*W\xe8\x00\
-y\xf3g~\x1f\xaa\x8dI\xfc`\xf6\xeb\x06\x99+\xff\
-\x9c\x1e\x13\x02\xc4\xc8\xe0\x11\x068\xf0\x10\x83L\xd8\xe9\
-UZ\x0f\x0fS\x80\xee\xf8\x22\x07\xb0O\xe8\x19,y\
-\x83\xcd\xa0\x87\x9fB\xfa\x8d\xf7\x92H\xe6)$\xe0\x80\
-\x0a\x01\x87\x10j\x22\xc1\xc7`L\x0b\xca\xe4\xccv\x05\
-}7aL\x07FTaA\x11t\xb7\xe1A\xce$\
-\xa0\x90x\x10\x01\x80\xe1@\x07\xcc7\xe2H\x08\x88h\
-\x10\x84\x08}\xf8\xe2\x89\x0a%\xf8\x10\x00\xf7\x0d$\xc1\
-\x8d=\x95\xf6`B\xfb\x01y\x93\x86\x07\xf1\x98\x10\x8d\
-FJ\xc4dC\x0a=I\xd0\x0126\x99\xe4c\x08\
-\xe9h\x903\xff\x11$\xa5\x95\x0f\xd9(P\x8c\x08u\
-X\x10\x95`V\x84\xe5A(\x12d&Ab\xa6\x99\
-P\x9ce:\xa3\xa5\x9c*\x15i\x90uy\x01`\xe2\
-\x94.\xe2\xb9dBw>\x93W^\x05<\xf7L\x04\
-\x0c\xbc)\xe8M\x87F\x0a\x80\x00y=Z\xd1\x8f\x11\
-E\xaai\xa5\x96N\x14'\x93\x9bj\xda\xe9Q\xa1\x1e\
-:*E\x98\x1a$V\xa9\xa6\x9e\x1a\xd3^\xacr\xff\
-\xea\xaaJ\xe8\xc5\xea\xe8\xac\x14e\x17+\xae\x96!\xf4\
-\xe7\xae\xbcBT\xe8J\x02\x01\x1b\xecH\x9e\x19{l\
-\x8d\x0f)\xbblW\xb6>\x9bP\xa0\x01D+-\x89\
-\xcd\x96zm\x99\xd9\x86\xba-\xb6oi\xfbmA\xb7\
-\xba\xb9\xe9\xb8[NT.\xba\xecB\x15h\xbb\x93\xc1\
-+/xk\xcek\xefM\xfd\xdd\x0b\x13\x9d\xfa\xf6\x0b\
-\x11\x92\xfe&\xb4b\xc0\x05\x09I\xd0\xb0\xf7\xb6I\x90\
-\x84\x01\x1f\x06n\xc0\x06\xfbH\xb0@\x08?\xa3\xf0\xc4\
-\x05O\xccpA\x7fb\xcc\xac\xc7\xb5U\x09r\xc0\x0e\
-\xee9\xb2A\x1d\x9f\xac\xf2\xca\xc4&T2\xcb\xfe^\
-\x5c\x18\xc90?3@\x8f\x03\xa5|\xef\xbb\x02E\x0c\
-\xef\xcda2\xc5\x80\x07\x14l\xe03~\x01\xe0<P\
-\xc50a\xd0\xcc\xd3\xcd \xc0osS\xeb\xcc\x93\x01\
-Pg]\x16\x83\xce\xb8\xf7\x90\x03\x22\x93$@\xd6d\
-\xcb\x86\x9f\x00\x0e\x13\xc9sIX\x93M6\x08\xe9\xc1\
-\xbd[\xdbnk\x1d6x-R\xc5@\xddn#\x9e\
-p\xc1\xddP)\x0d(W\x0b\xf0\xddw\x5cke5\
-Qu_\x01\x10\x81\xe1n\x13\xd0\x16W!\x0d|\x90\
-\xa2g\xd1\x0dy\x7f\x883%\x9aD\x00\x7f\xb5\xde\xe6\
-\x06\x11\xb0\x01H\xb45#s\xe3\x9d\xf1\xad\x90\xe9)\
-\xac\xdd\x90\x08\x1b\xa4M\x91\xecWi\x9e\xf5D\x1d\x89\
-\xc0\x90Apw\xce6x\x018@v|\xf5^\x07\
-\x80\x01\x07@M\xef\x86\xcb7\x9f\xef\xc9\xd1\xcf\x0d\xb8\
-\xf2\x85\x13v\x00\xd3\x01\xa7\xdai\x01\x12\xe8\xc9\xd3e\
-\xc1\x86\xb4\x80\xd5\x15\x01\x06A\x01G\xcf\xea\x8c\x00\x01\
-\x18p\xbe\xf8(c\xc7\x97\xbfBR\x1a_@\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,\x17\x00\x12\x00m\x00r\x00\
-\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13>\x1b\
-`a\xe0\x85\x0b\x02-X\x10\xa0\xb0\xa2\xc5\x8b\x183\
-j\x1c\xe8\xe1\xc1\xc5f\xcf<\x5c\x10Aq\xa3\xc9\x93\
-(\x0d\x02\x10\x81!%A\x02\x18H\xba\x9cI\xb3 \
-\x80g\x1ek\x1a| \xe2\xa6\xce\x9f@\x7fz\x08J\
-T%\xc4\xa2\x16/\xf8DZS\x00\x06\x04L/\x22\
-\xc0P2\xeaI\xa7 \xadf\xa4\xaaU#\x88\xae&\
-\x11\x1c\x05\x9b0@N\xb2\x1b\x090@ks\xc3L\
-\x09\x04\x97\x96400\x82K\x0fK\xc9\x0e8\xab1\
-\x02\x84\xb5'\x0bH\xc8j2\x00\xda\x02'\x1b\xfcd\
-\xb0\xc0\x01[\x8d-3\x1eX\x88t\x00\x84\xc9\x19\xf9\
->\xde,\x10@\x01\xc7\x185sv\x80\x98\xedg\xce\
-\x02\x07ht\x86\xba\x01f\x8b\x80\x7fB\xb5(\xa1*\
-\xeag\x0b>\xfetF\xc1\xe2\x81\xd8\xb7\x09\xbe\xb6\xea\
-\xcc6\xc2\x08\xc6\x83\x0f\x84[\x11\x81\xea\x94\xce\x9c\x19\
-V\x08\x81\xb5\xf2\x94\x04\xf2n\x8c\x9e\xfc\xbaF\xe0\x08\
-{\x9f\xff\x8c\x1e\x9d\xb9w\xa4t\xb7\x93w\x06\xc0\xae\
-\xf0\xe9\xe7i\xc2\xc7\xb8>:\x00\xf3\xc8\xe3\xebD\xa0\
-]a\xfd\xf5\x03\x140\x80u\xfa]4\xc0p\x06\x0d\
-u\xd1\x7f\x0c\x16\xa8\xd1|\xd01\xb8\x9e\x83\x1b\xa5\x17\
-\xa1\x84\xe4Q\x08\x94\x85\x07a8\xa1\x86\x1a\xf5WP\
-w\x02y\x18\x1d\x88\x85)\x94[\x87&\xa2\x08\x96\x89\
-\x04\xba\xc8\x14\x8c2&\x96\x10\x7f\x05\xd1X\xe3v\x0a\
-q\xf8L\x8b;\x06\x15#\x90A.F\x90\x87E\x06\
-e\xde\x8f\x12&y\x92\x88\x03-\x85\xa1\x93'\xadx\
-\x90bG\xd6G\xe5I\xe0\x11$\x1a\x93[\xa6\x84`\
-\x5ca\x02e\xa5A]\x96\x99R\x9a\x02\x9d\xa9\xe6L\
-c\x0aD\xc0\x9b:-9\x22\x9d4\x95v\x10\x9bx\
-f\x04\xe53>\xf6iR\x9c\xcf\xd8)\xe8F\x09\x1c\
-JT\xa2\x8an\x98\xd0\x9f\x8d&\x14h\xa4)AH\
-i\xa5\x97\xd6\xf4'\x9f\x99f4i\xa7\x1a\xe9\x09j\
-Y\xa3\x96\xfa\x18\x9f\x96\x9a:\xd0\xa7\xcf\xa4\xaajE\
-\x90\x96\xffj\xa8@\x84\xbdj\xabK_\x16z\xab\xa7\
-\xbb\x12\x84\xe5\x9e\xbd.\xf7h\xb0\xcf\x00P+\xb1h\
-\x22\xab\xa2\xb27\x0e\x1b\xecs\x071\xca\xacA\xa2\xde\
-\x0a\xc0l\x07\xc5\x0a\xea\xaf\x06\xcd\xfa\xea\x9c\xd3\x16T\
-m\x8e\xc4\x82{\x10\xab\x9d\x81@\x81\x07=5\xca\xea\
-\x01\x90\x0e\x80@3\xf46\x13\xd9\xa1\xd8\x1a\xe4fA\
-\x0c\xd4\xeb\xef\xbdx\xeeK\x10\x89r\xfa\xeb/\xb7\x97\
-\x0aL\x90\xc1\x06C\xabf\xbe\x05\x1d@0\xad\x0c\xd7\
-\x9b]\xa6\xe8\x0a\x94@\xc5\xf5\x8a\x17\xa9\x031\x22\x14\
-\x00\xc7\xf5f\x8c\xe2\xb8\xfcbd\x00\xc9\xf4r\x1a\xa6\
-\xb7\x08mL\xb2s\x8aj\x1b\xd7\x01,7\x83r\x98\
-\xae*4@\xce:\xd7\xe8pP\x0dT\xbc\xf0X\x1a\
-2\x00\xb1A\xee\xa1\xb4\x80\xc1\x07a\x10r|H\x1f\
-7S{\xf5&\x84W\x816\xebt \xbd\x0a-\x1d\
-\x5c\xcf\x95Ep\xecA\x14\x0c\x0db3.o\xd4\x9e\
-n\xa89\xf3\x15jo_D@\x0al9#\x82\xb9\
-\x15\x11\x8cZ\x933\x0a#t\xc1\xc4:u=\x90\x03\
-j\x07\x15\xf8A\xcdx\x80\xb7w\x09\x18\xee\xd2\xca&\
-\x0d\x1e\x9c\xc9@\x05\x00\xdaF\x08x0\xb7\xdbx\xe7\
-\xda7\xd9\x1aR\x00\xd1\xe7\xf6E47\xdf&I \
-yP\x02H\x1b\xee@\xce\xec\x1c\xdc\x01\x98\xa3\xf5\xb4\
-w\xcd,@8g\x02@p\xbb\xef(\xd6.;Y\
-\x06\xbc~\x9b3\x03,\xe0\xf7\xb4\x1b#\x85p\x99\x01\
-\x18 \xc1\xf3\x179\xc6\x80\xf2A\x06\xb8@\xa2g\x17\
-\x94\x15]\xbfG\xca<A\x01\x04P>Y\x01\x01\x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,\x15\x00\x12\x00o\x00r\
-\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\x0e\
-t\xe6L\x80@\x0b\x22\x06\x0ap\xa6\xb0\xa2\xc5\x8b\x18\
-3j\x14\xe8l\x80\x88\x0d\x140\x22\x08\x99b\xa3\xc9\
-\x93(-\x82LI\xd0\xc3\x05\x960c\x22t\x18R\
-\xe6A\x10\x0em\xea4Ys\xa7\xcf\x9f\x1b)\x02\x1d\
-J\xb4\xa23\x00\x0f\x8a^\xbc\x00@)K\x86\xce \
-8\xbd\x88\x80\xe9\xd4\xa0P\x93^\xc5(tkB\xa8\
-P\x0fx\xbd\xf8`\xc0X\x83`\xc1J\xc8\xd8,\x01\
-\x04\x03\x02\x03\x98}\xd6\xf1Y\x00\x06\x06\x168`\xb9\
-\xe1\xec\xc2\xb4P\x19T\xdc[`\xaeF\x00\x01\x0c\xac\
-5I\xc0\xf0V\xc0i\x17\x1f\xcc\x19\x13@\x83\x08&\
-\x0bx\x85\x9c\x16\x80\xe4\xbd\x94}\x0a0\xb07#\x86\
-\xa9\x9c9\x0b\x90\x8b\xdad\xe8\x9f\xa9S\x8f\x05`@\
-\xac_\x82\xb1!\xdf~F;\xa3c\x9b\xb9\x01\xef\x96\
-\x98\x80*\xec\xe0\x0c\x87\x1b\xd4<\x16yr\xe5\x071\
-?\x0e\x0e]\xa1\xd4\x8aZcR\xaf\xae\x90\xb9\xc2\xec\
-0cs\xff\x97yZ;\xe7\xf16\x05\x9bO\x8b^\
-\xe7\xeb\x94P\xdb\xef\xec)\xff\xac\xfa\x84\x0d\xea\xdf\xce\
-\x9f\x10\xc1{\xfdS-\xa0\x90\x80\x00\x9eU\xdaA\xcd\
-\x14\xd8\x9e\x07\x0a\x8eu\x1dB\x014\xe8\xd5\x81\x06I\
-&\xa1S\xde\x19\xd4\xcc\x7f\x17\x02%\xddA\x0fvX\
-T\x84\x22\x0eW\x1cB\x19\x968\x16x*\xc2\xa6\x10\
-\x87-\xca\x04\x17\x8a1\x0e\x05\xa3\x855\xee\xf4a\x8e\
-S\xf1wP\x8a<\xc6\xf4\x1bA!\x06)\x13\x85\x04\
-\x9dh\xa4ME\xe2\xb6\xa4M>\x1aD\xe2\x930M\
-iP\x94T\xa2\x04@\x82\x07\x11\x98%K\xb6\x19\xa4\
-\xe4\x97>\x11@&KM.t&JX\x12\xd4\xd4\
-\x9ap*7d\x9c)YY\x90\x9dtV\x84\xe7@\
-{\xe6\x09aB}\xfa)\xe8\xa0\xed\x05J\xa8E\x86\
-\x1e\x8aRW\x8a\x1a4c\xa3\x1a\xe18P\x98\x90\x16\
-\x84\x00BcV*\xd0\x9c\x9af\xd6)F\x8e\x05\x80\
-\x01\x05\x14\x80p\xa83\x97\x228\xd0\x00\x144\xe3\xaa\
-\xab\xe5\x09\xff\xca\xe93\x8b!\xf5\xea\xad\x89f\x09\xe4\
-@\xfc1p\xeb\xad\xf4\xd1\x19,A9\x19\xf0+\xae\
-\x9d~\xe8\xeb\xb1\xaez\x19\xa7\xb3\x05=(\x00\xb3\xaf\
-\xc2\xf8\xe4\xb4\x099\x96\x00\xb5\xcd\xa4\x99%\xb4\x04\xed\
-\xf8L\x01\xdc\x22\xf0\xe6\x99[jt\x00\xb7\x8f\x92\xd9\
-\xeeE\x10pk&\xba\xa9\x828\x19\xb7\xcd\xec\x1a\xe7\
-\x86\x08-\xf0+A\xfe}i\xed\x8b\xaf\x1e4l\x90\
-\x07\x0bDi\x97\xae\xe6\xa9\xaf@\xef\x1a\x84m\xa7\xe7\
-&\xe4\xad@\x0f0Z#\x8b'\x01\xb0p\xb4A\xc6\
-\x1a]F\xf7!T\xf2\x97\xb3\x1e$iA\x0f\xf3\x18\
-qE\x02|LP\xbe_\x22\x89\x91\xaf\x84\xa6l\xdd\
-\xa0-[\x94\xe9\x8fF\x82\xbb\x91\xc7\x16\xbd\x04\xa0\xa9\
-S\x0d sAe\xd5'rB\x03\xfb\xd4\x8cU\xe3\
-\xcd;\xd6\xd2\x05\x11\x90\xabS\x00\xf4e\xd1\x01:\x9f\
-\xa44F^\xdf&\x82\xd5\xb7\x8d\x8dQDcm}\
-\x15\x00\xe2ZT\xf1P\x14%<2\xd7?+TU\
-\xd4(\x09\x80`\xb4~mZ\xf4\x00\xd2\xc3\x09\xadT\
-\xd8\x08=p\x81\x05s_\xe4\xd13hkt\xf2V\
-\x00\x18\x8e\x11\x01\x0c\xa6`\x01G\x0f\x09\x94\xc2\x05}\
-q\x89R\xdem\xc7\x8d\xde\x01\x81\xefW_3\x0b4\
-\xfe)A+\xa3\xf7\xb2W\xcdH\xe0\xb6r\xb4a]\
-\x14\x04|\xb7W@\x04\xa2\x17\x15A\xcf\x0d\x0ap\xd9\
-P\x12\x14\xd0\xfb\x85\x00\x14 \xc1\xba0\x15G|\x90\
-\x88)\xe6@\xf0\x08\x89e@a\x1a\x13\x8a\x98\x9d\x00\
-t?\x5c@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x13\x00\
-\x12\x00q\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\
-\xc1\x83\x08\x13\x1et\xe6L\xc03\x0b\x02\x018SH\
-\xb1\xa2\xc5\x8b\x183\x1ad\xc8\x91\xe1\x05\x04\x08\x09P\
-\xc0\xa0\xb1\xa4\xc9\x93\x17;\xaadh\xa0$\x88\x01(\
-c\xca\xac\xb8\xb2&\x00\x94\x046\xc0\x9c\xc9Sf\xcd\
-\x9f\x01f\x12\xb8\xd0\xb3h\xc6\x9fH\x83\xf2l\x86a\
-\xa7\xd1\xa7\x05\x91JU\xda\xb3\x19\x05\xaaP\x9fJ\x95\
-z\xe0)S\x87Y\x8dnE\xda k\xb3\x0d7\xc3\
-\xf2\x1c\x8b\xb4\x80\x83\xac\x04\xb0\xaa=\xc9v\xeb\xb3\x01\
-\x01\x0240`@B\x82\x08s\x03+\xac\xcb\xd0d\
-\x81\x05o\x05+\x16h\x97'L\x09\x1aA.>Z\
-3\xec\xcd\xae\x187L\x9c\x9c\xb2\xb0`\x00\x060[\
-\xa4\x90\x96\xb3i\x8bn/>(}\xba5Bg\x05\
-T\xb3vM\xbb\xb6\xed\x9e\x06\x9aY\x04{\xfbv\x00\
-\xd1\x09W\xf7\xee\x0d\x00\xf2\xf0\xe3\x14\x1b\xe8VH\x12\
-\xb9\xed\x02\xcb\x13\xb6t^\x1b:E\xb9\xd4M[O\
-H`vv\xce\xca\x15z\xff\xf8N{\x01\xc5\xd8\xe4\
-[\x9bW\xe8=\xbd\xe2\x04\x0a!\xb8?-\x00\xb8A\
-\xa7\xf3\x17\x97MH!\xbfi\xf8\xfe\xf56@t\x06\
-\xf5\x17\xe0b\xd3\x1dH\xdez\x0a\x06\xc6@B\xcd\xb4\
-\xd7\xe0S\x89\x1d\xb4\xdf\x84j]\x88\xa1i\x00\x10\xb8\
-\xe1d\x0c\x1a$\xdf\x87Y\xe1W\xd0\x03$\xa6\xa8\x22\
-z\x07=\xa8\xa2Q\xbc\xbd(\x98}\x03\x11 \xa3Q\
-\xc6\xdd8W\x82:\x9e\xc6b\x8fY\xf1\x08\xe4I\x15\
-\x0e\xf9T\x88\x04\xa1h$JB.\xc9\xd3\x8fQ9\
-\xa9\x95\x94%aG\xe5\x95\xb7I\x88\xe5\x96\xdf\x0d\x00\
-\xc2\x05\x16h\xc9%B\x03\x10\xd0\xcc\x99\xcd\x10`\xe2\
-\x98\x09\x09\x80\xe6\x9b\xdd\xb1I\xd1\x00\x10\xbc\xf9\xa6\x8b\
-cjhP\x02v\xa29\xa2\x9c\x09\xf1\xd9g3\x00\
-\x02\xba\xe73u\x0e*\xd9\x98\x85\x1e\x04\xdd\xa0\xcd\xc4\
-x\xe5f\x09\x05\x00i3xbieA\x97\xfe\x89\
-e\x93\x06E\x00\xa9\x92[\xe6X\x90h\x0b\xa0\xc9\xa9\
-\xa4NjY\xe8\xa3\x8e\x1a\xffJP\x82\x1d\x22d\xaa\
-\x94\xb7\x12\x84\x1f`\x08\x89y\xa3\x96E>\x03\xaa@\
-z\x1a\x09\xa5Bk\xd6H\xa9\x91\xce\xd8\x88Q\xb0\x04\
-mz\xe3\xb1\x03A\xfbL\xb1\x03Q\xb0l\x8f\xce\x18\
-x\x10\xa8\xb5\x22$\xad\x8a\xd2F\x88\x10\x92\x04y\xcb\
-\xad\xb3\x07\xa1;\xd0\xb8\xe3\xca\xd9hAq\xea(\xe6\
-\xbc\x06\x8d\xeb\xe9\x8b\xe3!\xd4L\xbc\xcf\xe0\x1b-\x96\
-\xee\xe6\xabP\xbd)\xb2Z\x90\xc2\x07\xe5JP\xbf\xb2\
-f4\xac\x8c\xd6*D\xad\x8c\xd8\x0e\xac\x91\xc0\x03!\
-\x90l~\xdb!\xb4oO\x1e\xf7\x18\xc1\xb6\x18]\xdc\
-\xf1\xc7\x18\xd2\xa8\xd1\xc4\x02!\x90iz*\xe3X\x11\
-\x08\xf3\x85\x1c\x18\xaf\xcc\xa5G\x14E\x12\xa0\xcc\xa6\xba\
-\x08E\xe0\xabZB\xbbw\xb4Z\x0f\xb0\x1c1B\x17\
-$\xad\xd8\xcc\xb4\x09\xc03E\xa4\x9aFtBF+\
-\xe6pB\x22,\x06pAK\xafU\xb0k \xb0k\
-\xd1\xd7s\x15\xe02s)\x94m\x91\x08\x10c\x04\xf3\
-\x5c\x02p\x5c\xd1\x06)\x98Z$@\xdfY\x07\xe8L\
-\x03o[\xa4\xe4\x05?CTZ\xd8\xcd\xc9\xc4\xb0i\
-y\xbbW\xf3\xd3\x03\xb1M\xf9@\x09\x8cm\xdb\xd9\x93\
-\xe9M^\xc5s5#\x81\xe6\xd9\x81\x0eU\x03r\x93\
-\x17\xc0\xc8EE\x00\x81\xd3\x1b2\x00\xc1\xd5D.@\
-\xb5\xb1\x01'\x90@\xe1\x02UH\xfa\x92\x0c\x99\x08\xfb\
-i\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x12\
-\x00r\x00r\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\
-\x83\x08\x13*t\xc6\xb0\xa1\xc2\x87\x10#J\x9cHq\
-b\xc3\x8b\x18/V\xdc\xc8\xb1\xa3G\x81\x19C\x8a\xfc\
-H\xb2$I\x91(G\x9a\x5c\xc9ra\xca\x97\x030\
-P\xf0 \xc2Y\xcb\x9b7_\xa6\x0cP\x90\xc0\x05\x00\
-8\x83\x9e\xd4\x19\x12\x00\x81\x83\x08~\x0a]\xba\x91h\
-\xc6\x02\x0a\x93\x02eJ\xf5\xa1S\x8c\x0b &\xb5Y\
-\xb5\xab\xc1\xab\x0d\x13H|0\xc0\xab\xd9\xafD%P\
-\xbc\xc0\xf5\xac\xdb\x83\x18\xcbR|\xf0\xb6nB\x86\x0c\
-\x0eT\x04a\xb7\xafI\x0c~\x03{\xf4 \xb8\xf03\
-\x03\x86\x13Kl\xa0\xb8q\xc9\x07S\x1d\xd7m\xa0W\
-\xb2\xe5g\x02\x22\x5c\xb6\xec,\xebC\x0cm7\x9b\x85\
-\xfa\x90\xb1h\xc7<O+F @\xf5\xd9\xbc\x0a\xe9\
-\xba6\xcb\xe0!\x84\xd9f\x11+\x94\x8b\xbb\xaa\xda\x84\
-\x14B\xf7\x16\x0a@s\xc2\xda\xc3\xa9\xf2>H r\
-r\xa1\xa4\x11\xea~^\x975u\xbb\x9e\xaf\x07\xbd\xad\
-\xdd-\x80\xca\x07\xa7w\xffoi\x9a\xb9\xf0\xf1TS\
-\xa3g\x19\xdd`\xf6\xf5+\xc1\x1bt\x0e\x7fi\xf9\xfa\
-\xf8\xf3\xeb\x9fx\xbf\xa0\xfa\xfd\x1c\xd1G\x90x\x00n\
-\xe4\x00Bb\x15\xd8\xd1{\x04!\xa0`G\xfd\x11\xb4\
-\xdc\x83\x12MH\xe1G\xe7\x0d\xc4\xe0\x85\x10%\xc8!\
-I\x04\x0e\xe4\xe1\x87\x1e\xc9\xf6\xcc\x00\x1e\x10\xd0\xcc\x03\
-\x1e\xb4F\xe2@!\xfa\xd7\xcc\x8c4Z\xf7\xe23\x11\
-\xf6D\xe3\x8e\xbf\xddx\x17\x00;\x06\xe9\xa3B\x02\x04\
-\x10\xe4\x8e\x02R\xf8\x9fAF\x1e9\xe3\x92C\x12\xd4\
-\xa4\x93PF)\xd0\x94GV\x19eY4\x12\xf4\xa4\
-\x95_=\xd3\xccA\xcdh9\xa4Mc\x86wc\x8c\
-\x04\x1d\x08\xe6@\xdc\x19\xe4\xe6\x9b\x04\x8dx\xd0\x86\x02\
-\x99\xf8\xe1Q\x07q\xc7\xe63\x19Z\x89\xdcAf\xbe\
-\x98\x9a\x8bj\xd2I\x90|u\x92h'B=\x86y\
-a\xa0\xcfD\x9a\xa3@\x83>\x98iA\xf7Y\xa8\xa1\
-\xa2\x8b\x82Z\x10\xa3\xcf\xc4iP{7\xe2\x99\x90\x9e\
-\x00\xb2*\xaa\x7f\x1b\x99\xff\xfa\xaaA\x88\x82ZkA\
-\x91rHAB\x8fN\x84\xeaz\xbfJ\xe9\x91\x83\xb3\
-r\xa8*K\x9bjWh\xaf\x07y:\x90\x8d\x056\
-\xe3l\x9f\xb1=(+I\x80iwmAI~\x14\
-\xecl\xdf\x0e\x94lD\xb9\x16\xd4L\xb8\xda\x95+\x11\
-\x00s\x92Y\xa8e\x05\xa4\x89\x90\x03\xddF4\xad\xb8\
-\xb8\xbd+\xafG\x97\x0et\xeel\xfb\x1e\xd4/E\xc7\
-\x0e\x84.\x89\xce0K\xd0\x06\x9be\xab\x90q+\x15\
-\x17Q\xbd}\x09\xe0jW\x12?\x84\xc0\xbbn1@\
-\xec\xc3\x81m@\xb1c#\x7f\x94YD\x08\x88\xe0\x97\
-\x08\x1f\x83LU\xc9\x03Q\xc01\x85\x10C$3\xa5\
-})\x1c\x14\xcc\x04Q \x02\xcf\x1b\x01 \xc2\xc5\x09\
--\x80\xb3P\x0d\x04\x0c\x11aG[\x94\x02G\x03+\
-\xd7\xeeD\x14\x5c`A\xd3_Yp\xc1\xae\x06\xde\x8b\
-\xb1\x04JOD\x00\x05\x0c[0\x90\x05f\x0bd6\
-\xc3|v$\x01\xd0T\xc1V\xecA\x00@\x10\xb6`\
-\xdb\x1a6\x80\xceuy8]X\x00\x09\xdc],\xe0\
-\x82\xcf*\xc0\x9f89\x00\xc1\xad\xcf\x0d\xb0\x00\xa9\xf1\
-\xed7@\x03\x12@^\xd1\x01\x124\xe07z\x03\xf0\
-t\x9b\x03\x85\xc3i\x00\x03\x8c\xbf9\x00\xd6g\x05\x04\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x16\x00r\x00\
-n\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13\
-*\x5cx\xd0\x99C\x87\x0c#J\x9cH\xb1\xa2\xc5\x81\
-\x0f3B\xbc\xc8\xb1\xa3\xc7\x8e\x1aC:\xfbH\xb2\xa4\
-I\x82\x22E\x9e\x5c\xc9\x92bJ\x95-c\xca,\xf8\
-2\xe5\xcc\x9b-k\xda\xc4\xc9\x93\xa4\xce\x97=\x83r\
-\xfc\xb9S\xa8Q\x89Da\x1e]\xba0\xe9C\x00\x1b\
-\x99Jm\xf8\x93\x01\x81g\x086L\xdd\x8a\xf0\xa5V\
-\x82\x04\x06p\x1d\x8b1$\x03\xb2h\x13jD\x80\xf0\
-\x01\x80\xb4c\x1f\x0a\x80K\xb7\xe1[\x85\x14\xearu\
-\x96`!\x06\xbd[\x05\x1cXX\x00\xf0\xd4\x00\x86\x0d\
-\x17h\xd641\xd3\xc2\x8e\xebBN\x888\xf2Q\x08\
-\x0a\xafZ\x86\xdb`sZ\xb6\x9e\xd1b\x0e\x1dTB\
-B\xc6\xa4{\x0aN\xcd\xd5\x80\xc2\xbb\xaco:\x88=\
-u2m\xb8\xb6o\xb3\xec\x8c0\xaf\xee\xa5s\x7f\x1b\
-\xcd-\xbcd\xf0\x83\xa6\x8b\x07E0Ry\xcf\xb3\xce\
-M\x8aE8:\xfa\xcd\x07\xd6MV/\x88Z\xa0\x00\
-\x0a\xcd\xc2S\xff\x10\x91]\x22\xf4\x83\x95\x01\x10\x08\xcf\
-\xbe\xd9\xdf\xf2\x0b\x8f'l\xd0\xbe\xfdt\xf8\x16]?\
-\x93P\x9f\xbd~\xfc\x1c=\xd0_x\xff\x01h\xd0\x02\
-\x08i6 \x81\x06V\x84Z{\xcf\xb4G\x5c\x83\xcf\
-\x9cw\x10\x00\xdd\x0d\x14^e\x14\x12\xc4!z\x19j\
-\xf8a\x87\x0b\x010\x22A\xf7\x91\xb8\xd0\x89(\xa9H\
-\x92|.\xc6(#]&\xce\xc8Q\x8a6\x12T \
-E\xbc\xe5xP\x88\x03\xed\xd8!\x82\x07\xf5\xa5\x10\x91\
->\x1ad\xa4\x922\x02)\x90~\xdb\xf9\x08#A\x90\
-M8\xa3\x85\x08\xe1HP\x8f\x1dF\xd9\xe2B\xc9\x91\
-\x88\xddA\xb3\x0d\xb4d\x8eS\x0e\x84\xe43B\xcah\
-e\x85IR\x04\x9b@e\x1a\x04Z\x83i\x0a\x14A\
-\x9c\x05qY\x90\x97\x99Q\xa8YIX\xaa\xb8\xe7A\
-m&\xe9'\x9f\x09\xcdY\xd0\x9a\x05\x0d\xaab\x98\x07\
-\xe5)\xd0\xa2\xc5\xb1\xc8\xa8A\x92\xb2\xe4\x81u\x80V\
-\x04iAo\xce\xb8\x9a\x81\xea)\xa4)\xa2\x0d~\x9a\
-\x10\xa5\x11\xd5\xfaY^\xa2\x02\x0dV\xd1\xaa\x97\xe2W\
-jB\xa1\x1ax\xa6K\x87\x22\x84\x80\x96\x91\x0dp\xe7\
-A\x07X\x1a\x91\xad\x09\x11k\x98\xb3\x04\x15Z\xd1\xae\
-\x08\xe0J\xd7\xb1\xac\xc6\x09\x02C\xb0z\xd4\xadA\x17\
-\xfc\xe6(O\xae\xd2\x05-N\xa7*4fZ\x178\
-YP\xb2>\x0e\xb0\xeeB\xe7~4\x00\xb3\x99Y\x8b\
-S\xbb\xcb\xf2T\xefX\x22\xcc\xbb)A\x00\x80\xd0\xa9\
-B\xdf\xde\x94p\x82\xdb\xca$\xc0\x05\xd8\xeaE\xabB\
-\x22(K\x91\x00\x22\xbc7\xd1\x01\xbb\xde\xc4\x00\xbe\x13\
-=\xb0A\x0a\x16_\x98\xc2\x06\x02K\x94@\xc9\xe8\xfe\
-\xea\xe03\x7f\x91'\x10T\x03\x85\x1bn\xca\x1b7\xd0\
-\xdcX\x1ds\xb5r]\x0bou\x80\xce\x80\xe9{\x94\
-\x04,\xfbx\xc0\x02I\xa7\x15\xf4L\x07\x180\xeef\
-\x004\x10,O\x05\xec\xac\x1b\x04W\xaf\xb4\xa7\xd1\xa9\
-\x01\xc0\xc0\x02\xb2r\xe4\x00\x04\x0cL\x9d\xddH\x05\xb8\
-\xd6\xb5A\x07\xf4\xd5W\xcf\x14\x0e\x00\xf6T\x01\x01\x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00 \x00r\x00d\
-\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\
-\x5c\xc8\xb0\xe13g\x0e#J\x9cH\xb1\x22Cg\x18\
-3Z\xdc\xc8\xb1\xe3\xc6\x8c !z\x1cI\xb2\xa4\xc0\
-\x90!M\xaa\x5c9\x11eJ\x960c\x16t\x89R\
-\xa6M\x984_\xde\xdcY2'H\x9e@=\xfa\xfc\
-\x19\xb4h\xc5\xa1\x1a\x8d*\x8d\x88T\xe4\xd2\xa7\x0b\x9b\
-B\x9d\x9aP*\xd5\xab\x04\x91b\xdd\xfaP+\xd7\xab\
-V\xbfN\xf5*v,H\x01\x18\x10<\xf3\xc0\xc0i\
-\xd9\xa5 \x1b\x18\x0c\xf0\xd6,]\x83j\xeb>\xc5\x98\
-@\xafXg}\xfd~]\x90p\x80`\xa5\x0c\x12B\
-8\xcc\x15\x81[\xc6S\x13\x1bd\xe0\x81\x82\x07\x11\x90\
-MJ>H\xb8 \x84f\xa0A#0\x9cy\xa4\x03\
-\x84\xcd\x00\x10\x1c\x10\xba5\x02\x01\xa5=.FX\x80\
-\xe0\xe7\xd6\xa1\xe5\xc6\xde\xf9\x00wh\x03\xbba\x06\x16\
-\xe8\xfbwp\x8e\xc0\x17\x06\x00=\xb0\xf5\xe6\xe3\x14k\
-#\x84\xfd\xacA3\x83\xa0\xa9C\xa7H\xfa\xa0\xe4\xd9\
-\x06\x0fl\xff\x8f9\xbc`\xf9\xf1\x12# \x94 \x90\
-\x00B\xf0\xe8\xe3\xcb\x17xw\xbe\xc3\xfa\x07\xf1\xdb7\
-\xda}\xffG\x85\x8f\xf9GQ\x80\x02\x96\xa4\xddA\x04\
-\x168R\x82\x0av\xc4`\x83\x0a\xe9WP\x7f\x10\xde\
-'a\x85\x0b\xe9\x86\x90j\x08=\x87\xe1B\xe2}(\
-\xd1y\x06\x9dv\x10|\x22\xbaw\xa2\x88#i\xc8\xa2\
-r\x09]\xf8\xa2D\x07\xce\xc8\xd1u6\x1a\xa4\xa2A\
-$n(\x22\x85\xb6\x11\xe4bA\xd2a8dE\xec\
-}\xf8@U\x0e\xe1\x98\xa3@I:\x94\x1c\x84(\x0a\
-\xf9dE52Td\x81\x1e\x12\xd4\xe33[\x16\xb4\
-\xe3\x8ca\x0e\x04@\x88\x07\x95\x89\xe1\x01\x0cVI\x10\
-\x87,vV\xd1\x94\xf6\xa99\x10\x90\x05\xc9yeD\
-Y\xee\xc9\x90\x9b\x03\x1dY\xa0\x9e\x0a\xc1ye\x9f\x15\
-Q\x10\x1f\x06\x0a\x11\x1a\x15\x84\x82\xcad'c]\x8e\
-D\xe7Ax\x1e6@^~R\xe5$\x86\x93:\x14\
-\xe9j\x8c\xc9\x18\xe4M\x08\x98\xbaU\xa8\x02}Y\x91\
-z\x0b\x81\xb9\xb0\x9d\x89%\xa1\x99\x10\xa3b\x09\xa0(\
-\x88\x99n\xd4+Ac^\x05\x02\xa7\x0a\xfd\x8a!\x00\
-\xbbR\xfa\x94j\xc4Ne\xabX\x174\x9b\x90\x03\xc6\
-\x924\x00\xad\x0d\xa5\xb0\x933\x98E\x04+P\xae\x22\
-t\x01\xa2#m\x10lY\x80*\xf4\x80\xac$\xa9\xb6\
-\xa4D\xcd\x8cz\x13\xab\x09\xa9X\xedA\x16\x5c\x90l\
-z\xf7\x1e\x06\x82\x05\x02\x0d\x00\x91H\x16`\x86\xc1\xb9\
-\x115s)T\xf2^E\xadX\x8ev\xaa\x90\x00Q\
-Ru\x80\x01\x86J\x8c\x1d\xc6\x99\x0d\xb0\xc0\xb3<-\
-@\xae`\x05\x84kR\xc5\xdb\x09\xd0\x00\xca%9\xd0\
-\xc0\xc8\xc7A\x04\xc1\xb7\x1cI\xd0@\xbf\xe8u\x07r\
-A\xa0\x85X\xa9\x8d5\x06\xa0\xaaR\x01\x01\x00!\xf9\
-\x04\x05\x02\x00\xcf\x00,\x12\x001\x00r\x00S\x00\x00\
-\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\
-\xb0\xa1Bg\x10#:\x9cH\xb1\xa2\xc5\x8b\x08#j\
-t\x86\xb1\xa3\xc7\x8f\x177n\x04I\xb2\xa4I\x81\x22\
-5*\x1c\xe0\x01\x01\x02\x0f\x01N\xca\x9c\xf9,\xa5D\
-\x84\x03\x104\xdb\xb9\x93\x02\x00\x9a@?\xda\xbcip\
-\x01\xcf\xa3\x1e\x82*\x0d9\x94\xa3A\x01G\xa3.\x9d\
-:\xb1\xa9\xd3\x82\x0d\xa2\x1e\x1d@\xb5\xebB\xab\x06%\
-h\xe5\xe9\xb5l\xc6\xa6\x05\x014+\xc83\x81\xd9\xb7\
-\x05\xc1\x0edpp\xa7\x01\xb8xk\xa2\x1d\xb8\x00a\
-\xb3\x98y\xdf\xca\x15H\xc0o`\xbc{\x9f\xfdD\xe8\
-\xf6\xb0\xe0\xa1\x0d\xef:6+W\xf2A\xc0\x93\xbd\xca\
-\x95`83e\xc8\xcf\x1ex\xce\xacq\x80\x05\x0b7\
-\xd7\x1e\xb4<\x9a*D\x10\x08\x06\x22\xb8p\xb5\xb5c\
-g\x0d\x0e\xe6\xe6\x8a0\xb7m\xd7\xb1\x0d\x16\xfe};\
-\xe1b\x84\x98\x89\xc3Mn\x90\xb9\xf2\xb2\xce\x09F\x7f\
-Nu\xba@\xde\xd4\xb3k\xdf\xce]\xa9\xf5\xee2\x05\
-(\xff\xa4\x0b\xbed\x01\x8c\xac\xcb\xd3T\x9d\x90\xb3z\
-\x90\x100\x8a~\xff\xb1\xb1A\xfb\x9d\xe9w\x0cn0\
-\xfeB\xf1\xfa]\x04\xe0A\xe7=C^\x80\xd5\x094\
-\xa0A\xe9!h\xd2\x01\x08\x0d\xe7 H\x11\x10\xe4\xde\
-A\xd8M\xd8Q_\x03\x15x\x10\x87\x1a\x96\xb4`A\
-\xfc\x85HR\x85\x08yh\xe2G\xbe\x1dt\xe1\x8a\x13\
-\xa9\xa8`B\xcd\x1c\x07\xa3@\x00\x94\xd8\x10~X\xdd\
-H\x90\x8c\x16\xfa\xe8\x91\x84\x06\x1d\x18\x97\x03B*\x04\
-\xe4@H&\xd4`\x92\x03\x11Y\xd0\x93Pz4b\
-\x95\x0c\xe9H\x10\x88X\x82t\xe5j\xe3ui\x92\x8d\
-bv\x94\x14\x94\xfe9D&\x83e\xb6i\x91\x91\x13\
-\xa5y\x90\x96\x1a\xbeH\x11\x00M\x96\xb9\xe6D\xdf\xdd\
-\x08\xa7Er\x06\x98\xa1Rv\xd2G'M{\x82w\
-\x81Y\x83v\x07\xc0\x99n\xbe\x19)F\x90j'\xc2\
-\xa4\x1d\x11p\xa9Y\x22H\x99\x10\x84\xb6iJU\xa2\
-\x0a}\x99\x19\x02\x1b(\x85\xc1\xa1\x08I@jP\x5c\
-N~t\x81\x05\x22\x82@\x81ETR\xf5\xa7C/\
-\x81\x10\xd23\x1b\xccW\x91\x03}N\x05@\xa1\x14\xc5\
-v\xc1\x05\xbe>3 \x80)<S\xe9E\x10\xbcZ\
-\xd6\xae\xad\x15\x8b\xe9\x94\xd6\x06\x16k`\xecQ'\xc0\
-\xb7o-`*q\x02\x18\x90\xa7W\x0e\x18\xd0-q\
-\xce`KS\x02\xf2\x96W\xc0\x02\xeb\x9a\xc4\xa3\x89\x03\
-4 \x01\xa8\x1d\x1d\xb0@\x01\xefN\x18\x80\x01\x9c%\
-\x00pB\x11 \x8b\xa9S\x0cX\x16@\xc1T\x05\x04\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x000\x00r\x00\
-T\x00\x00\x08\xff\x00\x9f\x09\x1c(p\xc0\x86\x0b)\x08\
-*\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9c\xf8\xd0C\xb3\x8b\
-\xcd\x1e\x04\xa0\xc8\xb1\xa3\xc7\x8f \x9f5\xc0Hrc\
-\xc8\x93(SJ\x14@\x92$\x01\x950c\xc24\xd0\
-\x92\xa4\xcc\x9b8;\x12\xa8\x891\xa7\xcf\x9f\x0c\x0b4\
-S\x88Q\x02\xd0\xa3@)0\xbcX\x00\xa9\xd3\xa7\xcf\
-\x9a\x01\x80J\xf5\xa7\xd1\xaaX?>p\xc8 \xabW\
-\x95\x07\xbe\x8a\x8d\xd8\xb4\xe1\x82\xb1h\x1b^M\xcb6\
-\x22\x82\x86\x0e\xda\xca\x15\xe0\x10\x82\xdc\xb6]\x1b\x9a\xbc\
-\xcb\x97 \xdd\xbec\x13\x00\x1e\xfc\x96a\x84\xc1P\x9d\
-)\x9e\xb8\x16\xf1O\xc5\x90\x17;\x16\x1b\xb9\xf2\xb3\xbd\
-\x0b\xcbN\xceY9\xf2f\xaf\x9d=;\x9c\xfa\xf9f\
-h\xd1\x0d\x9d\x956}ZrC\xd2\xaba\xb6v\xcd\
-\x10sl\x94\xb3U;\xb4};d\xee\x87\xbc{\x7f\
-\xfc-\x1ch\xee\x01\x0e\x0d\x14\xc7\xdd\xfa\x99\xee\xe58\
-gCT\x0e\x1d\xa4\xf4g\x82\x196\xae\xce\xf1\xfa\xf6\
-\x81\x85\xb9w\xff\xbcN\xbd\xb6\xf8\xee\xd7\x83\x0b,\x7f\
->\x22q\xd8\x0b\xb3\xb7w\x7f\xa10\x05\x11\x90\x09\x1e\
-^:_b\x83\x85\x14\xd0vVCy\xf5\xf7Zx\
-\x04\x19\xf0\x1cDv\x19\xd8\xd1\x03\x0b\xc2\xa7\xd0V\x0e\
-r\x14\x97B\xdf\x0d\xf4W\x85 i\xb6P\x83\x1c\xae\
-\xe7\xd0\x7f\x14!X\xe1\x82)y\x18\xe2\x8aN\xa9\xc8\
-\xe2IaY\xf7bL.\x8a\xc7\x9eL/\xcd\x08\x13\
-\x88\xe7y\xe0P\x8c\x11\x0d\xa8W{\x052t\xa3C\
-,9\x94\xa3x&\x12t\x80\x84!a \x9e\x8f\xc9\
-u\x04$C$.w$A\x17rT$C_\xce\
-\xa7\x1eD\x19\xb2\xc8\xa3\x95:\x0a\xd4\xe5Ga\xa6\xf9\
-\x91\x90,n\xe9\x91|\x5cM\xd6&\x861\xad\xd9\xd0\
-\x05\x88\x81\x10\xd1~TQ\xc9\x97\x94\x80!p\xa7W\
-\x01,9\x98\xa0cmP\x1a\x02|\x82&\x82\x9b\xf3\
-\x01:\x11\x94i!\x07U\x99\x0e\x11\xea\x93\xa3\x1c\xd1\
-\x09\x95\x9c\x0f\xdd\xb7!J\x16l@!Gp~\xf6\
-\xc0\x06\x16\xa0o(\xd1\x00 X\xf4\xd1\x01\x87Bu\
-\xe6\x83>\xa6`\xc13\x02\xe86\xc0\xaf\x17\x5c\xb0\x81\
-R'q\x8aU\x00z\xde\x85+_\x06\x5cI\xa9G\
-\x00\x90\x9a\xd5\x02\xa7N\xab-P\xd9\xc6\xa6\xecM5\
-\x0a\xd7@\x04C\xdd\xe4\xc0\x02\x0c`Z\x1d\x00\x05,\
-p@\xb9 \x1d A\x03\xc1\xbe8@^\xe4\xc2\xcb\
-\xd0\x01\x09$pV\x00\xb2\xba\x09@\x00&\x19\x90W\
-~l\x05\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-,\x00o\x00X\x00\x00\x08\xff\x00\x9f\x09\x1cHP\x84\
-\x07\x0a\x18\x04\x10\x5c\xc8\xb0\xa1\xc3\x87\x10#J\x9cH\
-\x91!\x86f\x181\x16\xa8\xc8\xb1\xa3\xc7\x8f\x1e\x0bd\
-\x1ci\x00\xa4\xc9\x93(+\x02@02#\x02\x85)\
-c\xcaL\x09\xa1\xe5\xc8\x003s\xea\xac(\xa0\x19\xc1\
-\x96\x03v\x0a\x1d\xcapAC\x8c\x0e\x88*]\xca\x10\
-c\x03\xa6Pe\x1aux\x00@\xd4\xab&W>,\
-\x89\xb5\xeb\xcc\xaa^\xc3R|\xf0p\xaa\xd8\xb3\x0e\x83\
->\x84\x89\xb6-A\x08e\xdd\xca\x1dH\xe0\xa1\xda\xb9\
-m\xd92L\x80W\xeeS\x87\x1b\xfb\xb6\xe5\xebP\xaf\
-\xe0\xb0>\x0f\x1f\xbe\xcbP\x82\xe2\xb3\x81\x1b\xfe}\xec\
-\x15nZ\xca}\x0f`\xee\xebx\xf3\x5c\xae\x9e\xddF\
-\x0e\x8d\x16'\xe9\xd3\xa8\x85\x9aN\x1dv5\xeb\xae\xae\
-_\xcb\x9eM{q\xed\xdb\xb2\x0d\x13\x9c\x8c[\xa9\xe5\
-\xde1\x936$\x0c\x9c(\x82\xe21\xcd.lf\x15\
-\xf9I\xde\xce\xa3B\x8f\xce\xd1\xd9\xc3\xdf\xd4\x1d:\xdb\
-\xce\x9d \xf1\x85u\xb3k\xff\xe7N~ \xf6\x85\xba\
-\xc5\x93_o=\xe2t\xf5\xec\xbb\x8b\xf7\x18_\xfe\xfc\
-\x8a\xf5\xedC\x04=?\xffv\x8a\xed\xf5\xe7\x1fA\x11\
-\xdc\x07\x91\x7f\x01JD\xc1}\x08.\x04\x80f\x0e\xc5\
-\x86\x5c\x83\x0c\x9dG\x10Y\xd9Qh\xa0D\x08&\xe8\
-\xdd\x81\xceu\xf8\x90\x84\x02\x0e\xf8Pg\x06:3\xc0\
-\x05\x22\x08\x10\xdf\x86\x1cb0\x10\x02\x17\xb0'\x91r\
-\xd9-\xb8\x10\x06\xe5I\x94\x1eA\xa3\xc9&cC\x05\
-\xe8\x07\xd1{\xc0\x0d\xd9\x90\x04\xffU\xf4]q\x06$\
-6\x9c\x87>F'\x12D\x0bP\x09\xe3@W>\x04\
-\xd6\x96\x0eI\x09\xd8I\x05F\x14\xa4b \x88\xd9\x10\
-\x8e\x1f\x95\x09\xd1\x06\x94\x01\xe0\x81D\x09h)\x14\x86\
-\x82\x0d\x80\xe7C\x114\x07&\x97\xc7=F\xc1\x8f]\
-)\xb9\x99\x9f]\x01p\x01j\x08\x80\x90\xe8\x05\x81\xba\
-E\xe8Cv\xea\x04)G\x88\x12\xc5&D\x04,J\
-\x94\xa7\x15mJ\x14\x92\x10=\xe0\xa8L)<\x13\x1e\
-G\x1625\x80p\x1e]e\x90B\xa6\x13M*^\
-x\xa7Z\x00\x93\x05\x02\xa5*\xa3\x9a\xac\x0d\xe0\xe6c\
-g\x8aUi[\xcd\xb4*\x17\x84r=)\x18\x00\x06\
-0+\x96\x04$\x1ef\x95\xb4Q\x1d *f\x00\x14\
-;T\x04\x0d\xd0\x8a\x9a\xb825\x03\xae\xad\xa9\x09\xd0\
-\x80\x04\xb0\x82d.\x04\x0c\x90\x0b\x1c\x00\xd5\x1eU\xa0\
-\x01\x1b\xc9\xcb\xa030\x05`\x1a\xbaQ\x05\x04\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00(\x00g\x00\x5c\x00\
-\x00\x08\xff\x00\x9f\x09\x1cHp`\x8a\x0b\x22\x00\x14\x5c\
-\xc8\xb0\xa1\xc3\x87\x10#J\x9c(\x10\xc0\x83f\x18\x11\
-\x14\xa0\xc8\xb1\xa3\xc7\x8f\x0f-b\x1c\xd9l\x03\xc8\x93\
-(S6\x84@\x92d\x00\x950cv\x1c\xd0\x92\xa4\
-\x04\x998s6|P\x90$\x04\x9d@u\x1a`8\
-rc\xd0\xa3*\x054#\xda\xcc\x01\xd2\xa7(\x178\
-l\xc6\x00\xaaU\x9c\x09\xaejUy@\xc0\xd6\xaf`\
-\xc3Zu\xe0L\xacY\x81K\x1b\x1a=\x1b\xb6\x81C\
-\xb2l\xc5\x12p\xb86\xee\xd6\x97\x0d\xe1\xda\xfd*\xb5\
-\xa1\xdb\xbd\x80\x15\x02\xd6:\xc0a\xdf\xc1q\xab\x22\x8e\
-[v\xf1\xd9\x9b\x8e\xa1\xe2e\xf87\xb2\xd8\xc2\x96\x91\
-\x0em\xd88\xf3\xd7\xac\x9e\x8f\xceex8\xb4\xe9\xd3\
-\x1f'\xa3\x8e\x89y\xb5\xeb\xd7\x1e[\xc3\x0e\xday6\
-\xd0\xda\xb6s\x0a\xce\xcd\xfb\xb4\xea\xde\xc0\xcf\xee^X\
-7\xb8\xca\xcd\xc69\x82^X:9\xca\xe5\xce%\x22\
-/\x88\x00w\xf4\x8f^\xaf\xa3,\xae\xbd\xbbV\x9e\xde\
-\xc3\xeb\xffT,\x9ecv\x86\xd0\xcb\x13\x8c\xe0p\xb8\
-z\x81\x95\x17\xc6\x7f\x0fq4}\x89\xe4\xef\xcf\xbf?\
-\x95\x7f\xc4\xe6\x04Q\xe0\xdf3\xb2-\x94\xdf\x80\x08v\
-4\x1d}\xe9\x85\xe7\xcc\x83\xd6\x11T\xa0w\x10B\x98\
-\xa0@\x15Vx\xd2~\xafe\x98\xe1I\xdc\xad\xe6\xe1\
-\x87 \xa5\x05\xdb\x88$\xd2\x87b\x8a\xea\xad\xc8\x22\x88\
-\xa7\xb9\xa8\xa1D\x0d\xf6d\x9a\x8c\x16\xe2\x84\x81{\x80\
-\xe1\x98#E<6t^\x8f>>x\x94\x08\x83\x05\
-\xe0\x01\x02\x0f\x5c #T\x13\x82%\x80\x80\x04a\xb0\
-\xa2U%\x9d\xb5\x81\x89\x04A0\xa2J\x00\xb07\x11\
-\x92[9\x03\xc2C\x08\x00\xf0\xe2IAB\xd4fN\
-\x22\xd8\xe7P\x033\xc6\xe4\xccO\x14!\x80A\x940\
-\x0d\x80\x01E\x06\xfc\x88S\x01\x07xD&L\x00\x9c\
-\xd9\x91\x00\x11\xe2$fG\x04` \x02\x9f\x0f\x15\x86\
-\x01x\x1d-\xd0hN\x0bv\x84\x00\x05\x1b\x5c\x80\xd0\
-3\x16\x0c`\x81@\x22\x5c\xf0\x8c\xaa)y\xa9\x95\x00\
-5\x02W\x96\xc0oW1\xe0\x14b\x0e\x14\xb0\xe9U\
-\x5c\x9eu\x80\x01on%\xc0\x02\xbd\x82\xb5@\xb0b\
-5p\xebV\x0et:\x983\xb4\x1e\xb5\x00\x03\xbb\x0e\
-&\x80\xb38!k\x19\xb4\x06\xc4J\xd1\x01\x09`k\
-\x9b3\x034\x00A\x02\x09<\xcaP\x04YI5@\
-\xb5\xc9\x19)\xd0\xbb\xf0\xea\x14\x10\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,\x12\x00%\x00[\x00_\x00\x00\x08\xff\x00\
-\x9f\x09\x1cH\xb0\xa0\x08\x0f\x146\x00(\xc8\xb0\xa1\xc3\
-\x87\x10#J\x9cH\x10C\xb3\x8b\xcd\x10\x04\xa0\xc8\xb1\
-\xa3\xc7\x8f\x03-b\xbc\x88`\x00\xc8\x93(Q\x16\x18\
-9\xf2A\xca\x970#\x0e@0\x90e3\x931s\
-\xeal8r\xe1\xce\x9f'18\xbc\xe8\x00\xa8Q\x8f\
-\x1b\x876Kz\xb4iD\x02\x0f\x9b-pJ\xf5d\
-\x84\xaaX;\x1e\x10\x90\xb5\xeb3\x0a^\xc3:d\xda\
-P\x82X\xac`\x1f\xfa<\xdb\x94,\xdb\xb7\x0d\xaf\xc2\
-=\xca\xf5\xa1\xdb\xb9:!<L\x80W\xec\xdd\xbeN\
-\xe5\x02\xceZ`\xf0O\x9a\x86\x13+^\xcc\xd8l\xc3\
-\x03\x8cc\x22\x8eL\xb9\xb2\xe5\xcb\x98\x07:\xce\x1c\x93\
-oY\xce\xa0\x0d\x17\x0e=\xd1\x19\xe9\xd3\x8c\xff\xa2\xa6\
-\xa8z\xb5\xeb\xa38_\xcb\x9e\x1d\xd64m\x8a\xb6\x1b\
-2\xb8\xcd\x1b\xa4\xe0\xde\xc0\x83\x8b]+\x9c\xe1n\xe0\
-\xc4\x8b\x17\xfc\xad|\xe0T\x87\xc9i\x8fn8\xbd\xb9\
-f\xe1E\xad\x13\xd4\xeb\xb0\xfa\xed\xd8\x0c]\x06\xd5\xcf\
-\xde\xb0\xb5k\x03\xda\x09\xd6M/psz\xf3\xec\x09\
-F\x8f\x7f\x9b\xb9u\xf3\x93\xd9{@N\xbf?E\xef\
-\xb2\xcd\xd7\x1c|\xcf\x10\x18\x1az\x105\xe3\xdf\x82\xbd\
-\xd9\xd7\x10x\xaf\xad\x17\x11\x08\x869c\xa1\x85Ny\
- ![\x17v\x98\x9bG\x0e2\x84\xc0\x05oyh\
-\x22p&\xa6x\x92g\x15\xa6\xe8\x22J\xcf\xf5\xe5\xe2\
-\x8c\x1f~t\x5cG\x14\x80\x00!J\xce\x0c@\xe3\x8c\
-/m\xf8\x91\x90\x12Y\xc0\x10\x06\x00\xfc\xd8aL5\
-\x06\xf5L\x0aF\x0a\x84S\x0a\x02m\x00\x11\x06Jb\
-\xa8S\x00\xe4\xb1\xe5\xe3\x8fF5\x00\x19[\x06\xd0\x18\
-\x5c\x02@\x9e\xa9\xa2W\x02 \x98U\x99K\xbeuc\
-`I6\x09W\x03,\xeet\xc0\x02IV\x16\xa2r\
-\x00\x04P\x00z\x11(\xf8\xd0\x98z\x11\xb9\x1aS\x01\
-\x08\xf8R@\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\
-\x22\x00L\x00b\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xe0\
-@\x11\x186\x040\xc8\xb0\xa1\xc3\x87\x10#2\x14\xf0\
-\xa0\x99\xc5f\x1b$j\xdc\xc8\xf1!\x00\x02\x17/B\
-\xe8H\xb2dD\x00\x15C^d`\xb2\xa5K\x81\x14\
-\x08\xaa\x5c\xf0\xb2f\xcd\x90\x09l\xea\x8c\xd8\xa0\xe1E\
-\x03;\x83\xfat\xd8\xcc\x01\x00\xa1H\x07\x12x\xd8l\
-@\xd2\xa7L\x0b@\x15\xca\xf2\xa1\xd4\xa9;\x01 \xc0\
-\xcau\xe0H\x879\xbb\x8a\x1dK\xb6,\xc9\xaa\x0d\xbf\
-\x9a]\xcb\xb6\xe4\xd5\xb6;\xc3\xc2\x9dK\xb7\xae\xdd\xba\
-N\x1b:\xb8\xabQ-_\x93K\x19\x1ep\xf6\xb70\
-T\xa0\x86\x13+V,\xc0!\xe2\xc5\x1b\x17B\x9e\xdc\
-\x92&\xc3\x08\x945\xca\xcd\xfc,0\xe7\x92\x8f?7\
-D\x9b9\xaf\xe8\xd3\xa8\xbbJN]p5\xeb\xd7\xb0\
-c\xcb\x9e\xad\xf1@Z\xda\xa8\xfd\x12\xf4\xcc9tA\
-\xc2\xb3]Sn\xdc\xd07e\xdb\x0c7g\x96@\xbb\
-\xe7h\xda\x96q\x7f\x8e\x1e[\xb8\xf4\xeb\xd8O+\xcf\
-.}+m\xdd\x93\xb7s\xc0\x17\x0d\x9e\xe0\x03\xdc\xe5\
-\x15\x93\x8e\xcd|\xbc\xcc\xb7\x93M\xfb\x94\x0f\xd9\xf9l\
-\xea\x0d1\xe0>O\xdb\xfbd\x00\x98A\xd4\x0c|\x8a\
-\x01\xb0\x17m\x07\xba\xc7\xd0\x05G\xe1\x06\x9cl\x04\x80\
-@\x9ca\x0d4\xd3\xd1\x03\x19\xed\xf4`M\x03$\xc8\
-\xd1V)l\xa8\x913$\x96X\xa2M\x00\xe0\xd7Q\
-3\x0fP\x80\xc1\x05\x17\x08\x04\x80\x894\xd6x\xa2N\
-\xeb\xd9\x84\xc0\x063\xda\xe8cV\x06X\x18\xd4\x03>\
-\xfe\x18\x94\x00\xe2\xb9T@\x915&\x15@\x92\xa01\
-I#T\x03, \xa4K\x09Hi\x22V\x024\xe0\
-!I\x06hy#W\x03@\xf0\xa5F\x0d\x88)b\
-W\x02\x14\xb0\xc0\x99z\x89IWc\x06\x8c\x84\x5cA\
-\x12\x08`dicJ\x14\x10\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,\x12\x00\x1f\x00=\x00e\x00\x00\x08\xff\x00\x9f\
-\x09\x1cH\xb0\xa0\xc1g\x03\x0e*\x5c\xc8\xb0\xa1C\x00\
-\x1b\x9a5C\xb0\xc1\xa1\xc5\x8b\x18\x01<\x90\xc8\xd1\x03\
-\xc6\x8f \x09j\xe4H\xd2@\xc8\x93\x16\x01\x14$\xd9\
-L%\xca\x97\x07\x1f\x18$\x19\x00\xa6\xcd\x81\x04\x14r\
-Lx\x13\xa6L\x9d\xcd\x0e\xf4\x1cz0(O\xa2H\
-\x9f5+\x90\x14$\x83\x86K\x9b\x82D\xd0\x90\xa9T\
-\x8c\x1e\x19\xd6\xbc\xca\xb5\xebA\x01\x0d!x\xb5\xb8\x80\
-\xa1\x84\xb1\x0e\xb7*t\xe0\x12-J\xb5n\x0f\xc2\x8d\
-\x0b\xf2\xe7A\x07tQ>\xcd{\xf0,\xdf\xbf]M\
-\x02\x1e\xdct.\xe1\xc3\x5c\xdb\x12\x06\x8b\xb8a\x83\x85\
-V\x1b\xebTL8\xe7\xc1\x04\x92)K.hxs\
-J\xcf\x07\x85\x82\x1eM\x103\xe9\xd3!#\x1ff\x8c\
-\xba\xb5\xeb\xd7\xb0c\xcb&\xd8Yv\xed\xd9\x8d\x05\xb7\
-\xf6\xdb\xd8\xb4A\xbb\xb8\x01\xef\x0d.\xf0\xb1k\xde\x88\
-}\x13\xdf|\x948\xd5\xe5\x7f\x87\x1b\xb4\x0c\xbd\xbau\
-\x9b\xc8\x0b\x02G\xad\xfa:\xe1\xac\x88\xb3\x17\xaa\x94>\
-\x98u\xeb\xb2\xaf\xf1.\xc4\xd0\xf8v\xf1\xc6b\xd3{\
-\xef\xfe\x97>\xe9\xf8\x0c\xed\xd3u\xa6\x5c!\xfb\xd7\xdb\
-\x9d\xf6\x1ca\x11\x5c\xa4Y\x5c\x00\x14\xe8\xdd@\x228\
-\x03\x98\x82\xad\x01\x80\x9fE\x08`\xd0\x9c[\x0c\x88\x86\
-\x11\x01 \x987\x96\x00\x10~\x84\x01\x00\x0e\xa2\xe5\xcc\
-\x84\x18=@\xa23,\xb6\xd8ba'\x19\xe0\xe2\x8c\
-.\x22\xe5L\x03\x1aZ\x94\x00\x8d<6\x05\x80\x019\
-2\xb4\x00\x8f=6%\x00z\x0d\xc9H\xe4\x8c\x5c\x09\
-`\x80z\x0a\x09\xb0$\x93]9\x13\x00\x92\x04A0\
-%\x95c\x01P\x00\x84Jn\xf9\xe2~b\xd2HX\
-\x99,\x926\xa6@\x01\x01\x00!\xf9\x04\x05\x02\x00\xcf\
-\x00,\x12\x00\x1d\x00/\x00d\x00\x00\x08\xff\x00\x9f\x09\
-\x1cH\xb0\xa0\xc1\x81\x16R\x1c\x5c\xc8\xb0!C\x11\x08\
-\x9aI,\xe0\xb0\xa2E\x82\x18$jlF\xf1\xa2\xc7\
-\x85\x1e\x04n\x94(\xe0\xa3I\x86\x1b%\x9c\xfc8\x00\
-\xc1A\x8d\x0fV^l\x89\xb2Y\x04\x99\x15\x05\xb8\xac\
-\xd9\x11'\xc3\x98\x0d\x9b-\xf0\xc9\x10@E\xa1D\x19\
-Rp\xd8\xacA\xd2\x85\x06\x1c\x1ex*\xf3\xc0\x00\xaa\
-\x06K6\xb4\x8a\xd5\xe0\xd2\x86\x0c\xba\x16t*\xd6\xa3\
-\xd1\x86Q\xcb\x0e\x0c\xa9\xb6\xad[\x83W\xdf\xcau\xf8\
-u\xae\xdd\xbbx\xdd\x92\xcd\xcb\x97a\xdc\x837\xfb\x0e\
-\xdc\xeb\x16\xa8\xc1fs\xcf\x1eT)\xb7\xa7\xc1\xb0r\
-\x87\x0av\x18x2\x84\xc9\x02!\xbfu\xdc7-\xe6\
-\xcf\x04\x16J\xfeLZ\xae\xb3\xd2\xa8S\x0f<\x8dY\
-\xab\xea\xd7\xb0W\x06\x88-\x90\xb0[\xc4\xb4?'\xc8\
-\xdd\xd56\xdf\xbf\xbc\x05#`\xfd\xd6\xb3\xe0\xd9\x0b\x19\
-O\xc6-\xf72f\xe0\xb05\xbbu\x1e\xfc\xedh\x83\
-\xa1\xe5\xba>\xe8\xbb\xbaw\x93\x9c\xd5N\x82e\xb8]\
-\xad\xf1\xbe\xc4'K?\x88\x814u\xb5\xce*O\x1e\
-?\xb9{\xde\xeb\x0b/X\xafX\xb7\xac3\xfc\x07!\
-\x80\x9c\x7f\xca\xa1\xa4\xdfg\xfdM6@z|! \
-\x00\x83T\x15\xc8\xd0\x02\xceT(\x963\xf6\x11\x94@\
-\x85\x1cB\xe8\xd3\x00\x0e4Da\x87\x1dR\x05\x80\x84\
-\x04-H\x22\x89Tu7\xe2\x8a,>\x05]\x040\
-\xc2\xd8U\x01\x12HP\x00\x005\xaexa\x8f5\xc2\
-\x07d\x8cB\x0e\xe9\xe1\x8fA\xdee\xe33\x01\x01\x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x1b\x00#\x00a\
-\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0A\x83\x03\x00\x1c\
-\x5c\xc8\xd0 \x80\x0b\x08\x9a5\xf3\xa0\xb0\xa1\xc5\x82\x03\
-\x1eH\xdc\xf8\xa0\xe2E\x8b\x05\x08nl\xb6\xe0\xa3I\
-\x91\x1b\x05\x9c<\xf8`\xe1\xc6\x00+\x09\xaad\xb81\
-d\xcc\x8f\x12\x0fx\xbc\xd9P\xa2\xcd\x95\x03>\x1e\x80\
-y\x13\xc1\xc5\x083y*\xbd\xd8\x12\xa4R\x0cK\xa3\
-J\x9d*\xf5@P\xa5\x06\xa8.L\xba\xf0'\xcf\x92\
-\x0c\xc1*\xbd\xaa\xb5\xec\xd4\xacf\x0b:\x8bJ6\xad\
-@\xb1nw\xba\x9dK\xb0\xe9A\x06R\xb9\x16t0\
-\xb5\x01C\xaft\xa3\xea%\x98`*\xde\x85~\xa5B\
-`8\xf8fa\xbak\x037\x04\xcc\x13\xed\xc1\xc6\x92\
-3\xdf\xb4\xab9\xad\x5c\x82\x87\xa3\x12\xedL\xbat\xe0\
-\xc8\x90%\xb75}ru\xe9\xd1\xacW\xf2=\x087\
-\xb6m\x83\x94\x07\xba\xbe\x09{n\xb3\x85\x8f\xe9\xfe\xee\
-\xab:\xf3\x01\xc9\xb5\x09&\xbe=5w\xcc\xe5\x06\x09\
-L\xfdL\xd09\xf3\xd8\xc9e\xe6mHaj\xf6\x81\
-\xa1\xaf_\x5c\x8fP|rf\xeb\x1f\xa9c\x94\x8c@\
-\xbdI\xf4\xcf$\xa0v\x8b\xc0\xd9\xfc\x9b\xe4\x19\xda\xb7\
-\xaf\x14@~\x83\xf2\xedw\xdfI\x00\xccF\xd0\x01\x02\
-\x08\xc8\x1fO\xab\x0d\xa5\xa0\x80JA\xe0\xc0\x01\x12$\
-\xf8 \x847]\xa8\xe1\x821mx\xe1R\x1eb\xa8\
-T\x88\x1c\x8e\x18\x22U\x1b\x96\xf5aZ\x0a\x0a\x14\x10\
-\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x1a\x00#\x00\
-Z\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x22(\
-P\x00!\xe0\xa0\xc3\x87\x04\x03\x10hF\xb1\xd9\x03\x00\
-\x103\x12t\xb6\xa1\x99\xc0\x8a\x165\x8a4\x08\xb2\xc0\
-H\x87 <\x92\xa4(\xe1\xa4\xcbg\x14\x13\xbc<I\
-q\xc1\xcc\x01\x0846;\xd0p\xa6\xce\x03\x03|\x8a\
-\x94\x80Qh\xc6\x067E\xca\xf4I\xc0\xa8F\x0aN\
-\xa3>\x0b\xea\xd3\xa4\xd4\xabX\xb1\x22\x85\x18\xc0h\xd1\
-\x87[\xb3\x8a\x85\x18al\xc1\xaef\x05BH;\xf0\
-\xabY\xb4l\xa5\xe6dk\x95-\xd4\xb8x!\x1a\x90\
-\xda\xd2aO\xa3\xce\x1e\xf6\xcdK\xd8\xe8\x03\x87\x0e\x0a\
-\xb3e \xb5n\xda\xb5\x8a\xcd6=\x089\xf2\xcc\xc0\
-\x0e\xe1Z\xc6J\x95-\xe6\xcd\xa0Cg\xfc\x9c\xf6\xaf\
-Q\xcdf\xdd\x16d,Zj\xe5\xd6\x1a_[F\xed\
-\xb3\xf3\xe6\xc1lU\xfb\xdc\xeb\xd01l\x88\x89\xe3\xca\
-&\xc8\x9b\xed\xdc\xdf\x19}\x9b=\x80w8A\xddb\
-\x8b\xe7\xc6+]\xa8s\x81\x04H\xfb\x84>\xd0\x99\xf6\
-\xac\x09\xbc\xb35\x0d\xe0\xfd\xfbK\x00\xcc\x07\x02-/\
-\xde\xe9\x00\x08\x0e\x22\x18\x00\xc0\xbe\xbc\xd3\xfa\xf8\xed\x03\
-\xce\x8f\xff>\x7f\xf6Q\xfd\xa7\x9f\x7f\xffI%\xa0y\
-\x97\x15x\x15\x7fb\xf5\x97Q@\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,\x12\x00\x18\x00&\x00S\x00\x00\x08\xff\x00\
-\x9f\x09\x1cH\xb0\xa0\xc1\x83\x04\x07 \x5c\xc8\xf0 \x00\
-\x0c\x08\x9a!\xc0\x00\xa0\xa1\xc5\x83\x0c\x226\xdb\xd8\x0c\
-\xc3\xc5\x8f\xcf\x00x \xc8\xb1Y\x03\x90\x0dE 0\
-\xc8\x91\x00J\x84\x02(,\xe4\xa8\xf0e\xc1\x9537\
-\x0a\xb0\x89r\xa3\x03\x9e=\x0f\x04\xe0\x09\xe0\xc1\xc5f\
-\x11j\xbe,z\x14BE\x9bL-&\x05\x1a\x95a\
-3\x03@AN\xcdj\xb4!\xd6\xac\xcf<\x82\xbd\xc8\
-\xa0a\xb3\x02c\x05\xe0Dxv\xac3\x993\xd1\x8e\
-\xfd\xba\xb0\xec\xd8\xa1\x0c\xed\x8eu\xb9\x10\xc2X\x81t\
-\x0fFx\x0a\x16\xc0Z\x96J\xc1\x066x\xf2\xaf\xe1\
-\x85\x12\xfe\x0a\x94{\xf0\x80\xe4g\xce\xf8\x1e\x5c\x9c\x95\
-\xb2\xc1\x03\x84\xc1f^\xc8\xf92A\xd0\x97##,\
-\xcd\xd3\xd9\xcc\xd0`\xf5\x1a\x5c`\x9a\xb6\xe9\x85\x9a\x0b\
-\xfe\xbc\x9c\xb8\xa0\xdf\xcb\x8d1\x9aN\x80\xd0\xf2e\xd8\
-\x04UK\x96]\xd0\xf3\xdc\xdb\xa4\x11F\xb8\xad\x1cz\
-A\xe2\x07\xab\xff\xcdm\xdd\x22\xeb\xd6\xddQ\xe2\x92\x0d\
-?p'\xf9\xf3\x0e\xd1\x0b\x1c\xff\xd7\xfcA\xf6n\x17\
-\xc2\x17\x1d\xfd\xb2\xb3\xdd\x06\xbf\xf3\xc4\x8e\x9e\xffu\xea\
-\x08\x1d\xf6Wp\x06\xf5\x06\x96\x81\x03\x11\xe8\x96q\x06\
-i7\x96\x83\x02\x098\x96\x82\x04\xcd\x97\x15\x82\x80\x99\
-v\x1fB\xfe\xfde\xdbA\xae]\xe6\x1cA\xc8e\xe5\
-\x9eA!^\xf6!A\x108\x93b{\x0c\x0a\xb4\x80\
-\x8b/\xba%\xc0\x02\x0eD\xb0@\x004\xba\xa8a\x8f\
-@\xfa(Y\x90A\xfeH$\x8d\xf6\x1d\x89d\x92J\
-\x1ay\xe4mJ\xd6\xf8W\x93P\x12\xd9]\x91Y\x05\
-\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,\x12\x00\x17\x00(\
-\x00J\x00\x00\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x05\
-\x01X\x18\x80\xb0\xa1C\x84\x0004\x9bH\x80\xc1\xc3\
-\x8b\x08\x9d]\x108q\x22\x02\x01\x18C\x0e$P\xb0\
-#\x05\x91\x17\x05\x9c<\xd8\x11$\xca\x83\x0064k\
-\xd8\xb1\xc1K\x83\x03H>\x9cX\xe0&A\x8b\x18\x9b\
-\x1dp\xe9sc\xd0f=}>\xc3\x10\xb2Y\x04\x86\
->\x89^<`S\xe9\x00\x04!\x17(\x15(\x00\xeb\
-\xc5\x04[Q\x1e\x00\xba\xd5\xd9\x03\x8cR}:c\xfa\
-P\x02\x80\xb0\x02!\x5c4\x00W`\xd2\x86\x07\xea\x0a\
-\x0c0\x13/\xd4\xbag\x1d\x06\xd0{\x11)\xe1\xae\x0e\
-\xe9\xeau\xb6\x12\xa1V\xc2d\x0f&pF\xf8\xe1\xd0\
-\xcar+;\x14\xd0\xf7`\x04\xcd\x8aY\xfe\xd5\xeb\xf5\
-`f\xcd\x08\x1d\xa0\x0e|\xf0\xae\xde\xc1\xa9)\xa3\x9e\
-}0-\xed\x81\xa1o\x13\x04\x8bp\xb4\xde\xce\x05y\
-W\x86}\xb0j\xe5\xdc\x05m\xdfV\xadY\xf6\xc1\xc7\
-\xc3uK\xbf\x08\xbd s\xcd\xc2\xa7;<\xad\xbd\xbb\
-\xf7\xe9\xbe\xbf\x17R\x0c/^7q\xc2\xe4o;/\
-_02\xfb\xba\x9f\xdf\xcbG\xae\x97;A\xfau\xdd\
-\x0f\x0c\xb0~qv\x81\x0b8\xd3\x9f^\x00@\xc0\x9c\
-\x04\x05\x088`]\x0a6\xa8\xe0l\x0eF\x88Z\x84\
-\x0eBH\xa1\x80\x16^\x98\xa1\x86\xcd]\xb8 \x83\x1c\
-NH\xa1n\x12j\x16\x10\x00!\xf9\x04\x05\x02\x00\xcf\
-\x00,\x12\x00\x16\x00*\x00A\x00\x00\x08\xff\x00\x9f\x09\
-\x1cH\xb0\xa0\xc1\x83\x08-\x0c@\xc8\xb0\xa1\xc3\x0b\x08\
-\x9a5#P\xc0\xa1\xc5\x87\x08\x04J\x94\x18\xe0\xa2\xc7\
-\x81\x00\x0en$\x10\xf2\xa3C\x00\x10\x11nd`\xb2\
-\xe1\x00\x02\x0e%\x1ahy\xd0\xd9\x85\x8b2i\x16\x14\
-\xf0\xc0\xa3D\x96:\x05V\xf4\xd9lA\xd0g\x00<\
-\x98t\x004hO\x8f\x07\x0c\x94\xd49\xf5\xa2\xd4\xa3\
-H\x9f:\x8c\x8aU \x00\xad\x0d%T\x0d\xba\xf0b\
-\x83\xae^aZ,\x8bV\xa9C\x08\xce\xd0\x0a\x9c\xe9\
-p\xa8\xdc\x8e\x0d\x9b\xc9\x1d( #\xc3fv\xd1\x8e\
-5x 0Z\x08\x0e\xf1\xee\x1d\xa0\x97\xe1\xd9\xbd\x17\
-%@\x16\xda0\xc2\xe0\xaej\x11\xb2\xddK\x17\xa1\xe1\
-\xc9\x07\x13\x80~f\x94\xa1\x00\xd0\x00\x1a\x1f\xec\x0c\x99\
-u\xc1\x03\xa3\x9fe\x8em\xb0)m\x93\x9fo?\x83\
-=\xfa\xb1\xee\xdf\xc0!\xe7\x0eN\xbc\xb8\xf1\xe3\xc4]\
-\x03\x97\x8c\xfc \xf3\xe6\xd0\xa3wUL|s\xc1\xcb\
-h\xe3\x1e\xe4=\xdaY\xe9\x82pc;0\x13\x10\xa1\
-\xa0e\xed\xdd\x9d\x150\x90\xc0@\x01g\xf0i\xc3\x9f\
-O\x1f=\xe8\xfa\xf5\xe5\xe3\x9f\xaf\x7f\xbf\xfd\xc9\xfe\xc5\
-'^\x80\xfd\xedw\x9b\x7f\xba\x19H[@\x00!\xf9\
-\x04\x05\x02\x00\xcf\x00,\x12\x00\x16\x00,\x008\x00\x00\
-\x08\xff\x00\x9f\x09\x1cH\xb0\xa0\xc1\x83\x08Exh\xd6\
-\x0c\x01\x03\x84\x10#B\x04A@ C\x86\x0f%j\
-D(`\xc3A\x86\x157\x8a\x1c\x88\xa1\x19\xc2\x8b\x19\
-GFt\x06B#C\x03*%>\xd8\xc8\x10B\xcc\
-\x83\x00<\x8ad\xd8\xe0f\xc1\x01!wF\xf0I\xd4\
-\x22\x04\x00E\x9d\xe9\x14y\x00\x82\x80\xa2\x02)\x8ct\
-\x00u\xe0\x80\xa9\x05\x9cUUiR\xeb\xd6\x91\x09\x9e\
-~E\xba1\xe5\xd7\x99\x1a\xc5~}\x866\xe2\x02\xb2\
-kmJ\xec\xb9V\xa0\xd9\x83\x07\x02\xd4\xdd\x1b\xd3+\
-D\x93|7\x16\x08\xac7\xe2\xe0\xc0A\x0f.\x08\xfc\
-\x8c.\xe3\x88\x08\x1eKf,a2\xc2\x03\x963O\
-\xd5\xcc\xb9\xb3\xe7\xcf\xa0EV\xe6(9rh\x84\x8e\
-\x03\xcb=x\xf5q\xdb\xd3\x9d\xd5zn\x8dS\xb23\
-\xaa\x06G?v\x16\x00s\xc1\xc2\xbb\x9d\x0dX\xe0\xdb\
-\x01\x03\xbf\x8c\x9d)W.\x00\xc0\xf2\xc9\xcb\xa3?\xb7\
--=:\xf5\xea\xd3\x93c\xcf\xae\x1d\xbb\xe5\xed\xc8\xbb\
-W\x05\xd7,=s@\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,\x13\x00\x15\x00-\x001\x00\x00\x08\xff\x00\x9d\x09\x1c\
-H\xb0\xa0\xc1\x83\x08\x9d\x09P\xe4e\xc2*\x00\x09#\
-J<(\xc3\x0b\x87\x8b\x17\x1f\x09\x98\xc8\x11\xa1\x80W\
-\x9f0\x8a\xe40\xa1\xa3I\x81\x02\x9c\x8c\x5c\xc9a\xc0\
-\xc9\x89\x00^\xb1d)\xe2e\xc2\x98\x8ff\xb2\xbc`\
-\xf3\xa0\x85\x90:i\xf6,(3(K\x0d\x1b\x87:\
-\x1b\x80\xc9(KG.\x95*r\xba\xb2RM\xa5\xce\
-TR\xbd\xa8aCT\xa5\x00,n\xb5\x8au \x80\
-\xa6T\x1d]-\xbb\x14\xa8Q\xb5l\xcd\xe6t\xca3\
-\xae\xc0\xb3N+}\x8d\x8b\xd7h]\xbb\x02\xd1\xea\xd4\
-\xb0\x16\xb0\xd6\xc1{\xed\x8a0Z))\xe0\xa5sg\
-V\x82\xf8\xd8Y\xdf\x99\x8e(W\xde\x10TCb\xbb\
-\x16:\x7f\xb6\xebVhe\x81 \x82b8}7\xf2\
-\xca\xcc\xac\x9dq\xd69:\xae\x80\xa0\x1bb;\xc30\
-Xse\x00\xaeG\x82\xd0}A\xa7#\xdd\xceJ\x8f\
-L\xa1{1f\xe4\x1et\x16>\x1d\x1c\xa3\x06\xdf\xa7\
-u\xe6F\xdek\xa6\xe3\xd8\x03X\xae\x1bF.\xd0B\
-w\x8c\x93\xc9\x13\x1cp\xe1\xc2t\xf5\xf0\xe3\xcb\x9fO\
-\xbf\xbe\xfd\xfb\xa7\x03\x02\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,\x16\x00\x14\x00,\x00*\x00\x00\x08\xff\x00\x9d\x09\x1c\
-H\xb0\xa0\xc1\x83\x08\x9d\x01\xf0\xe3\x07@\xc2\x87\x10\x0f\
-\x02\x00\xf4\xe3\x83\xc5?}\x22jD8\xb1\xa2\xc5\x8f\
-\x16el\x1c\xe9\xac\x89\xac? S~\x18E2b\
-\x9b_*c~h\xd2\x12a\x13T2e\xb6\xa9Y\
-\x10\x80\xac\x9c9w\xf2\x14\xc8\x0a%P\x99\x0ey\xde\
-<\x9as\xd3P\x19F\x99\xa6\x5c$\xb4\xa5O\xa9)\
-m\xf5\xa1\xc9\x13\xc0(\xac\x16KQ\xe2:4\xccW\
-\xac\xa5\x9c\x0e\x1d\x18&\xeaQ[U\xd7:k\xe36\
-\xe7\x1e\xb5r\x05\xb6\x95J)i^g{\x8f\x96\x0a\
-\xf3w`\x93\xba1\xb3\xf8\xfd\xeb\x95)\xde\xc2\xce<\
-\xda\x15\x09Y`\x9f\xa3{\x08W\x06\x8cYse\x00\
-\xc3\x80f\xde,\xd0\x94h\xcf\x95\xdb\x1c}\x5c\xf9\xac\
-LJ\xa4-\x03]\x14\xbb$\xe2\x8f{\x16W\xa6\x04\
-\x94r\xec\xd02\xb3\xd4\x16h\x97l\xecR\xaf\x87\x0b\
-T\xad\xd2\x96\xf2\x812\xf6\x80\xcc\xfd\xdc0\xa5E\xa5\
-\x90\x19\xaf\xce\xbd\xbb\xf7\xef\xe0\xc3\x8b\x03'\x1d\x10\x00\
-!\xf9\x04\x05\x02\x00\xcf\x00,\x19\x00\x14\x00*\x00#\
-\x00\x00\x08\xe7\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x07CU\
-\xc1\x15L\x12\xc2\x87\x10\x13\xc6!\xa0\xa1b\xc58\x11\
-3\x1e\x9c2\xd1\xa2\xc7\x8a14j\xbcR%\xc2\xc7\
-\x93\x1aj\x89\x84\x08$\x0e\xca\x97\x04V\x1e\x04r\x87\
-\xe2\xcb\x972\x0bJ2y\xf3%\x98\x9c\x02c\xf0\xec\
-\xf9rHN \xb8\x88\xf6\xac\x90sJ,\xa5(\xc1\
-l\xb9\x92\x93\x8aM\xa8\x15\x1dl\x99\x02\xd4\xd9\x1d\xac\
-Y+P\xe9\xea\x0cH0\xb0`Z\x91\x15x\xe5)\
-T\x07\x9a\xd6\x0a\x9cr\x95\xe8\x10 r\xcb\xba%Z\
-\x81j^ {o:\x08\x99W\xa0K\xa2\xa7\xb8\x16\
-vv\xb8g-\xbc\x8b[)5\xba\xd8\x99\xe4\x9e\x0e\
-\xc6V\xa6KTq\xe5\xa4=\xd5Vv6\x85h\xdc\
-\xd1\xceb,E=\xf7\xa6J\xd6\x02\x85\xa1<\x05\x19\
-6\x90S\x1fi\xc3&\x08d\x88Ea\xb5w\x13\x8c\
-\x11\x5c\xb8\xf1\xe3\xc8\x93+\xdf\x1d\x10\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,\x1c\x00\x14\x00)\x00\x1e\x00\x00\x08\xcd\
-\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x04\xdd\x5c\xa0S\xa2\xc4\
-\x98\x06\x08#J\x1cHF\x19\xac1\x0d36\xbc4\
-\xb1#\xc1#\xc44\x8a\xccH\xc6\xa3D2\x0d0\x8e\
-\x5c\x89\xc6\xe4A\x94*W\xae\xe4\xe8r\xe0\x1aX2\
-sn\xac)\xb0\x81\xce\x9f-]\xbaa\xf83'\x9e\
-\x92&}\x16\x95\xd9h\x15\xd2\x8eC\x97\x8el\x8a\xe6\
-iG\xa5R\x1b\xe21\xe0\x86\xa73\x9cY\x1b]Z\
-\xe3U \xd8\xa5>.Y\xadI&$\xda\xa0e\x9d\
-\x91!\xfa\xb3\x91\x91\xb8\x14\xe9\xea\xfcA\x16\xaf\xdc\x98\
-9\xed\xfa\x1dh\xaa(\xdf\xc1\x02\xdd\x14]\x85x \
-\x9a\x9f\x06\x1a\x0fT\x9c\x13\xaedgxdZ\xbe\xbc\
-\xa6\x91\xc8F\xb9.\x1b\x5c\x93YkW\xd1\x07\x13]\
-\xca\xb5\x16\xb5\xeb\xd7\xb0c\xcb\x9e]0 \x00!\xf9\
-\x04\x05\x02\x00\xcf\x00, \x00\x13\x00&\x00\x1a\x00\x00\
-\x08\xbc\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x04=\xa5\xf0$\
-\x06\xa1\xc3\x87\x03=\xf1qb\xa2\xa2\x09\x1f\x0c j\
-\x14(\x06\x10E\x8b +\x06\xda\xe8\xb0\x86\x8d\x90(\
-+V!YP\x0c\x1fT)c\xfa`\xc9\x91T\xcc\
-\x9b\x15Yv\xe1\x83\xb3'I@>z\xe2\x9c\xa5\xb1\
-\x13L\xa17\x17\x8d|x\x07i\xd2!]\x1e\x8aI\
-\xe54\xe4\xa2*\x0c\x1aB$\x11\xb4\xaa\x89T\x9b\xb4\
-nlZUT\x95\xa5,?\x22]\xc4 *Mg\
-C\x9c\xb2};\xb0\x0bRQ\x19\xdc\xd2u\xd6I\xe8\
-,\xb1{\x9d\xd9\xbd)*c\xe0\x82Ub\xa6B{\
-\xb8\xae(\x94U\xf46&\xd8\x85jEQ$&;\
-\xecB\x22C[\xcd\xa0C\x8b\x1eMzo@\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,$\x00\x13\x00$\x00\x16\x00\
-\x00\x08\xa6\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83p\xd0\xdc\xba\
-\x85&\xc8\xc1\x87\x10\x9d\x05\x89\xd1gV\x87\x8b\x18\x7f\
-8\x8c\x181\x88\x9d-\x18C\x86\xdc\xc2\xf1\xa0G\x90\
-\x22Sb\xdcXR\xe2-:*c^l\xd1\x12\x09\
--\x982e\xd2\xecH+\xa7\xcf\x0e;\x1f\xa2\xc1\xf9\
-3f\x16\x88-\x9c\x14\xcdI\x07\x8e\xc9>Kc\xd2\
-\xd9b\x07\x89I\xa5Q1bPd\xc7iD\x22Y\
-;`\xf8b\xb5\xa5\xb3\xa8t^\x945+\xb0h\x16\
-;,\xd9\x0a\xcc\x92\xf3\xad\xdc\x83v\xa4\xbe\xb8\x0b\x11\
-\xacHfk\xf9\x1e\xf4\xdb!\x8b\x1f\xc1%\x91\xd8\x09\
-\x8a\xb8\xb1\xe3\xc7\x90\x11\x07\x04\x00!\xf9\x04\x05\x02\x00\
-\xcf\x00,)\x00\x13\x00 \x00\x13\x00\x00\x08\x94\x00\x9d\
-\x09\x1cH\xb0\xa0A\x817H\x18!EJ\xd1\x8d\x83\
-\x10\x0b\x96\xa9\xa3h\xc3\x89\x8b\x18/N\x8axP\x8b\
-\x1aR\x19Cb\xccT\x86\xe3@\x12 E\xaa\xbcX\
-\x87\xa3\x16#\x99V\xca<!\x09\xa2\x16E3s\xd6\
-,x3\xa7O\x19\x05\xeb\xc4\xf4\x99\xb3\xe4\xc0:D\
-sf\xd2S\xf0WR\x95\x10T\xb54\xf8\x14c\x15\
-I7\x8cBL\x0aA\xc6C\x93\x03A\xe4$\xf2\x15\
-,A=CCf\x02\xa1\xc5,\xc4I!MI\xd2\
-\xea\xf6\xe0\x0d\x10\xa6\x88l\xac\xcb\xb7\xaf\xdf\xbf\x80M\
-\x06\x04\x00!\xf9\x04\x05\x02\x00\xcf\x00,-\x00\x13\x00\
-\x1d\x00\x10\x00\x00\x08\x83\x00\x9d\x09\x1cH\xb0 \xc1$\
-Qd\xb0Z\x11\xe7\x8e\x19\x83\x10\x07&i!\xe3N\
-\x1c\x15\x183bd\x15\xb1`\x0bV\x1aC\x86\xbc\xd2\
-\xf1\xca\x8b\x8b\x22SbLa\xf0\x8c\x8c\x15*cb\
-\x1cRP\x06J\x991i\x0eL\x81\xb3'K\x81I\
-z\xf6<30\x90\xd0\x98+H\x0e<sT\xa3\x01\
-#f\x94\x16\x84\x89\xf3\xa9\x99@\x1d\x07\xb6@*\x89\
-hV\x83FB\xc61\x82\xf5k\xc4$\x85\x0c\xc4\xe9\
-S\xc8\xac\xdb\xb7p\xe3\x1a\x0c\x08\x00!\xf9\x04\x05\x02\
-\x00\xcf\x00,0\x00\x13\x00\x1b\x00\x0e\x00\x00\x08u\x00\
-\x9d\x09\x1cH\xb0\xa0\xb3An\xccXi\xb0b\x05\x17\
-3#\x0cJt\xa3\x86a\xc3\x8b\x18\xd9H\x148b\
-\x89\x15]\x18C\x86tc\xd0\x17\x1b\x91(C\x9a)\
-\xf8%\xa5\xcb\x8b\x9a\x08\xbayI3\xe6\xc0\x964]\
-\xc6 (\x22gJ]\x11\x07\x9a\xf1)\xb2\xc1\xa0\x82\
-:\x886\x10a\xc6\x8d\x8e\x8d\x9aR\xd2\xfa\xe2t\xa3\
-\xc1\x11Q/60s\xd4\xaaW_f<=\xf5J\
-\xb6\xac\xd5\x80\x00!\xf9\x04\x05\x02\x00\xcf\x00,4\x00\
-\x13\x00\x18\x00\x0d\x00\x00\x08k\x00\x9d\x09\x1cHP\xe0\
-\x8e%\xa08qr\xc1P\x11(&\x05\x072aA\
-b!\xc3\x8b\x18]$\x8b\xb8\xc3b\xc6\x8f\x17\xb5\x10\
-\xbc\x01\xb2\xe4\xc5B\x03\x81\x98\x5c\x89R \xc9\x95%\
-[:{\x09\xf3\xe3\x8d\x81;j~dS\x90\x8d\xce\
-\x8b\xa1 \x12\xf4d\x12\x04\xa7P\x85n\xec\x888\x90\
-\x04F6\xa1n\x00aJ\xd5\x19\x90\x1d;\x84V\xdd\
-\xca5b@\x00!\xf9\x04\x05\x02\x00\xcf\x00,7\x00\
-\x12\x00\x16\x00\x0d\x00\x00\x08c\x00\x9d\x09\x1cH\xb0\xa0\
-3cE\x0c*D\xb2\xab\x8e\x1d;/\x22\xbe@\xd4\
-Ba\x90\x16)$j\xdcX\x91 \x9c\x8d 7&\
-\x14\x18$\xa4\xc9\x88H\x06~<\x19\xb2\xa3\xb3\x16,\
-C\xa6\x14\xd8$&\xc8 \x03K\xda\x94\xe8\xa7\xe0\xa4\
-\x9d\x80\x5c\x0e,\xf2e# ;-Z\xc0A\x82S\
-\xa1@8I\x9b4uJ\xb5*\xc1\x80\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,:\x00\x12\x00\x14\x00\x0c\x00\x00\x08\
-V\x00\x9d\x09\x1cHp`\x12(X\x0a\x16\x04\x12\xe5\
-F!32\x22F4\x93C\xe1\x19\x88\x123f<\
-C\xf0\x8c\xc6\x8f\x12\x03\x10\xe4\x05\xb2$\xc1\x00%A\
-&\x14X(\xe5\xc7\x91.3\x9a!\xb8#\xa6\xc4\x8a\
-'c\x06\xe0X\x10\xcb\x0d\x88f\x0a\xdd\x88\x92\xe3\x0c\
-O\x85H\x93\x0a\x0c\x08\x00!\xf9\x04\x05\x02\x00\xcf\x00\
-,=\x00\x12\x00\x11\x00\x0b\x00\x00\x08P\x00\x9d\x09\x1c\
-H\x10\x06\x10 \x04\x09\x96\xb92\xa5S\x8c\x87\x10\xa7\
-\xc0 8\x08\xa2E\x8b\x9dP\x08\x84q\xb1\xe3\xc3A\
-\x02\xafx\xec('\xe4\xc8\x8bSL\x9e\x84\xb8K`\
-\x9e\x95\x10A:C\x91\x08f\xc6\x81PjzL$\
-Gc\xc1+@\xaf@98q`@\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,?\x00\x12\x00\x10\x00\x0b\x00\x00\x08\
-M\x00\x9d\x09\x1c(\x10F\x992X\x08\x12\x84\xa2\xe7\
-\x86\xc3\x87\xae\xa0(l\xf8\xb0\xa2C-\x03\x01X\xdc\
-\xe8j \xc5\x8d\x15a\x08\xfc\x08\xd2a\x19\x81bJ\
-\x86\x14\xa8Q\xe5\x8d\x8e\x02\x95\xb8r)q \x0c9\
- Y\x90Q(\xb0\x0c\x80\x83eD\x12\x0c\x08\x00!\
-\xf9\x04\x05\x02\x00\xcf\x00,A\x00\x12\x00\x0e\x00\x0b\x00\
-\x00\x08H\x00\x9d\x09\x1c\x88\x85\x89\xc1\x81\x08\xb1h\xd9\
-\xc1\xb0\xa1\x16\x14\x03\x994\x9c\xc8p\xd0\xc0A\x14)\
-v\x11\x98\x91\x22\x00g4:N\xd4\xc2Q$\xc3\x8f\
-\xce\x90\x98\xdcQF\xa0D\x91\x16\x07\x96\x11CQ\x0c\
-\x00\x1a\x08\x05\xa20\xc8\x04\xe7\xc0\x80\x00!\xf9\x04\x05\
-\x02\x00\xcf\x00,B\x00\x12\x00\x0d\x00\x0b\x00\x00\x08D\
-\x00\x9d\x09\x1c\xa8\x04\x05\x8a\x10\x03\x07\xd2\xe8\xa2\xa3a\
-C X\x14\x02pHQ\x07\x0a\x81e*R\xec\x22\
-\x90\xa1F\x87\x02\xc9|\x04\xe9\xcc\xe3H\x81IF\xea\
-\x08\x220\xc4\xc4\x8fJ\x14\x9al\x18$fB\x81\x05\
-i$\x0c\x08\x00!\xf9\x04\x05\x02\x00\xcf\x00,D\x00\
-\x12\x00\x0c\x00\x0b\x00\x00\x08?\x00\x9d\x09\x14H\x83F\
-\x88\x81\x03C\x14\x81\xc1\x10\x06\x13\x14\x09\x994\x9c\x08\
-\xd1\x19\x96\x89\x18\x05.\xc4\xd8\x90\x863\x89\x1c\x19z\
-\xdc\x18\xd2#\x8a\x90\x0e\x07\x82\xc4X\xd1Y\x88\x8b\x0d\
-\x8b(A\x98\xf0 \xc2\x80\x00!\xf9\x04\x05\x02\x00\xcf\
-\x00,E\x00\x12\x00\x0b\x00\x0b\x00\x00\x08/\x00\x9d\x09\
-\x14\x18b\xa0\xc1\x104\x12&,HP\xa1C\x1a\x02\
-\x1f:\x8c(q!\xc2\x8a4\x0ab\xcc\xe8lcC\
-\x89\x0c\x9d]T\x18\xd2\xa0Ig\x01\x01\x00!\xf9\x04\
-\x05\x02\x00\xcf\x00,E\x00\x12\x00\x0b\x00\x0a\x00\x00\x08\
-\x14\x00\x9d\x09\x1cH\xb0\xa0\xc1\x83\x08\x13*\x5c\xc8\xb0\
-\xa1\xc3\x82\x01\x01\x00;\
-\x00\x00\x00\x00\
-\
-\x00\x00\x01\xbb\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a}\x0d\x0a\x0d\x0aQSplitte\
-r {\x0d\x0a    border:\
- none;\x0d\x0a}\x0d\x0a\x0d\x0aQFr\
-ame {\x0d\x0a    borde\
-r: none;\x0d\x0a}\x0d\x0a\x0d\x0aQ\
-Frame > #leftFra\
-me {\x0d\x0a    backgr\
-ound: rgba(245, \
-247, 248, 0.667)\
-;\x0d\x0a    border: n\
-one;\x0d\x0a    border\
--bottom-left-rad\
-ius: 8px;\x0d\x0a    b\
-order-bottom-rig\
-ht-radius: 8px;\x0d\
-\x0a}\x0d\x0a\x0d\x0aQFrame > #\
-rightFrame {\x0d\x0a  \
-  background: rg\
-ba(255, 255, 255\
-, 0.767);\x0d\x0a    b\
-order: none;\x0d\x0a  \
-  border-bottom-\
-left-radius: 8px\
-;\x0d\x0a    border-bo\
-ttom-right-radiu\
-s: 8px;\x0d\x0a}\
-\x00\x00\x00%\
-Q\
-ScrollArea {\x0d\x0a  \
-  border: none;\x0d\
-\x0a}\x0d\x0a\
-\x00\x00\x00%\
-Q\
-ScrollArea {\x0d\x0a  \
-  border: none;\x0d\
-\x0a}\x0d\x0a\
-\x00\x00\x00%\
-Q\
-ScrollArea {\x0d\x0a  \
-  border: none;\x0d\
-\x0a}\x0d\x0a\
-\x00\x00\x00%\
-Q\
-ScrollArea {\x0d\x0a  \
-  border: none;\x0d\
-\x0a}\x0d\x0a\
-\x00\x00\x00\xa9\
-G\
-enerateCodeDialo\
-g {\x0d\x0a    backgro\
-und-color: white\
-;\x0d\x0a}\x0d\x0a\x0d\x0aTreeView\
- {\x0d\x0a    border: \
-1px solid rgb(14\
-4, 144, 142);\x0d\x0a \
-   border-radius\
-: 10px;\x0d\x0a    bac\
-kground-color: w\
-hite;\x0d\x0a}\
-\x00\x00\x02(\
-Q\
-ScrollArea {\x0d\x0a  \
-  border: none;\x0d\
-\x0a}\x0d\x0a\x0d\x0a\x0d\x0aQLabel {\
-\x0d\x0a    font: 14px\
- 'Segoe UI', 'Mi\
-crosoft YaHei', \
-'PingFang SC';\x0d\x0a\
-    color: black\
-;\x0d\x0a    padding: \
-0;\x0d\x0a    border: \
-none;\x0d\x0a    backg\
-round-color: tra\
-nsparent;\x0d\x0a}\x0d\x0a\x0d\x0a\
-QLabel#label_con\
-tent {\x0d\x0a    font\
-: 11px 'Segoe UI\
-', 'Microsoft Ya\
-Hei', 'PingFang \
-SC';\x0d\x0a    color:\
- rgb(96, 96, 96)\
-;\x0d\x0a    padding: \
-0;\x0d\x0a}\x0d\x0a\x0d\x0aRangeSe\
-ttingCard > QLab\
-el#valueLabel{\x0d\x0a\
-    color: rgb(9\
-6, 96, 96);\x0d\x0a}\x0d\x0a\
-\x0d\x0aQLabel:disable\
-d,\x0d\x0aQLabel#label\
-_content:disable\
-d,\x0d\x0aRangeSetting\
-Card>QLabel#valu\
-eLabel:disabled \
-{\x0d\x0a    color: rg\
-ba(0, 0, 0, 0.36\
-);\x0d\x0a}\x0d\x0a\
-\x00\x00\x00'\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a}\x0d\x0a\
-\x00\x00\x00\x00\
-\
-\x00\x00\x02+\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a    backgroun\
-d-color: transpa\
-rent;\x0d\x0a}\x0d\x0a\x0d\x0a#scr\
-ollAreaWidgetCon\
-tents {\x0d\x0a    bac\
-kground-color: t\
-ransparent;\x0d\x0a}\x0d\x0a\
-\x0d\x0aQSplitter {\x0d\x0a \
-   border: none;\
-\x0d\x0a}\x0d\x0a\x0d\x0aQFrame {\x0d\
-\x0a    border: non\
-e;\x0d\x0a}\x0d\x0a\x0d\x0aQFrame \
-> #leftFrame {\x0d\x0a\
-    background: \
-rgba(245, 247, 2\
-48, 0.051);\x0d\x0a   \
- border: none;\x0d\x0a\
-    border-botto\
-m-left-radius: 8\
-px;\x0d\x0a    border-\
-bottom-right-rad\
-ius: 8px;\x0d\x0a}\x0d\x0a\x0d\x0a\
-QFrame > #rightF\
-rame {\x0d\x0a    back\
-ground: rgba(255\
-, 255, 255, 0.15\
-1);\x0d\x0a    border:\
- none;\x0d\x0a    bord\
-er-bottom-left-r\
-adius: 8px;\x0d\x0a   \
- border-bottom-r\
-ight-radius: 8px\
-;\x0d\x0a}\x0d\x0a\x0d\x0a\x0d\x0a\
-\x00\x00\x00\x8f\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a    backgroun\
-d-color: transpa\
-rent;\x0d\x0a}\x0d\x0a\x0d\x0a#scr\
-ollAreaWidgetCon\
-tents {\x0d\x0a    bac\
-kground-color: t\
-ransparent;\x0d\x0a}\
-\x00\x00\x00'\
-Q\
-ScrollArea {\x0d\x0a  \
-  border: none;\x0d\
-\x0a}\x0d\x0a\x0d\x0a\
-\x00\x00\x00\x8f\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a    backgroun\
-d-color: transpa\
-rent;\x0d\x0a}\x0d\x0a\x0d\x0a#scr\
-ollAreaWidgetCon\
-tents {\x0d\x0a    bac\
-kground-color: t\
-ransparent;\x0d\x0a}\
-\x00\x00\x00\x8f\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a    backgroun\
-d-color: transpa\
-rent;\x0d\x0a}\x0d\x0a\x0d\x0a#scr\
-ollAreaWidgetCon\
-tents {\x0d\x0a    bac\
-kground-color: t\
-ransparent;\x0d\x0a}\
-\x00\x00\x00\xbc\
-G\
-enerateCodeDialo\
-g {\x0d\x0a    backgro\
-und-color: rgb(4\
-3, 43, 43);\x0d\x0a}\x0d\x0a\
-\x0d\x0aTreeView {\x0d\x0a  \
-  border: 1px so\
-lid rgb(58, 58, \
-58);\x0d\x0a    border\
--radius: 10px;\x0d\x0a\
-    background-c\
-olor: rgb(43, 43\
-, 43);\x0d\x0a}\x0d\x0a\
-\x00\x00\x00\x8f\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a    backgroun\
-d-color: transpa\
-rent;\x0d\x0a}\x0d\x0a\x0d\x0a#scr\
-ollAreaWidgetCon\
-tents {\x0d\x0a    bac\
-kground-color: t\
-ransparent;\x0d\x0a}\
-\x00\x00\x00\x8f\
-\x0d\
-\x0aQScrollArea {\x0d\x0a\
-    border: none\
-;\x0d\x0a    backgroun\
-d-color: transpa\
-rent;\x0d\x0a}\x0d\x0a\x0d\x0a#scr\
-ollAreaWidgetCon\
-tents {\x0d\x0a    bac\
-kground-color: t\
-ransparent;\x0d\x0a}\
-"
+_rcc = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resource.rcc")
 
-qt_resource_name = b"\
-\x00\x03\
-\x00\x00x\xa3\
-\x00q\
-\x00s\x00s\
-\x00\x04\
-\x00\x06\xdf\xd3\
-\x00g\
-\x00i\x00f\x00s\
-\x00\x06\
-\x07\x03}\xc3\
-\x00i\
-\x00m\x00a\x00g\x00e\x00s\
-\x00\x04\
-\x00\x075\xdf\
-\x00l\
-\x00o\x00g\x00o\
-\x00\x08\
-\x05\xe2Y'\
-\x00l\
-\x00o\x00g\x00o\x00.\x00p\x00n\x00g\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x09\
-\x0a\xcb\xb7\xc7\
-\x00i\
-\x00n\x00d\x00e\x00x\x00.\x00p\x00n\x00g\
-\x00\x04\
-\x00\x06\xa8\x8b\
-\x00d\
-\x00a\x00r\x00k\
-\x00\x05\
-\x00r\xfd\xf4\
-\x00l\
-\x00i\x00g\x00h\x00t\
-\x00\x0c\
-\x09<\x02\xa7\
-\x00d\
-\x00o\x00c\x00u\x00m\x00e\x00n\x00t\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x09\x9ce\x07\
-\x00d\
-\x00e\x00s\x00i\x00g\x00n\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0e\xc5\xb7\x87\
-\x00o\
-\x00t\x00h\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x03ZZ'\
-\x00l\
-\x00o\x00g\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x07\x9eT\x07\
-\x00p\
-\x00a\x00c\x00k\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0b\xdf,\xc7\
-\x00s\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x0bHv\xc7\
-\x00p\
-\x00r\x00o\x00j\x00e\x00c\x00t\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x068W'\
-\x00h\
-\x00o\x00m\x00e\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x06\xf4\x91\x87\
-\x00c\
-\x00o\x00n\x00s\x00o\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x05wC\x96\
-\x00l\
-\x00o\x00a\x00d\x00.\x00g\x00i\x00f\
-\x00\x0b\
-\x0ck<\xf3\
-\x00s\
-\x00t\x00y\x00l\x00e\x00s\x00h\x00e\x00e\x00t\x00s\
-\x00\x08\
-\x08\x01V\xc3\
-\x00m\
-\x00a\x00i\x00n\x00.\x00q\x00s\x00s\
-\x00\x0b\
-\x0bHt\xa3\
-\x00p\
-\x00r\x00o\x00j\x00e\x00c\x00t\x00.\x00q\x00s\x00s\
-\x00\x08\
-\x07\x9eVc\
-\x00p\
-\x00a\x00c\x00k\x00.\x00q\x00s\x00s\
-\x00\x0b\
-\x06\xf4\x93\xe3\
-\x00c\
-\x00o\x00n\x00s\x00o\x00l\x00e\x00.\x00q\x00s\x00s\
-\x00\x09\
-\x0e\xc5\xb5\xe3\
-\x00o\
-\x00t\x00h\x00e\x00r\x00.\x00q\x00s\x00s\
-\x00\x0c\
-\x09<\x00\xc3\
-\x00d\
-\x00o\x00c\x00u\x00m\x00e\x00n\x00t\x00.\x00q\x00s\x00s\
-\x00\x0c\
-\x05 \xc1\xa3\
-\x00g\
-\x00e\x00n\x00e\x00r\x00a\x00t\x00e\x00.\x00q\x00s\x00s\
-\x00\x0b\
-\x00\xbd\xcf\xc3\
-\x00s\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00.\x00q\x00s\x00s\
-\x00\x0c\
-\x09\x9cgc\
-\x00d\
-\x00e\x00s\x00i\x00g\x00n\x00e\x00r\x00.\x00q\x00s\x00s\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00!\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0c\x00\x02\x00\x00\x00\x01\x00\x00\x00\x1e\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00,\x00\x02\x00\x00\x00\x01\x00\x00\x00\x1c\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x02\x00\x00\x00\x05\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00P\x00\x02\x00\x00\x00\x02\x00\x00\x00\x08\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x01\x00\x00\x00\x07\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00`\x00\x00\x00\x00\x00\x01\x00\x00\xb1\x1c\
-\x00\x00\x01\x91\xdc\x93\xee@\
-\x00\x00\x00x\x00\x02\x00\x00\x00\x09\x00\x00\x00\x13\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x86\x00\x02\x00\x00\x00\x09\x00\x00\x00\x0a\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xea\x00\x00\x00\x00\x00\x01\x00\x01\x1f#\
-\x00\x00\x01\x91\xdc\x93\xeaX\
-\x00\x00\x01N\x00\x00\x00\x00\x00\x01\x00\x01'^\
-\x00\x00\x01\x91\xdc\x93\xeaX\
-\x00\x00\x01d\x00\x00\x00\x00\x00\x01\x00\x01(\x22\
-\x00\x00\x01\x92{@\x98\xe0\
-\x00\x00\x00\xfe\x00\x00\x00\x00\x00\x01\x00\x01 \x9e\
-\x00\x00\x01\x92{=\xfc\xe8\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x01\x1a\x88\
-\x00\x00\x01\x91\xdc\x93\xeaX\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x01\x1c\x17\
-\x00\x00\x01\x91\xdc\x93\xeaX\
-\x00\x00\x012\x00\x00\x00\x00\x00\x01\x00\x01&\x07\
-\x00\x00\x01\x92\x9f&\xad\x08\
-\x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x01!\xe1\
-\x00\x00\x01\x91\xdc\x93\xeaX\
-\x00\x00\x00\xd2\x00\x00\x00\x00\x00\x01\x00\x01\x1d\x81\
-\x00\x00\x01\x91\xdc\x93\xeaX\
-\x00\x00\x00\xea\x00\x00\x00\x00\x00\x01\x00\x01.G\
-\x00\x00\x01\x91\xdc\x93\xe6p\
-\x00\x00\x01N\x00\x00\x00\x00\x00\x01\x00\x016\x81\
-\x00\x00\x01\x91\xdc\x93\xe6p\
-\x00\x00\x01d\x00\x00\x00\x00\x00\x01\x00\x017E\
-\x00\x00\x01\x92{A\x06@\
-\x00\x00\x00\xfe\x00\x00\x00\x00\x00\x01\x00\x01/\xc2\
-\x00\x00\x01\x92{>r\x18\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x01)\xac\
-\x00\x00\x01\x91\xdc\x93\xe6p\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x01+;\
-\x00\x00\x01\x91\xdc\x93\xe6p\
-\x00\x00\x012\x00\x00\x00\x00\x00\x01\x00\x015*\
-\x00\x00\x01\x92\x9f&\xb4\xd8\
-\x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x011\x04\
-\x00\x00\x01\x91\xdc\x93\xe6p\
-\x00\x00\x00\xd2\x00\x00\x00\x00\x00\x01\x00\x01,\xa5\
-\x00\x00\x01\x91\xdc\x93\xe6p\
-\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x01\x00\x00\x00\x1d\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00:\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x924\x18\x9b\xe8\
-\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x01\x00\x00\x00\x1f\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0c\x00\x02\x00\x00\x00\x01\x00\x00\x00 \
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\x80\x00\x00\x00\x00\x00\x01\x00\x018\xcf\
-\x00\x00\x01\x92#As\xa8\
-\x00\x00\x01\x96\x00\x02\x00\x00\x00\x02\x00\x00\x00\x22\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00x\x00\x02\x00\x00\x00\x09\x00\x00\x00-\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x86\x00\x02\x00\x00\x00\x09\x00\x00\x00$\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x02j\x00\x00\x00\x00\x00\x01\x00\x02u\x7f\
-\x00\x00\x01\x924\x0e$8\
-\x00\x00\x02L\x00\x00\x00\x00\x00\x01\x00\x02t\xd2\
-\x00\x00\x01\x92\xac\xceUM\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x02tW\
-\x00\x00\x01\x92\x1a\x9c\xb6\xb8\
-\x00\x00\x01\xe4\x00\x00\x00\x00\x00\x01\x00\x02t.\
-\x00\x00\x01\x91\xe4\xec\xc9h\
-\x00\x00\x01\xb2\x00\x00\x00\x00\x00\x01\x00\x02rk\
-\x00\x00\x01\x91\xe6\xb5\x1d\xb8\
-\x00\x00\x02.\x00\x00\x00\x00\x00\x01\x00\x02t\xa9\
-\x00\x00\x01\x921\xde\xad\x90\
-\x00\x00\x02\x86\x00\x00\x00\x00\x00\x01\x00\x02w\xab\
-\x00\x00\x01\x91\xe6\xec\xf2\xb0\
-\x00\x00\x01\xc8\x00\x00\x00\x00\x00\x01\x00\x02ro\
-\x00\x00\x01\x92q\xb5\x96\xb8\
-\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x02t\x80\
-\x00\x00\x01\x92.\xdf\xbd\xa0\
-\x00\x00\x02j\x00\x00\x00\x00\x00\x01\x00\x02|\xad\
-\x00\x00\x01\x92\x9e\x91F\xf3\
-\x00\x00\x02L\x00\x00\x00\x00\x00\x01\x00\x02{\xed\
-\x00\x00\x01\x92\xac\xceU9\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x02z\x9c\
-\x00\x00\x01\x92\x9e\x843/\
-\x00\x00\x01\xe4\x00\x00\x00\x00\x00\x01\x00\x02z\x09\
-\x00\x00\x01\x92\x9e\x9b\x05\xcb\
-\x00\x00\x01\xb2\x00\x00\x00\x00\x00\x01\x00\x02w\xd6\
-\x00\x00\x01\x91\xe6\xb4\xfa\x90\
-\x00\x00\x02.\x00\x00\x00\x00\x00\x01\x00\x02{Z\
-\x00\x00\x01\x92\x9e\x9b\x05\xba\
-\x00\x00\x02\x86\x00\x00\x00\x00\x00\x01\x00\x02}@\
-\x00\x00\x01\x92\x9e\x9b\xa0d\
-\x00\x00\x01\xc8\x00\x00\x00\x00\x00\x01\x00\x02w\xda\
-\x00\x00\x01\x92\x9e\x9b\x06Q\
-\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x02z\xc7\
-\x00\x00\x01\x92\x9e\x9b\x06C\
-"
 
 def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    # 文件资源由 Qt 内存映射，按需分页读取
+    return QtCore.QResource.registerResource(_rcc)
+
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    return QtCore.QResource.unregisterResource(_rcc)
+
 
 qInitResources()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+import os
+import sys
+
+import pytest
+
+
+# 测试直接导入 common/ui 包(与 main.py 相同，以仓库根目录为导入根)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+FAKE_TOOL = """#!{python}
+# 模拟 pyside6-uic / pyside6-rcc: --version 输出版本，编译时写出标记文件并记录调用
+import os
+import sys
+
+folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+with open(os.path.join(folder, "version.txt"), encoding="utf-8") as f:
+    version = f.read().strip()
+if sys.argv[1:] == ["--version"]:
+    print(f"{{os.path.basename(__file__)}} {{version}}")
+    sys.exit(0)
+args = [arg for arg in sys.argv[1:] if arg != "--binary"]
+source, output = args[0], args[args.index("-o") + 1]
+with open(output, "w", encoding="utf-8") as f:
+    f.write(f"# {{os.path.basename(source)}} {{version}}\\n")
+with open(os.path.join(folder, "calls.log"), "a", encoding="utf-8") as f:
+    f.write(os.path.basename(source) + "\\n")
+"""
+
+
+class FakeInterpreter:
+    """
+    临时目录中的解释器布局: python、scripts/ 下的假 uic/rcc、Lib/site-packages 中的 PySide6 元数据
+    upgrade() 修改工具版本并改变 site-packages，与升级 PySide6 后的效果相同
+    """
+
+    def __init__(self, folder, version="6.7.2"):
+        self.folder = str(folder)
+        self.python = os.path.join(self.folder, "python.exe")
+        self.site = os.path.join(self.folder, "Lib", "site-packages")
+        self.version = None
+        os.makedirs(os.path.join(self.folder, "scripts"))
+        os.makedirs(self.site)
+        with open(self.python, "w") as f:
+            f.write("")
+        for name in ("pyside6-uic.exe", "pyside6-rcc.exe"):
+            path = os.path.join(self.folder, "scripts", name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(FAKE_TOOL.format(python=sys.executable))
+            os.chmod(path, 0o755)
+        self.upgrade(version)
+
+    def upgrade(self, version):
+        if self.version:
+            os.rename(os.path.join(self.site, f"PySide6-{self.version}.dist-info"),
+                      os.path.join(self.site, f"PySide6-{version}.dist-info"))
+        else:
+            os.makedirs(os.path.join(self.site, f"PySide6-{version}.dist-info"))
+        with open(os.path.join(self.site, f"PySide6-{version}.dist-info", "METADATA"), "w") as f:
+            f.write(f"Metadata-Version: 2.1\nName: PySide6\nVersion: {version}\n\n")
+        with open(os.path.join(self.folder, "version.txt"), "w") as f:
+            f.write(version)
+        self.version = version
+
+    def calls(self):
+        """
+        编译过的文件名，读取后清空
+        """
+        path = os.path.join(self.folder, "calls.log")
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as f:
+            calls = sorted(f.read().split())
+        os.remove(path)
+        return calls
+
+
+@pytest.fixture
+def fakeInterpreter(tmp_path, monkeypatch):
+    """
+    假解释器，解释器元数据缓存写到临时目录
+    """
+    if sys.platform == "win32":
+        pytest.skip("fake tools are shebang scripts")
+    pytest.importorskip("PySide6")
+    pytest.importorskip("simplejson")
+    from common.metadata import METADATA
+    monkeypatch.setattr(METADATA, "path", str(tmp_path / "interpreters.json"))
+    monkeypatch.setattr(METADATA, "data", None)
+    return FakeInterpreter(tmp_path / "env")
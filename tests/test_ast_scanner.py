@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+ast 扫描器与正则扫描器在仓库源码上的结果一致(与 python -m ui.eric.AstScanner 的检查相同，不含基准测试)
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from ui.eric.AstScanner import CORPUS_PATHS, corpus, differences, model, scanFile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FILES = list(corpus([os.path.join(ROOT, path) for path in CORPUS_PATHS]))
+
+
+def test_corpus_not_empty():
+    assert len(FILES) > 50
+
+
+@pytest.mark.parametrize("path", FILES, ids=[os.path.relpath(path, ROOT) for path in FILES])
+def test_scanners_agree(path):
+    diffs = differences(model(scanFile(path, "regex")), model(scanFile(path, "ast")))
+    assert not diffs, "\n".join(f"{key}\n    regex: {regexValue!r}\n    ast:   {astValue!r}"
+                                for key, regexValue, astValue in diffs[:10])
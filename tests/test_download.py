@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+SegmentedDownload 对本地 HTTP 服务器的测试: 分段、续传、ETag 变化、换镜像、校验
+"""
+
+import os
+import time
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("PySide6")
+pytest.importorskip("simplejson")
+
+import simplejson as json
+
+from common import download
+from common.download import SegmentedDownload, probeMirror, publishedChecksum
+
+
+CONTENT = bytes(range(256)) * 64     # 16 KiB
+
+
+class FileServer:
+    """
+    只提供一个文件的 HTTP 服务器
+    @param ranges 是否支持 Range/If-Range
+    @param truncate 整体下载时只发送的字节数(Content-Length 仍为完整大小)
+    @param headDelay HEAD 响应前的延迟，用于控制镜像的测速顺序
+    @param getLength 整体下载的响应是否带 Content-Length(不带时以关闭连接结束)
+    """
+
+    def __init__(self, content=CONTENT, etag='"v1"', ranges=True, truncate=None, headDelay=0.0, files=None,
+                 getLength=True):
+        self.content = content
+        self.etag = etag
+        self.ranges = ranges
+        self.truncate = truncate
+        self.headDelay = headDelay
+        self.files = files or {}
+        self.getLength = getLength
+        self.requests = []
+        self.sent = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):
+                time.sleep(server.headDelay)
+                self.send_response(200)
+                self.sendEntityHeaders(len(server.content))
+                self.end_headers()
+
+            def sendEntityHeaders(self, length):
+                self.send_header("Content-Length", str(length))
+                self.send_header("ETag", server.etag)
+                if server.ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+
+            def do_GET(self):
+                if self.path in server.files:
+                    body = server.files[self.path]
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                if self.path != "/file.bin":
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                rangeHeader = self.headers.get("Range")
+                ifRange = self.headers.get("If-Range")
+                with server._lock:
+                    server.requests.append(rangeHeader)
+                content = server.content
+                if server.ranges and rangeHeader and (ifRange is None or ifRange == server.etag):
+                    start, end = rangeHeader.split("=")[1].split("-")
+                    start, end = int(start), min(int(end), len(content) - 1)
+                    body = content[start:end + 1]
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+                    self.sendEntityHeaders(len(body))
+                else:
+                    body = content
+                    self.send_response(200)
+                    if server.getLength:
+                        self.sendEntityHeaders(len(body))
+                    else:
+                        self.send_header("ETag", server.etag)
+                        self.close_connection = True
+                    if server.truncate is not None:
+                        body = body[:server.truncate]
+                        self.close_connection = True
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    server.sent += len(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}/file.bin"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def smallSegments(monkeypatch):
+    # 16 KiB 的文件分成 4 段
+    monkeypatch.setattr(download, "MIN_SEGMENT", 1024)
+    monkeypatch.setattr(download, "CHUNK_SIZE", 512)
+
+
+def sha256(content):
+    return "sha256:" + hashlib.sha256(content).hexdigest()
+
+
+def readFile(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_segmented_fetch(tmp_path):
+    target = str(tmp_path / "file.bin")
+    with FileServer() as server:
+        result = SegmentedDownload([server.url], target, checksum=sha256(CONTENT)).run()
+    assert result == [True, target]
+    assert readFile(target) == CONTENT
+    assert len([header for header in server.requests if header]) == download.DOWNLOAD_SEGMENTS
+    assert server.sent == len(CONTENT)
+    assert not os.path.exists(f"{target}.part") and not os.path.exists(f"{target}.part.json")
+
+
+def test_probe_falls_back_to_ranged_get():
+    with FileServer() as server:
+        server.httpd.RequestHandlerClass.do_HEAD = lambda handler: (
+            handler.send_response(405), handler.send_header("Content-Length", "0"), handler.end_headers())
+        probe = probeMirror(server.url)
+    assert probe["size"] == len(CONTENT) and probe["ranges"] and probe["validator"] == '"v1"'
+
+
+def test_resume_from_partial(tmp_path):
+    target = str(tmp_path / "file.bin")
+    half = len(CONTENT) // 2
+    with FileServer() as server:
+        # 上次中断时第一段已完成、第二段下载了一半
+        with open(f"{target}.part", "wb") as f:
+            f.write(CONTENT[:half])
+            f.truncate(len(CONTENT))
+        quarter = len(CONTENT) // 4
+        state = {"url": server.url, "size": len(CONTENT), "validator": '"v1"',
+                 "segments": [[0, quarter - 1, quarter], [quarter, 2 * quarter - 1, quarter],
+                              [2 * quarter, 3 * quarter - 1, 0], [3 * quarter, len(CONTENT) - 1, 0]]}
+        with open(f"{target}.part.json", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        result = SegmentedDownload([server.url], target, checksum=sha256(CONTENT)).run()
+    assert result[0], result
+    assert readFile(target) == CONTENT
+    # 只获取缺少的一半
+    assert server.sent == len(CONTENT) - half
+
+
+def test_changed_etag_restarts(tmp_path):
+    target = str(tmp_path / "file.bin")
+    old = b"x" * len(CONTENT)
+    with FileServer(etag='"v2"') as server:
+        with open(f"{target}.part", "wb") as f:
+            f.write(old)
+        state = {"url": server.url, "size": len(CONTENT), "validator": '"v1"',
+                 "segments": [[0, len(CONTENT) - 1, len(CONTENT) // 2]]}
+        with open(f"{target}.part.json", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        result = SegmentedDownload([server.url], target, checksum=sha256(CONTENT)).run()
+    assert result[0], result
+    assert readFile(target) == CONTENT
+    assert server.sent == len(CONTENT)
+
+
+def test_if_range_mismatch_downloads_whole(tmp_path):
+    target = str(tmp_path / "file.bin")
+    with FileServer() as server:
+        download_ = SegmentedDownload([server.url], target, checksum=sha256(CONTENT))
+        probe = probeMirror(server.url)
+        # 测速之后服务器上的文件被替换: If-Range 不匹配，服务器返回整个文件
+        server.etag = '"v2"'
+        download_.fetch(probe)
+    assert readFile(f"{target}.part") == CONTENT
+    assert download_.verify()
+
+
+def test_without_range_support(tmp_path):
+    target = str(tmp_path / "file.bin")
+    with FileServer(ranges=False) as server:
+        result = SegmentedDownload([server.url], target, checksum=sha256(CONTENT)).run()
+    assert result[0], result
+    assert readFile(target) == CONTENT
+    assert server.requests == [None]
+
+
+def test_truncated_whole_download_fails(tmp_path):
+    target = str(tmp_path / "file.bin")
+    with FileServer(ranges=False, truncate=len(CONTENT) // 2) as server:
+        result = SegmentedDownload([server.url], target).run()
+    assert not result[0]
+    assert not os.path.exists(target)
+
+
+def test_truncated_download_without_length_fails(tmp_path):
+    # 响应不带 Content-Length 时以测速得到的大小为准
+    target = str(tmp_path / "file.bin")
+    with FileServer(ranges=False, truncate=len(CONTENT) // 2, getLength=False) as server:
+        result = SegmentedDownload([server.url], target).run()
+    assert not result[0]
+    assert not os.path.exists(target)
+
+
+def test_falls_back_to_next_mirror(tmp_path):
+    target = str(tmp_path / "file.bin")
+    # 第一个镜像测速最快但只发送一半内容
+    with FileServer(ranges=False, truncate=100) as broken, FileServer(headDelay=0.2) as good:
+        result = SegmentedDownload([good.url, broken.url], target, checksum=sha256(CONTENT)).run()
+    assert result[0], result
+    assert readFile(target) == CONTENT
+    assert broken.requests and good.requests
+
+
+def test_checksum_mismatch_rejected(tmp_path):
+    target = str(tmp_path / "file.bin")
+    with FileServer() as server:
+        result = SegmentedDownload([server.url], target, checksum=sha256(b"other")).run()
+    assert not result[0]
+    assert "校验失败" in result[1]
+    assert not os.path.exists(target) and not os.path.exists(f"{target}.part")
+
+
+def test_published_checksum():
+    digest = hashlib.sha256(CONTENT).hexdigest()
+    with FileServer(files={"/file.bin.sha256": f"{digest.upper()}  file.bin\n".encode()}) as server:
+        assert publishedChecksum([server.url]) == f"sha256:{digest}"
+    with FileServer() as server:
+        assert publishedChecksum([server.url]) is None
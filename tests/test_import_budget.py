@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+启动导入预算: 在新的解释器中导入启动集合，检查延迟模块未被提前导入、模块总数不超过预算
+"""
+
+import os
+import sys
+import json
+import subprocess
+import importlib.util
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REQUIRED = ("PySide6", "qfluentwidgets", "qfluentexpand", "simplejson")
+MISSING = [name for name in REQUIRED if importlib.util.find_spec(name) is None]
+
+SCRIPT = """
+import json
+import importlib
+from common.lazy import STARTUP_IMPORTS, PAGE_IMPORTS, importBudget
+for module in {imports}:
+    importlib.import_module(module)
+print(json.dumps(importBudget({budget})))
+"""
+
+
+def importBudgetIn(imports, budget=""):
+    """
+    在子进程中导入 common.lazy 中的模块集合
+    @return importBudget() 的结果
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    process = subprocess.run([sys.executable, "-c", SCRIPT.format(imports=imports, budget=budget)],
+                             cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+    assert process.returncode == 0, process.stderr
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.skipif(bool(MISSING), reason=f"missing {', '.join(MISSING)}")
+def test_startup_import_budget():
+    from common.lazy import STARTUP_MODULE_BUDGET
+
+    result = importBudgetIn("STARTUP_IMPORTS")
+    assert result[0], result[1]
+    assert result[1] <= STARTUP_MODULE_BUDGET
+
+
+@pytest.mark.skipif(bool(MISSING), reason=f"missing {', '.join(MISSING)}")
+def test_pages_keep_lazy_modules():
+    result = importBudgetIn("STARTUP_IMPORTS + PAGE_IMPORTS", budget="None")
+    assert result[0], result[1]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+ProjectIndexer: .gitignore 与 pipreqs ignore、按分类取文件、增量扫描使用规则副本
+"""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("simplejson")
+
+import simplejson as json
+from PySide6.QtCore import QCoreApplication
+
+from common import indexer as indexerModule
+from common.indexer import ProjectIndexer, IgnoreRules, scanTree
+
+
+TIMEOUT = 5
+
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def waitFor(app, condition):
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "timeout"
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def writeFiles(root, *names):
+    for name in names:
+        path = os.path.join(str(root), name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    # pipreqs 设置写到临时目录
+    monkeypatch.setattr(indexerModule, "ROOT_PATH", str(tmp_path))
+    (tmp_path / "data").mkdir()
+    with open(tmp_path / "data" / "pipreqs.json", "w", encoding="utf-8") as f:
+        json.dump({"ignore": ["scratch", "./legacy/"]}, f)
+
+    root = tmp_path / "project"
+    writeFiles(root, "main.py", "setup.py", "requirements.txt", "form.ui", "res.qrc", "README.md",
+               "pkg/__init__.py", "pkg/view.ui", "pkg/cache.log", "pkg/keep.log",
+               "wheels/demo-1.0-py3-none-any.whl",
+               "scratch/tmp.py", "legacy/old.ui", "logs/run.py", "venv/lib.py", ".venv/lib.py",
+               "nested/generated/out.py", "nested/kept.py")
+    (root / ".gitignore").write_text("# 注释\n*.log\n!keep.log\nlogs/\n")
+    (root / "nested" / ".gitignore").write_text("/generated\n")
+    return root
+
+
+def indexed(app, root):
+    indexer = ProjectIndexer()
+    done = []
+    indexer.indexed.connect(done.append)
+    indexer.setRoot(str(root))
+    waitFor(app, lambda: done)
+    return indexer
+
+
+def relative(root, paths):
+    return [os.path.relpath(path, str(root)).replace(os.sep, "/") for path in paths]
+
+
+def test_files_by_kind_and_ignores(app, project):
+    indexer = indexed(app, project)
+    assert indexer.files(".py") is not None
+    assert relative(project, indexer.files(".py")) == [
+        "main.py", "nested/kept.py", "pkg/__init__.py", "setup.py"]
+    assert relative(project, indexer.files(".ui")) == ["form.ui", "pkg/view.ui"]
+    assert relative(project, indexer.files(".qrc")) == ["res.qrc"]
+    assert relative(project, indexer.files(".whl")) == ["wheels/demo-1.0-py3-none-any.whl"]
+    assert relative(project, indexer.files("setup.py")) == ["setup.py"]
+    assert relative(project, indexer.files("requirements.txt")) == ["requirements.txt"]
+
+    dirs, files = indexer.listdir(str(project))
+    # pipreqs ignore(scratch、legacy)、.gitignore(logs/)、固定跳过的虚拟环境目录
+    assert dirs == ["nested", "pkg", "wheels"]
+    assert "README.md" in files
+    # *.log 忽略，!keep.log 取反
+    assert indexer.listdir(str(project / "pkg"))[1] == ["__init__.py", "keep.log", "view.ui"]
+    # 子目录 .gitignore 中以 / 开头的规则相对该目录
+    assert indexer.listdir(str(project / "nested"))[0] == []
+    indexer.clear()
+
+
+def test_rescan_merges_rule_snapshot(app, project):
+    indexer = indexed(app, project)
+    rules = indexer.rules
+    changed = []
+    indexer.changed.connect(changed.append)
+
+    writeFiles(project, "added/a.py", "added/b.tmp.py", "added/sub/c.ui", "extra.py")
+    (project / "added" / ".gitignore").write_text("*.tmp.py\n")
+    indexer.pending.add(str(project))
+    indexer.flush()
+    waitFor(app, lambda: changed)
+
+    assert relative(project, indexer.files(".py")) == [
+        "added/a.py", "extra.py", "main.py", "nested/kept.py", "pkg/__init__.py", "setup.py"]
+    assert relative(project, indexer.files(".ui")) == ["added/sub/c.ui", "form.ui", "pkg/view.ui"]
+    # 后台扫描的是副本，新规则在主线程合并进原对象
+    assert indexer.rules is rules
+    assert str(project / "added" / ".gitignore") in rules.stamps
+    assert rules.ignored(str(project / "added" / "x.tmp.py"), False)
+    indexer.clear()
+
+
+def test_rules_copy_is_independent(project):
+    rules = IgnoreRules()
+    snapshot = rules.copy()
+    scanTree(str(project), snapshot)
+    assert rules.rules == [] and rules.stamps == {}
+    rules.merge(snapshot)
+    assert sorted(rules.stamps) == sorted([str(project / ".gitignore"), str(project / "nested" / ".gitignore")])
+    assert rules.ignored(str(project / "pkg" / "cache.log"), False)
+    assert not rules.ignored(str(project / "pkg" / "keep.log"), False)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+ModuleCache: 修改过的源文件重新解析、缓存跨实例持久化、PARSER_VERSION 变化时旧条目失效
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from ui.eric import ModuleCache as moduleCache
+from ui.eric.ModuleCache import ModuleCache
+
+
+SOURCE = '''
+class Dialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+    def on_button_clicked(self):
+        pass
+'''
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """
+    记录 ModuleParser.readModule 的调用
+    """
+    calls = []
+    readModule = moduleCache.ModuleParser.readModule
+
+    def counted(path, *args, **kwargs):
+        calls.append(os.path.basename(path))
+        return readModule(path, *args, **kwargs)
+
+    monkeypatch.setattr(moduleCache.ModuleParser, "readModule", counted)
+    return calls
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "src" / "dialog.py"
+    path.parent.mkdir()
+    path.write_text(SOURCE, encoding="utf-8")
+    return str(path)
+
+
+def cacheIn(tmp_path):
+    return ModuleCache(folder=str(tmp_path / "module_cache"))
+
+
+def test_edited_file_is_reparsed(tmp_path, source, parses):
+    cache = cacheIn(tmp_path)
+    module = cache.read(source)
+    assert list(module.classes) == ["Dialog"]
+    assert "on_button_clicked" in module.classes["Dialog"].methods
+    assert cache.read(source) is module
+    assert parses == ["dialog.py"]
+
+    with open(source, "a", encoding="utf-8") as f:
+        f.write("\n\nclass Other:\n    pass\n")
+    assert cache.cached(source) is None
+    assert sorted(cache.read(source).classes) == ["Dialog", "Other"]
+    assert parses == ["dialog.py", "dialog.py"]
+
+    os.remove(source)
+    assert cache.read(source) is None
+    assert not os.path.exists(cache.entryFile(source))
+
+
+def test_persists_across_instances(tmp_path, source, parses):
+    cacheIn(tmp_path).read(source)
+    assert os.path.exists(cacheIn(tmp_path).entryFile(source))
+
+    # 新实例从磁盘读取，不再解析
+    module = cacheIn(tmp_path).cached(source)
+    assert module is not None and list(module.classes) == ["Dialog"]
+    assert list(cacheIn(tmp_path).readAll([source, source])) == [source]
+    assert parses == ["dialog.py"]
+
+
+def test_parser_version_bump_drops_entries(tmp_path, source, parses, monkeypatch):
+    cacheIn(tmp_path).read(source)
+    monkeypatch.setattr(moduleCache, "PARSER_VERSION", moduleCache.PARSER_VERSION + 1)
+
+    cache = cacheIn(tmp_path)
+    assert cache.cached(source) is None
+    assert list(cache.read(source).classes) == ["Dialog"]
+    assert parses == ["dialog.py", "dialog.py"]
+    # 重新解析后按新版本写回
+    assert cacheIn(tmp_path).cached(source) is not None
+    assert parses == ["dialog.py", "dialog.py"]
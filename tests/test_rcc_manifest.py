@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+RccCompiler 清单: 无变化时不编译，.qrc 或其资源内容变化时只重新编译该 .qrc，工具版本变化时全部重新编译
+使用 conftest 中的假 pyside6-rcc
+"""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("simplejson")
+
+from common.rcc import RccCompiler, rccOutput, rccBinaryOutput
+
+
+QRC = '<RCC><qresource prefix="/">{files}</qresource></RCC>\n'
+
+
+def writeQrc(path, *assets):
+    path.write_text(QRC.format(files="".join(f"<file>{asset}</file>" for asset in assets)))
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "icons").mkdir(parents=True)
+    (root / "icons" / "app.png").write_bytes(b"app icon")
+    (root / "icons" / "close.png").write_bytes(b"close icon")
+    (root / "style.qss").write_text("QWidget {}")
+    writeQrc(root / "icons.qrc", "icons/app.png", "icons/close.png")
+    writeQrc(root / "style.qrc", "style.qss")
+    return root
+
+
+def compileAll(fakeInterpreter, project, tmp_path, binary=False, **kwargs):
+    rcc = RccCompiler(fakeInterpreter.python, "PySide6", str(project), binary=binary)
+    rcc.manifestFile = str(tmp_path / "manifest.json")
+    result = rcc.compileAll(**kwargs)
+    assert result[0], result
+    return sorted(os.path.basename(path) for path in result[1]["compiled"])
+
+
+def test_second_run_compiles_nothing(fakeInterpreter, project, tmp_path):
+    assert compileAll(fakeInterpreter, project, tmp_path) == ["icons.qrc", "style.qrc"]
+    assert fakeInterpreter.calls() == ["icons.qrc", "style.qrc"]
+    assert os.path.exists(rccOutput(str(project / "icons.qrc")))
+
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+    assert fakeInterpreter.calls() == []
+
+
+def test_only_affected_qrc_recompiles(fakeInterpreter, project, tmp_path):
+    compileAll(fakeInterpreter, project, tmp_path)
+    fakeInterpreter.calls()
+
+    # 资源内容变化
+    (project / "icons" / "close.png").write_bytes(b"new close icon")
+    assert compileAll(fakeInterpreter, project, tmp_path) == ["icons.qrc"]
+    assert fakeInterpreter.calls() == ["icons.qrc"]
+
+    # 资源只修改时间戳不重新编译，之后也不重复计算
+    os.utime(project / "style.qss", ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+
+    # .qrc 增加资源
+    (project / "icons" / "open.png").write_bytes(b"open icon")
+    writeQrc(project / "icons.qrc", "icons/app.png", "icons/close.png", "icons/open.png")
+    assert compileAll(fakeInterpreter, project, tmp_path) == ["icons.qrc"]
+
+    # 资源重新写入相同内容不重新编译，被删除时重新编译
+    os.remove(project / "style.qss")
+    (project / "style.qss").write_text("QWidget {}")
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+    os.remove(project / "icons" / "open.png")
+    assert compileAll(fakeInterpreter, project, tmp_path) == ["icons.qrc"]
+    assert fakeInterpreter.calls() == ["icons.qrc", "icons.qrc"]
+
+
+def test_tool_version_change_invalidates_all(fakeInterpreter, project, tmp_path):
+    compileAll(fakeInterpreter, project, tmp_path)
+    fakeInterpreter.calls()
+
+    fakeInterpreter.upgrade("6.8.0")
+    assert compileAll(fakeInterpreter, project, tmp_path) == ["icons.qrc", "style.qrc"]
+    with open(rccOutput(str(project / "style.qrc")), encoding="utf-8") as f:
+        assert "6.8.0" in f.read()
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+
+
+def test_mode_change_invalidates_all(fakeInterpreter, project, tmp_path):
+    compileAll(fakeInterpreter, project, tmp_path)
+    fakeInterpreter.calls()
+
+    assert compileAll(fakeInterpreter, project, tmp_path, binary=True) == ["icons.qrc", "style.qrc"]
+    assert os.path.exists(rccBinaryOutput(str(project / "icons.qrc")))
+    with open(rccOutput(str(project / "icons.qrc")), encoding="utf-8") as f:
+        assert "icons.rcc" in f.read()
+    assert compileAll(fakeInterpreter, project, tmp_path, binary=True) == []
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+JobScheduler: 优先级与先进先出、按解释器并发上限、依赖、取消传递、失败状态
+"""
+
+import time
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from common.scheduler import JobScheduler, JobState, JobPriority
+
+
+TIMEOUT = 5
+
+
+def waitDone(*jobs):
+    deadline = time.monotonic() + TIMEOUT
+    while not all(job.isDone() for job in jobs):
+        assert time.monotonic() < deadline, f"timeout: {jobs}"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(maxWorkers=1)
+    yield scheduler
+    scheduler.shutdown(wait=True)
+
+
+def blocker():
+    """
+    阻塞到 release.set() 的任务，started 在开始执行时设置
+    """
+    started, release = threading.Event(), threading.Event()
+
+    def run():
+        started.set()
+        assert release.wait(TIMEOUT)
+        return [True, "ok"]
+
+    return run, started, release
+
+
+def test_priority_then_fifo(scheduler):
+    order = []
+    run, started, release = blocker()
+    first = scheduler.submit(run, name="blocker")
+    assert started.wait(TIMEOUT)
+
+    jobs = [scheduler.submit(order.append, name, name=name, priority=priority) for name, priority in (
+        ("low", JobPriority.LOW), ("normal1", JobPriority.NORMAL), ("normal2", JobPriority.NORMAL),
+        ("high", JobPriority.HIGH), ("normal3", JobPriority.NORMAL))]
+    assert all(job.state == JobState.PENDING for job in jobs)
+    release.set()
+    waitDone(first, *jobs)
+    assert order == ["high", "normal1", "normal2", "normal3", "low"]
+
+
+def test_interpreter_limit():
+    scheduler = JobScheduler(maxWorkers=4, interpreterLimit=2)
+    lock = threading.Lock()
+    running = {"py": 0, "other": 0}
+    peak = {"py": 0, "other": 0}
+
+    def run(interpreter):
+        with lock:
+            running[interpreter] += 1
+            peak[interpreter] = max(peak[interpreter], running[interpreter])
+        time.sleep(0.05)
+        with lock:
+            running[interpreter] -= 1
+
+    try:
+        jobs = [scheduler.submit(run, "py", interpreter="py") for _ in range(6)]
+        jobs.append(scheduler.submit(run, "other", interpreter="other"))
+        waitDone(*jobs)
+    finally:
+        scheduler.shutdown(wait=True)
+    assert peak["py"] == 2
+    assert peak["other"] == 1
+    assert all(job.state == JobState.FINISHED for job in jobs)
+
+
+def test_dependent_waits_for_dependency():
+    scheduler = JobScheduler(maxWorkers=2)
+    order = []
+    run, started, release = blocker()
+    try:
+        first = scheduler.submit(lambda: (run(), order.append("first")))
+        assert started.wait(TIMEOUT)
+        second = scheduler.submit(order.append, "second", depends=[first])
+        time.sleep(0.05)
+        # 有空闲线程，但依赖未完成
+        assert second.state == JobState.PENDING
+        release.set()
+        waitDone(first, second)
+    finally:
+        scheduler.shutdown(wait=True)
+    assert order == ["first", "second"]
+    assert second.state == JobState.FINISHED
+
+
+def test_cancel_cascades_to_dependents(scheduler):
+    ran = []
+    run, started, release = blocker()
+    first = scheduler.submit(run, onCancel=release.set)
+    assert started.wait(TIMEOUT)
+    second = scheduler.submit(ran.append, "second", depends=[first])
+    third = scheduler.submit(ran.append, "third", depends=[second])
+    pending = scheduler.submit(ran.append, "pending")
+    fourth = scheduler.submit(ran.append, "fourth", depends=[pending])
+
+    scheduler.cancel(pending)
+    assert pending.state == JobState.CANCELLED and fourth.state == JobState.CANCELLED
+
+    scheduler.cancel(first)
+    waitDone(first, second, third)
+    assert first.state == JobState.CANCELLED
+    assert second.state == JobState.CANCELLED and third.state == JobState.CANCELLED
+    assert second.error == "依赖任务失败"
+    assert ran == []
+    assert scheduler.activeJobs() == []
+
+
+def test_failed_job_state(scheduler):
+    def raises():
+        raise RuntimeError("boom")
+
+    returned = scheduler.submit(lambda: (False, "Error: bad"))
+    raised = scheduler.submit(raises)
+    dependent = scheduler.submit(lambda: [True, ""], depends=[raised])
+    ok = scheduler.submit(lambda: [True, "ok"])
+    waitDone(returned, raised, dependent, ok)
+
+    assert returned.state == JobState.FAILED and returned.result == (False, "Error: bad")
+    assert raised.state == JobState.FAILED and raised.error == "boom"
+    assert dependent.state == JobState.CANCELLED
+    assert ok.state == JobState.FINISHED and ok.result == [True, "ok"]
+    assert returned.finished >= returned.started
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+SlotsModel: 模型一致性(QAbstractItemModelTester)、增量过滤、控件文本与信号的匹配规则、持久索引在过滤/排序后保持
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt, QCoreApplication, QModelIndex, QPersistentModelIndex, qInstallMessageHandler
+from PySide6.QtTest import QAbstractItemModelTester
+
+from ui.compoments.slots import SlotsModel, CHECKED, IMPLEMENTED
+
+
+def signal(name, signature):
+    slot = f"on_{name}_{signature.split('(')[0]}"
+    return {"signature": signature, "methods": [slot, f"{slot}({signature.split('(')[1]}"]}
+
+
+OBJECTS = [
+    {"name": "lineEdit", "class_name": "QLineEdit",
+     "methods": [signal("lineEdit", "textChanged(QString)"), signal("lineEdit", "returnPressed()")]},
+    {"name": "button_ok", "class_name": "QPushButton",
+     "methods": [signal("button_ok", "clicked()"), signal("button_ok", "clicked(bool)"),
+                 signal("button_ok", "pressed()")]},
+    {"name": "listWidget", "class_name": "QListWidget",
+     "methods": [signal("listWidget", "itemClicked(QListWidgetItem*)"), signal("listWidget", "currentRowChanged(int)")]},
+    {"name": "frame", "class_name": "QFrame", "methods": []},
+]
+
+
+@pytest.fixture
+def model():
+    QCoreApplication.instance() or QCoreApplication([])
+    model = SlotsModel()
+    model.setSignatures(OBJECTS, implemented=["on_button_ok_pressed"])
+    return model
+
+
+def fetchAll(model):
+    for row in range(model.rowCount()):
+        parent = model.index(row, 0)
+        if model.canFetchMore(parent):
+            model.fetchMore(parent)
+
+
+def visible(model):
+    """
+    {控件文本: [信号文本]}，展开全部控件
+    """
+    fetchAll(model)
+    result = {}
+    for row in range(model.rowCount()):
+        parent = model.index(row, 0)
+        result[model.data(parent)] = [model.data(model.index(child, 0, parent))
+                                      for child in range(model.rowCount(parent))]
+    return result
+
+
+def childIndex(model, label, text):
+    fetchAll(model)
+    for row in range(model.rowCount()):
+        parent = model.index(row, 0)
+        if model.data(parent) == label:
+            for child in range(model.rowCount(parent)):
+                index = model.index(child, 0, parent)
+                if model.data(index) == text:
+                    return index
+    return QModelIndex()
+
+
+class CountingList(list):
+    """
+    记录下标访问次数，用于确认增量过滤只检查上一次的结果
+    """
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.reads = 0
+
+    def __getitem__(self, index):
+        self.reads += 1
+        return super().__getitem__(index)
+
+
+def test_model_tester(model):
+    warnings = []
+
+    def handler(mode, context, message):
+        warnings.append(message)
+
+    def tester():
+        # 构造时检查全部行(并展开懒加载的子行)，之后检查每次变化
+        return QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Warning)
+
+    previous = qInstallMessageHandler(handler)
+    try:
+        # 过滤出子集、排序、勾选不产生未展开的行
+        current = tester()
+        model.setFilterText("click")
+        model.sort(0, Qt.SortOrder.DescendingOrder)
+        model.setFilterText("clicked(")
+        model.setData(childIndex(model, "button_ok (QPushButton)", "clicked()"), Qt.CheckState.Checked,
+                      Qt.ItemDataRole.CheckStateRole)
+        del current
+
+        # tester 在 layoutChanged/modelReset 的检查中调用 fetchMore 时会误报 changeInFlight，
+        # 重新出现未展开的行或重置后换一个 tester，由构造时的检查展开
+        model.setFilterText("")
+        current = tester()
+        model.sort(0, Qt.SortOrder.AscendingOrder)
+        del current
+        model.setSignatures(OBJECTS[:2])
+        current = tester()
+        model.setFilterText("line")
+        del current
+        model.clear()
+        current = tester()
+        del current
+    finally:
+        qInstallMessageHandler(previous)
+    assert warnings == [], "\n".join(warnings)
+
+
+def test_label_and_signal_match_rules(model):
+    assert list(visible(model)) == ["button_ok (QPushButton)", "frame (QFrame)", "lineEdit (QLineEdit)",
+                                    "listWidget (QListWidget)"]
+
+    # 控件文本(对象名或类名)匹配时显示全部信号
+    model.setFilterText("line")
+    assert visible(model) == {"lineEdit (QLineEdit)": ["returnPressed()", "textChanged(QString)"]}
+    model.setFilterText("QPUSH")
+    assert visible(model) == {"button_ok (QPushButton)": ["clicked()", "clicked(bool)", "pressed()"]}
+
+    # 否则只显示匹配的信号，没有匹配信号的控件隐藏
+    model.setFilterText(" Clicked ")
+    assert visible(model) == {
+        "button_ok (QPushButton)": ["clicked()", "clicked(bool)"],
+        "listWidget (QListWidget)": ["itemClicked(QListWidgetItem*)"],
+    }
+    model.setFilterText("nothing")
+    assert visible(model) == {}
+    assert not model.hasChildren()
+
+    # 没有信号的控件只在文本匹配时显示
+    model.setFilterText("frame")
+    assert visible(model) == {"frame (QFrame)": []}
+    assert not model.hasChildren(model.index(0, 0))
+
+
+def test_incremental_filter(model):
+    model.setFilterText("c")
+    model.textsLower = CountingList(model.textsLower)
+    model.setFilterText("cl")
+    # 只在上一次匹配的信号中查找
+    assert model.textsLower.reads == 5
+    model.setFilterText("clicked(")
+    assert model.textsLower.reads == 5 + 3
+    incremental = visible(model)
+
+    fresh = SlotsModel()
+    fresh.setSignatures(OBJECTS)
+    fresh.setFilterText("clicked(")
+    assert incremental == visible(fresh)
+
+    # 缩短或改变文本时从全部信号中查找
+    model.textsLower.reads = 0
+    model.setFilterText("press")
+    assert model.textsLower.reads == 7
+    assert visible(model) == {"button_ok (QPushButton)": ["pressed()"], "lineEdit (QLineEdit)": ["returnPressed()"]}
+
+    # 控件文本的匹配也是增量的
+    model.setFilterText("q")
+    model.setFilterText("ql")
+    assert visible(model) == {
+        "lineEdit (QLineEdit)": ["returnPressed()", "textChanged(QString)"],
+        "listWidget (QListWidget)": ["currentRowChanged(int)", "itemClicked(QListWidgetItem*)"],
+    }
+
+
+def test_persistent_indexes_survive_relayout(model):
+    label = QPersistentModelIndex(model.index(0, 0))
+    hidden = QPersistentModelIndex(model.index(2, 0))
+    child = QPersistentModelIndex(childIndex(model, "button_ok (QPushButton)", "clicked(bool)"))
+    assert child.isValid() and child.row() == 1
+
+    model.setFilterText("clicked")
+    assert label.data() == "button_ok (QPushButton)"
+    assert child.data() == "clicked(bool)" and child.row() == 1
+    assert model.rowCount(label) == 2
+    # 被过滤掉的行失效
+    assert not hidden.isValid()
+
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert label.row() == 1
+    assert child.data() == "clicked(bool)" and child.row() == 0
+    assert child.parent() == QModelIndex(label)
+
+    model.setFilterText("")
+    assert label.row() == 3
+    assert child.data() == "clicked(bool)" and child.row() == 1
+
+    # 勾选状态保存在信号上，与行的位置无关
+    assert model.setData(QModelIndex(child), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert child.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+    pressed = childIndex(model, "button_ok (QPushButton)", "pressed()")
+    assert model.states[model.key(pressed)[1]] == IMPLEMENTED
+    assert not model.setData(pressed, Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
+    assert [item["signature"] for item in model.checkedSignals()] == ["clicked(bool)"]
+    assert model.states[model.key(QModelIndex(child))[1]] == CHECKED
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+UicCompiler 清单: 无变化时不编译，只重新编译修改过的 .ui，工具版本变化时全部重新编译
+使用 conftest 中的假 pyside6-uic(命令行方式，不启动常驻进程)
+"""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("simplejson")
+
+from common.uic import UicCompiler, uicOutput
+
+
+FORM = '<?xml version="1.0" encoding="UTF-8"?>\n<ui version="4.0"><class>{name}</class></ui>\n'
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "forms").mkdir(parents=True)
+    # 跳过的目录中的 .ui 不参与编译
+    (root / ".venv").mkdir()
+    (root / ".venv" / "ignored.ui").write_text(FORM.format(name="Ignored"))
+    for name in ("main", "dialog", "forms/settings"):
+        (root / f"{name}.ui").write_text(FORM.format(name=os.path.basename(name)))
+    return root
+
+
+def compiler(fakeInterpreter, project, tmp_path):
+    uic = UicCompiler(fakeInterpreter.python, "PySide6", str(project), pool=False)
+    uic.manifestFile = str(tmp_path / "manifest.json")
+    return uic
+
+
+def compileAll(fakeInterpreter, project, tmp_path, **kwargs):
+    result = compiler(fakeInterpreter, project, tmp_path).compileAll(**kwargs)
+    assert result[0], result
+    return [os.path.basename(path) for path in result[1]["compiled"]]
+
+
+def test_second_run_compiles_nothing(fakeInterpreter, project, tmp_path):
+    assert sorted(compileAll(fakeInterpreter, project, tmp_path)) == ["dialog.ui", "main.ui", "settings.ui"]
+    assert fakeInterpreter.calls() == ["dialog.ui", "main.ui", "settings.ui"]
+    assert os.path.exists(uicOutput(str(project / "forms" / "settings.ui")))
+
+    start = time.perf_counter()
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+    elapsed = time.perf_counter() - start
+    assert fakeInterpreter.calls() == []
+    # 无变化的重建只遍历目录、比较 stat，不启动子进程
+    assert elapsed < 0.5
+
+
+def test_only_edited_form_recompiles(fakeInterpreter, project, tmp_path):
+    compileAll(fakeInterpreter, project, tmp_path)
+    fakeInterpreter.calls()
+
+    (project / "dialog.ui").write_text(FORM.format(name="Changed"))
+    assert compileAll(fakeInterpreter, project, tmp_path) == ["dialog.ui"]
+    assert fakeInterpreter.calls() == ["dialog.ui"]
+
+    # 只修改时间戳不重新编译
+    os.utime(project / "main.ui", ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+
+    # 生成的文件被删除后重新编译
+    os.remove(uicOutput(str(project / "main.ui")))
+    assert compileAll(fakeInterpreter, project, tmp_path) == ["main.ui"]
+
+
+def test_tool_version_change_invalidates_all(fakeInterpreter, project, tmp_path):
+    compileAll(fakeInterpreter, project, tmp_path)
+    fakeInterpreter.calls()
+
+    fakeInterpreter.upgrade("6.8.0")
+    assert sorted(compileAll(fakeInterpreter, project, tmp_path)) == ["dialog.ui", "main.ui", "settings.ui"]
+    with open(uicOutput(str(project / "main.ui")), encoding="utf-8") as f:
+        assert "6.8.0" in f.read()
+    assert compileAll(fakeInterpreter, project, tmp_path) == []
+
+
+def test_missing_binding_fails(fakeInterpreter, project, tmp_path):
+    compileAll(fakeInterpreter, project, tmp_path)
+    uic = UicCompiler(fakeInterpreter.python, "PySide2", str(project), pool=False)
+    uic.manifestFile = str(tmp_path / "manifest.json")
+    # PySide2 未安装，没有可用的工具标识，不沿用 PySide6 的清单
+    assert not uic.compileAll()[0]
+    assert fakeInterpreter.calls() == ["dialog.ui", "main.ui", "settings.ui"]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+VersionCatalog 使用可替换的获取后端测试: TTL、ETag/304、Link 分页、失败时使用过期缓存
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("simplejson")
+
+import simplejson as json
+
+from common.cache import VersionCatalog, latestRelease
+
+
+URL = "https://example.invalid/tags?per_page=2"
+
+
+class FakeFetch:
+    """
+    按 URL 返回预设的页面，记录每次请求
+    @param pages {url: (状态码, 响应头, JSON)}
+    """
+
+    def __init__(self, pages=None, etag=None, error=None):
+        self.pages = pages or {}
+        self.etag = etag
+        self.error = error
+        self.calls = []
+
+    def __call__(self, url, headers, timeout):
+        self.calls.append((url, dict(headers)))
+        if self.error:
+            raise self.error
+        if self.etag and headers.get("If-None-Match") == self.etag:
+            return 304, {"ETag": self.etag}, None
+        return self.pages[url]
+
+
+def tags(*names):
+    return [{"name": name} for name in names]
+
+
+def writeCache(path, fetched, versions, etag=None):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"url": URL, "etag": etag, "fetched": fetched, "versions": versions}, f)
+
+
+def test_ttl_hit_does_not_fetch(tmp_path):
+    path = tmp_path / "versions.json"
+    writeCache(path, time.time(), ["v3.12.1"])
+    fetch = FakeFetch()
+    catalog = VersionCatalog(path=str(path), url=URL, ttl=3600, fetch=fetch)
+    assert catalog.refresh() == [True, ["v3.12.1"]]
+    assert catalog.refreshAsync() is None
+    assert fetch.calls == []
+
+
+def test_not_modified_reuses_disk_copy(tmp_path):
+    path = tmp_path / "versions.json"
+    writeCache(path, 0, ["v3.12.1", "v3.11.7"], etag='"abc"')
+    fetch = FakeFetch(etag='"abc"')
+    catalog = VersionCatalog(path=str(path), url=URL, ttl=3600, fetch=fetch)
+    assert catalog.refresh() == [True, ["v3.12.1", "v3.11.7"]]
+    assert fetch.calls[0][1]["If-None-Match"] == '"abc"'
+    assert len(fetch.calls) == 1
+    # 获取时间已更新，之后不再访问网络
+    assert not catalog.isStale()
+    reloaded = VersionCatalog(path=str(path), url=URL, ttl=3600, fetch=fetch)
+    assert reloaded.versions() == ["v3.12.1", "v3.11.7"] and not reloaded.isStale()
+
+
+def test_link_pagination(tmp_path):
+    page2 = "https://example.invalid/tags?per_page=2&page=2"
+    page3 = "https://example.invalid/tags?per_page=2&page=3"
+    fetch = FakeFetch({
+        URL: (200, {"ETag": '"p1"', "Link": f'<{page2}>; rel="next", <{page3}>; rel="last"'},
+              tags("v3.13.1", "v3.13.0rc1")),
+        page2: (200, {"Link": f'<{page3}>; rel="next"'}, tags("v3.12.8", "not-a-version")),
+        page3: (200, {}, tags("v3.11.11")),
+    })
+    catalog = VersionCatalog(path=str(tmp_path / "versions.json"), url=URL, fetch=fetch)
+    result = catalog.refresh(force=True)
+    assert result == [True, ["v3.13.1", "v3.13.0rc1", "v3.12.8", "v3.11.11"]]
+    assert [call[0] for call in fetch.calls] == [URL, page2, page3]
+    assert all("If-None-Match" not in call[1] for call in fetch.calls)
+    assert catalog.load()["etag"] == '"p1"'
+    assert latestRelease(result[1]) == "3.13.1"
+
+
+def test_fetch_error_falls_back_to_stale_cache(tmp_path):
+    path = tmp_path / "versions.json"
+    writeCache(path, 0, ["v3.10.4"], etag='"old"')
+    fetch = FakeFetch(error=OSError("network down"))
+    catalog = VersionCatalog(path=str(path), url=URL, ttl=3600, fetch=fetch)
+    result = catalog.refresh()
+    assert not result[0] and "network down" in result[1]
+    assert catalog.get() == ["v3.10.4"]
+    # 失败不改写缓存
+    assert catalog.isStale() and catalog.load()["etag"] == '"old"'
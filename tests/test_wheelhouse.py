@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+Wheelhouse: 按内容存储、哈希校验后复用、LRU 淘汰、静态索引只在内容变化时重建
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("simplejson")
+
+from common.wheelhouse import Wheelhouse, fileHash, wheelTags
+
+
+def makeWheel(folder, filename, content):
+    path = os.path.join(str(folder), filename)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+@pytest.fixture
+def house(tmp_path, monkeypatch):
+    house = Wheelhouse(root=str(tmp_path / "wheelhouse"), maxSize=1 << 20)
+    house.rebuilds = 0
+    writeSimpleIndex = house.writeSimpleIndex
+
+    def counted():
+        house.rebuilds += 1
+        writeSimpleIndex()
+
+    monkeypatch.setattr(house, "writeSimpleIndex", counted)
+    return house
+
+
+@pytest.fixture
+def src(tmp_path):
+    folder = tmp_path / "src"
+    folder.mkdir()
+    return folder
+
+
+def objectFiles(house):
+    return sorted(name for _, _, names in os.walk(house.objects) for name in names)
+
+
+def test_content_addressing(house, src):
+    content = b"same wheel content"
+    first = makeWheel(src, "demo-1.0-py3-none-any.whl", content)
+    second = makeWheel(src, "demo_alias-1.0-py3-none-any.whl", content)
+    assert house.add(first) == "demo-1.0-py3-none-any.whl"
+    assert house.add(second) == "demo_alias-1.0-py3-none-any.whl"
+
+    digest = fileHash(first)
+    # 两个文件名共用一个对象
+    assert objectFiles(house) == [digest]
+    assert os.path.exists(house.objectPath(digest))
+    assert house.entries["demo-1.0-py3-none-any.whl"]["sha256"] == digest
+    assert house.entries["demo-1.0-py3-none-any.whl"]["project"] == "demo"
+    assert house.files("Demo_Alias", "1.0") == ["demo_alias-1.0-py3-none-any.whl"]
+
+    house.remove("demo-1.0-py3-none-any.whl")
+    assert objectFiles(house) == [digest]
+    house.remove("demo_alias-1.0-py3-none-any.whl")
+    assert objectFiles(house) == []
+
+    assert house.add(makeWheel(src, "README.txt", b"not a wheel")) is None
+
+
+def test_hash_verified_reuse(house, src):
+    path = makeWheel(src, "demo-1.0-py3-none-any.whl", b"v1")
+    house.add(path)
+    assert house.verify("demo", "1.0") == ["demo-1.0-py3-none-any.whl"]
+
+    # 同内容再次加入时复用已有对象
+    objectPath = house.objectPath(fileHash(path))
+    mtime = os.stat(objectPath).st_mtime_ns
+    house.add(path)
+    assert os.stat(objectPath).st_mtime_ns == mtime
+
+    # 仓库中的文件被改坏后校验失败并移除
+    with open(os.path.join(house.links, "demo-1.0-py3-none-any.whl"), "r+b") as f:
+        f.write(b"xx")
+    assert house.verify("demo", "1.0") == []
+    assert house.files("demo") == []
+
+    # 索引持久化，新实例看到相同内容
+    house.add(makeWheel(src, "other-2.0-py3-none-any.whl", b"other"))
+    reloaded = Wheelhouse(root=house.root)
+    assert list(reloaded.load()) == ["other-2.0-py3-none-any.whl"]
+    assert reloaded.verify("other") == ["other-2.0-py3-none-any.whl"]
+
+
+def test_lru_eviction(house, src):
+    for name in ("a", "b", "c"):
+        house.add(makeWheel(src, f"{name}-1.0-py3-none-any.whl", name.encode() * 100))
+    for name, atime in (("a", 3), ("b", 1), ("c", 2)):
+        house.entries[f"{name}-1.0-py3-none-any.whl"]["atime"] = atime
+    assert house.size() == 300
+
+    assert house.evict(maxSize=300) == []
+    # b 最久未使用，其次是 c
+    assert house.evict(maxSize=150) == ["b-1.0-py3-none-any.whl", "c-1.0-py3-none-any.whl"]
+    assert list(house.entries) == ["a-1.0-py3-none-any.whl"]
+    assert house.size() == 100
+    assert not os.path.exists(os.path.join(house.links, "b-1.0-py3-none-any.whl"))
+
+
+def test_simple_index_rebuilt_only_on_change(house, src):
+    path = makeWheel(src, "Demo_Pkg-1.0-py3-none-any.whl", b"v1")
+    house.load()
+    start = house.rebuilds
+
+    house.add(path)
+    assert house.rebuilds == start + 1
+    page = os.path.join(house.simple, "demo-pkg", "index.html")
+    with open(page, "r", encoding="utf-8") as f:
+        assert f"Demo_Pkg-1.0-py3-none-any.whl#sha256={fileHash(path)}" in f.read()
+
+    # 内容未变化: 重复加入、使用、校验、取地址、未超限的淘汰都不重建
+    house.add(path)
+    house.touch("demo-pkg")
+    house.verify("demo-pkg")
+    house.indexUrl()
+    house.evict()
+    assert house.rebuilds == start + 1
+
+    # 同名文件内容变化时重建
+    house.add(makeWheel(src, "Demo_Pkg-1.0-py3-none-any.whl", b"v2"))
+    assert house.rebuilds == start + 2
+
+    # 批量淘汰只重建一次
+    house.add(makeWheel(src, "extra-1.0-py3-none-any.whl", b"extra"))
+    start = house.rebuilds
+    house.evict(maxSize=0)
+    assert house.rebuilds == start + 1
+    assert os.listdir(house.simple) == ["index.html"]
+
+
+def test_wheel_tags():
+    assert wheelTags("demo-1.0-cp312-cp312-win_amd64.whl") == {"cp312-cp312-win_amd64"}
+    assert wheelTags("demo-1.0-1-py2.py3-none-any.whl") == {"py2-none-any", "py3-none-any"}
+    assert wheelTags("demo-1.0.tar.gz") is None
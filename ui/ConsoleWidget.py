@@ -4,12 +4,17 @@
 Module implementing ConsoleWidget.
 """
 
-from PySide6.QtCore import Slot
-from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Slot, Qt
+from PySide6.QtWidgets import QWidget, QAbstractItemView, QHeaderView
+
+from qfluentwidgets import TableView, RoundMenu, Action
+from qfluentwidgets.common.icon import FluentIcon
 
 from .Ui_ConsoleWidget import Ui_Form
 
 from .utils.stylesheets import StyleSheet
+from .compoments.jobs import JobTableModel
+from common.scheduler import SCHEDULER
 
 
 class ConsoleWidget(QWidget, Ui_Form):
@@ -29,3 +34,27 @@ class ConsoleWidget(QWidget, Ui_Form):
 
         self.setObjectName("console")
         StyleSheet.CONSOLE.apply(self)
+
+        # 任务表
+        self.jobModel = JobTableModel(parent=self)
+        self.tableView_jobs = TableView(self)
+        self.tableView_jobs.setModel(self.jobModel)
+        self.tableView_jobs.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tableView_jobs.verticalHeader().hide()
+        self.tableView_jobs.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.tableView_jobs.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.tableView_jobs.customContextMenuRequested.connect(self.jobs_menu)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.tableView_jobs.setGeometry(20, 80, self.width() - 40, self.height() - 100)
+
+    def jobs_menu(self, pos):
+        menu = RoundMenu(parent=self.tableView_jobs)
+        index = self.tableView_jobs.indexAt(pos)
+        if index.isValid():
+            job = self.jobModel.job(index.row())
+            if not job.isDone():
+                menu.addAction(Action(FluentIcon.CLOSE, '取消任务', triggered=lambda: SCHEDULER.cancel(job)))
+        menu.addAction(Action(FluentIcon.DELETE, '清除已完成', triggered=self.jobModel.clearFinished))
+        menu.exec(self.tableView_jobs.viewport().mapToGlobal(pos))
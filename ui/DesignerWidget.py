@@ -7,7 +7,7 @@ Module implementing DesignerWidget.
 """
 
 
-from PySide6.QtCore import Slot, Qt, QRect, QThread, Signal
+from PySide6.QtCore import Slot, Qt, QRect, Signal
 from PySide6.QtWidgets import QWidget, QGridLayout, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, QMessageBox
 import os
 import logging
@@ -41,6 +41,8 @@ from .utils.tool import startCMD
 from .compoments.info import Message
 from common.pyenv import PyVenvManager
 from common.py import PyInterpreter, PyPath
+from common.runner import VenvRunner
+from common.pipplan import progressText
 from qfluentexpand.tools import designer
 from manage import LIBS, SETTINGS, CURRENT_SETTINGS, REQUIREMENTS_URLS
 
@@ -68,8 +70,10 @@ class DesignerWidget(QWidget, Ui_Form):
         self.gridLayout1.setSpacing(20)
         self.gridLayout1.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        self.venvMangerTh = VenvManagerThread()
-        self.venvMangerTh.signal_result.connect(self.receive_VMresult)
+        self.venvRunner = VenvRunner(self)
+        self.venvRunner.signal_result.connect(self.receive_VMresult)
+        self.venvRunner.signal_output.connect(self.receive_VMoutput)
+        self.venvRunner.signal_progress.connect(self.receive_VMprogress)
 
         self.initTitle()
         self.initWidget()
@@ -249,41 +253,33 @@ class DesignerWidget(QWidget, Ui_Form):
         return path
 
     def open_origin(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return
 
-        self.venvMangerTh.setPyInterpreter(path)
+        self.venvRunner.setPyInterpreter(path)
 
         if self.file_ui.text():
-            self.venvMangerTh.setCMD("designer", PyPath.PYSIDE6_DESIGNER.path(path), self.file_ui.text())
+            self.venvRunner.setCMD("designer", PyPath.PYSIDE6_DESIGNER.path(path), self.file_ui.text())
         else:
-            self.venvMangerTh.setCMD("designer", PyPath.PYSIDE6_DESIGNER.path(path), )
-        self.venvMangerTh.start()
+            self.venvRunner.setCMD("designer", PyPath.PYSIDE6_DESIGNER.path(path), )
+        self.venvRunner.start()
 
         self.button_open.setEnabled(False)
 
     def open_plugin(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return
 
-        self.venvMangerTh.setPyInterpreter(path)
+        self.venvRunner.setPyInterpreter(path)
         if self.file_ui.text():
-            self.venvMangerTh.setCMD("designer_plugin", PyPath.DESIGNER_PYSIDE6.path(path), self.file_ui.text())
+            self.venvRunner.setCMD("designer_plugin", PyPath.DESIGNER_PYSIDE6.path(path), self.file_ui.text())
         else:
-            self.venvMangerTh.setCMD("designer_plugin", PyPath.DESIGNER_PYSIDE6.path(path), )
-        self.venvMangerTh.start()
+            self.venvRunner.setCMD("designer_plugin", PyPath.DESIGNER_PYSIDE6.path(path), )
+        self.venvRunner.start()
 
         self.button_open.setEnabled(False)
 
@@ -302,18 +298,14 @@ class DesignerWidget(QWidget, Ui_Form):
             Message.info("提示", "卸载中，请稍后", self)
 
     def thirdplugin(self, cmd, args):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return False
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return False
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD(cmd, args)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD(cmd, args)
+        self.venvRunner.start()
 
         self.button_designer_thirdplugin.setEnabled(False)
         self.spinner_designer_plugin_install.setState(True)
@@ -340,9 +332,9 @@ class DesignerWidget(QWidget, Ui_Form):
 
     def on_button_filepath_textChanged(self, text):
         if text and "python.exe" in text:
-            self.venvMangerTh.setPyInterpreter(text)
-            self.venvMangerTh.setCMD("py_version")
-            self.venvMangerTh.start()
+            self.venvRunner.setPyInterpreter(text)
+            self.venvRunner.setCMD("py_version")
+            self.venvRunner.start()
         else:
             self.label_ver.setText("版本: ")
             CURRENT_SETTINGS["designer"]["custom_python_path"] = ""
@@ -364,24 +356,30 @@ class DesignerWidget(QWidget, Ui_Form):
             write_config()
 
     def on_button_designer_install_clicked(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("install", "pyside6")
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("designer_install", "pyside6")
+        self.venvRunner.start()
 
         self.button_designer_install.setEnabled(False)
         self.spinner_designer_install.setState(True)
         self.spinner_designer_install.show()
         Message.info("安装", "安装中，请稍后", self)
 
+    def receive_VMoutput(self, cmd, text):
+        logging.debug(f"{cmd}: {text.rstrip()}")
+
+    def receive_VMprogress(self, cmd, progress):
+        logging.debug(f"{cmd}: {progress}")
+        if cmd == "designer_install":
+            self.spinner_designer_install.setToolTip(progressText(progress))
+        elif "thirdplugin" in cmd:
+            self.spinner_designer_plugin_install.setToolTip(progressText(progress))
+
     def receive_VMresult(self, cmd, result):
         logging.debug(f"receive_VMresult: {cmd}, {result}")
         if isinstance(result[1], list) and len(result[1]) > 5:
@@ -398,7 +396,7 @@ class DesignerWidget(QWidget, Ui_Form):
             self.label_ver.setText("版本: " + result[1].strip('\n'))
             CURRENT_SETTINGS["designer"]["custom_python_path"] = self.button_filepath.text()
             write_config()
-        elif cmd == "install":
+        elif cmd == "designer_install":
             self.button_designer_install.setEnabled(True)
             self.spinner_designer_install.setState(False)
             self.spinner_designer_install.hide()
@@ -437,71 +435,3 @@ class DesignerWidget(QWidget, Ui_Form):
                 Message.error("错误", "命令识别错误", self)
         else:
             pass
-
-
-
-class VenvManagerThread(QThread):
-
-    signal_result = Signal(str, tuple)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # self.venvManger = PyVenvManager(LIBS["pyenv"])
-        self.pyI = PyInterpreter()
-        self.stopBool = False
-
-    def stop(self):
-        self.stop = True
-
-    def setCMD(self, cmd, *args, **kwargs):
-        self.cmd = cmd
-        self.args = args
-        self.kwargs = kwargs
-
-    def setPyInterpreter(self, path):
-        self.pyI.setInterpreter(path)
-
-    def run(self):
-        cmd = self.cmd
-        if cmd == "init":
-            pass
-        elif cmd == "environ":
-            self.pyI.setEnviron(**self.kwargs)
-        elif cmd == "py_version":
-            result = self.pyI.version()
-            self.signal_result.emit(cmd, result)
-        elif cmd == "install":
-            result = self.pyI.pip(cmd, *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "thirdplugin_install":
-            result = self.pyI.pip("install", REQUIREMENTS_URLS["qfluentwidgets"]["pyside6"])
-            if not result[0]:
-                self.signal_result.emit(cmd, result)
-                return
-            result = self.pyI.pip("install", "git+" + REQUIREMENTS_URLS["qfluentexpand"] + "@pyside6")
-            self.signal_result.emit(cmd, result)
-        elif cmd == "thirdplugin_upgrade":
-            result = self.pyI.pip("install", "--upgrade", REQUIREMENTS_URLS["qfluentwidgets"]["pyside6"])
-            if not result[0]:
-                self.signal_result.emit(cmd, result)
-                return
-            result = self.pyI.pip("install", "--upgrade", "git+" + REQUIREMENTS_URLS["qfluentexpand"] + "@pyside6")
-            self.signal_result.emit(cmd, result)
-        elif cmd == "thirdplugin_uninstall":
-            result = self.pyI.pip("uninstall", "-y", REQUIREMENTS_URLS["qfluentwidgets"]["pyside6"])
-            if not result[0]:
-                self.signal_result.emit(cmd, result)
-                return
-            result = self.pyI.pip("uninstall", "-y", "qfluentexpand")
-            self.signal_result.emit(cmd, result)
-        elif cmd == "designer":
-            result = self.pyI.cmd(self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "designer_plugin":
-            result = self.pyI.py_popen(self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "designer_plugin1":
-            result = designer.main()
-            self.signal_result.emit(cmd, result)
-        else:
-            self.signal_result.emit(cmd, ["False", "未知命令"])
\ No newline at end of file
@@ -7,12 +7,11 @@ Module implementing GenerateCodeDialog.
 """
 
 
-from PySide6.QtCore import Slot, Qt, QSortFilterProxyModel, QMetaObject, QProcess, QProcessEnvironment, QRegularExpression, QSortFilterProxyModel, QSize, QCoreApplication
-from PySide6.QtGui import QBrush, QColor, QStandardItem, QStandardItemModel, QFont
+from PySide6.QtCore import Slot, Qt, QMetaObject, QSize, QCoreApplication, QTimer
+from PySide6.QtGui import QBrush, QColor, QFont
 from PySide6.QtWidgets import QWidget, QAbstractItemView, QGridLayout, QVBoxLayout, QHBoxLayout, QFrame, QSpacerItem, QSizePolicy
 import os
 import contextlib
-import simplejson as json
 
 from qframelesswindow import FramelessWindow, StandardTitleBar
 from qfluentwidgets import InfoBar, InfoBarPosition, FluentIcon, TreeView, CaptionLabel, ComboBox, PrimaryPushButton, LineEdit, qconfig, isDarkTheme
@@ -22,15 +21,15 @@ from qfluentexpand.components.card.settingcard import SettingGroupCard, ExpandCa
 from qfluentexpand.components.line.editor import Line
 
 from .Ui_GenerateCodeDialog import Ui_Form
-from .eric import ModuleParser
+from .compoments.slots import SlotsModel
+from .eric.ModuleCache import MODULE_CACHE
 from .eric.config import getConfig
 from .utils.stylesheets import StyleSheet
+from common.thread import TH_POOL
+from common.uic import FORM_INTROSPECTOR
 
-pyqtSignatureRole = Qt.ItemDataRole.UserRole + 1
-pythonSignatureRole = Qt.ItemDataRole.UserRole + 2
-returnTypeRole = Qt.ItemDataRole.UserRole + 3
-parameterTypesListRole = Qt.ItemDataRole.UserRole + 4
-parameterNamesListRole = Qt.ItemDataRole.UserRole + 5
+# 过滤输入的合并间隔(ms)
+FILTER_DELAY = 150
 
 
 class GenerateCodeDialog(FramelessWindow, Ui_Form):
@@ -124,6 +123,10 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
         self.LineEditor_filter.setReadOnly(False)
         self.LineEditor_filter.setMinimumWidth(300)
         self.LineEditor_filter.textChanged.connect(self.on_LineEditor_filter_textChanged)
+        self.filterTimer = QTimer(self)
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(FILTER_DELAY)
+        self.filterTimer.timeout.connect(self.__applyFilter)
         layout = QHBoxLayout(widget_filter)
         layout.setContentsMargins(30, 5, 30, 5)
         layout.addWidget(envLabel)
@@ -204,6 +207,7 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
         self.slotsView = TreeView(self)
         self.slotsView.setObjectName(u"slotsView")
         self.slotsView.setSortingEnabled(True)
+        self.slotsView.setUniformRowHeights(True)
         self.slotsView.setMinimumHeight(300)
         self.slotsView.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.slotsView.header().hide()
@@ -227,23 +231,47 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
             self.formName, '.py'
         )
 
-        self.slotsModel = QStandardItemModel()
-        self.proxyModel = QSortFilterProxyModel()
-        self.proxyModel.setDynamicSortFilter(True)
-        self.proxyModel.setSourceModel(self.slotsModel)
-        self.slotsView.setModel(self.proxyModel)
+        self.slotsModel = SlotsModel(self)
+        self.slotsView.setModel(self.slotsModel)
 
         # initialize some member variables
         self.__initError = False
         self.__module = None
-        print("self.__module", self.srcFile)
+        self.__form = None
+
+        # 窗体由常驻进程加载一次，同时得到对象名、类名与信号
+        self.button_new.setEnabled(False)
+        self.button_save.setEnabled(False)
+        form = FORM_INTROSPECTOR.cached(self.project["interpreter"], self.project["type"], self.formFile)
+        if form is not None:
+            self.__form = form
+            self.button_new.setEnabled(True)
+        else:
+            TH_POOL.submitUi(self.__formLoaded, FORM_INTROSPECTOR.introspect, self.project["interpreter"],
+                             self.project["type"], self.formFile, self.formPath,
+                             errback=lambda error: self.__formLoaded((False, f"Error: {error}")))
+
         if os.path.exists(self.srcFile):
-            with contextlib.suppress(ImportError):
-                splitExt = os.path.splitext(self.srcFile)
-                exts = [splitExt[1]] if len(splitExt) == 2 else None
-                self.__module = ModuleParser.readModule(
-                    self.srcFile, extensions=exts, caching=False
-                )
+            module = MODULE_CACHE.cached(self.srcFile)
+            if module is None:
+                # 未缓存或源文件已变化，后台解析完成后再填充类列表
+                self.ComboBox_classname.setEnabled(False)
+                TH_POOL.submitUi(self.__moduleParsed, MODULE_CACHE.read, self.srcFile,
+                                 errback=lambda error: self.__moduleParsed(None))
+                return
+            self.__moduleParsed(module)
+        else:
+            self.__moduleParsed(None)
+
+    def __moduleParsed(self, module):
+        """
+        Private method to fill the classes and slots from the parsed module.
+
+        @param module parsed source file or None
+        @type Module
+        """
+        self.__module = module
+        self.ComboBox_classname.setEnabled(True)
 
         if self.__module is not None:
             self.LineEdit_filename.setText(self.srcFile)
@@ -276,8 +304,28 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
                 parent=self
             )
 
-        self.button_save.setEnabled(self.ComboBox_classname.count() > 0)
+        self.button_save.setEnabled(self.__form is not None and self.ComboBox_classname.count() > 0)
+
+        self.__updateSlotsModel()
+
+    def __formLoaded(self, result):
+        """
+        Private method to handle the introspection result of the form.
+
+        @param result [True, form data] or (False, error message)
+        @type list or tuple
+        """
+        if not result[0]:
+            Message.error(
+                title="uic error",
+                content=f"There was an error loading the form {self.formFile}. {result[1]}",
+                parent=self
+            )
+            return
 
+        self.__form = result[1]
+        self.button_new.setEnabled(True)
+        self.button_save.setEnabled(self.ComboBox_classname.count() > 0)
         self.__updateSlotsModel()
 
     def __objectName(self):
@@ -287,13 +335,7 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
         @return object name
         @rtype str
         """
-        objectName = ""
-
-        output, ok = self.__runUicLoadUi("object_name")
-        if ok and output:
-            objectName = output
-
-        return objectName
+        return self.__form["object_name"] if self.__form is not None else ""
 
     def __className(self):
         """
@@ -302,13 +344,7 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
         @return class name
         @rtype str
         """
-        className = ""
-
-        output, ok = self.__runUicLoadUi("class_name")
-        if ok and output:
-            className = output
-
-        return className
+        return self.__form["class_name"] if self.__form is not None else ""
 
     def __signatures(self):
         """
@@ -338,129 +374,17 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
                         signatures.append(meth.name)
         return signatures
 
-    def __runUicLoadUi(self, command):
-        """
-        Private method to run the UicLoadUi.py script with the given command
-        and return the output.
-
-        @param command uic command to be run
-        @type str
-        @return tuple of process output and error flag
-        @rtype tuple of (str, bool)
-        """
-        env = QProcessEnvironment.systemEnvironment()
-
-        if self.project["type"] in ("PyQt5", "PySide2"):
-            loadUi = os.path.join(os.path.dirname(__file__), "eric/uic", "UicLoadUi5.py")
-        elif self.project["type"] in ("PyQt6", "E7Plugin"):
-            loadUi = os.path.join(os.path.dirname(__file__), "eric/uic", "UicLoadUi6.py")
-        elif self.project["type"] in ("PySide6"):
-            loadUi = os.path.join(os.path.dirname(__file__), "eric/uic", "UicLoadUipy6.py")
-        args = [
-            loadUi,
-            command,
-            self.formFile,
-            self.formPath,
-        ]
-
-        uicText = ""
-        ok = False
-
-        proc = QProcess()
-        proc.setWorkingDirectory(self.formPath)
-        proc.setWorkingDirectory(self.formPath)
-        proc.setProcessEnvironment(env)
-        proc.start(self.project["interpreter"], args)
-        started = proc.waitForStarted(5000)
-        finished = proc.waitForFinished(30000)
-        if started and finished:
-            output = proc.readAllStandardError()
-            outText = str(output, "utf-8", "replace")
-            if "@@eric_start@@" in outText:
-                # it is something we sent via UicLoadUi[56].py
-                outText = outText.split("@@eric_start@@")[1]
-                ok = True
-            elif "@@eric_error@@" in outText:
-                # it is something we sent via UicLoadUi[56].py
-                outText = outText.split("@@eric_error@@")[1]
-                ok = False
-            else:
-                ok = False
-            if "@@eric_end@@" in outText:
-                # it is something we sent via UicLoadUi[56].py
-                outText = outText.split("@@eric_end@@")[0]
-            if ok:
-                uicText = outText.strip()
-            else:
-                Message.error(
-                    title="uic error",
-                    content=f"There was an error loading the form {self.formFile}. error: {outText}",
-                    parent=self
-                )
-        else:
-            Message.error(
-                title="uic error",
-                content=f"The project specific Python interpreter {self.project['interpreter']}.ould not be started or did not finish within 30 seconds.",
-                parent=self
-            )
-
-        return uicText, ok
-
     def __updateSlotsModel(self):
         self.LineEditor_filter.clear()
 
-        output, ok = self.__runUicLoadUi("signatures")
-        if ok and output:
-            try:
-                objectsList = json.loads(output.strip())
-
-                signatureList = self.__signatures()
-
-                self.slotsModel.clear()
-                self.slotsModel.setHorizontalHeaderLabels([""])
-                for objectDict in objectsList:
-                    itm = QStandardItem(
-                        "{0} ({1})".format(objectDict["name"], objectDict["class_name"])
-                    )
-                    self.slotsModel.appendRow(itm)
-                    for methodDict in objectDict["methods"]:
-                        itm2 = QStandardItem(methodDict["signature"])
-                        itm.appendRow(itm2)
-
-                        if self.__module is not None and (
-                                methodDict["methods"][0] in signatureList
-                                or methodDict["methods"][1] in signatureList
-                        ):
-                            itm2.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                            itm2.setCheckState(Qt.CheckState.Checked)
-                            continue
-
-                        itm2.setData(methodDict["pyqt_signature"], pyqtSignatureRole)
-                        itm2.setData(
-                            methodDict["python_signature"], pythonSignatureRole
-                        )
-                        itm2.setData(methodDict["return_type"], returnTypeRole)
-                        itm2.setData(
-                            methodDict["parameter_types"], parameterTypesListRole
-                        )
-                        itm2.setData(
-                            methodDict["parameter_names"], parameterNamesListRole
-                        )
-
-                        itm2.setFlags(
-                            Qt.ItemFlag.ItemIsUserCheckable
-                            | Qt.ItemFlag.ItemIsEnabled
-                            | Qt.ItemFlag.ItemIsSelectable
-                        )
-                        itm2.setCheckState(Qt.CheckState.Unchecked)
+        if self.__form is None:
+            # 窗体仍在后台加载，完成后再次调用
+            return
 
-                self.slotsView.sortByColumn(0, Qt.SortOrder.AscendingOrder)
-            except json.JSONDecodeError as err:
-                Message.error(
-                    title="Update Slots List",
-                    content=f"The update of the slots list failed because invalid data was received. Error: {str(err)} Data: {output}",
-                    parent=self
-                )
+        self.slotsModel.setSignatures(
+            self.__form["signatures"], self.__signatures() if self.__module is not None else ()
+        )
+        self.slotsView.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
     def __generateCode(self):
         """
@@ -576,62 +500,55 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
 
         pyqtSignatureFormat = ("@Slot({0})")
 
-        for row in range(self.slotsModel.rowCount()):
-            topItem = self.slotsModel.item(row)
-            for childRow in range(topItem.rowCount()):
-                child = topItem.child(childRow)
-                if child.checkState() == Qt.CheckState.Checked and (
-                    child.flags() & Qt.ItemFlag.ItemIsUserCheckable
-                    == Qt.ItemFlag.ItemIsUserCheckable
-                ):
-                    slotsCode.append("\n")
-                    slotsCode.append(
-                        "{0}{1}\n".format(
-                            indentStr,
-                            pyqtSignatureFormat.format(child.data(pyqtSignatureRole)),
+        for methodDict in self.slotsModel.checkedSignals():
+            slotsCode.append("\n")
+            slotsCode.append(
+                "{0}{1}\n".format(
+                    indentStr,
+                    pyqtSignatureFormat.format(methodDict["pyqt_signature"]),
+                )
+            )
+            slotsCode.append(
+                "{0}def {1}:\n".format(
+                    indentStr, methodDict["python_signature"]
+                )
+            )
+            indentStr2 = indentStr * 2
+            slotsCode.append('{0}"""\n'.format(indentStr2))
+            slotsCode.append(
+                "{0}Slot documentation goes here.\n".format(indentStr2)
+            )
+            if methodDict["return_type"] or methodDict["parameter_types"]:
+                slotsCode.append("\n")
+                if methodDict["parameter_types"]:
+                    for name, type_ in zip(
+                        methodDict["parameter_names"],
+                        methodDict["parameter_types"],
+                    ):
+                        slotsCode.append(
+                            "{0}@param {1} DESCRIPTION\n".format(
+                                indentStr2, name
+                            )
                         )
-                    )
-                    slotsCode.append(
-                        "{0}def {1}:\n".format(
-                            indentStr, child.data(pythonSignatureRole)
+                        slotsCode.append(
+                            "{0}@type {1}\n".format(indentStr2, type_)
                         )
-                    )
-                    indentStr2 = indentStr * 2
-                    slotsCode.append('{0}"""\n'.format(indentStr2))
-                    slotsCode.append(
-                        "{0}Slot documentation goes here.\n".format(indentStr2)
-                    )
-                    if child.data(returnTypeRole) or child.data(parameterTypesListRole):
-                        slotsCode.append("\n")
-                        if child.data(parameterTypesListRole):
-                            for name, type_ in zip(
-                                child.data(parameterNamesListRole),
-                                child.data(parameterTypesListRole),
-                            ):
-                                slotsCode.append(
-                                    "{0}@param {1} DESCRIPTION\n".format(
-                                        indentStr2, name
-                                    )
-                                )
-                                slotsCode.append(
-                                    "{0}@type {1}\n".format(indentStr2, type_)
-                                )
-                        if child.data(returnTypeRole):
-                            slotsCode.append(
-                                "{0}@returns DESCRIPTION\n".format(indentStr2)
-                            )
-                            slotsCode.append(
-                                "{0}@rtype {1}\n".format(
-                                    indentStr2, child.data(returnTypeRole)
-                                )
-                            )
-                    slotsCode.append('{0}"""\n'.format(indentStr2))
+                if methodDict["return_type"]:
                     slotsCode.append(
-                        "{0}# {1}: not implemented yet\n".format(indentStr2, "TODO")
+                        "{0}@returns DESCRIPTION\n".format(indentStr2)
                     )
                     slotsCode.append(
-                        "{0}raise NotImplementedError\n".format(indentStr2)
+                        "{0}@rtype {1}\n".format(
+                            indentStr2, methodDict["return_type"]
+                        )
                     )
+            slotsCode.append('{0}"""\n'.format(indentStr2))
+            slotsCode.append(
+                "{0}# {1}: not implemented yet\n".format(indentStr2, "TODO")
+            )
+            slotsCode.append(
+                "{0}raise NotImplementedError\n".format(indentStr2)
+            )
 
         if appendAtIndex == -1:
             sourceImpl.extend(slotsCode)
@@ -669,7 +586,7 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
         @param _index index of the activated item (unused)
         @type int
         """
-        self.button_save.setEnabled(True)
+        self.button_save.setEnabled(self.__form is not None)
         self.__updateSlotsModel()
 
     def on_LineEditor_filter_textChanged(self, text):
@@ -679,10 +596,14 @@ class GenerateCodeDialog(FramelessWindow, Ui_Form):
         @param text new filter text
         @type str
         """
-        rx = QRegularExpression(
-            text, QRegularExpression.PatternOption.CaseInsensitiveOption
-        )
-        self.proxyModel.setFilterRegularExpression(rx)
+        # 连续输入时合并为一次过滤
+        self.filterTimer.start()
+
+    def __applyFilter(self):
+        """
+        Private slot to filter the slots with the current filter text.
+        """
+        self.slotsModel.setFilterText(self.LineEditor_filter.text())
 
     def on_button_new_clicked(self):
         self.generate_class_card.show()
@@ -7,29 +7,32 @@ Module implementing MainWindow.
 """
 
 
-from PySide6.QtCore import Slot, QThread
+from PySide6.QtCore import Qt, Slot, QThread, QTimer
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QWidget, QGridLayout
+from PySide6.QtWidgets import QApplication, QWidget, QGridLayout
 import os
 
-from qfluentwidgets import NavigationItemPosition, PipsPager
+from qfluentwidgets import NavigationItemPosition, PipsPager, Theme, setTheme
 from qfluentwidgets.common.icon import isDarkTheme, FluentIconBase, FluentIcon as FIF
 
 from qfluentexpand.window.fluent_window import FluentWindow
 
 from .Ui_MainWindow import Ui_Form
 from .HomeWidget import HomeWidget
-from .ProjectWidget import ProjectWidget
-from .DesignerWidget import DesignerWidget
-from .PackWidget import PackWidget
-from .DocumentWidget import DocumentWidget
-from .SettingWidget import SettingWidget
-from .ConsoleWidget import ConsoleWidget
-from .OtherWidget import OtherWidget
+from .compoments.page import LazyPage
+from common.trace import TRACE
 
 from .utils.icon import AppIcon
 from .utils.stylesheets import StyleSheet
-from manage import APPNAME, UI_CONFIG, RUNTIMEENV, BUNDLE_DIR, PAGEWidgets
+from .utils.config import write_config
+from manage import APPNAME, UI_CONFIG, RUNTIMEENV, BUNDLE_DIR, PAGEWidgets, CURRENT_SETTINGS
+
+
+# 首次显示后开始预热页面的延迟(ms)，每个页面之间让出事件循环
+# 只预热项目页与上次关闭时所在的页面，其余页面在首次打开时构建
+# (设置页构建时会启动 pyenv 初始化任务，不应在用户未打开时执行)
+PREWARM_DELAY = 300
+PREWARM_INTERVAL = 50
 
 
 class MainWindow(FluentWindow, Ui_Form):
@@ -47,6 +50,7 @@ class MainWindow(FluentWindow, Ui_Form):
         super().__init__(parent)
         self.setupUi(self)
 
+        self.initTheme()
         self.initNavi()
 
         self.initWidget()
@@ -66,30 +70,36 @@ class MainWindow(FluentWindow, Ui_Form):
         PAGEWidgets["navi"] = self.navigationInterface
 
         # create sub interface
-        self.home = HomeWidget(self)
+        # 首页立即构建，其余页面在首次打开或预热时构建
+        with TRACE.span("page home"):
+            self.home = HomeWidget(self)
         PAGEWidgets["home"] = self.home
 
-        self.project = ProjectWidget(self)
+        self.project = self.lazyPage("project", "ProjectWidget")
         PAGEWidgets["project"] = self.project
 
-        self.designer = DesignerWidget(self)
+        self.designer = self.lazyPage("designer", "DesignerWidget")
         PAGEWidgets["designer"] = self.designer
 
-        self.pack = PackWidget(self)
+        self.pack = self.lazyPage("pack", "PackWidget")
         PAGEWidgets["pack"] = self.pack
 
-        self.other = OtherWidget(self)
+        self.other = self.lazyPage("other", "OtherWidget")
         PAGEWidgets["other"] = self.other
 
-        self.console = ConsoleWidget(self)
+        self.console = self.lazyPage("console", "ConsoleWidget")
         PAGEWidgets["console"] = self.console
 
-        self.document = DocumentWidget(self)
+        self.document = self.lazyPage("document", "DocumentWidget")
         PAGEWidgets["document"] = self.document
 
-        self.settings = SettingWidget(self)
+        self.settings = self.lazyPage("setting", "SettingWidget")
         PAGEWidgets["settings"] = self.settings
 
+        lastPage = self.findChild(LazyPage, CURRENT_SETTINGS["window"]["last_page"])
+        self.prewarmPages = [self.project] + ([lastPage] if lastPage not in (None, self.project) else [])
+        self.prewarmStarted = False
+
         self.addSubInterface(
             self.home,
             AppIcon.HOME,
@@ -142,6 +152,47 @@ class MainWindow(FluentWindow, Ui_Form):
             NavigationItemPosition.BOTTOM
         )
 
+    def closeEvent(self, event):
+        # 记录当前页面，下次启动时预热
+        CURRENT_SETTINGS["window"]["last_page"] = self.stackedWidget.currentWidget().objectName()
+        write_config()
+        super().closeEvent(event)
+
+    def lazyPage(self, objectName, className):
+        return LazyPage(objectName, f".{className}", className, package=__package__, parent=self)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.prewarmStarted:
+            self.prewarmStarted = True
+            QTimer.singleShot(PREWARM_DELAY, self.prewarm)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if TRACE.enabled and not TRACE.summarized:
+            # 本次绘制完成并提交后再记录
+            QTimer.singleShot(0, TRACE.firstPaint)
+
+    def prewarm(self):
+        """
+        在空闲时逐个构建尚未构建的页面，每次只构建一个，保持界面响应
+        """
+        if QApplication.mouseButtons() != Qt.MouseButton.NoButton or QApplication.activePopupWidget():
+            # 用户正在操作(拖动、菜单)，稍后再试
+            QTimer.singleShot(PREWARM_INTERVAL, self.prewarm)
+            return
+        while self.prewarmPages:
+            page = self.prewarmPages.pop(0)
+            if not page.isBuilt():
+                page.widget()
+                QTimer.singleShot(PREWARM_INTERVAL, self.prewarm)
+                return
+
+    def initTheme(self):
+        # 设置页延迟构建，主题在页面构建前应用
+        if CURRENT_SETTINGS["settings"]["theme"] == "Dark" and not isDarkTheme():
+            setTheme(Theme.DARK)
+
     def initWidget(self):
         self.resize(900, 700)
         self.setWindowTitle(APPNAME)
@@ -5,7 +5,7 @@ Module implementing OtherWidget.
 """
 
 
-from PySide6.QtCore import Slot, QRect, Qt, QThread, Signal
+from PySide6.QtCore import Slot, QRect, Qt, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QWidget, QGridLayout, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, QMessageBox
 import os
@@ -42,6 +42,10 @@ from .utils.icon import AppIcon
 from .utils.tool import startCMD
 from .compoments.info import Message
 from common.py import PyInterpreter, PyPath
+from common.runner import VenvRunner
+from common.pipplan import progressText
+from common.metadata import METADATA
+from common.thread import TH_POOL
 from common.pyinstaller import PyinstallerPackage
 from common.pipreqs import Pipreqs
 
@@ -72,8 +76,10 @@ class OtherWidget(QWidget, Ui_Form):
         self.gridLayout1.setSpacing(30)
         self.gridLayout1.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        self.venvMangerTh = VenvManagerThread()
-        self.venvMangerTh.signal_result.connect(self.receive_VMresult)
+        self.venvRunner = VenvRunner(self)
+        self.venvRunner.signal_result.connect(self.receive_VMresult)
+        self.venvRunner.signal_output.connect(self.receive_VMoutput)
+        self.venvRunner.signal_progress.connect(self.receive_VMprogress)
 
         self.initTitle()
         self.initWidget()
@@ -313,18 +319,14 @@ class OtherWidget(QWidget, Ui_Form):
             Message.info("提示", "卸载中，请稍后", self)
 
     def pipreqs(self, cmd, args):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return False
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return False
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD(cmd, args)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD(cmd, args)
+        self.venvRunner.start()
 
         self.button_pipreqs.setEnabled(False)
         self.spinner_pipreqs.setState(True)
@@ -333,10 +335,6 @@ class OtherWidget(QWidget, Ui_Form):
         return True
 
     def generate_requirements(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         folder = self.button_env_folder.text()
         if not folder or folder == "选择":
             Message.error("错误", "请选择项目根目录", self)
@@ -347,6 +345,17 @@ class OtherWidget(QWidget, Ui_Form):
             Message.error("错误", "python解释器获取失败", self)
             return
 
+        # 工具检查需要读取解释器元数据，放到后台执行，完成前禁止重复点击
+        self.button_requirements.setEnabled(False)
+        TH_POOL.submitUi(lambda tools: self.__pipreqsChecked(folder, path, tools), METADATA.tools, path,
+                         errback=lambda error: self.__pipreqsChecked(folder, path, None))
+
+    def __pipreqsChecked(self, folder, path, tools):
+        if not tools or not tools["pipreqs"]:
+            self.button_requirements.setEnabled(True)
+            Message.error("错误", "pipreqs 未安装，请先安装", self)
+            return
+
         with open(os.path.join(ROOT_PATH, SettingPath, "pipreqs.json"), "r") as f:
             data = json.load(f)
             Pipreqs.PIPREQS_PARAMS.clear()
@@ -355,9 +364,9 @@ class OtherWidget(QWidget, Ui_Form):
 
         cmd = PyPath.PIPREQS.path(path) + ' ' + folder + ' ' + Pipreqs().getCMD()
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("generate_requirements", cmd)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("generate_requirements", cmd)
+        self.venvRunner.start()
 
         self.button_requirements.setEnabled(False)
         self.spinner_requirements.setState(True)
@@ -366,10 +375,6 @@ class OtherWidget(QWidget, Ui_Form):
         Message.info("提示", "生成中，请稍后", self)
 
     def install_requirements(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         folder = self.button_env_folder.text()
         if not folder or folder == "选择":
             Message.error("错误", "请选择项目根目录", self)
@@ -384,9 +389,9 @@ class OtherWidget(QWidget, Ui_Form):
             Message.error("错误", "requirements.txt 不存在", self)
             return
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("install_requirements", "-r", os.path.join(folder, "requirements.txt"))
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("install_requirements", "-r", os.path.join(folder, "requirements.txt"))
+        self.venvRunner.start()
 
         self.button_requirements.setEnabled(False)
         self.spinner_requirements.setState(True)
@@ -430,9 +435,9 @@ class OtherWidget(QWidget, Ui_Form):
 
     def on_button_filepath_textChanged(self, text):
         if text and "python.exe" in text:
-            self.venvMangerTh.setPyInterpreter(text)
-            self.venvMangerTh.setCMD("py_version")
-            self.venvMangerTh.start()
+            self.venvRunner.setPyInterpreter(text)
+            self.venvRunner.setCMD("py_version")
+            self.venvRunner.start()
         else:
             self.label_ver.setText("版本: ")
             CURRENT_SETTINGS["other"]["custom_python_path"] = ""
@@ -468,21 +473,9 @@ class OtherWidget(QWidget, Ui_Form):
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return False
-        cmd = ''
-        if self.comboBox_generate_code_type.currentText() == "PySide2":
-            cmd = PyPath.PYSIDE6_UIC.path(path)
-        elif self.comboBox_generate_code_type.currentText() == "PySide6":
-            cmd = PyPath.PYSIDE6_UIC.path(path)
-        elif self.comboBox_generate_code_type.currentText() == "PyQt5":
-            cmd = PyPath.PYQT5_UIC.path(path)
-        elif self.comboBox_generate_code_type.currentText() == "PyQt6":
-            cmd = PyPath.PYQT6_UIC.path(path)
-        (filePath, fileName) = os.path.split(file)
-        outFile = os.path.join(filePath, 'Ui_' + fileName.replace('ui', 'py'))
-
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("generate_code", cmd, file, '-o', outFile)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("uic_compile", self.comboBox_generate_code_type.currentText(), os.path.dirname(file), file)
+        self.venvRunner.start()
 
         self.button_generate_code.setEnabled(False)
         self.spinner_generate_code.setState(True)
@@ -531,9 +524,9 @@ class OtherWidget(QWidget, Ui_Form):
             Message.error("错误", "python解释器获取失败", self)
             return False
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("install_whl", file)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("install_whl", file)
+        self.venvRunner.start()
 
         self.button_whl.setEnabled(False)
         self.spinner_whl.setState(True)
@@ -555,9 +548,9 @@ class OtherWidget(QWidget, Ui_Form):
             Message.error("错误", "python解释器获取失败", self)
             return False
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("uninstall_whl", file)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("uninstall_whl", file)
+        self.venvRunner.start()
 
         self.button_whl.setEnabled(False)
         self.spinner_whl.setState(True)
@@ -565,6 +558,18 @@ class OtherWidget(QWidget, Ui_Form):
 
         Message.info("提示", "正在卸载，请稍后", self)
 
+    def receive_VMoutput(self, cmd, text):
+        logging.debug(f"{cmd}: {text.rstrip()}")
+
+    def receive_VMprogress(self, cmd, progress):
+        logging.debug(f"{cmd}: {progress}")
+        if "pipreqs" in cmd:
+            self.spinner_pipreqs.setToolTip(progressText(progress))
+        elif cmd == "install_requirements":
+            self.spinner_requirements.setToolTip(progressText(progress))
+        elif cmd.endswith("_whl"):
+            self.spinner_whl.setToolTip(progressText(progress))
+
     def receive_VMresult(self,  cmd, result):
         logging.debug(f"receive_VMresult: {cmd}, {result}")
         if isinstance(result[1], list) and len(result[1]) > 5:
@@ -607,6 +612,16 @@ class OtherWidget(QWidget, Ui_Form):
                 Message.info("提示", "安装成功", self)
             elif "generate" in cmd:
                 Message.info("提示", "生成成功", self)
+        elif cmd == "uic_compile":
+            self.button_generate_code.setEnabled(True)
+            self.spinner_generate_code.setState(False)
+            self.spinner_generate_code.hide()
+
+            if not result[0]:
+                Message.error("错误", output, self)
+                return
+
+            Message.info("提示", "生成成功" if result[1]["compiled"] else "未变化，已跳过", self)
         elif "generate_code" in cmd:
             self.button_generate_code.setEnabled(True)
             self.spinner_generate_code.setState(False)
@@ -640,65 +655,3 @@ class OtherWidget(QWidget, Ui_Form):
 
         else:
             pass
-
-
-class VenvManagerThread(QThread):
-
-    signal_result = Signal(str, tuple)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # self.venvManger = PyVenvManager(LIBS["pyenv"])
-        self.pyI = PyInterpreter()
-        self.stopBool = False
-
-    def stop(self):
-        try:
-            self.stopBool = True
-            self.pyI.stop()
-            self.terminate()
-        except Exception as e:
-            print(e)
-
-    def setCMD(self, cmd, *args, **kwargs):
-        self.cmd = cmd
-        self.args = args
-        self.kwargs = kwargs
-
-    def setPyInterpreter(self, path):
-        self.interpreter = path
-        self.pyI.setInterpreter(path)
-
-    def run(self):
-        cmd = self.cmd
-        if cmd == "init":
-            pass
-        elif cmd == "py_version":
-            result = self.pyI.version()
-            self.signal_result.emit(cmd, result)
-        elif "pipreqs" in cmd:
-            if "uninstall" in cmd:
-                result = self.pyI.pip("uninstall", '-y', *self.args)
-            elif "install" in cmd:
-                result = self.pyI.pip("install", *self.args)
-            elif "upgrade" in cmd:
-                result = self.pyI.pip("install", "--upgrade", *self.args)
-
-            self.signal_result.emit(cmd, result)
-        elif "generate_code" in cmd:
-            result = self.pyI.cmd(self.args)
-            self.signal_result.emit(cmd, result)
-        elif "generate" in cmd:
-            result = self.pyI.cmd(self.args[0])
-            self.signal_result.emit(cmd, result)
-        elif "install_requirements" in cmd:
-            result = self.pyI.pip("install", *self.args)
-            self.signal_result.emit(cmd, result)
-        elif "uninstall_whl" in cmd:
-            result = self.pyI.pip("uninstall", '-y', *self.args)
-            self.signal_result.emit(cmd, result)
-        elif "install_whl" in cmd:
-            result = self.pyI.pip("install", *self.args)
-            self.signal_result.emit(cmd, result)
-        else:
-            self.signal_result.emit(cmd, ["False", "未知命令"])
\ No newline at end of file
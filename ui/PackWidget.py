@@ -7,7 +7,7 @@ Module implementing PackWidget.
 """
 
 
-from PySide6.QtCore import Slot, QRect, Qt, QThread, Signal
+from PySide6.QtCore import Slot, QRect, Qt, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QWidget, QGridLayout, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, QMessageBox
 import os
@@ -44,6 +44,10 @@ from .utils.tool import startCMD
 from .compoments.info import Message
 from common.pyenv import PyVenvManager
 from common.py import PyInterpreter, PyPath
+from common.runner import VenvRunner
+from common.pipplan import progressText
+from common.metadata import METADATA
+from common.thread import TH_POOL
 from common.pyinstaller import PyinstallerPackage
 from common.nuitka import NuitkaPackage
 from manage import ROOT_PATH, SettingPath, LIBS, SETTINGS, CURRENT_SETTINGS, REQUIREMENTS_URLS
@@ -72,8 +76,10 @@ class PackWidget(QWidget, Ui_Form):
         self.gridLayout1.setSpacing(30)
         self.gridLayout1.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        self.venvMangerTh = VenvManagerThread()
-        self.venvMangerTh.signal_result.connect(self.receive_VMresult)
+        self.venvRunner = VenvRunner(self)
+        self.venvRunner.signal_result.connect(self.receive_VMresult)
+        self.venvRunner.signal_output.connect(self.receive_VMoutput)
+        self.venvRunner.signal_progress.connect(self.receive_VMprogress)
 
         self.initTitle()
         self.initWidget()
@@ -338,20 +344,16 @@ class PackWidget(QWidget, Ui_Form):
         return path
 
     def open_stop(self):
-        if not self.venvMangerTh.isRunning():
+        if not self.venvRunner.isRunning():
             return
 
-        self.venvMangerTh.stop()
+        self.venvRunner.stop()
         self.spinner_open.setState(False)
         self.spinner_open.hide()
 
         Message.info("提示", "线程已停止", self)
 
     def open_pyinstaller(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         if not self.button_filepath_main.text() or self.button_filepath_main.text() == "选择":
             Message.error("错误", "请选择程序入口", self)
             return
@@ -367,6 +369,17 @@ class PackWidget(QWidget, Ui_Form):
         if not Path(path).is_absolute():
             path = str(Path(path).absolute())
 
+        # 工具检查需要读取解释器元数据，放到后台执行，完成前禁止重复点击
+        self.button_open.setEnabled(False)
+        TH_POOL.submitUi(lambda tools: self.__pyinstallerChecked(path, tools), METADATA.tools, path,
+                         errback=lambda error: self.__pyinstallerChecked(path, None))
+
+    def __pyinstallerChecked(self, path, tools):
+        self.button_open.setEnabled(True)
+        if not tools or not tools["pyinstaller"]:
+            Message.error("错误", "pyinstaller 未安装，请先安装", self)
+            return
+
         with open(os.path.join(ROOT_PATH, SettingPath, "pyinstaller.json"), "r") as f:
             try:
                 data = json.load(f)
@@ -436,10 +449,10 @@ class PackWidget(QWidget, Ui_Form):
         if tmp:
             PyinstallerPackage.PYINSTALLER_PARAMS["outName"] = ''
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setEnviron(PYTHONPATH=(';').join(pythonPath))
-        self.venvMangerTh.setCMD("pack_pyinstaller", cmd, cmd1)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setEnviron(PYTHONPATH=(';').join(pythonPath))
+        self.venvRunner.setCMD("pack_pyinstaller", cmd, cmd1)
+        self.venvRunner.start()
 
         self.spinner_open.setState(True)
         self.spinner_open.show()
@@ -447,10 +460,6 @@ class PackWidget(QWidget, Ui_Form):
         Message.info("提示", "打包中，请稍后", self)
 
     def open_nuitka(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         if not self.button_filepath_main.text() or self.button_filepath_main.text() == "选择":
             Message.error("错误", "请选择程序入口", self)
             return
@@ -547,10 +556,10 @@ class PackWidget(QWidget, Ui_Form):
         if tmp:
             NuitkaPackage.NUITKA_PARAMS["output-filename"] = ''
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setEnviron(PYTHONPATH=(';').join(pythonPath))
-        self.venvMangerTh.setCMD("pack_nuitka", cmd, cmd1)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setEnviron(PYTHONPATH=(';').join(pythonPath))
+        self.venvRunner.setCMD("pack_nuitka", cmd, cmd1)
+        self.venvRunner.start()
 
         self.spinner_open.setState(True)
         self.spinner_open.show()
@@ -558,10 +567,6 @@ class PackWidget(QWidget, Ui_Form):
         Message.info("提示", "打包中，请稍后", self)
 
     def open_setup(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         file = self.button_filepath_setup.text()
         if not file or file == "选择":
             Message.error("错误", "请选择setup.py", self)
@@ -579,9 +584,9 @@ class PackWidget(QWidget, Ui_Form):
 
         cmd = "cd /d " + filepath + '&&' + f" {path} {filename} build " + '&&' + f" {path} {filename} sdist " + '&&' + f" {path} {filename} bdist_wheel"
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("pack_setup", cmd)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("pack_setup", cmd)
+        self.venvRunner.start()
 
         self.spinner_open.setState(True)
         self.spinner_open.show()
@@ -601,18 +606,14 @@ class PackWidget(QWidget, Ui_Form):
             Message.info("提示", "卸载中，请稍后", self)
 
     def pyinstaller(self, cmd, args):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return False
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return False
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD(cmd, args)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD(cmd, args)
+        self.venvRunner.start()
 
         self.button_pyinstaller.setEnabled(False)
         self.spinner_pyinstaller.setState(True)
@@ -633,18 +634,14 @@ class PackWidget(QWidget, Ui_Form):
             Message.info("提示", "卸载中，请稍后", self)
 
     def nuitka(self, cmd, args):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return False
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return False
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD(cmd, args)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD(cmd, args)
+        self.venvRunner.start()
 
         self.button_nuitka.setEnabled(False)
         self.spinner_nuitka.setState(True)
@@ -680,9 +677,9 @@ class PackWidget(QWidget, Ui_Form):
 
     def on_button_filepath_textChanged(self, text):
         if text and "python.exe" in text:
-            self.venvMangerTh.setPyInterpreter(text)
-            self.venvMangerTh.setCMD("py_version")
-            self.venvMangerTh.start()
+            self.venvRunner.setPyInterpreter(text)
+            self.venvRunner.setCMD("py_version")
+            self.venvRunner.start()
         else:
             self.label_ver.setText("版本: ")
             CURRENT_SETTINGS["pack"]["custom_python_path"] = ""
@@ -726,10 +723,6 @@ class PackWidget(QWidget, Ui_Form):
         os.system(f'notepad {os.path.join(ROOT_PATH, SettingPath, "nuitka.json")}')
 
     def on_button_setuptools_clicked(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
@@ -737,9 +730,9 @@ class PackWidget(QWidget, Ui_Form):
         if not Path(path).is_absolute():
             path = str(Path(path).absolute())
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("setuptools_install", "setuptools")
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("setuptools_install", "setuptools")
+        self.venvRunner.start()
 
         self.button_setup_action.setEnabled(False)
         self.spinner_setup_action.setState(True)
@@ -764,10 +757,6 @@ class PackWidget(QWidget, Ui_Form):
             Message.error("错误", "文件不存在", self)
             return
 
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "env忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
@@ -780,9 +769,9 @@ class PackWidget(QWidget, Ui_Form):
 
         cmd = "cd /d " + filepath + '&&' + f" {path} {filename} install "
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("setup_install", cmd)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("setup_install", cmd)
+        self.venvRunner.start()
 
         self.button_setup_action.setEnabled(False)
         self.spinner_setup_action.setState(True)
@@ -800,6 +789,22 @@ class PackWidget(QWidget, Ui_Form):
             Message.error("错误", "文件不存在", self)
             return
 
+    def receive_VMoutput(self, cmd, text):
+        logging.debug(f"{cmd}: {text.rstrip()}")
+        if "pack" in cmd:
+            lines = text.strip().splitlines()
+            if lines:
+                self.spinner_open.setToolTip(lines[-1])
+
+    def receive_VMprogress(self, cmd, progress):
+        logging.debug(f"{cmd}: {progress}")
+        if cmd.startswith("pyinstaller_"):
+            self.spinner_pyinstaller.setToolTip(progressText(progress))
+        elif cmd.startswith("nuitka_"):
+            self.spinner_nuitka.setToolTip(progressText(progress))
+        elif cmd == "setuptools_install":
+            self.spinner_setuptools.setToolTip(progressText(progress))
+
     def receive_VMresult(self, cmd, result):
         logging.debug(f"receive_VMresult: {cmd}, {result[1]}")
         if isinstance(result[1], list) and len(result[1]) > 5:
@@ -927,96 +932,3 @@ class PackWidget(QWidget, Ui_Form):
             pass
         else:
             pass
-
-
-class VenvManagerThread(QThread):
-
-    signal_result = Signal(str, tuple)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # self.venvManger = PyVenvManager(LIBS["pyenv"])
-        self.pyI = PyInterpreter()
-        self.stopBool = False
-
-    def stop(self):
-        try:
-            self.stopBool = True
-            self.pyI.stop()
-            self.terminate()
-        except Exception as e:
-            print(e)
-
-    def setCMD(self, cmd, *args, **kwargs):
-        self.cmd = cmd
-        self.args = args
-        self.kwargs = kwargs
-
-    def setPyInterpreter(self, path):
-        self.interpreter = path
-        self.pyI.setInterpreter(path)
-
-    def setEnviron(self, **kwargs):
-        self.pyI.setEnviron(**kwargs)
-
-    def run(self):
-        cmd = self.cmd
-        if cmd == "init":
-            pass
-        elif cmd == "environ":
-            self.pyI.setEnviron(**self.kwargs)
-        elif cmd == "py_version":
-            result = self.pyI.version()
-            self.signal_result.emit(cmd, result)
-        elif cmd == "pyinstaller_install":
-            result = self.pyI.pip("install", *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "pyinstaller_upgrade":
-            result = self.pyI.pip("install", "--upgrade", *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "pyinstaller_uninstall":
-            result = self.pyI.pip("uninstall", '-y', *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "nuitka_install":
-            result = self.pyI.pip("install", *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "nuitka_upgrade":
-            result = self.pyI.pip("install", "--upgrade", *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "nuitka_uninstall":
-            result = self.pyI.pip("uninstall", '-y', *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "pack_pyinstaller":
-            start = time.time()
-            result = self.pyI.popen(self.args[0])
-            if result[0]:
-                self.pyI.cmd(self.args[1])
-            else:
-                self.signal_result.emit(cmd, result)
-                return
-
-            result.append(time.time() - start)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "pack_nuitka":
-            start = time.time()
-            result = self.pyI.popen(self.args[0])
-            if result[0]:
-                self.pyI.cmd(self.args[1])
-            else:
-                self.signal_result.emit(cmd, result)
-                return
-            if len(result) > 50:
-                result = result[-50:]
-            result.append(time.time() - start)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "pack_setup":
-            result = self.pyI.popen(self.args[0])
-            self.signal_result.emit(cmd, result)
-        elif cmd == "setuptools_install":
-            result = self.pyI.pip("install", "--upgrade", *self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "setup_install":
-            result = self.pyI.popen(self.args[0])
-            self.signal_result.emit(cmd, result)
-        else:
-            self.signal_result.emit(cmd, ["False", "未知命令"])
\ No newline at end of file
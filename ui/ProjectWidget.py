@@ -7,12 +7,12 @@ Module implementing ProjectWidget.
 """
 
 
-from PySide6.QtCore import Slot, Signal, Qt, QPoint, QThread, QProcess, QTimer
+from PySide6.QtCore import Slot, Signal, Qt, QPoint, QProcess, QTimer
 from PySide6.QtWidgets import (
     QWidget, QTreeWidgetItem,
     QGridLayout, QHBoxLayout, QVBoxLayout,
     QSpacerItem, QSizePolicy, QSplitter,
-    QFrame, QFileSystemModel,
+    QFrame,
     QFileDialog, QLabel,
     QTreeView, QMenu,
     QMessageBox
@@ -22,7 +22,6 @@ import os.path
 import logging
 import clipboard
 import subprocess
-from PIL import Image
 from pathlib import Path
 
 from qfluentwidgets import (
@@ -47,17 +46,26 @@ from qfluentexpand.components.widgets.card import SettingCardWidget, ComboBoxSet
 
 from .Ui_ProjectWidget import Ui_Form
 from .GenerateCodeDialog import GenerateCodeDialog
+from .eric.ModuleCache import MODULE_CACHE
 from common.wintools import findProgramPath
 from .utils.stylesheets import StyleSheet
 from .utils.config import write_config
 from .utils.tool import startCMD
 from .compoments.menu import RecentFilesMenu
 from .compoments.info import Message, MessageBox as CustomMessageBox
-from .compoments.tree import FileSystemModel, FilesystemModel
+from .compoments.tree import FilesystemModel
 from common.pyenv import PyVenvManager
 from common.py import PyInterpreter, PyPath
+from common.runner import VenvRunner
+from common.indexer import ProjectIndexer
+from common.uic import UIC_POOL, FORM_INTROSPECTOR
+from common.pipplan import progressText
+from common.lazy import lazyImport
 from manage import CURRENT_SETTINGS, SETTINGS, LIBS, UI_CONFIG, PAGEWidgets, IMAGE_TYPES
 
+# 只在图片转换时使用
+Image = lazyImport("PIL.Image")
+
 
 class ProjectWidget(QWidget, Ui_Form):
     """
@@ -94,8 +102,14 @@ class ProjectWidget(QWidget, Ui_Form):
         self.gridLayout12.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.gridLayout1.addLayout(self.gridLayout12, 1, 0, 1, 1)
 
-        self.venvMangerTh = VenvManagerThread()
-        self.venvMangerTh.signal_result.connect(self.receive_VMresult)
+        self.venvRunner = VenvRunner(self)
+        self.venvRunner.signal_result.connect(self.receive_VMresult)
+        self.venvRunner.signal_output.connect(self.receive_VMoutput)
+        self.venvRunner.signal_progress.connect(self.receive_VMprogress)
+
+        # 项目文件索引(后台扫描，供目录树与批量编译使用)
+        self.indexer = ProjectIndexer(self)
+        self.indexer.indexed.connect(self.on_indexer_indexed)
 
         self.initTitle()
         self.initWidget()
@@ -144,6 +158,9 @@ class ProjectWidget(QWidget, Ui_Form):
         self.recentFilesMenu.fileSelected.connect(self.button_project_recently_open)
 
         self.menu_project.addAction(Action(FluentIcon.CLOSE, '关闭项目', triggered=self.button_project_close))
+        self.menu_project.addSeparator()
+        self.menu_project.addAction(Action(FluentIcon.CODE, '编译全部 UI', triggered=lambda: self.uiCompile()))
+        self.menu_project.addAction(Action(FluentIcon.CODE, '编译全部资源', triggered=lambda: self.rccCompile()))
         self.button_project.setMenu(self.menu_project)
 
     def initWidget(self):
@@ -232,12 +249,29 @@ class ProjectWidget(QWidget, Ui_Form):
         self.widget_teminal.addWidget(self.button_teminal)
         self.envCard.addWidget(self.widget_teminal)
 
+        self.widget_venv = SettingCardWidget('', '项目虚拟环境', '从模板环境克隆到项目 .venv', self.envCard)
+        self.spinner_venv = GifLabel(self.envCard)
+        self.spinner_venv.setGif(APPGIF.LOADING)
+        self.spinner_venv.setFixedSize(30, 30)
+        self.spinner_venv.hide()
+        self.button_venv = PrimaryPushButton(FluentIcon.ADD, "创建")
+        self.button_venv.clicked.connect(self.on_button_venv_clicked)
+        self.widget_venv.addStretch(1)
+        self.widget_venv.addWidget(self.spinner_venv)
+        self.widget_venv.addWidget(self.button_venv)
+        self.envCard.addWidget(self.widget_venv)
+
         self.card_project = SettingGroupCard(FluentIcon.SETTING, "项目设置", "",
                                              self.scrollAreaWidgetContents)
         self.gridLayout121.addWidget(self.card_project, 1, 0, 1, 1)
         self.comboBox_project_type = ComboBoxSettingCardWidget('', "类型", "", self.card_project)
         self.comboBox_project_type.addItems(SETTINGS["project"]["project_types"])
+        self.comboBox_project_type.currentTextChanged.connect(self.on_comboBox_project_type_currentTextChanged)
         self.card_project.addWidget(self.comboBox_project_type)
+        self.comboBox_rcc_mode = ComboBoxSettingCardWidget('', "资源编译", "二进制 rcc 由 Qt 内存映射加载", self.card_project)
+        self.comboBox_rcc_mode.addItems(SETTINGS["project"]["rcc_modes"])
+        self.comboBox_rcc_mode.currentTextChanged.connect(self.on_comboBox_rcc_mode_currentTextChanged)
+        self.card_project.addWidget(self.comboBox_rcc_mode)
 
         self.verticalSpacer = QSpacerItem(0, 1000, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
         self.gridLayout121.addItem(self.verticalSpacer)
@@ -256,27 +290,21 @@ class ProjectWidget(QWidget, Ui_Form):
         if CURRENT_SETTINGS["project"]["custom_python_path"]:
             self.button_filepath.setText(CURRENT_SETTINGS["project"]["custom_python_path"])
 
-    def initTree1(self, rootPath):
-        self.treeTitle.setText(f"项目目录 ({rootPath})")
-        fileModel = FilesystemModel()
-        fileModel.setRootPath(rootPath)
-        self.tree.setModel(fileModel)
-        self.tree.setEditTriggers(QTreeView.EditTrigger.NoEditTriggers)
-        # self.tree.setRootIndex(fileModel.index(rootPath))
-
-        # 隐藏列
-        self.tree.setColumnHidden(1, True)
-        self.tree.setColumnHidden(2, True)
-        self.tree.setColumnHidden(3, True)
+        if CURRENT_SETTINGS["project"]["rcc_mode"] in SETTINGS["project"]["rcc_modes"]:
+            self.comboBox_rcc_mode.setCurrentText(CURRENT_SETTINGS["project"]["rcc_mode"])
 
     def initTree(self, rootPath):
         self.treeTitle.setText(f"项目目录 ({rootPath})")
-        fileModel = QFileSystemModel()
+        oldModel = self.tree.model()
+        fileModel = FilesystemModel(self.indexer, self.tree)
         fileModel.setRootPath(rootPath)
         self.tree.setModel(fileModel)
-        self.tree.setRootIndex(fileModel.index(rootPath))
+        if oldModel is not None:
+            oldModel.deleteLater()
         self.tree.setEditTriggers(QTreeView.EditTrigger.NoEditTriggers)
 
+        self.warmUic()
+
         # 隐藏列
         self.tree.setColumnHidden(1, True)
         self.tree.setColumnHidden(2, True)
@@ -312,10 +340,16 @@ class ProjectWidget(QWidget, Ui_Form):
                     Action(FluentIcon.COPY, '新建文件', triggered=lambda: self.tree_open_newfile()))
                 self.menu.addAction(
                     Action(FluentIcon.COPY, '新建文件夹', triggered=lambda: self.tree_open_newfolder()))
+                self.menu.addSeparator()
+                self.menu.addAction(
+                    Action(FluentIcon.CODE, '编译全部 UI', triggered=lambda: self.uiCompile()))
+                self.menu.addAction(
+                    Action(FluentIcon.CODE, '编译全部资源', triggered=lambda: self.rccCompile()))
             else:
                 # 获取文件路径
                 try:
                     file_path = self.tree.model().filePath(index)
+                    isDir = self.tree.model().isDir(index)
                 except Exception as e:
                     logging.error(e)
                     return
@@ -331,7 +365,7 @@ class ProjectWidget(QWidget, Ui_Form):
                 self.menu.addAction(
                     Action(FluentIcon.COPY, '复制路径', triggered=lambda path=file_path: self.tree_copy_path(file_path)))
 
-                if os.path.isfile(file_path):
+                if not isDir:
                     # 添加分割线
                     self.menu.addSeparator()
                     (filepath, filename) = os.path.split(file_path)
@@ -370,7 +404,7 @@ class ProjectWidget(QWidget, Ui_Form):
                 # menu.addAction(Action(FluentIcon.CUT, '通过pycharm打开', triggered=lambda path=file_path: self.tree_open_pycharm(file_path)))
                 self.menu.addSeparator()
 
-                if os.path.isdir(file_path):
+                if isDir:
                     self.menu.addAction(Action(FluentIcon.FILTER, '新建文件', triggered=lambda path=file_path: self.tree_open_newfile(file_path)))
                     self.menu.addAction(Action(FluentIcon.FOLDER, '新建文件夹', triggered=lambda path=file_path: self.tree_open_newfolder(file_path)))
 
@@ -466,22 +500,25 @@ class ProjectWidget(QWidget, Ui_Form):
             if menu:
                 menu.deleteLater()
 
-    def getPyPath(self):
+    def getPyPath(self, quiet=False):
         path = ""
         if self.comboBox_mode.currentText() == "独立模式":
             path = self.button_filepath.text()
             if not path:
-                Message.error("错误", "请选择Python环境", self)
+                if not quiet:
+                    Message.error("错误", "请选择Python环境", self)
                 return
         elif self.comboBox_mode.currentText() == "跟随全局":
             if CURRENT_SETTINGS["settings"]["mode"] == "现有环境":
                 path = CURRENT_SETTINGS["settings"]["custom_python_path"]
                 if not path:
-                    Message.error("错误", "请设置Python环境", self)
+                    if not quiet:
+                        Message.error("错误", "请设置Python环境", self)
                     return
             elif CURRENT_SETTINGS["settings"]["mode"] == "Pyenv 环境":
                 if not CURRENT_SETTINGS["settings"]["pyenv_current_version"]:
-                    Message.error("错误", "请设置Pyenv环境", self)
+                    if not quiet:
+                        Message.error("错误", "请设置Pyenv环境", self)
                     return
                 path = os.path.join(LIBS["pyenv"], "versions", CURRENT_SETTINGS["settings"]["pyenv_current_version"], "python.exe")
             else:
@@ -511,8 +548,20 @@ class ProjectWidget(QWidget, Ui_Form):
         write_config()
         self.initTree(folderPath)
 
+    def on_indexer_indexed(self, root):
+        """
+        索引完成后在后台预解析 .ui 对应的 .py，生成代码对话框打开时直接读取缓存
+        """
+        sources = set(self.indexer.files(".py"))
+        forms = [os.path.splitext(uiFile)[0] + ".py" for uiFile in self.indexer.files(".ui")]
+        MODULE_CACHE.readAllAsync([path for path in forms if path in sources])
+
     def button_project_close(self):
+        oldModel = self.tree.model()
         self.tree.setModel(None)
+        if oldModel is not None:
+            oldModel.deleteLater()
+        self.indexer.clear()
         self.treeTitle.setText("项目目录")
 
     def on_comboBox_mode_currentTextChanged(self, text):
@@ -526,11 +575,19 @@ class ProjectWidget(QWidget, Ui_Form):
             pass
         write_config()
 
+    def on_comboBox_project_type_currentTextChanged(self, text):
+        if self.tree.model():
+            self.warmUic()
+
+    def on_comboBox_rcc_mode_currentTextChanged(self, text):
+        CURRENT_SETTINGS["project"]["rcc_mode"] = text
+        write_config()
+
     def on_button_filepath_textChanged(self, text):
         if text and "python.exe" in text:
-            self.venvMangerTh.setPyInterpreter(text)
-            self.venvMangerTh.setCMD("py_version")
-            self.venvMangerTh.start()
+            self.venvRunner.setPyInterpreter(text)
+            self.venvRunner.setCMD("py_version")
+            self.venvRunner.start()
         else:
             self.label_ver.setText("版本: ")
             CURRENT_SETTINGS["project"]["custom_python_path"] = ""
@@ -546,6 +603,28 @@ class ProjectWidget(QWidget, Ui_Form):
 
         startCMD(path)
 
+    def on_button_venv_clicked(self):
+        if not self.tree.model():
+            Message.error("错误", "请先打开项目", self)
+            return
+        path = self.getPyPath()
+        if not path:
+            return
+        if not Path(path).is_absolute():
+            path = str(Path(path).absolute())
+
+        target = os.path.join(self.tree.model().rootPath(), ".venv")
+        if os.path.exists(target):
+            Message.error("错误", f"{target} 已存在", self)
+            return
+
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("venv_create", path, self.comboBox_project_type.currentText(), target)
+        self.venvRunner.start()
+        self.button_venv.setEnabled(False)
+        self.spinner_venv.setState(True)
+        self.spinner_venv.show()
+
     def tree_edit(self, file_path):
         try:
             if CURRENT_SETTINGS["settings"]["editor"]:
@@ -580,10 +659,10 @@ class ProjectWidget(QWidget, Ui_Form):
         pythonPath.append(os.path.join(pypath, "Lib", "site-packages", "win32", "lib"))
         pythonPath.append(os.path.join(pypath, "Lib", "site-packages", "Pythonwin"))
 
-        # self.venvMangerTh.setPyInterpreter(path)
-        # self.venvMangerTh.setEnviron(PYTHONPATH=(';').join(pythonPath))
-        # self.venvMangerTh.setCMD("py_run", file_path)
-        # self.venvMangerTh.start()
+        # self.venvRunner.setPyInterpreter(path)
+        # self.venvRunner.setEnviron(PYTHONPATH=(';').join(pythonPath))
+        # self.venvRunner.setCMD("py_run", file_path)
+        # self.venvRunner.start()
         #
         # self.spinner_project.setState(True)
         # self.spinner_project.show()
@@ -609,25 +688,34 @@ class ProjectWidget(QWidget, Ui_Form):
             Message.error("错误", "UI文件不能为空", self)
             return
 
+        self.uiCompile(file_path)
+
+    def warmUic(self):
+        """
+        打开项目后在后台预启动常驻 uic 进程并准备信号数据库，之后的编译和生成代码无需等待解释器启动
+        """
+        path = self.getPyPath(quiet=True)
+        if path:
+            UIC_POOL.warm(str(Path(path).absolute()), self.comboBox_project_type.currentText())
+            FORM_INTROSPECTOR.warm(str(Path(path).absolute()), self.comboBox_project_type.currentText())
+
+    def uiCompile(self, *files):
+        """
+        增量编译 .ui，files 为空时编译项目中的全部 .ui(索引完成时直接使用索引，否则由编译器扫描)
+        """
+        if not self.tree.model():
+            Message.error("错误", "请先打开项目", self)
+            return
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return False
-        cmd = ''
-        if self.comboBox_project_type.currentText() == "PySide2":
-            cmd = PyPath.PYSIDE6_UIC.path(path)
-        elif self.comboBox_project_type.currentText() == "PySide6":
-            cmd = PyPath.PYSIDE6_UIC.path(path)
-        elif self.comboBox_project_type.currentText() == "PyQt5":
-            cmd = PyPath.PYQT5_UIC.path(path)
-        elif self.comboBox_project_type.currentText() == "PyQt6":
-            cmd = PyPath.PYQT6_UIC.path(path)
-        (filePath, fileName) = os.path.split(file_path)
-        outFile = os.path.join(filePath, 'Ui_' + fileName.replace('ui', 'py'))
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("generate_code", cmd, file_path, '-o', outFile)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("uic_compile" if files else "uic_compile_all",
+                               self.comboBox_project_type.currentText(), self.tree.model().rootPath(), *files,
+                               indexed=self.indexer.files(".ui"))
+        self.venvRunner.start()
 
         self.spinner_project.setState(True)
         self.spinner_project.show()
@@ -657,31 +745,31 @@ class ProjectWidget(QWidget, Ui_Form):
 
     def tree_qrc_complie(self, file_path):
         if not file_path:
-            Message.error("错误", "UI文件不能为空", self)
+            Message.error("错误", "资源文件不能为空", self)
             return
 
+        self.rccCompile(file_path)
+
+    def rccCompile(self, *files):
+        """
+        增量编译 .qrc，files 为空时编译项目中的全部 .qrc(索引完成时直接使用索引，否则由编译器扫描)
+        """
+        if not self.tree.model():
+            Message.error("错误", "请先打开项目", self)
+            return
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
             return False
+        binary = self.comboBox_rcc_mode.currentText() == SETTINGS["project"]["rcc_modes"][1]
+        if self.comboBox_project_type.currentText() == "PyQt6" or (binary and self.comboBox_project_type.currentText() == "PyQt5"):
+            Message.info("提示", f"{self.comboBox_project_type.currentText()}没有可用的rcc,使用PySide6的rcc进行编译", self)
 
-        cmd = ''
-        if self.comboBox_project_type.currentText() == "PySide2":
-            cmd = PyPath.PYSIDE6_RCC.path(path)
-        elif self.comboBox_project_type.currentText() == "PySide6":
-            cmd = PyPath.PYSIDE6_RCC.path(path)
-        elif self.comboBox_project_type.currentText() == "PyQt5":
-            cmd = PyPath.PYQT5_RCC.path(path)
-        elif self.comboBox_project_type.currentText() == "PyQt6":
-            Message.info("提示", "PyQt6没有rcc,使用PySide6的rcc进行编译", self)
-            cmd = PyPath.PYSIDE6_RCC.path(path)
-        (filePath, fileName) = os.path.split(file_path)
-        (file_name, suffix) = os.path.splitext(fileName)
-        outFile = os.path.join(filePath, file_name + '_rc.py')
-
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("compile_rcc", cmd, file_path, '-o', outFile, self.comboBox_project_type.currentText())
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("rcc_compile" if files else "rcc_compile_all",
+                               self.comboBox_project_type.currentText(), self.tree.model().rootPath(), *files,
+                               binary=binary, indexed=self.indexer.files(".qrc"))
+        self.venvRunner.start()
 
         self.spinner_project.setState(True)
         self.spinner_project.show()
@@ -781,6 +869,16 @@ class ProjectWidget(QWidget, Ui_Form):
         img = Image.open(file_path)
         img.show()
 
+    def receive_VMoutput(self, cmd, text):
+        logging.debug(f"{cmd}: {text.rstrip()}")
+
+    def receive_VMprogress(self, cmd, progress):
+        logging.debug(f"{cmd}: {progress}")
+        if cmd == "venv_create":
+            self.spinner_venv.setToolTip(progressText(progress))
+        elif cmd in ("uic_compile", "uic_compile_all", "rcc_compile", "rcc_compile_all"):
+            self.spinner_project.setToolTip(progressText(progress))
+
     def receive_VMresult(self, cmd, result):
         logging.debug(f"receive_VMresult: {cmd}, {result}")
         if isinstance(result[1], list) and len(result[1]) > 5:
@@ -797,7 +895,7 @@ class ProjectWidget(QWidget, Ui_Form):
             self.label_ver.setText("版本: " + result[1].strip('\n'))
             CURRENT_SETTINGS["project"]["custom_python_path"] = self.button_filepath.text()
             write_config()
-        elif "generate_code" in cmd or "compile_rcc" in cmd:
+        elif cmd in ("uic_compile", "uic_compile_all", "rcc_compile", "rcc_compile_all"):
             self.spinner_project.setState(False)
             self.spinner_project.hide()
 
@@ -805,71 +903,31 @@ class ProjectWidget(QWidget, Ui_Form):
                 Message.error("错误", output, self)
                 return
 
-            Message.info("提示", "生成成功", self)
-        elif "designer" in cmd:
+            Message.info("提示", f"编译 {len(result[1]['compiled'])} 个，跳过 {len(result[1]['skipped'])} 个未变化的文件", self)
+        elif "generate_code" in cmd:
+            self.spinner_project.setState(False)
+            self.spinner_project.hide()
+
             if not result[0]:
                 Message.error("错误", output, self)
                 return
-        else:
-            pass
-
 
-class VenvManagerThread(QThread):
-
-    signal_result = Signal(str, tuple)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # self.venvManger = PyVenvManager(LIBS["pyenv"])
-        self.pyI = PyInterpreter()
-        self.stopBool = False
-
-    def stop(self):
-        self.stop = True
-
-    def setCMD(self, cmd, *args, **kwargs):
-        self.cmd = cmd
-        self.args = args
-        self.kwargs = kwargs
-
-    def setPyInterpreter(self, path):
-        self.pyI.setInterpreter(path)
+            Message.info("提示", "生成成功", self)
+        elif cmd == "venv_create":
+            self.button_venv.setEnabled(True)
+            self.spinner_venv.setState(False)
+            self.spinner_venv.hide()
 
-    def setEnviron(self, **kwargs):
-        self.pyI.setEnviron(**kwargs)
+            if not result[0]:
+                Message.error("错误", output, self)
+                return
 
-    def run(self):
-        cmd = self.cmd
-        if cmd == "init":
-            pass
-        elif cmd == "environ":
-            self.pyI.setEnviron(**self.kwargs)
-        elif cmd == "py_version":
-            result = self.pyI.version()
-            self.signal_result.emit(cmd, result)
-        elif "generate_code" in cmd:
-            result = self.pyI.cmd(self.args)
-            self.signal_result.emit(cmd, result)
-        elif "generate" in cmd:
-            result = self.pyI.cmd(self.args[0])
-            self.signal_result.emit(cmd, result)
-        elif "compile_rcc" in cmd:
-            result = self.pyI.cmd(self.args[:-1])
-            if result[0] and "PyQt6" in self.args[-2]:
-                with open(self.args[-2], 'r', encoding='utf-8') as f:
-                    text = f.read()
-                    new_text = text.replace("PySide6", "PyQt6")
-                    with open(self.args[-2], 'w', encoding='utf-8') as f1:
-                        f1.write(new_text)
-            self.signal_result.emit(cmd, result)
-        elif "py_run" in cmd:
-            result = self.pyI.py(self.args[0])
-            self.signal_result.emit(cmd, result)
-        elif cmd == "designer":
-            result = self.pyI.cmd(self.args)
-            self.signal_result.emit(cmd, result)
-        elif cmd == "designer_plugin":
-            result = self.pyI.py_popen(self.args)
-            self.signal_result.emit(cmd, result)
+            self.comboBox_mode.setCurrentText("独立模式")
+            self.button_filepath.setText(result[1])
+            Message.info("提示", "虚拟环境创建成功", self)
+        elif "designer" in cmd:
+            if not result[0]:
+                Message.error("错误", output, self)
+                return
         else:
-            self.signal_result.emit(cmd, ["False", "未知命令"])
\ No newline at end of file
+            pass
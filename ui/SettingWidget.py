@@ -7,11 +7,10 @@ Module implementing SettingWidget.
 """
 
 
-from PySide6.QtCore import Slot, Qt, QThread, Signal
+from PySide6.QtCore import Slot, Qt, Signal
 from PySide6.QtGui import QIcon, QFont
 from PySide6.QtWidgets import QWidget, QGridLayout, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, QMessageBox
 import os
-from copy import copy
 import logging
 from pathlib import Path
 
@@ -43,6 +42,10 @@ from .utils.config import write_config
 from .utils.tool import startCMD
 from common.pyenv import PyVenvManager
 from common.py import PyInterpreter, PyPath
+from common.runner import VenvRunner
+from common.pipplan import progressText
+from common.warmup import WARMUP
+from common.cache import VERSION_CATALOG, latestRelease
 from manage import VERSION, PackageTime, LIBS, MIRRORS, SETTINGS, CURRENT_SETTINGS
 
 
@@ -71,13 +74,40 @@ class SettingWidget(QWidget, Ui_Form):
         self.gridLayout1.setSpacing(20)
         self.gridLayout1.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        self.venvMangerTh = VenvManagerThread()
-        self.venvMangerTh.signal_result.connect(self.receive_VMresult)
+        self.venvRunner = VenvRunner(self)
+        self.venvRunner.signal_result.connect(self.receive_VMresult)
+        self.venvRunner.signal_output.connect(self.receive_VMoutput)
+        self.venvRunner.signal_progress.connect(self.receive_VMprogress)
 
         self.initWidget()
-        self.venvMangerTh.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
-        self.venvMangerTh.setCMD("init")
-        self.venvMangerTh.start()
+        self.venvRunner.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
+        # 启动预热已获取 pyenv 版本列表时直接使用，否则执行 init
+        if not WARMUP.result("pyenv", self.receive_warmup):
+            self.runInit()
+
+        # 上游最新版本: 先显示缓存，过期时后台刷新
+        self.showLatestRelease(VERSION_CATALOG.versions())
+        VERSION_CATALOG.refreshAsync(self.receive_catalog)
+
+    def showLatestRelease(self, versions):
+        latest = latestRelease(versions)
+        self.label_new_latest.setText(f"最新: {latest}" if latest else "")
+
+    def receive_catalog(self, result):
+        if result[0]:
+            self.showLatestRelease(result[1])
+
+    def runInit(self):
+        self.venvRunner.setCMD("init")
+        self.venvRunner.start()
+
+    def receive_warmup(self, result):
+        if not result:
+            self.runInit()
+            return
+        self.receive_VMresult("list", result["list"])
+        self.receive_VMresult("versions", result["versions"])
+        self.receive_VMresult("init", result["versions"])
 
     def initWidget(self):
         self.basicCard = SettingGroupCard(FluentIcon.SETTING, "基本设置", "",
@@ -157,12 +187,17 @@ class SettingWidget(QWidget, Ui_Form):
         self.comboBox_new_maxbit.setFixedWidth(75)
         self.comboBox_new_ver = ComboBox(self.card_pyenv)
         self.comboBox_new_ver.setMinimumWidth(100)
+        self.label_new_latest = CaptionLabel("", self.card_pyenv)
+        self.label_new_progress = CaptionLabel("", self.card_pyenv)
+        self.label_new_progress.hide()
         self.button_new_install = PrimaryDropDownPushButton(FluentIcon.ADD_TO, '操作')
         menu = RoundMenu(parent=self.button_new_install)
         menu.addAction(Action(FluentIcon.PRINT, '安装', triggered=self.new_install))
         menu.addAction(Action(FluentIcon.UPDATE, '更新', triggered=self.new_update))
         self.button_new_install.setMenu(menu)
+        self.widget_pyenv_new.addWidget(self.label_new_latest)
         self.widget_pyenv_new.addStretch(1)
+        self.widget_pyenv_new.addWidget(self.label_new_progress)
         self.widget_pyenv_new.addWidget(self.spinner_new)
         self.widget_pyenv_new.addWidget(self.comboBox_new_maxbit)
         self.widget_pyenv_new.addWidget(self.comboBox_new_ver)
@@ -203,6 +238,7 @@ class SettingWidget(QWidget, Ui_Form):
         menu.addAction(Action(FluentIcon.PRINT, '安装模块', triggered=self.install_pip_list))
         menu.addAction(Action(FluentIcon.UPDATE, '更新模块', triggered=self.upgrade_pip_list))
         menu.addAction(Action(FluentIcon.ROBOT, '卸载模块', triggered=self.uninstall_pip_list))
+        menu.addAction(Action(FluentIcon.DOWNLOAD, '预取到本地仓库', triggered=self.prefetch_pip_list))
         self.button_pip_list.setMenu(menu)
         self.widget_pip_list.addStretch(1)
         self.widget_pip_list.addWidget(self.spinner_pip_list)
@@ -257,7 +293,10 @@ class SettingWidget(QWidget, Ui_Form):
 
     def configure(self):
         if CURRENT_SETTINGS["settings"]["theme"] == "Dark":
+            # 主题已在主窗口启动时应用，这里只同步开关状态
+            self.theme.switch.blockSignals(True)
             self.theme.setChecked(True)
+            self.theme.switch.blockSignals(False)
 
         if CURRENT_SETTINGS["settings"]["mode"] in SETTINGS["settings"]["python_env_modes"]:
             self.comboBox_mode.setCurrentText(CURRENT_SETTINGS["settings"]["mode"])
@@ -305,39 +344,27 @@ class SettingWidget(QWidget, Ui_Form):
         if self.comboBox_new_maxbit.currentText() == "x86":
             version += "-win32"
 
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-            return
-
-        self.venvMangerTh.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
-        self.venvMangerTh.setCMD("install", version)
-        self.venvMangerTh.start()
+        self.venvRunner.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
+        self.venvRunner.setCMD("install", version)
+        self.venvRunner.start()
         self.button_new_install.setEnabled(False)
         self.spinner_new.setState(True)
         self.spinner_new.show()
         Message.info("安装", "安装中，请稍后", self)
 
     def new_update(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-            return
-
-        self.venvMangerTh.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
-        self.venvMangerTh.setCMD("update")
-        self.venvMangerTh.start()
+        self.venvRunner.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
+        self.venvRunner.setCMD("update")
+        self.venvRunner.start()
         self.button_new_install.setEnabled(False)
         self.spinner_new.setState(True)
         self.spinner_new.show()
 
     def existing_uninstall(self):
         if self.comboBox_existing.currentText():
-            if self.venvMangerTh.isRunning():
-                Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-                return
-
-            self.venvMangerTh.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
-            self.venvMangerTh.setCMD("uninstall", self.comboBox_existing.currentText())
-            self.venvMangerTh.start()
+            self.venvRunner.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
+            self.venvRunner.setCMD("uninstall", self.comboBox_existing.currentText())
+            self.venvRunner.start()
             self.button_existing_uninstall.setEnabled(False)
             self.spinner_existing.show()
             self.spinner_existing.setState(True)
@@ -346,13 +373,9 @@ class SettingWidget(QWidget, Ui_Form):
     def existing_update(self):
         print("existing_update")
         if os.path.exists(os.path.join(CURRENT_SETTINGS["settings"]["pyenv_path"], "versions")):
-            if self.venvMangerTh.isRunning():
-                Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-                return
-
-            self.venvMangerTh.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
-            self.venvMangerTh.setCMD("versions")
-            self.venvMangerTh.start()
+            self.venvRunner.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
+            self.venvRunner.setCMD("versions")
+            self.venvRunner.start()
             self.button_existing_uninstall.setEnabled(False)
             self.spinner_existing.setState(True)
             self.spinner_existing.show()
@@ -360,10 +383,6 @@ class SettingWidget(QWidget, Ui_Form):
             Message.error("错误", "Pyenv路径错误", self)
 
     def get_pip_list(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
@@ -371,19 +390,35 @@ class SettingWidget(QWidget, Ui_Form):
         if not Path(path).is_absolute():
             path = str(Path(path).absolute())
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("pip_list", "list")
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("pip_list")
+        self.venvRunner.start()
 
         self.button_pip_list.setEnabled(False)
         self.spinner_pip_list.setState(True)
         self.spinner_pip_list.show()
 
     def install_pip_list(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "pyenv忙碌中，请稍后重试", self)
+        if not self.comboBox_pip_list.currentText():
+            Message.error("错误", "模块名不能为空", self)
             return
 
+        path = self.getPyPath()
+        if not path:
+            Message.error("错误", "python解释器获取失败", self)
+            return
+        if not Path(path).is_absolute():
+            path = str(Path(path).absolute())
+
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("pip_install", self.comboBox_pip_list.currentText())
+        self.venvRunner.start()
+
+        self.button_pip_list.setEnabled(False)
+        self.spinner_pip_list.setState(True)
+        self.spinner_pip_list.show()
+
+    def prefetch_pip_list(self):
         if not self.comboBox_pip_list.currentText():
             Message.error("错误", "模块名不能为空", self)
             return
@@ -395,19 +430,15 @@ class SettingWidget(QWidget, Ui_Form):
         if not Path(path).is_absolute():
             path = str(Path(path).absolute())
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("pip_install", self.comboBox_pip_list.currentText())
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("wheelhouse_prefetch", self.comboBox_pip_list.currentText())
+        self.venvRunner.start()
 
         self.button_pip_list.setEnabled(False)
         self.spinner_pip_list.setState(True)
         self.spinner_pip_list.show()
 
     def upgrade_pip_list(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
@@ -424,21 +455,17 @@ class SettingWidget(QWidget, Ui_Form):
         for p in tmpp:
             if not p:
                 continue
-            tmp.append(p.split('-')[0])
+            tmp.append(p.rsplit('-', 1)[0])
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("pip_upgrade", tmp)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("pip_upgrade", *tmp)
+        self.venvRunner.start()
 
         self.button_pip_list.setEnabled(False)
         self.spinner_pip_list.setState(True)
         self.spinner_pip_list.show()
 
     def uninstall_pip_list(self):
-        if self.venvMangerTh.isRunning():
-            Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-            return
-
         path = self.getPyPath()
         if not path:
             Message.error("错误", "python解释器获取失败", self)
@@ -454,11 +481,11 @@ class SettingWidget(QWidget, Ui_Form):
         for p in tmpp:
             if not p:
                 continue
-            tmp.append(p.split('-')[0])
+            tmp.append(p.rsplit('-', 1)[0])
 
-        self.venvMangerTh.setPyInterpreter(path)
-        self.venvMangerTh.setCMD("pip_uninstall", tmp)
-        self.venvMangerTh.start()
+        self.venvRunner.setPyInterpreter(path)
+        self.venvRunner.setCMD("pip_uninstall", *tmp)
+        self.venvRunner.start()
 
         self.button_pip_list.setEnabled(False)
         self.spinner_pip_list.setState(True)
@@ -479,9 +506,9 @@ class SettingWidget(QWidget, Ui_Form):
 
     def on_button_filepath_textChanged(self, text):
         if text and "python.exe" in text:
-            self.venvMangerTh.setPyInterpreter(text)
-            self.venvMangerTh.setCMD("py_version")
-            self.venvMangerTh.start()
+            self.venvRunner.setPyInterpreter(text)
+            self.venvRunner.setCMD("py_version")
+            self.venvRunner.start()
         else:
             self.label_ver.setText("版本: ")
             CURRENT_SETTINGS["settings"]["custom_python_path"] = ""
@@ -510,12 +537,8 @@ class SettingWidget(QWidget, Ui_Form):
     def on_comboBox_pyenv_mirror_url_currentTextChanged(self, text):
         CURRENT_SETTINGS["settings"]["pyenv_mirror_url"] = text
         if text != "origin" and MIRRORS["pyenv"].get(text):
-            if self.venvMangerTh.isRunning():
-                Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-                return
-
-            self.venvMangerTh.setCMD("environ", PYTHON_BUILD_MIRROR_URL=MIRRORS["pyenv"][text])
-            self.venvMangerTh.start()
+            self.venvRunner.setCMD("environ", PYTHON_BUILD_MIRROR_URL=MIRRORS["pyenv"][text])
+            self.venvRunner.start()
 
             write_config()
 
@@ -526,13 +549,9 @@ class SettingWidget(QWidget, Ui_Form):
 
     def on_button_existing_uninstall_clicked(self):
         if self.comboBox_existing.currentText():
-            if self.venvMangerTh.isRunning():
-                Message.error("错误", "pyenv忙碌中，请稍后重试", self)
-                return
-
-            self.venvMangerTh.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
-            self.venvMangerTh.setCMD("uninstall", self.comboBox_existing.currentText())
-            self.venvMangerTh.start()
+            self.venvRunner.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
+            self.venvRunner.setCMD("uninstall", self.comboBox_existing.currentText())
+            self.venvRunner.start()
             self.button_existing_uninstall.setEnabled(False)
             self.spinner_existing.show()
             self.spinner_existing.setState(True)
@@ -569,7 +588,18 @@ class SettingWidget(QWidget, Ui_Form):
 
         write_config()
 
-    def receive_VMresult(self, cmd, result, isClose=True):
+    def receive_VMoutput(self, cmd, text):
+        logging.debug(f"{cmd}: {text.rstrip()}")
+
+    def receive_VMprogress(self, cmd, progress):
+        logging.debug(f"{cmd}: {progress}")
+        if cmd.startswith("pip_"):
+            self.spinner_pip_list.setToolTip(progressText(progress))
+        elif cmd == "install":
+            self.label_new_progress.setText(progressText(progress))
+            self.label_new_progress.show()
+
+    def receive_VMresult(self, cmd, result):
         logging.debug(f"receive_VMresult: {cmd}, {result}")
         if isinstance(result[1], list) and len(result[1]) > 5:
             output = result[1][-5:]
@@ -595,15 +625,10 @@ class SettingWidget(QWidget, Ui_Form):
             if not result[0]:
                 Message.error("错误", output, self)
                 return
-            result = list(filter(None, result[1].split("\n")[1:]))
-            result.reverse()
-            tmp = copy(result)
-            for res in tmp:
-                if "rc" in res or "a" in res or "b" in res or 'c' in res or 'win32' in res:
-                    result.remove(res)
-            if result:
+            # 正式版本，从新到旧
+            if result[1]:
                 self.comboBox_new_ver.clear()
-                self.comboBox_new_ver.addItems(result)
+                self.comboBox_new_ver.addItems(result[1])
         elif cmd == "update":
             self.button_new_install.setEnabled(True)
             self.spinner_new.setState(False)
@@ -613,13 +638,13 @@ class SettingWidget(QWidget, Ui_Form):
                 Message.error("错误", output, self)
                 return
 
-            self.venvMangerTh.stop()
-            self.venvMangerTh.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
-            self.venvMangerTh.setCMD("list")
-            self.venvMangerTh.start()
+            self.venvRunner.setVenvPath(CURRENT_SETTINGS["settings"]["pyenv_path"])
+            self.venvRunner.setCMD("list")
+            self.venvRunner.start()
             return
         elif cmd == "install":
             self.button_new_install.setEnabled(True)
+            self.label_new_progress.hide()
             self.spinner_new.setState(False)
             self.spinner_new.hide()
 
@@ -629,7 +654,6 @@ class SettingWidget(QWidget, Ui_Form):
 
             Message.info("成功", "安装成功", self)
 
-            self.venvMangerTh.stop()
             self.existing_update()
             return
         elif cmd == "uninstall":
@@ -643,7 +667,6 @@ class SettingWidget(QWidget, Ui_Form):
 
             Message.info("成功", "卸载成功", self)
 
-            self.venvMangerTh.stop()
             self.existing_update()
             return
         elif cmd == "versions":
@@ -671,17 +694,10 @@ class SettingWidget(QWidget, Ui_Form):
                 Message.error("错误", output, self)
                 return
 
-            result = list(filter(None, result[1].split("\n")))
             tmp = []
             maxLen = 0
-            for res in result:
-                if "Package" in res:
-                    continue
-                elif "------" in res:
-                    continue
-
-                tmpp = res.split(' ')
-                tmpp = f"{tmpp[0].strip(' ')}-{tmpp[-1].strip(' ')}"
+            for dist in result[1]:
+                tmpp = f"{dist['name']}-{dist['version']}"
                 if len(tmpp) > maxLen:
                     maxLen = len(tmpp)
                 tmp.append(tmpp)
@@ -698,6 +714,15 @@ class SettingWidget(QWidget, Ui_Form):
                 return
 
             Message.info("成功", "安装成功", self)
+        elif cmd == "wheelhouse_prefetch":
+            self.button_pip_list.setEnabled(True)
+            self.spinner_pip_list.setState(False)
+            self.spinner_pip_list.hide()
+            if not result[0]:
+                Message.error("错误", output, self)
+                return
+
+            Message.info("成功", f"已预取 {len(result[1])} 个文件到本地仓库", self)
         elif cmd == "pip_upgrade":
             self.button_pip_list.setEnabled(True)
             self.spinner_pip_list.setState(False)
@@ -720,87 +745,3 @@ class SettingWidget(QWidget, Ui_Form):
             Message.info("成功", "卸载成功", self)
         else:
             pass
-
-        if isClose:
-            self.venvMangerTh.stop()
-
-
-class VenvManagerThread(QThread):
-
-    signal_result = Signal(str, tuple, bool)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.venvManger = PyVenvManager(LIBS["pyenv"])
-        self.pyI = PyInterpreter()
-        self.stopBool = False
-
-    def stop(self):
-        try:
-            self.stopBool = True
-            self.pyI.stop()
-            self.terminate()
-        except Exception as e:
-            print(e)
-
-    def setCMD(self, cmd, *args, **kwargs):
-        self.cmd = cmd
-        self.args = args
-        self.kwargs = kwargs
-
-    def setVenvPath(self, path):
-        self.venvManger.setVenvPath(path)
-
-    def setPyInterpreter(self, path):
-        self.pyI.setInterpreter(path)
-
-    def run(self):
-        cmd = self.cmd
-        if cmd == "py_version":
-            result = self.pyI.version()
-            self.signal_result.emit(cmd, result)
-        elif cmd == "init":
-            result = self.venvManger.list()
-            self.signal_result.emit("list", result, False)
-            result = self.venvManger.versions()
-            self.signal_result.emit("versions", result, True)
-            self.signal_result.emit("init", result, True)
-        elif cmd == "list":
-            result = self.venvManger.list()
-            self.signal_result.emit(cmd, result, True)
-        elif cmd == "update":
-            result = self.venvManger.update()
-            self.signal_result.emit(cmd, result, True)
-        elif cmd == "install":
-            result = self.venvManger.install(self.args[0])
-            self.signal_result.emit(cmd, result, True)
-            self.venvManger.rehash()
-        elif cmd == "uninstall":
-            result = self.venvManger.uninstall(self.args[0])
-            self.signal_result.emit(cmd, result, True)
-        elif cmd == "environ":
-            self.venvManger.setEnviron(**self.kwargs)
-        elif cmd == "versions":
-            result = self.venvManger.versions()
-            self.signal_result.emit(cmd, result, True)
-        elif cmd == "pip_list":
-            result = self.pyI.pip(self.args[0])
-            self.signal_result.emit(cmd, result, True)
-        elif cmd == "pip_install":
-            result = self.pyI.pip("install", self.args[0])
-            self.signal_result.emit(cmd, result, True)
-        elif cmd == "pip_upgrade":
-            tmp = ["install", "--upgrade"]
-            tmp.extend(self.args[0])
-            result = self.pyI.pip(*tmp)
-            self.signal_result.emit(cmd, result, True)
-        elif cmd == "pip_uninstall":
-            tmp = ["uninstall", "-y"]
-            tmp.extend(self.args[0])
-            result = self.pyI.pip(*tmp)
-            self.signal_result.emit(cmd, result, True)
-        else:
-            self.signal_result.emit(cmd, ["False", "未知命令"], True)
-
-
-
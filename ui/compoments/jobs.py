@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import os
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from common.scheduler import SCHEDULER, JobState
+
+
+class JobTableModel(QAbstractTableModel):
+    """
+    全局调度器的任务表
+    """
+
+    HEADERS = ["ID", "任务", "解释器", "状态", "耗时(s)"]
+
+    def __init__(self, scheduler=SCHEDULER, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self.rows = scheduler.jobs()
+        self.index_ = {job.id: row for row, job in enumerate(self.rows)}
+        scheduler.jobChanged.connect(self.on_jobChanged)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self.rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return job.id
+            elif column == 1:
+                return job.name
+            elif column == 2:
+                return os.path.basename(os.path.dirname(job.interpreter)) if job.interpreter else ""
+            elif column == 3:
+                return job.state.value
+            elif column == 4:
+                return f"{job.elapsed():.1f}"
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == 2:
+                return job.interpreter
+            if column == 3 and job.error:
+                return job.error
+        return None
+
+    def job(self, row):
+        return self.rows[row]
+
+    def clearFinished(self):
+        self.beginResetModel()
+        self.scheduler.clearFinished()
+        self.rows = self.scheduler.jobs()
+        self.index_ = {job.id: row for row, job in enumerate(self.rows)}
+        self.endResetModel()
+
+    def on_jobChanged(self, job):
+        row = self.index_.get(job.id)
+        if row is None:
+            row = len(self.rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.rows.append(job)
+            self.index_[job.id] = row
+            self.endInsertRows()
+        else:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+import time
+import logging
+import importlib
+
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+from common.trace import TRACE
+
+
+class LazyPage(QWidget):
+    """
+    延迟构建的页面
+
+    作为导航子界面立即注册(objectName 与真实页面相同)，真实页面在首次显示、
+    预热或被其他页面访问属性时才导入模块并构建，之后作为唯一子控件填满本控件
+    PAGEWidgets 中保存的是 LazyPage，未定义的属性会转发到真实页面，
+    如 PAGEWidgets["pack"].setMainFile(...) 会先构建 PackWidget 再调用
+    """
+
+    built = Signal(QWidget)
+
+    def __init__(self, objectName, module, className, package=None, parent=None):
+        """
+        @param module 页面模块，如 ".PackWidget"
+        @param className 页面类名，构造参数为 parent
+        """
+        super().__init__(parent)
+        self.setObjectName(objectName)
+        self._module = module
+        self._className = className
+        self._package = package
+        self._widget = None
+        self._building = False
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(0)
+
+    def isBuilt(self):
+        return self._widget is not None
+
+    def widget(self):
+        """
+        真实页面，未构建时立即构建
+        """
+        if self._widget is None and not self._building:
+            self._building = True
+            try:
+                start = time.perf_counter()
+                with TRACE.span(f"page {self.objectName()}"):
+                    cls = getattr(importlib.import_module(self._module, self._package), self._className)
+                    self._widget = cls(self)
+                self._layout.addWidget(self._widget)
+                logging.debug(f"page {self.objectName()} built in {time.perf_counter() - start:.3f}s")
+            finally:
+                self._building = False
+            self.built.emit(self._widget)
+        return self._widget
+
+    def showEvent(self, event):
+        self.widget()
+        super().showEvent(event)
+
+    def __getattr__(self, name):
+        # 只有常规查找失败时才会调用，私有属性不转发，避免构建过程中递归
+        if name.startswith("_"):
+            raise AttributeError(name)
+        widget = self.widget()
+        if widget is None:
+            raise AttributeError(name)
+        return getattr(widget, name)
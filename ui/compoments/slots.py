@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+"""
+
+
+from array import array
+from bisect import bisect_left
+
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex
+
+
+# 信号的勾选状态
+UNCHECKED = 0
+CHECKED = 1
+IMPLEMENTED = 2      # 类中已有同名槽，只显示不可取消
+
+
+class SlotsModel(QAbstractItemModel):
+    """
+    生成代码对话框的 控件 -> 信号 两级模型
+
+    不为每行创建条目对象: 控件与信号保存在平行的数组中，信号按控件连续存放，
+    控件 i 的信号为 [starts[i], starts[i + 1])；另外预先保存每行的小写文本作为搜索索引
+    过滤只计算匹配的信号编号(有序数组)，新的过滤文本包含上一次的文本时只在上一次的结果中查找；
+    子行在视图展开时才计算(canFetchMore/fetchMore)，过滤或排序后通过 layoutChanged 保留展开与选中状态
+    过滤规则: 控件文本匹配时显示其全部信号，否则只显示匹配的信号，没有匹配信号的控件隐藏
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clear()
+
+    def clear(self):
+        self.beginResetModel()
+        self.labels = []
+        self.labelsLower = []
+        self.starts = array("i", [0])
+        self.texts = []
+        self.textsLower = []
+        self.owners = array("i")
+        self.signals = []
+        self.states = bytearray()
+        self.filterText = ""
+        self.matches = None
+        self.labelMatches = None
+        self.descending = False
+        self.rows = []
+        self.objectRows = {}
+        self.children = {}
+        self.fetched = set()
+        self.endResetModel()
+
+    def setSignatures(self, objectsList, implemented=()):
+        """
+        @param objectsList UicFormWorker/SignatureDatabase 的信号列表
+            [{"name", "class_name", "methods": [{"signature", "methods", ...}]}]
+        @param implemented 类中已有的槽(方法名或 方法名(参数类型))
+        """
+        implemented = set(implemented)
+        self.beginResetModel()
+        labels, starts, texts, owners, signals, states = [], array("i", [0]), [], array("i"), [], bytearray()
+        for objectDict in sorted(objectsList, key=lambda objectDict: objectDict["name"]):
+            owner = len(labels)
+            labels.append("{0} ({1})".format(objectDict["name"], objectDict["class_name"]))
+            for methodDict in sorted(objectDict["methods"], key=lambda methodDict: methodDict["signature"]):
+                texts.append(methodDict["signature"])
+                owners.append(owner)
+                signals.append(methodDict)
+                states.append(IMPLEMENTED if (methodDict["methods"][0] in implemented
+                                              or methodDict["methods"][1] in implemented) else UNCHECKED)
+            starts.append(len(texts))
+        self.labels, self.starts, self.texts, self.owners, self.signals, self.states = (
+            labels, starts, texts, owners, signals, states)
+        self.labelsLower = [label.lower() for label in labels]
+        self.textsLower = [text.lower() for text in texts]
+        self.filterText = ""
+        self.matches = None
+        self.labelMatches = None
+        self.children = {}
+        self.fetched = set()
+        self.rows = self.visibleObjects()
+        self.objectRows = {obj: row for row, obj in enumerate(self.rows)}
+        self.endResetModel()
+
+    def checkedSignals(self):
+        """
+        @return 勾选的(未实现的)信号，按控件与信号的顺序
+        """
+        return [self.signals[index] for index, state in enumerate(self.states) if state == CHECKED]
+
+    # 过滤
+
+    def visibleObjects(self):
+        if self.matches is None:
+            objects = list(range(len(self.labels)))
+        else:
+            objects = sorted(self.labelMatches.union(self.owners[index] for index in self.matches))
+        return objects[::-1] if self.descending else objects
+
+    def visibleSignals(self, obj):
+        start, end = self.starts[obj], self.starts[obj + 1]
+        if self.matches is None or obj in self.labelMatches:
+            signals = range(start, end)
+        else:
+            signals = self.matches[bisect_left(self.matches, start):bisect_left(self.matches, end)]
+        return list(reversed(signals)) if self.descending else list(signals)
+
+    def setFilterText(self, text):
+        """
+        大小写不敏感的子串过滤
+        """
+        text = text.strip().lower()
+        if text == self.filterText:
+            return
+        if not text:
+            matches, labelMatches = None, None
+        else:
+            if self.matches is not None and text.startswith(self.filterText):
+                # 增量: 结果只会是上一次结果的子集
+                candidates, labels = self.matches, self.labelMatches
+            else:
+                candidates, labels = range(len(self.texts)), range(len(self.labels))
+            textsLower, labelsLower = self.textsLower, self.labelsLower
+            matches = array("i", [index for index in candidates if text in textsLower[index]])
+            labelMatches = {index for index in labels if text in labelsLower[index]}
+        self.relayout(lambda: self.applyFilter(text, matches, labelMatches))
+
+    def applyFilter(self, text, matches, labelMatches):
+        self.filterText, self.matches, self.labelMatches = text, matches, labelMatches
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        descending = order == Qt.SortOrder.DescendingOrder
+        if descending != self.descending:
+            self.relayout(lambda: setattr(self, "descending", descending))
+
+    def relayout(self, change):
+        """
+        修改过滤/排序条件后重新计算可见行，持久索引(展开、选中)映射到新位置
+        """
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        old = [self.key(index) for index in persistent]
+        change()
+        self.rows = self.visibleObjects()
+        self.objectRows = {obj: row for row, obj in enumerate(self.rows)}
+        self.children = {}
+        self.fetched &= set(self.objectRows)
+        self.changePersistentIndexList(persistent, [self.indexOf(key, index.column())
+                                                    for key, index in zip(old, persistent)])
+        self.layoutChanged.emit()
+
+    def key(self, index):
+        """
+        行的稳定标识: (控件编号, 信号编号 or -1)
+        """
+        if not index.isValid():
+            return None
+        if index.internalId() == 0:
+            return (self.rows[index.row()], -1)
+        obj = index.internalId() - 1
+        return (obj, self.childList(obj)[index.row()])
+
+    def indexOf(self, key, column=0):
+        if key is None:
+            return QModelIndex()
+        obj, signal = key
+        row = self.objectRows.get(obj)
+        if row is None:
+            return QModelIndex()
+        if signal < 0:
+            return self.createIndex(row, column, 0)
+        position = self.childRows(obj).get(signal) if obj in self.fetched else None
+        if position is None:
+            return QModelIndex()
+        return self.createIndex(position, column, obj + 1)
+
+    def childList(self, obj):
+        """
+        控件当前可见的信号编号，按需计算
+        """
+        entry = self.children.get(obj)
+        if entry is None:
+            entry = self.children[obj] = [self.visibleSignals(obj), None]
+        return entry[0]
+
+    def childRows(self, obj):
+        """
+        信号编号 -> 行号，只在重新映射持久索引时需要
+        """
+        signals = self.childList(obj)
+        entry = self.children[obj]
+        if entry[1] is None:
+            entry[1] = {signal: row for row, signal in enumerate(signals)}
+        return entry[1]
+
+    # QAbstractItemModel
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0) if row < len(self.rows) else QModelIndex()
+        if parent.internalId() != 0:
+            return QModelIndex()
+        obj = self.rows[parent.row()]
+        return self.createIndex(row, column, obj + 1) if row < len(self.childList(obj)) else QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        row = self.objectRows.get(index.internalId() - 1)
+        return QModelIndex() if row is None else self.createIndex(row, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.rows)
+        if parent.internalId() != 0:
+            return 0
+        obj = self.rows[parent.row()]
+        return len(self.childList(obj)) if obj in self.fetched else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.rows)
+        if parent.internalId() != 0:
+            return False
+        obj = self.rows[parent.row()]
+        return self.starts[obj + 1] > self.starts[obj]
+
+    def canFetchMore(self, parent):
+        return parent.isValid() and parent.internalId() == 0 and self.rows[parent.row()] not in self.fetched
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        obj = self.rows[parent.row()]
+        count = len(self.childList(obj))
+        if count:
+            self.beginInsertRows(parent, 0, count - 1)
+            self.fetched.add(obj)
+            self.endInsertRows()
+        else:
+            self.fetched.add(obj)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.internalId() == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.labels[self.rows[index.row()]]
+            return None
+        signal = self.childList(index.internalId() - 1)[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.texts[signal]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Unchecked if self.states[signal] == UNCHECKED else Qt.CheckState.Checked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or not index.isValid() or index.internalId() == 0:
+            return False
+        signal = self.childList(index.internalId() - 1)[index.row()]
+        if self.states[signal] == IMPLEMENTED:
+            return False
+        checked = value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value)
+        self.states[signal] = CHECKED if checked else UNCHECKED
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.internalId() == 0:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        signal = self.childList(index.internalId() - 1)[index.row()]
+        if self.states[signal] == IMPLEMENTED:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
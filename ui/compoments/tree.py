@@ -6,15 +6,152 @@ email: nbxlc@hotmail.com
 """
 
 
-from PySide6.QtCore import Slot
-from PySide6.QtGui import QAction
-from PySide6.QtWidgets import QTreeWidgetItem, QMenu, QApplication
+from PySide6.QtCore import Slot, Qt, QFileInfo, QModelIndex
+from PySide6.QtGui import QAction, QStandardItemModel, QStandardItem
+from PySide6.QtWidgets import QTreeWidgetItem, QMenu, QApplication, QFileIconProvider
 import sys
 import os
 
 from qfluentwidgets import TreeWidget
 
 
+PATH_ROLE = Qt.ItemDataRole.UserRole + 1
+DIR_ROLE = Qt.ItemDataRole.UserRole + 2
+LOADED_ROLE = Qt.ItemDataRole.UserRole + 3
+SORT_ROLE = Qt.ItemDataRole.UserRole + 4
+
+
+class FilesystemModel(QStandardItemModel):
+    """
+    基于 ProjectIndexer 的项目目录模型
+
+    目录内容来自内存中的索引，不访问文件系统；子目录在展开时才创建条目，
+    索引增量更新(changed)时只同步已展开的目录；图标按后缀缓存
+    与 QFileSystemModel 相同提供 setRootPath/rootPath/filePath/isDir
+    """
+
+    def __init__(self, indexer, parent=None):
+        super().__init__(parent)
+        self.indexer = indexer
+        self.root = ""
+        self.items = {}
+        self.iconProvider = QFileIconProvider()
+        self.icons = {}
+        self.setSortRole(SORT_ROLE)
+        self.indexer.indexed.connect(self.on_indexed)
+        self.indexer.changed.connect(self.on_changed)
+
+    def setRootPath(self, path):
+        self.root = os.path.normpath(path)
+        self.items = {}
+        self.clear()
+        self.indexer.setRoot(self.root)
+
+    def rootPath(self):
+        return self.root
+
+    def filePath(self, index):
+        return (index.data(PATH_ROLE) or "") if index.isValid() else ""
+
+    def isDir(self, index):
+        return bool(index.isValid() and index.data(DIR_ROLE))
+
+    def icon(self, path, isDir):
+        if isDir:
+            key = ""
+        else:
+            suffix = os.path.splitext(path)[1].lower()
+            # 可执行文件/快捷方式的图标各不相同，不缓存
+            key = suffix if suffix not in (".exe", ".lnk", ".ico") else path
+        if key not in self.icons:
+            if isDir:
+                self.icons[key] = self.iconProvider.icon(QFileIconProvider.IconType.Folder)
+            else:
+                self.icons[key] = self.iconProvider.icon(QFileInfo(path))
+        return self.icons[key]
+
+    def newItem(self, folder, name, isDir):
+        path = os.path.join(folder, name)
+        item = QStandardItem(self.icon(path, isDir), name)
+        item.setEditable(False)
+        item.setData(path, PATH_ROLE)
+        item.setData(isDir, DIR_ROLE)
+        item.setData(("0" if isDir else "1") + name.lower(), SORT_ROLE)
+        return item
+
+    def fill(self, parentItem, folder):
+        """
+        用索引中的目录内容创建子条目
+        """
+        listing = self.indexer.listdir(folder)
+        if listing is None:
+            return
+        dirs, files = listing
+        items = [self.newItem(folder, name, True) for name in dirs]
+        items += [self.newItem(folder, name, False) for name in files]
+        for item in items:
+            parentItem.appendRow(item)
+        self.items[folder] = parentItem
+        if parentItem is not self.invisibleRootItem():
+            parentItem.setData(True, LOADED_ROLE)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            listing = self.indexer.listdir(parent.data(PATH_ROLE))
+            return bool(listing and (listing[0] or listing[1]))
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent):
+        return bool(parent.isValid() and parent.data(DIR_ROLE) and not parent.data(LOADED_ROLE))
+
+    def fetchMore(self, parent):
+        if self.canFetchMore(parent):
+            self.fill(self.itemFromIndex(parent), parent.data(PATH_ROLE))
+
+    @Slot(str)
+    def on_indexed(self, root):
+        if root != self.root:
+            return
+        self.items = {}
+        self.removeRows(0, self.rowCount())
+        self.fill(self.invisibleRootItem(), root)
+
+    @Slot(list)
+    def on_changed(self, folders):
+        """
+        只同步已展开的目录: 删除消失的条目，追加新条目后重新排序
+        """
+        for folder in folders:
+            parentItem = self.items.get(folder)
+            if parentItem is None:
+                continue
+            listing = self.indexer.listdir(folder)
+            if listing is None:
+                continue
+            dirs, files = set(listing[0]), set(listing[1])
+            current = {}
+            for row in reversed(range(parentItem.rowCount())):
+                child = parentItem.child(row)
+                name = child.text()
+                isDir = bool(child.data(DIR_ROLE))
+                if name in (dirs if isDir else files):
+                    current[(name, isDir)] = child
+                    continue
+                if isDir:
+                    self.forget(child.data(PATH_ROLE))
+                parentItem.removeRow(row)
+            added = [(name, True) for name in dirs if (name, True) not in current]
+            added += [(name, False) for name in files if (name, False) not in current]
+            for name, isDir in added:
+                parentItem.appendRow(self.newItem(folder, name, isDir))
+            if added:
+                parentItem.sortChildren(0)
+
+    def forget(self, folder):
+        prefix = folder + os.sep
+        for path in [path for path in self.items if path == folder or path.startswith(prefix)]:
+            del self.items[path]
+
 
 class CustomTreeWidget(TreeWidget):
     def __init__(self, parent=None):
@@ -43,8 +180,9 @@ class CustomTreeWidget(TreeWidget):
         self.contextMenu.exec(event.globalPos())
 
     def setPath(self, path):
-        for filename in os.listdir(''):
-            self.addDirectory([filename, '0B'])
+        with os.scandir(path) as it:
+            for entry in it:
+                self.addDirectory([entry.name, '0B'])
 
 
 
@@ -54,4 +192,4 @@ if __name__ == '__main__':
     app = QApplication(sys.argv)
     tree = CustomTreeWidget()
     tree.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+基于 ast 的 Python 源码扫描器，生成与 ModuleParser 正则扫描器相同的 Class/Function/Attribute 模型
+
+方法签名、返回注解、@Slot 参数与基类列表仍按正则扫描器的规则从源码文本中截取，
+结束行与 _calculateEndline 的规则相同(预先计算每行的缩进)，两者的结果可以直接比较；
+语法错误的源码由 Module.scan 回退到正则扫描器
+
+一致性检查与基准(不一致时返回 1):
+    python -m ui.eric.AstScanner [文件或目录...]
+"""
+
+import os
+import re
+import ast
+import sys
+import time
+
+from . import ModuleParser
+from .ModuleParser import Module, Class, Function, Attribute, PY_SOURCE, _indent, _setVisibility
+
+
+# 与 ModuleParser._py_getnext 中 Method/Class 的写法相同
+_defHeader = re.compile(
+    r"""
+    (?: async [ \t]+ )? (?: cdef | cpdef | def) [ \t]+
+    (?P<MethodName> \w+ )
+    (?: [ \t]* \[ [^\]]+ \] )?
+    [ \t]* \(
+    (?P<MethodSignature> (?: [^)] | \)[ \t]*,? )*? )
+    \) [ \t]*
+    (?P<MethodReturnAnnotation> (?: -> [ \t]* [^:]+ )? )
+    [ \t]* :
+    """,
+    re.VERBOSE,
+).match
+
+_classHeader = re.compile(
+    r"""
+    (?: cdef [ \t]+ )?
+    class [ \t]+
+    (?P<ClassName> \w+ )
+    (?: [ \t]* \[ [^\]]+ \] )?
+    [ \t]*
+    (?P<ClassSupers> \( [^)]* \) )?
+    [ \t]* :
+    """,
+    re.VERBOSE,
+).match
+
+_slotDecorator = re.compile(
+    r"""
+    [ \t]* @ (?: PyQt[456] \. | PySide[26] \. )? (?: QtCore \. )?
+        (?: pyqtSignature | pyqtSlot | Slot )
+        [ \t]* \(
+            (?P<MethodPyQtSignature> [^)]* )
+        \)
+    """,
+    re.VERBOSE,
+).match
+
+_docstringStart = re.compile(r"""[ru]?(?:\"\"\"|''')""").match
+
+_MODIFIERS = {"staticmethod": Function.Static, "classmethod": Function.Class}
+
+# 复合语句中包含语句块的字段
+_BLOCKS = ("body", "orelse", "finalbody")
+_HANDLERS = ("handlers", "cases")
+
+# 一致性检查的默认范围(相对仓库根目录，tests/test_ast_scanner.py 使用相同范围)
+CORPUS_PATHS = ("ui", "common", "main.py", "manage.py")
+# 基准文件(大型生成代码与手写模块)
+BENCHMARK_FILES = ("ui/Ui_NuitkaDocDialog.py", "ui/Ui_PyinstallerDocDialog.py", "ui/eric/ModuleParser.py")
+BENCHMARK_REPEAT = 5
+
+
+class _Scanner:
+    """
+    遍历 ast，按正则扫描器的规则把定义加入 Module
+    stack 中 Class 表示类体，None 表示函数体
+    """
+
+    def __init__(self, module, src):
+        self.module = module
+        self.src = src
+        self.indents = self.lineIndents(src.splitlines())
+        self.rawLines = src.split("\n")
+        self.starts = [0]
+        for line in self.rawLines:
+            self.starts.append(self.starts[-1] + len(line) + 1)
+
+    @staticmethod
+    def lineIndents(lines):
+        """
+        每行的缩进，空行与注释行为 None
+        """
+        indents = []
+        for line in lines:
+            stripped = line.lstrip()
+            if stripped and not stripped.startswith("#"):
+                indents.append(_indent(line[:len(line) - len(stripped)]))
+            else:
+                indents.append(None)
+        return indents
+
+    def endline(self, lineno, indent):
+        """
+        与 ModuleParser._calculateEndline 相同: 定义之后第一个缩进不大于 indent 的代码行的前一行，没有时为 -1
+        """
+        indents = self.indents
+        for index in range(lineno, len(indents)):
+            lineIndent = indents[index]
+            if lineIndent is not None and lineIndent <= indent:
+                return index
+        return -1
+
+    def column(self, lineno, col):
+        """
+        ast 的列号是 UTF-8 字节偏移，转换为字符偏移
+        """
+        line = self.rawLines[lineno - 1]
+        if col and not line.isascii():
+            col = len(line.encode("utf-8")[:col].decode("utf-8", "replace"))
+        return col
+
+    def offset(self, lineno, col):
+        return self.starts[lineno - 1] + self.column(lineno, col)
+
+    def prefix(self, node):
+        """
+        语句所在行中语句之前的文本
+        """
+        return self.rawLines[node.lineno - 1][:self.column(node.lineno, node.col_offset)]
+
+    def atLineStart(self, node):
+        return not self.prefix(node).strip()
+
+    def scan(self):
+        tree = ast.parse(self.src)
+        self.moduleDescription(tree)
+        self.visit(tree.body, [])
+
+    def visit(self, body, stack):
+        for node in body:
+            nodeType = type(node)
+            if nodeType is ast.FunctionDef or nodeType is ast.AsyncFunctionDef:
+                self.function(node, stack)
+            elif nodeType is ast.ClassDef:
+                self.klass(node, stack)
+            elif nodeType is ast.Assign:
+                self.assign(node, node.targets[0], stack, len(node.targets) == 1)
+            elif nodeType is ast.AnnAssign:
+                self.assign(node, node.target, stack, False)
+            elif nodeType is ast.Import:
+                self.imports(node)
+            elif nodeType is ast.ImportFrom:
+                self.importFrom(node)
+            else:
+                for name in _BLOCKS:
+                    block = getattr(node, name, None)
+                    if block:
+                        self.visit(block, stack)
+                for name in _HANDLERS:
+                    for handler in getattr(node, name, None) or ():
+                        self.visit(handler.body, stack)
+
+    def docstring(self, node):
+        """
+        类/函数体第一条语句为三引号字符串时返回引号之间的原始文本
+        """
+        if not node.body:
+            return None
+        first = node.body[0]
+        if type(first) is not ast.Expr or type(first.value) is not ast.Constant or type(first.value.value) is not str:
+            return None
+        start = self.offset(first.lineno, first.col_offset)
+        match = _docstringStart(self.src, start)
+        if not match:
+            return None
+        end = self.offset(first.end_lineno, first.end_col_offset)
+        return self.src[match.end():end - 3]
+
+    def moduleDescription(self, tree):
+        """
+        与正则扫描器相同: 文件开头(注释之后)位于行首的字符串，只取三引号中的内容
+        """
+        if not tree.body:
+            return
+        first = tree.body[0]
+        if type(first) is not ast.Expr or type(first.value) is not ast.Constant or type(first.value.value) is not str:
+            return
+        start = self.offset(first.lineno, first.col_offset)
+        if start == 0 or self.src[start - 1] != "\n" or self.src[start] not in "\"'":
+            return
+        if self.src.startswith(('"""', "'''"), start):
+            end = self.offset(first.end_lineno, first.end_col_offset)
+            self.module.addDescription(self.src[start + 3:end - 3])
+        else:
+            self.module.addDescription("")
+
+    def function(self, node, stack):
+        match = _defHeader(self.src, self.offset(node.lineno, node.col_offset))
+        if not match:
+            # 正则扫描器同样识别不到，只扫描函数体
+            self.visit(node.body, stack)
+            return
+        name = match.group("MethodName")
+        signature = match.group("MethodSignature").replace("\\\n", "")
+        annotation = match.group("MethodReturnAnnotation").replace("\\\n", "")
+        thisindent = _indent(self.prefix(node))
+
+        lineno = node.lineno
+        pyqtSignature = None
+        modifier = Function.General
+        if node.decorator_list:
+            last = node.decorator_list[-1]
+            slot = _slotDecorator(self.src, self.starts[last.lineno - 1])
+            if slot and not self.src[slot.end():self.starts[node.lineno - 1]].strip():
+                # 紧接在 def 之前的 @Slot(...)，与正则扫描器一样从装饰器所在行算起
+                lineno = last.lineno
+                pyqtSignature = (
+                    slot.group("MethodPyQtSignature")
+                    .replace("\\\n", "")
+                    .split("result")[0]
+                    .split("name")[0]
+                    .strip("\"', \t")
+                )
+            for decorator in node.decorator_list:
+                if type(decorator) is ast.Name and decorator.id in _MODIFIERS:
+                    modifier = _MODIFIERS[decorator.id]
+
+        cls = next((item for item in reversed(stack) if item is not None), None)
+        if cls is not None:
+            # 类中(含方法内嵌套)的函数都作为该类的方法
+            f = Function(None, name, None, lineno, signature, pyqtSignature,
+                         modifierType=modifier, annotation=annotation)
+            _setVisibility(f)
+            cls.addMethod(name, f)
+        else:
+            f = Function(self.module.name, name, self.module.file, lineno, signature, pyqtSignature,
+                         modifierType=modifier, annotation=annotation)
+            _setVisibility(f)
+            self.module.addFunction(name, f)
+        f.setEndLine(self.endline(node.lineno, thisindent))
+        description = self.docstring(node)
+        if description is not None:
+            f.addDescription(description)
+        self.visit(node.body, stack + [None])
+
+    def klass(self, node, stack):
+        match = _classHeader(self.src, self.offset(node.lineno, node.col_offset))
+        if match:
+            inherit = self.module._superClasses(match.group("ClassSupers") or "")
+        else:
+            # 基类列表中含括号(如 namedtuple(...))，正则扫描器识别不到该类
+            inherit = [ast.get_source_segment(self.src, base) for base in node.bases]
+        cls = Class(self.module.name, node.name, inherit, self.module.file, node.lineno)
+        _setVisibility(cls)
+        cls.setEndLine(self.endline(node.lineno, _indent(self.prefix(node))))
+        description = self.docstring(node)
+        if description is not None:
+            cls.addDescription(description)
+        self.module.addClass(node.name, cls)
+        self.visit(node.body, stack + [cls])
+
+    def assign(self, node, target, stack, single):
+        if not self.atLineStart(node):
+            return
+        targetType = type(target)
+        if targetType is ast.Attribute:
+            if type(target.value) is ast.Name and target.value.id == "self":
+                cls = next((item for item in reversed(stack) if item is not None), None)
+                if cls is not None:
+                    attr = Attribute(self.module.name, target.attr, self.module.file, node.lineno)
+                    _setVisibility(attr)
+                    cls.addAttribute(target.attr, attr)
+            return
+        if targetType is not ast.Name:
+            return
+        isSignal = single and self.src.startswith(
+            "pyqtSignal", self.offset(node.value.lineno, node.value.col_offset))
+        attr = Attribute(self.module.name, target.id, self.module.file, node.lineno, isSignal=isSignal)
+        _setVisibility(attr)
+        if not stack:
+            self.module.addGlobal(target.id, attr)
+        elif stack[-1] is not None:
+            stack[-1].addGlobal(target.id, attr)
+
+    @staticmethod
+    def aliasName(alias):
+        return f"{alias.name} as {alias.asname}" if alias.asname else alias.name
+
+    def imports(self, node):
+        if not self.atLineStart(node):
+            return
+        names = [self.aliasName(alias) for alias in node.names]
+        self.module.imports.extend([name for name in names if name not in self.module.imports])
+
+    def importFrom(self, node):
+        if not self.atLineStart(node):
+            return
+        names = [self.aliasName(alias) for alias in node.names]
+        if node.module is None:
+            if node.level == 1:
+                # from . import x
+                self.module.imports.extend([name for name in names if name not in self.module.imports])
+            return
+        path = "." * node.level + node.module
+        fromImports = self.module.from_imports.setdefault(path, [])
+        fromImports.extend([name for name in names if name not in fromImports])
+
+
+def scanModule(module, src):
+    """
+    用 ast 扫描源码，结果写入 module
+    @exception SyntaxError/ValueError 源码无法解析(此时 module 未被修改)
+    """
+    _Scanner(module, src).scan()
+
+
+def model(module):
+    """
+    可比较的模型(不含 import，正则扫描器对多行括号 import 的结果不完整)
+    """
+
+    def function(f):
+        return (f.name, f.lineno, f.endlineno, tuple(f.parameters), f.pyqtSignature, f.modifier,
+                f.annotation, f.description, f.visibility)
+
+    def attributes(items):
+        return {name: (tuple(attr.linenos), attr.isSignal, attr.visibility) for name, attr in items.items()}
+
+    return {
+        "description": module.description,
+        "functions": {name: function(f) for name, f in module.functions.items()},
+        "globals": attributes(module.globals),
+        "classes": {
+            name: {
+                "class": (cls.name, tuple(cls.super), cls.lineno, cls.endlineno, cls.description, cls.visibility),
+                "methods": {name: function(f) for name, f in cls.methods.items()},
+                "attributes": attributes(cls.attributes),
+                "globals": attributes(cls.globals),
+            }
+            for name, cls in module.classes.items()
+        },
+    }
+
+
+def scanFile(path, scanner):
+    src = ModuleParser.readEncodedFile(path)[0]
+    module = Module(os.path.splitext(os.path.basename(path))[0], path, PY_SOURCE)
+    module.scan(src, scanner)
+    return module
+
+
+def differences(left, right, path=""):
+    """
+    @return 两个模型中不同的项 [(路径, 正则扫描结果, ast 扫描结果)]
+    """
+    if isinstance(left, dict) and isinstance(right, dict):
+        result = []
+        for key in sorted(set(left) | set(right), key=str):
+            result += differences(left.get(key), right.get(key), f"{path}/{key}")
+        return result
+    return [] if left == right else [(path, left, right)]
+
+
+def corpus(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, dirs, files in os.walk(path):
+                dirs[:] = [name for name in dirs if not name.startswith(".") and name != "__pycache__"]
+                for name in sorted(files):
+                    if name.endswith(".py"):
+                        yield os.path.join(folder, name)
+        elif path.endswith(".py"):
+            yield path
+
+
+def benchmark(path, repeat=BENCHMARK_REPEAT):
+    """
+    @return {扫描器: MB/s}
+    """
+    src = ModuleParser.readEncodedFile(path)[0]
+    size = len(src.encode("utf-8")) / 1e6
+    result = {}
+    for scanner in ModuleParser.SCANNERS:
+        best = None
+        for _ in range(repeat):
+            module = Module("benchmark", path, PY_SOURCE)
+            start = time.perf_counter()
+            module.scan(src, scanner)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        result[scanner] = size / best
+    return result
+
+
+if __name__ == "__main__":
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    paths = sys.argv[1:] or [os.path.join(root, path) for path in CORPUS_PATHS]
+    failed = 0
+    checked = 0
+    for path in corpus(paths):
+        checked += 1
+        diffs = differences(model(scanFile(path, "regex")), model(scanFile(path, "ast")))
+        if diffs:
+            failed += 1
+            print(f"DIFF {os.path.relpath(path, root)}")
+            for key, regexValue, astValue in diffs[:10]:
+                print(f"    {key}\n        regex: {regexValue!r}\n        ast:   {astValue!r}")
+    print(f"corpus: {checked - failed}/{checked} files agree")
+
+    for name in BENCHMARK_FILES:
+        path = os.path.join(root, name)
+        if os.path.exists(path):
+            speed = benchmark(path)
+            print(f"{name:<32} regex {speed['regex']:7.2f} MB/s   ast {speed['ast']:7.2f} MB/s   "
+                  f"x{speed['ast'] / speed['regex']:.1f}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner New
+email: nbxlc@hotmail.com
+
+ModuleParser 解析结果的持久化缓存
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+import threading
+
+from common.thread import TH_POOL
+from manage import ROOT_PATH, SettingPath
+from . import ModuleParser
+
+
+# 修改 ModuleParser 的解析逻辑或 Module 的结构时递增，旧缓存随之失效
+PARSER_VERSION = 2
+# 项目源码使用 ast 扫描器(语法错误时自动回退到正则扫描器)
+SCANNER = "ast"
+CACHE_DIR = os.path.join(ROOT_PATH, SettingPath, "module_cache")
+
+
+class ModuleCache:
+    """
+    按源文件缓存解析得到的 Module
+
+    每个源文件一个 pickle 条目 data/module_cache/<路径哈希>.pickle，内容为
+    (解析器版本, 路径, (mtime_ns, size), Module)；读取时与源文件当前的 stat 比较，
+    任一项不同即重新解析(stamp 在解析前取得，解析期间文件被修改也会在下次失效)
+    内存中另保留一份，同一进程内不必重复反序列化
+    """
+
+    def __init__(self, folder=CACHE_DIR):
+        self.folder = folder
+        self.memory = {}
+        self._lock = threading.Lock()
+
+    def entryFile(self, path):
+        key = hashlib.sha1(os.path.normcase(os.path.abspath(path)).encode("utf-8")).hexdigest()
+        return os.path.join(self.folder, f"{key}.pickle")
+
+    def load(self, path, stamp):
+        try:
+            with open(self.entryFile(path), "rb") as f:
+                version, source, entryStamp, module = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.debug(f"module cache load {path} error: {e}")
+            return None
+        if version != PARSER_VERSION or source != os.path.abspath(path) or tuple(entryStamp) != stamp:
+            return None
+        return module
+
+    def save(self, path, stamp, module):
+        entryFile = self.entryFile(path)
+        tmpFile = f"{entryFile}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(tmpFile, "wb") as f:
+                pickle.dump((PARSER_VERSION, os.path.abspath(path), stamp, module), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpFile, entryFile)
+        except Exception as e:
+            logging.error(f"module cache save {path} error: {e}")
+
+    def remove(self, path):
+        with self._lock:
+            self.memory.pop(os.path.abspath(path), None)
+        try:
+            os.remove(self.entryFile(path))
+        except OSError:
+            pass
+
+    def cached(self, path):
+        """
+        只读缓存，源文件未变化时返回 Module，否则返回 None
+        """
+        stamp = ModuleParser.fileStamp(path)
+        if stamp is None:
+            self.remove(path)
+            return None
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self.memory.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        module = self.load(path, stamp)
+        if module is not None:
+            with self._lock:
+                self.memory[key] = (stamp, module)
+        return module
+
+    def read(self, path):
+        """
+        读取缓存，未命中时解析并写入缓存
+        @return Module or None(无法解析)
+        """
+        module = self.cached(path)
+        if module is not None:
+            return module
+        stamp = ModuleParser.fileStamp(path)
+        if stamp is None:
+            return None
+        try:
+            module = ModuleParser.readModule(path, extensions=[os.path.splitext(path)[1]], caching=False,
+                                                scanner=SCANNER)
+        except ImportError as e:
+            logging.debug(f"module parse {path} error: {e}")
+            return None
+        with self._lock:
+            self.memory[os.path.abspath(path)] = (stamp, module)
+        self.save(path, stamp, module)
+        return module
+
+    def readAll(self, paths):
+        """
+        在线程池中解析多个文件(已缓存的直接读取)
+        @return {路径: Module or None}
+        """
+        paths = list(dict.fromkeys(paths))
+        return dict(zip(paths, TH_POOL.map(self.read, paths)))
+
+    def readAllAsync(self, paths, callback=None):
+        """
+        每个文件一个后台任务，全部完成后在主线程中调用 callback({路径: Module or None})
+        @return {Future: 路径}
+        """
+        futures = TH_POOL.submitBatch(self.read, dict.fromkeys(paths))
+        results = {}
+
+        def done(path, module):
+            results[path] = module
+            if len(results) == len(futures) and callback:
+                callback(results)
+
+        for future, path in futures.items():
+            TH_POOL.addCallback(future, lambda module, path=path: done(path, module),
+                                lambda error, path=path: done(path, None))
+        if not futures and callback:
+            callback(results)
+        return futures
+
+
+MODULE_CACHE = ModuleCache()
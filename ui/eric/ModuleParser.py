@@ -371,7 +371,43 @@ _hashsub = re.compile(r"""^([ \t]*)#[ \t]?""", re.MULTILINE).sub
 
 _commentsub = re.compile(r"""#[^\n]*\n|#[^\n]*$""").sub
 
+SCANNERS = ("regex", "ast")
+DEFAULT_SCANNER = "regex"
+
 _modules = {}  # cache of modules we've seen
+_stamps = {}  # (mtime, size) of the source file of each cached module
+
+
+def fileStamp(filename):
+    """
+    Function to get the stamp used to validate cached parse results.
+
+    @param filename name of the source file
+    @type str
+    @return tuple of modification time (ns) and size or None, if the
+        file does not exist
+    @rtype tuple of (int, int) or None
+    """
+    try:
+        stat = os.stat(filename)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _cacheModule(modname, mod, stamp=None):
+    """
+    Protected function to store a parsed module in the in-memory cache.
+
+    @param modname name of the module
+    @type str
+    @param mod parsed module
+    @type Module
+    @param stamp stamp of the source file taken before parsing
+    @type tuple of (int, int) or None
+    """
+    _modules[modname] = mod
+    _stamps[modname] = stamp
 
 
 class VisibilityBase:
@@ -461,6 +497,35 @@ class Module:
         else:
             self._getnext = None
 
+    def __getstate__(self):
+        """
+        Special method to get the state for pickling.
+
+        The compiled regular expression is not picklable and is
+        recreated from the module type.
+
+        @return state of the object
+        @rtype dict
+        """
+        state = self.__dict__.copy()
+        state.pop("_getnext", None)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Special method to restore the state after unpickling.
+
+        @param state state of the object
+        @type dict
+        """
+        self.__dict__.update(state)
+        if self.type in [PY_SOURCE, PTL_SOURCE]:
+            self._getnext = _py_getnext
+        elif self.type == RB_SOURCE:
+            self._getnext = _rb_getnext
+        else:
+            self._getnext = None
+
     def addClass(self, name, _class):
         """
         Public method to add information about a class.
@@ -532,16 +597,29 @@ class Module:
         """
         self.description = description
 
-    def scan(self, src):
+    def scan(self, src, scanner=None):
         """
         Public method to scan the source text and retrieve the relevant
         information.
 
         @param src the source text to be scanned
         @type str
+        @param scanner scanner to be used for Python sources, "regex" or
+            "ast" (defaults to DEFAULT_SCANNER). The ast scanner falls back
+            to the regex scanner for sources it cannot parse.
+        @type str (optional)
         """
         # convert eol markers the Python style
         src = src.replace("\r\n", "\n").replace("\r", "\n")
+        if (scanner or DEFAULT_SCANNER) == "ast" and self.type == PY_SOURCE:
+            from .AstScanner import scanModule
+
+            try:
+                scanModule(self, src)
+                return
+            except (SyntaxError, ValueError):
+                # e.g. a file being edited, the regex scanner is tolerant
+                pass
         if self.type in [PY_SOURCE, PTL_SOURCE]:
             self.__py_scan(src)
         elif self.type == RB_SOURCE:
@@ -554,12 +632,42 @@ class Module:
         @param objectRef reference to the object
         @type Attribute, Class or Function
         """
-        if objectRef.name.startswith("__"):
-            objectRef.setPrivate()
-        elif objectRef.name.startswith("_"):
-            objectRef.setProtected()
-        else:
-            objectRef.setPublic()
+        _setVisibility(objectRef)
+
+    def _superClasses(self, inherit):
+        """
+        Protected method to resolve the super classes of a class definition.
+
+        @param inherit text of the super classes list including the
+            parentheses
+        @type str
+        @return list of super class names or the empty string, if the
+            class does not inherit from other classes
+        @rtype list of str or str
+        """
+        if not inherit:
+            return inherit
+        # the class inherits from other classes
+        inherit = inherit[1:-1].strip()
+        inherit = _commentsub("", inherit)
+        names = []
+        for n in inherit.split(","):
+            n = n.strip()
+            if n:
+                if n in self.classes:
+                    # we know this super class
+                    n = self.classes[n].name
+                else:
+                    c = n.split(".")
+                    if len(c) > 1:
+                        # super class is of the
+                        # form module.class:
+                        # look in module for class
+                        m = c[-2]
+                        if m in _modules:
+                            n = _modules[m].name
+                names.append(n)
+        return names
 
     def __py_scan(self, src):
         """
@@ -570,33 +678,6 @@ class Module:
         @type str
         """  # __IGNORE_WARNING_D234__
 
-        def calculateEndline(lineno, lines, indent):
-            """
-            Function to calculate the end line of a class or method/function.
-
-            @param lineno line number to start at (one based)
-            @type int
-            @param lines list of source lines
-            @type list of str
-            @param indent indent length the class/method/function definition
-            @type int
-            @return end line of the class/method/function (one based)
-            @rtype int
-            """
-            # start with zero based line after start line
-            while lineno < len(lines):
-                line = lines[lineno]
-                if line.strip() and not line.lstrip().startswith("#"):
-                    # line contains some text and does not start with
-                    # a comment sign
-                    lineIndent = _indent(line.replace(line.lstrip(), ""))
-                    if lineIndent <= indent:
-                        return lineno
-                lineno += 1
-
-            # nothing found
-            return -1
-
         srcLines = src.splitlines()
 
         lineno, last_lineno_pos = 1, 0
@@ -723,7 +804,7 @@ class Module:
                     )
                     self.__py_setVisibility(f)
                     self.addFunction(meth_name, f)
-                endlineno = calculateEndline(def_lineno, srcLines, thisindent)
+                endlineno = _calculateEndline(def_lineno, srcLines, thisindent)
                 f.setEndLine(endlineno)
                 cur_obj = f
                 classstack.append((None, thisindent))  # Marker for nested fns
@@ -774,31 +855,7 @@ class Module:
                 while classstack and classstack[-1][1] >= thisindent:
                     del classstack[-1]
                 class_name = m.captured("ClassName")
-                inherit = m.captured("ClassSupers")
-                if inherit:
-                    # the class inherits from other classes
-                    inherit = inherit[1:-1].strip()
-                    inherit = _commentsub("", inherit)
-                    names = []
-                    for n in inherit.split(","):
-                        n = n.strip()
-                        if n:
-                            if n in self.classes:
-                                # we know this super class
-                                n = self.classes[n].name
-                            else:
-                                c = n.split(".")
-                                if len(c) > 1:
-                                    # super class is of the
-                                    # form module.class:
-                                    # look in module for class
-                                    m = c[-2]
-                                    c = c[-1]
-                                    if m in _modules:
-                                        m = _modules[m]
-                                        n = m.name
-                            names.append(n)
-                    inherit = names
+                inherit = self._superClasses(m.captured("ClassSupers"))
                 # modify indentation level for conditional defines
                 if conditionalsstack:
                     if thisindent > conditionalsstack[-1]:
@@ -816,7 +873,7 @@ class Module:
                 # remember this class
                 cur_class = Class(self.name, class_name, inherit, self.file, lineno)
                 self.__py_setVisibility(cur_class)
-                endlineno = calculateEndline(lineno, srcLines, thisindent)
+                endlineno = _calculateEndline(lineno, srcLines, thisindent)
                 cur_class.setEndLine(endlineno)
                 cur_obj = cur_class
                 self.addClass(class_name, cur_class)
@@ -1629,13 +1686,14 @@ def readModule(
     extensions=None,
     caching=True,
     ignoreBuiltinModules=False,
+    scanner=None,
 ):
     """
     Function to read a module file and parse it.
 
     The module is searched in path and sys.path, read and parsed.
-    If the module was parsed before, the information is taken
-    from a cache in order to speed up processing.
+    If the module was parsed before and its source file is unchanged,
+    the information is taken from a cache in order to speed up processing.
 
     @param module name of the module to be parsed
     @type str
@@ -1655,6 +1713,9 @@ def readModule(
     @type bool
     @param ignoreBuiltinModules flag indicating to ignore the builtin modules
     @type bool
+    @param scanner scanner to be used for Python sources, "regex" or "ast"
+        (defaults to DEFAULT_SCANNER)
+    @type str
     @return reference to a Module object containing the parsed
         module information
     @rtype Module
@@ -1699,13 +1760,17 @@ def readModule(
 
     if caching and modname in _modules:
         # we've seen this module before...
-        return _modules[modname]
+        mod = _modules[modname]
+        if mod.file is None or fileStamp(mod.file) == _stamps.get(modname):
+            return mod
+        # the source file was changed or removed, parse it again
+        del _modules[modname]
 
     if not ignoreBuiltinModules and module in sys.builtin_module_names:
         # this is a built-in module
         mod = Module(modname, None, None)
         if caching:
-            _modules[modname] = mod
+            _cacheModule(modname, mod)
         return mod
 
 
@@ -1729,19 +1794,66 @@ def readModule(
 
     if moduleType not in SUPPORTED_TYPES:
         # not supported source, can't do anything with this module
-        _modules[modname] = Module(modname, None, None)
-        return _modules[modname]
+        mod = Module(modname, None, None)
+        if caching:
+            _cacheModule(modname, mod)
+        return mod
 
+    # take the stamp before reading, a change while parsing invalidates it
+    stamp = fileStamp(file)
     mod = Module(modname, file, moduleType)
     with contextlib.suppress(UnicodeError, OSError):
         src = (
             readEncodedFile(file)[0]
         )
-        mod.scan(src)
+        mod.scan(src, scanner)
     if caching:
-        _modules[modname] = mod
+        _cacheModule(modname, mod, stamp)
     return mod
 
+def _setVisibility(objectRef):
+    """
+    Function to set the visibility of an object based on its name.
+
+    @param objectRef reference to the object
+    @type Attribute, Class or Function
+    """
+    if objectRef.name.startswith("__"):
+        objectRef.setPrivate()
+    elif objectRef.name.startswith("_"):
+        objectRef.setProtected()
+    else:
+        objectRef.setPublic()
+
+
+def _calculateEndline(lineno, lines, indent):
+    """
+    Function to calculate the end line of a class or method/function.
+
+    @param lineno line number to start at (one based)
+    @type int
+    @param lines list of source lines
+    @type list of str
+    @param indent indent length the class/method/function definition
+    @type int
+    @return end line of the class/method/function (one based)
+    @rtype int
+    """
+    # start with zero based line after start line
+    while lineno < len(lines):
+        line = lines[lineno]
+        if line.strip() and not line.lstrip().startswith("#"):
+            # line contains some text and does not start with
+            # a comment sign
+            lineIndent = _indent(line.replace(line.lstrip(), ""))
+            if lineIndent <= indent:
+                return lineno
+        lineno += 1
+
+    # nothing found
+    return -1
+
+
 def _indent(ws):
     """
     Protected function to determine the indent width of a whitespace string.